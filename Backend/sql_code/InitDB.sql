@@ -7,14 +7,16 @@ CREATE TABLE frog_cafe.Roles (
 
 CREATE TABLE frog_cafe.Users (
     Id SERIAL PRIMARY KEY,
-    Name TEXT NOT NULL,
+    Name TEXT NOT NULL CONSTRAINT users_name_key UNIQUE,
     Pass TEXT NOT NULL,
     Role_id INT REFERENCES frog_cafe.Roles(Id)
 );
 
 CREATE TABLE frog_cafe.Toads (
     Id SERIAL PRIMARY KEY,
-    Pic TEXT NOT NULL,
+    Pic BYTEA NOT NULL,
+    Content_type TEXT NOT NULL DEFAULT 'application/octet-stream',
+    Etag TEXT GENERATED ALWAYS AS (encode(sha256(Pic), 'hex')) STORED,
     Is_taken BOOLEAN DEFAULT FALSE
 );
 
@@ -35,19 +37,93 @@ CREATE TABLE frog_cafe.Menu (
     Id SERIAL PRIMARY KEY,
     Dish_name TEXT NOT NULL,
     Image TEXT,
+    Image_thumb TEXT,
     Is_available BOOLEAN DEFAULT TRUE,
     Description TEXT,
     Category TEXT,
     Quantity_left INT DEFAULT 10
 );
 
+CREATE TABLE frog_cafe.Images (
+    Hash TEXT PRIMARY KEY,
+    Content_type TEXT NOT NULL,
+    Data BYTEA NOT NULL,
+    Width INT NOT NULL,
+    Height INT NOT NULL
+);
+
 CREATE TABLE frog_cafe.Cart (
     Id SERIAL PRIMARY KEY,
     Order_id INT REFERENCES frog_cafe.Orders(Id),
-    Menu_item INT REFERENCES frog_cafe.Menu(Id)
+    Menu_item INT REFERENCES frog_cafe.Menu(Id),
+    Quantity INT NOT NULL DEFAULT 1 CONSTRAINT cart_quantity_check CHECK (Quantity > 0),
+    CONSTRAINT cart_order_id_menu_item_key UNIQUE (Order_id, Menu_item)
+);
+
+CREATE INDEX orders_created_at_id_idx ON frog_cafe.Orders (Created_at, Id);
+CREATE INDEX orders_status_id_created_at_idx ON frog_cafe.Orders (Status_id, Created_at, Id);
+CREATE INDEX cart_menu_item_idx ON frog_cafe.Cart (Menu_item);
+CREATE INDEX toads_free_idx ON frog_cafe.Toads (Id) WHERE Is_taken = false;
+
+CREATE TABLE frog_cafe.Revoked_tokens (
+    Jti TEXT PRIMARY KEY,
+    Expires_at TIMESTAMP NOT NULL
 );
 
 
+-- Уведомления об изменениях для приложения (LISTEN frog_cafe_changes)
+CREATE OR REPLACE FUNCTION frog_cafe.notify_change() RETURNS trigger AS $$
+DECLARE
+    rec JSONB;
+    payload JSONB;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        rec := to_jsonb(OLD);
+    ELSE
+        rec := to_jsonb(NEW);
+    END IF;
+    payload := jsonb_build_object('table', TG_TABLE_NAME, 'op', TG_OP, 'id', rec->'id');
+    IF TG_TABLE_NAME = 'cart' THEN
+        payload := payload || jsonb_build_object('order_id', rec->'order_id');
+    ELSIF TG_TABLE_NAME = 'orders' THEN
+        payload := payload || jsonb_build_object('status_id', rec->'status_id');
+    ELSIF TG_TABLE_NAME = 'revoked_tokens' THEN
+        payload := payload || jsonb_build_object(
+            'jti', rec->'jti',
+            'exp', extract(epoch FROM (rec->>'expires_at')::timestamp AT TIME ZONE 'UTC')
+        );
+    ELSIF TG_TABLE_NAME = 'menu' THEN
+        payload := payload || jsonb_build_object('dish_name', rec->'dish_name');
+    END IF;
+    PERFORM pg_notify('frog_cafe_changes', payload::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER orders_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON frog_cafe.orders
+FOR EACH ROW EXECUTE FUNCTION frog_cafe.notify_change();
+
+CREATE TRIGGER cart_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON frog_cafe.cart
+FOR EACH ROW EXECUTE FUNCTION frog_cafe.notify_change();
+
+CREATE TRIGGER menu_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON frog_cafe.menu
+FOR EACH ROW EXECUTE FUNCTION frog_cafe.notify_change();
+
+CREATE TRIGGER order_statuses_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON frog_cafe.order_statuses
+FOR EACH ROW EXECUTE FUNCTION frog_cafe.notify_change();
+
+CREATE TRIGGER roles_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON frog_cafe.roles
+FOR EACH ROW EXECUTE FUNCTION frog_cafe.notify_change();
+
+CREATE TRIGGER revoked_tokens_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON frog_cafe.revoked_tokens
+FOR EACH ROW EXECUTE FUNCTION frog_cafe.notify_change();
+
 INSERT INTO frog_cafe.roles (id, name) VALUES
 (0, 'admin'),
 (1, 'user'),
@@ -66,10 +142,10 @@ INSERT INTO frog_cafe.order_statuses (id, name) VALUES
 (3, 'Готов'),
 (4, 'Выдан');
 
-INSERT INTO frog_cafe.toads (pic, is_taken) VALUES
-('data:image/webp;base64,UklGRlZRAABXRUJQVlA4IEpRAADQRwGdASpYAo4BPlEmkEYjoiGpJbIpmSAKCWNu/AlUUwkOVywPNnFZWbWvOAf4OCewS3f8XzmuTe6343+C9Yv+l4r/Af9Dy5fXv6nzef8X1c/qf2Dv11/Yv3OflH78vNf+5f7r+8V6dP8F6h39d/4vXEeij5eftE/17/0+mhqxEwLmz/M8IfLr9j/iOMfEa8N84/9j30/N/UX9oeefCHcX9//QGnH/SOoJwi/rvsB+UB/y+XL9q9RT9juuz6TxGUw6UbG6p56p3fhqxSBeYecrI99DnQJlSRtHsIyBve6ehCVsdIsn7572mw28q+7SJJgj40/0kvHh12Ysli8lYtEFMVOrjPYcQua1+I5YideTPsxYzqQXeyLYhkGiZvSkl+9eOkvc201ognUeLDyTTGfwlB0Ppf6BpMxbkyN9l8Ss26OgLsxTgISKxZ5gdRjYm/5f3v6nXB38yU4HQZXGQWWmuFlUsUSLVbMYXTc9X9SmI667RjZJuG2U24JA4OiNUOaEpgI03Ney7ALX4vdkuTeeGFrZQNN4ttWFmwtANMO4OLyOBxHtDXcXOSLikUVGuJWLPDO5IPI+9pIuLDA0kxrq0Xf2h1Kcq+7jc8etvnWy9W0uveC0MZNKb9ncg3NueYEfA8r3u64ZwVU421ahvObKpT55z/FE5loUfHCiEtoAdGI3zds9H7OhHDImFJM77bcKHscBbLsNQL2gSpQu+k1AhHdNLqGf24fFGP0ac76dBS2678B+t8XWCf+QI8Xb9NiNSJQgTiVnlkyxwl1bBJiW6NVU3iQMNOtPlFGB/23G0+wJMQvAKW3XQwZvvZQgDVUW6xHwsiq2Z52qcCHL8fPwRRNJo467YAdoQx0+OyAtDMPQ2i4WfimSoNoEWXrYl32XA8KgCmm5EL7dadyBeSvDxZKnnJ9eEs80nmgeSaq0gLhRtJvlbjqzTSEIvNyvsidRo4ijMNVIWmuQE1jz55+oeW4QR850YFpbYVqu1Jvld5MsyzrfACPLUPMKqj+GQ6pO8xFxKt5qXyWMSckr1wc+PzysTXyI3WgSgC6SmJUssomtcAo+T57tIB1MK5JGQhBNB8pcAzy+36z1sHQROJfN6troyXQYAYaU5PRzwc8KvhdQon/SIVWedRS9lApyCEo1Hhr86QlhFmDrCvlwShdRENIA9IsE2XloNOGsxqSAJyl+pIlYJAY6R9MnXZA2FrWD6TbS0KRzEZKZ+Odb+DSFkPetvNb8ds/zKctPO5F8qS7ukyNXG/cyStztSWOwJ8pgFYuYy1eWgm36yRBm3oYCOgSPt/+q1s31C5V76lNHeiVordTd3SdY9XWduiEEytuactHT2TMokQ2xOQhrSjZtAOFQd296isbNpE99Wzl4snybdJzEm0aFhq1KlNQCWY8djg8omiU0pasp5VeUubZTqZTY6NBBoh3BYvWENEfkWqlce6d4fmzWr/UhO/WyU33GymWVmMrtf1szCuq9JhWblQ/XFBun1rQ9rROTx8MIGFwCjLodQ9lXO9Nl8I/6J4HzcQsk1LXbD83+buuh+DNY55X7oCHcssgeIVADaAq36ZNQeKSe1NLlH+xx8flNxWjDjkkzNmxrjgrvTgV2k2kTe7snyBvoHea8+7HDreHinTJuRc0HWi42SOG0nKx6/9ZXcTj07AP82jrn9Ss6AJT3SYliLZuQVn15GE1SkV62/hkrhG3+b2O4Q+VYX34V9f1Q/2SYUKepke8sl3eXd42JE2EHWD1bFiw8uBetutwdoDE9Q5Svoc/Ru+Qrwc5N9oIsySZF5ZzCXteYCCR87ASHuctxjkuUWFBA8noOM3aWvOZEz0V31/CxiquTax1zBih9a2UewUJSj6Qtv5s6inIv6OFI28IhKvyhT6vkiJ4XLQ2+zr9BYLjpmyYfcS69LNf07oFkmohRZU0qIxHnwNO7C6+ey27yeoGeA4l4PkgRosBPClHnWid+a/vhRByLdfH2LhOuiGVqixvf7h0FuNVbqYMOLOIMbhufyb0LkG5eQRbLru2D/4FEaDCd7v5X+j6o+erjSB+qChjQll/8eGXwLmg+jQQyowoiq7mWez5clFZJOitEdb73K1YCPUvjBlRehZ4zbOT2AgCIEZ6AsBMULZI/TL7qDsn+ZNcgSJq7ZIoq30Q8nw7rCpj75oSlYs4N0F7Xag2KObEw93aSlgdcYc+wF/+oR7PUsXTYZ2DD2phPNCPsO7A3m4LjzZRfTEKdSccA2J5A9cUY+YuTiv4HgGfxLStt67K02lO335ss1kufsNxzMJoZVIIztNjlzocV/wrR7ucXk4GJ4uvMF9H6PN/jkXm2xHOz9oj0BTP3y+T2K47Qom0lWwSPbnMuylJGCTKsE5ro5Zu/az5FVJltadeYXrUhWICCu5wM/uO5uWIkhVkXqrBuu+Qi+MAtpfMcNFfPDbECSorIr3F6lutto1mk/4RF7TMitV96k0Baqypt7Q02IHzDEzClYweLVv/l0fn/GNsMg/On7rFTjlvlU9HUrp9QxmckzoJo7/XQ1BqRE+HA3rGvlH4xUX1F50XcG3oJG+MGi0g32+iz2HiInJHXQ81lk4U3cow2IjlKdSvPMKcwPuW5xpswi17R98e+9JKMsL06Z5Tg5fhUEWmmtAOMRjX0QUMhVu2dGXCuSfjq1axm09vZNlmeB29tVhVwzziBKBzlrW+ewp/JjVM51sWLNoTzZfQSBVcIq1Jbe00li/5Vk00dLJF6yQ0qvc9MEuKYcOjrh1CERfaCA2zewqA07+f8vV+E3FJEeGpMbRMFLwlXPUDRaZKzte62VbnlotF7ylMhXJKmrmRiMKXLKGh6n+C/Su0WTHPWl0ATjFXTdulkmoofjs10V4sdk0UzIRo8Pl4lyycwQ0aZCkqhZZWi/S2U+bVRcXAIXJMdx/WCUld5NDlrxzDrjs1EZTHvYkNNu3VxaxJ+UMW0mOaa1uq/Q8IfAlTxU8lVBV8Ka4vULY3Ue6+s7uQi0pMnI76MDwEtyH5lrX4eugGULxBBDROLnd3gsEcvkNusC1eyQ02rR3F7j5fEHYLNM/47NnOxyc+hNbO/YFnd55pA96yw35pQ3BmK2dei2JmEkNEMH5qLfS+edzrhWCauTHmdki+tGSMOdbiJPSoqk8bUjeq/tWgYK3AtvY5jlBdY61yTOceCsLZmhWUDz8NVC4JQwbuFI/OwlB5ETtVcKnUedOC5hnXX73uj7hb47xCKaBYaBMERVZNLXwRA5qotwipdcR5iVIwQ94GUkxE//HMPgluW7l7SPlEEAFOBf+QSBvNT3U18EnVXh4NPjHCEFOWFavdTGy2k612Y94TCJKheseqyiVOGjFeXc3SgLEAMZi09kMvFVBUzgXI8k/yxJMP4mk/s5fXjD6QEyytsJc79qgxko8tX9DAqWbVJ1GLf/xiiWrklGqfbmDDwUcsgv6/r6VrthXI31sNGwjlk0EjG8Rc74qf2r6OEHsRPcXdaNkIxzHqvVIVYYgAA/vDIy3sZX/cW7l7kZxDWHK8cO4ojmxzYOaHGszObhVLI5wiuUb2jI2pSv2CqXqwKoLULkb+4jL0rWrpudICmP+J6GpwBQiI41w2PikOsxLK96VDeE3f7OybNNhxe/pw8ahKYWzrY1mmaKSQ8Uzh668DSgiPHpB+BVLdMpuED27frgKxUDgqdDfFVtcNrtgdhGzFJO3DopnGl+ng+qFkHQ9VxDhKxYVF71NvbniXB0MA70WbSyFjhl7SVThXoOuD7/9m7mVL3Wd1ejweVfLVG4Owmd4LWDPb9eeC0XD9YxKzhA7R3SM5/EjJHbO7jgUGCqh8MUV2DxKkmbm5GF1CJQ8/IbgvzfglloxoFfD4lfNVSX6FW1VD4R7tCKwa6ssCH7eLY/QfA7X+6IUOERo+2Yrs4wm2/KUNoykLOZ+zONIOY/cZRciFNvF6Ob9cIwFep8QadPViLajEoRO0QbGMrWizpkFKzDKoSwVg+CXTxVl7hYjI0+kvQZG+MgP7RMOEjNpQaK/c7EC0mx3nDYS8kqVo58U3aLHLSwcbQk7amNG2RcOcSGtz1yI7U6uLhiMYf/gyP4PGKWjIeNcjUaHdkMvUlFlzQwodYBr0YkfVzcOprnhQIFyjx7fFiFcp3M/9Ca64FlNdXVSEo3Os9CVH2RTbZS6BfX2MMIxVr3gVrmWD/Tn7TpSjQkZj/CFZfp59XG6OMWkEzlMeR9rcosoD/BaBq7HsxYdjE4xCNtjSZWZACHVKPc+N67rm38xI1JRQn7agOf6PQ8cWSJWXvNLlqucXymWExkAzFbEM0TFEpbZG3nyRFlltag0smTqhhTTE9D3+GgFErTpOPGQZs/Qwrnrj+EVxiFGCuAJVoSk4sfgT73ybcU/CwDfNy941S0dB6QIUjns3EdokzVDSdbYhcVFujbE0sM+vNRzRbpuFVbWO9mOWRuryEHXaKxzAYe+ekZp7WwqGnb9RmtG6vayyIBxy0bS2hWE3mr11gjw7cLFhXbd7NxMNGisPpD6WaU7OeYg7JMriPC00AYsXjeVBqsPNGuxAYneGEF8KtL5S4rh0Yqsee2AVz4ekekWYicL6piURCaYVTnkkNRCNsGy44gEYTy4J3gOZuAW0Z76sGgG4D1Sz3BQyi2l6yJ9TH0imVDqS54PArR0ok0KzT9+YayPpZivRlKbLvY3dG+Xkx+dXZ9BdPQJKu+MITezgweIOeCLGZ2I9DLkBxEdTkzSvfC4u9vz54gbv0TIwjo/t+0mYW2jb5IIQiYVCVW7X/8G3MKmmMPJFIYdNnkH8ect0/yeEoa9PxXv9Hs31f+zUgFHir4piBCV0R11HmdH/ytOYDVB9xCkLl3SAQiKgUPY0J8GgPnpayo6K4nO12xaWNIhqJ34n4IGKrXT1jO0QacvGBFoeo0OTNcZusDyLndr+e77TuxdPVjZXoMf8tfO5kzskCKDCLKVTWcp6XUZtlHx40dmFPLPdoSEb7aFm5q+NG9e/sSsbz9Nx8J/vUqVY3Jnw8A5fgqVCXclGPv6WudTjS0hUaejfvVBNwHCJ/346HilznCfRs8IYi1Tizt8/AhxaA5qQgDSiGpqPmoBDYt6VcSJKWhHJCexvpfLv9NBGw58jnYB1ZiZA8YNnFvDRLm7U3f8o1EEFBMQSLXetR/lbUCbP7o+7a5LgNq4Gb5gqzy6Hq4Mb6ATdlcuie5Pn1KHK7dnzFfNKHweU/TZ6O8SYgSHW5v2Sng2Rc+LeNGICASE0MMhJQGmruIYfUEKS+Oe+Bn2+70wOFNR3/DyHX9+Rm5v6jB7tBd4EwjldIkt3AsWaiOTIBCyUW2QtcaxdyEPWDmB7F48/2l5GI5bHEabaks20SehhwcodY3Wu7GPDnuPmfvpcjU9vOPzyJiC/icNDExZMqeFMC4qnhR59IrLfVXEkxqnxdGFDQNDOIVojX0xhpyD+X5fntoVsT/dTJ3qT07797/++mZ5VrwWqdMczM/dpZdxAIGAZcJ3qT+/2/43H2bNMbDdAEpHf7uIT6fGN5C4IhQdaq/URibZArarylcK4/HdYbqatJGOdXX9f1+KWMJcH+g/xE7zImFPIt4zSGDmC1j9sXX9fTSca+Y6Xw/X6jMd23lvF4zjGC8ZGDbKWctkQx1aVR8SvIdSmYDQsCB98U3KrKntef6+oAQwzYByFYujqJMeG2E5eMIwAzlsFCBbW5BhuhJku6+4wjAUdvTZWXJ+wInIK5xQHXUUPSJdFtx8EA1GCtrthNot/VKYqPMuRcHUsrflR5zmW+4EocFNp1K8nCiRznevR6po4M3aVXvNZBFK6R5LsmlCKFxYMMNf2Fy52i7DV8HAQDADDuwhkHcDjjLlXOJoEk0Y1MbSBa532pmCNT7rYQDMP6CLcgtja5UtLepiAFdU2xI8j3ksFEc4V13Z61Okkg5+Z401L4MzQTo5MPlPC0jeJ4DJb1L8FAMJClek+UsyW+Huv7Kvdkhlsx1cfidiRVZuV4cghHvqcrDNNz1hfs+flnZ/hgJxrUj9guQUCQzTV90dKuZF9rWL3WJ5i07JZwi0TZFlNVFfxX9he8l+fnjLCtPu8Ke6H5MyaKNaqw1o2mrBJW8qZIctoMZm3ki9uVA3Zrru2SZOWzjyY0j7HZX8N2BmJVYNilAWB4nwfm1738ro/p49qwopTZX6bV7Ml1uFo6QCo9HFWRoV9onBMO1lytAUEOugrvKdVSKbQEK+07rqYeC3HX0Ym9zT7oYwOQ/VkhQWDeiUg87/9rvEhv3ZXuCkdL7YN5rs6l9KA8kbQrkrvugCDWlLgxEtIaA0SECmW+T+4qNip2PY7NEbckfFZVHG/fHVkHSHX1VVyLMCqsnbJ9JgW0vJz5prgaQE9SWxFi8J0fSXPRcpLEzCASkdagPPDv0V+po55STmjIieQve9xRrUGnaXI63BeR8vWzRs5MxqnUEg+6v/LPgBSIibD3eRvp2eQqfi5AUnpc17sQHOJGg/Wc1qr1ndZ1oyXw0DsobdBkzZrbSfzGpMt6fbmeYdExNn0R+n7yDPTQxZIFwXEwZTQRPazsGqznaShjz5x+hSKSgGEU//ftr4VJ/3uHK/Cn3JNQIAtMDLsP8J4PDdHhcCmIh97e/bC+X27tcUnOITXr9b8rG/emic4PkI+i/OcBXTfAudAtZhV788/4kBT3uGTBzLnn/yyW53pUci+rllJImRKafQg1uwwLTaQ1agN2dNRmpCCclFwi+sRKofuu2UE8FlZBP3EVbTPvGBTX5ivgcWVMnHxYEn/Xm5njMlYTdy/FjKPcg6r1fTLh62Sdz5qr9TFESMpjy+BH0hw3IHvyAR5VTZLHqjDAkdsVaQ6Mt98zx+8JnrYMjLwFmMB/puXvEsw6X4sgz9FoJSMfM0A5WvX3m2PA57ZjPg97Y5Xiy0PRNFwS+vC1sFzMd1U3QofIENQPfmwoAYLa2hDKp/m5jfyOCfvUGaJBP7PP7SWDjZFdDgP9UX3cXA14QJeO+wcAqGOF0ESm8mc7BYq7pE5tWQzff0jCvCqWh24vc4hdQmG3Z357sxEPeihr2xd3+WRC3y5ezCmgrijC0c2ABpYOlrDz4+gS5nGQtCYIPLO/jx7VQEmTbpZ5fvvFhlZ5GKlpJ4jf0/cegxG7Oey3qctWP8Oybi8vA25xSHgDPj12tlvzNffI5OirPNeHJAyFDjVzSyjtMwexlA1kJYNHH1mLBAGVm9zCG5p21/zfRWb3bzk6TN23q8L4aJw2J3vWpbdXtfdrEC4TLX8SFT/4Ft6nu5oQf57onDZ+JZDr3hbDVgc1atL0Egx6HfveFWC5kwMukvE7d6GE+4Gu0iM+3zbL73fAVdobTblI/ESHETKmpxRv5Hvmt4RteREv28OboO7UUsUCIi+3TqOUSWni+0+tGGr23P2fcJs//TjU8rBzcIiszeNZrFRb3Fw9JSSO70yM/9iJ0PwWsadp6meMmpuTdIBzFEWZRujXfsJ6Yh+v85POat/bV9Sl2MVKskGr5IsTKvTJ+4DVsBsw+bze7MtFakbMSlG4ofpQjWh8v10V28WrK1XgBTBvfI6n01oVJesgRKlJLzreJP55TOf1cYbm5MkXfzVDVHjdiJwHnN3wfnPYGF0ptufh7iMOFfmbGaTO+pkHRh7Mk/s0zDdbej9XwU+mCwg73OSs1WYCSdIBlg2id+aqTuL0+smcEUfApmkDWmmXyXqMBkU0VDgL+hib4wMM6Zep1fuD5x6ivmYvFfGimCR5dso0O9QDtwMGofUsiKijvMywGzwGx47AVI1Dm/lwqNE1AcRJBLYjwu4izoFVUbtIvgXsGKxNi/C2K3mbBr9K3V8MlohKsjvRRWl1sZsTxuceQEt8y86mkGhAclCis5Chsq/3m2vNF787XtCRL6+6cytasY7CQULz6RKG+eeA/nVQZJIVp3lX+3zWgE2xgXpHXjxa6mrrGuqj2OnxG6iem0CXxZVjaTV9YcBQadoEngN+nsSe6J4mJLETP7M4fRi2XsOPj/1+cEr3EqHTc6wIsBr0K3srPRAfTPQ9i8WT+HCERBlicficZgErXdKuhPGaY+ruK/gcsvCGuT83ff6iNJb9uZSvqRXFq5INTSlbcUwRpYHGEerbrtWx/6TQf99djGyMPTulVirrcT/N+YlySnqcudfVIVDt4N2ZG8m+R1DyURiJeIFDLIk8ncqP0V6cQujj3QDwwZ3ClPOUGDWOthVvoIfBjqkzbMKwHq90xei7SxYzStGFLDGuTizjeiAj2cRBgsiTSAvGptTZZ2ZtvNpcp69uzKhs/wZPLh6pZdTTWDjXcy8VMll39aHlwDkZAS9hV+CscovlLeCBANsLn2kgGzkIwMdSWRLbZSGNNakYgoi979Lkggbx4ZLq//uBLvWnWanB5kmeqoW/ep12BVym7a+UX7noARSlcJnk/tIAlJwGjavbvYDh9I59goLhZ1RIE1UsT8ARB1XAkB6Qu6goyKkOB7dIpoxbgPuWbNrH5yqbZMfpC/byCb/zE8bREceQeCAmK0EF4ef6WaCg+9DFrsKlFnTCWZK3CyaaDGPowXRU26W1o4Fd8DTFMZ0Zjs+SLBYvuvyOUS1HJuaLKQ+PDqv6jmjXgbq7KXTeN5wc86oX/xzB2UQOkqfefXrRwfisoRbgaoeDWJgt1ipEuAhuqOJ2qXeIMJzBmF6fKGA7TjVO9fU3jaxdYgcIQ0fWjYTp91kMUqrRpTmiuY/auI2t2Z9VyrXZyJA1bZ2DvsKDptP0bPtOR0K2G8n3id74V1i1TceG3fp1r7jC3oEgvEVrOcOc7r/RMHvJUGBAhNSy3Ctch6Vg4/z1QNZnF07lB0eO5wTTbTI8TNGmSRze78KmpuwAbp2VVo1B/efdycQLA0bjCpIbn0RlANSek6XfwEfQ3Bym9zTmjrQ3D6Ug8hkFKzwl0lFYR3TkgM8YuOioSmL3TduGPXBtiq3ny3LZrxaz1oh/zJjlG2omhWFXvSXgx823KD10MTcdPkl5wxzbmQxfj/kx5WpywjTsqL1V6zgf0Bm2YgTUdAl2Qi7qI+9/KyTNsBgio97qWDyveMRAmIer+zAxCtSE1Ekux6+6KEydr17gs/k1LMqGtMgBflMKvnXQpqKHgN38IBCOuq7FBMAWiFgC6fDzUofUrEUupU6YOcTq6THSyReavuqMLfYYF0JQsWXwycGuc+/zd6iMhCp8gzA/eoJ6fUDu1AXq/eTEeMSwR7Nke+jqBSBtEYWVIPZJ/Q7fwmezk3eM3jbznku3pGEvMQoWDAr1gpcUMuxg9tp2eF3OYJ380AWMKgJIE69uzXQIZz1BVwzrPiV5QY6AUn9hxRzMNhF6XVoPigR+bjdRa62oI20KbbtsdDN4uX8dJPd7gFKYW5QBasbrFrqtfewO/GVkgdGt75VsuEuzgN3q+xJqydp2dzbWaSlGJxgv/ik7E6ykK3t+frageGP5XWGu57KxPTYiKUP8F7m97ZEzOuG86DfnoMDK0SVufOOWAzBKIGSIpVnSLrZoykK5Om+ZGb0UBux5ivxjKP8gSx0iqehZTDEGNgwz6qR4xgrQv3WfdpFQn2O5CadWBIy+2npZr2ouiiwmfT/IrnKcsbmq7BdzIx17s/Ezt3SCHlPZfrlPt2D3vrn1frUzsKCmFba0RyXIN6J8EFnm+3OPFeQo6d2eHUg8cTmijxCoXpo4oii0VUnAFHPgBbLVBSX/QUIp7rCtPutswTffzEVRfbufKOF6PA1VGSZMmmzU/fSX4DP8xo8V5wLbfedtpAxpCAQfvsH0xBLVYf8kpuZpui3q8lO0CY0UQMnAzPb+8OHMlLPZATQskzD2C6gqmOdQ2qrDNk7z+3fIQ1UmXROzsJ0ct7g7i9v10x90jdIKiKVtXHRqP17TFazzbLFCw5CCrwItrCg+3V4AYVvbPeKDXsfqpGFEcShoLCjcVfB3iIg93R5EpNoBtjoJqWwiXIbqe1HaCu9PqsgM/GICHVY+5rsw2oBd43NoxiVA+yG+6RkEO4eQZ2OuR76tuXx3Z2uq7eZN6lIxHHkDW/NhAtnFxT5kyzLYk/kdpr2ocJNwAnc/JFhSCyR0UJCqY+mLo8+ZSfMQazsrpRM1ccaTiDrxvJkwTXckhX62TrRT+lFPW4+JHZTdhQnd1qH2uK3uRlb+Ncj1mnRWzsh+qK1h91uQnbxoBA+rqB2L+++7ym452p51KVKEeYxzlYHKBnGq0cWIvz9UjvJwD3krycBTEzviLVBvPreD6buICYM8KpL2zkFsr++dbSitOKxZr7hllevTqOxbB6cNgyuEzIBlmLSr37no7f+2/AS4RlmSo2/yWRlfeUxvk74AWYDLh4591UyLlAHoXYRWAmx8ZRTVBc1IisY+QNJF8IJaFh3JOMPw1n6UGfZqiU3KY1k0ywRZhvvdBRvBwY/FtyinommTQWt2GMeSl4hB4SwEdDu55PwV73M8KLRl+oX1rYGlAoqz3WVO6mV4UXRQOVwZpvpi4bVmqXVDRiOSECRxx2kuNlK0zlnoNUbQQ6I5B72LSW2isKB8H9kZ0fA1iAqZt/oSwaOU1jZKuQJOSZGqxOLdP9gq78Cz/D+0TDzVETfwQQb28i7PMN9fTcXjXcsaUi9WBu7PKtC9cECWHq14BYT4OPHQv4G0IactCj3Lgo9m5kdzlKDLkUZf1kJVEUfQb7QjqjbpIs0wq3EnoolrvKJ+Tnejg+9muR39jZmtTknNsHm3sCuTpmCtgH41vzWyAKMzL6jGnm0QBJRdWxJkqGQBriertXnIyMkCAuG/yGOoPwHTH+ea1f4Z8vtCT1VMaK8eBNbbRFXYDY9KLfdiGVvrjAaPtDJycpwf5SdwIP1aR/W2oMpJHxhuenM2aA0B2Em2yKXjrY4kYXp57NM9XSqRxUCoeQmZwPX+zQnic3uJ1cNR8+YtKAz7l5I3MQFwAiBjMpFjYu6IHEE8IiYBO50C1CREdkwV/QjIGEhyHedxIHR4ac537tFbDhjYaEew1o1kQCyVl8pt6BnWqiMCAzVCzWZMlYl94+jY3NnbBKoyGEHI3KvHRCeyz+uSKGnnWgMFAO3c9K3aZGudXGqqRF3wBfEynjlqkK+tVe+NO7ssBC97unvv756oX5jAQ2lo08AmgD6HtSciMi7lM6l7aOen0ZKOc6fCJU4AYaZE3qXL7Bgpy3Sqt6lYNmVjzHSjWs60cpcBWiTa02kUxLuvhR8TBgXCAQs3/a4/LDsVFOjtmAnkK+vAa3HR07VgDExwfSfTatQLiCxGICY7D/euD4LAO1c5ttrv6opmYcWokp4t2CeEAV9dsO4QyzUsndpEv+ISEnwZXdYBR4ZWR7nUIOH96qTHqwF0gjhFuPm2O/+aEcpiq1vDE3BHJuUi0P+tFKU0yM7vY3Y3Y1q2iYPtunc55HUESz0fzZpcfXDzuczxYZ779Kv3OUYoVxOJYthrk7aJNKQxaw2xrv605axm4srLTEMQ+ZG8iYbo02zWn/9VLEaf6VspBNRdapBrqgQCbr3mNFuuar/tYl31PzpzlursnwAaG/MK0XmWVUbnfCD5lvUP181dzy0Tg6B2RwPoop+66yd3hi113snttm47uyV4EpLNqpQxW95FW6trocf2M+EvkAdtb80fdQJycls2fKfpMQtD+6f4qYzuvhwakFj3ogYF+PIKYODTcwol8jZhYzcq9n8Ls25zOArkZo9qOHnzz5mr2i1qe7br8jbbKopgnNsOiEkoz+wo2ejwfWJf0BzYycZFEkdQKvm6tO8zhAvv0FvSEL2CLvZ2kP+nsFey8Bkqgicc8PBAp/UxK80IMxek5EtoZGywn39i2D62o2pbhHmLbkeT/KoN2xtVOEe8gW19gGyZqQ5wsg+YKJoh8FIUAIa/P6iO0Pz4mrSbFNIf6EXxbwxh4h3vHo9m7ocXPUL9XalqJAQOc5GQoHew+BAvc/6U9j2EUcea3cckCLqitaTVUf3erGuiIRFf/iiYIND3ii7GIm3Vl5VCBQcokFSB82WAtvCefQDqUYY1Mek5Zs9SBf4z38U+G1HxLJEmm7SeGodckNhE3ZZGj6ho6AN3HGUfE+5OlDzBGgRvNq0SGLBsLZfB6FI+3LAy03SQnXubDhijF7Oey3Wjtw09aKqAPhQOY59U+HhqcNW1Nb3IcUMqDcZ3LKT1Y0etTBWRAHfYoYpw8eUL7hfj3alQ2QfhYwnC+BuM5tXrbyKaxQFlvtIW4Oi8lFn5Pyk817yoCAsgcgoqs7IsrtZgN6DNNkDo4zNd9uU/PZXmA3+Oy+1ACMZ4kidxJPGnCJ/PPvPBgrLF6cI0vxxBCSK0/Bq0Ub8F4kIRwuHw6FpgpEKzmfMhs+4N5uyUDUc2shwBmh3MoU7x02IiSRywX+6pj8b50TDpoLjqcTHAjtfUiwckrp8aHGs0gDAPqdfJiNYPw8+5YQtbHHa28TaOjH/SQFoMGhkz3pR+ZIWyM1KhBjnHxGMixHSEOZpUCB75dG/77BL8gsDBBAw7HVzFfn+9quNKGVlasJotzx7MEU0QQ8apBt6PhS6Q0atGYg43AJ938FcMYyqkaP/TjS0wCHHe/Syc/NplIJqsy7J4M+Tu+U1ePvPvykjM7rS1+abnSzn38KJb3LF88txb4Dp24B5QtCVwvK+328i5rmrM0uEB2uRyCo+mDXshmRqKiUo8M9r1lbasd+9rPsK8UhTuOvsmGBoBhlAlrmv39xt0IWS/Dl0IikLTooGk8K3vFJLkMMHEV5lpcf+p7PiW8jWcMxYFNqtEXfSa1jOBd9vWAxTEUEt9r7RMZgBaCZ3Jf1gQeRFUyV63iOIkGoUCXRZq8mLjDYwN5IG84U8nmlmU5vw3o89RfqHMJPhQFELNNokQrPNJ1Suts2m5RzfGSaOsFhSnBBUkfiWwHw675CrPnIQMwNFhfawdavwIz3afHdCQme6B3wEO0GTMzbYHKRVRJyIbTN/f5W/9gfuaqk3UKRqIbxlknQ4kvKvd0nrngG8ju0ESJmya1t989CMVD9xfWIF+CyNCTKFLy1GeOhYhYkxTi4ZBb/NsLsrfx4yd3yapxUAnNbg4hMHxEjWiYD6zJnt4kI5rdLcHidAaPTaReraVBWRV1MOvchrMyLh+G9X5mGpBT2xxaqZj+dteeytw97i2uoDhOQIxExvG6SKFUJrq+/1G8UvTFBsEgFnZ204LtKryK6SRXGz7oLHNtlpMCsqWpyeye9Hz15oYFydSiDOcOP0QM6trVcNQmUm0bZkgMjlyZJHy7PrtI2Vr8MLk7Ob6NdL881CAn9K97REZ5AE1HP5NyqGoYgpTssBIuxJ1wBjzB/h61HEOtS/xNrbh1nyPN2/z0MMKkwbj4d4z3TcKYiP2j/cQcDPf/YvlBvuvPVTxZjdLvcRjYETwC9JM+KTGz6UOSC21gFsn793veNKoU2G6/iPuJuZ09kiIJuvykw5mYpXyqadnxM6COXKAe2ZivlDd+GxDzXVOeUdLqVOcdNEKZPIhgmYjBZdF8ChHQaqUHBLOCxY6t3GoHzS6BpsbXoWv3JnY9tXpm3/nvbEFgU0D2SvGKlWnNIYCkb4PKneYUJ7rEgZgAxtsmCIV++BbsC8ihxcQqGs3kugCALzJGk7VzP524LpI92xtKfRR7t3evnNgy+8YKtv1GQYQpCzOgehWhXITFNU1PZSb+dsJL16gwRV7qirTgrBMXX/Saf+NJD6Jg5h498pcTaBM+yu16z6bclDnCEILVbY5y1Z+QgGn7COq4NBX7ZSPxs0kCbpfqBlp8R8L8cMOTbQuYXIZoJRkXXlbMqSwg4nMdXLhEXJe3u5CwhovbjeDBetEd89jEzkmuSaeIjGASqjPFmVNVB3PAk2OUUIKVI4icngNRiX0X6SxMcKMbAIKomtkpee38A9y/L280J2h/e9woqhJRdk8vAjZU8WqTNFPK/0uTfE/inGQ4laGrzUAAMUpnm5apkTaddskCfdto0xwkM5bfQEbyUhZl+I7bcAcX+crYDDyHkvO7QEnoAXHRRT1y3pyGkB9U9771O1XHCuy/30nMGaX4ZUUu6j1Pme4+nwqw9vgVNcbp+/f+a5cNdGcRcAIT5LhoQHBGTkeOd6knmTmsSC9PxhU/ahnVAyT0gj4HACSPylOn1PPu/pZn/8r22TDiP/2pIP6bydwNO2SYPbKoNdbN32G4HUl9FL75rUFYSaHXcbQ6XZ/lAcXb9MuVLp968wA4Wf0YNu8KIaU1h4BKe/ouexO+PPO5fKTESvqUu8reCh+SdwXqwkdQNV6tlFBoKsTn6M/lGg8HE9sZInGorABBONnTtRh4iSrXwWRe2q62e82hT2YHnaxQTnCSG1qS3H5h1m0BW+284/H3ZOqwU5406e6dKkAD2gMZ4VHal/nauZ1HaoE1JE56F8OWytxG9G9Bn/4vYKMH7C2Y6AjgpFXdnOZGLTLDdzNwbpZzYzRZJArOl8KYqYO6P78BpDGp1bm+Vry7fUr/QjEKEu6mndGgsAEt+LFr1i0qeaGDhJxZPKNituAcwnoBGHNWJW7q27XmRbpAudYI4+rZgzXSU60QtwAzvV+NZUzxbaWoycuZ6yDys+FFsMr/VCYA1tTQeUXMzBHzsUOkegw/4VG5a7XBRDyeVwUrmWUGU4EYowjowbQFnQ+/znRf1BvNbwyDrcUvwWAACrT7NEgl80aMfGNhMnKobuOGvWV3PGymExxV++MxnqmudFTktkdlOqsIc5enz4rZV0vBuNbTrhPsv7zrFnipu0zaXwmvjq2a4XZNgxrkcREfprbt5kkA9rmpE1y8ZoL/WUNMBFTLOt2saYIM3ug1bZ0TakamkPwPL3LL0ZAdHsaGLsJQKR3qxG1oOL7/jOdexNRB4yBwI23d0kfzq+1cLdcA6AzMDwabhGTC14Gy0+Hu+R4nmRTcuQ6hg5cMSghzuSsuKOTgKb/i3R0Zud//4isIPYBsuwazW/KNl2UhMrsn1cJg2tHFySrjsZKfA4ZtyIICVSCwDZnXXF2KB8MyEt3ohRyDwRK8SlB/YWHJemZKbKJKi3+LNYqOLWbacrMA72HA5hCEGWxrmTRq5BfoNyOw8+90VZa6ixiR3gX6+B2aK8WQKb219PvZEZhEtcKr3iTwGhZ9q/Tg3DcmPt7D+RiJ46sLAfO32xExtZzIIV9YFmq9hUnnnzOa4zmoJKmhSnY5mCXOibBNtpz8pKPw3iRXFLrkuz6SbelqWTJFYkZBoF/2oTv7FUOT6oIODVpvsYTq4aEIsmRXom05AwGWGVIQmMEEMHdZv4iRAby9bUPK9S7BAeN3WHy4snitntOKIt+qEZvr81dv7T+cQmJHD6s00WjxFKj10eC5yc6ySvjTx456Rl/ejuBCf+lD4DpCaLuaXMaRN3BirPkWYVMtpAIbaShNEosOtG/H1S3/RsZB1k2+dvAvdzuovYDSppFTspVSK9noBiG9QO8fokg0jUfh7OinpNdCR7GfYPtXwLJzkw+7xgx/YYSX9hNRa8uQTVYu/tcIuDGUJImIW3BYvGQdV6HsqrXrXegoVpygNBoTT7IjD3evR6mDyv1I2a6161EYnfYmijuPok5+9XwvrxNZ1tWPiNDDmRMctT3LFlA+/XZQ9BIZSvdZ+P12Ag/SxW0y4yN1JQhjLRvZodWan2CkXnz+PPY0IN/DVJ3gkkhspzTAErEctajhSN4wb77kv46DsZOkKvabQ45KhdDb/G26IkO2CBG/Wp6boUSW2LBR0IaqkwcgNxgwhrdRiOSQC1yeRba6fVm702PUnMjxyquos7NExg4KyBo4uXuW9JSlLmr1DYbvC90tMVIEzcQ+9gAWKvd5DRWcmWLSSBLax/owFiy92vyFaxoPxjrX23sfQjIaylA1PEBXYNXj7sMO1vqlH5Q/XauuH1M4qKLIUkp+Bj5PmpgVYKZKep166n4BNuD5RH/pZU9dEvbqtpihukeBs+0fgj3pHTL1ZBgA3gPoF3/+c2uxCQ93YM80zjgLuoP6fj/ni0bzmu/Nq1bGcSkePDNvLdIsmKEqX10TD7zYOBDq1seVZmzZhmFeHxEgsOO5MVD2clIXM/duVT0abAFMEASowyo4YiGF/yMTCVOAuBOd/5YeT4LCJxqOtiBEtsKB9Pm42dHCjREXkZmuZin9v1zOanRemB2OCR0Q/nr3kuDSRdV91qnxSrJvgN5UNj5wKzkFnclst87FuVyE8Kq+Z3KNR04GEuE7SUpLEwMKKiUQpPm2CVmYMk18ZTRPuAsUG3iQQFWAsplZvXS8VsGGhMMOCW+Xf8MgoU5o/X3AOUBBu4apvIAabPEmMGcL9iFT/yBCzNKvd6nrgWjvSdCoj2N1ePvu4sUHXRc6GXJwolya6xLpD3gSvLlCC8LrC7IRSAP75P5JZtm8/LRoaCJBftlWyIX7UFBUUplHdZH3GPWdOtvJTqg8h1oFrQoXxUxPBXKOgB7kdN9GvuGbMdWOTyEUfctP+Tv7VaIkyXgcpn1orfhkR/IMzrCS4FvODUth31OJM5PNweuQ0J8pdvzciYAW8AIuObgA9eC6qHGVN8B2dc+178RM4YklzfP0IXUTGzptBWKkn8iA98aBuZirho0LVQpy85K/6lPwvrU7yNeFTayUnhRFImkQwwp+RcCsJl4KuCpN4nMTpdtEIbWlDPSJhqFZ1Z/6r88oGwLF9RefyiOR2ftmPorL2XO/9vblQ3a+35hWKVDdGBn9JegFyXCd5poaX3iIYFt1nXdSbUYDP2K3hRVg2ol0+nUdsPLGVfhbgI31FdSaDTfHNSPCc90FND4fBPqJsTNCQi1eW2NBEnXxhoqy4xVTv7JdnvCanchSxPm7FSXGjRYIw5N6Hx8HIaqaOfpjhvd2Xr15714d8p5EXzD2TWYcj02seZHKyvZ69ItrbBmk2iMuuEt04XANKwoLsxEFDqTiJUNooNs79/JPdr+B4SGG1LoWzt1rYEz5Qv+KYkg4pUv4g1ikmt5igE9+ypNvyjSt5ewGx389FvwxbN8XfWO+IjLTbZMum03dFdaBnw95uSt96skM8vSFERQKHdi32Z0BVnw7s/LCwlqUprn1GB4LAEB7nqJHYIfnz4zx/iJZOG/yPoUuuFvQYxCXuaEW8BGc/wks8PoHr/2rg7TxyJ+PR8YokqD8kzMXytP655z/kB8oJQCEMNP34VTvXcKeT8l2p2tp7ZfMHFwiP+2XNHYED1XL8sY68ttw6RueRXEQ34f9i1iOq7FuIidSkWTsSEqTYxVxkaOqnMJVgaTpBCjxH8gkoBGjDt9TxRaRDMq8XfIpHCllft+GZOLt9U3MSY/qiMQ1aGeJ9Frbs552bQJt3mellD1hgNc/yTAEbbF9ZrAunFOKllyog3eXbxacmkR2FeB/s6nj+n5SyU/EML4Ocj4atpRnFM6OOJ0UzQRSTuj7tOwtjepZO37gJQZBOPKUIsaoLjAzkx0EIgTtxK1KK2ucWIxDLRzAVxeDHJl72EVUdKHOLX9fEjPnTXHTca7m4YEF7BDFg2V2rIaI82cE6DZ0PCMdOX8C8geG/s84IMERRZTc8dGJ0Ty9YtSqygC/qqQan8ncT40bW7IfVBGTdfu7wGbbvQQuBsfhgzc1Ys/yyXWsGGSXtfblAWzlviO8yEQ2mv3fOXQVnQHuQTFr4FJks6CdSxkga5Ot4CULxl3/glWWXyJ8TsFjdBGRC6sgfZKJD3NIW0qZiRsTCessZ2xOvXsqM7JQjxdbxmIutZKhstdqDusR0HD61JtUSgxZYSHbxEGek6qj9bime8UQ4DPwOIfHoguJwXKhTdMTWbTn3C281DdrUcaADiOTLANbe5jRhEN4QZJkfNqjvqgP3ZP6f/NqGURn/BRcQBSeOrVVosO0yAZ5YPkstM4hMTtMsX716NTvXwfZq3H+2yp1x8S8vP7I5zb7N7EsDfFPiPGrko7xInPCJaBsVgCAStmx9PS3AX+pQepg1L3uB0lXtu1TE7AAwAB7siAhSkkPCwWOKPh1yrEXas3w6/OdDNmBhat2GO8jsSaGl9apVQDMyFcWRIR851NhW3H1wDe0IUhttW0eNTuqF0pBzKzC0r2xOpwAg993FZzQIXNa/k2EXf1KgsIpK8hv6S+fxTO05NMbqyPcGfhojRlT8TLPUD4V5Nn8MOTDHv9ctMMlU4XjCV9kSlGOXGTPm5gtBjU5T7p3hSq1Ho8AVPyiH9hVXfZX8JO9nDUpAWTBVkm7d86NpgcxkeHqpVWkQv1SoYhi82lrv2rYkfZfFMvCnlHfJr4u1PyMEnJ+I2H+F25y8yIMjRdyl8rJyBhPqKpdWezw3Y9AFcMc5AGPVEgcf6a/oNuKokj1vEnKi5Rn9fW46fgnSFM9CxETP51EIMLJE2UhcFI0gevxtYU3R9dQM7L+DsUEpU4fNgEUOwoeHWqSNYLqGlBjo6kPXORLMJ//ynkj++icFtBeZEh7FLM/Qn5eCBTsbvTRgAcjBmSbmDqO1kBb2VKFQw0xEZWcFRRLXtMl+p+2CP1n3zVtAcWie5tOAwqXhGG5N+eXQA5XokN+0lqco8I2uEVEpiHHsQHc1FH1GRG0RORBPvkvdR1YeGhEPLtz0Lkw+mx1IDdpu1R4nqrSfFvBNBt87eNbyefrfeP3Nk9wwl4dyxhsaTz4/q1Gz76McbMpcPApVjcajeY/yT9csV0YXQVwRyOcyVCsdbO3wjWx0AZ2YX6ZWjGTgrNu8gamdkVXKtPsIzQpFNQ8s+UQpbNzWLZ7m3ZpLlLQer+SKao0DjCwW9m820AsEmyzhCyPm9V3k3FjtIyLd6sbS4R1Skqv4SLE6yDN2L+5515mmyge7N64qqd0PzmVbFLD0fMFbrgwooJexCKfafLU7xwAUEcwaLBSwSKCGHvp+4LJXNjHiAG8xIAYxYqFey6SnqDMXTd/Gi1nig95KD11wyJXsc8ARihSKcrGjl+5is0tb4DppQeW//sopx1hE/WHliCRmSokWlBzMn2u12tkZM64qmVKuKaIRY3BhwKmuVH9M5OC7wlWK7tk2yQTGbXXSv2i97AhoajE0g9crto2C20D8hUvJlm5+sSX8Nh1Ai3fnw/7qJbA1mWrjBGnCkKHZgSpBI9RDd1WLIZBxaxNOVi7Qkb/ELg8qXSkA4YoW2M/g+5BzZMFTUU4hJ1VPA95GErt/U+Gdqu/iB2ZlOk6ogIWwJdZUoH9Wh/fyNX8Kh+V5q/Dreo9toF9Va2+rSk1z6uyg4pdIYXVEzSO5ltjwQR7lcQGT4Nzaaft3O74km3o5aVLknTfZ+fZkhPbPArZrPqDiu4J4z6brOZetJd1fC0rxDPlQsBIFIAo5sf5PhsvYruvI1gOgxy+jGAAVlh5aJ0721/7BPxNWi7alRFh3tWrgHtfHVKKrdedofeRX5KKXEoakJYe5pt2oTw5XGjWfBUe1/f4Vf8YXv/r4LgkkxgMKZQVVppHxk+FclOEBucytNlbB4l8y2DCaJQvFhMX12ueUd0VrazOYwucmK8CYNCX3mTWMIYJ7PKr1GDZfCbWnjEXKdBi0TWL5DpoH+F6CTzJg9TGZOF+vTi5oIsbgQQeTkrsBsdoCqzF1HV/hQP2awK0ax3p5MgMPFiZcSNjxekC+WyA8wbeJ+rmPGG7x0ao8yN5Gvx8fKrW3pb4vtoX8D5CXRkKVXggy9ulYBXN2L02ExH7QnVcXpJGxpCEFJKt6hxEIBLSbldXr9+VdB/LxH/vbkBA+EnRukNzPRptyFpAGBce+/mKuArKaX7vqk9oW3zku+yynV9/ncgTyz2JKudB8byFMBVqetRNH6haKtxT3RYRmZm4CW4XUuW0myYy/h0k7HLBmBx3vh+DZfsBi9/lk53ROIcyk44z4P4fDaJWoGj8Xve+Ykt/2yn7YI5qxpZvZRxyFkhzs8MY0tAneDI4CGdR1zTlemK5bH/rjydKtGdB2jC7BeKmy9R8+iZt3uS5ROGsNOhKplxmh9USr0H1phl5N2KSRzghG8hvyzrMQCnpGs1vY5yhA8bImgVUOI6PCEcxR1wazMZuiGRQ6RN3f1f8Otnr300RcaZIH8wV6Tl4qY2ymVvzyFpx3dhcZpxZ5uM/iY2p8P3AyTZeqEptmmi8RzF2UAsJoqZ6pnplU0QjMJlRDf7ZsA1ukiPrkz2EOuJmy6TugCabKaRNSEaS/JM4Uy4Ffu9Tx67udXY4+F56FPWcTzP4Gpnys/ySQ0CyIvyuIAOpjlMzZOEe97LM7oAWLyu8VSgPzCRvQ+n07bbdLIj9mCKf/z1IwKomxYz0ZREhF55ahlH/C3iFGT0P67cvJAu2s2iXkx68WfCm/zoxlwoP1io/Z3H/5L2Zt2/fs2XYbRxhUvVFlDRlDlP61U/KRIdiWjBPfdsnD9YRc7YN14GUj/aTQ3aNAg67Q0LDzBvgUDDCRq6fhzecvkl9dXW18hcV2heP6rvuAKUpKlMUHmNj+fo/X8BZbN9cSeWbxPWesMko2wx2pceV+LrsgaynU62cKl+uT5coG1Cd3QObwpCwteP2avybgDRmAFGBTAiL73EmJFrw12iIrNFTvoZ8FVHNZk82uhInEtnL3toSIb4CwN+IxCFJvJkjarEEfc7z29FP4MBYuGr8AgFb8aNEX+aWba8tonruXz75ZfWwzHTPSusNelicjmug9Dd1qb0Pkegh8lGS7V9OCFcJCTri8pZgWGRBQt1OalHcemK/jqn3VSxRlbKdt1mXbCcTuXv9IYkv4XA0GGyD5de4YtMGziGqeW34XosolHMYT48ndhd9ymHknVIEgvu5Rp/3x3VMtgSQye1Hjefq7OVI9oeIPUz2nLJmifG0kVehDZneN6v/rVfhOJI6b/GNLQVHqKoPpcLjl3riygHb1QvjNlmIQNMNRPI72h20ryk9BPQC4+m8RJ4pPh6iR+W61KyLrCZG5PoeUk+0Nu+3GMogaISfbHZRXMCn+bUbuHQrIARLoKOdlZ2NNg397WRYySkDlNh7gUuih+QgKiJBjUTfAsosB52te8IsNAhvZy7QoFSBoGF0hIWjrmr+8bnEM5eJjXZqWo7NGA+Mg8hGIdPNmCtuxcT7aQlt0+a46lNwvprkgEbyCauCOP5MNjaZbsApRjM+fzcHD32CA4jxKTZ1HmxxwLNrTK+c0ar1nH++U9ecNZPvFgs1kJpYVsLvTjofMEu+AbzfMRz6AgEx+3VyrOIqCtBOaQKpAIL3VgiZQMIT/sNHg67rvRM9aVhGeqw2fmf4w/16oHH6MgsThtdmA6QQ/ciDJpICOYfyDWs3hHDyObsvyDYaJA3RJOdsJrIIyz/XVyw13WWkL4zxgSz4YanO5gPTz5rQfQaMcofx/780BjI+m3K+xOqU/1PL/LgZz9mUB89ipHnXJONrNZzwFPDMMMrgRPPJ7nQoVDBix+MDuaamijuZW+qN+M8174VMpk7MEPZtwCVS2VSymVb6bhDeCkLxHV3nlHPXUruFX2J01CjZwAldLiCCvFb54irRv9y+VdDgTh0rE7tN6HGZI+OBDPuWgZK5/ggEgFiP7fmZ2TqnF8hbAJEevkXYWQzUwoLp+NLHUss2egfK7OWn4KsLYbW/VQedTzQzkfxMhNoEeo0uCOA8+rAJD/XTXSD2j5RBBY+/EPb114ICBG71eOxedHwWEtFmAuSCeuN67KOUDaGa8+kkxyQHWL2X0LuUrpr5IwhCNa/y4Zkc9aiZwRV4kGDYcXbRRljTHOysLYTJu/kZ+WC2IFjMh3ywlcmulSgSa9aUXsq7ABlpJQsox+AB78uagi3BoXahJeD35C+kDhZweKEDYzgnEpEgbAJVbhbE21A9LoUPLQTcpUn4NQk71lnprVvSBqQryCVygHe91BtQlUCOL5xH/WK4L1btD1A2JiGumksl5PTGdHrk8cQ3Vkd7vJaqHZDO8z9L5c7euNromF1DMzOALMpyFTiVqWdEbgTUCzVUqUTftXkHx2v3sVyvLHAgCjcWXQ5AydyG3Y2JEYK5bNAyp2y9UdL6kx+CfE+OzQm/TECcq0Q5izERHLheFgJxcR3VD9oZC5ZG6bLnrYl02G98qU8Qd+1t0JbOneaVpRpFUDBhapjRPdQq6mWFXvLw6OrjQk+sOzjff+tMdhlkYJbcCf65mhUsCno7zYQB5Tz15pnv6C/U9Gb77aPcU/hdZgc/MX80qWNxP3RjHiOceXmksRWKAAf0YESTvr7h70vlVO4lL+GKeVzbqOiKAKTNO8tY2bwMdcXponP7u5yyUkQV/+j85DNygxcQ1rtERyjs6mtlp9kSs+FgivPHUSfuYL3mC601pDTlhdWHaVKFlgPwRs0L8qJ91+eAIgoGAkSUAF5gwFfbujwd0qEwKJYXyqtkgQv80X7Ov8vcKFmN7zXVwFoL86vREY4tsBPrsyuNKtLCUjGDIVqMAMgAaRrqqwaMIQiV9q9IlELEmW3THvou+d9FbN2KN9azcA/WzxCtXyUxUt7Sb1KV0UI3Z10UbSOZ8mJ4vaDV/sF5JafuZdGsVIhopxW6gDQVDgmiR2OosXRL6m2q5BLTCKRLfp87EW9UbDVFh0wTe/j1vw4pIDlgpmvWIoEQBqfrvLPFJjtlBVEV3brCuGq8+H/m/bPfn+Uuz5gvxEbDOqcrkK7uR4+2pzBrwNYEtFiQzCrJ+Ecg/cuGNbs0abq/NrwTiNVbjgqmPpIOuQS7Te6NqvhXY//taUITXUA3y7mimUfhFibZxGHGtL1oXYMHAap/7Q+mHLthmr4oh/q95fKeoVGXeUsL+qzQwC9cKmweDXJf3OxCh7I36f7fIG/HHoSnDmTqSv9X9v0i4yNTLcMNWcK15hXAAASvpWqshzTrKBWfRqxOb1Dovx+mOQRozz/UtMjtnCW9Lxv0ZDYp9mLURpX+89oDpD2baGVWZXM7mwjzPMGvmyIusV09q+7dJM6yUOy0ZmpecokFrJTtA0ePyjFu5H52uwVXGMI5IH4DLL0mWrRopfJHCOkzfFX3eKOyOhg501Zqap24lSsrIadHkDMIOJiB/2rVCeyhLiTgIN1DveXNzcSn3HcaRWjZbvhEu+7K2LPbh0yapHoIlUrbnKw3i2U+Ir+bXZ3eDzk9snUl1+HlNW/+ki0EfUE0s1BIR2K8rh+LMRK8ZsrQepQpyvufzpACYflaJBdsf5051PJUbllvNBCMXrLTnwgHBVyEZQ1HGGEvhD37Pn8cVmEl/71NiSqVdKSR/gsfnuy7oqd7uM4TPoHNMLzdGHJHgS7mfJX7r7mxl5r2AAGWB0Fnut2Deva749nF48yapD/eLZabSFvxtsX/oV3MeN/9GLnqy08RiM68HE7/13PnfAm0WhRNAXcJ1Ns2lVFpQ9aM32ElqLb0qilhlOs+TOMeQ+H1nAKXN2Ir+mvEZBJS+ogMJEjQU/Kh1d0tSbw7hXPWV2nYrhdYPOTTJOaHEo2oexWT8ZfOHVIYXMb58TvaaVEg/9p3Sg1+stEJ3uuSUidLDUpfAv3Jr4ksEQZANV5Aia5fxKSH99dNQjpI30Lb5MCS/CUO84ICI3wNVsTMo7A5vJzlvtRwzRgJK3p+mnTnNYcOLPMzVpYbWDmNijvzzjR5ILE0LeFIg1BcrJ8u/Y60boYhbhnGvJ/OX3OaNK5gN6vDqT1CKh2fG3E40zmA9KIzG9uQOwGW1gB4Hc7GiqFyGl6xRnEbEkhMyG+xLzeGzKJuG8KgKQDk9CFjIp55LhGcTs7IJgOcWjBeyz1lew0k6EupH47z5iIOrkTzgaMaRHyZwAnsxzBsW4TsCRH/bWMWayr/1IBmWVwu4vnR9mVAe60SZwGJsioe0r2vAxN6pGYiuz6PupauwF/kPXcaDRvNtFjU2i1I8KPfAkMxK28ulj8w7SdVgPWTxuVRq5Kmg8D2tPc5gEdjKZnEnLErONZ4bm4ExFIXspw9nurUXno/lpG30c9J9RuWecoVT2xPcE6sN61BA0H5ZZeL7bsZHDqDduKv9RJyn5nEmk2X77iqobBs+KdSye9dQKybYlxFFfbyOIpXdnLAfaiOtAMFLP5cVHePxKrYSTIAMGMCKmKHfgSv+kjQXkRzdtIQOHNkwGDLaqQNuctqSx27+0qvA2zIEiveyxoImfWkMR+1kWr67ppeIKPP7c76FzsSXl3Mna+hS06e2zgMTR4PBJQscswXs5GMkKVhhYHNJ8vGAlSAvM4nhWBi7Ykilp88wNylbn88I78pvE0VmjwcfK7K7AvuaFPc2U46TUvovYS4Ppse6ZmCHEvLJGTSycYl6FBoBXBz5e4WMOWfM2Tabtg+PYT5m83e9ddY/ud380Cyu6dBZ5uSLPlxJIQI6gyK9JpVcfANW3fC+CwkVTPrCn8u7jaHDiSogUKFiz3tj0sVHwmfJ0S8PJWT9SV3K1jqcixjdcqCfovvpZBrfqgh6fBMflwQlDbyWYidfGLSfjJZVqzchLLR919zGGK4lzUWvf2G4DOwGxX96vQvGFCTU5mn+Y+BQkFnT+sZiLP6sx3dQJ0jSMKqc9T9v+SGsMaFIEDA8b+C39ZfudHmYfB5SAfXs9VqrP3TADPbdQUiYZxUBLf7PZTuqSPjmTocxTEGeNP0Hj0j4DB9LXVstJuXjLQoU7KEYx08EQ3R3ld2F9mH3of+8tfbr5Fhl/6nwaqGMPbPmb0Stb80T7I/CW9NxZkQVm53kR39Y2vUfL2okMSB4KJUGSRZ4WzY3H+nl0VyeakJ/YGqrdt3orr2Ih10jvr8pI2BBUDA5er2DqlUT8+6qJd+slpduxGw27lN/1G9Jc8JEvhIretKlf5fiNHzMnONvg8zh2gFx8SDz/rJvnsZCIvLJ4Nl+ulqR4ylmYRJ0wfLAqSNKF1GhAnh6t6Ae7/JB3DmQTWLjiYURZUrK0iIktrsCIfuazEl+PdgGPHlDANd333EiP/AD64t5XeCVCRl14NTYDFWR+Vl5tENkyt4E76DixN9hDO13d1DyzMyPtB6oHiTarAfIqs+KSUeuD6U9w+Qo2OIzk9pMmNf13CtYDFzopf+qnEF/hWlIFRzA723AJOrYHub+STVd4NQaWzSKa1f3Yo1zhiMkPwqiYivMkcryqx6a3aV53Fb9Kf6zyGiuzqZWNNjGja+Ra0goO3cchyMuwIBE4kh3/IBDwcADzBLEbCmAEDqluYA16Xnnsh8SlZiZXb4j/Z8tihnZuBm/myFI4EP1Eid3iHbMrtV7gKEUg/CNR3M/oIDZtTYgcwgAk4Gu3+zi9P1UzYF8agqwQxffakGypfK/CcKsKk9KOGlGWwe2w5g3kEw3UMycQYLXrMWoIgRu81ZTMRVoT3kdvucKOZuLvavr3nHOmqG0Xk/WfR9Zh/frJhIjjrqhpM6Ch7lIUV0oTukz6GjmknQrmDdnP80a/fHn83/RPw8pP2EPtPucewj8L74wd9PymwsqO7M1oxgC3CzbOsg5U58uHenV2eaRn6rkOYdSRi9EaCdlybbR2/iAGWIg0hWRaApGbs8aGZseAyLkIzVk7t/4O1v0cKEHf2mfur3yb7+DN6rftZED5YH/foiZWQqPt7fSDz/JjDc+AOJ3iK9x+L78V6Mvgkd3DYGxldAaXmXS3p2oMuN1AwNiSA780VJsxLAU0I36FZ6C2lC7mO3j0tKPwdZwUWC2ZEO98rqLVFJOwgLoslEVabyjQ0oKUx4zlABaLh3XxIK6dx23In0x/8JRT3n32p89Gwn/MqsUDHQGxnBO0o9P3clpH2jC9Jc1O+6giGwe75n4MYReok4dUptsPrtffWfwym1AFDWjIgG1j2/DR1Y9Oyr5NIKWOgxyz5scF1jo+CAA03/For1+WJrzl2z9CX8c7QmqwWoe7cPN2ProEG5U8eoNZnyS+P1aaaFSleucZnwW9pNqCOIDsdWvlmmIyEluwlAprYsfeE92hOrMu8wXUPYvZccJIGoaAAj3MKmuchKw+kW9X0mTfB/QPst/8WkABt1rfEve0NjfFgypP4d6bksUJXzbSYb2xHu2DHTdDlvPFgU6CpL8ToDqi0mM7knc9LptiUo/hgxcmxTZ35ukJhQUtfwV/GMlCZbev9w+e4tajQU2KJZruQgC6qsuVAdiK5CnzOsLGIz+T0NPbtRTSCGAfjfoTUHdtTHfRhaM0rsnMpNubDwEETT1SPBmtlVfrOBw/sgluhwVNTeJFfYsizbPEnFh8549oZCjLV39zLlHkPRbXj2hzIJmbbeJYDu/LUb4HdQUvtYguQfnO9BR0f1ruv5iOSI7RaBrcH6QJ/vjnlQaD2Sld60sdXV4zGVq7dUcuMR0UAd1zldMX8eMVj2c2u7eca3OlWCX1VM9F2q/2lHz8toLz266eUlP21SPn50Ylk9wX9uTtuKCNkBDy+Vg8tCd4e3xidHZzeWkSF9sTgqBdWDUqB9x8hgRh0bD/TeLKQ5et/jjnK/e8lySOgeA0UImt0hjWitkI+EiA3m+3yhSTwYZdYK4Dtj60bKQtOxBEo4lCiTyYCIiCcI0JykrPoHLkzOSuODLiEy/R/9yYGAVx9drA91OyU0qFnwoeQP5M1y79G6jxmYVJ63llIbukziZCjDDIwcff+eMU3VrHd3jv14kucbqJhCPqtK86gvwU+5IXbKbZsHxZRIcX2lh1Ko0StQRFZR6AB28CqSE4w62XotTy8w2J8iFUg/Fx7w/r0HsNpvjEQVxTVWjW9lj6NGeUriUJlhgjrNGzr5AHu/CwLkGWrzS6VBMQIVjfH5JD2sOczg9+xymU+u7VJbz9Rw0wevd4X7He0jvLK7rl5WRPNe44nOrqa2lMqKKwQ+sYAChPdvyEEUHNqFv5gKvEP9FgaAphHToqNzJt/ziABDpFbmlL1ehAlw4+fgko3V7ckQh6/o/D0CF5HnflAGFFKA0fkL8S386BgiBg5PaJo8cSK4ApbHGA3l08SqHRa0qNw7lHsR3r4wUDACiqGjkg2w2F8kUqzQpkDlALoSGTPqSMzGhVS9CC0HmmQ+LYHdL1BpuLdunQ6SRrZBsmjnpKp7aNJ8LQqQArc7vlFTgM3q54h+JsY4G0UafxqUsFzio5TVilzOHHxtoDcWCenfBoMJb3xpzvsoMlsgosmHKQNRV/0eVaJ9f1AViRfps7c0YELt+d4Z9USQY+ROCnJDBvrQkRoIuoyYtSMDmQkTb9lZJwasrOz/yCCVI9oTDzofY8TAPICQejyoiS0VxrBJEfhcgDxbRzUgcbDSP6dDv/dkr1POcEH4C9I6ONb23/k3rJE6wHBHg7yPVI7Ask2HkIDwd5M9H3hUItG4M2MDVEScWUUsD5eIU7LGKEv8JvBbW/i/kDKp3HJjluVoR9GwgqZEOJvh5a6XqfyJ26QqH3lOWHHw+HJ23e8cTn3qcQ+ff7SeeXwkdMu5DC3EJQjYpeP+DOgSBYyqSDuKqg3Y/tJ3exibVFt5BjzxebtTDtEWIbkQrYsU1Je8HsPW5BFdHoSwsrL2Miq+btn0bwuyfZnpkdJaUB6tMR/q5A9ckUFNU/tDeyz04ewwM9U2Zj9Ga/f6+6WCuIDkbMaoL2uAXye6oWjA09w6pWZNOBEpmuAPKmwJ3oQyQ+nYWlFOaA0hp1OaF0Bt8isWpwFgJPijAFj4fcNbCV4jaKQDlgEmnzYj18H85tVRCixBa6U4qyF35bpwzyYybcWNpIMcve/9AWeu4puI3b68NLBxmI0A8/t8yfOgVvXoDr1aieAAA==', FALSE),
-('data:image/jpeg;base64,/9j/4AAQSkZJRgABAQEAYABgAAD//gA7Q1JFQVRPUjogZ2QtanBlZyB2MS4wICh1c2luZyBJSkcgSlBFRyB2NjIpLCBxdWFsaXR5ID0gODUK/9sAQwAFAwQEBAMFBAQEBQUFBgcMCAcHBwcPCwsJDBEPEhIRDxERExYcFxMUGhURERghGBodHR8fHxMXIiQiHiQcHh8e/9sAQwEFBQUHBgcOCAgOHhQRFB4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4e/8AAEQgDIASwAwEiAAIRAQMRAf/EAB8AAAEFAQEBAQEBAAAAAAAAAAABAgMEBQYHCAkKC//EALUQAAIBAwMCBAMFBQQEAAABfQECAwAEEQUSITFBBhNRYQcicRQygZGhCCNCscEVUtHwJDNicoIJChYXGBkaJSYnKCkqNDU2Nzg5OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6g4SFhoeIiYqSk5SVlpeYmZqio6Slpqeoqaqys7S1tre4ubrCw8TFxsfIycrS09TV1tfY2drh4uPk5ebn6Onq8fLz9PX29/j5+v/EAB8BAAMBAQEBAQEBAQEAAAAAAAABAgMEBQYHCAkKC//EALURAAIBAgQEAwQHBQQEAAECdwABAgMRBAUhMQYSQVEHYXETIjKBCBRCkaGxwQkjM1LwFWJy0QoWJDThJfEXGBkaJicoKSo1Njc4OTpDREVGR0hJSlNUVVZXWFlaY2RlZmdoaWpzdHV2d3h5eoKDhIWGh4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXGx8jJytLT1NXW19jZ2uLj5OXm5+jp6vLz9PX29/j5+v/aAAwDAQACEQMRAD8A97PSgdKTPtRn1r5teZ6mwuRSHpnnH8qBx1o7fWqGHPUUZyeRR6cCkJ9jVpiYp+7SjpTc8dOKWqGBOP50Z9iKMd6T15PNUmTceD70e1J0pD3piA0ZOexoPb60oHaqTAPrTqbQOlO4C9enFJ+NHNHUU0SHTuaXvkUmKUjii4B/jSj0oHWgZ4HXNWAHr/UUHnmj6UUBcPw60vUnNHpQBg/4UEhjijvR/Wgjn3o3YCZzQOnFOI60Ln0plXEA5/CgcZ4OKXFKB15NBIgGKRs5pwHYUHqaOo0J2oXAGKU9+5FGCQRmgQYoAwKMYxTjnqaAG9efSlx83qKXBxjuaPqKB3G/4UAe1OGOvvSnmgLjQOeOlGOnFOA6gZNFJsYnejB5xSgc0pXOeTQAmOMUEe+KUevelxzk9aLgNGMcikxTgPr+VBFJgJj/AOtSdM07HvR/PFJAJ9aXjPvSfkaU/SkSIB1z+FKKMZ9hS9B1oGwHWj6+lHbBIoJ/LNSCDjApfWk70f4VIIP8KU8HikHTpzjmj0oKQvQ0DHSjrSUCbFozycUGkB5PpQCQvbpQDzzSZoPQ0ihe3pR25ozSZz9O1Jk2DvR3pOpGO1BwO3akUOH6Ud6Sk5/yaQDiRikzTc5GDR2oCw7P+RSZGDzSHpR64qbhYX60uab29qO9ABS54pByM0VIC+n1oFIelGaAFP50h9qCaKaAM89qUEDg9aSjOKQByT14oJ44pCeaO1UAoPJzRSZ/WlBoDcOtAIFJmincOgp5GKKKM0XAD1/Cj1o78Ug9KaY7C9/xoJ/yKOc0nfFFxWF4o/75pBR29qEwsKfvUZFJn60UPcaQH60nH96j64A9xRmgBelFJ16UE5OKChaQd6Q9aKBWA0Gjmg0Ba4McDNHcH2oNHPencQdRTaX160pHB5pFCdT70f55oA6ZNLQgEOaDRzj2o9xmmAnsKXsB3o9e9HWkAlHuaXFGOKVwAUh5PFL6UlMAwfwoxz0pR06Y+tHOaVwE+tB96XvQaGwEHpR2pfoKQ/nSFcQAd6U/SjHag9eOKBhSgj1pAKXrQAe4pAO5NLyBSdelSAUD71BH5Uo55p3JsJ75pT1o70EHt0p3AaetA60uKT8KkoQ0Y7Up60gxmq3AUcUg59qWj0oAT1pR92g9aTFADDRyeKCePWjqOKgBe/0FJz1pRxSEUAHv2o+n6UY4FLVoliDFLSZ7mlqgAc9aQ0vrTR0zVILCnOTS9znijPHPNLTEH1oHXnijvzS/zpgJTs8c0UAUAIcjpyKB06UpGBxQBzxVpkh2oHFB60YzTsgQDpwefagd6UAUAVYB36d6TFOx0pQB+NK4DcGlHBNL9SOKB19jTJExxn+dKBg9KOBRjA4/GnYAAzml60oFHXrS2AQj1oxx14px6j0pDyPamAnQe9LR6mlp9QG+vrQByKdz9KP0pAJ1bHelHX9aB160uO/50AN7c0vpS/SkzyecUAKMgdKWg9aD9KNwAdeeaAKTvzSnBFIaDv14pSDmk/zzQp5FAWDPHSlznHaggUh9hSsICME4FJilpG9KZQo96Qe9Ao/HrUWAWk578Uc5pT+tAADiik65oI4xmgGO/wA5oHH1pAMHij8KkEHelH6Ckz05pT1/CpAQf0o/WjPFIfxyKChf5UYFB6/SkbrRcAJwaATyTQKT1NIBR05paQe1BwM0mwA5+lHQkUmT+QoBpXCwv1pDzSd6OlJsdhc/ypMmj8aDx/8ArpXFYOKOfag/dozikO4elBPWjnNGMZpXEHXk0p5NN/Cjvyadw2FHf2peTTR900vbFSAZ5oo/WigAzRR24pM0ALQemaPb3optgHSigfeNIenSkAuKOeOO9J1paoAP3aKTtmlPpUggH3u1HAFB60e9UMKB0zQetHWhAH1oNFHencBO1KetAHH40d+tMBPej2pcc49qTrQNAe1B96Wk+lLQQc8DtQOxoHSj8xQ2O4Y/xo9/Wg+1HGe/1NCGAAzSClHXrQPyouAnbijrR60UwEFLSde1Kf61IIB1/wDrUHPWjnOM0dunNNAJ9aU9aKD1xQ2AmD/kUo46UYFIevFMA70vX0oPFFJgIc0DvilI6UAc85ouAA8c0GjtzSnj2pANPTigdKXrmlwPSgBuM4J/Sjr1peh7/jR6Ci4rDfQUY5zilPalHpUghAOOhoxS0GgYnU0lOHX3oFAAeetA9+KKQ4z1oAM0E59qM8dqQDOOO9BIpzTcfWl75/ShsdqChP6UetB7Ucds0AFKOO3NAPFJ+tAAeT1opfXn8aOtAEf+FFJ2o74qUAE9RR2penrRxjmmAH7tIe9O60neqQmB9BSDOPelxQByKpAwPT/61A+v50Uo6iqE2IOAODSnnpQB060uOtUgDH0oAyaXoPalHBpoQnY0oHFIcU7p0qgE70AYJpT0oGcU0SIBk0oHNLRTKEXmlPGKF6e9B6/hTRIZzigYxg/pR/FS+9DsAduTQMAd6MZo56CqABilx+NHfNKMelPqJiClPTHvSe1ByTmkIOhpSeKO9HSmAdueaOvtRmgDtR1HcBilxxjtRjmj3oEAoJG3n070vGc0mMdKAAjjrkE0YyetLjuaCPekAH6UgI9aXtz+lIKYC4pM4HY80Zzwfzo7e1FgA5JoHFAz3pc85PFBQp6UmaM+9ITSFYXJHSkPIBpMgcUdMVJVh1J60nHOKPpSEHQZpc0mec0p/wDr0EgOeemKM9MUhOPegGpZdhSeaOopM96O3FJhYXtR/KkJ49KM9BSuMXPFGeKbS596QBmjPFJ36UEHPtQAvpQOlGRmjNSAvvQcdxSdqCcHii4AR1o7UgI70fWkMKO9Jzmgng1I0KaOT3zQM80CgLBz/doo6UVIWAUn4jNKOT/Sg9D9aTBIO31pAOT6Ud+tKaLi6h1FFFGaLiQnryKXvRSZoGxaB7igfzpPwoELSd+c0vtQB0oAQc80GlHoaMYoHYQe9HTml7Zo9qYhMcUooxkUc59aBoXFIaXHvSdcfSncLMWkxilPXoaPbk0xWChv6UmaOp/CgbDnFA55NB+7RnoKAFxznBpBS0UAJjPFFB+8KKAE7Uv1o680UDQUhFHTijtQMD7CjvR15o5JoAPqf0pD1pcfSjrQAnQUUvagfp3oAO+aMUd8HFKOv4UAJn2pT7UgFLg5/wDrUAJjjkGj60evpml+lACY5o9aO9HOOQc0AHze1A6/SjrR83tQAHocUE5oNAHrQAh60U4fXFIegNArh1pKUe9JQhgPejFKenWkPWpAQnvQTijrQabAB7+lAo75xQB69aQCUUUv+FAkB78UlKOgpDjp2oGFHSjnPNBoWoAQMj3oP0pO1H1oAB92l70nvQOtAMXoKO3JNJ9aXpQBEOg9KX69aTPegHP9ahMBc9zR+PNJx/epfeqCwZNHSkOaUds9aaATqKXBA9qOoBpeoq0ADvTqYM4PenZ4piYcZ4oyORS9DijHJ/KmhCEnbTu+KTtTgeee9WhAM0tHf6UGgAxzQetA9qUDsadyRMcDrwKOnNOpAOM1SAT8OlHHelHp1o+oNMAz6fyoFHb1oz3p7gHPY0vWik4PGaaAcOnvR39qTtxRntTW4mKfvUlHr9KOnWmMcaPr0FJntQfT1pEhyV4oz6daT9KD/nmqSGhemaTOOaXJxn86TOBxRcQuecCjmkzSGkA4H1zSg8imDGPxozxTsVYdnrRnim5JozxikA7J/Ck4/KkzzQDkUAKCc040zJ4NKDnuaOoCk0c0lFLQLBmkJ+tL9aPWkyg70vc5poODzzRjjrSasApOaUHimntilpAApabz2pSePelYAGAetFFIBxUAKfTvRSE0DrxmkAvak70cdqCOaVwF70HmjI9OKQUXAXHOaTvS5OOKP88VLBATRS0hHrSYwJpO9L7ik5pBYB09KOvtS+/agUDQUnfOaXtmgjn2FLcLahRQOnHNHpSC4dxmjtR/kUc9qQXD/PSgdxQKMDrTJYGgdOnSlHP4UUgE9qAKUfeopMBMZPJoFL0xijPOaYXDuKB0o7UUAHQkUhzil5yeaDyKLgHej6Uh+8KXpRceocYopO2O1HQ59aaY1oLmko65xS9h7UBcKB0o/rQOKdxMTtS96TFKOv8AjSEJzS47d6PQ0e9UAd+aMf59KPrR2z60DsGOcUnbil64z60YouD2E/GlPSg9KDzUjWgnuaP5UvekHHPrQFwI9zQaP8KKaGJ2o9qCPQfWjrTAOo9aWk+tH40AH9KXp15pP/1UcjpQAtFJ/Kjv71IATxmlpPejtmmxWF/HvR9aM89qKYwpPqaO9HfNSLqL/DSHk+lGO9BpoYcn/Cjpmg0tDFYTOKT+L0oAxRjvSGJz2paKDQKwzOM8UpOaUUYGaBiClHI5oFKelADaO5xTgOlHqaAEPakFOPSjGKAExScHvS80Y96AGn7tKOe9LjPrQPagBpH40tL24FGDnpmgBOeaMHFLjiko0Ai6DH+RR/OlpO2ORWYWFOc4x+VIaXr1pP0qrgKevvS9PwpM8etANNALxjP86O/vSUpPTnrVIAA5NLxSA8/jS9s+pqwF9+tHfI/CkXrS+tCZFg70vU0h6ClFWmA6k9jSUp96YC0Cjvn3oFNAKaPx4pKKYrB1p1NH9KXr3ovqMWk4zRntSe3aqRIvH96gnB5NIfr0oBwTxTuh2F4IoJx6n04pE6U6qCwE0nb9aWm9Oc00Fhf60d+ppAefrR2OOtK4hQeKBnmm5wO/0oPX1pgOOMdaTPvSZpDzQA7NBPpSA85o9e2aAFJ460n65ozSd/xoKHDpRnkUnajvVEi0daPWkHTmpKFzzS/TikpQfmxQKwDpS038KPccUhi9Tg0ZwOKQdaD0oAdTfejpR9algHOKd+H600n2/KlGAKQbAelJ+FGaAO1AbDh05pPwpTQPu1mAU00vSloAKM0nalx8tIBOaWlA9aCOOTmpYCH7woGMjP40YGR3ox3xUtDDGRS9frRS44yKT3AQfepOtKP5GjHGOaB3Dt60Dg80uKDUiuIfrQR396U/QUnegLi8UhA9aU8daQ8e9IEg6c5o9c0nvSk/WgdhPy/ClP14oIz780fhQKwdqO9FB6Urgw7+lICetLRximIO9FFKaAEpD0xTl6UtADT0pOaWjt+NAAcnrRijjORSjilcsT8KPWlyPajvQhMQ+1HtjvQORR2x+tMm4etAPy0DrmgdKYwoHSkpR29aEOwAjFHek+nSiqCwp57cUe2aOKT6VIxT0opO/SigA9aMe1FBoF1Cg/X6Uc0mOlAxehH60g7UvU80AUAJzjmjP50tJj27VQBzR+NL9O3FIPapATmnUmOwpfSqAPpSGjtxQM5FFgFpO/Oc0vakPalcBaTtS0dqLgJ+HSjvS47UHrRcBMH1o+vX3pccUuMmkK408mjjGO1LjvS9sU7hcaaWik4xmmFxKXGDmj2/Gl/kakY0CjFKBQetACdaADil4oPSgBOQKXGKO3vQetABge9IadRQAneggYpR+dJjvQAnOaPWlxwOaQ4yaAE/nRj60vHt+VFACGgUppO1ICKkBpO5o/HFQMXvR70gOTketB4BxQIU+vSl6GkI9aPXFWAvb3pcnOKTt/WgdaaAUcUfTk0nNGf51VwF69KdnOaKaOlUA7PGOKX2pKO/an0JYvfigHjFJ60A4FVcELRRnnFBNMBc0uTTc9MUZ5xQIXNGaTtxzxTTmqTCxJ70hOKac0fjTQWFpc0lICcc0wHCg00nHFLn3oQBQOo+tJnkigdBzzTQCjntSgnGelNyPWjtyau2gC5zQc54pOcc9aCeTRrcAJ4oJpB/Ol9MVQAetKTxikoH3aLALnijHrSentS56/SgAz+B/nRzikzx7Cl/GgBQSeKOozSc5wKOnFSAZ496UcH3pMc0oAJ5qgDtz1pQc9aKBUgBzSHOOaWgDpzSYCCjj070o60CpsCAdKBxS445pT1oYITp70Y4paXjt1qGDE5z2pOadjn39KO1SAmKO/NLSd+9GwwHtSgZ/Gjt1o6cHNS2Jit1o59qQ9KD0/wpDQZ7UD73+FHcUY5pB0D1NKOoFC9KMcip6gJ3pe1AFAoYWDuKWgdBSL1qQFpO/NA7Ud6TKA8Zox0IxRwc0nJ4oAMdQaD0pe9IRnrQApx9aBwfpSdufxoPp60CuFH4UU6pJG0dKB96g9M5xTQwPHajNLnj6UlIGL1NHJOOhpO1KfWgEHejjFJSGqHYWj8KOe9A6UC6hR6UdBzQPvUFAOnNJ36AfhS8f/qoPXFJkhjkg5oHtR3o4ouUGaToaWg/epiYmT35o9fpSjpxSEUwQf4UYoGfWl6ChDDH1pO9LR6/SgSE7Up6Uoxz9KDjH4UDG49aAOOuKcQMnFIemP5UAFA6UppMcUAJ1FB560v4UuMHNNgNxxQKdjjGM0c4/nSJE6EYpMYFOPX8OKTHGKChO2aB1pT044oA5zjincBKXrRjH9KdSAaOvQUcelKBzR7UCYY5Hajqf8KPQClGAaBDe3NKO3NLS/lTuGo0DmjFHc4o7ZpAxCBRS4pPUUBcTpQP0p3GKSgoQUnXmlo/CgBB1FKMcg0DnilAOKAEP0oHJ/CjHcfjSgYNAAfoKQ80vHvR/wB80AA6UmOaX6Ug6Yo2AKDRj0o5ouAU3v7Uo/GkNIEFB9KdTT9M0AV/ejn6c0hOaMmskVYUdaM+49RSc4oyehqhC/5NAPOe9NPv3o+lNMdh4PHFIDgimg9aXnGDQIcp5NGenvTRgGjJ4NUmFh+fSgc5puef5Uq89OlWhDu1KD60zIGKXPOO3rRcB3SjNID/AJNBPTiqQDv880jdKM0hPvn8KpOwDh1ozk0mf50D9aYrCj7tHYZpAfTvRn+dMVh2cmmtR9fXFJVLcoMilOBx/IUh6UZPNWtEKwq9KWm9qXr0IFJAxaTNHbNHUc81ZIdOMUZ4paT68U0ApPag+vekPTNKfTNNbhbUQcdaOcUduKDyOKYCg8ijHWhaUdMUAJzSjpk0H/8AXR/SgBBgDPSlHXr1ox6560Y6frQAd+QDR1HSj9KUdKBXEFKB0GaSlHagYo5pfakHQYpen1qWAgHOSKU0Emj9algLSYOKO460DkUwF60UUHFQwEGDxml9Pej+tJ+dADvfj60EjvQtHeswsB6DrSZpcH2oHuKT1HYKUdMUAUHqKlhYSgc0D3FL26c0gQd6G60fQij0zxSY+guKKKKQhPX0o/lR9aWpAKKKb/nNAB1GKceaacY5o6cUmUHajtzR6/40UALzkGkBo46npSgUmK4nTijvmjuKPSmMB0Ioz1pR0NH+NST0E6milA55pMZGaAYHtmjoOacRSYoC4lL1NKc0dumaBCCjoKXvR9aXUdxOtIOlLjvSgcVVhCA+tGKXHTFGOaQDce1L2pc/SjrVAJj2xSAU49emKTkdqEg6iY96XFKOtHJNA2xvr7U6kNL9adxXEI5pP607+goP9KB3E4o60uOlLQIbjIpaKX360DuJjmjt9aU9DR1H60AJigilpfrQA3FABzS4Pelxg5oF1ExzSAcdvyp2BRigLjcc0YpSO4o6E0IYmBijH8qWg/e/GgoQjijoBSj7po70EiDPp3pMYIp2P50oHFAdRuDS06k7fhQK4mOKP8KUjigg4oBCEdaT2Pan465pMelA7jcc8UY5p3fFGKBXGY79aO/FO9OBR+tAXGr0o7U/GOMUY6UBcZjmlA9aeBzmkx3oAbjA4FGOafgdaDj14oC5GcH8qQj1p9IRwM0DQyj2pc88elNPBoKFz/jQcUh+tJSAKU4pM0hJz0oAUc0hNGeaQ9KAK2eM9qXPemA45zSkjjisEaWFzyTRnORRTffJoTGL/OjPJ9KTtRV3AcM4PNGeaTJxjrSD0p9CR3196Uenam/T3NL/APqp3Execc0o64zSdaUAYOKu4hTgDOaUHJpoPbFLTWwWFzx1+tL2pB34ozwBViFFHU49KOaOg55HamgFPSgf5FJml96oAHSjPakAp2KbAAcjNJ3pcdf60ZpoBp/yKBSt1FKOvSrATgClXrSA8dKXjrTAO1AoHU5o9BTRAL1pT1pO4pf6cVSGHag4z2zSY5o/CgQDnml7fSkApTn05p3ABjNL9KQdaOlMA6ilo749KKADoOOlGD2oxzS9BQAdTigDtS0Ad6AE70tFA65/OgAp1J2o/CouK4g606k70tAxBwcijvS0UAFFHajv1NQwDHpRigcUZNSwF4z7UvY4pOvXinUrAJ6ZNB68etBoHUVIwx+VH0pQODSYqWCA8gUdacfpTe1Sig9PrR1NAHtS+tDEw7UYoxS81LEJjtSEc+9LzzmgjrSAQ0fWlxRgUAJ2paTHFKBikx3E5z3NBFLS0BcSkHpTu/FGOM9RQFxuPagjJp3fNAHP40EsTmlxmgD2pcVICHg0mOMU7p2pcU2DY3H4E0YFOI6d6AKQXG/j9aMc9ad26UUANI/OlxSmjAwD6UANxRjnkmnkZFJj169adwG496XGOaXGBRgUwE7UY4pQO9Lg0AMpR0xSkc0YxRcBoHNA68elOxjA70oX06d6YDKDjinjpwMUmKAEwfSkxx606lA49KAG9vWlAHUUoHHNLigBvb0oFOIpMfhQAmB3pD0NOxRjtQAlHbmlwPSlxnoKAGdqXoOe1KBxntS4oAZg/h9aXBpemaMe9ACY70H6Zpcc0HPtQFxAPSgDnn6mlxn60v8AhQAwDjrxR36U4DgmloAb/wDqoHAp3br9aO2KAEx05pevalxzjijHOBQA3H4Uc54pT92lx69PWgVxMc0Y6Uo6UmM0BcQjnpmjnNOGc4pO9AxNvbFA/KlPegUE3G9Qcml7c0uAetGB3NBQn5Ufw/hTgMmgdDQAg/WkOfene9JQBGRxTW+tPPIphx+VA0NNNJpTz9TTCelIpC8k0hPNIetHepGH40ueeKaTRn2ouOwuQCc0ZxSd8UvXvikIq/kaMnI9Kb7e1KR7+xrI0SFB6UgPFGecYpOwFA0Oo6daOT7GkHcVSELSjtSdselO4J/CmgE9hSr/AFoHI4/Gjj8KokVf6UL1NHGeMUvI/XiqTJAdOacKaf8AOaUHJ4qrgOxScdulA+tB6Yx/9eqQCj71B5Bo7UZFUge4hzinDpn0o9KD0qkxB+PTinU2l9M0wDvSduKX+dABPJpp21YCHt1pR054FGPSl9qq4Dc/XNKcUvbNFUhOwnI6elHal7Yox2qwaDnrQBR14HagfoaOpIYzR1PNA6cdqUdc0wCkPQdKD04paoAwM8cUYyDR1NBoABSgfnRjjj8qUcGgBDS/Xikwcc4pfT0oATntil7ZoHJ/Clx70AJ6ULSnkZpQaBaiYJFBPXmgijHTmlYEGP0o6Uo+vv1o4pMYh6j+VLS4GR60mMfnSAOOlBBpeQM5peo4qQQmKMDj3pRjFKOtIGwAyBn0oA6UoH5Uo9ahgNoApSKMUmNMQZNGKdwB+NGM1DC4DpTcUoH5UuPxqdihOfwo/rTulJ/EaGSwxRijj1palg0Jjml9MUUY560gE9/Y0Y5xS0DvmhgJijmnYOc0g60hMbRjnNOHNFADaXjvml20vNADcZNLil78cUvQmpAaPXtSkcUuOMUuOO9UA3GCRQM5pw/P60oGAf6VIDeh6daMHdzTsUe1ADcUYNO7c0EcUEjcYGaUjilNJ2zVAGOlIBzTuaMZOKSAQjikI+alxxSjnr1phcbjg0HOKdxR6ZxTsFxoAo7dCaf0NJj3oC43Bpcf/qp2KAOaB3GgYHvQRzTsYGBS4xQJsYB82aMU/HPBoA45x9aAG45pQOvrinYPejHrQFxhGM+1GOfb3NOxS4qrBcYB6UbcCnFRjmlxkUrBcbik2kA04Dnnil96LFDAPrikIIp5ppzSAbRj2pxGAaQgmgVxMetGD6Clx60H6DrQMQYNHfHWjrS/4UAJzjBo6H+lAHHb8KOKAFxzR3xS459qOn0oAQcnmlHfg/lSgCgdcUAIOBQQMYp2DjtR16UEiY9OtIRxSnrQRxzQOwgA47UEdaU9aPrVBcbz7UAc05hxRiiwIb15o7Uo6elGKkYDqOKORS5Gab+GRVC6ifhSGnEevWmnr3qRjT1pjCnseO9MftRcaIzTW4ye9KaaTxgVDLEzxxR9KaeaXNIA9+1HPFGR60nTr1oKFz7UvQUnv0FJzj1oHYr/AKUZGaTsf60D8PrWNxoU9eePejOaKOBwKYxfYdKOOlGf5UHpRsIM8k0v+c0g6cdKUde1MSYZPYUuMDAODSDj8aXsM/jVoHqKOnvQOvNKP50DryM1SEHOKUDnjrR0o5zVAKv40vTB5NNHf1px9zTuSGOQD2oXv60Lz0oH3u9aAx3tS0UD1pIQmOaDRzS1dwDkD/69A96B1oC8Z5pgH9aMc80DrS96YCHkcCjHrTsdhSYqkwEGOaCOKXtSjkVSYCdfWk9z2p2DnANH51SIYgBHajBpRQecVSetgEHvSilK84NA4FVcA/rSflSjr0pR3oAbgdaX+LilI6UEH/8AVTSABzQBjp60uKXnHNFgGgc0oHGaWjnGKQriEUCloHvQMTtSjqKOnSg9eBSYBwP/AK9GMjrQRzjuaXHbNIBB1FL70d/ajjmlYAAFKB+tHene1S0A38Kdikpxz1pAIBzgUpHGBQD+dHNSwAjgUhHendaCMHj0qLANA9evvS80pHp196NuD6+4qWCE+lJ9RzT8c8cmjbSsO43H60EcmlxRikwuGOOMUDrS4PrR3pBcO/Skx+tOH60mDgGpEJ6Dp6UuDS/WiiwCYOOaXGOtOxxSGgBOhoxxS4oIpWAQDnBoA/LtTh3o7fLQA3BFKo/KnAUDjvQAgzijHNKc0UE3EA5zQOtOI79qMUWC4mPegClAFLj/APVRYVxh6dKMHGKeBQB7UJCG96CB1pxFJgYosO43HNLinHqaKYhnTmlIwaXHFLwTQA3uT0oAGKd+lH/fNACAA9aAODS980DpQAmOOlKBz6UAUvv/AEp2HcSgjpSjpS9hTBMQDrSU7vRimhDcU6jH1o468U7AIBQetL0FHoKVgG0U6imA2jt0pSDR35pNAMx7UEU7H1pMelQNCYFJ3pfaj1yKCxpHJFJ/OnkUntQA0/pR3x3NKRx+NB4JpoBope9A6DFOpAJ/OgDtR/Fmlzj8O9AC0nrR6UvqaBaBjigUDpR/KgLgCPyNFFHvTuK4e1IR+VLR+WaLgIe1DetL2/8ArUh60XGgHU5oI96O/NDdKQXAckD+VBI96T8cUtAxrHJ/rSE80v8AKmGi4CMcCoz0p56fjUbUmWMb9KZzintzTPr1qWUhD0pKOaDzUssO3vSfxe9LSGi4Du1FJnikzxnmi4Ir98c9aADx9aBn0NHPf86yQ0xT+dGBtwaAOuTk0dMcUwuL/hR3zmjGOQKUdTgilcQg9PypcYoA+v5Ud6tMBQOc/nS/0oA+vrRjoO1UkALyaUDscUDtxTv69KZIg7nrQOlL2oxzz0qlsK4YzxS/nSjFL361QhPpQBxTu9H8qq4CAHGaXk0vX60dDg07iEopcUVSAT+lKc4wD3oA/wD1Uo96pMAOBikH86caTvxQAY7dqAD170o6Uo44pgNwSaCKd05pP6VaJuw7+1HGPWlOTRjr6VaFcTnPrS4GaB09aPeiwC9B7Ug60o4zRVrYA/DvQB29aWhRimAmBgYPNKBzz+HtS/jxQBzQSxPx70vOfUZ5oxnmlx0oDYQjrSU7mkI684zVAwxzRj0pfTjkUdqkewY/L2pP0peaKAQnqRQMYpe9Lg9/woGJgUDrTgOOlKB9PwqQG9qXHNOwPSgelQwEA4A6Uvp0pe3JpQOKnUkQDnJoA4p3ejHFMoQCgjBpRS8A96zYDcHHNLgdaXtSdBUsAzj86McYpcDNGOPakA3FH+cU7rikIpAJS8Z5oxxSgZNJq4BjtzQetA496U47CpsAmO4oApxGKXqKQDR7ijA74zTgCDQV7GgBMewpMdxT8cUcUE3GgEc4FH504dcdaXFAXGgHAoxzn+VONAySKLEiY9O9HpS9hQKLAJjmjHAz6/nTvwpOtACe+OaXr0pfxAFJQAEewo70vXij0oAbg44zS8Y9KKKAExzRgY4paOg9aAE9qWg0UAN/DNLzijHpSkcUANxilxSmkHrQAtHfj0pcUD17VQCe/SgdaXAwBS96dgEHNBFKKXtTQBSAH/69Kego70xDcDFLjHWloosA0igClxRigLjTRg0uMGg859KTGNNIacenPJpDUsaG4/Gk/OnUhPepGhO/amk9j0pe/FNOCKCg/M0duKXpSA4PQ0X1AOopc4FIOnNB6UALn1pe3t1po684xSg4oAcOo/nSUfyoPr+NArACMf1paTt0oz0IoCwdc0dqBxRnmgYuelApM9OKQd6BWFzQCc9KT6cmjP1oGBHWg9hRn/CgnIoAB170n+NH0Bozx0oAae1IeppxptJjI2pp6dqVjzTHOajYpDe1M7U8nvTD0zQWhOM0UmeKCD1/WpKAd6TOfyp2CKaRzQAYOaPanYzmgDigCv29DRjgDoKdj3/D0pQOPeoAbgehpQOKUZzmlHTmgBMcUfhzjpTsHPFKvU0AN6dKXtSgGgdfwpoBB3pe30pRQPTitCQwM0o5oHP0pRxnFAISnDnGetIOn9KXvQhMAOTR6UdulLx1NXcQopKUc9DmjGR0piAcdKOpoH6U4j+VACe9KeBQAO4o44rRAJ3x7UcnoaXHWlx6VSAQ/SjGOtLjJoH3se9MTE+lL396BStntVoTYn1BowMUuOOtAFUITFH5U4j9aUDimA0Cj+IU+kxzVAAFJxTsdeOPSlwKpCY3FKBx256UoHPFLjH5UydRuBmlPBpcDAyKWmhjcZGaUDilIopgJgUnbtTiCehP1pPwoATHAxQBzzzzTuhFGMmgBAP5UY54/CloqQQEZNFA7ml7UDYmPWl6UYGaXvUghOaXvQQMDmlH3qhjD2FA6UAUAD9aRIo9aWlwKTFBQdqUAZ+tLj1xQvFZ3ExPSkPWnHkUnYDikDAfepccf1o/iFAHy0DADg0hHOM07HFA9TzUAJjpwaXbS/SloExuKMcUo70YqRARzR3pQeOaMjucUmAmPyo7+1BI7UFh60WJFA9TRxgUm8Y60bx607MLimlI45zSAjPWlBGKAA9OlLijvxS4oC4nakxTsYxigigBoHzUH360uM0uKVgG9sUd6cetJ3osAnbpR6cYpRwKDyaAExiimtLGn3nUHvk1E15ag/6+P/vqq5H2BySJ+etJyP8A69Mjnif7kit9D1p5pNW3BahgUvejHOCfej3FSAmKKUdOeKCKoBO+KXPHtQRRQDClFIBSj0psQDj60D9KBwDSnqKYwHvQRRxRQhWFx0pKWgUwEPQ0UHrSiqATnrmig9aKAENIeppW60lQMTsKQ049Kb7ioYCU08gU6kNIoafQ0nSlPWkbpQyhPxox6c0f5+lFTcLB2xR6CjOaPwzTQAPel6ikpeOppgAo/n1oPTrQOv8Anik2AL0o/ClpD707gKRx1pODS03t+NK4BS9TzSZo6etFxsUfdH0ox2pOePalB+bii4haTtxzSHqaX0oQCe4NA6UUn8qYIRuMEU0nmnH9aYfvUhjCKYRxUh6YprDAqGUiM0zAqTmmn7tBaEx+VBBpQOc0tJgNH60hBp2DRj60guNAyOaXHA607AA/nRxinYLlfAxxS4pQMflSgc9O1YjuNGS386Uj5ePWlxyOfpQRxTuFxKPzzTsUg5PBPFNBcMEijHNLgmjGaaEJ1PFKRmgetOUd6oBozTvelxSYOKaFcXHegdaUD1oP86fQQnejHGaUClx2qwAcCkpwGeaPamhCEUtB+lB5oAB696PalFK3arTATHuKXtn9KPyoA4poBcDNIRzSgd6XjH1q7kiLxQRzSgcUpHFUhMbgEGlH0pccY9aUCrAQ9RQOtOIzSKKpMAIo6GlxkClP9KYmN5/CgU4jA/Sgj8cVSEFFFHYUwDHFOpB+FLjJyOlUK4hGaMHvS4z0pe1AXG9KCP5U7g0mOaB3EPX2pSPaijHegkT60DBpexoxUlCDJpaOvHSj/GgdwHr2oGM9qBSgnualjEHTn0pwHekx06YoHXmpsAD1wKcB3po6/SnVLAB1peKQ9aXt71IriilFJjPNLnNS0MO2aDz6UDkf40HNImwYGaO3FGQO9MZwO9KwEtN49ahaVfpTGuB2NV7NibRayAM5pGdRVNrkY6ionul9cimqLZPOi+XA6U1plA61mSXgz1qvJfe9aqg2Rzmu046ZphuV5Oaw3vu27nvVeS//ANoZ9a0WGJlWSOgN2PWmm7HHNc41+f71MN9n+KtVhvIyeJj3OkN4OeaX7YPWuY+3e9IL84HINH1byI+tLudWt2OOf1qWO6GM559a5Jb87uucdeasRX+TjdUPDotV13OrWcHHNSLIM+tc5Feknr+tWobsk8GspUOxqqqN0OMUu4VlrcMB1pRd+pxxXO6LKVTuaeR60bhWeLv3/Kl+1e9DpMrmRfyOKCQFySKoG8UDJPArmPEvitLYNDAQW7n0pwoSnLlRE60IK7Z0mpazaWSnMoLegNclqvjJgdsb7c5AArgtS1qa5cvvkOeM9qzLi5JCliSe9exSwdKmtdWePXzGUtI7HRaz4ym5ETu7Hk/N0FY48X3IfBLD6k1kTYZgCp+brUEkTBS/TB6Vo4qOx5zr1JS3OmbxdqKENDLgcd66rwf49ke5W2vpAxPFeE+K9dl0+L7NbOv2iQcZ5wPWucT4jnwyywyqtxckZbaen1rjnBVrpnq4R1Y+9J6H3PbypPCskbAqakxXyv4G/aStYdkOqQFYzjoK958EfETw14thVtN1CJpD/BuGa4KuGnTV3setCpGWiOv7UtIMGlrAsTvS0Ac4pP8AGgGLSe1AFLTQXDtiigcigCmFwoz+NHT60cEUBcX8aKTP8qUmlcQUUhNFUAHrSZpabSuMXNIfakNHSpbAQmko+vrSE1I7B+dJ15oNIetDZXQTPNBP40H73oKQdMD86m47Bmgdc0mKKRYoOaO9J2oBouSLzRnjoaTPbPSl4x1ouAe1LnBpvfNKP0qhWFyaSgdKM+9T0HYB7UUh60Z9iKoBT96kzSE5+lB6UrgO60A03Py0E80rjsOxQeabmjNFxNDvakoz70madxWBs+vFNNOPam9KZYw01hxTutB6+9Q9RojpD7U49TSD0oAbS45pQMUdz60rgIPWlI6H1pQOKMcUwG96CKd2oxkUAV8Z5pacPf0oNY2KQ0ClPTHegdKXt70wEoxSijrQrgAFLxRggZo7n+VNAA6nj8KXpQOpzRjimiQox296Xrigd/arATGQaXvQBilxzQAg96Xoc0oGAaPSqsIQdKOAacAKMVSATr/nvQBilxzinY9aoBo78UYzj1px9cjNBHpQgEwOfypcDHalx6UdKpAHQ0AGlPP5etHb6VZGwg/SloHT1pQBjmmmAAetAFL3xQOpqkAADNLjvQOvIpQB6VQnoJjpQRzilA7HpQQM1SFcTA9qMenWl6ZxQB61aAAOaPY0vWjk5pkiYp386AM807HNNBcYOhpQAOKcBRimK40Dnj1owcU4UhU9c0wEA55oxS4/WjoaB3Gn9KBxgU7FIOoOOKTGho6k9KUj86cRxik9KkLiAYNHPPIp1IB270rDuAx6UCjGME0AHH8qlhcF60tGOc9qWpZQAZJoA/lSnmlqbAHGKAaQsAKjeVR3o5bkt2HlgOn0qN5QAOaqz3AA4OKoz3i5681tGj3MpVDRlucD2qrJdAdTWTPe81RlvexaumFDsc868V1NuS8A71Xa9z3/AFrFe6JOQ3FMa5PrW6oaHLLFrobD3nHDc1BJe4PXoayjMx6H361G7nPX+lP2KMXjHsaUt6eQP51VlvGx96qbMec5zTCcjv8Aia0jTSMpYmTJnu3znrUf2hsnHNMZeQTgigbR1wTWlkjB1JPqSGVz14prStUMsqgkA847dqry3Iwc/pST1Jci2JSe9DTZAO41mm4YucZx61KsjY5Ofeq5RKRdWbDfePSpBc4X72e3pWcxI5GSaY8jAYIP55qXFFe0aNYantbGehq5a62q43c8VypWRznBP0p4hc4GcVnKnGXQccTNPQ66TxFHjjkVGNbWQ/K3X1rl/s2BvkYkelWomiT5VYE9MZrNUIrc1jiqh1KaljknHOaUasMY3dD1zXOIzMSAcj0qrd3XlIV3cjrmh0I9DWOKkbGteIRHCY42JPoD2rhtSupJ5WZz1PWm31wZ3PX6A9Kib7+CS2PetIwUNjlxGIlUfkMVMKQRj8SasWWlajqdzFZ2UHmzSttjUNgtVzSrSKbUrNbmFntnkAkRX2lh3APY1614L8GaNGYNRgeQwyysI0k2s6Ljv7+4raMU9bmFOlKbsjxDVNMvdK1F7K8ieCeP78b9RVS7mEMDlwRleOMkV698b9G0y1Npd2tuY5pHKu+WKsB0/E14b4vnWK2cZJ3YVMdz7Vz4uSgtNmaQo8tTkPPNav1SXUNVlIZYVIUDpuzgCvIbmaS5uGmlYszkkmvSPiZcmDQ47QRonnzZIHUgf0rzdMDsPzrlwfvQc31Z7duXTsIBgdcVqaDr+p6HqKXmm3csEqHcCDwee9ZxXI4FMYZPNdlmLc+0/wBnv44weJUTRdekWK/AGxj0evoBWDqGU8EZr8udJvbnT72K6tpWikjcMrA9Oa+6v2b/AIir4w8MR213J/p1uArZ715GLwypvnjt1OqlVcvde5693zSdR7UZ5o7Vxmwc0dDQetJ3/CgLAOhNGaP/ANVJ2qQsL3P0pab17fjSE1VwsOyKTrTe9L/nNK4WF70ZGcfrSE0nFFwsOyO2aaOlGaTPGQKVwFz6UhOaOeO1Jz7UXKsLTSeRSE8UUrjSFP50056UHPtTalspC89hScelHekPQ0rlC9KOc8d6aTng0H2NFwFFHekySMijPHvQAvfig9KQnmgtxQJoUHpQTTc80EnPvRcLC5GOaM8UhJozR0Cwvfignik9c9qQnjNAx1JnH60h+9SA0DsO9qM0najPNArDgRRkZ6UwGigLD++aARgd6aSc0Z9vehPoKwpNITz70cYpD1ouMD+FN96Xmmmk2MOoxSYpaTNK47AewpeOfemk0oPegLDh0pDyemaTNJuoCw6m9fpRn1pM0XGkMxx1o60uBQAOwxUAJjBzSgDHU0uKBRYVwxyKMYpRS9eOtUguN9xS+1LjilAoQXGqB70uDmnAdaAD6VZNxAvFAAxzTqPr0oQXExxRjn2p2KCPwp20AaAcUp6U4D9aCKpEtiCkHI5pwBzRjimFxOtLzSkYxSgZ6UANI4/ClHXvS/ypKaABzxSdsUtL09yapDuA6UcdfxpQPagVXQkF4BoI/KnY70YyRVoBB607A/xoA444oAz9atIlgevFKBRjmnAcVSJG49eKDyadijHIqkO4mMe1JgDNOx+VHtTQriD0pcDFLjmjoKtCuBFAHOaPrSg80xXEFLRRximMQgdaCBigelHanYT2D3oI9hQDSr3pDEPTpTcDqeacelJ1pMaEHU0YxS96DSYCY/OjGKX39KO/SkAntSijtS9eKkBMClHNKRzSE+pqGi7i8YpjOBTJJAAelU7i54NVGDZDkkTzTAZ/xrPuboDJLcVWu7zGfmrJubzrzXXTpHLVrqJdurzPRv1rLuLvJwGzVK4uzyM5J/SqjzA8Z59q7IU1E86rim9i3LcsWwCfzqEux53H8ahAmY5CNyeeKlEE2AChHP5f4VrZI5HJy1ZIDkZz24p2c5wMY/WkWKQL90/lTJDt5PB+maGxdB2cg80x5ADz+NRmZcY4zVW4lKnIyT9KglyRcEik9ePXFNMqdD+dZ7XDkcKelQ4ndshT+dFyHI0Zrj0OOOOfWmh2JPWqSRTFueMjqauwQ4GOB+HSjcLsayF846H0/Sozbkk5yR6Yq4Rx6ZpTjt2p2GytDboGzxxipGVB07dqkxtz/So2wSMHH1qri6DWZAecZpmVPPBHpmkKAtgtwfWpTHGIyQcexp2AhnmWMcDj6VUe8dm4GP8AGrEyA9CMflUSxqWyBz70uUT1EUSTDcznpT47XaAeQB6ioZ7nyG25IpjasQ4QDIPena+oJLuXZpzAp3HgfkOKw726eQM+cgdxU+oXwmTYiDPrmsq7kCLtXOcc57VDQ5TdtCCSZmHUAg4OP0qRJAHVlPzHHbmqhG3PPc/WpYyRJtYE5GQMe1Fjn5jpdOl09oZBP57s6jZ5Zxgg9O/9K9d8E6dBpXhu1v8AV7xrW2DmaMTbd6jsCw5PHUY/KvFdO82KAyCMojNt3mLjOR0JHWui1fxXqWpaTBpmoy+bHCBtAGCRjv61POlo0dFOaWr+X/BL/wAVfF0Hie7hgtY2S3t3IQ5+8a8n8YahbaVq+kyXMCTQzThCr9DkV09vbwF2dACrEttJ7+xryT44Xty0tr5UUkYs5dxBPO7sR61lWh7VLsdOHblU55b/AORw3xknlbxEbYuhhjJaIKeADXDLkEeldj8SLkasNP1sq2+5jxJ8oAyvHbrXJAf/AK6xw0XGEYvdaP1R6s2nJsnhUMh6A1TkyshHWp1fbTJfnOSK676GaGoehr1X9nbxRN4e8YwHewilZVYZ4zXlGNvWt7whM8GqRTJ95WyKwqxU4OL2ZcXaSZ+l1hcJc2kU6HKugI/Kpz0zXG/CzVft3hGxkJyfLArr0cMAa+eu1ozvHUZo9OaSnzALnNJn2pCcj0o4FLmHYAeKDSEikz75pXGkLnkUH0603NGaLjsOB460Himk/lTSSKOYLD88e9JkDvTc96TPBpXGPJ54pM03PpSFhSuOwpP60nfBpCfzpM896B2FPNGaTPFJ2zQMcTk0lJnHWjP86VwsKMetIDyOKSkz2xRcLai5xQPeg9PWk6YpdB20Fz6CjIApp4FHJzR0HYUnNBIzSE88c0HPrRewrC0hoFDdaoBcnPWjP0/KmkjFBxU3CwpPNGcd80wn86Udc0XHYUnjpSnrkGmZwBRnmi4NDwaCRTM4FG7vRcLDwc9+KM8H60wGk3dvei4WH7uOaM00mkJxRcLDiaac0mev1pCeRmkx2FyaTJPBoJFJmi4C5pc80wnPejNIB2eeTQSKbn8aTOBTuOw4kdKM80zIxR7YpNjsS9qBzS0EdKEZ3Ck6c0o7mge9OwgGMUuKP0p2PWmAe1AHPeil+tUAhHrS9qXHvS4yPehIVxuOwpcc8U7Hp+NKO2apILjcUAHvTselLj26VRI0D9KMdM07BxkfpRj8aAExSde1OOcnNGOKAQ0jp0pR0/pSkDg+9H60AJj5aT0p3pRgelUh7jKdQRS9uetNCsHPFApccZ7UL1q0AoFKANvHFAH50N1qiWLjg9KOlLxmirRIfyoox6UvNUgDFHQilOKB1/CqAQDIoxTu/pSYqoiDiil/D9KOxNWAlNp30pPerJF7dKTvzT6bjjilcBMUhp3I6n/9VB6UyhBxR3xigUtSAh6cUcYpaQ0AthO9HSj6kUVLGFLmkpRSAOtL3PNHGKiklA71IXHu4XrVae4VeODVe6uQM/MRj3rIvb4DPzVpGGpnKaSLtzdjBOf1rKu77GcH25rOur7cxG6s2W4Lg5PFdcKR51bFKOiL9xdsx4/SqczuxIyCahVhnkjHvWLquqMHMNvliBjI6Gt7xgefKo5as057i0hXdczjrgKnP61WfxHpsQ2wwksO7nNc5J9ouEb5HOTzgVE9pg/NCcj1/nTVW2pk5tbHSTeK1CErCGA44POaov4s3oQ0TID/AHjwPwrDmgVyWCnd6DtVGe1Y5dnZsHpnk03PnMJ1JnV23iVwfMyuzHRT1+hrSttfguEVWdA3o+MH2z6155HG7MWAz2xnmnIJTOMuwx156jtSd0CryR6Y01nhmDcex6Uy7jIi3oNw65Gf8iuAtrmaCX/j5kAHTHStKy1q4t7gkFth5IY5Bo5u5tGrGW6N/wA7aTkcA/WrHnFYhIFG2oYLuyvYjIzKDgEshzirEFsgQGIh19R3qmh8rvoOilLxBtuBimecTLt3HirSkBcBPxqu7RZ4AJzRYGiUuoUZ47VGkvz4UCo52by/3asxA6CqvmXZG7aRjsBnFWQ9DRacLnIHfvTGlDHOO/NVN8qx7nUjPr/KmNfKsiiUiJM4Y9f0qQuWw2f4Me/pUbRyO33iFz0FRXOo2JlU27Suq9cgD8hVKfxBHESBbkc8ZPX3ojJNXQNpblyVZhIFjjLgnBJOB+dOWKQElnVf9nvWV/at3ct8iMi+uCBVix+1zMw3hz3OziquRz3ZYe0VwZZJlz6HpUcdpA8ZfcTx2HSrUdoygtcXG/PIQHOf/r1ZSzIA2Ac9jxz61pGz3Gl3Mr7GMMEiJLDg9qzrixaFWMrrnrgd/wAK6Z7ebBWOMl/UcCqE2l3MzMXbdnA6cfhRV5Le6J2OUYYyuQ2PbmpLFsTFScsD05rYuNElgIlaeJW3Z2nOfrVeaGRZizBRu5yMYNc/oRY37fxpqiaLFos3kyafEwYRGMDODkAn0qXxv4nh102txHptrZlI9m2JOTz3Pf0/GuSZP3h3EevBqC6vo4ioePgnqOcVnzvZm3tG1ZmlHMTl0O0+hPX/AOtWF4s0pdb0S7iRGecxnCB8bjjI57EGp7e6TzCrEkenWg3Dq2/PynHSlqtQVRxd0fNt/cP/AGNPo80ZWWzlLKG4YDoRj61zyyc4wK9U+OGjKl/D4gs40VJTsuNv97scV5bcwGOfCsGHXK9KFa7a6ns0antIcwE8UHNKqE9TTjhTjPTvVu6LI8ZPJ/OtbQjsu4wSfvDpWWvJODitrQYTJdx4HO7nJrOb0Y47n2h8D78jwjahv7ozz3r1C0uw68NXiXw4lNjoFpEcr8oPWvRdL1EYHPX3rwXC6ua/WFGfKdukgYYBp+f5Vk2d0GA5/WtCOQNWEtNDsi09iXNIx70dqaTxSLsLmkycdaM03P1qWOw7NJmkJ/Ck9aEwsOJpM5pvbrSE+lUOw7PekJ4/+tSd6TPvSuHKOyKTP0pPzzSZA60rjFzke9BP/wCukoouNIXJo7/jTc0GpCw48GjNMJ5oz70MBxNJntTc8UZ5zQUOzSZ9OKbn0oz+dFwsOBoJwKTvgUgP407gOz0pM89aO9FFwAk4zQTz/gaTqKQ0gDPPSjJwaKQ4FDYAT+VKDTfyopsodnIzSZyaT3opXJA8UEnHt25pKTPT6UDsOJ4pM96TNJSY0PzyKM9KZ70uaLhYUHjmgk8Z9aTORg0hz+NFwF/lR70nNH40DsFFH8qQigQueKQ4zQPu0h/CgLAD1oJFJ696OQcUAWMen8qdRjj3ox+vFMyEHH86cB3pBxTsGgBMUo4oAPWlI5q0hXAClx70o6UoxVJEt9A2+vNAFL3xS9faqAQCl70pFAH50IBD+dGOfelGMYoxVJE3A+vejgUUmKGUH0/GjrS4x703oDSEhaTOD+FKaPegYf40hpOn1peM1Q0Hegev4UtID8vNUAvpS9zRjijvT6CFHIHfn8qWkHTpSnrVoloO1KKPWgHj3qiRc9qMUmcn3pwqkAnIHSl7470fjQTzVoLDqQ/SkJp2cimKwg60ZoPWkzjnFXcBefSkPf6Urcd6O+PUU0KwnSigdKKYwpD3oJ7UZoAAaMim5oHWqAcTxSHtSHJpM54qGNDqO1ICe9L+NSAooOOvSkYgCq88wCnmgNh00oUdazru72k5qG9u8A4OfSsW9vcggHr0q4x7mFSqookvr1hnJNYd5eMzdec0y7uHcnHNUicHk/hXRCPU8iviXLRD2cnrk/40j88570zIB6ik3DIwe2a25jibuyrrF9HaWjuz4AHJxmvNdX8Ratd3L22iWskeDy6rub9eBW38QtXg0+NjcMGbGVQV4T4w8b3935lpaylIyeQnygflWcIua5md9Ogt5HoEdl4yvrjZHJKZ/wC4uoRpJj/dDZrQh1DxJoN7HBqc99aK3Kx3ke9W9cM2M59j+NfO8zy7vMDtu7tnmuu8J/EjxVokIsZL3+1dKYjzdO1EefA4HoG5U47qRSnSk17rOnkg90e/6X4h0/UcQXEf2G4ztB35ilP+yexP9010Xhqaws/EtpJqcMktrkpMgUEhTwTjvj0NeZ+Hm0PxhYNdeE08iYQ+Zf6PI++SHb1aMn/WR989R3rvbSO1l8OQ3keoJNJDtjuYHwJ7d/4Swz8yN2cdCMHBrGjUmpOM1aSOavhNOeB2HxA+Hg0+wk8QeH5/t2lsA4dHy8an1Pt6/nXnMK8FSQNvf1ratdV1S0gltftLrBIMPGSSp9yM4NZSqwl3oocMc9M967HUUlc8yootpxX9eQ5oUkGDkdenTPpUMybRzkKeenWta3hDh3lDlFA3GNSQCelN1C1SKRlJWQY++OQQf8+lSyHGxk/a5t4ZjyuApAxWrZeIbpSqS3OccBCoBP4/41lXAH8OARx71EkTyrhNrd2GK1hIlSa2O7s9Tt9Sj2xPskHB52nrU0Vtfwsd8aTr2BOGFcRZtdwZ2TH5eNuM4PpXR2GqzswWWBz0w2eK05kdCqJr3jSkmnUFFtSAT1Peq8r3CREjZG5PGegFaInnddotjJyCrBx0qBtMhln81rBRIepL/wBKbsxS8jGla8ZdstyrDoSvOPahYJWbIVpCT1z/AIV0UdjGm4iJBk/3eT+NOa3LMB91PalbuTymLBaQCQxMjKwXcSOMfjVO5ulguEjh0uR07s3c+tdQIQP4QQOtAtxuLGNd3TpTBwM23t1lZQ8QjJGQjDp+VXZIkTYh4Uj+Dj+VWYoHBDuUVfRef1pZZPJjONp56+vNCdirJFPbOFT7PFGQw5LA7hj61biEcQJ6kjLKnPNM3TsCY9oOMgZ5/KoppbjbmYx2yZ5YnJ/Skp9xKSLwdA3zLhexNRXUtvEpDyoCe2awdR1ZrdzDE8cv+2M/nWRLcvLkuAW9h3/rUuokw5l2NTVLiN2IRm6HIrKnnjQMzbvQk0sJaZTudiR05zzVLUnSOLGeTXNOd3ZAouRBeToM7TjuCOxrHad/tG0ufqOOaXUZGXBJGGGB2zVAMVcMCQfrSHyuxoR71JOcIT2q07+Zbk5B7Eg9frVewcFSjjKt29TTmBhBUfdHQkdK1jJNWM3oYfiW0j1PSLuymUZkiIXaM8jpivGbLTjO91Y7YhLCpddxwWweQPevd7xV83eMNuHX1/CuR8ReFbe53X9kwtb1TlcD5GJ9e/1qO/c78FO3us8fuA8b7CpGPbrUJ+nWuzvNNG4+faeYg4lAOGQ+xrPfw/Zzvmz1NI8/wXC4I/4EODWf1mC0k7M9NRe6OejXJ7813Pw+0x7nUYVwMbhnjOKz9O8IahJOoWW2kU9CkoNeu+DNCg0ax3SNuuCOvYf41z4nFwULRd2XCDbuzu9Nu44okgU42AD+ldHpt5txg8Zryq01KSO+dW6bu5PrXa6TehwuWAB74rk2Vjy6srzckemaVfZC8+ldHZ3QYDntXnGm3TLjnNdNpl70G72Fc9SJ24XE7JnYxvlaeSazbK4DLnIq8jAgHmud3PYi1JaD6Q9OtJ3NIam5Qp/nQabS5NACHpQe/vRSUXGBPWkJ4oyRmkyMZoQC5NJR/wB9Uc96CgzRmk9PT+VFCAFPWgn0pOaDSBC55pMj1pOp5o79KdygPWjig0gpCsGePejrQRQKBi0ZpD/SjtQAtHtRQKaAKKB0oHSgmwUh6UtIaOoCc4ooopFB1pDz+VLnikI5oAQjgn3pKU5x6ZpM4oAKPajHNJ+NAaBmgdeKXGaBk0DuHfFFAHHPpTqBDQOc0DpTqTFAMSk6mneh9ab/ADoBBSHNL2/+vQeo4pIqwgHfrR04oXpjrS9qYiyOR1oI5o6UvGasxE9fpSjkdaP0pR+tBL0Adad36mk7UoHPWmhXFHTFKMZ5/lSDpTsiqQB2NGKB3xQDVAPpoz049s0p5ozTAOMcflRxSemaUntQAnHbNB6UmeOaM4xQAuSP8aQ9PSkyPWkz3/Si4DqTvSZpM9cdaLjsKP1FKSOueaaDwPWlznrQFhc9qQcDrSA0uePrVLQB2aXuaZ6ClBB7GqT1AWng/lTM4GeOtKvTGDVoQ7rR296RelGc8VV0S0O70DvTSaUHPOaaYrDlNGe1NJ9qUmrT1GkLmlBpmetKOlWmJxHZpM0fxGkHSqRNhTS5puaTPPFUgHAj1oJphPFIT0pphYeT1FJmm5557UZ/+tSY7C5/OjPJ5pM0n+eaAFJ5NOpmeKUYz/WgLC5o3Ck3YGahmkwp5pMewlxNtWsi/u9oPP1pb+625w3Nc3qV71wf/r04ROarWUVcff3x5G7vjg1lTTszHB4qtPMWOc1HubOM5zj8K2SPFrVnN6Fhmz6+9RHH4mkV+Pb69KazjPJyDV8xzOVxHJX8Peq91dLa28lw5wsak81PnPTj2zXBfG3Wzo/g+cqwWSb5FweaV76GlCHPM8U+KHiybVtanhhkIjRiGIJ+n5Vwy/M3Jz7ZpjsSSzElmOST3pzZjgWTI3NXUketayI3bJ9hzXsH7KvhvwZ4j+JCW3jWe3FnHCWignk2JO/HysfTvjNePOR+dOSVlIKMQfUHBq4SSZM4uUbI+5f2lLX4ReE/BhudEXSNK8TwlW019LIWcMPXafu465614d4Q8Xad4gmS5vIoY7hlMFxAiABN38a/7JPvwcg9q8LnunlOZHZz3JJOfzqxouotYalHcquV+667iMj6j86wxNNVo2benW+o6SdNt9+i2PpkapJ4T1ew0bWZc2V9HnTb12yuehhkJP5E/jXTrZ77kKkgAYguV7L7dj9K8n8Z6xH4l+FS+daf6RpbrmTORk8ZBHPIxW38HvEd+dK06ayu7q8mG60ubaTEgUDoef4SMEelYYPmlC094u3+TMcVQgnzRPpHw94W0K78NyWnh/V2utR8nFy/llFcsSVWQDtntz061j+NPB6WGhQSzadJaXsa/O0dx5ytjqWB5X1yMjtgVzOg+Jrjw9rrS2RlgedCr+WB0645BHX1qxqvxH1LUdZsn1uUoLd/lEESggEYbIIw2fQ8f07209zglKm4tNa/h/w5x+p2mx2Vt4YHkcj/AD0plpbSSMCisOBnAz+ldt4x8YabrgjVdNsYJ48Ktz5ZDuvuuSoHsc1zEcqo4Ky/MOhBwKya7GEoJPRki2NxuUrEwY8ZIrUsNPuJgERSuOrdAPaqK6jcsVCzEKBxuHFaCa7cGADzQ7dDhB/+utIcn2gUUa8GnvGmxWVT1bC5yavJC8Y+UAY4ya5ZtQ1BjgXT7c/dGOPXmopbq8zveeRiPVq0dWmtkzRJHWsyAlTInuOKimmjjUl3UL12k1yBvZthVpGGegBxVVrpuRvc9uW6cVjKp2RLZ1F1rtlbEZCv3wp/Ss+fxRkny7VVTsWf+lcxeyB/lB5xVNpP4TyR1NHMyHNnUSeIriXAiAJPU4wB/Wnpqt4GP+kBc9OMiuVy0YyrHB/OnpdOWxk8dRUu4KXc3rjWb4M032t3l+7vJ5xWTc6vezgJJI3HcnOKrgyM7Mc8DgUkipjlmJPoKSkyZN9C1BLHISWYk9xnOKkHIyuMZ5HeqEUWeMkcdBWlbwmMb+v4c1Miqd5EynyYiXJB9OT/ACrl7+5me88yXcEGQO2RW9PIz5O0nPBDdv8AOKxNWgM9rK6M3mAfKoPB96mKsz1MPFK5VM0NzFJEu3cOcE8jioI9xflsY6YHNU9NvF+aCa3KXyEbh2kX+pHpWq0a8OuFXHc+vas53RhiIKL0CzibDkpjGceh9xV5lX7PhlDk++COKbao2Pkj+Q5w5HB+npU6275O8oBnaMHGfenGWhwS1ZSFufKWUkBCQPm9fpVPV4W2xtbZd92PoK6GOwK2jxM3mso/iPP6UklnCm2MSo+TklRx+dNyRpSk6crnAtc2kNw8d5tjkfOWP3T9fSsm98P6bNcCVH2s54x0PpzXrP8AY2kSQgz2VrKzMSWdQTWLqXgzT5GElk7WxBztU5X8jXLXoQqe9FuLPTp49R0cTktD0i0t7qPDPlepBz+tdlp0Xmaj5cZxGoGOeaw00+/sZ9si7tpwWFdd4XsndhM45xyPWvLnRdLWTudrxEa1owMrUtJC3bMn1GAataY8luVySB0ralg/0tsqfUc1BLaANuC4xXTRfNFXPOxVPkk2jb0u53KAfxro9Pn2spY5z+Nchpx8t1BHT0ro7R+mM/lUVo8uxhTlqdjptzwMmt62lDAYrhrK4YEc4wa6XTLncANx965J2Z7mErc2hvA5GRSD17VHC24cmpO1ZnoIDmkIzSnmkJ5oAO1Ie9L9aRutAIDSUfyoPrQhid/ajOCaD9cUccmgoQ0vfFIelB60AJS+n0oPU0hpXKA9aKB1o7HFNEhSH6Cj2oHPWhlAetHPWlptABTh0pB/Wl9aAD0oAHeijFAC9OKWk/Kg0XAZSmlpDQKwCkpfxpKAsFFKTQKBjcUY4p2KO1ArsYaTGafgUDrn2osFxuMHpR0p1A6UDuJRR0BpPwoAWjpRRQMQ0lLihetAhpBIxnig5z1z9adjP1ox7UWAbjHSjGB70/GexpOopWAs0npn1paT8etaGQvWgdaB9aMDFADh1HX8qWm0o60E2FFKMDrTecetOHWqWwhQeaXoKaOOvFGeCKq4DqQkjtSZ5x3pCeDRcLDvSkJ5waaTxikJwcii47DiTikzxTSfWkJpXHYdnnFJmk3e+aTNCY0hSeB60c4pM9PpSEincLDsjHNLnjg0zPH4UHqOadwsPycUoPY0wHil9qaAeW6e1LzTCcYNAbNUmBID0pOcCkBFGeMmrTFYdnBxS5PHsajpc1aZNh5J5ozzTc4IHajPB7VVwsPBpKaD0oGc1SAkHPNGaYD1+vrS7vTGadhMUE9DSg9elMJwaM8HqKu4WHk5703JpM/zpD14qhWFzRmkzn0zR8o5p3HYdSZ45pvSkP3qYx2c+9GcflSZpeQaBWDPHvSjqPrTeD60OwA560BYbK+F6isu/udqEZ/KprycKprm9UvOvzcUrXZhVnyoi1K8OSM1gXEpZsnGPrTrufe5OffFVufy9K1SPCr13N2ELHAGMDPNABxjoKVgcfWlC56cZp3sctxOcgfz7UoycYPHuPrQy9f8mlGCcVNxDQCRyw5xXh37UE8g/su0B+UuWPua923qp+YgY5ye1eD/ALTjKX064XadrHFJTtUivM78HHVvyf6HikcR5JH0zVWUnOG7VoJIGU4HJPaoJ0DDPBOK9Rw926OlSd7MqLzxzTtjKxDDBBwQeCDSLlelbfjXxTrPi3UYdQ1u4W4uYbdLcSCNVZkQYBYgDc3+0eTSSjyO710Ld72MFgQeeaRWwemKMZpCKzYzstD1xYfDuo2101yDPCFUxsNjY4ww716r+zX5dv4Z1TUZi43z+Wg3HBOOTivCrB5TZXECRlgV3MeuAO9e6/CJmh+G1qA5AllkZs9OvWnBfEzlxkuWmjtmlMkxbh1HoaydQd5JQC44OV4/LmraEi0R0SUZ4Zj90/TisW6mYXBVR8vUfWhKx4kn1NC3JkUJK+CffitOGQsoXfwc4z0rMt55JzEZWVscfMR096040AAIOQOhx0otoVF3Q9lYgopPzHk55FSQ743PzElRgHPWojgTZYnOMYFTxnzfmLD5eOaotElvK0Z4PHoc8VaS5jGVeTJ4xkY+tY+rXkdvEOSBnB4IGfrWfJP9rZE3eTtOQzdqze9j0MLSU1d7HWvCjoWLrkelXfDXh+PVZpGlukt409cEn6f5zWFFdJ9mJRgfl5wetVkvp0LhJCoPPBPXvTg11QV6MYl3XbaGG6lit3EkaMVDj+L3rCnjKyZyo65xWoWMsfz9fU1G1sJVIAIxxVM4pQ10M0SZ5J/WnsVBLgjPBzikmheNyrqQQe9MdApLknI646UW1M2TQMzkndzjnHapY0MsojPX9abpMSzzKrOEyMA9P09auTWz29zt8xWYAbWU8MKEluFmJHb+S/zA+nNWGdCq4JXGM0sayMC0pz+ApjwHBYcZ7+tRNWVzalKz0IPEVpb3rxm0meMAfOAeCf6VT8hoYghJbAxn/P4VedSGOB9MdqqylmfJHH+e9YOTsX7Zpmc9laT3KyTR5cdG9KsxRp54BZdoGabMrZJA5HUg0xXcLuC8qecVlaUt2KVRzjqzRcEodqMwHHBxmkWYkBHXcep4GcfWkW48tFyNyHrgVJJMZFAIBPr6+xrZJ9TnYErINocqM8dsf4VVkjlR3UsCR90sc/rU7qozkMPUL39gKY5KrhVzx9QabiSij5t2pDBsZPIz0rRtLuU5V0YnPWoEba+3keuRzU8coLcnb6cVzzo3NozaVie4fzVJePcw9R+dQ2+ptbgqE249KnFwFKgKevcVLcWcVzH5wGHxzxXPPDxduZnTRqyjrEyZdZzdbiec9+9dBYyLdQZyCR1xWBNpKyfvMY46etbOh7rcCNiTg96iTjBaHck6m5fij2sPT+da9gMgH9aq+TkbhyKtWZw2Og4rKrJOOhySouEtTSijKjNbGmOV2jtWfb8jkVZgbY4HeuSx20I8rTOqs5QQMH9Kuo24dawLCfkc5rVgkBHBrOzR7EJXRc7YpDikRs04j0pFje9JTsDFIaBoTnrR2p3SkPTpQO431+lHrTiKTFAXE7Unse9OPSjvQMTFIelOwDSfSkgExSU44zzQOmaZQ2j69KU4pKACg9KQelL7UAGPxooHBo/WgA7e1L2pKKAHUnSko/GgANIeeKO9BoAWm0UEZ4NACjt1o6HFHalxk0ANpSKdwKDT2JG4pMelOI9Tmk6UAIR3zS4o/wAaU9aLDuJg4oxxSjkUdyfegVxpHaiiimxBik/pS0d6ksTtR9KD1pO//wBenYBT+tN7Yo+lFICxml/Cm/40Z4ppmQ4nnrR+tNJpRz/jVAOHcdaXPem5/nQT1pXAd270uR2FMzx1pevtTvoKw7PNBbP+FNzmm5//AF1VwsSZ9aTNMzikJ96Vx2HfWjPXnrTCfegn1pXCw7ODSbuB3ppPc0meKBjic896OnpTc88UE+tBSQp4we1GabnNFUA8GjPuKYOnp/WlB5p3Adj0pQaQdT9KWqTJFzn60v1NMz0pQadwsPo/nTMnpS7u/atL30EOz15xmgHjB5ppOQKB0PNUnYVh+cigHimZyMj04ozVJhYfn1NBIpmTjr+NGTVoLDwTjHSlJ7etMzj0596M/lVILDyccUhP8qQkZ4pAeOc9KsTHH71G6mk0lAh4OR1pMn6U0dM0enPaqGOzz60E+2aQH+dHtVCHCj3pM8j3oJxxQAueKrXMu0cHtUkr4BrI1K52ocUGc5WVypqt3gEA9K5bULje3HQHmruq3JJIBOfSsRmLH371aPFxda75UICS38+3elBGM80hHygnAwKQHHQDHWg816McR9R2zT0BAPvUQJLZz71OmDxnP4Urkpgy54xnmpMKiZJHSgYGD0OfX2qhrN2IYG57cHFJysjWMbsytZ1NYCwU4+leV/FmEeIPDrFGUzW8ma2PFOq5LKrEVzWkvPcmdXXdDIvzDaeOetYRhKbcl0PSoNU5a7HjkCvDKySqVK9fanyRk/dIFdH4x0w2d83GAehwcGubJaN/lJwPWvWoVlKJtOFnoQLD8/zEAVFONkmABgVbMisPmXFVZss2ePwrabjZcoo817siH3qU4A4/OnCPAJzinwwNK+xQfyzWJRZtFYWsr+S5AXbu28L6ZNe+fCcrJ8PLKIAkDcR+Z4/lXjJVF8OPZJBJ5slwpDA4B9sV7d8PNOutL8I2tndgI6gk7TnjqM1VOXMpaHHjleCRrTXe6w+xGOMKJN/mbmDe4PYj8M1itlrh89B3ArSu4iEIwMA4Gf8APFU/LCy4clQehA4B7Uqkuh4sm7lzTxD5QDszPnOd4K49MY6itPKwxfMd4BwB3WnRLb4jKxKpXl8DAY9j9fpSkoxVcE8Y+7ggfQ0J6WKSsRweYyF26YyBnPFXbUhEODu5zxUCSiNwgcEDtjgD0pFdzLuSHA3du/4Vm5Nl81jZ0aPQhqRl8RWklxZmMjCMQVbseK5PxLZia+lj0fe8WcozHkLnpkda6i2VJoykiKfw4zS28dvYQSRoMFzkkHPWiNXTlZ6GHrqEbHPaZayWlkEdyTjkHmrlrtVh5g6Hr/OnSsSx6hev41AUIAY5wOnOKuHmY1azm7loMhfgj2xUsDGJiwyB1xjiq1tgjKgA+9WUO7g421bRje52uheDU8S+HZL+3kbz1BwB90EHpXDz6bNb3T20qbWQ7WGK9Y+Eeqz6PpF3GQk0cziRFx82cYP4Go/Ffg3U52Osq0Ks77/K6lQT69O/St1DmjdHRKknG6PJ7vTXt2UBHXnOGH8jV+ytg7B2yTnnJ5PHqa7XWNHu4LJJbmHCKPmIycE8fhWFBJFHdncAeMEkZ/OonHl3MvZtFbUYoltEZMo5ADDtn+lZ8bZbZyfQ4rY1aKKbJRduOQMD9cVkxReXMCMZ/Hmueq1sWotC3MOIjgDIFZc8L4BYYbvxzXRGMmLp+tZt6gyQelc0nZhKHUxyu4Bc4JFRgFXYMuQR0NXpLfa4APtjGc057cuASQffFOMjBpx0KCHG7uO3pUyYXnqM+vT6Ustu6Z2DIP6e9R5bAC4yT1x/Stb3JJPMEnyd8/ezjGKlUEgjJ685WqqxyK2dwBIyOMj86sknjglfbt+FDZcU2LcxQkB0UqFXoD37VWVSkhGWx0qVj8i9eeOeRSwrhhk471hOdjdU2+hZt4y3GOO/rWiqFYinJIFUIXVcM5JJOelXYmMnTp1rgr1uiO2hRY2MBnP3SBU0ceJAwwfWnxwF3xjgVdt7UqF3Z9zXnVK1z0qVC2pYjOIQSOnWiBjv46fhUdwxiiAOPpSQOCueD/hWlPWNzlxS99GzDOFQcjj2okvAhBLD1rCu7zyh1xxWc+plpMBmUd60pQujop01Y73TbzcM81u2lyMDnivOtLvdrDnGfSulsb3KDk1cqSexsnynZQzj1/GraMTXOWV1nHPatm2l3AcjNc86bibwmmi7jIoJPb8DTUOcinH9KyNBOx6YpOgpevpxQetDYB3pB60HOaWhgI3SkPrQeRRQUGetHagdTxSdKkAHBzR6gE/SgDJoOe4/GqGhDxSfSlIzR3pXGJ/KjNHUUpx0pgJjBpOhzTu+KQdKAG07NAFIe9ACUvvSmgUAIP60p96Tkn6UHp7UALSDocUoPrR/nimgDHGaXODxSAjHNH40Nki+9IelGabQwFzzRnAo6HmkJHTvSAX/ABo+lJkZoB5phZi5o96Q9KP8adwsLmkzSEHJNGeMVI0hfekPWkbpSZoGLmkPGKQmkLUrgKD09frQcY5pucdaTdTCxZJzR/nFJnvSZ59KCOW46im57UbsDmi4JD8mgmmZ5xQTincLD88delJk03NGRnnrSuFh+Tk80mc+ntTN1GcY5ouxjwaTNNzSZ70XCw8mkyPxppJxRmgdhwbPGaTOeQaaT+FB+uM0ByjiR60Zpo6//Woz1podh3pQDzzTfrQCc81SAeD+VHH6U3NL1p3uxMUnkUoORTQe9A6cVSGOBpc9ab3/AJ0VS0JHZ6GjOBzTadkgVqAo+tJ2HtR9KAc5p3JF6flQDjNNP9KUnnIqkwDNLnjOKbn070E1omFh2euelKD05pmTjoaM8U0IeTzQMUzOaXJ64rQB3cc0n6cUmffNL0NAC5/nSknj0pvfFGfSqEx2eeMUZwKO/ekU0E2F4oJwuKOgqGd8DrVAV7yUKpOea5rVbleee2etaeqXG0HnFcnqVxv3D6ihbHn4qryrQr3cm9yT61WOOfr600vliAeKTJxyR+FaHhTlzO49SMf5waQ9eRx/KkA+b06CrAgkYE4NTcy1K44x6k1OmBySM8daYybDyOnXNVL26WJD8w46YPWkyoxbH398sSt8wwAea5DXdZRoXBcHg4561S8Ta6qqy7uRnHzVwV3qUt1NsDHBPasHeTsdUElqPv3kvtQCLlsmu58MaXBBbLviQlh8wPOeKyPC+kbnWaVOSAenWu3gi8uMADkf/WrspxUY6C9o5PQ86+IPhfzg/lrk4LJxzjFeN6lZtBOyOpBXqD619M+MLd301ZE5dOhxXluoxaLqbmDULd7a4HBngxk/VTwazg3Btx26ndRqcy5ZbnkpXI46expu3Hbn6V6RH4L8PSXLLceK1gQDP/HqdxH4nrVabS/BmkESR3d9rjqeI2QQxn/e5J/AVr9bp3td/cdHs5HIaHomoaxO0dlAXVBmSQ8Ig9Se1bFta2NvcLaWkkspOPPnC8N7IPT+db11eXeq2DRGS00nT4yP9Gt8KPp6n8a1vC8FhZWWVk84jIRZBtP+9modaUm+n5/MHGyuVNJ0iO91+CTZ5NlZ8x+aM7vVjn3r1PwzcwakJhC4SOJyqg8cY7V5pJfH7Qba0gaR3YkrGhPBxkDHUV7DomhaamlWqLGY7lUDtPE3zZ649/oa66cOWGmiOLETjtIyNXUw3KkgqM9qS1024vnRopI4AFY7pBgHjgfjWrdWEU0zM564B7Z96fsAuVWMO20chueKzvrqePJLmILG2ZoA1zqMA2jGHXgkdq0IQJxHFIqBv4ptpBA9MelNKgBgYVKnpkYwe2PSmZXJyzEg+lVdsNiMwKJsqqggYBxwcVIiq2TgE9GOKVpRtxgg5796WSSFmUJhTjqKHB2GhBujfbHyAO5x/wDrqO4Jc5xjjgik8xt/BBXPOaeNrZAwT2pxjZ3GQQxYBDjI+mTUd1E23A9avbdrYz1p0qIyLt655rUpK5lJGVfIyOcVKHIGQcn271O8RK7cY9/WmmEqOAT9aLj5WjqvCF+kLos0kgAbIUsQuRjr/jXo0viy3uEWzyNvG7HKgfXvXilu8scgIG0g5zWnZGdpwS/AHA7U/rPslodUHc9e8Qajps+iNZFhuddvXn/eFecHSAkv7sfmTjPrViwtTv3uzZ9zmtmKaCIAA8454rmrYmVY6Y0OZbHOz6dKF+6Rj+VUprdomwUI+lb93rVos7REgHoeayru+tHY4I9KxSlYv6sVZcmE47VTkt2khZ+Tjrirc4xE0gdSCM4/xrltR1a5t3eNW2rn9O9Uo9y1hr7k+5XYjJ3A9CanRlJA6H1rgbm+u0vkkLOAW5YntXb2d/ZvArtIMgc+1ZyVtjGthH0LHlrg579CaoOoDspUHuMf1q8txHPGzR8D9KhSNnckjjPpWDxHKzJYST6FReWAUDmhwVzk5x37gVc+ylXDZwB0NWbe1iuGzHtYr04wDUvFxtY2p4OXYzI1yuBwM4yO9SwwTOeh2juOgraFsnniPBUqOvpU0YthKRINoH61yTrt6JHZDByMWC1cllI6nA9a2NMsvLH7w+47cVIEjmb9xHhhxn0rTtbCRypk59gOlZKjUqM7oUY09yGFV3gJHuBOc44rStbYsNzj8BV63seenFWJoRHEScYxzTlh4wRonc47xPIsbhU5x7elVtOYmIZIyelTaynnXhzng9f8/hUlnb7FG0cdqjVKx51aDlO6M/Vidm3oT1zWLDvEu5uv9a6HU4yVPGOMZrKkg2sSvUH0zxXVQV0dkI2Ras3wevatvT7vAXJPSuaR9rdeP51ctbkheTx3rqjHUzqqx3Flc4xlhj/PWui065DAc/nXnlneHcuT0966fSbvJGCD60q1O6M6c2pHaW77lqxWVYzhkHPWtKNgcV5FRWdjvjsP/wA4pMUtBpDExzSe9KeDR70AhOgpKdTc0rDQUelH86TNMYoxmkHek70fwk0DQvpSetGeKD196kYCj29qTJoNUKwdaO2aDSZ49qBi8cGkz1NHSkB60AL9KB1/pSdBRmgVxcj9KB0pOhz60ooGH5UlHFHv2oAUYxQfWjNJnmgApDmgmkJouAvekPJFJ9TR2pXAVulKDz1pmfTrS0mwFzRkZHNNPHXpSEmmmA/PY/rSE03qKTsPrRcLDs8Umf8A69JRxn2qbjsBPGKaTgjJpT3P9KaT9aLjsA4/Ck6Z6k/WlyPrTcmhjLGcUZpuaM0XIsOyDRnjNN/HFGeKAsOz6c0A46U0nijPHbilcLDiT3oJ9KbketJuycZouFh/oaCaYDmkJ4HrVJhYfn0oBP1pmf0oz1JpX1Cw/dSDr1ppOev6UpxnIp3CwueCOaUdaQc0tUMUfpSdTSA5OaXNCAOKXv60n8PvS8g5wapbCsA6ZpfrScGgdBVIB1A+7Sf1paaCwD6Uv0FJ35pc1oAZpR+lN7UE4ppiaH8Un0NIOvSjNUhC9aM9aaevakzVIdh2Tkc0U0+tGO/61omKwp9qM9RSD2oJ6Zq0yRw560A4pO9HbP8Ak1SYbC5+lKDzTe30pf8A9VNMGO7c0fyoA4yaKsQ4HnigdBRSdun51QmK5wOKoXkwGc9fc1ZnfA6isTU58A8/lUmU5WRk6vc8EAnP55rm7mQs5JzV3Upyz+x5rNYjPt6itEup8/iqvNIQDP45o3NjgH15oABJzT8DGMcim2cRc0uAzSj2NbsltHHCeAMDjNZWkusfJq1qOpIsR+YYxWU73sXBKxj6pMkJO04P4VwnijWFjjchyoHA561c8U6wE35c9+T2rzbVLya+uDsJIzxUtPZFx0KOo3E13cFVz1rY8NaCzkSyxgjjgjir3hvQt37yVDnI9a7W1s47dVAAxjp9K2hHlMqlRvREdjZrbj5FAH06VqWyHG7PIFJCOBjIq9Ci7cdPpVrY2pR0bMzVbfzomiI+XGB3x+deVeKNA2XTywr+8U8Z7V7HdlDHjFc7qdnHdowA+cdCK541/Zyv0ZrBvm0PGPs0s4AeILKnDf1+oqU2MUbK8ds0jYw5Y4/T0rtNU0lG3R+RtcHqBzUdl4fl2rEq4RhyWySM1vKlCp7yZ1QxSitTi/LjtLpri6MXlnpEeOfb/wCvWjoWl654ruBFZW5t7Uffnf5Rj2Fd7oHgPT4rsTXkazn0IyBXeWyWOn2yQ2kCxRqMACqgoU9tTCtjb35TH8JeGrTwxbItsoe4YZMpALfhV6/1BYw0bIXZiQeMfjUGo3U7FRErk5+UqOn1qtDBdzASTyKByBnqa0lV5ndnmuXmRea0rADDAnsPQ96lCbF+/wC/9ak8qG3t9qNgqd2e9V0IeQ5JGBxnjiiOruQiWRhvAj59wP1oDbYyORgnFNjmQ/IGJCn8acTkfKeK2Wg7DWYsScDBPrk0CMnoQDzg1YCoBgAcdwfeoZZCM+nY+tFykiVSRFh1471HEMOG2kBqfbozDdyB1zViFBjcFxjsas0UbhGNzANn+VRXs6W7HaoB/SpYXDTHbgjvzVmSBJSNyjnj3qZTSN40zNNxiMSEADOOfpWjpsaXyblxx6VjeImVI/IjXnjOO1SeF7/yCIHfOelTJ3OyNBNHQrpKcu3BXqOuR61ds7RdwIOQPeqk1/biPbu+Y9BzxU9vdLBEsjPgH1rmmnLRGkMNZmhdu0UJ284XpisNJLs3D5BwTnFa0d2s6Z/hNOWJX5UAqRTilFWOtQsrGMtnHPIZZScjHOaztbtoYyPJbnuM810lxaMgbYOcVg3VvIZcSqfaqcktjaFJMz4JpwmxmZh64rL1O0lu7vcq4APf9a6sQIIwMZ9f8KaYojxjkHj1rNyubqlys43VdNR4o49vzAdcZzVBrSSPCKpLexziu0u7RHGSarNZRCVCi5Ydqyk2jSNO5R0aOZQIcDc3PPQ1rT6ZdGJWDggj1q7ZWDyMjC1ZiOmRgCtKSx1GQBRIqJnBULk4rlnFN3K9nHqZdrosklpsnbZkdm6fjSWtpbWDqiyEgcEdSTXQQaNKdoluGlHfHH5VopoltGflQZHepVOKeoPlWxyttbXUsjtFCV3H7z+lX7bRCSHnJY5zgdK6WC1iQckAfSpHktYsiSQZ9sVadOPQn3noZNpYqrj5ABjgYrZsrWNVDbcfWsy71SJB+4iJPr0qhNrFyo4YLx2qZVJNaE8iOsmaGAZd1XHasXWtVgWIxxsCcY4rl7zULmR/3krZ64NVfOLnDfjXM7t6ik30LQcyTE47nArTjUeWOR09awpLqGHBLbcfpU9hqiSgKrZ/ClvsYKHcsX6jqcYx/nFZEyfLwBnnp1/OtG9uVZeP0rMlkyc+vYmuqhFpGuxUk+8ePcc0+DIxhT7dqCoJ6/mKsRxHBKjFdkY9TKbuLHNsbPUVv6RfAFctg1z8qbe2KSyuTHJj5vxqpL3Tjnoz1LS7vcoGRXQWsuVBrzrQ70naSTXZ6fcBkU5rx8TCzO+jPmRuhqUn1qCF93epc/lXNc6LC5pCe1IetIepouCVhd1ITSGkJGaLjFzQDTcmikA72ozjIpuRnFGeelBQ6imA+1KPvUAONGabkUdxTuAopKQHPelNFwCk6GikBzS3CwueKWm5FGeRTQrDs80mc0Z9DSDoR60XHYcDRnr/ADpM/jTfrRcLDiaQnJo9TSd6VwsA6GkP9aUcUhpAhO9HQfWnd+MU0+tAwyf160q9OfSkzxSZ5oAcexpvQDBAo+lDdqVwAHn8KKT1+lJTKF/Kl60mKd1B9qAGNnFNbBJp5xjn+VNPNADelIemQaXnPFFAD80u724ppP6CkbpWYDtxzkcmjd69abnnnmjPBpoB2fSjdzwM0zPTtSgGmmAuSKM0nbmlqQFzzmk3dKQ/rSfj0qrgOz270oJ5pvelB5xjmqFYU9f5UvRue9Nxx3pw5IoGKO/NKOBjGaaPYZpwH1+tMAHvR0FLz3pB+NNAL6Gjr19KDxR04poTClHSkFL9KsQvel6DNJ39KXiqAD1FHWjvRTTEFDdKO2KKtAAPFA4FA+vNJ+PFUgsH1o5oPIobjiqADSZ+ajtQeDmtEAv4UD8aQe1KenSqTJFpMdeaWj+dWtxMB27UvBP40Y49qXvmqEJTgOtAGRmlHr3qkIWmsTQWAqvNLhcg1VyW7EF7KArHPNcxqtzgkZ71q6lcYRsfzrk9VnLNjOfx5qkefiqtkyjO+9ySc1EM7hxSdTnOR2596fgscc8VVzwpu7uOVDz709Rnt+PpQuemcjPp0qUAYBx+H1qZMzEZ/LBIIJHTFYOuakUjYbiDz1NbF422MkHp0NcP4mkZ2dFJHUHntSTuNOxyuuXcl3cMgIOT2arugaICwZ1zzxS6RpbTXAZ1yD39fwrt9Ns1hiGEOSOK0irK4pSvoJY2aQxj5ccdKlkUAgZA96shccDg1HIhPv7VPUzsJAvzA+9XRwuzAOeOaox7g+Mde1XYuEywycdPWlKWh0QlZFe4UuoOCeeKzL2FosSo2Mdu1boXIyxAB4qleRI+QuCvTk1lyX3BycdTn3liYHMYDdM9f/1VPazxYAjj3uenFXo7eFDgrk/TrVtFhQFQgHJJ4pxpOL0ZDqt7orWs12y/LAUAODn6datDhQZHznqAeKjkuGdQAx/T9arSM2zIOWxkmt1Ezd2yaWVRIFUAAnBYVFJNkhVIZSeQTzmgR70LkEKfQ0iRoGLDJ3dQX6f4VSsLlZDcSFxgLux3ziokVscDJx03dDVm4VFX2OMnPSogVVsDOeuOn6VtEFHQbHEQ23Zj3ParUFsSTvfHUcVIjmQAbSD2IGM0243RheMkdPpV3SNlT6knkrERu7nnmlMaEZABY5/zioy3mgAhun5dqltEzJtbOCeuKTnZFKNwh3KmOnSpHHzAjBGeRmrcliFCOvbqKmggi8vc56Cs3M7KdCTZRjtCHMqZz356U+S5t7YZmYBvQ1W1PXIbINEqjdkgc1y2spc6m6yJI4XPQZ6Ur33O+lhnZaGlrE0NxvaPacY5zWXpcu2bJTLY/wA8Ve0jSpIY1MjFieMHtWvZadbxS+c2Cc5xiq5tDshh7LUoSrdSSLIFYLnnPFWAt3dYjXK49vpW20sHl7QFHGM9adaSxR5YRliD6Vm2dCoroi3pdg4hUSvgd+autcW9nCFLZI7DnNZhubuddqrtHf2py2Tsd0hJNYOZSp9yeTWATtSM1n3l28g/1JPNXhYAfMFOO9SG1UD58HHWoczVRijEc3LgbYTz60+PT7uY9l/pW2QFC4XI9MdKmiy2MAH+VQ6pfyM1dGUx5LbievNaNjZ2sKjIUnPf8qdNG8i7QxUfTrUYtzgAMxPX1JrN1GTY0RPbRNt3qD2FNa9T/lmhZvTHFU0tMnc6n2qwICMYBPA6VDkiNEM+23bPwqoOwzn8acbu5ByZfwA61IbZgcHrTHg56c1HMF02RTSySsAzO2fU1DsIONuBx0FaMEIIBK1I0Ix0GaTkJ7GDdggHnnmqL5KkZ9s9K2r6HP4Vk3SFQcZo1Yk7mZdnAJyenJz/AJ5rPmnKBiM5FXp8lhgcfTrVK9jxG2MHjr1rdRXUzZyOv6rP5uwM2ewJrR8N3EhVXYnoMk9KzdQtHkuAxB646Vp2EXkxDIwegqppOyRmlbc3Zbk7ADnp3NV/NLSAZH+FZ8k7Y6Ywe/SnQSMWxkkda6YU7GUqhrW53EHGPw6VowkbenUfhWbaKxbIBP8AWtKBWI5B9q3sZc1xs65Tp2rNn+Rywbv1rYkT5c9Dj+tZN7gMc+lZSM6iujU0a8Kkc8eldvo93uCkt1ry6yudko7djn1rtdAu8hcfoelediEgw7adj0OykBAGavKwxWHps2V5PSteFgVGK89nqx1RKTRSE0ZqblWA+1N70Z54oouFrBmkzSHpR6UX7FC5oz3pKXB60AGT0NAOGpOgpQOetSOwueKKTFAppiA0g6UuefwpOvNO4Bz60Ac80E0mfagBe1KKaCcc0vf/AD1ouNCij8M0mTRn3OaAYpPNISKOtJRcQZ//AF0ZyeaTjt1pDQIXNHNC9aWgYnfFGOcUp5PtSEGgBPQ0Hj6UuM0u3nIqShozRnn1pdvalAxigBuOvpQBkU4UAfpVAN/DrS4wOtKBQMfT2oF0EIxSYG6nYopXER984/Kgjjpin470hHNMpEfWgZ70me5o6/SouAd6B93rRzuzQBnpnGaQARxml70D2H1pcd6AE7YwaMfnTsAdqTApoAPWkIHT1p2OaMYx3NNAGOpFA96Xp0pKoBQOOBSgc4NJgnmnDG6kxMPelHaijHP04poQpFIKXvQenemIKAPalHNIRVDAdKXt0pOg44pfQfnTEwxjnvRjsOlL3PFAyRx+tUAhoFL6UuBzVpgJjiiloNNMBMd6TrTqQ/dq0wE7Yo7UuKUDiruAzBOKXHOetOGDRTQDQPSlAyKXGKB0FXcVxCCDS/Slx6Ufw1aZLEpw680c+lFWmKwvQe1Nd6a74B7VUnmCjriqjqS2luSSy471QurnC8Gq9zdjk7uay7u7BB5rZROSpV0uM1K4yCc1zt4+ZOv51dvZyxPes6TJY9qGeRiavMNj+nFTKO2PypiLk5645NTqATzgDsKls4WIg465AqcLhKEU9OmPWnkELzisZSEkZupKxjIGciuavbHzJCSOfr2rq7wZ+ucfWsuUDB54rSk+oSRR0+ySMdAf61q7QOo4HXiooM9eOPSpypJ689PetGzO2mhE5/wx6U08npU2zcehzmlKBevGOlJlISNQevWiQheh9xgUwyAHAI6EfWqN1cckA0lJPc3UG43LEtxgYFVGl81jgkVVaQkgg5zwKdGJNwK4Dfn/AJNZykuglDuCyssnJ9evpStOWBwAAO9MuEcHLAepPSodxbK4yO5HerjMiVO2pahbzcspHHOO9NVnwMNkg59qgSJ85AODwOatxBgRtzz14zir50NU32JELMGjfB9MmoQADt2rkZHHrV2OEnAYH2OBT3gtwRuddxPC561PtEjRYeT1sVWj3ImMZz0qT7G+0ZGMj61YS3jWPk8ehqCW4aG18yBfPjX0bnHfFaKt2OiGEk3qTW0J8zAXBxwf8auy2TSQ7toBBrMj1Vyp8uzkc4449fWiOa8nYtJIsJ29FOcmhVL9DrhgujLsNqCckhSOuT1qeCBI5f4vY1QUGRgNzOcchB71r20F/KgEdpJx3fgUNtnTHCxQ26SaUiONzGCOtSWlkIY/LmlBHTkirv8AZmoSAFikQHdeTUi6MhbLSO7YxyePypOVtzeFONzl9V0azuZswRtIeuR0qxYeHLjb90KoP511cMENqMMFQDn0pZb+AALF8/uKh1Dpinaxjw+HyPvNk9sdqnGgQL179z2q6k08oyhA9qfEJXHzN9RUOo2WkzP/ALIgB+7nipPsMUQComelaEKsj5wfTmrKqhOemfakpX3Fd3MY2xjYMox61MICV5B6dq2WiQjJUH8aZmDOwfUioY1JmekYKnj6Ui24Kcrn3q5NNAEK4PHYCq0U0jDEcB+prJyNYsgFuVbd8v40+JAqlvy4qYWksrguxA9KuC2EZxjI4qdyXURmLBLIxKjj1NWobUKOeT0zVtQI2IAwDUwQkZXAxUmbm2UjEO4/+tSrECMr69PSrSqMkdeKZt2tkevJoFciKjAyP0qPYAxOOKsueKiyOmc1LGmJsBHTmkZMDnIqQYI68VFLIMHB4pbibMzUMAH0H4/hWJcAk9vStq7O9sDue9Z8sR6/l/n862hEm9jLkiOS2B071n3UeQR19a2plAPAx/Ws+6UYyefb1rddhHN3MKq25sZ9O9U7idUYqOuPwq1rkhhUnnvXLy3RMgBI5461MLX1OXEVuVWNm3JkOMnGep71o2UBJH15FZOmsrkHJx9elb9k6ghifpxXZKqktDgnWsjZ0+2GARtJPtWklvgA4qnYSAxgdu+O9aKyrsHJrBVpMyjiitPCdvC9utZV9bZzggHsK25GBPODn1qtKoJOQOBxTdS+5qsSmjlTHJHLwMgHPBrqfDzk7M81RmtA8nQkVtaLbhSpAGep5rjrrqjooSi5WR2Ok9AT6Vv233RWFpSEKPpW9APlHFedJnqw2J+4Hc0nrijPNH4VBYmDigj86WjFO4xMcc0UE03qaEAueeaAeKUeuaKGAmKToTS5o7+9INQ/GkpevXmkwaCg75pM0pB7UY9aAEPFHSl9KMc5qgE7fnS+lAHFOxzQSMA9qM08r+dJ2oC4nv2pMc07GOKPfvQA3vRjsadxijHtQJBjA4pPal5paBiY/OgjgilxzS4z1oAafpRtyKdjt60oFAXGYNIelPxRQAzHY9aB0NOPWjrQA3HNGD6U7FIRQAdqQ9fel7c0mO/tQAh70decUpH+RS4oGisemOKAOfb0pSKBmsxhyO/FHOM0uOfSgDg0AGDn8aUDt1pQOaOmetUAh7YpfoKUjjPYc0DPegkQAk9P1pcfz9aX1o7UmFxoB6CnADnHvR36f/Xoz1xTKFA7GjuMUnSnH9aoVw/LmgdKKKBXDrS9jQaO1WAfTpSHpTqKEAnalHWk7fjRn3oQC554NFIKOtWhMd7/ANaB96k79KX8KoGGaO9Ifu0p5GcU0ADmjgmk7Uo5FWgE70p6GjHPFJ0z3qgFXijHIo4IxS981SEwPT0+lGKO1JVIQ7OaKTv1pccGrQC9qa7Y6fjQxwOtVriTA64q0S2MuJto61jX11wTmnajdAKRnI6Vz1/d7iRzxx1rppx0ucVWoiW7u+vP61nzXBbv9KqTSuzcAH1pAcj3rSWh5las3oh8jNnGfz70xueTye/NISc856dKQfeI7Vm2cMtSaIfLyPyqeIHjFQxHkc/nVyFCce9YSkQ1cdGmc4qXyiV4wDVmCHcTx39KuLafLwMCsJNs0jBs566hO0VkzxHJPXt0rqtQtm8s/Lg1i3MfUYPNVTnbccqTMyBCMDHA6cVbUcAHp70xUG454qZAPvAEY7it+YwtYbjA5xiqN5LsAI6/lWgEDvtbB59O1T3elq9sGHPPTHSr5W1oVBanNfaGKkknHriql++5SAcGrN1E1tPtcZx0qA2guZBu6DGRXM7rRnbSaaIdPPz7T7VpxPGHAPXvmrFh4eDsGRiR16damvfDkxIKyNtGMZrRUHLVM7I0YtamVeGORiAwyO3rVeNRwAATmr39hTSXWwFvpnrW7YeEwwV235Pua0WE13K9nDsc4X8tfmcLxjrU8TBlxleRnPWuwtvCttv+e2Vvrk1ow+GrZUCi2iHplc4rZYTuUoQRwTvLHGBA0JbHGf8ACm29rLNIzBZSzjLIE4B9q9LtvDluAP3MfB/uitJdHtolIUDjvj+dX9WilexomlseaxaZqbjAtcL0/eH+lTx+HtQVBERFGvfapr0ZEiFuM4BU8kcVWv7yOFkdVDdfu44/A9afJCJpzSbONtPCEu8NJNKD0wnyitmz8J2aYZogx6gscnrWo+povO5SMcAgVFLqqhSVRm9QKl1IpDUJMng0m0h5CKPwAp8scEKkgjB59KyJtRuXP8MY9Ac4qCSSWXIdyQPU1k619i1S7ss3Wow42xAyE8HArPkmuN5IcqCegHSnRojHB61bjhGBxngVzybZuuWOxQYGYgSuWB9af9lCrtQ/KwxWklspHC9KlEIUZI5FJXW4+cxIra4V/lYlB2NTlbhRkLg+wrVMeSMccd6Ro8ZHGfSi4cxlRpM3zOze49Kn+zy5GHOB0q2qgtt6HNSbRtKHt901LbG5ECQNggykfQ063gTeTzn6055GVQWHp2pqsd+4dvalZslyLEUMYz8owKVVAYkgbf5UoJxv9acuAMletVYhybADbJ2IPrTpQaCD1GSM96eSBzjipaC5Bt5DEYqXbtbrkGhsDDdQabIwwOah7FbiScGomPGQfypkrseM/nTVPy85rPqMV8n2qInFPOSTzwKY2c4xTsA0t7moLgkd+tSSHB96gmwcdDgVSiwKhXJ6+3So58AcjOKtBRg5qGdM8V0RRm2ZM/OfTvxVC4KhSMc/WtS6h2rx+OKxbjIzjg56VSQ+hzuvrkHsoz0rj54trgjg5rttXxs555OT3rk77AY8c9znrWUmkeXi9x+nzFSfm/DGa3LW4+70J9q5eFyvOCcdCPar9vMRjk+2f60J3djzps7TT7jgZ7+9bELll965DTLkqcngewrftrgeUATnH6V004Lqc61ZdkkI+8aalwrdTg9zVW5n4HJIqh9qCscEfyzVSirCbs9DcV1buDzjGK2NKcAr0rj4r3j73HYntWrpl8VcBjyDXJUi7HZhq3LLU9K0xlI6g1uw4IGDXG6Ffbwo3GurspQyda8uorPU+kozUo6Fo9c0GncUY5Oak2G0nrTiMigjmpFcaRwaT2p/vSY9qodxKTrmnY9KQ4x9aSHcQUoHNL1FIB82KQXDpRxTsUHqM1QhMetJjilH5UUD2EA6UuOvp3pfTNHfigLiEflS85zS4Hf8qUDBpIVxhBzRjIp+PT1pCKqwDdvNGOtOHSipsFxmKXFBNHOeDTC4YoxzRzzS+1Abh3pKUCl4x6UDshDmjNJS+uaLCsJS/WkJozUgGPz7UH2pCTSN0qhoXvzQOtJn9KBzQULzSN0oyOlISKLisB+9Rg+1G4E0FqBkZHFJ6e9L+NB6+9ZgJx+NHrR3zRnnk/SgTFHY5pfWmjnkUqnNUMU/lS8f3aSgdKAFJ6UetIDnFHGORQTYccZ60ncikHTnmlHsaCgPelB601T0J/Wl6VRIuaWkyKQdBQJju1Opue1HY800AuaT+dGaB1459qAAHtQTzSDp07daB2qixw69KB15o+lAxTRDF5/Cl9s5pMDrwDS8H/69UAlKT3pKDj8apB1Djv1oxQOnpQegFUgF6dKQeoNFHT1qhaiilOc0n4ilPWrTGApaaaM8/hVLUmw70pRgGm980jtgZzV3EyOZ8A1lahcYB5Gat3cu0H2rndSucyFeufStaS5pGFadkVb2RpeFyc9aqGyaTnbn1xzWlZQ+ZgnGD61rwWY2jAr2KdH3bs8WvUc5WRx8tkEz8pFVGjK/LjHTiuyv7T5MMo9q5i+j2MR0JNc1ZWZjLRFHBB5/GkAyfb2qQ8nt1oReSSea422YWJLcE461p2ce7GapW69AM/WtuwRQQSB14rJrmKhT5i9ZQHbyD+VWZjGi9cVC88cMZJIFct4i8RRxKVVuQfWtoUrnfTopbmxfXURUgGseXbK3GOfSuZbXGlYkOffnpVrT9VXzMO2Oferlhramrpxasar2rBd20HNQbWUFcY7VuWk0E8IwQM8gA1XubXL5UGueScTgrYdx1Rm4Zfm9PTtV21nkZfKbv196ngsGkHTnFEdo8cwXaRzVRm0YKEuhBNoC3qFto9s1gyac1lclG+70weor0WxXbHtI6+9c/wCLoNkTTJ2GRxWypqSud1KilqJprKEX1x2q5JcwsvJH5V55D4qFrM0D5yO+anfWxd4ZHPPrx+dXySid0XpY7azMPm7h9ema6GymhIA7j0ry201OaL5kcn1FbNrrzgB+Rz0zQqljVQuelRyxYxxS+fGCc1wP/CRtt6nP5VFLr9wyn5vbrV/WGV7E9DF3Eo4KgYqhqOpKgI3g+uDXEjVLlxxK1MeWZ+WcsSeeetZyqtlRoo27vWZGGxEH1PJrOuLp5Ww5Zu4yagGRGcjOe9S+WCiuD84/SsHJs3UUieBh0I6dO2avKnPTNUbNHJPYg4OK1ExsUenpQkxN2IJsjG1eOlBCkgg/UUOSrnB4p8YJyxGM9yKqwuZgY0UqwOc1ci2bBjn8KrBMnAqVAAu0ZyO9S0TfUsqdq596ieQtMFyAT+tJNIqocE9KqRSK8nmFsEGoY0jRIO7rg4qOVyX56jvTm5Ge+KiZdye9Q99CxOd+e+e9TBlc+/8AKoFGenJ9D3p6HBJPX3pxJYlw2Dt9RSxgBQAM8VDcozEEH8ant1IXac57ZqrdCG9CaLJGxu1DsYxjqKcg5xTpF5BPNU1Ym5HE2/jv9akXJHHbtQigcU5gACT1rNstDJACmDkEe9QtninyPyAOD9KiZjnpismy0Mbg+tM3D3+lSPyDzVeVcDIJzSWoyRm64qJ2POTTQ/HNRu5JOP0rWMLkt2GySE9P0pI1JPPShIwT6EVOqgcmt1GyIciJgB2x7VCQCeetSTkg8UxcADnvxQhblC+GQfbvWLcxAqw4z1revELHnisyaM9CBjBq4qwJ6nLauh2liORk5FcjqERDsMcZ9K9Ev7QupB965TWLEAthe1c1eDtoceJptrQ5fb3AO7ufUVNAwLgdT0OKbNGVZg2T9f8APtTEJyCGxg9feuenPWzPKlG5s2shGBwPwrUtrzamPb1rnY5SnXjnpmrFrO00oij9epFdUKrWnUz5LG5cXe4fL1/WoAzbicYz396u2GkySLyu49wD2p1zY+Sc7R05FdqhJq7IlGxTRyOpA6ZOatwSlWB9OoIqo67W6Yx1p0JKkDJ/nWVSmRHc7Lw7ekOAXOQa9D0a53xrz9a8g0iYpMMHr79P8/1r0jw5cAqvPGOK8jERsfQYGTtY7WM5H1FO98VDasSvWp+lciPWEopce1HHbpVAJigjNKaDQAmKTqKXml5oAQDik43dRTsd6OaAEptOx1oNACduho5HYUuaO2M1IB1opMj1oB5OKpMBTS5pufegGkmFh2cDtR3pM88GjNFwSAj0o/lScUZ4ouMDQetITSZ5o3BDjR2z+lN/nSFueaGFiQUhPao93vQGNFwsP6HrQTjqaj3fnSk+valcLC7qQn8/rSe2c03+GgdkO300sSKQntTQOOKVwQ4seOlG845xn600574ozSHYdnjjP40ZPrTM/rQSeeucVQDi1JuJpvX8KOcc0XAf2z6Ck96OfSjHOTUgL/KgY6UfjSc47ZoAX36HtRnnrR3oXqapALk460E4PvSdsUvelcSAnjJpD06UUcHHtTGKMH6/SjpRnn1FJVAOPFAA78GkJHWgYzigkWlPam5wTS5oQDj94UmeMmkBJoHTn+dFx3HE0A9xTe2ePWlz+VUhCg9aD94U3nHpSjtTKHA88/lRxSZ70gOOtNCsSDkj2o9qaOlKvWndiYoOKDgmkzRz36VYheaQ+9Ht/SjHemgsLnkUmaQ9QaP6VYx2ehxQT/LFIM44oJFUKwueKOOKTOaD9KtaAO5qGZsKakPFU7t8KcnFNsmWiuZupThQQT+Zrm5pt1x6dsVo6tMfmAPr+Nc68v78EevQV6GFjY8rE1bJnX6IikZroY0AjBrnNBmXYORmugSVNvXNevzJRPMp66le/UbD7e9cZrKYlIHPOPrXW6jcDackD2rkdSYyS8HvXnYl6FzWhmgYPAPSncDpT9hJ4pdnzY4rgbMbElt97j8aty34t0+9+RqGCMgZP51heKJWjhbacHBxTpK7R0UY9SDxJ4rWKJlEmOvevOr7W57y6wrPjPGazvEjzy3RXcxGcVY0KzLMMjn3BwK9KMUkder0Og04SeWNxzx1PanXbyp8yA+3PWtGxtwIwduOKkubUNGwCgn2oNOUbofiCWN0jdjgnuK9F0a7juoQzEbu4NeQzWpWXOCee4rofDeryW8iRs3HTNZVKakieXuevaeIwT8tPngTduAqhoFzHdQhg4579av39wkERJYH/PasoU7bkxpJbkM0ywpz19BXP+JLuGW1cbhjHeszxJr+xjGjewxz+NctPdXV1G3zHaR6/wCfeuiMbmuiOa1q1D3bsh4zwQaSyEkeF3Zzxmrs8MquWYd+ar7CH6cf4U3cIJbmlaXOFGWz9O1bVtKjJgdTXNxIxIOMVpWbFXA7d/TFc8lY6YGvGm/ggj0qxDbh+CcDHHNQWzhsHOCRzmrUTbOScAdhWcVdlt22LUEJj65+gq7DGxcHbmpLNFlRT29q0VhCjOMfhVtdSFJkX2eMxAkc1CYWEmFzyK0o0BAyBinugGMDjpWctGaKTKkMQVhnhjxVpBgEH1wMVXd2a4CAYwfWrSdMMcHrU3AR4AygDnPNOSMhcY5qUDBBwCB1pzDIouJkawlgCRyKWJCM1Kp42npSqB+dCYyq8e4MpGc9MVnpZyb+T361uog3EMPcZqMoFZuOKzaGirEHK4JGQPWpiBjFBGBnoetOgO5SzDqOnakrAxrRgD2I9KFAAwce1SMrflTJQuOOCKpaENkBJAPoDmp4PmwtUxNmXBHHSr8KgEFTxTRJMq85x0pzEFeaCeSBxUbHK44HNTKQ0hScDIxTJGJHHSlbaAMY/rUbng81i3c0QxjuX3pg6AUvfjgUxjg9aSVwuIzY5qN2O3nPp1odvyqFz2reFPUhyIJmIfgcY+tAYdOvpxUuzJ6UqRAHFdCSQr3eokb8DOAPpUrGmMmOR+tJjB54FRJ6FJETn5iTQgG0DH6cUODuxSqCOlZuV2Uo6EcsYY/w81SniO7pxWqq7j+PFQzRZ4AqozsS4mJLCCDx04rD1ayDIcjrXWvDx0rO1GEOvSqb5kTKOh5TrFt5bEkHisoEDPOCOMZ/Ou18Q2fDHge3rXE6gTC7DGBz361xVaTveJ51Wh7xHNMobavFbPhFRK3I+8cHoeK4+5nLzELjOfyrrfBknl8suR3HtXVhKVnzSOSouU9T02COOBSAuSOaydfZBIV4z6VNFqKJbDaecViX85mlZmP3j27V66S5TiqyuimxyCDz+NCgAgY/GnvjoACc+tQEgOAO3esJxsjKL1Rp2Mh80EH5c9fSu/8ADU3Cf1NedWj/ADDB59+/+ea7jwzKAEINeHilqe9gWek6e3ygVdWsfTJsquDWoj8VwbHsJkvNB700NS5/KlcsUdKOvcmkPTg0U7gKCD0pOxoPWkH3aLiQ7sPrS03OBQetMaDNNJyaU9aYakEBPNGf84pCeaTt9f0pJlWHZpQab26YoHXpxTGKaX0PNJk0Z+lArC560hNApOnFAbDs0vtTMGnA/nQDQUnenYppxmgLiHpSZp2PT0pMUDG55pM4FO280BPWixNxB1paUL1+tKfpSSKG9R0pOelP/A5NGM0iWMK9aNnGaeB2pQp4qkCdiIp+tJsxU22kK8U2h3ISvHApNtTbeMH+dG3vikMi28Uu32NS7R3pdox0oFchI4yD+tHGetHak7g02MOMnHSkzx0oBJ4pP61NwHZPrzSKeaM9PrSZGTkUgFJ4pCR1znPakJozQA4Gjj1pvSgemabYDiaM4NN9CaUcjGTTQC0o9MU3gd6XOf607gLwfxozikz3o9MZpgL6Glz0xTaB92lcB3bNANJnoaX+KqEwPQin0wdfrS+gpoELn0/KkBwKUdaMVSGHpTgeaSl45oJAdKO4oPSjqaq4C8mg80DocdKAfaqADRj3pOp9/Sg+9WmAvaj+dApRzVIAPWgGjAxzRVJg0MlPasy/cbDnpWjMflJrE1R/kIz0prV2MartE57V5OWHXPWshQWYHH51d1Ftz85zmqcVerS0PCxEuaVjX0u48lQMkj0rajvcqPmwfr1rmUfbyGOO1WY5sr9411XaQRhoaV7cZHLk/Q1lSqXNSF9wJzk9s1IiZ+tcVZtuwTj0IFjyRxx6VIIsc1OVAHaoJJghOMZzms1THGkOkIjQ5/ya5TxM6ujICDWvqF8oT5SM+gNchqt1vfAbrkVrSp2dzojDlRzlzYCW4Lds4xt4rV0u0EargY9M0QJuYttJPT6VdWRY+O3b2rrWxaRYBC4xgcd/rRLIGB9RVKe6VQNvpUP2gM2MmlYdx11tJyMZ7cVRYmORWDAEc5qd33kEA/XFV5opCCFQnPOSKaRNzovD3ihrJcMx47Z4rXu/Ewu0wH689eteZXUV1G/QgemKfp144cKWyc8H1pOKJUjspYBdyhyQT9a0bfT9sW1QSMd6xdMumDjrwM11VnexmLnGfr0pJlox7qx6jHas/wDs7J+6MnqP8/Sut2RynHHTHJpj6eADhRz+NDY7HLLZ7RwOfbv0p32dlY8fhW9LabTgdDUDwbcdxWbszWLZVtF2HP5Gr6fMfm7j1qEQkHdg5qxHGcg98/pUW7FORq6c7Rrz+ta0dwrccnisVGKLxzTopXY5ORihxuiE7G35meBUgJOD1xWdBMAucYFXFkUj8KylFmiZMoBkJx7ZqUDPOBUIIyOalDAcH0qOXQu5KW+Wnxj5cGoAwxzxTmlCjBPak4gmT46jtRu5/rVcTBhxzR5u49jU2aH1LQY8EnmmO3HHX3pFfJpQASCaLBceF6dvan7Bg49aF680qvgGlaw73HBfkwaqzp1xxmrBILc/zqvNkk0risVliAUsw5zU9uewqLtzyKVGw2c+tSnoFi3nrkn6VCWwf1pC245HFMB3Y5qHqNDjxnHamg5Hp6UhbjA/lTOuMdaajcTYpbBqMnIxyaVuCOeabnjPStoRIbI5Tt6c0saEjNOCZ61KFAH41o3oKxE4CjnrUYbBqaVcj371WY5bHbNJspRJAelD4C84FPAwOajlbHY8VlKRqlYhA5yeaftGAc0zoSSeKf2A9ayuNksQHfn2odOvTP0p0XIye/WnYAFNPUCpInHTis69j4zjP1rXfAA5wPWqF4vUe1WmSzjNdhBRj6V5x4nhK5YZHUmvVdVQFWGPy7V5/wCJIkZmBziuujbqcdc4JIme5wVbGcfjXXaITAoyDnHesuC3VZSwAOK0Y2CADqcZznGK1tqeViNjf+3seFJA9PanRTFhuPWsm3cnABPuD6VejOOvYV1wjoeXK7J5pNqls98fequH5HHbvTpX+UsFyBVYtzjJz1+lKpHQqG5p2TkHrwccZ/z7V2Ph2bG088YzmuJsWJcd+ePTFdToTlSo64NeFi42Z7WDPTNJlHlgbs1swycdq5TSJmKDJ5xXQWzHtXnOJ7dOWhqowxmnjHQVBF0qVV6GsmjRMd06UE9qCOKDQMQHnNLntSUqnjFCAX+VGT+VIKB1qhXEPNIetOI460hHpSsMZg0Y/wA+tPC9fWlC+vIosO4wDpil288dafjpSlaYXIwDjApcHtT9tGMHpSSFcjK+tJjAFSlaQjjmiwXGD7tFO2jp+dHXrSsFxtGOaf6elA9zTsA3bmgLin9ulGDTAaF5xRt/lTgDmlIP5U0K43FJin4PpSEEUBcaQMCg4FBB601vSkCFB5NLn3NIMd+KXtQgYuaCDSjpQaYhh4HNJzTz06ZphwM1LKQDrSnpzSD7tLnikBXHT8aQ+tLn0oPpTZY05HIoPOR6Up6mkwOagA6U3tinAetGOetACY7etNzwM07pQelACHrmj0oH1P0o+tACqefwpR1xSZ9aXv8A1oAMc9qMcZ/Wlzz+NA4oAMewoOOlAx0H50p9aoAA7daTp2yaXvmgYx0qgYAcUvXr60ccDHelHShCYUoHIPSkGenSnU0xiD14paQcUvbmquAuKO/rxSHtS96dwD15pM8cUdqD0681SAB2oBGfrSkDNA9e1UShM8UHpwKCPz7U72pplCDOetL3AoxyTS+9WmAmcA0DJ9aU8j6UEe3WqRKK9yDjPT+tYGrE7W7V0F1901zurHg4NEfiuYVtjmLxvmz71BF1/GprvmQiowCP/wBdetRPClG8x5bHYe9OVskYqLPXj/61PhOXGTzXYldHQlaxowLkDI7Yq0q4X+XrUNtg478VdCAqR7cVxzQONzNvZSiHceB2rnb+/bzCN2OeldHqsQ2HJ6VxGqKwlJ7E9z/StIo2tYg1G9ZlcA559KxmnLSncRz0zV14jIny/hUCWrmUcNg9R1rZaE2LVuoK8/hUV2So69+3FX4owBg4x3qOa0MjbVB549e1UNvQ5u4uX37VHXirmkWs9y43g4zxurbsvD5aUNtyTyTnpXV6RosUGG24x2AqXNRRlKSW7MrTNBLYLL09s1rxeH48DKCugtoURQMYGMVMZEFcs8Q+hhLEW2OM1bw7EY2+UDjPWuE1jR/skxdIgBnoB0r2O5ZWUg+lcp4gslkRmIB4yfes/byuc7xDucLpd6sTKjnHauhsrtJFGCe9cvqdm0MpK53ZqpDfzRd8Ct4zUjqp11I9HtL7YQwJC1tWt7FKOO4ryyPU5HUAH5vrW/oWoEnBOD9en+cVpbQ6YzR20io5461E9uGPAqlHdnaDknNWop+RnnNZtGyY0w7W5/H/AAoVChBwPyq2CHHJpGQ8YprQTEiXcAOopWVB25qeOPA6VHcRexzQSOVTszQssittB4qOGbaNuf16VLGNz5OKViixBO2fmNWVlLHqecVAiqeh6UMwTp/Ok0hps0UwRnNNlIZdvrVA3WAQpyQPSljmdjhhx9ahotFtVxUgGG5qLd8lETHf1qWrjLStjrUm/IG2oQC3WpFGwc+3epaAmD8Y5z34pATj3pgYbjkH/Gl5OcVDRSH7sjA61FIzdKezADnmmOePpUbD6ldz1P600MTweop8gx36CoiQGGetCWgEsTH9KcuSKh81B3HPvTxID06fzoaGrjm44FM3E8d6RmJxyKBxT0BoRg2fanqvIPSlGACetIvLYo5rEND8Yzgf1of7tHsaY+CvGRUuRSQxmBqPIGCep9qjmYLknrzUBfJrNyNEi08g29RUG5t2OfqKYXO3FNYcjOD1qLjRNknJB9c09Fz0H1x1qCNiSM+vGTU8ZXHPr6UAyZeO1BODULSYUjPtULzAHIJP1/lTTuJk0j8f4VRun4OCBTppx6isXVNQjiU5YA9q1imzNuxR1udVB/n6VwOuTlnIDA8961fEGsR7CBJ+HrXF3l+sz8MO4GK7qcXGNzlqSux+8K5yACe2fxp3ncAD+dUzKD8/8PTJ/WmwfPIuckHoO1axd2eXiNmb1kXIBUAnuexrRXeATgkY/iGKZosIAXKjgcjua1riNNjBcccdq7EtDznHqZLFgeR0qvI5Pr7D0q3d43HqPUiqUp79O+KVTYUNy9YsCegPP611eit0bgA964+yPIIJHpnrXU6O6gD5vpXh4tanr4aVjvNIYbV/x610tk+QSeTXG6VMAQM/lXS2E4OOT1rl9i2evBnRW/KggVZAI5FUrSVSOTV+MiuSUGjpTEx3o28elSUVlYaZFtNAXPbmpcc/hRj2HpTsFyLaacF59qcBj60YJp2C40AZ/Cgr0zTguBSkcCgLjMUYp+2k/pSC42in8dMc0hI56UWC405780vP/wBagYxTj1ppA2Jg/SmlSR1p/HcUmfyoJGbTRtPanmgEcmixVxoU8UoXgU4ZoIoBsQDFHHWjOKaTRcEO4pTjB+tMBycUvWgGKaQnmgn0pOo9xQAhppp5HFMxkDFJghtOBoA5o7ZpWKHZoPrRtPGeaCDnvVdBMYSMU0nmnEUhXkUmNDMmjJ9qft96CKkdyA4weD6UE4GfWk478e9L+FK5Qd+gpPwFC/1pCRjHQikAds+lJ3560vb0NNz15zQMU9KD0opD7UCF/X6Ug6d6MnJx3pMdv0oHuOz0FGcikUc/54pQKBCnAFAPekx2zS459aB7BnPSg56dKOMGl60CA9RS8+lAxmnDJ/8ArVQDcHIpwGTQcelOqhMaB+dKB0HoMUH8uaUdqSEAA7j8qXFHSgdKpFBjtS4ox6Uo61SJExxmkI9RTiOOtB7UwGgd/SjHHPanAeuaQY9/xqkwEI57Uq9KO9L2qigxS4FIOmKUHmrjuSJ256UHrQfYZoyc1SAgueVOelc9qo4I9q6G4GQRWLqiZU0k7SMqqujk7pf3lRgdsAYHrVu+Tax96oGRcn9a9ajseQ4WmEnHQ/gDSROAwPHvntUckoI/zmovMBI+Y/nk12xdlYtI2rKXnOeO9bMDKY+cZrl7SYBsZ/8A1VrxXOFHT86wmkXZD9WxsPbtXDamMyNnnk4x+tdfqFwrR4PP05rmruPfIcdD6UIpIpW1txkqPanvbrkAj8KuRIQAQAB14p/llnxxj3GK1TJasVoLYlsZ/Kta1sFzlhz6GktYcckdPwq+j4GAe3WsqlSxzVqyitCSCBIwABVpZETnI61nS3QHRh7VVa6O4885PvWGstzzZVnJ6m+ZQRwcVBJMPb2rIS/xg5IpHu94+91o5FYTmrGhJOCMk8fzqneqHTPrVdrjnhqa04KjBOfTNLlMbmBq9irl2x25rlbzTypYlcHn8K764VWycDGKybm1DZJABHfrUXaZUJcrOPSBh9evStTSN6TALyCPzq9NYZIC4FXtJ0xgQcHPrXXSleJ6lCXMtC/Z5ZFH3q07dWOCB+npUS2roBxnn1rQsozsAwB061bOxJkkKlByPzq3AoZeg9zUbLx0wKLd8HaaljLscYwPpTZodwI2ip4AWGexpzEBiec/zrNmkTCuIXRyccZ9KWOYjgZrWlSORcdfc1VFkAxIxilzGnKmNgdiTjpinSK5yO1TRJs6d6mRVbGR1xRzC5bFSCEhuegq7GmFHy/rT0iwQfWnrjGO9LmAj2HtQi5IHSpNy9MdKfjB4HajmE0xwb5SMZOacDx3600LnvilIIJP0NQ2NIXndzkU5GxnHFNByee/6UrA9Qe1ZtlJAWOcenaopJAo4/8A10184/Wq0z4yM8VNyrFa4u5N5Uk4/lVd7sk8ZzTbsZ5AwfWoYkUn5hk+5ouVYvQsS+e2eeKuxnC45qnbEcHAx/KrauMY7+1DCxMue9LgHnNMDijfgcfrUNjsSjjpzzxTQQDx0pjScN83aozKuT7VNxcpZZ/U+9RSyBV+lQNKSOKru+RgnP1qW+w7CytvbOfpUTOAT1xRuHSmtySe9TsMkRgetDEkVFGTx/U1Ig4HHFKwD4u+OvfNK0mB264ppbA4P6VXuJNqk07dib6jp7gDnPHbn9Kz7i9Vd2Tjn8qq31xjOCBXN6vqLIjMHII9Oc1vTgKUrG1qWtJEhO8jjrnrXA+KPFKoWQS8HHfrWR4k12XY2HwOhrzbV9SmmlbJ4rupUUtWck6l9EbmseIJJ5CqucZ57VXtb5nIyTXNQmSWQ85IPFbmnW/Cj061vYxkdBDPlAcDeAPxq5YSLuzjqQKy4QcAdj6+lX7Q4GCOuOTWdPc4ax2WmXCoAQecVZuLndvCNlfbjNZekwedGH6jtmtJ7RSpAZlb1NegloedK9ipM5K9/wAaruCXXJPPtUxUBSCFyO9RSkhwQAD3OcVlUCJPZkq2CTkH610mlvjaynP41zNqeSOOvbmug09toHTArx8Uup30GzqbO4IAyTwOvp2rdsr7BHOPWuNMpRd2SKdBqLI4O7HPX+VaUIKUT1FNo9RsL0Ecmtq2uMnOa830vUSwHzdfeujsL8kDk1FXCJ6o6adU7COUEcVMrKRWHbXYIB3c4q9Bcq3evNq4dxOhSTVzQ4zkfjRnIyBUCyjOc0/zAR71ztWG0Sdhj1o4/WkDDHb60d+eeaVxNC59OPWkz60YzwKP5UMLiHrSE5BFKR/+qmnpUsaBiTx6UhJzRjvSgc0xgOlOHNJ0FLxQhXD6GmnpS5xzmk3DpQFhe9B5PWm7ietKGxRcLMdz6/rSGkz3xSEnr1pBZgaTikzSGlcsf3HrSjgVGvWlzTTFYkGMUZHGODTaU+xFNaiYhNB7cUY/yKMcZoATBzR04o+lH86B3Anv6UZz1pOKM+lAXA0elBpMjFK5VwxSEe1APvSE0riS1K/8qQ88YpR6Uc8VBYn86TFO70Hpn3oAbz0oxz7U4jJo75IzQAzt7Uo96XB6daOvTqaAE4JNA6fSl/CjgigdwHfHWjgg96AO470uO9FwDtzR37UH8Pzowc9qBAtLjHpSL047Uvt3oAX3pfX0pBzz3pR05600AoHr19aUc0nPWlpisHvR9KO1A9zVDFHSgHjpigdeaUdOlMAFLQOtHeqJCjvQPu0i9aLi6in7v4UDp0oBoPWqQC96QY+goPWirKQuOlHGKRcnn1pccUxBxjikpaKpMERyjI5rL1BMoxI/GtdhkVUuotwPp2NDQpK6OK1VOD/Suau5tkmOg/Wu51W0JDfliuN1myky20MBXdhq1nZnFVo63RlyXq5xu5PSiK4GeSMZ/r61kXgmibG1unBpYJWyMZHr6CvUWxy2Z0KSkMDn0yc1bjvSsYGfpWJbuSBzxn86sAOQD/Ks5MuMWzQmut4+vpUIAJz3/Kqw3dTU8TZAHQdqhSNuQuQR5APuOnSrKQdOOf0qC2HIIx7e1W5WCoc9KqU7I56rsmxkhCZxwBVOa52jhsEUy9ugCQSfTmsme6O7vjPJ9K5Iz5meHWk5PQvyXBBJBNVpbjk4P+f84rNkuuhzg46ioXujyDzXVFWOdI0WuWxx+opEuzu6jnp2/wD11jPcZORwfpTPtgUk5HX86UrDs7HRrcZzzipBL8uBj+Vc9DegHk/4VL9vAHDfrWLkVGLN3zec8nA61FIyFSD0J6+lZQvl6k54pyXBmk2p82cCs9ZPQ0jTvoalpD58uMAnPrzXT2NgiRKStU/DlgxxIVxjGP8AGumCLGgGeK6YR5UexhqXJEy2gG72+lTQQhcD8MVYYDO4CljUAcjiq5jrsMMAYAUosjjOP1q1Dgtg4q9HGGXmi5NjPjj2DHOPpTZkyCR2GK0HiA7AYqB0ySBUsqJhea6zbCDxjrVyNtwHrT7i2BbdgCoGJQ8Y9MVhc3RK+AeMnNMRucjpTJGOOck96WE5UZpXGW0kyMEU8LuHt6VAGxjmnLOATnFFwaJPLOeMk1Yj4IBqBJQ34cc9qfvweMdqbAs4H4D0prLn3qISnGATijzADmpZJKox160FgBkGoJJgenX61BLONvWoZViaQr0qlct1HSopbnHGTVV5yamUjRRCUrzgjFIh2npn0qFyT1anxng5qVK47FlHA9f8akE2O9Vt3603fk4PBoTbJLZuPfH0NKJX7Z59BVTjOecUu/HQd+tNAW/M4PvxTHb3quZsnOeKjebP61MkBZLg+2e1QySg9eBUDyfWomc4IBPFSkwLBn5AA5705JNwB696pDLNk9qtwdie/arsS2WIxxzUhyoPP61CJMCmPMMEZGf50RiyWyR5Ao7j8Kzry4wCM80TzZyemDWXezYGd31+lawhqS2VNRuBtPzfTiuL8QXJIbB6DnB4xW7qt0ASOrd64XxBeKAw/PNd1KCWpy1Jt6HLeIbnOTnPqK5SZg0mAPrWnrd1udiDjHSsVHzLx+HFbERNPTkBbvy3eukso12g9cfpXN6cQuOePY10VnIOFAPT1qhTZfCkNjGfbPQdau6TEJZFU4PTj1qrGc8hcjrWjox2XCtg8HJ5rCm7zOGsz0Xw/aeZACIkOBzxTtbhZFLKoCkc4xxU+hTQraqUlAGM8moNcmWQHDll5zkdeK9OKujknZROXlcBiRjk8dhVZn7ckg9etEpzI3UevH4VC24kHBX6VzVTGJctWy2M456VvacSUBxgY7dK5+13B+R+ldDpvIPBPHpzXk4l2TO7Cx1LU7gR5yc9ef6VkSXRWUDHfvWnqGRGSQcgHtxn3rk7y5xcbTwc/rWmCloerKJ3GjXZwPmGK6vT7t88nPNed6HcdPXHaux0+YbeoHHH9K77FwV2ddbXfHBAFaFve4AxXMwy4U46VYW4IA571hOkmdEYST0Osivct94VetrgMOTXGQXZDgZx+NbNhdMwAz+teZiaCWx0xT6nURvnFShsmqFoxIFXF615T0YNEmaKQfdpfT60XJsJ60hPFOOMcU04pDSGnPGTQBzxzS96Ud89KEUHbigkijPy01mpk2A/1puR6UE4pMnH0qblDu/QUo6Y700HODRmhMNRw4HPSg/r60xjxS5ouKwfrQeOabSkUhiE80A+tGDTcGi49CTNLnpUfNKOc0JiH5NITSZ70hNO4rC7ueKCQfU+1MzmlAzzRzBYcSD6U3P+RS9qQii4xM0mRnmgg5pCOagfUB/kU4+xpAMUuKCiDHX3oz0/SjtS8cZAoAOOx4oPSjHv3oGMdc0AIfpxQffmlPBFHqPegBvbrijvil/Ck6n1oDyF9aKQ/oKU9vekOwDI6UepH8qBxS560BYQ9aCO9BPPelwPfNNC6BwOe9A244o49aX07UAKPxooUd+9AHagBc8Ae1GfxoweMijqcVSYB+dLjpSD1oA9fwqhMd3oHSgfhRgGmhijrnNAyfalox3oEwpPxp3GPekJ71QhBSntQBgUAUxB+NA+7S4yaB6VaGIOtL3oFKF9aoVxM8UuKUD1FAH4VQmJj60yRC1Sgc8elLtyKdrhcyry1356Vz2p6WHJ+X612bxgiqlxa7s8U1dO6BpM8u1PQ9zFgo/75rEl0ZlYbRg/SvWbrTt/OKzLjSRn7tdtLEtKzOedFN6nAW9hIjZx2zkCrqwYXkZxXUy6WFJypHpiqd1Z4B+X2yOK19tzBGnymEYxnJ69DUeMNir88OGxiqrRnPANaQtcTLNtwM+ntTro/IQfT0plucdxjGOlJdEFOMHHX0pVr8rOKt8LMG+Y7yMkjNZUpYn09a1L0He39RWbKvJ78/nXJRbvZnjSjqVZWY9O/Y9qqOxxjJwPc1ekXPfrz0qEqM9B6+uK70mYuVirtk69B9MVFJI6jB6e3etdY42Azjiq81urAKmOf196mVO60BSTRmef1GTuHrQ8zkDBznvU1xaEEsO3Ws+4LxqTg4zx3xXLODSOqCiyb7UVcDP0JOK6bwqnmzKW9cH2rg1ugbnaxAH5V3PhG4UMuGIIrow0LK7OylTSZ6vpKItuuPTPPrU83J4zj6VlaXckxJ0JxzWqjq3Pbr9a2Z2LYjKHbk5z64pVUn8euBVgYxjtSBQOeeAazkaxYyBCXB5AxWinyrjvVVCFJNSrINpAPXikpA0SMwIHHTioXPNDuKjZs8npUuQ0hJAPf24qvLCD6VKD13Uxjn/61YtmlynKNox3pi/d7/lVmSIOBxkio/Kxx1NAJkJYA+tO27ven+UQ3OKHwKdrDuMyV75+tKJXBwcn601m9OPSmnHah+Q0rsmW4xn/AAoacc1WGOe49qRm46+4NRctK5LJMff24qB3Lc9eOtNZsN96oWkBB55qWykK5GCKjds5568/hTZG4596Q53dT17+uKjcd0KT6elODdunv1qI46mhpAOAOp71SiJsmYjGBx3FIDhTjpiq/nZJBAoMx28cVaiRcsl+nJPtTSfwI71V8w/d7+nSk80DjP5U3GwXJywyB2phYseRULTDHJH5VFJMAByD261m4piLIf5vWlbheapi4G44PXpUc12o43Yq1Bk8xf3qD0GT7U5Z8DIrJN1zjcPoOh5qOS7GB8xPODxVqmS5Gy10AODnHJJqtLeYyMkcjtWLJfAfifWqVzfqM5Iz047VSpk8xtTXo2feHP8AOsXUb8AE5zjjrWbc6koVgGz7Vz+ramxzg5J9+lb06epnOZLrOpEbhvWuF13UPNVsH6/nVjVtRzn5wO3WuT1O83knJJ9RXSlY59ynfXG6XPGM9qr2zEvgk4NRTPuYdKltV+cbsfnSbH0NezHQ8gkVtWOSw5ABPSsmwQFVxxnjNb1lF0BA69+KroZzL6MQpBIHfpWjpjEt8oIzjHtWbEv7zsDnpXRaNAjYyCDyPxrKlH3jiqbs3dOvvJttpy+O3f8AOnX14ZwQFwOvToaie3UR/KSDjt3qlI7bwOePfrXc3pocjT6h5SlepPODzTWQbc9PqOtTBlC5OR3NRu/zZ7VhNoElcfbKA+SAMdCa6PSR8gI79cCuctssQOe/411GkqRGCc9PWvIxb1selhYpMXUVIhPPQda4fUA32w9+ewrvNVwIT2PauKmj82/IUZPQVpgb6nozXumnowdQCQQAPpXXWDlME9enpmqWg6WBErsvPeujj08JHkDBxXpoUHZ3HW8xwOc1MZ8jHoaomMq2Md/8mrdvA0hUfjXNVq8p6dK0oksUuZBjpW/pJZu5qhaaccjgHHXNdDp1ptAG38K8nE4lPQ05bGtZE4FaMZPpVS1i2gAirsajp3rzG7vQzY4HignpRgdqWmQN60nNP6d/wpCakdxoB9KXHPNGR1pQRmqGN7UmMjtTsim5xSuAhBxQBxSkikzzRoAAYoP1oJphbnrSGhxxjnik/Wk/GikwsOXpTu9RhqN1FwHnrSHnvim5oJFIVhccD6UU3qaM5NUgHZ+XrTSaQtxmmlqkaHZ6mnKeCKi6nqaUZoAmByBjvSUwZ9KdzVIQ496acA0E0xs0MYpYAdaaWppzSYJHTNSNCDgc0Z9cUnJ570o6YoGL36UDtxQBQBgGgA9KSnAUAAE0CuNPajmnYpCMcUWGJ1pOcDPPNOxS7eegpA2NI5zRyDS4P9aXHNOwIafSlxz9KMcdM0oBosAfnSj+tAAOKcBTSATHAzS96XHajFOwCY9qPwpwpOtOwriDp3oGc5707GaMVSQmJTh06UAHNKBgVQmwxigU7HAooAb2pfoKcRS8DtTSAYOaMHrmnYHOaSqW4CAc0oHelNKPu1QDccZpwHel9qXH/wCqmSNx6Zo/CnAHP9KM9sVYriYOcYJpR0zmlxmlAwOtAXEoK7vx6U4f55pRjIFabiuV3iUqcg1BJbA5+Wr9IQPShILmPPa99tZV/acHjjtXTyICOlZd8nyk+9Wm0wOLv4dhPHFZZUBjgc10OqoMkAVz9wArMD+ld1J3Mp6DIepxmnzxnb1PrmkjJ3AZP1qyyhl6dvrWk1eNjkqK5zuoR4+bJGe2Oay5R1wRjtxXQanFkfdGc/nWLIPmZT1I715zXKzyakeWRQYEH0+pqF1PLEZ7elXZVA7/AE9arSfKCO/TOK9Ki7o46kSs0jIwByBn8qkR2JG7njvQyBuADgGlUYyTnHtzXTymCY9lU4BwD6DjNZ99Z+ZF0IB59sVc3AE4PX86miCuDnHPp0rGrBGsKjRweo2MsUu8DgdvStzw1feQwWTjBx14Fbl5YRzDkc+w68Vzl/YvasSM4z/KlTl0PWpVFLc9P0XVFdFJfcD78+1dNaXgcZzx1HNeHaXrz2uI5MgdCa7TRvEsUmAXUNj1pyidcZHpcc2cHIFSiUYHP0rk7PWY3ABb9a0Y9RRgPm4x361i49zRM3BMM5zSCUgHnP49qy0ulJ69aX7WAD7e/FQ0aKRpiXnrSls/59qzUuhjr681Zjm3DjP+f/11LiVcn3ZH1pBnjH401TxnscUZIP8AnpScRtj857Z+tHQDigEfU00txjjHrSsFxJCPXtVOeUL+NWJCNtULlSxz09DQUh6SBlzx+dK2O5qJFI79RSsSByPpk9aRSGuxLdaYGycZ96bISfY1GWGcYOM8VLRcdiR2B5qMg56njtQTk4z+PP8AntSFgB1A/GjlFezEfHftUbtzjNNmmUZBPPf2qtLcAAkHHrinygrsnMoyST19qgmnUdxjPrVG4uwCf9nrzWbcXmP4gR7nGadgehrtcjOc5yOtILkZwCcVhG7JOcmmC7bpk89ya0UW0ZuSR0DXIAxk+3pUMl2fX/GsY3TFcc47ZqJrn5jyRn07VfJchzNZ7zOQ3eoTeHkk559azBPwdvX07VHNMoUc9O1DpC9oaDXnXnn34qB7slsknrzWXJc8kbiAO/FQyXY7H9a0UNCHO7NhrwqwG4g4z1qtPfHJy3FZD3gHfp09qpXV9wSTjk981XIJzsas9/tGDjHqD0rPutRzkBsYBxWPdXpB4bpzzyKzLq+56nIBIyelWoaGTqNmvfaiMEgnryM9q57UdQ5O5+cVSvdQOxsMT75rBvLxiCA2Pp/jVpIhu7JtRvSSxLdffpWNLKxZjk0lxKXZj69arhsj1FJlIdvOcgn6elWLUguAeOOKqdDxn0qzaglhipLex0elMCoOT69a6SBdo+7z168Gub0gEKADnByeK6CJwqKCeneqkc03qW0bbg4GfbvW3plxsTPyjHaufhfBPAPOelX4I2IyTjPNOn3OObOgl1NWUoD24HrVZrjdJkZwRxzWZsbkMr+/ap7dXI+bPTvW7bsct+5ejlJAIAH+NKWO4EdO5xUIBClT/KnoTgDP1BH8qwmyo2bL1guWyOc9ya6/S1Ag4I7cVyWnY873z26V1li2yL1HuetePX1lc9PCrcj1twIM9sc5rmdLRX1RSRk54FaniO72xldwGRyKxdDkzdBt5zu69a7MJGyuek48yPU9DgTC546cCugMKhD1xiud0K4TylJ7cdf51uvdJsx0+lenBJ6EpdDOuIVM7DPc9q1tNtugxgdKzPNBlOT39a1tNuFBHOfxrz8XTutDpoStub9nbDA6fWtKCEDqO1Z9lcoccitaCRWHFfM1VJOx2yJVGMYFP3eopp7etFQjJ6jg3FGabSGnckfmmk8dRQBSkH60wAcijvmgCl2kd6oBrGmlqeVppWoBPuNBpQaUpzShfSkDGnNNIPNS7R60oUZIqrBexFj260FSDU4UUhUUNBzEBBz0pvNTMBUZ6e9KxVxADmnBCacuM09cAUiWyPaaNlTcZpcj1FXYVyuY/amlPbj1qwxHNNyMUNDu2RBMD+tLsx05pzMPrTS+BUDHKvFOVc1EJBmnLJ15q1YTJCnFNKAUhlFN80U3YSuK0Y70bQOtNMlML8+tSXG4zFL6e1OxxzSgGhILjcc0f5xTwtGOOOooEN60EGnAYHAoxii1xsbjj3ox60/Ax7UEc+1FrCGAYBoxxzUm3ikx3/OiwDcUhFS4FJj9KLBcZt4pcU8j1xRjkUbhcZtFLjpTzn2oxTQrjcUoHrSgUo5pgJjGKMDr6UY4zijHrTsCD0oxS0fXimhMQdaXrS9KOOtMYnPSnAc/SkyMZ60ZxmgBcZoIpM9qXODxTTEw60oHFNz9KUZ/pTTCwuPWjGPwpKXJ61SEL2oJpo9aUHvVXCwv09KOvFNzjigH3FCYDh1wKXNMyM+lLnHGatMVh/GaXqeKZnuRSg+mKpMVhxNISMUmeKazADr9apbBYbK1Zd+/yEZq3cSYGAaxtRnABHatYx5mJuxjas2QxzmubuyQxPStfUbjknNYNzKCSO3867qdNo551E2PRscZ46VowkMox171jLJkg88citGylzxnpzWriZML+Hchx0J6Gueuo9jnPArqp1Doc85zWBqcYJ7Y9xXHWj1ODEx6mJNkPxxgfWqr8tj/AOtVq7HBBHI6Z7VRc4BGPyNVQnY4pxugz3ANNkc9sD0pqkYHBwKa5zxnn+ld0Z6HntNaEcrnk46H9akiuCpxwTULKFXcc4pm7A7E+/eokD8jXhuMqBg/4Uy8gjmjIPQ+hwKoJKVI5+b6VbgmzgEAe/r/AJ5rNrU6aNVpnKa5prIcxdc1zyX9xZvjdgDpz0r0bUoBNCeOcda4bXbDErMRg54OBWkJ30PXpTUkaujeIpsr+9bnpz/n3rrrHXndQxPfnnrXk1k5jkIbIFdTplx8oGela6M12dj0qz1VpFHJz0GfWrqXbtggj+ma4zT7nacg7l7V0mmSb1Hp2zUOKQ4s37eVgfmPXNaNvMe54rIt8EAAZHWr8RJOCe3r2rNxNEzWSUbR/KpPMUj1FZqMcbRxj8qf5mM5P1qHE0TL/mDuaXzOBVATdxwetOWX5ckjFQ4lXLL8j+n9KgbA465pjzYPJI/pUEs2MnoKlotMncrj0qEsC2CevvVaafB61SmuR+OKXLcvmLzSr1HTFRNMueCazZrkkk5x/LrUDTvu6nimoE85q+eAfxqvPebTwW575rPluSASWB/Gs+6uGwfmAA4xT5dB3RduL7Byx4J461Qn1Dbn5v8A69Zl3ckj7xyO341TmnPJ6/5601ATnY0ZrvOMHP8AEKqvcd85NZc1yAuOn8s1WN8VHOR71rGmZSqmz9oUHhuPSozcgDBIzWM9+vQMDVeW+AU8jFaKnYzlO+pum8JHD4we5qI3vvxjiufa9BJJIxnjPWoJr7B4c+3PWrUTNyZ0v9oYwAc/WoJ77AzkMRzXMtqHBBI4PHbNV5dTGevXtTSIbOhk1DqCQRn16VWn1Ad24HpXNS6iQpwQcHtVKfUT2Y8807C5jqJdR5xnA+lZ0+o/M3OM/jiufl1FhnIPoDmqkt4WDfNg4p2Bts2bnUMAAt78Gsy6v+cbsgVmyXDFcF8k1TllyTihgizdXRcnHXriqE0pYDJHocVG7t71Gc/QUmUhxbnikB44IpArEjgkflT1XPGMiodxpioOewPrV2xjJcY5+lV4YmZgAK3NNs/mycFevWlbqNySRo6bGI41JOR3rQZ2GFz9Bio4kEcfTGO1I7HJyDnt70N3ZyzZpWL5P17AVv2CqVGSMfToa5SF2VvmLde1alpe7VwWOQB27/0rWDSOSd2jpjDGygFcEnqaaqKCy5yPTFUIdRDLk59Bz1NTRXII6gjuBx+lXKSOe2hYl+7xnoMZ4pq4JGMEj6c1GSDlqljCs64IOBnkVx1paGtOPU09MQmTH8h0rpAxSAZPXjjoKw9LT5SSMj0q/e3Gy35Pb0615Mp6nsYWGhzPiq9xIRuyOucVB4em/eAkjjPGKwvEt80l0QpBBJJP41b8PyncvG4nr7V2U6uqR6tOnZHq+iytsXBH07ZrdRmYD5vxxXMaA5IUFa6m2GQMZ4969RSujKcLPQjkLLzn6U0Xrx/xGrM6ZBz/ADrMuEbB4Oe9ZVJKxUI6nR6PqZc4LGu00ufeuc9a8z0ZJBOB8wr0DRQQoBFfPY1Rvoda0idInIpxA61DExx6c08tXAmZvcXAwc+tIQAetGecUtBIfWj+dITzSU7gh4NLnmo6Og700Fh5PWmk80hPHNISfSncSQpbnp+tG7ApmfalINK5VhS/OKN/5UxgfwpMHNK4WJTJ8vFI0hzTCpxT1TtT3CyQwsaTOal8vHamlPSlYLjAeeadu4o2896DGRn1pagG88Uu6jbxSqmOTT1DQTcSKTnjmpVXjp3o2d/yp2FfUgbpjNRlT071ZYAUm0UWHcrYOadg1Y2jIzzSbRRYV7lbBPPFAU981YIAPFJxU2GQ4yDxShKkyMnmnjAFOxVxgFA5p4H0o21pYzuIKMcY607bS44oSC4zGPWgjrTiKKQJjQOP6UhHPWn9RRgUmMQDJox+lL7CiiwMQDNGO1Ln86QZBJpAKOBRjB6UnPpRn3poGGBS0maCfSmiRR0/Gj6UUCmUL2xSZooouSA/pRRn/Gii+o7BRQTRQhgetFFFUAUehptOoCwoNLTaCeKEwF3Zoz700daQ56cVSYWH5wKTNN7YNGefwqkFhc8cUAnFN+lHFNCsOzijOevNNJ5zSg+3arQx4P1pwyD60zOaMnd1qkSO7H681FI3FKx45NVppPetIpsluyK93JgE9KwNTmwCfQdK07ybBPWue1GXIbnrXfSp2SZy1JtmJqMxBI6Vjs+5jyTWhf5di2c+lZdxxnIJGa9GFPQwsSo+Acn6+lW7WXDex5rKVyBngkeo61agkGeuSRUzhYa7G8jkpg/nms/UIwVPGe+Ks2koZSCRS3UYKAcZHGK46sLozqwurHKXa7ThQOe1Zkmd2TzgfnW9qMeCRjqO9Y064JH1rkhLldjzJprQpk88f4UwthR1xUj5wRzj6+lQtnJyf0xXVTmzkqQ6gXywz39Kjbn7uTj6UbSMnc34jvSMeRxnmtmYMUdBtH+f6U9CUzlufX0oVsEAnGMdBmpFGQF/I1DBE6ndjcSRyOlZer2XmpgKcgdB2rXiXCjIAwc/40syB0HHSudycZaHdQqctjze/tWifOCNvcd6WwuNrAdABgY/Cui1yxUKzbQOcjjrXLSL5cnTr0A9K74Surnq3ujqLC853A59a6nSbwKv31AB6Zrzi0uTlcgDvxXSaTdAFcnaB7da03QloemWU4YL69etaUMme9chpl6pCnnHHfpW9bXKt6/nWTRonc2lbK4FBYHgHjqKpLOCMKeOKeZc9QTz2rOxaZaLZHXimPLxwTVd5e+RUUk/1HpUuNy1IsyTcnDD8TVZ5jnGefQ1Vmny3DcA+tQtMM9gcdcUuQrnRPLNwcZqpPJkkbuDximSXA9eelVZZ1XPPHeqUCXMmZxzkjPpVZ5gG4OT+VUri8wxGetZ91dkdz/hVKBPPoas92u3OfqKyrq8HJ5yev0rOub3qN2OnOORWTfX/Jxk85wDiq5Bc7NG8vRuyTyeOKoyX3zEZ5B+lYdxfbj16jkmqUt8ScKaajYHJm3c3hIwH981TkuyXIJ79fSsV7ssMYIHvTJLoE5DDPWmZtmu13155zziq8t0QDhjz3rKlulB5OMDsapTXg2nJyT056VRLehsTXpGRu6VUlvWLZBI+lZM13ls5wT+tV5ro4IJ69eaoDVe9JyoOaryXoxw3H9ayXusDAzioXuGOctRoBpPebtxP4Y6Gq013lcg4Hes55MnqenrUZc+mPalcTRfa5OepI7c0hmJIOTz1qkGxz61LGO+eOaYIsE54OAKiZexx7VMnI5zz7VKkW7HP40DKLREn+dKIO3tWrHbD0x70vk5BA5wcZFFl1AyxCTnIOas21oxPc9M4FXY7cbxj09K0LK2wpwowDxmk0FxLDT0KZI5Gce9a9vAqbe3So43SNQpGSCecYpZbnnkgrUvayMZyHuVBKqxHGOKjCcjrgnkmmCTP0q3AFY+/wDKiMTFyHW9sSMKM9hUr27ICy+vXPerdsUL459zVsxKyZ2jpkcVfLoYtmVF5g4DEEVoQTMFznp3xxSm2JPbGeuP0qWG329Btzxj1rKTsRFj45s9Tj1x6VoWhLuMg5Jzg1SSEg/LgjjArY0y1JC7sc8+lcNebsdNOPM7GlaPsQnkdh61n67dnySFbOa0J08uIjp3Oc9a5XVZQQ2DkE8fWvLvqe3Rhoczebpbtjxn3rovDltI0gwDj1wKo6daiWYZB5616H4S0jJUleOMY7ULEWZ6MEbfh6yfyl6genvXVWtnLgdv6Vf0HSVVFIXHA7V0sGmptGRn6810xzFpWY5QTd0cqLGVhjJ/L9ali0YvjIzzzXYR2CDPy/XirCWaLgjGKyqZg5bE8qRzmn6OEcHaRXQ2NrtHA7VZjhUHpU6gAYxxXnzqOerHKQqJgYpwXnFLnAAo3/NxSRkw2n1p22mb+advHrVCF2DPPpQUoD4PWkMgxnNNJC1EK89qTAzSNJTGkHPPSpe40rkhAx1pCBURlHc0GXmlcZMoGf6U7HyioVkHr3p3mYAp3uDuPIHrTSPWk3/SmsxI4pAh2QDT0cCqzMcfWkDHP1p3BotlxjtmmFqgBY0hJPU03IOUn3DPNBcYqA7h0phJHPp7VKdgsWS4A60eYPpVN2bHWm+Y3FHMNQL3mjHFI03oao+YxHNSxgkDFHNcOUmMvv1pPMPfNM2H+lI68+3pRdhYl84DrTGuAD1zVdwc9KTyyfUUcw+Um849qaZjz1pFhIFO8qkmPlEMx7mjzyBxSGLrTTFVJ2GkaPSlyaFHvmjNa3MBRyfSij/GjikAmDRjJozRmkyhD6+9KBS03ANAC4xmkpf8ik7cD9aACiim0AgycUZOcUGk6VIC80Zo7YoqgFzSim9sCl7UIVgJxig9TR1pKTCwDoT+FKPSg9MUlMYpzQP6UlHbjgUBYUdKSjml+lAADx70dqBR3xTGAPFBxRijFUAmeelBpcUfyoAT5vagZNFOqkFxuOOaTHFPNFWIbt96AKUkfhTS2B6VcYtgx3Smu4HSo2lAB571UmuMcZzXVCizJzRLcXAUGs6e5B4JxVW8u8ZBI4rMuLwE/e6dq66dFLc56lW5Nd3G45HNY93JuBHc1LLNk4Jqsctz2rupU9TDVsoXC9z9ay7pCWPTj25rZmQn/wDV2qpLCWGQOPpXakkjTlMGXcpG4gAetKlxtAy3X07VeubYlSdvXpxWXPE8fXOTyKwnuLlu9DYsrwbsbhnp1rU80Om3P9a4Z7p43IBOeeo6c1rabqYkGC2R15P8q5ZpBONtzS1BN6bskYrCuV5IBJ/Dmt9mWROD+PrWVfx4J+ledUWp59eGuhjzgoc4A/nVN/lbnj+ZrQnHOCPr+VVZISXyOnfJq6cjgqLQiTPIPU9MmkcEKDweOhNP2EH8fXFRyk8c4btmuxanLNaEeQrYBH0zU8MnJx1PT+VVH+/zwcDtUkRIJPr2PapdjNGlE+WC8E9/erMWSRzk8dqoQMSQuMEVo265C46GuaasaRk0Z2sQboWODuI7CvPdZQJJk88+tep30AaHg/iPWuE8QWHzMe/JHpXTQeh7OHndHNxTBG+90GK17C8AI547e/0rBmQxHqfw/rUUd2UIByDngV03sdbjdaHo2m6iocZJOP4s10NjqS4/1nI615bY6jhhuPIresNSIYEtn6Yp2TM9UemQ34K1YF5k9ec1w9rqgAU7yOavx6kDgsx/KpcCrnVNcjaRuAP16VFLdDr796wE1NCfvHjvmmS6iCM7h+eMUuUFI2Zrlc/MfzqrJdjB5A9OaxZb8E8uAOnNU5dQyOCP5UcoXNuW+Bzhh161Unuxz82Pb1rDnvztzuHX16VSuNQwSdx46YqrIVzYmuxg9Tx1rNu70FSSRwfrisa51QAnLDnrzWLf6nzkNzmmM2L3UQ2eQSvb1rIu78MCNxBA49hWLdaidxw3Pr71QlvSc8nA/UVII2ZL0jofwqrJdYOeAMdM1ktdkdOpqKS7Jz82fwqQNZ7wYIOc+marte44J9utZTXBwcHio2mPGDVEmi94d2c5P86hkuCQc5HrmqXmHP60xmJ5HH40Ba5YkmJIyaiaXlgKiOTjP60nb9KLisKWODzSMT0oA44pdpz35pXHYYckk4oxipAm0kGlKcelLmCw1RyO1TRnHQ9RTSpU+9OUbugpqQ0rFmJiDyRkmrcB+YYx2+oqjGjFuhyK0II8EHtj61SEyzEmRnrUgjyAPekt0OOMZFWoUOQWIP6Zqm0Q2LbxAANxj0xVoqEXAx054qMfKetIX7nINZSZNxs7MB681BufdxgZAqcoWIIBJFPEOWwVz6ChIllWCUgY9Tx7VoWs7ZCsBjP5ioRallzz/k1IluUIIBH171aMmbGnzBgM5PTA71qJJ90dDjGK5233qc7c+h9KuxTMo4bt3p3MXA3Igu4EoM/1qwqqCDnBzx3rJt7pcrv6f0rQt5wzEFs5P41jJiUDStYC7L909PpXQWFsqxg46DnIrI01gxGe3X3reWZI4NxwMDrXm1229D0MNHW5R1oqiMDn2wOlcJqsm+YqvIz25rpPEN+D8qv0OMVz9naPdz8IxzXBUXLFtns04mh4ZsWmlUAY7jivYPCem7EGQD07VzngvQSux8Hp09K9U0XT1iRRsHA44rzpSbZ1x0RpabAERRgCtaJVAAqvbxbVA61YHHbpSuxtkoxzmgt/+umr1IpwHpQmQ9Az83XFOU0beetOAqkS2Ix6Uh3dqeAOOKCv59quwrkRJz29OtGT6cVJtGKTA78Uhjck/Wk7cU8DmkOKZNhhJ/Gozuyam4zzTD9aTKIircc04DA7inDpRmlYaERiPp/Kl3H0ppPakOe1MLC7iSKeDxUYHI5zSgGpCw89PelUfMOlMwcc461IOtArC/SlAGKQHrS5xiqAQqDSOufSl3jNMLfjQAwoCOlKIRnOKXfyPWnhx0NAXY1YR3HNPVQMe1AfA9+9I0lPQWo+m4FMZyBUbPkUmxpEuFPpS4A9KiD9M9PSgsc+9AyfIx7004zxzUQZiTSr97k0rhqSHGKQ4DdKaxxnmmc8nPWmCLgpT2pP8KbWxiOooPU0napuULR+BzSZpM4zTAcOlHcGm5OKXnrU3AUdOaKPegVQBSHqaWkI5oFcQ0nWlNIDg1DKD6UuOBSDGaXNMTF68UY4pM8+1GfyoAKcB82aaCaUE59aLgHGKXiikxxx0qgDjt6UnQYoIOaTNACk0Z6+lJQP1oGOzSA0Y4HrRTQXuOFIDntRz3o+lOwriUuKM80xnIrSMJMLknA70DFVjLgc9KY04B6itVRk2K5bLAdM/nTWkFUzcD1FMMwweeK3hhW9yHNIsvLUEtxgdaqyzd81TuJwAfm5rtp4exlKr2LU91zjNZl7efKar3NyD1NZt1cM2cHk+nauyFExd2Je3bNn5qp+Yx7nn2qOTczGpIUPB29e3eumNKxHKSpz2PPrU2zj14p0Uft1Hap1j5BrZKxaiUxACckZp32UEknGf1q/HGO1WFiB5HP4UXNFEw57HcOBisbU7HapG2u0eH5OlYWsoAjDpxWFTUageZ66pj3Hjjtn61gWmteRc7C+Mt0xiug8WOArEDAOcZFeW6zctFKCpIOc+9cc5pM2cVKNj2vRNSSeNVBOQMda0bpN8ZOGry7wHrRkbDtg5xjNeo2kglhB6g+tc1dI86rTdrWMS4jK8gDIPAqNVBOCfStbUYCBlTn9KzHwrEjsK5Yy6HmVYMrTKME+nWqMy/QZ71oSHA5PQd/8+1VZsEcEHjGcdK76crnnTXQgiXLjlfyqRVXYVBP40inDZwTnnNAPOeeK3USVoXIUAbIOT71fgG3jHaqNvxjPpVyMsxC5PA9aynELlg5dOAOmc9axtZsg6H5S2e3rW7CM4Jb8fSpZ4FePOMj0zUUvdZ3Yaor2Z4z4gszExODj8hXJ3DFG5ySODXrPivTdyOQuR2P9K8q1uMwyEZ59RXY9rnr0p9GNgvGU4yABzWpZaiVwCxArlWmIYfMfYU+O8OeT7ikp6FSSZ3ttqrbR82PTNWotV5ALNXn6ahjDE/jVqPUieN4z7mtE7mVjvf7WAH3uuabLq+ej+4ri/wC0scBs+nHIprahkfewB1OetO6FY6yfVmBBZuvXmqkmrlTwT+NcvNfHPUnA/wA5qrJeHsSOKnToDR1M2qZBYt161m3Ortk/PnmuemumKkBjz2z0qlJcNuOGIobKNu51UkYDbR6VnT37t1Y+/FZrysepPpTN7HByai4Ftrk9Ace1RGUnqT1xUXPc/U0mCfzouA8vxjJP8qQse1AUlQDShMng9vSlcdmNycZGeO9AyfepFjzjAPPrT1i7g0uZC5WyILzkfWhVJyMZqyIgDx2pywEr904JpORSiVdhIGck04IM89Kti3fuDU8FizYAB/Co57lclncz1j4AyemKesRJ4GM9sVuw6SWxhSTxxV6LRsYyv4CqSdhM5hIGYkFTgHmpEtGZumcdRXVrpJGFwTn2pzadhMgAU+Vi5kcutlIwGAPripUsSMgryByK6VbNEH3cY6Cop0SNW557fWqURN6mQlsEXJHQ898VIsZDH5elWANxGOQOlSR24BycY7jFPYykxkEZCk9OOAR1qdEXAGDmnrkHbgccgdaOVG7p0pbmd7jSh5z360gVd2OCKJJV9fyqpNcNtPOeCcinYC8AAwYnB/SjzEUkfz/z9KpCclRxnNIfM3cOQatEs1raRXXI5q4iqSMYA7HHSsm0JUc7iSPpWnASVXkH8KZD0LiRAls8k+tL9nXG8AZH4c8UJzjBOfUVahG5R1x0471LIepUML9QTnGBxVqyicsBgnJq9FCOOMZPNaNhZq0oPUZrlqS6CW5PpaGNAcc45/Ol1fURFHtzyB0BrQaNIIMgj0xXI6qslzdBIySBxwK8+q1HW562Hg9LkCPNfXB2jOTiu78H6A77HcdfbiovBnhoswaROvOK9a0HSI4EUbfTtivJq1eY9WnTaV2O0LSlhjT5eQBXUWqhFxmo7eBUUYHWrKpjNczZtYlRhkVMjZ69qrAGpVOOM8UILE+QM4p6kYqANk9uaejdqa0IaJh7GjPFMDDOM0Fh61dyLEoPSjcKi39PSgNmhBYeSTSE0gYY696QsAPxouMVie1MJOOmaUsM00njpQwAHjt70EE49qTPPWnbh+NIYAcZNLjByTmmlximNLzVATY45oCjFQedSCU0BZljABpOOarmUk05XI7ZqbhYlZwADSLIM81XkJxTVY5xn8qLjUS3uHU015AD1qqznk1GWY/lQ3YfKXDIKjZ+arqHJBqZI26mhsLEgbIzSFz0PNOWLC9f1pvlk8UBoAlJHHHtShsGm7CD1pWHQ1QCPIMHrim7wVpRHng07y1A71LBWI1b5h1p7PjilYKBTSy8c0IBRJx0oEpxzTGdcZx2qMyLn2qgtcmaQknv9aaZCOAKjLdx+VKrDvUtjtY1R0pKbk80ZrW5hYdn3pMjH40hpKLjsOPWjI/Gm0UrgOLD1oJpOcUdKQWF3cYpc0gApccUCYuaQmlxwKB9KpagNP15op/1/lQevFFgTGe1HQYp2DRipDcQDp60AcH60o9+KB0qgF5H9aMc4ope+aEMTFHbFLmkNOwgpv4c06kJpjuIQM0e1HtSZxnvSsDHHmkzUbuB3qF5vSt6dPmYizvx9Kaz89aqGbJ60bznrXdTwl1qZuaW5aLetQu/HUimq2RxSN0xXo0sMkc8qjZDMxx061VeYjvVphx161TnXB6muj6ukJNsaZscCmNOajkBB6HNMIJ9aqNFBYWWQniqkzMy+v8A+urZTOOKYYQRV8qjqVYy5VY8nmq7w57kDuK1pIR6cVA8QHY/T+taKSBmYsHzHip0gwQTU5jHUDilIxVcxFhFHbAHvUiLxkf5NIMZA9KlQA4qXPQ0jG5LCuDVuNeQKjhTjt+FT9ATiolM6I0yteEKhrkvEEwVGBPGK6TU3xGcE57471wXiW64YDPHArmqVVY1jTRwfiu4Ad8nAPcmvNNVPmOeARnjmu08SytLKyj5upxXKTW4ZchRk49q8mtX5maqlZlfQLs2l4oLYUnqTivY/C2rCaBAzD25/SvGntmDLx/jXUeEdRlglWNi2C2OvFVGopqzOWvRPYnAkjyRk47VlXkTI5PIzV3RZxcwL3PXA+n/AOurt3ablyAc45OK55XTujya1G5yVwSCwOePX+lVZSwPPX+ta97asgOBzz2rLnUhT82B6YrsoVLnlV6VtWV4+oyNxFSxgbQevp+f86j6MflAOPzpyMQxYfU5rvjI4WjRhXIUnPFWIVYv8oBqnasrFcHjvW5aRoVBJHT1q3DmQJXIowydeMVaik3ADJyfUZqGfYFOOSD6022bD5J4zWE4WZa92Wgalpq3MWAAT615l4x8MOQ7BCD14r2azZHUKwx/Sm6no8V1HgKDk9hV06qWjPTpVk1qz5F1azuLO4KujDB7VnmQjqTXvfjLwKbglooxuwTnFec6h4Bvo5GKR5Q5OAprZJS2OuNQ4nzWVRycU5JXBBya2L/w5eWvymNgcnn1rONlNGSCjfgKfKy07jopWzwcCpVdtoBOOmKYluwzxx61YSE7QMEcZzSuXy2ImY55yTUTtgHrn6VZMW04I+oPeq0429aWqEV3YkH696hbj2p7kdeaYR7mlcBhH+c0qqcdDTlHqM+wp47CpchcowJj65qRU7d6kCcninqny9OD1zUuZSgRBDnpx0p6rz746U8LgdaeiEsdrAH3qHItRsNiiJ49RV+3sy2B5YxjpT9Pt92ABzkfhW7aWu5OAOcinBcw1Gy1MuHT+cEf4VOmm4GD07ZrahgUruAHPTAz+NXY4AVyRkEeldHIgULnOxaaSSCBn6Vo2WngDoPr1rYW3UY4yRx0p8SgEjt/IYqlCxDjYrR2oTacDA61ajhTGVAGO1MlkC/MDx6CoWuOB0+lNqwnG5aZUBPygccmqV4U28EDJ7VHLeAEsAT2NZ13cO/tkdTUENW3Iru62NhWzz0HrVFpmlOCeac0TSN0x2qaK3C9Tn1FBlKQkMeSpPrVgkbSMtnHNI2AMD8vaoWmy2c9RjFBm9R5fbkk8Z+hqC7uMKQMfnUUkpYZzgCq5BkI64qhIQylmIwc+lKkZPOeBxk1L5W1hjj+dTxoMgAHcOOBQgY23hbAGOPrV6CBQecZ9MZzSQpx8uQR61egj3YJ6dyBQyGNhhBBIP596uRxBduO36ev1pyQ5XJHTirCR5AAXGen41DlYQsKgnAGOMZPGKv2secDHXBNV4YXHPbrWjbkQ/e+UnB5GPrWUp3CMDSsrEMAuDg/pWtHAlvuYnoM9ayYNUjiH3u3p/WpDeveELETg9x3rkrTUEzpo0Lu5Hq97lfLTOc44qx4Z0ZridWdC2epxWjovhuS7mEsi574I4r0bQ9BS2RcIPyrwsVinN2ie7h6HKrsf4f09IIVXYBwM109thUwB9M96jtLXaMY6e1XI4CAOtcSb6nUSxNn+tTA+1NSPA6VKqDPSi7DQaGAIIpCxxUgjBJFO8oVVyWyFXPapAxx7VIIlGcU4Rr6VWnQltWItzUmW98VZEa0FAAcU7EcxXDH0NOUtnnrUrKN3TmkxyOo+lGw9xvODTWzgfrUowB9aG2ntimIh53daNp9aeSBSFhihMdhoU+pp4Q4NM3dxSh6dxAU45NL5Qx1zTS9KJO1JMNRPKAPJ+tSLEAM46VEXJbv70pcletDCzHFFz1pfkA4A/Oq5dqcDwTQOzHttpjsM4pDknAoxn3/AAouAAAjNOVRxgcUoUY9qNw6dPpSGOAXd0708EAYxTAwBHNNZ/TNMW4+R/Q0wMRzTS3GMU0Nzzz7UXKSJMknI7e9NYnOP5UjSY6Coy5zz60XCxKWP6UDcerYqEuTz/KopZXVcDvRuFi3IB681CEyTmofNc85P0p0TMW5zRbQaViUqNoGeaYVAPOKY7uXC0kqsRxxx6VQ0SnYOppS0YGM1TUOWJOakYEdj+FTYLG3j+VGOaXoPejtzWpzjaXtgUHg8UdvepAMcUAUtFNgHOM0HrSHil7880gAfdpew5FIOtFAh3pSimjNOHSqTAUUnQ0vpRihvQYlIaX1NAHAzSuAg/yaXmjFKOmRTEJQPT/IpRjGaBweaBiY/OlPTAoHpQDVCEApCKk46U00BcbgVHJxn0qQn1qCUnHFBSK1xKBnBqi0259uafeNgkiqKORJ6V6+Dppszq6LQ0kfjHH1p2eKrRNk5qYsMV7caUbHMo3JY3AAHsKlVlPfOaoyPgU1JeSD/OtOeENB8hakdRiq0pye340pbPFMJz0rGpiECgyFgfQ/Sm7Tx61YVCw5qVIeBmuaWJj3NFTZVWM56U8x8H1q2IgD0pkgGDUrEKQ3TaM+RMVTmOOOlXrhsH2rNuHOTz0rppy1MG9SORuMmq80wAycD2pk8u1TyPyrJvbwAdQMjv2q5TdtBpXND7WPMPIwKv2cu8Dn3rkopmaTu2DxXSaOTgdK4quKUDrp0mdBbKSvJxxT5iBmi3HyZ56VDfPgVwyxt+p1KF0Yet3GEbPbnFeb+JbnJfPPY47V2XiG4IDDIrzjW5C0rgrkH1Nc9TFOV0aRppanN3cZlmYg/MT60iaX5gyV9PpWtZWzSSbdnU11Ol6TuTAXP9K4pysjW1zhW0IsDlCOo+lVf7MNvKHVSDnnA7V67/YeVzt+pqjf+HwAT5YPpxWPt5J3E6fMrGN4SvSu1HyCvr9a762VJYwcZyK4UadJaTgqMLn8a6nR7sCMKTz6YrvpVVUSPMrYbl1E1axBQkKPXgVyepwtE348ZFeiTASxE/zrl9csSSdobHatotwlc8jE0bo5Bj85VTz0+oqVEYk55569z71KYCsnIOc96ljjAx+uOa9GjO54lWHKOt1I+bJP4VdiuGjH3uDwAKp8Y3ZGfUmiOdFOATnHI/z+Ndqlocydtyw9wznOMDPNT203zAAjPfA5+lUDKHJYAZPHNaOlWxcrjpjvWMnd6j6m3p2cgYPWuggHyc8DFVdI0xwoYr6HitKSIxL05/nWcqT3sWm0is9nDM3zKDn25qneaDbOpOxTn2qyboRvtJB9s1ZjleRehx34pKTizso17HnXiHwnFLu2xDGecDpXC6p4R2u2Yj7+le/vZrMAWH09qytR0aJlJ8sZxxxXXTrp6HdCpFs+drvww6uSsYOODnvWVcaLIpb5SPUEV7rqOgpvchOT6jrWHd6JvQ5QEHriuj3Wro2TPGLrTnRT8v51kXlsyliRxjp6V7NfeH1YH5fmx161haj4VV1IRG59T0rOUGO7PJXjbpg/hTVXkcZru77wpKv3Y881mT6FIrcx8j9axlCRSkjmlQjOOOO4p4Q46fWtz+yX5+UgH+dMGmsMDBI6+9YSUl0NI2ZmCM4x2HNSqhAIIBrRXT23bjznvThp7H+EbRyKxbdzayM1YznkAelSRoN2DVz7IeM8ZHSm/ZX3DaCeMnjFFmwskXdNRQVBB5Pcda3YIwUAA4xwKwrON4wCucA1t2b8fPkbfbtXRR7B0LcUfRhxnGKnRcDg49aRTgZLDkYJqMyBRs6f1rsurDS0LBkVV6jH061FNOBnLe3NV57jBJHWqUr7yF5JB71LYcvVk9zPzncBjJ6VSkmbcRnIPbNOCO2CB/jTha87tuTUNmE5kSIznG7tUhtRtJP45q1AiR46gA/l/nNPkZGXGcDHc9aDllIoNGEHAB/SoJZNuRkc9eamuJlAOMD3Pbmsm/uB82MAE5oSMmOkuQDg4+marM7yPjJzxjmqoZpZAvOM9a0oYfl5BA7k1QFdVKgljjjripUIBHPA96n8tmOMDJ7CnfZCcevWkhXIFLOwxgg9iKswKRnJ6/kat21kzOB1HbnrV+HTw/YjnqO1Fxla2Q4XjHpWpaQgnp1p6WYQBjgcU03SwNnPbnmpbCMbmgIAoyQOB9KdH5QYZA4/Suev9fQIQhz9DxWYNamllCqOp/SsJysaRptneCWFV3Ej8ay7m7ldtsYOfU9Kz9LF1eEDaR6HFdvoHhwyMrSL+ff/AArycRjVE76OFcuhz+kaPfXk4LHK9fpXp3hXwv5ao0i9MYz61q6JpEMAX5ACfTiuptFSMAAdP8K8qriJVT0adBQ3JdK06O3jGFXjj61uQRqpGBgewrPhfjp3we1XIZOfT8awua2uaESqOuanHSqsUmRUm+pbHyktLvx3xUJfP+FG7P09qaGTiTBJp4k4xVVT6ZpC5Bpk2Lu8YNAkAqkXbb1oBc9apCsXxKDxTt4I61RG4Hk0oZsdeBVXJcS9uGD70wkZ61Wy/b+dKofPOevrQ2FkTbwB3pG5HFMCH3/OpAhPv60BYj4xjNLkAc05ozTPLY9+aAuJnkflTSTn3qQRHjJxz3oMZzQO6IiT2FIM49zU3lj1oIGaBEfbPNL2pwC9qTHXtRsFxhGenelwBnpimkndgUqoT+eaChwwFyaUMARmmrESe+PrUiwc9aBXSE8xSCM4NNyM9etSG3UDPSnJGoHNFibq5XU7s0cZ6ZyKshEHT1pyhcHiiw+YpsCT0xSBG3A9Ku7Vzk9DSkL/AAiiwJlIKV4NI8Zxn2q5tBGcClC560W1DmKAR2PAoNvIWHy+9accY+90p6bTyBVWYucy/sxJAxj1qwLcIB69KsMdr8DrTZMnvilYHJshaBOp6+1KYUA7U4qcZziowpJwT1o2HdiJGhJIpTDG3XFKYmTPpQIt/IYY7UahdFr8KQg0u7r0/CkYnFWZWFopAeaTNAWHe9GD3pM+1Jk0DsOIGKUADB4po9c0ueeKBWHADH4UduaT60h9c0BYd3yKN3BpvWj6UAPB6UE0wHjml4oAKUnpSUh6igocDQD603NIGGMd6BWH5x0oz7U3cKTdg5poVh+frQT70zdjvSFwKbaHYlyevWkJz3qLfijf3zSuKw9jxTJQMGml8UhfIOfwoTKSM+6TIJrNZCDnjp2rYnGRxis+VcNmvRw2IUWW4XQ2ByDirCnIHeqoUA+v1qUHj1r0/rsUjL2A6U5OM+9AUY9BSqhzxU8aVx1cbd6GqopLUjWMn0qRYsHkYqxGvHTIp4ToDyf51wyxMpD5UiJIwB0596kCgCnhQOpqN2C9xWXPJsLoHwBzxVC5kGM5p1zcgE8jpWReXWQcH9K9LC0pN3ZjVmkguZgSRVCdu/pSPMCeCP8A61V55RivZhGxw7spahL1AP0rEnLySdxWrMjSnB7e1SW2nFsHaeevFcWKxHJE7KFO5S063Z8Egkf1rqtLttqjtg9KXT9NCBTgVtQ2+xOOK+dq1pSdz0Ukthg+VcYrO1OYIjEkcVo3GVX8K5/Vgzg/nisk2wOV1+4BB5zXE3cLzzDaoIJNdxeWBlJyP09qfY6F8+dnPpgn8q2TsPmSOd0TSWZlyh5IzxXd6TpgRB8v6dauabpIQj5K6CztFRfuj3yKzk7ic7lCGwG3G0Z9hyar3OnKQw2flXTJCAMAfhTZrcEZxWDFzHnuqaWNpAUcH0rn5oXtm47dsV6bf2YbICj8RXJa7YnaWx9K0pzcWmhNqS1IdMuA8YBwKmvbZZYicA574rnLe5a2utp6ema6GzukmiBB4I7/ANa9mlNVIJnlYinZnK6lZmKQ/Lk54rLlbaOQAP1/Ou01K2SRCVA9q47VYmiyRgAHj/PatYy5HY8PE0Hcz5rjbwPp1qsJt0mAeT6moLgu0gC8/NyKuaZAzOCcn9a7YVG0eZUjY09Gtt5BcZz3xXc+HbWISpuAAGOMVzFhEIwMDnHPFasF99nbdkDAz7V1QS0bMU7Ho8CQxwZAUDHtmsDX72OHIVgQR0rBm8UlYwgYn2xWPPeT6hcZLErjGK0qVYpFOqtkXo7oyzZzwc4ro9NGQDgH8KwtNswuCQM9TXQ2m1V5x2FcPLzsdNtbl5Tge9RTnIO4dau2kAdQe56mmX1uqDscelRyO+hupNamHdW6t2BPt3rJubNfSuglxgjp2qlMoJ4PIOK3g5o2hXkjm57EMM7eSOKzbqzVAflHfPHNdi1suOOKoXthvBAX1rVVGdNPEX3OJntYDkMq+mKrS6NDKAcD1HFb11pcquRg7fp2qSK0kQYbgf1rbnR0qpGRxl34fiwWCDn24NZs+hxqThRz04ru7uIhCWA/GsK9O1hxz1wBjmloyoWObOkJuAwBjrj196hl0kL820nPPSukhG7IBGPrTpoAUPI9+KiyNm30ORk0wAlCBtHXimLpo3ZKjOO1dJNAc89CenrzUSxAc8fQDp/k00kCb6mG2mDGdo9vXt/jTFtNjbccjp/+uujEfGcHPc4qCaLI+UdvShRNYuy1Md0KjgfgaqksBk9MZrdaxZzwvvtweee9A0oAZIAH0pu6L50jACOw21JDa5HPGf1rdFiqjJHvnFRTQeUWAGMevekzCU2zPSABc469KR1C45OPQjrUs8h57ds+9UrmcIvUYHpTsjB6le7n8otjqM9B1rON/hcEAgcZ9aqancszFS2fpWNNKQSc9Dx3pN2IcTSvLxuRu5zzkis8s80hLHj3quGklkCqCTjoBk1r6Zpk0jbmj4HWpuS1Yl0+1JAZgP8AGtMQY6KAB3HFW4LB4UG4c+1E0ZjPbrVdDNkKRZJJHPY4yK0LO0MhAxwDUNumW+ZeT6VsaeUQhzxtPGRyKQralqDTkRAWwfTPaq97LFaqTmpr7UkWLapIzXG69fSTsVDk/nRsaKJcu9eDMUUg89RWRe3rTAheOfrVG3s55pAwXP1FdVovhyaZlZwTnnkVw4jGQprVnZSoOWyOZtLC4upAFDnJ+tdj4e8KSSOrumR9K7DQvDccW0+X82Oe1dlpumIgGE4I6YrxMRj5T2PSpYZJ6mN4f8PJbqAycgDmuwsLIRgEJx9KsWVmFAwvHtWvbW2cEKePSvL1e7OxJRVkRWtu2Rg4rRgtnBqza2/IB/lWpb2ucHA/pTsJsz4LZ8DIz61ehtiOxq9Fb4HSp0jA7UWdxcxVjgPpiniHtirQHPtS7eAaLC5iusHNSrBxyKlRacOatolsgMVCwDqanIpzYC47+lCQXZX8lcDinLCvPFOBweTQWHqKYhPLXJGKNijt2qRME9e9ErL607CuNAQUrFc8Dk0g24znmm7lD9f1p3Ddi7gOwpA/HApS0eKRXQd6L2DUUscdKQSEduT0pWdB3B4qJpYzkcU7hYc0h6jpUTSsDjvS+dHk89OtMaWMZNK5SVh25sZzSkHr1xUSzqe9SB8jpQMeq9TRgbTkmonlGD/hTVkycD/PNArEg2hqkyoGQKr7xngEil80YwOTQtBMn8wjoooMvHA5qLzsJjbUfmk9qASJvMkJNN3Oxximec4QjbzUXmS5yBRcfKXE3LwamHAye/rVFZWznNNd5HYHeR+FO+ouVl4n1PSnI8YHytmqJLBeWOaIIiEYlznsKBuOhe82PZnOKY9zGijkH+VUFAP3jyKcyZXhcincXJqWmvFwQDxTBfRgY3VUeNsYPy0iwRxkbjnNTcpRRZbUEzxn61HJek9OBTBBHuznIHanEx5xlRTuFkh8V0dvCmiS4kxkKcUyT7mVZcetKJYvLxIwyOOlUFkRvcyucEMMU6O6dRhYyR601HQPkdDTvtMCtsA+bGaleQWRqnpSMcc0m7gimluKu5lYdn60ZyOaj3c/hS7jQBJ3Ht1pCcE84qPf6cU0v1AoCxOCMU7PcGq+/k5NAfrnvQFizu55oYioN/cdKQMSKLisSFu1Ju4qMt2x+dN3HrSuUkThvWlLjnmq5Zh3o355pXHYnL9e9Jv461CGNIT6mmKxL5g55pu8YyeeKj9s8e1HB7UDsiQydPSkMntUecA/nSEnP0oTDQk34/rTS/fNMzwTigfXvincaRIH/DNAY+tMGTkdqcAQOQfyoCw4HPUUnPr0p3PtSHOen0obAjcZFQSRZPbNWT0zzSY6dqlOzKRU8rmlWMelWtmeopdnB6Vp7Rlc1iFU56VKigU8qPUUAYFS22TzDlPGMfhTwc/lTF9PenlhiqSIYx22qaz7ufGQD9KszyjBGayb2QE//Xr0MLhubVmc5qKKF7MxyM5NZk0jMcE+xPqKuz4Yn2/WqzoADx9K9ynTUUcjbm7lQyFT7561AZNzbR/On3HB4PFMt4yzj3qK9ZQRvTpXdi5ZWwkxn/IrdsbMccfhVTTYemR3rftIwEHWvm8VXc5HdGKirEkFuBjrxU5jAXpSrwetOJ4z781xMZTuItw6VmXNkGJBBrcYA0wxgnpSvYDn10xOhUDNXILBV4C1qrEMdKdtA6Cr52PQrQwKo4FWI1CjoBSmmliBUN3EybdTWwaiLH60Fj0pBYhuEBFc/rFvuViB2roXyQapXcO5cYzmgdjyrxFaNG25QQM9uDWXYalJbSBHb8CK9C1rTPNRuCT+dcDrOkzRyF1U5HtW+HxDpSM6lPnR0FtfLPCDuyCPpmsrVrXzlYBevcViWN1NBIEcFeeBXS2UyXEYJ2/n3r101UV0eViKNlqcsdLcS8pwOvH51etIFjAyBkdOOlb91bJsLYAH8qwtSnEWQvG0dq66c+Xc+dxFGSdkTNcxxIBnjPHHUVmXuqKCQpxjr3HSsi9vZHJ2kn1qkqyzEccGurmukc0qVlqb1hM1xKdvr1xXWaTbDYGz0HpXOaHa7GV+/r6V12nuAgHf0qZJN6GKjqWWYxDCg5pv2+RXOQRz61aHluvVQc9c1SuYE5IOeKpRsU01qja0/Vxt4JNF/q+7gHr6HpWHCAhIXoKuJbCXrnp3rZRu7milJ6DJNQJ7/mKi+15fLE5zjr+tWH0/Bzy2fWq1zaOi8E8e1EtNQs0W4rpDwSADzVmJ45OSR9DXMySPG+DnjpnrUi6gyqQDn68UlJGkZvY3J4kZugOeTimPaIEJ2g96oWt5vIJbIrRSUSDAH60m0zeMjD1OwGxsAdPqQK5LULCTzyq5PoOteni08xDkdeAKqto0Zl3suec//XojJnfRcpI8/sdGmcKzJ+daX9iSeWQVPPfHOK7mOxijAwq8etOFumOFrdRuekrKx5zcaAxHKj1+lVW0OVSTgj1Ar057BTztXr0xVSSwjycLnHtTsVyw7Hng0eTgbSBjp+VWF0JwQxjO0d8c16Pp2lw7vmUYHsOKuX9nbRQE98cjrmpuRLsjy2XTBApBXp75xWbcqiBgeAOtdbrjRrkDgjpXEapLtY7QDUtmVmyvPKq8ZABrKu3znjpzmluJnYkZyOxrOuLgITuHQc1k52NVRK99JsTJ4wccdawNSu/mJJP07Va1O8BVhgYIrCum3AkY655NQ6ttB+yRXuZSxPQ/Wq6xvI2OSc96sRxPKxVVyenSul8P6E0gDtGce471Km27EuKW5R0bSyzq7AgfSuptRBEApUfStqy0YCMAJxjB4qteaaI5ecgfkD+ddMdDklTbehNaWouYgI1B75xVW60qXdgrj3Haup8LwxbQoHTrW9eafbiLe2Dgd/ShmTgeXNamDJYYPuPSqd3eLCvDBs571teL7qKNmjjGD0yOlccttcXb7Vydx4OPWlOagrtjjByeg+W+aYhAck8E+tWNM0qW6kHGQf1rU0HwvO0qmVT16EV3+kaCIE+6fyrxcZmSTcYHqYbBt+8zG0HwzEBGSgAByB612Wm6NFEqnZkj05qzZ2jRso28g/lWxa2zjA2kkcDPavn5VJTd2z04U1FWQyysEUDC5I6ZrasrNBtG0YxTbW0cYO3kc1p21uwAwOKlyKZLa2qZzxz1+mK0re3jUAZ79arwIynmraK3UdKu5LTLUSRKQAKtRugFUgDgCnIcd+aLk8poLIm3qacsycHFZhkOMZ9qVX5zmpchuBqGZRyCDTDOBzVJWyOWFPLrihSDlJzc80huyB6VWHXmoZ3Ocdqdx8qLpu2z3pjXDluKqh6A4DY79Kq4cqRaWRz1NCu397pVdWYgn+lJ5hH86QrFnzXGACenNBkdupxVdZMj60rEj1pg0Tbyvc0mWZs5qN2OBxQshU9DTSFsWGyVwWAPvTXXC4BqBmkJyATSFp2PCkVVtBLUmPTGT/Q0oVcctUQWY87cU3ZMT0osMkKZJyR+NSJEmDuP51XZJ8jrT4oJmPfFANkiRxjnNPZ1Pyrj3qJbedmxjH41MtrKrdeMdqBNoRdpzk0u2IHJINPFm3XNPWx+TGfzosTzIj8yPbjFRsyLlu/pVgWaqSd4+lI6wAZyMjsKdn1DmK7NvXP9KjEgBwRzVg+WF4FBhUsp3YqWUV3mG/HWgTNjJQn0q0YrcDlgTUkbWqMEYqMc00F0ZhmfeQqHP0qQNMMnYauyXFpuxGATQLiPGVRmNJhfyKJWdj908UrtOOoOPSr6yEvlk2jFNmvowQPJYn6VQczXQpJFLIQ2CuKkWCUYIY5FTfb5wuI7U81G8986jZEAO/tS+YXd9hk1vKWDBzn0qP7M7tlyc1KzX27AjBBHJxTkS82ngL9BRsFyOOxmOcFse9CadvYhm+v+FTwfawfmy3+zxUHlahJMfnI9l9KLgSw2mxjG67x6ZpsunQ5ypAHOBnmlW3uxnk88ZNRmwu2cl5yQeM4ppIV9dx5tY15yDjp2pJGtCw3soJ9KVNOkVdvmOw75qT+y4SM7iGHU07PoO66sl3UpbNQjkc04EUzMf7/0pMgjOe1IDx096T+H27UAL7ZoOO5pM0nWiwAT7inAkU3HcZp3pmi4Chuadxj0NJxzT/r+NDAbyab3p5znrSEDPtQBGcnijpTyPrQ31pWAaMnPIo2GnY5+lPAHemNjdvP0o2H60/PNLkdRQIi2exppTnGKmppwDx/+ugCHbS45/Gn9sUYA70FCBTnFOUAc0dTijtigBenSkP3qazY7U0n8/X0oJHE5oB7VH+FKMkA0MtkgPSnLgcmmLzTvanYTFJGeKaW+XkilbjB9Kq3MwX/69VFXAlacA56VXmvFA4IxWddXgU4JxzWZc3x/vda9KhhuYmTsal1e4zg1nz3m44z19qzJ7tiD/IVAJsnvXsU6SgjCUXLU0fNBwc5FQTy8nBNVmmIGQevHWkizI2McDr+FOpVjFFxpWH+UZCOvFX7GzORxUljak/X+Vbtpa4GcenFeDi8TzaHXCPKRWlqwXPetCOPA/GpI4cL79qmWPpXmWbHzEIU9c4p+0461OsfJp2weneq5CHIgCZxShPm9KnC9M0oXn0qWguQ7Dx3FIUPpVkKMUhXjilYLlUoc9KQx5+lWSo5pCB6fjU2C5X2HNJ5Z/CrAxSEgZwaLBdlby+5qN4s1a478U1gKQ7mXc2gYYKisDVtGWVGwo/EV2RUEcjioZokIxigaZ4xr+gtG7Oq4x0xWPazy2shV88cf/Wr2TVNNSZTkZ+o4rida8PnLMiZOfxropV5QemxM4c5hvqYeLBJOelZdzE1zISgJ6dutO1axntuzHr+FR6NdYmCSnuPqK9ijVVQ8vEYVbsZ/YBZSwBzjqakg0owuu4DArtLBYZYxgZ460l9ZrjgDIrv1ieHiMP1RgRIsYGOMVat2PvkU/wCxys+cMBnr3q1a2bIoBH6UnM4PZST2ERpQoGeB2pryyH3465q4YsAD+lQyR87sYHrTjVuiXBjbZWYgdBWvBmNNx/nWVDJ5Td+vGPWpn1DIGDyRjpXTGoluUtNzTMu5uMfT0onZXUr17VlpdblBx09akRncjHT3rVTTQnIW604SjzFGM1gX9i8LHuPYV2tqpMWCueKz9WgVlOVrCcdbnRSimc5ZPhlUnHODmuo0xYsckfQnv/nNee61ePZzllzwapL4vmjPlITnoRnNUqV9TvhQSZ6800SEgHn1xSqQ6k4+uK820bXLm5lBYsRnv6V32iTGVQM1o4JI7KMUiW4BXg56f1qCKTa3PT2FX7qM7c4OOOc1lSoQ3BJpqVjqijQEi7QQeKilPzZ4PrVON3PfoOatRjK5Jz9abdy7Eiz7Fz3Hr6Vn6leuVK7uoOBViRgAQvFZGokBT056VDFGBy+uTNltp47e5rjtQc5ILZHXgV0+uOqq24jjr9a4TV7xUY7eSDycc1zVaqidEaNkRXsqouTgH2Fc/fTlmbqewJFW7hp7g7VXOf8AP9TVzTvD1zcv9wnJwOK82eJ1sjT2ZzBt3lYDuTxVuDQbiYriM57V6doXgiRwDIue/PXFdxpPhG3j2jYD9RW1OlUqK5m0keO6H4OlZwzRN15BHOPeu90Tw4sYSMxgY9QK9GGhR20eDFjPfs1QparHKDGO/PNehTpqCOecbnOzaA1vAGCgcfd74+tc/qlgDuGB78V6bfmR7by8DGPSuP1SEqWLLj2FW9EZxgziY5H0+fcOOeBnvUmo+IpJITGrc7ccelWNXsZZNxjQgDkntXOwaXNNdeWAW/GspVlBczM3Q5noYk1tPqF9n5myc13fhXw5GkcbyxYzjjFbnhjwZIyrK8YXJ6V21l4f2KqhflA4/wAK+dx2OlUlyx2PUw+GhS1ZgWWnRRBQEBx0x3rWtrRVXG0HHQ4rct9EwASM/WtCPSlCkAD2zXlWbZ086OegtRkEYxnNadtbhT0A/CtaPTEB555zmrSWca4GB9TTsLmRnRwjGFUdKsrERjA4q7FbovOcVKEQHdQwvcrRRtnOP0qaGIk8VYTaP61MmwdaSbBsqmFicAGkaBj2rSWWIdRS+dHjpmqtcnmfYyxbyZBx2qRLWTI4q75wzwuasJyB8tLlE6jM5rdyeBx60C3kH1rQLsTjbTJVk64NPlQuZlP7NIwzSrZE53Dirq7yOlSbTjPOafL3E6jM5rE5IGMU7+zuBzV4ZFKSdvBFOwvaMoCw2DJbrSm0QjtVz5icP0prR7hw2BVKK6BzvqVUtokODipRBCfQfjUsUSE53CnNFGAfnAoSYORAUgBxx9aWRIMZxzipfKtwPvA0AW69SCKdhcxXEkK/LtzTzIoUfuuPpT3ltI+wz2qMXkRGFUEU9g1YjyMcBIxmog8i8eWfyoW+XzTtj6U9b6M/MI8+uaW49UthrvNgYiqSJrn+5+GPanfb0K/cPFAvcAER1VrE6voIqXWSx6U5/tJxjAxUTahKxOyOo/tV0x2qu2h2DUslbqQctj6UiwTbP9YSKQi8aMANz3poN+igZU0aAKbWRwVMjYx61EbAgEBxnPNP/wBLPVxz2ApHt5gpG9gTzQ7DTa6gLI4AdvwqwlojoFU4I6fWqv2S6ypeUjPQE05IJYpf3kgwenNJA79y3HYrGQWZc042tooLMVNVBZh2yZmyB68Un2ddh3E4Bpvl6C16sm2WqHKhfzpwELDauBjvjvTFhtgVGQuO5PWmLLbxtwwx6mp1H6EsaoDgjinqlsz/ADJkg+lVprmEjcHAOe1JFcw7iBIuT39apCs7E7zRK+wRkD6UNfRDC7dw+lVTdQr/AKwKaI7/AE7jAO7/AHaSd9h8pZWeR8lEwPenwzBlw4weuapNqMDL+6idsf7PBHtUaaiZBj7M6r0yRxR8xWdti81yUlxGmc9cnJppkmJJjQg4zzxUEl9nHlwbc85xyaIr+UyFAihiOMnAptlKL7EsMtxKpBAQj17UD7QcjcSRz/8AqpYJ7g581Y8442mlZ2QcBmJ9qVxa3Itl1IMCV1+vBpDY3DR5a5b6E1Yl+0tEGiUYpYVvJIgsqrx0OcH86Ewu/Ipg9c804Zz65pMeopQvP/16odw9OvFFL7mkA7/5FLoAZ47Up9v50d6Oh5pgGeKUfSkH3fSlHToaAHDrTh1PpTF75p3agB2aCeKaSM5NITjjrQKwueBQTzTc8cUZ59KVxCkntS7uBxzSY59qMYpgKW5pGbikIP40mD0oAcX78Uobcc+1RnpknHuaBkGpHYk4PPaj6VHk/WnA+9N2GSLycUAUinBFPyMelCFcYwI/Kmhe9SMcf/WpmfemFhAuR9acExQOgPtxT880NCEApcZxSjpSE/rQAjDI/Ws2/BCkitBmHrVO9G5W6mtIuzTLRyuoy4bFZzsSeprY1G23MeDWW1uyknofpXtUa8bFcjvchK5U5pSmOmeOnNS+SQD/ADxUiwknmtpYlItR7FRkLNgDrWjp9vyMrjFPgtMuMLmteytwvOPXrXm4jE32L5bFmwg2qOOa1IkAAz6fhVaEBRjNTbz/AJ9K87WTM3dFhcdMVKpAqmJf9rmniX3q0rGTRbDKKaXFVjIeeTTWc9qGg5SyZB60CQE96p789KdvI6VjIpIt+YB+NKZB61S8w/X3pPNPNIaiWzJximM49aqmVsex9qYZCallcpaMufpTfMz0qsWY9aMnoMfjUNgkWC+e9NMnPNREt3NAU+5pXY0ibePWjIpixmn7KVw0GsAfeqd1aRup4q+V9KQpkHj9Kd7CT1OG8QaGsiEhOorgtU0G4iuN0Yf1r26W2WXgqDVObRoJR8yfpVwqyg7plStJank2kS3Nt8r5wD3roYbtJAA+AT6V0134ajKnaq4+lY11okkOdoJ9sV7NDM1a00ebWwd2+USJYMc4zjHSnSTQKp+ZeOtYWppdW6nar57H/wCtXJ3+p6grFdrYGRXoQxVGp1OKWGkuh3/mpI+AwP8AWnyQ8HofeuD0PW7gzhZAxA/E11seohkHI59T1roUItXRzSoLqhyWZlcLnH4VqR6EzIH6/hVG01CNJBuII966zTtQglg428CmqdjCeFi1oc5Jpoi6pT7VESQbgBmtnUMSu22syW0fIYflipScWccsPKLNuJIvIDLgkiub1uTazfLxyMgd62bBwse1icVnawI2fjGc8muhK6OrD03e5wGr2D3cjDae54NYNz4aeKTOwgdcYr0+zs4mYMVzntVq60+FlAwOmOlXex6CjbU8/wBItGtkHByBzXXeHdRSGVY5G68D61LJpyBTsGCe2axrjSLr7SJIg6qD0GeaJ1Y01eRtTpuT0PVYkt7q13rgnAyM9feue1SxAc4O4djVTQ7m6tYlSRjjHerV5eGVsk/U1n7WFSN4nSoNPUzmQoen86dvKjG7FSNMjDkjPTqap3Eqg8GkpmnIyO5nPIGce1ZV/KSuO9X5WUqT3rKvsMdqkjPaoqVeWNzop0zj9fkd2ZVJ659sVkWvhq61CXcyPhvX/wCvXqOgeF0vZxLJGCMjP+Fd1Z+G7W3iACL+C189i8U29GdFkt0eU6J4LRI13xkH02109h4ftoiMxg/hXdrpsa8bf0qK5sFQEqOlZ4Sqvae8ZzldNI5xoBCu5EHPXjvTYLwxThnDfzrSnTjn8apvaiRhgYPTivpKc9Dktcj1TWRKuxVGDwR61WtZd+M5OT681ak0eUjeq570sekXaRb9gC+5zWnO+wrRRHPI7rjA9+Kyrm1eV/u9z2rbUKi4Oc+hp8aRkFiBScw5exyWsWjQWXlQw5d+pxnFHhHwxI0vnPFwOfu10ixx3N0quARkCu102zhit0VEHT0rwsxqte6mbU48quzKsbBo4wqxAY9qti0k4O2ttY1A6fpSrGTwB+leS9CnJ9jMjtmx05p6W7g55rUWD19Kc8QHTrU3C5mm2cnPOKkS1yRzVzClQM/40wFRIMMBSaZRCLTB/nUq2q4AJxUjsMD5ulAYf3xS0FqMW3QNzSeVED2pcDu9IqxZJDc/Wiwx+2Aeg/GlDQhunT2qMiPdknipAsTDJAFAgaSADIFM+2KONtOEcIPB5+lKwtwfmAzTFoQ/bCCcIfpQbxzz5dWIxDyeCKRzH/Ch4qkGj6EIuZiPuYpPNnIOAKl3Z/h47U4ORwFpXYaEKtO/GaPLud2C/BqUs6fdTJPtSu7AZbikIrywzHoxNO8qTyygbmpQ7lcqKg3XAfPPWncNWJ9mkU/fx+NOEK8hpOvfNJIk7jIY4+tRfZJTgFiDVJlfMsfZ492TJx6ClKW6/wAQNRfYJCeXOM8mpF01QMsxb3p+gnbuMlFuUOSuMUiNalcJgCpTp+eA3HpQmnoowFLZH5UrMV0t2Rq1oPmOMduKRrizxgLgfSrMdiqj51704WQPRBgmqSfYltX3KXn2ynKrkmpnu4FizsNS/YvYdfSnfYDgiVQR6ZxihKXYHKLKa30P8MXA46U1r85/dW+VHtWkthCE27Qfanm1SNQFUCq5ZW2EpxMpL67cHZCF9zmiS6vAoLAA9BitXyMgNwKBaq2SwBH1xT5ZWDnj2MxRdNHveQChWkLACTJ9QK1o4gpI/h9KeVgB4jHPXHShQbE6i7GQROhADsPenT27PhzIzkCtUrH/AAnj0NOESbcvxR7J7C9quxjCCUEFmxx0pfs7uoQl8fpWi62oJHXNBljWLbvC59+DR7Np6sftPIyhYz4IXjB/vZpVsGZGWUqSepHetWKSPoWHPfuKbHcWasysck+/Wjk8xuo9TNWxQMqsCPfFA0+JMukefQ5rQn1C1VsFSCPQZqEX8XIVCVOMYFJxS6jUp9iuLESAZVQAehHSpI7AE4CJkdeKvNIgCOh4PamPcDcT0PWnyJdSeeXQrvYBTgDb7AVIbRGtzGCGPUHoRTprtiu48HPNQf2iUxtUNkf3eDS924e+x8FowUrvL4PRhmnCzh3HCg/hUM95MwGyE8jjP+FJHcXYUmRMc8dKdoWC0y2IYyOARj07fhUixkNt+6Prx7Vnyz3JGV3E+4pjveMRulOAOx6UXigUZdWaTRkOQjDHX1oYeWu1wC3fHFZyJK5P791bsaYkNzv+a53j0J6U+Zb2HyXerFK/WjbwCBUv1xSHHGamxVyPGDx6UAd8fnUnHbmk47ClcQ3aeMUgXtT/AEPpQTkUwIyCaXHP86UnAppIxxSuUhc4pC3tgUwtxmms3JGTTHYlLUm7nrURfjJxRuwcVNwsSjkDHrT+vaog2TT1PYGhMTRKMAcfrSjt2qLfwe1BfiqFYlIA5puB6Y+tNL5oVsrg0DDHT6U0gU7dz0pGqQQ3jHtSE+lKQaY2c57UFC7uR1pwc4qLH1pyjjA59aaAfvzSBsn0puDnpTth/GmLYerZFKGPXvTQpxxzTwvIoE2BPvTC3HWpNvWl8rPWgVyEnNRSjcMVbMXPSgxdeKGykzHuLbeMAZqm2nZ5xz9K6Mx47UGIZ6ChVZI0U7HN/wBnHqF/SpEsMEEgYre8pf7tIY6TrSaK9ozKitCp6Zq1HHtFWfL9qVY2P4VCbkxOdyDaRx05pQpzVpYad5POD/8ArrZIycikFOOc04K3Bzmrnke9OWEccdKdxc5VRGPX86d5eewq2IwD/OnFBilJi5yl5XT607yuDVnaBS4GazdylIpmOkEdXNoxRsHbFQPmKXkk9qQw+1aAQUhQAUWDnuZ4i5pREOaulB1xSFfapaHzFXy+KeEGfSrG32pCp9KLBzEIAC0uABin7T0IppU/WkFxBx9aABnOaCtKo45oQCMmBk9KVVANO25GKUACjQVyMoOhAqGW1jlxkDn2q1jFORRgDNNBcwr3RLecEMgwetYl14PtpP8AlmM+oru8AdhTGUccc0xXPNpvBkSNuSPB9hWbqOiTW4O1Dx6dM16w6KccCqd1YRzAhlzW9LFVKezIlShJao8PuluIpOhI9a09O1Z4Fw2QTnr1r0O68LwyZwnXt2rB1LwiADsTjFexh80UnaaOSphF9kz7PXY2k/eNwTW3Ff28sY2sCenWuL1HSLq1ckZwORU+lRyj5WYgHFerCrCa0OSVGUd0dcilzlDTV05pnOSfpUVk4AwWB46elXTNIgO0/hXRT5bXY6dNIy9Qt2tHGAMA9PWmRySMoBIJHf1qS8d5m+c55pEIRDkDipnJdDqUbon0tRLMEYj866y10uFoV3KM1xOlTOdRATPU9ORXodg7eSAVIr5vMsQ3LkTOujDlVzl/Edg0Kl41IxXKC92uY5TtOe9eoX9t9oXBXORjpXJap4TeeQvGNp9q5KGMlT0OlKMlqYeY3HXBNQSoxOVYHH4YrTHhPUYyNrE47k1dg8NXuBvA9jXpxzKm9yPZpO9zk5Ym4A5JPHNXdE0aW5mDsDjPPFdlaeF1yDKM+oxWzaaUtsoCJiuLE45y0ibJqKsUtJ09LWJQAAcVeK8das/ZZOmKX7DJjrXne8zKU0VkQHrTLmNBGcmtCOxOOuKSbTWYEdfSmlJO6I5kcRe3cAuTFuAb0qEbPvKevStTXPCUkzmWIsGzngVjDTNUsziRGkAHXrmvaw2PXLaQnTT2ZZjvpoicYP4VYn1q6ktXg2Iue+BWZ8+TujYHnigycY2n8q9KONVtGT7BN6lcozEkvkk5zUqKVjJb0p8aSSviOMk4z0q2mh6hdYyCiE8/SuarjIRW5ryI5iye6n1wRwqTGDyew/zzXq+mpthTepziqWg+HbbT1DsoMh6nFbqLEpGSMV4Neo6suYJzilZEYIB4FBJzgCpwsZPXp7U9gmBis+Ux5ig7SBiMcVDcvMU+Q1p4jzgsKYwgH8a8VLiy1JdjHSO4bGc1KlpMT945rRMkAAO5etSC4th/Gv50lC/UHUfYoLZsv3ienrQbV+CCcVca8tscvk/Shr23jXLcVTghc0n0K6WpIG4mpBaDGcGmSapACcJTRq2B8kTH8KSjFbsPfeyLBt1VMYzxSCDdnI4qsNQmJJMdMbUptx3IcDpxTfKHLMurbAe9K1opOSBWa+oXZ5SPj6VA+pXxO3YaOaAck77m6lug4BAo8lMcHp7Vg+fqJ+YIwP0pyNqbj7wHaq54DdN9zc2RL0I/OnII8dVFYT2t6Tu3EMe3anQ2Vx1kmcZ7A0Kcb7Eun5m80cXHzikYQdNyg+9YL2kxlwHcDPc0+WwmwFWRm47npVe0j2EqdvtGwDAAVyPrSDyiQNwxmsyCwkRPnk59jU/kALhnI/z6VPOuwOnbqXlSBo8ggU0rCq+YxGAeTVLymQZEvFSRojoUYkg+9PnT6EuNtblmSVCuVxt7mhHXacEH0qgDbw5TcpBPTrinbVxu89Avbmnzaj5Ey4kmPvAD8af58IwNwJ9qqssYA+bIPrRtgQbl54oTYuVMsi7Qk5wyjt1pZrnYgKLx61niaAPkI49SRVmIwld5bPbB4xVqb2E4Ja2FW9Qn5W+bOOKT7W5l2cYz0zUDyQQsF8tzn+IDNPkKIA4iJbAqW5dx8qutBxupQ3MQx2qGe5uhKPLiBQ9/SlDMV8wqOOo/+vQLiSTP+jqFPejm8x8qWyHRzTknzUxgZGOtOMznDIrfQ1C7yk8KCg/u0pkOcfaNnsVpKXS4cvkSs00kRYZBzwaiiS7RmJlBHcYxTDFJ5hbzGOepBo8mbeSJpMEdKVykrFglyQd2DUcsUxGPMwvrniq8lshJZDKGHXac8+9SIk5AVidp4yTQpdBWQv2fCH5jn604QKmAWVgeoOMUC1cfelyo6A/403yfLfeN2Oh54otqCa7iC3iWTAyrEd2/lT2t2k+7Lxjg5p3lsQAqHGeeMYpWtizZ3Fcds0rX6BzeY3bEhCzMpPfPWhvI+8GUjqMLginyW6SOpdDn+93pPs6RDaqggnqDzVNabCUkRxyqzFM4PXAUjNLKyhxtQuT2PHNStEEGTwfQ96dFaBvnJ2+ozkGmosLpakTTxDgcNjoRmkhljcZQKR14HFTsiEFSinnqaWNY0+6yg91PGaHFkp6FfzN0mwjaB0wMCmSzzK/zW+9ehI61ddeAGwB70wugbbuGfrRytDUvIpl5NgKhlHYVBP8AanUKvB6j1rTcQ7Qdw59aaJoF6sh9jRyvuXz9kZai8YYVwpHB61ILa6xujIBPvV5rq1Gdygn2FIl9AvKZpKHmHO+xBu+tJk0AcUn86oQpbHGabuOfwpcCkI4JpAN3HNJuJyeacUPGATQIyOooKbIyxxSEtmpvLz/+qlMf41NgvYrnJpMEE9easGOkCE9qodyHBpdpqcIRRs59anlC5EV4707FSeXgetKsf4U7CbIsHvnNIOuanWLOTxmjy/50xXIPalHTNTiIelAj61IJojA9qAM81LsHcEUoXmqC5EFPegx5NWAB2FGACOKTFcriIjinJEce4qcDnmjFCC5GI6cIuT/WpMU4YqkhcxGIxj09KXYBUnb2pGHvQS2MCCnYGAaKBx6fhQFwwCe9KR60D/OaXI9KEUMIHamnrUhI9P0poFKw0xm3/wDWKaRyM1KB1GKQrUuIcxGBzyacq8U4AZp3Y46VSiDYgHHSn4pN3t1pCxzVpCHZ4pM4+lMBPfpRkk9c07oS1Hk85pCeKQZNLt4zUy2GNpM8+mKcVpjL6D9KzH1F3cUbwAe1RlSecHim7DnvU2Y7k/mAfSgyDFRbG9KXY/pSuPQkMg3Ub+enWmhD3GKNh/CgHYeGHFD4puw1IFzzVEkZINM3ECpvK5pwhBqbD5kVTkk0qKcZwauLCM9qXyVo9mw50UyDijParhhX1FJ5Ao9mw50U808H2qfyl/ClWNR1p8jE5og+Yjp0pPm/CrgRMn6UbUA6U/Zk85U2Me1SJE3pVkGMEdKXzY19BT9mgc2QCI45FNktFkzleMVM1wgGcU1rxM1SggvIx7/QYrhW+UZrm9S8MSohMI2kdCK7k3g5wOKhkuC/GwEVpCtKl8LHZyWp5cbDUre4wwIAPGc4FaCswjAYV2lzbrMOY+vtWfLo3mfdGOOnauqnmk18RSoxZyxTcx459KtQaZNdEqvGelbsWhBW3MCc1q2tuIRhVwadXM3NaF+yjEo6D4citsO4yfeukjt4UGPSqiSSHoMUhEpbrXA5qWrJdzQKxAc7abmAc8GqJjkYffINN8lxnLH86nnS6C5fMvs8HtkHimtLAvTH4VT+z5/iNH2dc8sTRz+Q1HzLP2iIdwKQXUXTioWhTBweKayRKBzU8w1FFs3Eee1J9pjAqrmI/wAQpv7sdcdaPaMXIi0byNSe9IdQUnpxVTbC3cUgMSH5sYo9o2Hs4ostqKY+5zxUcs8Mo5iB/CkH2cjdxT0eDdwB+VHM3uNJLoZV1HFIxHkDn2qsdNRjkQA/hXQYhUkkDHY0nmoW+VaPeWxaqW6GdaWPkgbYgOOeKuASqMKBmp3kyBhaQMeeMVNmDm3uivtmPfnNRlJd3JJq1HIN2CDTnOBwBSYuZlTEzcAkCkkjnI4ZquRkleVFKzyAD90cetHzBy8iitrKRkuTnsTSfYXZeHP51pBWcYC80LE+0rjBo5WyfaFGGy+UAsT9aGtUQ/Nj8aueVNnDAg1DNbSSNgMxocdAU/MjS3jx1GccGleCLGS6nj1oWybG3LfXNKdPXbyzAmlbyKv5iBLbaCzJ+dJ5lsMqGHHam/2f8+AM59al/s1T0jB9cClyt7IXMurKz3FuuMGle5t2IUqWDdKuR6ZGo5HPr1qY2ap0xk1XJLohe0gUBc2yDYFPXpileZTykOfwq+kMYU5VM9d1PZIwuVZDjqc1SpyI51czFubhjj7Of5VJG0mN5XB9KtO0eQQw/Oh5rQr/AK6MHoOafK2DkuiKjy3bklQqj86ULOyg556nA61M2pWUDbDJg4+uajbVrMLlHyM8jbRyPuNSfYR47pxwVUdvWkEV0MB5CD7Cmy61YqQDnr1Apw1ZJJCEjZvfrT5V3H7/AGH/AGeRwQzlvqah8l0YKA7A8g1Ot+gUkxEn6ULqCsc5ZWxzlaPd7iXMuhG1izZaTg/U0C2EakE/L3Jps+oPtOEJ29ADmnC+eQhlhfbjnjmi0b7guceltEUyq4z0+XikWFFJJiDY9KjF9LJ9xRuz1HemPNdKQVHln0PQmmrDtJl3apCpEm4kdx0pojYkZcIQcYNVmkuWjOzG7sarwSXjMVlYAjselEpJohRZoSW7McPMQPbipIrVVjCht+OvrWcBev8AIsi7QOO9OhS8DYe4yp4IU0JxHytrcvmJAMAnOe55pHVduC42+h9ao/Y5w5MdywDdARTFt2eJo5GdjnGen6U7pBa6tcvStEAAHwe+CKiaSEHiX5u65FUV05ljOGYnpt/w9KLew3PmVJCR6mlcpRSW5e+02St87kd+elBu7ESffBPXnmqraUN7ZL7W5wTkj8aj/seFfmDMT7jmjm8ieWD6luTV7FeRHnHGAOOKautWTLlYyPQYpo0+3cbZYiD2YYxTl02BD90HuDV+0fRAowW4HWIwfkhDZ9RjI+vampqWSWl+UH7uB+hqV7JNoAXJHtSCzTbkrmlzSatYXLDoRz6oCQFiLZ6c1J9sYRBgOf7uOaetqhUDyRj2/nTzZKCCuB2JxzS1HeBUTUpWcqYiMdiKa+pSZBSIt16VcS1IJGc+nFC2aI3C+9Hv9AvApPdXc75jTYMetPja/VSdoYjkc1f8hOGUY9aVFVTjJNNc3UXNHoUN15MpbeqHHII60JFdKQTMSMc4rQaNScilCcdKLSuLnRmsZBLt8wt+HNH2SZ8OZ2HoK0vJTP3RTRG0fC8ihxfUftF0KEQuDJs3PjPSm3FiGcsHcE+9aW0nHAz9KEhYknr60KLDn1ujPji2IUZmb6mmLbkvkDitcW4PzNTRFGDkkZpcjD2nYzxAM4PH1pTbKB8oyO1XnRM5HNOwMDjimqWovaGeemcUY5p4AwcEcU7b0p2GM289KcFGKfgYxilAxwKLBcj29qXaB2xT8CjnP1oSFcaE5zS7BinduKXNOwNkewHPHWl2+1SAZpdvFFhXIStG01KRQBz7Uh3I9tLt5p46AYpdtArjAvXIox7U7HbNGOKAuNABowMUoHfFKRx0pBsRHPejHPWpCuaTZ7daLFdBgPbigfhipAnFHl00hXG80c1IEFKFUDFO1hXIx+FOHXsadgetKMD6+9FgGc4x0oAJGaeMY4pwxkYFVYQwLjNBXHan+vNL2pWFciZT+FNINTcGmnFFirkW00oBzz0qTj8KTiqsFw2nNLikLYoLDAIpWQgC856UbeD0oL9jTd9MaHbehoKj0phdgKaZTmkgsSFetLtHIz0qIyMQR70oZqdwSJQAOc0cY61Gd305pCCR6VDY0S5GetISvrUBDZpGDg9am4cpMdgA6DFG5Paq+GPenbTwOaVx2JhIoppkWozGeTmmmPr2NTew7E3mrmmmUVEUxg+9IAOnTmk2Uokxlz07U7zh3/KoCB2pP50uYOVExuOaQ3LDoKhOATTlwRyT+dHMw5USi5bnr1pVnY1CduelIzEdAaOZj5UWjM5FN81icZNVw7EjrUibj2NCkyHGxIZCaZ5hB601lk6gGkEMhHGad2OyJllOeTS7yR1pi28gODTxbyYqlzCaiGSeppNue9SLbuepp4tmz1470csmLmSK2wHqSRSsiAdKsi24zn/69Bt1zyaXJIfOioQg7CnAoB93mrf2VMZzQII+nFCgxc6Khdey9KaJOfuVoeREooWKHnJFNU2P2qKIbOODSMWzwprR8uIdMUbYuhIpumw9qrlFN2OlKN2ehqyzwJnJAqFriHIwQaXJYOa/QYSw7VE/nEn9eKnNxBjqD+NM+1wAHIGaLDTl2Its5xgGmPDOx4Y1cW7ix2qA6gquQE3e1S0u5ScuxH9muGXkml+wSnClzTzquxceUR71HJq5b7kVHLDqw99j101lOTzUv2DI5/nUEeqSbsGPj3qZ9Rk2jamc96f7sT9oJ9gxypNH2MH745qBr245JAFNa6uz8wwRU3gPln1LiWqKMACpBaqGHIrMS4uZMsJCPbFOD3eeZSaE4JC5JdzWS1VuuDR9mRDnKjmsgvfE4ErBaDDO33p3yfQ1XPDsHs5dWazpAMbnXPbmmhrdeWdePeslrOTr5jv7ZpYtPaQ8lh7mkqivsDpruaksloSD5ij8aZJc2kfV1P0qmmnIBg5NKdPjDgsGx9ablpohcse5cXULJASSM03+0YCM7uPpTPskQGQg/GmiGPkbATS532BRi0K2sW6ZIVj+FRjWUcZETjnuKPKw2Aq4zzxU0dsWUjA5HHFHtJjcYLoQy6qwkASDMZ7nvSHUpiG222OPWrH2cjgqAPYVE9rEX4DFx0x0ocpsm0CGLUZhGzPAQaX+0pCB+5Oc9Kti1cxhdmB3zTYrILwTgUrTKvBld7u7Bx5SfX0ofULwJsRU3mraW6A52gjoCTSPbhzkYOPamvaLZiThsZ8lzqSLmUZ78DpUUb6hKxYyOFPStlLfkF2yuO/SnNCqP1yp/Shqb6h7SC6GCINRyT5jbe3OKb9hvGc5nYf8C5NdBsTAAG7PSkWNSQzAdPrijkfcr2vkYT2aKuJXlc9DiphpkDAMxfPbPetgRqNz78r9KGDHjcSo7EUuTuS63YyoNOSIOwi8wHJwy5/KpI7RJCZfs4TjjitLyFK4LZPUZ5FPSGU5zngfhVKl2JdYzEsY3bb5f3eoqZbPB+VUGDzg4P8A9etH7Oir1C5GOvSkESSABm79Tx+ta/V2kZ+3bKf2YOhKuit2B6CiKIBgDsLfTir5gCkjke56gU1kTaEXkg8Zp+xa6C9qym8EWC6rg+mOTQsKgYBUZ54Oc1aMbCP5v4e3pTPKIOQSM9c9qn2fWw1PzKpRQxCqMjqF9PWlltkJBd+MZGKmBVWHIb3xml/d7slixB6dsU+QfMRBEXHyjHbtSmBWO5VQ++OhqR5YjlmHToM4zSRTRCRgeCew4p8q2Yry3RE0L715AXPBGOtOeBUXPBz1Ap0l5GRgshA6fWmjULVW+faT3560ciuF5tbAIAqc7dnXBPFPWBCTk49M1G2pw7AScY7jrUX9p2+NzZyPbiqcY33F776E5iQcYLNTtrEBvLPH6VXfV4VTKLv/AAqL+2gxGFZc+1O0Fuw5aj1sXVh3nlXH0NTPCNnCsD0JxWU+szoMeWGOeoHNOGruV5jYHvTTprqDp1DQNtleM59CKI7U4z0A9DWauqTSHG1sVKdRkC7VVs96nmp7jdOoXPs+GB649TTygJAAFZovJv4uDnuab9vn7qOe9CnAPZzZotHg7cdaTBzhu3vWU2oTBsFc9s0G6nZg+8Y9MUnOBXspGqF28gjHvSbo85LCs37bvwrNtP1ph3ZLb8r60nUXQPZPqarywZB34PfNNaa3LDBUVkIA7YZ806WBBghiT9aTq+QeyXVmoZYVGd2fpVaXULVW2lsn1qqqIw2buo9aZ9mgBy5yaTqt9C1TRcbVLfHBzUH9rJn7hx+VRpHb5GOlK4gzhkz+FHO2CpxXQcdXH3UQ49aU6w4UfuyOKh2RnBWOo2C7ipQZFHtZIpU4PoSPq0+fuHFMbUZT821gKVljI6cUYVV5XI+lQ6knuVyx7DX1KYN8qmmvqF4yg7QPwqURqwyqim9BggU1NoLR7GhjvTwuMU4AAYpTgVoYXG4pNtSjHem59KkVxgXjNLtp4pR1podyPZxT9vNA6Uce9VYm4Ac5pwXijPpSjGKYXEK80u3g0FqTd7igNQAHekb9KQuO9M8wVLGkPOMc8+lFRb6QtmpGS57UEiot3NG7JzQFiQmkzzUZJBzSjd6U7gTA5FFRLuxikJNNSFyk+R60wuAKiy2fxqMhiOo6mm3caROZOab5o6ZqHaSBSqh4yKgonD+hp+/gc1EiEDgZp201QrDtw9KQyU3HFJtPWhsY9nNN39uaTaeBS7D6UlcTE3HtSgn1oCmneWarUWg3nvQCeKlWP6UeXx160WDmREOlKBnrUu3BpyqMZNHKJyI9g20gTJPNTgDuKXC+tXyi5mQiIAZApypzyKnXb7ZpfkzzQohdkJj9qTZjnFTl055qNpUHelKKsCbIyuT0puwnkDNOadBxkUguUBxWdlfUeoCI4zj60vkkdhSNdqF7c1G17npRZBaRL5ZoMGTUAumPHNONySMgVL5WP3h/kZwab9n9TTPtD+maa1xIeADSaiNcw8269M0C3UHk1XMs55pokuN2Oah8paUrbl7yYwKaY4xVQ+eT1bmnCOUgZNPR7Cs+rLO1KNsWOaiEL5604QORnJpfIGxcxr2GakSWEdcVELVmHWgWR3etNX6IWnVk4nhA7UhvIgeOvvUZtOBkGlW2A7Vd2ugrLuPN6i87c0xtQU9FNPFvuHSkW1xxtoUpdEFo9SL7e38K037fMTjafzqwbU5Hy04WmRk/hxSTmO8CobmdhxgVG0lyxzk1ofZsLyBSCP2qXzDUolRJJujE04NKOQxqyY/mOBThH7c0Wl3FzR6FUSyHjke9IHlBPJq8LfJBxSiEDjH401CbDniUm85vuk01Y5mbGTWjsCjAppX5yBV+zYlUM97YPnLEH61H9m28AFq0iu3NIAewqHC41UKS2ak9Mf1oe1UDFaARiTgdKd5Y2nPWn7JtB7Vpmd9mXjFOFsOuzpWlHbjjkGnSRYG08Zpqgxe26Iyja7hwKclsoP3Oa0TGoXAIpnAb73FS6NtAVVszzAC20DGDSi32ZIGKtyeVuHQUMyEZpezSK9oyu1ujrlu1KEQnAQYHtUnmAfL8p/HrTk8s5BdeaXIgcmRiIMMAYxT/ACAP4RkUrSRJx5gBNQyXCo2Czc8VXLFILtkqxqCcAZp0aKWwVGc4zVd7yFDuU7qZ/aiIu0Dn1oXKtxOMmXPLO/gEfhTsBiVzjHrWcdYkVyuzt2ph1nnGxyTxwtPnph7Op1NcIiLkAk9qURu/VT+VZMOsyZ2LasW7ErinSavdldojCvn14q1KnbVidOouhpCI7WBUjmkEOxSFTdk+vSseXUdRUFsLzTIr6+Gd74PYA1LnSTG6Mu6N4K6gfKox60FZHBACr6AVhLPd5Mssm7P8JJ4qc3rlMI+Dj7x7UKrAPYvyNXYUOGcAketPiURfMXQetc/9plD580uB75AqT7XtYbSJCexfpS9rC+wexk9Ezabe7Ekkg9ADxUeSuFO0k9QP61hx3c0jsiyYHOfSpllKMdzlvYnkUOtG4fV5I02ZQcNIAM+vSjcMkmYBR2FZs0kSKGk3JjnHeo/PtwSC5VCMnPIP5VPtE+hXsnY0XubczBVl3ZHrnND3NsjBCTj68VkGe0WQi2XG4cilbUrZS8UkPmcdNufyxSc9SvZeTNU3tqqnYcjtUf8AaETxFgNhzkgiskXgjYgW2xG6EjFKlxNNwtpnHeh1GN0kag1KAjbGwO7kjGKjm1MpsWOPkHBPY/hWaJ542LfY03dz1zVqF5XUOAinGCCnQ+lCqN6XE6cVrYsf2hORtFqQSeCDgVNLe3IXJXHGOvSqM1zdbwohC9jnpSyCSaIkFVJ+971SnK25HLHqi2t1NJgABfl69v8ACq/2m680eWgyvq/FRxebENobdnqfWlndUBBfAx60ueT6lKEUywLu7xsIwP5UySS/ZRiWMYPOO/1FRoqRqHEwbPTnNRSmJvvycZ7cU+eTWrDlj0RbW6uTEHkcbRwSORSPcvt27wMd89aqRNEAULH6E0zEQfBkyue1Tzy6sfJHsWWzIh3T7HB4zzRIwKqGlw361WK2byZ80k+melRzywK4B+bHpT1HYu+bHt2sxJB5z1qO7kjkUKXfd7elQGSOSL5QeO3c02KdSceWTjgA0XsCiPQRrmP5mGeCaPs6NhuT7Zxik82TJzCQtSx3DjhU/Sp16j1AQxuBxk/SiRRGfuED3pFlnRwyxcZ9KWaaWU/MnP0puwtRBuIyEAz6U3bLncqAk/nSbpuoXAp3myKoKruxQmOxG0Uxfnj04qRkk4yRTftDyHJUril+crnORTbFZhh4zuUjNSxSNjcWGeuKiAzz3pkm9vu8e9SrBa+4XBcv8rYzSReaG+ZqQLIMcbqk8uU9EP4VQ9Bs0cp5WQEdaRA4wHapBBc4LEnFKLOVsHn60BfuxjQKOd3NWItvlbWbg0z7HO3BJxSx6fL3Yk/WgTa7j0EaZOec96UmJsc5NH9nsSMn8Kki0/DdTjuKdmybx6siQIOMAU5hEwwf5VY+xcY5+lP+xKMDJpqDJc13M5gsTfLkilGGXABz2rSFioOcZp62qjjGDT5JC9ojNjQj1prJlslc8Vri1BIp5tkH8Io9lMXtkYqxsTyKe8LEAcmtb7MvUDmkMahsHFP2D6i9unsZUcT8gKacbdieeDWp5a4pQFA7GmqNg9qVCwxSbxz9Kjw3XPSkwaLjsS7+T9KTeOtM2nJoCeuaYNEhfgUokx1pgQdKcqDNBOgu/juaNxz1pQtAUCjUNEJuPtQXpdo9aXAHbNFmPQj3E+9HzZ4p2B+lIOpo1BDGDHjNKqEn60/gdqcDz2qQvYjEfvThGMfyp+8DNJvFOwXEEYpdmDilVhmlLA1VibjdgPelVKQsMYoD9u9Gg2OKjH1pCoJNM30hZvSloA8IvFO2L6frUYZh2pQzelUFmSBAOeKdsWogzUfP70roVmPwoprEU3a+O9NaKSl0KFZl9aQuCc4pvkNznJNKID3poBd470vmDpSiHBH+eakW3HpTSYm0RGQZ60hnA7VObcZ5HFJ9lGenah3TC6IftHHSmmds8AmrItRjpThbADpzTtJheKKTSvnjrSeZKemTV8W49KctuP7tPlkJzRQV5D2NSL5nuPxq75CgdKcsS56U+WQudFFfMx3xTtrY71e8pcdOaXyhxwKfIw50Z/luc80hhY+laIjXODikKqOuKTpsftDMa3bPJoFrz3rU/dYzxTcxjrio9iHtvIz/ALLxjFPW0A7VdaSEDORmoZLyFOcih011BTk9iMWo7DrSi24ph1KIcU19SUcA96XLFD95kwthkHApwthj0qsmognkH8qnF/FjvSUYdQfOPFqvani1XPT61C2oRL3pDqsWOP5VahT6kv2nYs/ZV55qPydrDFUptYHO1W/KoDqsjfwcd6mXItilCozVKLTkVQuKynv5SMhetNF/MQcLg1PtIofspNG4NoHAGKbld3bGKxheXDHGAKjluJiwG7nNP20SfYs38x45I/Okby/UVip5pX/WU0GUEHzT7Ue2j2D2LXU3VKdOKR2TGRgViCdgPvGkaY4yXPsM1SrxtoCovubQljAByKb9pizyR19axCwcZ3k/jTVaI8M/NR7byL9h5m1Je22Nu7tUf2+BOeDWTiIAnDMKUNEwwEIx61LrvsNUUaX2+AksAOKQahFu5UZ+lU0aNQcRHn0FRPNtOFh596n2jepXsltY031IgjZFmkN7Iw4QCsyaecRgpBke3Wo1muShPl7AelDrS6sboxXQ0DeXG/PFNN7KvzHlqobroY+UEe1O/wBJzzCCD3qfaSfUr2a7Fl7y7YbhGMVAtzfMeMfSniGV+GOB7U6OOVflUik6kr7jUYroOgmvgOZF96cZ7zkiUZpBHIPv0BGA3HpSUpdxWQ9JLlHBaUnmpJ5p3XIds+wqGVJGHfHtSNgx7TKVP1p872J5YvUkhkuSm0N0HU96awnJy0m3FRAxIoQzck8ZOKV1gIyZ1IB7NQ5StuVyoW4A+8xwPUU1ZBIv7tyfxpVFvCgEr8H+8aTzoCCEGEXv2qR2GzANHtkYgD0pUiwu5HOccEnNBuLcR7i6sPzpyXKLyJEI9KWrHqhgjIAaVwW9qfMrCMLvLfWo5L61GNxGScDbTnuYhGGXLd84osNtiFlijywAb6VG0zKCRb9e4p5lhnXc8MmB2HP5UqXkbDZ9nKp3BH9KNUHyIY33MP3ZA7gjrUhkkwVWFPY9xTnvEQ4WLHHBzUD30kpCxAIwz360Ds30FDXgfcHUZPBbmoSt3LJv8tHx1ycVKZ7xlJjRd3ckU3dehxgRxHGCCODSTQ9uwkg1CSTyjsTA+mad9mus8y7QfXsajMF6ZC5uSo6fdzmnPb3DLkuR344odmF2TrY3BjPnXxZSOw/rSPp0APMznPIw/Wq6294+WR3x6k09dPduWdyPrgfhRdE6rqTJb2sXBnKswwQGyTTIxAZAUCOBz1/WoxYv5hEcRdR3JzUn9nNndjax6YNLfoP5kkkunfeaYCQckLT4Z7GQgLOpOMjd8pFQLpqs4Lphu+D1qcWEEJIWEOT69RVr0E+XuJJLA4Kbd/rnkf8A16YDbk4RcMRg5XpVkQBFAWNcdgRS/ZdwLquHx0pNMm8bEMcUEQ3MCc/nTd9vGwbyi2eeBnNWTA5Zd4BA9qSSFRkqP/rUKInJX1IHu4uAYz8vT5elQNdlWGxCWPPA/rV2aAOAxXH+0D0pkcBViM8fyp69A90ri4eSM74wvvinSXTIgaNc5xnPpVhYUDZLfhmpSsOQSF/Omk9+oXiuhVkkn8vKqD7Yqozzs3yxnBrV/d7cIRnoMHpSKIUGWYHHUU3zCUkuhk+VcyEASiNu/wBKb9huC4DynI4rUaS3EuduD1BxT/MTAITPpRyvqyvaPsZzWDKhHmE/SoxYqsm5y5PqDWo5ZvupimEXIYLsBH0pNIXtGUTpvmtkSMAfepTYxoQMnpjINWfIuM5ViPbFBt7lupOPpTtZBz+ZCdNhKgk80qWEIcbyGBqWSwmyDvNWILBzkPISPTFNRbeiJdXzK620IbKYIHapCkAfIUA/lVhNP54Jp5slB5zWnJK2xnKou5Wd4FQkgZ+lQq8TDhSK01tIucjmpVtokGdo+lUqcmR7WKMrk4XZ+NPSF8fdJrT2xjGFFLvA4IAq1RfVi9s+iMvyGJ4XApv2R88Dj3rSdlU5OBml8xOtL2K6saqytsZZsSwyQPrT47Ek4OMVomRc8AULIgPWj2K7g6symbBVxx71IlhHjmp5J1AqP7SueGGKt04JkqU2NWzjTsKl8mMYIUVE1yB1IpDdp03U0qYPnZOscZ7dOlJJCoOarm6Cng9sUG6z/wDrp81MnlmWlRDwQPyo8tR0xzWe10wPGc0wXUr464pc8EV7OT6moypg9Bn0pFZFPGKzGlnYcA00NNv75qfaR6D9k+5qNMijtTPPTjkcVm7J29akS2l7k0e110Q/ZLuXhcL7Ux7lPaqjWr9iadHZtjJY0e1l2Dkit2WFvFFI14pOcnNRCx9zS/ZMHIo9pMTjTHfawMDqKie5O4HtUi2wHUU4Wyd+c0NzegvdRAtwWHel89vSrIt0A4HFIYkA6VNplc0ehX9cYFJg07aacEPWlYq4zH50v86cEbJpfKbGaqzC4wnkUE9af5THrR5JoExu4elG8elO8o9xR5J7HrzRqLQj3ZoyTxx+VTJACeuKeIlx1p8jFzFXmhQe9XPKGKNijPf60crDnKmG6UuCasFVHpTTtqeUfNdEQjY9aPKJqdWXP4Uu5c56iiyC7IPLI+lOEZNSblz7UqSKOtNRQXYxYGOO1KLc55HFWVZD1pWkX2/KtPZqxnzSKwtutL5Hr0qXzl6dR3pryr7UuSK1HzMaIR1p6wjoR3qMTAd6PtAB60LlTH7xL5IH1p3krntVc3Q45qNrrHGRTvFC5ZFwIgHNLtT2rNe9560w3bH6Uc8R+zkaDsoPUVEzr1qi0zn/APXRvYg5PNZSlcpU7F7zlyaPtKCs8KxI5waaEYnBo5yvZo0/PXI5qQTJydwNZhjIWnK2AR/WrVUTp9jU89BkCkMykVlPKQ3XFIJmI6nNV7UXsjV80DnNO89SOoFZJlboCfxpWZgDzR7cPY9zSedcZBqMXIHeqBd8YPWoWZ8+mal1bsqNJGm95jg4/OojeHseKzTuNKM4APFJzZapRLj3j5wDxUZvHI6kVBsyDlh+dMkiJHBpc0ilCJZFzLzlqUysRndVeGPPylgKc0G1uTSbbHypDnYkZLE0xtpGCc/1p4jXFKIkPbFYNu4tENREOCfypdiA8D9aeCiNz0pWdeoFA7jiihQSOKjZlGeBTvPGMYpnmofvJSugRHKcplRmoo2YdQcCp2k6ALxTN7A48sn8KktELnLcKSfpSBpM4CcVMgff8q0yT7QH+51pNlaAHlHGOKekch54puyfPPIpUV5BsDbcULUluxJ5LnkOKkSE4yWFVJIrlGzvJHqKnS3lePOWzj0qtCfmTrCM5D/rThCnVnqpDZTN1kYH+dPSwk3ZaQg+nNNCtbqSlbbdywpkhtl+6c+/pUyWSY2sM59af9kVUwVGKYuZJ7lHzrdTxg9selOmmtAMsv4irb2Nu+WKjd9aEtoxw0Yx61I+eLKUV3bqv7sEn0xTzdRbNxjYZ9qum0ibHlxBT6inCBRlZFBOPanysXtIleC4Xy9wXHtRLNHjLLg1ZS2hyTgBuxpBEhbDNRyyQlKLKrTDGVGeOMD+dC5dDhRx2xV0RQj5QQ2O4FLGY1JBwPrxRyMXMuiKQLRgFYzTpNzJuGVJ74qckO4VAcZ55qdliGIy+T/FihRbYcy3ZT+dYugc4pkXm43FCrdhVxVjVsZzk+lStGhXCknPJJNHIw50Zzvckj5AF9ajxKzFEJx34rTAjAIGHx6DNJFgMflI9Mf4/wBKfs2+o1URkvaXDj/WyDPbPSmpp7hCJXZvxrbIjHXkHt0x7+1RkJu+UNj+dJ033KVV30Rlf2WgQOBuA/h54oXTiHyItueMg9a2gAYyQpH6VEvy/eyCOgz0o9n2YlWdjPGn7owCSSOiij7A33hCGPZQcVpSc88jHoOTSQlpHBkiwOhPrQ4ISqS6GdHaAgiRe/TFDWKocpFye+cVeKDzDiNzk9c4qVkGMZwR2JOBS9ldjdVlD7KzKJHt4B2/GhI+Np2HBPIWroCKFjdsr1yDSSrH8wUpj045FV7PTQXtGUltnALeYHXsP89Kb9nLA+agXoQCetXt1so2uwB9zj9aRliwAJCzEZX6f1qfZ3H7VleG0jV8BQ2f4ieaetvb+YwZAWHTHUfSpovKKkMvXjOOlKFhjy2OccHrVezRLmyNreNWXDd+KS4t4mHB4PGQamRlbGASBzgCmo8hYqqjaeo7GhqIuZjILbAA3ZOOQfWpzCisqjBGeVppScjhdvGOOaFtp2kyXAFVZLoJyvrcVY4YhgtgdRSBFUblIB/nSvaSFskkinfZiCNpI/pT5W/sk83mMRl5dfx4pNylipc7cZNTi3GMcHPNH2WMNuJ/OnyStoHPHqVwVTlPnX1HagSIxyB9RVpLdUyQcqRUccCBjt/LrScJIakmQtLtP3f8aiMzqDheD3HWrzxIG5wT2pBEm0nBxT5JdwU49TPmeYhSikmkhjuGX5wK1NsRHAHTtSKyY6jIpew7sXttLJGT9luuofC98U8Wr5A3YNaRdehYYoUwq3zEGn7BdyvavsUPsJY9Tn3pwsycKw6VdkuYgOCMDvUX2yJlOG6UOlFaNiU5taEYsVUgjinfZYwclfxpkl6m7kkioze88KTStTQfvC0LeLOdo609YEDYA4ql9ubI+Qn6083km7AQ4NWpU0S4zvqWRCoJA9al8qPGSOaovM5wV64pjPcbcjNNVIJ7C5G+pojyhgBRxTt8YXHHNZKtcM2OlO8uYAgn8qv2y7A6Xdl/zEJ4xTRcRr3qmkEv8TcUrWrFxycfnS9q+iDkXVlhrtVfOR+dNmvBt3ZFRfYx9aBbA8fzqfaTBRghRer680j3pUe1AtFVs45qRrZSOeeKXNUK9wqtfMTwKd9odhkj8KnWBBxs/OnmEAcChc7Y249EUGllPOD+FKGuGxhavCMZPFPMWOcc0uST1uL2kVpYqJ5xyOc00xS7uGJq+qEnmnBeMHFUqbJdRFFraV1+8R9KjSzYHLMa0jnfQcEZqnTD2jRRNrxSC0AbJq5wAO5pGYdj+dT7KIc8iuLZSDnr2pRbge9SAg08bemcU1TQOTIDDHnoDT1iUDIUVISgORRvSq5F1J5mwjCgcilkRM5AFRO69Sc+xqNrhR3yaq6SsCi3sWFUegzijPt0qo12v+RTftQ45qeaKK9m7ltm/wDrUgkwOn5VSa6z3pn2jPSpdTsNU2aYkzihnAFZv2jHrQZ2PSj2oOmXmcY603zVHeqRdye/40h3k85pe0D2ZeFwKja4BPWqpR8cZ/OkEMhGTkfjS9oylBGmAo7e9PG3jn3rOW5LUNcEHHatOdE8jNDcvtR5i4PTOay3ncHPP5UzzpD0Bo9qgdM1GlWmGQZ61SDSHFNdnBPJqXUKVMv+YMdaaZR7VR81gvUU0sSeuKXMPkL/AJ+Oc8d6Dcjb16Vn5Jzznmk5B9QetLnYuRGh9pHTNJ9o571QUEnPapVAwcgUKY3BFppuOvWommJpnUfzNIOtJyYcqSHece3SjzW7800gdhSAgfWlcqy2H+aSMVG0zhuDSscj0qJs9DRzAoonW7I+Xt6077UW71UMZPrSopHb/wCvQqj2DkRM07Z4NIZnPQ1CynPFC5xjBocmOyJPMJyN1JliM8k0FD6c/SnIrEDAyPpU6hZEZZunNHzN61MYmJHFSJC/IA4+lUgbRWCE9qkjiIxkGpfJcfWpPLfpigm5DtABphYYIzipmgkLcfyprWrNzg5pDTI94B4NMaYAkZNWPsLH1prWJ5zmlqO8Rv2lClMEik5FTrY4wBUyWQGOKpXE5RRS3AjoaBj+7V/7Kg5wKk8hAB0q+Vic0ZoJzwtCyNkDBHpxWgsaA9qcqxZ6Cl7Ni5yg28jhetMMczH7uK1o0jYDpUuyMcGqVJi9pZmJ9mmA64+tDWkjKOenpWw+wDJxSAxYySMfWj2bH7RmTHaSDgk8e1PFsRWkZIFydwqJ7mBT1HX0ocLB7R9ioLQ7shsU42+cknJqc3cIHBH1xTFvoeRk/lRyhzSES2Zlxt6d6mFmw+8Bio01CLGM4py3/JUZxT5IpakvnAWKMTxSm1XnIqJ79kkxsz70j6gSCFXt1rNqBSUyVrHuMYpYrJGPzDJqBb+UdYwae9/IOwH0qeWG4WqEz2iD7qjFO8heOFzVB7+RuQCfpSwzzsCVz9DR7i0Hadi20Khs4564pDErJ1w2elVWluN3zKW9hTHa7JwsRA9aluNx8rLyW5Hy7fxqMxxAkHYpz61WUXrPguyD6VDLp08jkGZsn15FJuK2Gk+rNIG2TG91x3pJry2iX5SpB96zotMkRCGkJ54FPTSPnydw9utPm7IXLHrIlF/AE/dnJ5zTxqNmgzKxz14oi0dQwO7OB0Iqc6bayMGkT5161Uea+wm4dyrJrFuQAi5yKRdWhK+WyP8ATFXl0+3HCqoA6U5bOHaGIHHc1py1G9iOamtjKXU13nbbv9cVK+oTyACO0+uRWn5EDYIwRSmOFc8j6d//AK9TyzG6kX0Mtby6AwLfd7A4NPNxdNjMIQjnDGrbGPAwUJ9etIzxoFcEc/jUtT1TZV49EVJmvdxKBQOuDSpFcuPmlxn0qz9qhYkHBx02j/OKd9rt1ViFPHVduKXLf7QuZrZEawyIPlHGc56808wyE8Jz3zSf2kh5VG6dD3pG1O6kf91BgDuT1/wqrU1pzBao3sTG2kODJxTxDsQlMFuhGKoPe3j8eSN3YA9PrTSdUZzyFUjkYzUuVNPRjcJdS+8RGM7Dn06fhRJHCAu+Xv6cGstbG/kf5rk4zkYXGfbrUh0+4dtskjhR3HBo5k+guVWs5GghhBH71PqODSGe33/NKoHUNnr/AI1nppMqAlZZNpPdqfHo8RcNlic9ycZqlJ9Ig4wWvMTz31hbkbpVJJ6jmlXU7Jj8u4ep28Gmrp0GCHVTj1FIthETkICF9eooc5/yiSp73Em1KDacKTzwQOKg/tKQnK25UgcE1fhs4iu0ADI5/wA96nFpCB8xLe2elHLVkPmpx6GSt7dyFlEIVh6joPWhpdQcYRQoPVsVsLDFGcqoBXjr0pwERXII68j/AOtT9jN7sXtY/wApjyxX8oXfclFHQpwT9aQ2MruXNw5J9OK15Xh4LYH44qNmUJkFQPaj2LvqxKq+iKIsyyDDuD6nNSQWCHh5MHOcZqys0YUgHAqNZU+8SPbHep9nBD556gLCBSWYYx74FSLa24G7GCfzzULTxnJLZ9B60n2uFSMHp0ppQXQT55InVFxhsfWnpEmw5APv6VVa9w4Gw4Peopb6QE+VGT68VV4IShNl0bVbp07YpyupYYHP0rJe5uZAAiYOcn3FKTc88EVLqRRfs21qa5kGcE80wy7WJzx7VkBbtvvMR9RTpLS4IH7xsH2pOv2QexS6mubhQmQw461G06ZDNJ+RrO+ySjADNmj+znwDu5qlWfYXsody9PdW8Y3eYB6jNV5L6HaCSTiohpqbgW5qY2UYwu3jtmk6kn0BRprqKL+PYOCfpTXvox8wTH1p8FmgGDipGtI9wGKOaoxe4mVZb5tgYJg0xL6VkPyc+1aP2aMDGBihbVAcgfhihqp3Dnp22Mhp7sngcGnE3LHhuTWuYIwdxApBGobIWpdOfVle1j0RliG6YH56Fs52bmQ4rUIXBAApchB29qfsddWHtX0KC2B+6xJpw01FORmrRk5zkYoMwNNU49SOebIhaRgYIyfpS+Sik/KKl8wEihmG3OeavkiJykMWFSOFoSLBxt4NPikWnM6L1PSjkT1FzPYDECM4pNvQYpRcJg1EbpQ3SraiJcxL5QznApwTrxUEl0o6VGt4eufrxT9xByyZb2EGkZT14Aqq94euCKT7Vngc/hSc4goSLmRjtTcj2zVB7g5zzx7UeexHAJ/Cl7SJXs2i8cHk0hZQMEiqBllzwpprCZhwrE/Sh1IhyPqXS6BuopRKmcf1rO2XBPcfhSrFNnHNQqnkV7NLqaXnJyaa13GBg9aoiCUjqfxpxsnI5z17Vaqy2SF7OPVlh75BnFRm+yeTUX2FuvNC2mDyDUupPsPlgSm77k9Kb9ryTQ1ocZNAtRnkc0c07haCI3uT26mozcMeoz71cW1HAxz/ADqQWyA9OKXLJhzxiZ6TydgacZZCBgHNaIt1A6fpS+Qo5xT9nMHUj2M8GY9jSZl9CBWoI0HOKCiY6CqVJ9yfarsZvlysOQaQ2shGMkVpgKpp3yk44FNUbrVi9qzJ+xMOTTvsfFaeV2+tNJX6UOig9qzOFmueelOS0HpkVeJWm7h24pexS1H7RlYWg7Cnx2qjtUzSLxQJF6g/hVKmkS5yGi3XHvTxEmOlNaYfjTTPwKdooV5DjGg7UjYx2qJ5smoml96lyiilF3P/2Q==', FALSE),
-('data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDAAMCAgICAgMCAgIDAwMDBAYEBAQEBAgGBgUGCQgKCgkICQkKDA8MCgsOCwkJDRENDg8QEBEQCgwSExIQEw8QEBD/2wBDAQMDAwQDBAgEBAgQCwkLEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBD/wAARCAHCAlgDAREAAhEBAxEB/8QAHQAAAQQDAQEAAAAAAAAAAAAAAgEDBAUABgcICf/EAEgQAAECBAQEAwYEBAQFAwIHAAECAwAEBREGEiExB0FRYRMicRQyQoGRoQgjsfAVUsHRFjNi4SRDcoLxFzRTJWMJGCZUhLLS/8QAGwEBAAMBAQEBAAAAAAAAAAAAAAECAwQFBgf/xAApEQEAAgICAwACAwEAAgMBAAAAAQIDEQQSEyExBSIUMkEjQlEzQ2Jh/9oADAMBAAIRAxEAPwD6K8R+I7WD2k02moS/U3xmAVqlhPJShzJ5D5nvNaMrZHDqpiTEFceU7WKzNTOcnyqcOQeiR5QPQRrMxVWLbalibFVMwvJ+JMed1dwhu+55X7R5vIv5kY8U5bbcVr2JZyrTT05Oulxw7J/lTfQCOfHHjfRYcfWumqTNQHmVluT8N9YrezqrVQzdUT4hCiRf4YwmdumtVJOVBCjbyg3PvC8VmXRWqpnZxOUWUg6n3RaM5l01hUvTeit9+kZXdEISp5Kb5gb+kZNIg2qoJsbE/wDTHPZpFUdyof6MvprFYdNANzoObzXv94RDSxRMKVdzMNNBrFmcScRVP5gUW6QUlJl6iCNIrMMpqmMzjSiPzTe8IjTCarKXnEhaTfn1jWL6Rpe0qcSpxGXfMNzG1f2s59dZew+A/iHAbanDoX1FGvLnH0fFrqr4z8nP/eXSeY6AR1Q4NsGxiyoosoyAyAyATKDdW3zgBI5dDAZAZAZAZAZAApPc/eATL8V/vBckBkBkBkAaf6QAqgEgMgA+IwAr5esEzJFbQQGAD4vlBMSyCCKgEgEVtADAZAJ07d4mAKv10jSAKjFQKtvpFFjcFakV7o+cG1SL3ETDMPWNIA/P7xVfuEjc5r2gdyf3gobVsPWAFXzgdzWXMT1GsDuFSco5bwRsC+Q7QNm1bfKCDC/dgGS3/eAsKNivE2HZhL9Dr05KFJvlS4ch/wCpB8qh2IgPRfCTi4xjtlVLqzbctWJZGYpRoiYQN1pHIjmn5jmBlaulottxzEdXermIJ6rPOFZm31KR2ReyU/JIA+UTS3pjaGs4mxJJ4bp/tUxq+slLSCfeUOVul944OVnmstsWPbguIMQzVVn3pycmA4tZIylWgT/KI5Ynq9vBxYpG2vzk824n38qU+6q+pPftFZtt1Y/2nTW6jNqF/wAxCydR5rGMbWdNatdnKhmvmSUqvYXVeM4nbprVWPTmgSpQKr33hLoiqumpvLbzdee0Zy1iFa9PJVfKoG29jtFLto+oL09/q9NYybVhFcnvL733jGzompkzmmhisQtX0b9t8xJNtesFrCE8NfMPrFmYhPJze8PrBEezkvOKbt+YLHvFU9U1me2ObYw2ymqxlp/NZOYXJ6xEq9Wz0RxxxxCUakKT8jHXxv2u4uRPWZe8uFVIVR8B0qVcBS4tnxV5gQcyje1o+swV1R8F+QvvPLcR01hDi2Ic+sWW2WLIZAZAZAZAIraAHKe8BljrvALYwCQGQGQAlPwwXBl1gFyq6QV2QpI/8wNlSLmBsVsoOsDYVGCxIDIAPiMAK+XrAIraCYgMCYB8XyghkAi/7QCQCK2gA6wC8j3gBQLX0sYuEVb03gAX73faARW30iixva2bSCIIqDSGW0+UXUCd1QAq93flBUB568oAeXLSCwFbfOAbVbSDICraeb7QAqtvBESFX9YLwaXbXrvBJpQ/lOhgGlDXTrAMPNp6gQFphKtPYbxRS64w4pJlJpCl2Nszd7LT6FJI+cRb2iITKlVJWkyLtQnFBLTCcysxtpyt6xx8jNFa6TixTll59xdjCZxLUn5t1xSEAgNN30bSP69Y87Fbdtvc4+CaQ06cnkqUta12BFrX1PeNLWdFKqKqVRaR7wNtrH9YwtLeKbUk5UvFvchMZzd00w6Uk1MalXiAgHTfeMps7KRpBcmb2VfUmKLRCvmppOoKwINIVD01lvZQNz1il3RCE9NZviH1jDTWqMuY094RM1XidGFTRTpfQRHRaJD7TfXMNYjqnuz2j/UIdTuzx1dfvDqdzzU0P5h9YdTsntTHmF1DeE07ztWL9lpT3MzgVfnca2jW9dRpS0Oy8EsIvYyxdIU9KVlhC0zD6gLjKkEm5+Vo9L8bxJyZPI+f/J8iKV096MNssMol2UhLbYAR2AFgI9+sbyafE5bd7bO/pFpVgQ+e0YzC0F/vFoQWJGQGQGQTtkDZPLBDPLALAIUgwA5T3gMgM59/WAGxz7H6wB2H7MAm8BkAioBpXPeC5bdf1gMgAV78AKoIj0Q7QaRIYEyHn84M59kgkihAD2gFgAUBpAZADfU7b94tsCr5Q2AVrrFUww2gkCxdIy6wCK/esBkXAqBvAIdoBs+78oBtX+8FQK5+sAA9YAd/lAIrn/eABXL+8A2pKeZ1gG1J3SPUd4BpQ36EwDLiUnmLwDaxsBcwHNeLmN1VKeFKkXP+ElFEnzX8RZ7jlHzuXJOSdPZ4+CKS5VNVBXxLKVfM37RFv+cbel60qpupBN/NcgaQmy0VazWKgVKKvEIiky68dNqRypZUk+ISducYy65iEBU4Vk3cKeehiEGHpgpsQ6tWvMwWhWTE95jzvBpEK6ZmFK200MZS2hAecUb2hENamfEc9DtFkzOjanFW6GKKzJouOJ52A7xPUGl05Qdde8OoNL3faHVEDbc1Gu5h1aQsGVFShvcGNenSNsqzps1BkHp6ZRKy7JdcWtKQlNzck6CJwV8s6YZc3V9Afw+8L2cA4XFQqDf/ANTqISpzQHw02uBH1GGkcXF6fBfk+XN7adbsmwyiLb608jzZ9V2wJPyiFoF12iJhaCwhDIkZAZkV+zAIf3rAZc9IDMwgFynp94DIDIDIBMogMy94BMpgEsf2YDIDIAVQDZ58oLlgBJ+sAkAKtYJmCesFJkMCJCr9ILxBIIZACpP1vAZACrVMAPwwA8z6wCKgEGsEwS247wSBWnpERIxSbxpAHtAZ94Bv4YAFe7pANH3j1gG1e76mAE7C0FSJ2gAV71oBFbwAq+8A0rVXqIBtSfvANKSn5mAaKCfl94Dy9O1JlK/M4SQomxN7/OPmuz6iuNRTk6i63MxvlMOzeuPbX5yoam6j9IrNm9aKOpTSnL2VtvGUy6a1VM3NN6ZCe+kJl0RVAcmPhCjvEE1MKmtxmJuIJpVCW5qfNBr1RnHB1JiiIlGcV5TaDSJMqPz/AKwT5NgUVb6iB2NqV5esREJmSBWnP6xbTOSNqsfrF6V0rNkxlOZQ6nvC86aVsuqbKqWsJKVXJ9OfI9YnFW2SeqMvI8Nfb2V+Fjga2ltvHeJJUlCADJy602Ob+ZWke9xuJGGO0vjvyPP/AGersqTb1sCByA0Fo3l8/MjA26QhnMl/vFoVgMS0gtzBJb9ILRJQMsFS37CAQ27awUZAImw6wXHp2gGzr6QCp5wCwGQGQGQCK2gBHOAyBs2rW3pBOgnnFpWIojaKhIAVK+0BkAh2gA+KAU6wAfEYDIDIBDbTtFoAH3frFQPwwAkb7b6awCHrAJ16GCYlh971gkKh94mAkWAKT+/nEQMHOLQGz7v1iAJ909hAMn3j84AFe7ACqCmgfCLQSEbmAFe4gBXAArr84AFJgG1DUwDeW+sB4tnKoh5XlUgadY+U7Ps5jSqmJ4f/ACAn1h2b442pp6eTcpubnbWKdl4Us5O2SrU/WK7bRKqXN3UdTF20SadmBawJvExBMoi5jub+sQtWUZ15Xp84LTJnxDzVeCgVK3O0DYc5ynKRz5xMwnRt1R11jM2a8TYnUxeITsoVm2uPnFtJ2caTrteL1ZTGlnJSmZy2pI1sOcZ3hpWHoj8NvBdzH1abnZyWWmlSSg6+pQNlG98oJGp01j2+Birkr3fMflvyHWdQ99ycnLyMq3JybYbYaQlCEJ0ACRaOrtOW3SHzmW/ljaSlJNjy9YmWMjOXrvCGchFtotCxYkDY8rmCYkuUiCwt+cFGZe8BhFoBAD3EAtvKIDMveADn84LigMgMgMgMgMgAgMOsERJtWnSDSAqMWkCDFRkFdhUNeWveBtkFgqMAKjltzvAYdlekAMBkBkAMWgCrUHlFQIUDAYTaADrAB/eAVR9PrBMSzexiIlIFaKAi2wKv6xMDPneLQGyqxy7xABW3ygGzuqAA63TAN/6fprBMwHqIM5D8UEhXuIAV7QAkaCAA7CABVtP3ygAOn/mA+fE9UHpKaU1MAJCdM3Ix8lt+k3wVv8Rnqp4ibpUkk/WDHpOL4qJqezKzFRHzjPaJorpqazAjN94bWrVCU4fv1i0NDLj5UemnWLCOXd/7wTsCncw6QNg8SBAc24gts2SrXzafOI0bZm0yk6xKssCM1usNKxJ5pnzDnfWLaaRZYS8qpNlOJsDt3i1omsforMxV1Hg7wtrXEjEDFKkJNRZSr857KQGxfcnnHfweJOef2eL+Q58Y30ZwHgek4Dw1LUOlsgBpIClWsXFc1H1j2Mvt8jmzeaWzJSdOQ9N4yqxvbUC6bf3iykEUe8GkMiyrIDEjaAJW0FybgQUFAZAZAZAZANJ3guKAyAyAyAyAFW8Am0Bh2gmDavdHYQWCraAQi0AkFdMOvYwNBgsRW0AChmty5wCK80AkBkAKlcoDIBvrAIlNuYOsAqvdMACoARpbvAKr57wAjlBEQH+8GkB+L6wQxW/ygGlfzdotAFex9ItACIAc+f1gG7aiCZIrl84M5gChygkCv94BFQAfCIATsIBtXu7X0gE/e8B89sQtpdSfLfMfW0fKTGn6Phrav1ok3OOyrxSVEC+Ud4wtbTqmkWNieS6k5tT6xDmsacf3/wD9f7QViUdyY06/ONIX0jqmTmPl+8WNGvaMyjsPnFkBL222p6wClXf7wTISr5wV2yJmDYgP3aM5WhKZava0TtXSxlpVSVBWUHna8W2l0jhTwlxBxMxAzT6XJqLDavznFaIQDzvzj1OHx4j+7xufy5xvobwy4Y4f4YUFqk0mWBdCbOvFPncPW/L7x6UTFP6vleVlnO3ZKir3thtE29uXHXUDv2tFYjSKx5J0TMIkZ8UAsWGJ7wC89IDDeC7B0goL7QGHTvAZAZACVQAp2guWAyC4cxgCgoyAFSb8/tAZb1MAKoJgCkwWJAIoQAjaAyAFQtaARW0AMAHxfKAW28FiQA5f3aAxWsAOXvALlEAik6GABSfKYAbfu0Aiv1MBkE6ArlBAD728AKvi9IBtUWgCrWLQBVziACv6wAHcQAq5adYJ0RW0FdGlbHfaBoKjA0BfOBoCv6wQzeADa0B8+qmrMjYH5x8f32/QqWaPXZXxCRlJJ1unW0W6bdlJarNKelVEC5H3h0ZSbaqBPkUoXMW6M5OGZFtwfnCKaJk2p/fb6xor2B4mt9D84ro7ywOZt9Law0d5HmzfFa0Ig7DTb+aLHY+02hV8yiABppETCInZ5hnxFehjOYb0nSxl2fDtm1PKI1uTvMQ3nhtw/q2PK9LUulyi1qdVlUqxIQOp7R34OHOSHkcvneKX0U4R8LaZwyw41S5VtHtK0f8AEO2HmVbXX1j6Cs6h8nyuR559N+bScvQ/W8YfZcVvUC6cjEoFp2gsz/uiIgLGkDIgZAKN4LigMUBAJsNBALAJp9YKzAYEMg0hkFWQAQIZBpEsggqVQBQU2RW0E6NddtYLMVtABpvAYraAHrAZACqARW0AJ5QREEtqYNIYrY+nWCA7QGQAcz2gMG5gMTtAIraAFXumAG+l4AT70Ah2gBgAgAPvQRMA/pBIPii0Aba3hCIgCvei0JB8UQEVy9YDIBvrABuIBtfOABQ/vAJ8UFQueUdYD54T7wKd4+Niun6HWmlDNJzXtYX+kbRbTpr6a7UpTxL3SLwiyJhrM5KKbWVJuLRbszmEEPLSTmUdIRbaswcTN3VvaNIYzB32hvTzfeGjvA/ESq3hqHfWGjvBwKPUaxVbR1KjpFog0lspK7am94pMtK1Wsk0G0ZjqRtGcy01pe4boc5iGqS0jKNlx+ZWlCG0pJsSecdPFp5JcfL5Hiq+i/wCH3hBJ8M8NMTUxLtCqziAp1VgVJ8u22ke5SYww+O5nJ8lnV05reYC2bMe5jbfp52Ouo2eTr6X9Izp7lFf3nQvrFtKhhpYSYtoLEDIBBygC+GDTQgf3eBpitRvyghkAP1grEs+sFgnpALAZAIqAGC7IDIDIAswgziQq/rBpAE7QCK+KASAQ7QA/EYDIBCNt94J0S3YwNBy7bwW0H4oIYdlekAPWAyAHyjrAJ06wGHaADe3YWgEUd4BIAeZgAXAISP2YBs8+hgB3JgvoGveCNAVsesWg0HryhCdA6+sWhQPWICK5dbwCK2gG/hMAF/Ke0AKkwAq90QAdN4KhX5gb/rAfOSaOY7/9vT5x8ht+jxCumFJ1ym+kNtoVkwjNc84sopZ5jNm8ovFlVDMSasx0GsTSFLSgPMKSTfQAxrtz2g3k9frFts+g0KUnckdNYqnqkNzAHvaxSYWiqSh9CiDt84tX00iE6XmkpUEje8VmesNdxSnWG04bp01XJ6Xp8mkl+YcShICb2uYriwTmlGbJPHxdnvz8Pn4c6fgOXYxJXEomaktCVtpUi4bJ7czH0mHDGCHxX5Ln+W3p39KNzaw5crQmItLyb5JvUaNdFX+sSg8kWEFmK2iITMs6f3jSJZyQbxC5b9jAZ9YLsTvAHfsYDL9jAZfsYBCqAG/07QGcucBnyMBl+xgMv2MAMF2QGQGQGQGQAqN4DIBOUVCAXidjCnT/AHhsBl39YbC29TDYE8ohYKvL2iwG+W0AkBkACu0AmYwXIdIAcpgEUTAJ5oI6g8xgdSQOofNr3gdQqubesEhUnQ+kAmXeAHa8A0r3TACr3hANq+2sBltIALcxGmwKuUNgTpDagFcu8NgdMvO3rEATsIAVe6IARtACrnAfNmYmBlCeV/n9Y+Pfo8QgvLglDec81usXFfMCLKq19rMo23i9WUztWvy5JMWlnMbQ1M5bxG0hLQV8MWVkqWU32iYg2d8PKRpFZ9G1hT5TxHRmuLHXvGUz3dOLBN8feXqz8JPCl6vYlRXpqXIlZGznmSbKN9o9XgViHkfleZ1x9HvptvLbKo2SkBPKwj0s8zM6h8benb2Pza66HvFOk1jalNfDm1rc4soXNbeCxdSYKbFEbSHXvEpiRQaQQX/ZgnTDtA0W/SCC3/d4DM2394BDrAJreAWAHMPUiATXXzGAIbQCHeC5IsMgMgMgBVm+8BkAlj+zAYdhy+cVCwAFSee8Al/3eAWABX9YLBVFg2r9L84BvMrTUwB2H7MFtMNv2YGiQW0RUDRIGgQNEV7nygbDA2FX9oG2QNhXy9YGgq90wNA6wQE7qgGle92gAPvQAZdYDL6QAxdOiK5epgaAvaCDavMPSAbPu+ukEzAVHvz6wZhVrAZACrL2gPmY84FC55R8bD9IRXXkm9o0gRHVpud9O8SrKI44Dziy1URxSSo23MW2rau0V5O/WJ0z66RFNnnERGkm/CHSLb0r1ElkX925i8TpFq7SWZXOQMtyYyyWXpib/wAN8B1DF1ZYpNPlluLdWAbC4AvG/FwTntthz+Z/Grp9LOEHDuT4dYZYpKQBMOELcUlNupt949y+PxV0+F5fJnPbbfEEkEnnE19OfY0pT10hb2bOQVZEaGDT03iQtzFdBIbWisCv+7w20isBuO/1iO0o6QzMOv6xbtJ0hmZO0VjZ1hmZPQfSJ9nWGZj2/vE7k6wJKh+vWK7k6wXToItMaOsB56RXtpbpBLA+9Fosz1DPL0EJna0RAvpEnWGf90DrDMoidp6k07w2dSHnyiAI96LBVRGwg+vzhsZ9ogCesBitjAM67wBJ1OXodoAjzgEc0EA2rl6RZYCvigmCZdu0GkE101MFWQGQAr5esAitoAB+sBivigBgEX/aASABX7+kAKt4AF205CAFeh9TANq3+cAKvpACreAHS0AI2gBVy+cACjzgAVpp1gBUBaABcWgNnfSJUIowGQHy/fcPU/WPj36PtHdXvaBtDU7rudYumxlxY1iysI6lekIWidmlebQesaRDO0gU38oT6U7A8MCMpnSxxtsc7XJ0ivkaVqsqdKLeeCUXN9O94n+zevp75/CPwlZoNF/xVVJS0y+lPg5xchPNQJj6PiY4wxt8P+X5fltp6WRdV1FRtc2v0jW2TzTp43WKxs4n3egizDYx5YGy5+5+sUggGfvGkQ0hmb1N+8UNDBTprFtGi3TtfX1jJWKyRSk7b/O33g0isgU80lNnFtgf9VjeM4ywv0lHcqEmhJ/4hCT/ANV4t5YOkgbqkiR5p1u4hGWFvFJ1NUp/u+2tG/aLeWDxSc9sklWyzTSh/wBVojyQr45GmalirKl5o/8AdF+8Hjk5nQrytuoJ7G4+sZRk2tOOYJm+FStRvrGsU2ymJgl0ny5jppvGcxo8cszJ67RpWNp8Zcyfn6xKvWWZk8v1gdZZm6K19YziV+zLb84vB2ILgjTSIiQUWGQGcjADAJygBVt9YBu+g2gFSPTXWAOACABW0WWAReC7PhgBVz7QGQGQAr5esAitoAYAFcu4gMgBO8AhNoAO94APegAKoAd9ekAPP0gAUfvAIpMFDcBg5wXN31gB/wBUAKlXSe0AHwj6wDaveMWgD17m8SAUPMYDCbc4I0+XLjniR8hp+iGHFev1hoRXDvExCsyjqXGkMpApST2iEhgEtfmRCFoKlPLr3hJJ9lonRNiSYrX1GmlbzM7df4C8OZjG2M5KTDZLDbgW7ppl0j1eDxq2ncvN/Ic3pGn0so1JlaLT2KbKpSlqXbCEhO2gj1sltvhs37TtM0HpGMTpWa7jRwK2i21OpcyU2MNbW0TOlOp1+cVmy2mKWlPYc4rN4W8aLM1amyl/FnGQQL7xW2aIaeDupp3HlHlvdcC1crdY5rcqIaV/H9lJM8SfOUy9gDsekY25Ltx8DSjnsfTjiz+dYHuRGFuRLrjgq5zFk07f8/7mM4zy3pxNI5xIvMfz9TvrE+aXRGDRl3ETxT5XM3ztaI80ytGCDIr00o/5hTy3OsO0ytGCEpmtTKk+aYPbzGJUnjVPprEzm8swb/8AUYK/xqpLeIqsyfLOONgdyRCsaRbj1ssZPHlYlSM0x4wH8wsDHTW+nLb8fWy8kOJjYOWpS4AOuZvW0aVzy5r/AI2tY9NkZxZRZpsONzGfT0Mb15EuC/Fms+gJxPTL6KOkTHL2rPDlJbxDTHf+eBFo5MyieJKQ3UJV6wZeBvp6xMSjwT/p9LidFco0g8Vf9GpSdVJ3i3TSPQU6nnE70jrEj10784iEFiyrDtAANoATzgEy94BYDIAIIg2qLNIIf7QTDILQQ7QJDtzgrLLiCQXEAhIgiJB8IgtE6Jv8oICr96wGQAqgBJsIBtzYfWAAnbvrACTbT5QA7X7wDcAiiCYM4gMGgT7v3gBVomAbVuIBNhAAdrwAj9YAPigB+IxcCr9YD5ZuObdPWPkn6AacV+7wEVbl1RfSdGlHzCIVmpN+usDTEjXvA0LL3isEsCfqYSQtqLTXpuaal2EXW4oJT1BPaJw/9baWy3jHSZfRH8MfCqXwXhFFVmpce2zrYUVXsQk2/qDH0WPjWx13D4zm8jyXmHckC3y0jWsdnl19xsvf9iF66Y1v70W6UpzWuYiY0ms7RZmoysqguTTuQDbXW0ZzbTprTbVKxxMkZH8qU1163jktkdlOHtpFU4m1CaV5Znw0HS1457ZpdlODuGuTmLXHFXdmyf0Mc85pl1Y+DpVqxO3mUr6axjO5dUcfqZVXws5k7jaE5Gni0A1k+/cX9Yzm8Na0MO1xWu2o6wi0LVxmRU8yb6C2u8axMLTiOt1ZV8qSBbvCJhXrKYzPuPeXMLesaRaIRqUxuedTZII0PWI2znHZYMzqlKF9TaG2U0smpf8AE0Nh84tEnS0HUrbTobG3eLGrFDp3SRrrvGkWhFsdhNziknyqA+dovFoYWpH+pLFUVs4dYruCccH/AG4pSVePyvvFu+lfHBUYmdllAJeJI2iK5pWvgi0elnI8RZqXISXCRfURvXM4b8C1vjbqXj6mzwKZhRQskDNeN4z7ceXizVs0vMMvJDjCgtJF73vF4tty9Jg/mFtOekawTAeXSLKs/e8V2qTpDYFe376RYLAZAIo2EAH94IgPxGLNIAreCYYP0gtDDtAk2vcwVlg1gqQ62gEItAN307QWiSJ2gkhN7+kAKoAb6QAu+7AD0/fKAA7j5wDat/vAIr3zAIdoAfiMAN+XK0A1zMBi9j84BofqYBF/rAIdoAE7QAr931EA307xcYrlrzgPla4rbWPkn3phxXcRYMqVvfpAAVb9oDMyu/1i0H0o58+0Vst8ONpKeusVrO/qJ/Y62z4qhlUNNbXjSa0n62xxp3j8M/Dc4yxnLPTDZWxLKDjmhtp3jt/GYZv+0vA/M8nrGn0SlJWXk2GpdlIQhpASlPYR7F79v1fHzabzs+lO/UGGlq6EVJCSrkN+gh2WnHEtSxRjeTora223czp0Hm0EeffN6duHje3IcScQpycdXmmsoN7ebaOG+b29fFxNw0acxSpTn+cT844pyS76YpiNKWYxEhV/Mq8TF5Wpx5idozlaWpIHjG/rGXbTp8WmN1IlQz2JJi3k0nWkxM4rLdLoA6XinZaSe2rT5gofWK7Ro17csr8yhaJrCawMTatO8dFVplJZe2sQSe8WJlYy8wE2uoC3eCutrSXmBcXF+kOqqe3OZVDkDDqzmExMwc2ZWnrGmlYg4ic82hFjtFtK2OiaTzUAeesWiUzJfE8Q5Tzi22Mk9qCVnMQAe8RNtqzWYGzOeIfDuLbDXSJrDKeyfT6W5OzHhy6s6yddbgd40rTakcmZ+tmksC5kpW8oqKuQNgfnHRXDtpGSLfU1zhxLpSVMTS21kaWVe0Ix6UnUpVFpWJKC+nw5wutA/Fe0aRGnJkw9m7Sk8qabHjtltwHXS1/SL1tLgzY0oqjTvLlr6YFX93X5xSJ6pie5Y2ieyJnqRRHMxZRn0gFiNhFHSLRIDS+8QiICNzFmkAV62ggMFoYfdPKBIbGCooAPiMBitoBoi6RACPdI3MFoJy6QWgioGw5u0DYVf1ggJ3HrANq59rwA/EYAVduekAivdMAB2PcwAcr8zAB/qgB/8QAj+8AKveEAitoAYBvpACfegBV/WA+UzilR8u+82ZcV6A9ItEGzalHN05RKAq+p9YAs3ltzgtT2JKre7rGV1rejiCpegvFYnt8XpVaUmUU8+2hsEqWoJT6/u0JwWstaer6Ifhd4fJwlg9qoTDSBNTaM2YpsbdI+ox0jiR1h8H+V5Pkvp3EJJUNCbaRX/ezgtMUpsaVZbhW5vaL2tphSk7aHxAx0zRJZctLnM4oa2VtpHJbJp6eHBNoef8TYydecWtx8rJv8W0eZfN6e1i4+pc8qmJs18zxvfXzRw3ze3sYsOoUaq8pSj51H5xzeeHTbHFZ0xNQDhGZ43Oo1i9c0NrUisbPszjriv8wGxinZE1hbSy9ApSh9YtEbZTRObWbXvoO8X0ziBqdH80W6rRBlThzeU3v3i8QjR1t45d9Bp840Z3lMl3PMNdu8IIlZsq3VyvGkNYhbMOXSMtz1MadWKdLqGXzakG8OolszGfylJHSLaRo75lJPhoJSfdI5RbTK0G/DeF73Nudt4RVSSKnHc6Q4TYbZd7Xt+sW6sZKqUrC2y6qnqCddcpsT9Ii9NFc0WVblSqUsfzJN9IO/kV/aOacnV01rFl1QcWO02ZbezANqICsx19I6aZdOfNgrHx2Oh4gl6jJJmmnEHQXSFbR11zuGcEzPpbCpNBIKlAfOHkb1xSxVWZCRdSSLw7NfAcRWGdMqhcajvF4ywwy8PcJDNbTmsoD/AFdoTlh59uEtG5lp5IU3Y3313jfHXyOXJi8RwqAtt9Y2mvjcs/uA8zyMWlUqdvn3jOQWh5/eIWCr96xaAl/3eJToI59LxZBFCAbT+9YLQy28CWQVZADACqAH4R6wDad/l1gtBFD+0FoJbeDMJ5JgBVp2F4LkVyMA0rn6wAp/rAN/FAYqABRgAO3zgB+GADl84BBtACdx6QAqOh9IAFbwA9IAedv6wAK/WA+UKnLR80+7NqVm964trAApWsFYITeCxU5rdonSaejjabm3zjO0t49pbLaVKCU87xEROSWkVint6A/DVwZnMcVyWq85LrRJMLSrzAWVv/aPW4uCYh4f5XmVj1D6CUynytMlGpOXbCG20hKUjY202j0Znb47JO03xEoSb3300hHplWNtexhiSXoFLVNOKAWpJCdd45OReIh18am5eWcbY0cnZhbzzpAKibXJAjybZY2+gw4fTk9dxFncUMytVaC8eZkybe5ixaa3MVJS1G7ht+kZRO3fWvojcxcjM5vGcNr+09lWYo82wjSGPxbSAczZlaD1i9YUldyx0G3fWOirGYTA4q2VPOJ7MtaIp4J3VFuy0WNuTBSknNryi61Yi6Uy5+WnLqT5jygzvWKJUu9mV0tFtQy66WsrdRHnAAjSsQdrQsUvKZtmslGwJVpExfav7z9TWX0lVw4LEcjpF49nTf1Nl3HL+G2kkHVSgL2i0TMlsdoXcmWzbTS3yHa/WNIpMue0zC2l5Vx91DbUutwKAIS22pR+gETWZuwvf/8ASbTaNMMzpTTqT4j6lnyzDagCoqGtyLAAC9o2jHEfWG//AOtiewYqZaW5Wp13xlLKm2pd4FhCe1tzF+sWcdbWj/VdU+GntEulmTqE60EAKAzXFuV+oif4sWb1y2j/AFola4d1iltrcTLpmUkklbY847kRhPFmG1eRWFbJVyZwlMIY9vK2lq/NbJN0DuPWOa8TjdNYrldAlq4zNS4fl5guIWARYn5xHazamOY+JTdXCT7/AC6xPaV7Rk/xNZrGyidIvCm4TG6ol09j0i207p/p5NYmJXzMqJAO2aJjJMOfJgi8NgpOKpWcUluZSAv3QdQI6aZ5eRm4vSV/mzEWsUq2PL6x10ju821OrDudLRNo6IiYGLZYhn2J8Ri52J9YiExIdAI0iUliA1bW0AtrX/vAD8RgEUdDACNoATqLQAKVACOsF2K80AO1+8FAq01O0ACtU9YLhvtAAqAD+0APeAA/7wAfFAIrb5wCHb1gGztrAJACdx6QDatTACr34AVKgEO0AMTofJdx9wfDHzL7s0qYc/lMA37Q5r5TBnAvaHP5DBtA25pfuqSesRFtkekiXezqttpCa7dFPbovCHh+5j/FkpSAFeEpweJ0IvteOzhYYtPtwfkOV4qTMPplgXBdIwPQ5Sj0lkNBtsZjlsSbR7M1jHD4XLyrci8xLZRcqJO8TNXPa2zcxNJlW1uPOAISCTrptGF7aa44eZOL2PjUZp2WaeAaQohPmte0eTyMszD2+HxPbz1iauuHNd21zyNxHk2v7fSY+NqGmvzjkwoqKydbiOe8PRpUiFKV7xitW/xJbT+YPMYQfVtKq2jSIZW9LuTctpzvF4hitGXMtsx2jSJRMJCXs1kp3PyidKRGxZgu/rrFtLdNq6emilYQk/ELxO1aY5osWZhKsmW9ykC1tzDZfHN01tQbV5iU/wA2YED015xNazLO8dPctlw7RKxiJ5LFDpc3PrKdmWlKCe6iBYAd47sWGZhw35laOif+iWMJZMs3VVJky4ApXiLSAlPdSiEgesTXE47fmKT8XbPDfhzLJ9mqmNWpOe0CT7Yl3xD0ASnKB3v6xvWmnLb8rv4dmMM4Op7zMph+XmcVzq05lNUuYKkt8vOoJyg87XMa9Yhz2/IZpbVI8M6mmURO1nCzNKkXleVArIW6Ff6kpTcH5mJ8kQ5b8zNLW8WYkwHw7nPYZyjVGfeOqsjriQFHcBy19+kZ8e8XJr/+muyPFrh/PTiJao0icp8utzNb2p1aQL8zmBvFs9Z/wjHv/wAk7FGIuCqpfwafXp6WWdUuykwtam+1lXBjCtphaIpP+qGm1eXCmRL1rGr8utNy4iRFyn+YG/8AWN655hpFK/8AtvFLp9Sq0mHpHGlalGTon+ISgQ4g9SNbj+8Vzc+KqRW0rJeB6LiWVEtiGXnxPgf+6bcbBWOSkg21PcRy1zRmaxybYmrTXDmawkpxyenK9KUwnyTNQpiVtDofFZJAHqI6ZpEOrH+XiJ9pMxh2oSdPNRl6xTJ+SGU+0SswXEpvsFADMk+oG0ZTMQ9DH+ax/wCorLFX9iM8zIzExKgEl+XT4yBY63Kb2+YisuvHzcGT4GSrSVJ8rwUBoMpveImW8xiv7hJcrlrJS4SD87Re1ohTxTUy9WkpyqS8AsHkYiMkQpbh+Vt+C8eKcmE0+ecSWlmyTe5BjpxZ+rwubwukOkZsyhrcKSCDytHX28jxPFMSzNe8XV6ii51ZAAofv5xG0xJYukEAKlawCQAk6wAqgA5dzABAIbWFucFywAq01gAV7ttCYAdNOkANtbwDUAn9oAU7QAW1t2gEI/d4ADqmAAncdIAVe7ACpVoABsYAep+UAJ94npABufSAE84DInY+TBzi2duPmNvvNB36CGzRUp8w0iNorQ7lb/lGm8NrzUKkoXcJSR3iKzpeuNKkaa5MLCUpPe94rezaMb1x+EfDrbWIEOZQFJsrNbe8er+Prp85+ctuHthvUgq1sLR6Vp3L4+Ppz+ZSbaRNv1hFZ1DlvGTHLdBpi5Fl9PiKOVWu3+0cGXJEO7i4JyvG+LsUKmJhzKrMQolRvoSY8K87fYcPFNXPKtUFTCgVKNidr7RzzD18dtI7KsyhrYcorp0JaFWvASW15lBVz9YppEysZVy9v7xaGcrSVeVmHc9Y0hSY7rVlSjbzDfrGkQpM9EjxPDGZSthyuftGvWIVpWIImYsklSrA6jXlEaaW3CnrE4GVCyjnUMyRY7df36RFbXyepVmaRG5l07CHCjFVWp0tUqwpVElZlvMwh5hS5mYB28NhIzW55l5RbW8ehg4ta+5ePyvy/wDGnVHQUYYwnhVyQk6bQZabxA4kIUuvKUJZkc3DmVlJF9EgL+XPS80tO4h4PI518sut4Xp+HW6JMTmLuLIEqEnJK0taZOXcWndJyWuOmgPaLWz9Y1EPNzTOSFbXpjgzSPZ3sSMsOMVFAUwHn1uqeGtlBRUbDltyMZWydf8AxWwzNTND4Z8IsTTn8SfedEgsjK1KvKd+SSNhEVzx/wCmmTLKjxfxOwZwaqDmHsB4RWsG6nnXXHEEHkSN1HXaEY63n2Vif9V+FsWcf8YF2u4XordTkb5lKmJFLYHZOY9OdzHZ/Ex69y03H+ui0HHlNeVL4fxxQVSlZWrzS/h+IFq2OVRSRa4MedPfH7qm2Kub9krHVDw5UKVMLxNhNAaEuVJS82EWHI3SBpbnFZ5Nr+rJpSt/1eHnqlLtTUy3LpUsiYui5AFuQ0j28WS96sfFD2hw5xBKYu4bUpUjiBbTsgyW3m3gn8tQGw0va/WPD5uS9LfG9McFrq25OlvprOPm5Z1CVKQc6Qsi1wEi0cuLHOWW03jE8sVzGU9UKo5OTFWdfUi6UuF5RJSFWBABEfQcXjTSHDmzeR6Q4H1p6YwyuWl8XN1VlSbqazOJfllEXKbEkEG3cdY8/mbxztfj4+7cJStUnCslN16s0oyEo6pIfq0iwh1KidEqeSACLXsSAR9o5a5PLGnRlxdGt4iw7K4unW6xg+cNOL7YWxiKhkltS+aH2AQdd7iOmtpidywjyV+NVmHsQYVqCRxUopq9KzBArEigKDZ6qCAFJB0JuLi2l9Y6Mtq5K6axyM9fja04Bwviqku1fDNSDIHmbclXVTDRB2zNqOYX9U+h3jG07ddOfas+3PJzCeLEyszUJenqm2pNxTcwGUnO2RY5i37wBBFrX5xSK7exx/yEWj2p6dWFNzaVN3StBvYmxBB1BvsfWK//ABuzlRj5FfUvRmDK1/GaMh7MCUpAOvyj0OPfvD5Ll4/Bb0vkj6CO/ppxRLB+9Yb0raS3/d4ttQJNotEp0GELdSeWLbOptQzKBFhFdoKTyENgf9XWLbAKMQBVy+cERAYNIJ0gMUYAYATvAAo5YDIBrT694AFHL8+8AidoAfi+UAitoAEwDf8ANBP0CzBbqBWsE9NEzGCug/DBUPUc4AVb3tAIdoAP7wHzNmqTLK91ki8fLvvoVLtGbv5WyNYNIgKqUmx8utoqvFDKqWrKfKfpBM1S5KkpUoeI2SLXgTbTbKRSWU5Clsab6b8ot02pObT1j+FOlLZmXpxSQQki2na0e1x69YfLfl7benm+Q3JBPpHRv2+YV9brDNGpr088oIsk2udu0Y58uob4MfkeLeL2PXK1V5lSnLoKjlsrbUx42XLMy+k4GCKuHVKdU86sa6q6xx1nb6LFSIhWzTaktlarkDaLTVvSPYJVWYgZopMNk7YHzXtGcwHG1352iNK7T5N4dYrItZXzKACtzzjSrLt1WTb2W6Sq1u+kb1g6+RKllOTSksy7Tri1nKlKQQddrkXtf625RelJs5b5JxRt1bCfA/8AiAU7iXETEtLtozqbk3CpdtLpvluD1VpaOynEmzyeR+ajFOm6u4VouFZdqrYdw/KU9gOBsVios+QrT/8AtWCCp1y17qUcuhIG0W5FqUtqHkZPyV88frLq9Jp+MH6aalQZqbROPy5bRVKgjxVNpUN8igNBuE7cotbHa9dw8vNm1O7vLPE7gvjim8QpKcqia1jNTuWYfCnF/npCrqSQnRsG+lhpaO7hY72jcw68eamSDXESYqVWq0slzhrJYJkZRGSXp7ZWtTirWzLKj5j3jXLPWddStYvLecA8McEVaRl556l4kqDzCEqmVTySmWKidG2gNUi+t9tYy5F9f+LObxD0jhWtUvBcoxTZLA9nVICW2GkBIQT/AK+ZHOMMVpn/ABja8SsZ/B9PrEs5VsUYclJh8EuNpsFLSRqE7am1t458+G2OfS1eTF/jh+KvxNT8u3P4Z4aUOYEzKNqS54jYbDFtCqwtf6R04eNkyx9X8c3+IvCLFnFrEzTNXqDjRAcV+bMMArCRyB3HONcvTj03ZOOtqfqkfiU4uKp2G0UufmVuztQQW0+YgoRzB/2jzMEV5d/1bzhti/Z5DeeS9lMo95lqvm1FzH0/FrSIedbJMO0Ufj1RaHwqOA04NQ1WUIKFVJt8Z85PvEczHPyeJTLPxviyS5XVq7XK06iZqU8uZdQDlUVq0HLSM8X4+MXtW+aciG28LIMwVNuo90g2BEdnWKwziHT+Acw8riJTpduoPobfWUueGogKCk2sbb7x5X5HjxNNuvi5Oj2PiDDE9S6Sug4aVJz7EyCHVOE2Zva5UlXvWNtI+awz1tp3Xv3aDgnhhxL4T1pfsrlMqlIqakuPtOKVLKQbk5kEXB1O1to9LkZYiu4YRTJH10Sryk23KPzvszTwUFLW1LpAW6kJJUixGVVwbX7x5mLLa9tNY3H1w2iy2EcdVidTw6nKng3EMmpWeRKlFDgGyijQH0EenvaIiuT4fp/FSsYMxEadxBpIM6zdsz8mktOuJABzKGyxueu45RtSu2OTtj+Ltuc4fcTnFyxm5BDrpC2p5r8ibSSfdUgjKv8AWL5sXZri5mSn2W14CoNVwjOTVDqjyH0qBVKvI0S6m+hI+E25czFsFeicuTz/AFvDemutvpHpTdxRVmb4rE31jOZVtVma/I/WNGcEPobxaGsQBSvNzP8ASLSgJ3tFdhYlEhgzkJ2VERKYkCt40hpAIhQKoDLmC4T0gMVADACd4BLiAAbmABfmOmltYAfiMAHxQCKMAGw+cA31PWBvQXNvn1gmL6ArWCfJsg59oK9g9RACr3j6QCKEAkA2dxAfON4FXQR8tt+hdUVbNj/tDZ1AWb3iuyK6G3J5jte8WiSZ0spWR5ZQNIrEaUm21tIy7iVBI0jaLaYzj29jfhop6pfC7k4rQuKsNI9/BHp8r+VvuXayrIRbTQA/KLzT28bW4cL4/cQG5WTcpMo8AVXzWV3t0jxuVk3D2fx/G9vHWJKoZh5alXJzEg33jx/9fU8fFENXUouOZje5MK+nfWExLfis+ZOgBFotPtaZUq1+xvBCrgE+WI+L0T5dxKrjNv8AaK9lrVOpcynQ3hSOyuj0q4pN7nWLWjqrpbyU0EpObQptvYDvrFI3eWE44yz3u6Jhvh/MVKUp1VxRODD1LqygmQXMsKdmKiSq3/DSyRncF91GyQbax6WHF3h5/wCR/IRjr0o9G0PhfRcJ05HsXtUhTloS8UhIcq8+/Ygh51YLcskAaIbClWOqhvHdGamnzGbld/qjrCuJ0rNSFPotDkqNSHXkqcZee8RTo/neVYrWeeW5EZRlpthWlLfXVKdg+cfnJSfqGIFVb2VtJbW+ckq0r4vBaGiRy1JMbU63js5Zy9j3GTjJiDDNPlMO4RlTO1GZb8Nvw2ypDV9M2xzH1tE0yVyz1UnDW/0vBet49o+FZlzFlNSKjNuKeM0+AXgDskdANbDleOq2SONXoyvHj/qgY4wlTahUmsa1taW35dIcvMJskgHUgHf6R5drWpbu6uPHk/s3PAeN6U2yahJS7MyyUAJQykWt30I+0d3E5Fq01dlmwxtBx5iKZTT56tSqUMTJbUJdQuVEnawFtY4M/a990dGKIrDzNI8euJGGMUycjjSemZanTKsrnjJschNsyeY0j1a0jJj1ayclIn49ATHD/g5xCkUVily6Zpx1tKpmZZ8qlHe102J+d44uRbw060srS00bFheRw3w3kHJhoJ9gaT5EurBDY5g33MZ4s/aNJind4/8AxbYzpuOMUyLlBlUIYazICmrHOe1hzj0+LXU7laI8bn2A+GOPMXVSUlmcLzhlXXEp8YtkICTqVEm3K+kehy7VwR6c9f2et65wm4N1ClSFBxJR5OkTktLJb9rZT4ZWoD3iq28fMZ+dMz6d2PG57iz8J7jjiZjhzXUvNBIJTMLuHE9EnnE8b8rOS3/RbPhjXpxvGHDvGmD3j/ifDrzbTS8vjJTnbIvuSNr3/SPc/m4uv15VsVt+lHR6pUMP1Viepc0th9t0Oo8NR06ajaLZMdORHprj3iewOCnGqQx86xh/Eji5OvSqVKYeSogTFgNFX0vt1j57mcO2OfT0ceftDaK1xGxRJV5+Vb4f1Wdp0tbxJpkaKVa+gP7Mc18V7SnyTPtsFDxNTcWyLVeorcygZiw/LzBLS2HEjZSbnTf6Rz5aXxw08sz6cV4yUdyn4qp2NJfE8tTH1FthxmVTkeCb+ZYI96401Ed3Ctmy01LWJjGk4olMGcQ6SG0YqTNVCTsplxx4LcSLC4tYd+Z3MaY7zxr7mGGTWRodLor1DVNM1Sn+1yy0kMTBKkraVf3klJ0P1jpvmpLOtG64LxRV5FwSzM5MTsgFBaPbF5wlQ08pGv15xz+ajScbp9P4hSbJSnEDTsk2qyUzKjnaUo8iQLj6R105Plc2TeJtsvMMzTaJiVmG3WHdW3EEkZeu0ddcdJ9y5pyTcar66nTsQPrGuseOvqVp7QBTrfmCZhs5Pe8wuIzxTG9ojJMEQ4HG/EbeQtNveCtD6HnGk1rHxabbIk3vqO3+8R2mPhFtMzekRCWJjRXRIstoHO3fpBGwwNkUB3gqSw6wRADp3g0iSHvE7GX2iAJ949oAVf8AVaAHrABtf0gB6wAdT2gB+IwA3vp84BtRuYJmdhUnN2grMbB70FIglvuINCK37wAK3vAIowAKNu9oBID51uM9o+VfoHc05Lq6QO4UyqgRpeKHdJZZ2i0M7SsZdrKfeOxhtE+k6XzJtY63tFohXyae2+AkqZfActnSQVHMO8fTY/1h8d+S92bbi6vN4fo8xNvOAKCTYX7Ry5M/WXPjx7q8O8TMXPVaozMwt4nMpXO/OPByZJl9ZwOM5TOPe0eZSu0Yw9iuKYMy8vmczG4EUlus2GwFFA1BEWr7ZXlUYgkLth1KblO3aJmNpxWUknOKZWUuHY6xXo6ZlapmW+Sr31vFrR42PZLzuAtZmSA/l8MpObPfYJA1JPIbmLUjyK9noLgbwRen3DijFVNamBT0ocVT5i+VpZUCku/DYjXIfMdjHr04EVrt8t+Q/KzW3SjdMQcUpSk42m6bh5wOYpdR4KqwqX9pXLDLZEvLItoo6AEWSkXvrE8eOttPPmZtHe7s/DqSkcB4daVjOeRVMRzredCZlYIZUoEqSR8StdxrbQxetcWnnXr/AOkfjlXmafhOTksOpeFVfcCXVISCWwRcqTlHl3tFa0xbc+rx8SeB1WnJbDa/8bS7zzylH2ZtzSybEZlE6neOvJlw4Y6rTX/02WnjBkpMP4gxRNsByXc8RkeIEJbA22970jLDkw0nspOO/wDjSZzijVuIVacofDlkKS0uzlQdSMiRfUptudIyyTOWe0tZr4/7NR4+4ZrVNw//ABLEGLp+Zm0BITL+43126GK5MtIjrLfHHk/qseGfFjDM1gmTk6rOSEg622W1Ib8i1K01V/eNOVetv6F6TMum8PqlhlKvFmp5upoWr8pKiFBF9zFePlpi/srbHMQ5zxhwpg3F2LZFTzbeQqUhLiU7JzajXvHNk5k3yda1a4sU/wCuk4Fw7g3DMkuSZqTUo0hsKV+aLKIHeNsFfJfV6s8+SMby3+LDH8rP15FHw3iN1TLCSiYZl3LIKgbDUb3i3H42rEX6uLYD8OexVRm515xbTU0g5c2iTfXXnHr3p4qtYjyPpLK1CXkJGUdl/BQplhKW05QAbczbcx4fJ5NsvqVMeLTlXE3EWBcTVqRwTiCcfcmZp26lNqyZT68wI48eOJ+uuJ6tkxhilng7gSQmcPyK6s0zZtzxF3DabXvrqY2nhVzz/wA2HaZn2rsC8XqHxcafpcxh9hDiGw84lZC8yedge8cvI4mXjx7l24a1n61bizwBw/jSimrYPkWpGryd1BltOQPJ6EDnE8T8lfHPtTLxYlwtrhtxOoUxS6g9Q59hTLwU45LXLiUA3Uqw10AuBHu05NeRHtxdPHL1jh3HmFKhKiTp+LJh0tspDyp4+zuqVl3UFW1Bjwr+Wsu/FWJrs7h2Yw3S5VyTw7V5KZ8d1b8w57SlZKle9vt8ukYZa5ckGKIm2nIeP2BMUVyusVilpQ+1LsBLiQ4QQNwUjn3jt/HZ7YPVjNjmXIZPBmMWZhK2Ka4Jhs2UG1WJ5i5PLWPZnkca/wDaHBO6Ogy7+PmpJEvOU4TKUpCSlKgSB/qjitGJ00s2Git+DTyqSySj5uXkKSSQbna8cOW+KsujairnEdVFfdpZcZf8t3VLN1lJ022v33jt4uHbl5Foum4N4jNSKmpSlzNVaSgqzteJnSoHmCdb9to68uO1fjLFSIWFf4uU6m+K1MT1VqJWFJLOcslCgLgExxUx5LW1Mum9KufU3HGKsUVIKorgl5ZCtUKUbqHUneO61Zw12w8cOhyuPMfUFtpqakZho3SoOIs4hQJ0sOvaMK3tH1WMbe8M8WFTzKU4hkwwFnKJhvUZr6BQ+GOmueI+k43Q0qu2FBwKCgFJINwUnYxrDIoUdt/nGi2hK2+cETANoM5Im0FdhO4gszQCCPgDz15QNhV3iIloTTSNIA9fWIAq1gAUf1gEUYADokQA/DAN/BACmAb+L99YIidlv8oLRGwWy8yQdYIJ0gAVACr34AFa6QAH3j2gBuddbQHz8cT5hyj5V99oSmc2qQIrMmmeDfpEJgSGrRdWyS2gfF06xWnqqutyfk8zky0ymxKnEgd9Y043uyub1D3rw1l/4fgmntKSBZpKlXPaPpMn6Q+J5eWbZdOP8fseKUXqbKuXCQQqxOu3ePE5OXcu7h8Xy39vKOIJ8zLi7XJPUx59o2+swfrCml2vG+UZxVr5faW1LnKLW3MXaVTpaXso7k2gzyGqkwFS6kgA3GsREaVpeYaLUpRTLq7XA3hN2/aZDS3JmcnGpGXl1vzDyw02yyCpal8kpA1UT2EdFcM5E5clMHvb1Pwl4G1bDcv/AIgr84iWqDQWlUsy2l9cqoiylkkFKXEXKTuAbkbR248Xjh8t+T/J/wDp6E4fYZaeweG2SWKWXAZdhTqluzr5VbxFH3lqPInnHZWPPHZ87eZhWt4UwLw4ViHH1VEqKvMIS1Ky6E3WlzYZSfdPUCK1ybnqUmWw4JwIy5h9rHmJ3gufdSpxDjilFKU/ClKCbDfU6mNcnHrjx+nNfk5vN1WODeIFLqlYmmZ6nhclLaqcSyFlxXcnl6WiuOfHj9J5GDJ27NWxriCr4+rUxScIONSQuW1PquAlI7CMf+d7bbVr1hy6t8CuIU8otKxMH0FWb31AHqbE7GPRr4OupWpk1LauBqsU8PZidojOH1zBQoqU/luOccuTN1jdGnKxVu2vGkzXcXTS3K1T2JyXKbOMPLKTltYWPKxjjrybZJ1JxcFauGK/DjiitV5fs5aYYccKkZFk5Uk3AuI7cXOiP0XyT424K4N8ROFtPfq0piCYKwjyJy3Rb+8Y8iv/AJmPkbaDhvEWJcX4mFGqeI/YlrJvMPKACFc7etozjjY7z7dk3VUrg3jFjbFk1Q8P1qcmZQPqaTOFRDTgBtoBHdhw4MX1x5LIvEn8OeO+HkiqtYmcEyH915iDfoSd42teJsxxW7Q0fAbzMviqmszjyGGPaUBTylXA8wH9Yvn1NXTjr7fR3DblGnvZfzTNyoSlKXAbZwemkfPTWLz+yJmatH44YTwiZxjELckXXaSoPJ8EWLxO6SQOUa2yRhj9WuOZs2DBdQwzxSwi1J/wdapdCC26y557KGmulzGd48k9saL38E9XL8G8JcQYV4wPpoMwJaRl0l1OYW8RpRN07DUXiL5PJHXI6K+o7O8zFPq0w+4ZBbIdQFKHmAJFtrdY8qvHjN9aRk6KuUmqxJ1AOziWGG0/5jl7FCvRRO/M2jaJtxf6K2t5HCuPHDlzGz3+LaHMlBYSv2plnTxCk6KSRbT6x6XDzTM+1eRji8enktVcqlLmXm2aq+w6h3KjK4Um9/dsDrHv1xxkh5N5nFPp6S4T1/iliCi+2PJztsICGnppROY20T6d48TJ+P18dXmquqlQ8WV6YW7W8Rykm4j3mWVgW7EjeN8HHtRXy1FR8MzDLyW5WtNPrJ1Up83v2imTFZO6Nknf4tIyvgv05MytKSApvUKH63jCKWq2pakOZ4kwvhuvTC35pmZps44qxcULJJ+m0dWK/hVvSMjaMB4FRhuVD09MNz6XT+Q4hN7n15GOblZrZPiaY4o2jE3DlvE8q1PJk0OPi+e6bZlWtYnnaOLFyckfW+9mcL4ZTQU+0Lk2ZRZ/LCFNpIzDtaN7Z5t9VmNt5U2zVpf2RySCGwAV2b0Uo+nTla0Upb0W+uZY2xBhzC9VXKTCQlLwV5XCBew00GtriO7jY+8sct9Q6LwlxLK4iwvLticDjwTnSc1/J09b2jqw21GmEw3m+W3Ubxvj9TtnLM3YRohilbQWgMFWQAKVBXRORgtEAUde0FyRYCo20EAO0AMAGhEABNoBCd4BtXS/SATbX+sANtzr+zAAR6wAm2oG57wCKNhAAr3f94BvNdPqYBDYdoAFc/XrAJAfP/yqve/1j5OZffbONqP9IrM6NlOYKCb6RKYGlJylWt4urY4Cq5STpY8ozn1VbHG5TsLy6pzEMlKpVqt5I+8dHB92Y8v1D23XK4zhXBbLbisq0ywSnW2uWPZ5mXUPkIrGbM8d48xC9Upl+YW4brUq+seBb95fQcXj9LenNJglxWa5J15xSJ29T5B6VbyDTc6wmWdPcnVAhQHIaxDqrKbK8zvBnkk5MNhbdiLk7xfW2c3irWa1I3t5QCo5U2NyrokC25i9cHYjkQ7vwf4Grwnh6Y4gVaYYka6tr2lt5aR4tLlEgElvNp45BuFbiPSx0ij5vn82/wAb9VMRVSf4X5cL0l2k0BQSlc0q4dU2DdKRfVRJ1Uo6qOpicl9vL/8An9y2/g/iPFgbl5ORlXTMrZEuxNzA8rCVHzOJFraA3HpGtLeGOpyJiraeI2E6XOYiouGW5gvkKExNOWup1Y11PLU7xamLU9nDXPES2/HEhI0fB4VO1f2ZDbeRpnNYBNraj1MRyYtFdKYr2zZO6ow69SaXwzmfYaa2WnEkrms1rm1yb84tMdcO5bTkyZsnRRYCVS6RTXalJzCJkzKitWozIIO14yxeO8bbz8bTNYzlZWizLkwyguLGYKWNUjoDGFtdtQyx49y4FQ/xKTGHcRzsi9S2nZRx1TZe3tcn+8dHEx9Me7u2ePazrVBrFSxHL/xFmktiUdRqoi5N9b29I5u9b5JiFPFajW8acZJHAL6afJNqW+2oKUop93lb7Rhhxzb9kzXzNNxT+IRzGDLNPl5aZmiryuNkkDX0jqtl7/qvXi9XPnuGtYW/M4hn2WpBgpzNpbuSkjUADqeveOuM2KPjTq2vhVxkbwUGZGeZW3+cVpUrp1PrGGTV/jG9CcbuM9X41zDWB8NyTjjTS0pzAklV9DrF75JiyuHDqF/gT8KFHSmUqGJZhQeKkqTLpBNlCxufnGfI5UxVrH6y7XjqfVgHCaFSkky3KSy0lS0qyltI5d44M0Tln9V8cxkLgqvUjiBRUzErZxlAJUlWoN97xHjmkfs1mYxpE5WaBwUork9LspYD6lOBtJuVE9Iy8/W3TG570889mkYHmOIOO8UnHy0iUpoXlaZWLLUnX6x1+PrHbI6K+46utpZmaml55lDbLpUTmvbLbePIpabT6aXx9nIKw/OYzxJM0iXmJttMolTb7gUUpWbjW/PUx6GOaxH7stdE/CsvJy8mrDpceeVIKUl5DoNlpO5SefSOjBMRPplabUj20ln8NOG69jaXxI5RTKSaXlOPoUCEqUNU29dY9vDNph5ufNEz7bnihun0+lzEjh95umU6UaKn5hRCUDTZI5nSOrxa+uCtrS8d1uoYwqFUmZ6kzE7MS7riglSlKCcoNhY8+vzie1aOmtbSuaHWK5Sm2HJysTbDwUR4fhmxPPWKxStl647N2leKE1R3pVTVaM+XVeZtQuEC9rH5xhkxVhaaXh0H/F+H8QSKJPFFGQx7T5W5q2UdlC28effFptW81a5PTlS4XKFWkZ9c7h51xN0OKuWs2tx6RlF6V+t6zN3VaTWHcXYXH+H6wUJKUutPZ8xSon4hzHYxx5smOPjaJ2smWa03ItfxiXYem1DIpbeYt3HxC8csW7NY9rdv2iWp/iKmCELCSsZrEge9YDtFpt1Vn3Lw5+JziJLyXESek2ZaUW/KyqEpecUo+Y31SOR13j2vxk9nNyK+m9/g1xZVJ6jzKppwhEsq6De4y3uoXOv9opNtW0i0PZylBXmT7pF068tLfaO6v9dsZ+l7iNFWd7wWgPWC2iZh+zA0H3RBXQeWtoLRAVawQFR1iwS99YAFfvWARUAF9PWAbP3MAmloBIBs/O/rAYqAGAAnvAArlAATv6QAafLlAIo3+cACvMfnAZAfPoLTHykw+9OtvNJ339dozkSvKrKpKrjn3i0yts6keX1hEmyG2u3SM8k7lFfUti4UtsvY6p/jaBLwJ9BHpcOdOPmzuHXeN2NkPvGny7/5TSLG30hyckTDx+Lgntt5wq9QL7q7rNjHnR7l9BMfrpVIRm9LwTHtJSCkj7REyvFDmS9lcyYiWs+pT5dtKU9+cWqzzfDrjfkGbKSSetkp6nvGlo7SratY9t1wDh+Uw/I/+olck0zq0flUinrbsH5lxeVC1BXIG57gC8ejxa9YeN+Q5NY9Q6hVp5zEErS+H6fFeaanEzVaqFifKTdKewuSLCwAAjXyTGXtR4mWlcnx0jFaqbih6g4EZlxLUtC21JyJIC2k78tj3je01tbtkc/WcZnihj+j4BYFNwi62t1NkJNhZsJ0II9PrGF62i3WUVyWmNS5fhTiJiatYhE3mXNPOKy+JzQDvaw20jSeNipHaxjjU7l09OF65jmTnaliaqLalZZq6Ws2gA5m8Z9K/wCL6c8/xBiDE0nK4Joj6kSLUypteRWriL2uRGtKf+kTbq3HEGF57h/S2ZhM4SHynS9rEDpGeSnX6mmXtk7NxYoK67hdc048nI40PLYb2jKONTJ9TbL1ydnjXHlP/wAN4zcp6XkKYXMJVyOt/wB7xvx7enVa3V7N4Z42pdPwrKs+CnOqXAVmtYafaK3z+KduLJj8rk3EDhy1jStGqJqRaDjmZQTsRe/9Y5ceeMbav/Kera+HfD7CuHao0qpFpbNhqoDU8464y1ytctOkdm8Y1nME+Cim01tt5biVHLZPptGfKriif0Y4IzRHt5zrnBuqVqoqelUltpw3G/lAN7CM6ZaUj9nTWt5n26Lg6h4K4Z0xFbrACKlLXVmUm1wefc+sP5Fci2tOm4F4gq4hvIfk0oYlEmxc0BPfaKTjizky12s+MVDps9heZkJyaDjam9BmABPK/wA4tmjxZd1RxLUuj8DeHrdBwoJZUyFLfPiKKVDypik/976s05OSmNqX4isG4rr07TV0WV9oYlHEqOU3BseYjLHhx4bdolrgyd/rqWE3pp/D8jKuUsSy5dkJUhKbEKA30HWMZyTbLuGmaKw57W8QYzwzjKbblZJM5TphObJstKudvWMvHqVr6yGGa9Mzin3hRF01azaxTqs/2jS9+sK1pFU5DKnpVdRDgMwhNlJSQCRfnHXw/wBnNnjcL2exYhWHyxmLCwwVe9qLi1/tHv4LeN4+XHO3iHiZxSqONuMtM4f02YWiiU9xKZlLK9HVbqzX3i3K5ERDq43GmZeg6bh+lpl2WfY2sgSMqQnQa6XA5x5tcvaXfavihYv8PaTUEqTNMtL8UeW6QLH5R6VIck5OjVJ7hRRR47KZZPipGYZU20HeF6kW8jjHE6oYtpsnNyLUiubp6GwEJQbONqSfeBGoHYRzTqV/HFmi4C41VDEjc1w/xEQttTZbQpw+dI2HztHNf06ceKKtp4NcW5ng1ip7D+Jluv0h1WVDhNwE3uLekceam0y9W0bj1hGtPNyEnKzamH0nw1LBIH8tu8c1cKk201bE2JOIlPxFMVTDHgzdJ8MOIlX0jOi+itbXuDrvHVbBSfhFtvM/GThzUMV4kYxOqVdln5x1QmZd65KRyKb8t4vTJ4fjSIdL4PrlcE16i8PpGlvTk3VpFUw57M2bMoVceIsnZJ0HqRG32WFp29mJ8raG/EQS2hKfKTY2ABIPyjqxTpjoaVbR0dk6KvYRWUbZFgHW0AKtYAFwAnYQA76wGZrbxYAowALWnlp84pAAnUxpEgCr62iAJI6wAqUD8VoBL9IAb9TeAFStoAT2gAUdvvAAowAnnAIowAf3gEJVygPnu3311j5e0Pv9GZ1LmUFkkHlGM/TSZIqcU0nxLgp313iJVWCVC2sIEd54pV5VEfOImFp+rnh/UPYcQImkkAtlRJv6R0Yr9WOfH2guN8QLqFQdc8TRdyde8c+XJMo4uCNbaQ47mV5tbnTWIxe3RMe9HWlZR5tb6iNJIro7mBUOlrRjMrx6SG/XnEyX+pjKxoOf3i1Wd/cNtwHQf8T1lDM5ZdOk1JcmRmyE2N0tg23JBuf5bx3cenaXl83LbHTboeIa5LyuJsJ1+ZpYmKQ2mZqNPkGxkQ4UkttTCx/8ebypSeSc3OPTjH1h8xE25N9S61huiSdPwWKlNOJXVa2kzUyUJ2UVH7WOnaMuRMRTtiKbp9V1PwjWmZSZxhPTzoQE5QkrV+W1ySOnpGHW1sfbItbNEtfb4WzHERc7iOsVBxpgpOXzWslIuk2jfBjy5Y72R5KzOobFwiwbTaAgIebGrpzLIsopB2v3hOWt56WU5EajcKrjFjaflJycodBZIaeSUHw7+7bY25XjCMV6/W+GvdzjhPXjhnFXtE4DcAeMpw+W42AEdNMvX61ycd1DG2L3eJ87J02RSGky69FA6G3/AJjjycjyfGUcfpTsjYjxrU6LImiycxeYCQ2lptV82ltBGUWtX4vHG8mPs8qcSsN4qw7iZGIMXSTqWJh1LqEpWcpFwbEfOO+a+OdLzTu3WvfiOafkpKTw7TxJMJaDThSbWKRa/wBYzz4e8bXrjirauG/GicxI0xSZiRSh1nQrT7zlzoTHNk4klsPeeyVxUxzVKC14zbxbdScoSom9vSKUpbG16xljqouBmMnMRY0VPYhqmcIAASpRA9I6IrTDP7mSLRX09dVCqYYVKo9lRZ0AKGVQsDaGbxZY/VwRXLM+nHOM0w5PUUy0i2jMghxd1DYb/KPM4uO0y7rQ5twr4kYroc6WafT3X2CoqNkkBIB5aR6vWawwtXbqWIafxJ4vLZl5N9FOkiPOFE3V0vGOC277spWMXHWVHxpXuD2Sg4mnFvpaTlSpJJ0HSMMl95tVbxjxcluuGPxC4Xqku4lWcqzHN4iTpHPGHJGPtMp8Pj+Nuo/GTC71lSU00666rLkBFyekXxZK46blhfBbL8T5ZdOqNVmJytKbyOjM3l0sDunvHPXN2le1Jo5rjzFLGGZwOPOobkphRQ0SPdTfcnrGmWNwtSJs0+r1yYkm3HJOZUpK05syVaFKhvHXxbdEzj20l7Fk7VZaanUTbi1SzC2A2F6C3xfO32j1cWXs48mCHmLhzhxzE+Kqtih6qOy8zKzbnh2J8ys2xPSMuZaYb4Zirsbf4jMRcMZqap+IMGTNcYlAlzxpcEgNgamOfjfsvlju3rAP40uDuMlmVrKncPTCElTZeFwe149ulnm5cfZ0SarVPrkr/HsOV6WnJfw82Zl0EkEcxGlpZ0jo5LiacVMeK3kSGrlKiFDUR5HJy+N6PHwzLhjGFaArjdLNsJPgzMkp5eQ2IcB0vE8afMvnrNG68QuGrcwpmbZlVLSEeGXEnUX1tF70cWLL2dS4SyNKw7T2ETmR0iyGisXy22Ue8ZaiHV026S/iTDtQcQmVSQtBupShZBUNSB6xxWran0immtViXbxG0FTiEoWXwE5hoQPdsextGmOO/wBZZMnVfcMeEw/9Q6txLql0+EhFKpqUkhKmUJBU581nT0j0K0ZVnbtSr+52te3Lf9Y6K10tMFT+kViyJF0jWGcyxW0WSDke8AMAHP7wCKgB5C8AKtYAFnTTSAbVb7QAKPzvEbAZu+sXAqtlN+kAkAJKfnAJr/MYACf1gAv0EAijy5nWABR6QAq09YATzvACReAwqgPn1l0sNI+SfoAQnNZsm5Gt4CUynKQehiJUqeccypMZyWQZpw5/KbRWGtKnKJNeCp5aVG6b6315RtCmWqsqU/4kws5jbbeKq0qhtqzqG+kWh0xCYOW+sVQeSLWUbWtFLCS2pKkXFt4jW/atvcpEqh151DDIzqWfKke8pd9h2i/TuvaesO3SNH/wnwrZkZWaCMSV9QCG0aqu4rKLjcBKMxvyvHuYLdavjvyNu9lxiSk+JW6fL1RoGppWn2oqXZDEqhKQ22nkLAAEdYY8nS23nWnddNxxVxSwbgOpLpUwpUzllhfKfKlZFwkBMVyU8s9lfFtW1DjdRXMOOyAnEFhaQ4lkHzKUfhMRb946qzx5ScP8QpCpS1OokrMLabn1JQ4baJFwClR5aR0cfH0Uy7qvsfV+VwyUfwsqWAlIKW9Re28c3MjsthnsSm0mjvYUOIKiAmZfSpRKx5gOUa0pjpH1ecX7vP8AiKXVXMTJkqLdsLVbxAbDfnaMZmJn09WJ6UdAnKDUuHuH1VBU2C6horDg1+Em32jlyYtMoy+eXnCl8cqwnGzGIKu94stLLUktpuOehjq436tsuLdVtx141yvFNuSp9GkylDQGfTUq00H0+8a5Z/Zz8ak19tSwfwrr9eyqnGzLS6rkpVzBN4pmz9auibxadOxYLwSnBU0mebezr8qUlRvtHJfkWiFJtqep+tYNrXEqvOuTM0tICyU5bm45Q49rZJa2t/Gjs1PFXDfE3DNSqtJuaJspQVcG1r6xryLzht1lSOR5BYU/EFWGZRbNUUFrSMqPMTb1hbDE17Si2PsuabNYq4kTbdUfqRakiot+E24oXT0I2OkZ4sFKfWn7Vh6dwNgeiyVBaU2lsL8PKoqSLmw9I7oxUs8jl5rxKrqnEpjh64fMQsA5UpN80eJfJM5ezupwoyRtXU6qM8QpgYgrdLDjQIs2sAWTfU6xvXPNbdlq4a450f8A4ThWTNQp8hSZZLlQGVoKKbpJHLTSOn+TDLJE2xqXCfBPElKrbVQnJptEulXiIQhV9zpGN8vZrhv0xt9xnjKn4alUPVSZsuXN0gHUkf1jyb1l0Ut5HmP8QfFuqYhZlaXTWZlEoQHVrebKOtrH5x3cbD2hXLpsWCMXTeJMDsuKbzuyzXhuJG+gtHVavRSv9WvMTM5hjEAZnWyiRqSALqOgJvuPnHThvtw3ruXOcOzCcH4yrNHeUlpEw+ZqX5JcCu0Wz/tDbF6dWl6vTy5nck2ptp5AbeStN0uJI1SRbbWOXjx1l0W9qXEH4Y+A+N6bNVim1Kcw3UgkgsS7gWyonmEK2vzAj36dYeVpzOXwHxG4Iyi6zg/iBLVeTaul2nkLGdO3u3tpz7xjlzVhrSm2i4o40cRnlKTOMCSLhJ8qSL36HeOeuOMkNJ9Nt/DrLVXEWJp7FFUUqYeDPgNqUTcKPK5jTFSMcua9nqqWpLysP+zzKPFWlJUrnZUTljupjq1psKpgW3MXyOHRF9RHn2r1l2xXTaKFlVKmV8FYBJLXiai/X1ik37J0slTbKZFcvPEl1gFKLG5zHaNKVNu1YCnlTmFZJpVm1sN5FN7aX0juxfHPMth7X2jSv1SS/SNEFO0AHvW7RMBFbxYINoAN9YBFQDauQgAUdfnAAdbQAKgA6coAfi6REAY0iQiogJANnXntACVfaAE8hACfdPU6wDd/KVHvAZzJgAVrAIqAGwgPAbidY+SfoAfDtrpAOJVtrziJUqJxV7xnJZWVBzKo6626xnEt8cobc97PLuJB1MbQZFQqa8Q3vzvApVMl3BoTzi0NtLBKh5f7xSETA0q1HSEszqXNk7CLUjddqbbNhOnh9VQrK7BFGlfac2QmylKslN+/mjr4VO9tOLl5ppDpeA01aoY1YxtiRnw5KkJQ+hlVwUoy3QAO/wDWO+kf4+UyX7+5dJ4iSaJTBNUxTPrtP1JKXmEEWJKj/S+sUy06+3NWdzp5jnJ6UVSqlOVaem3Kn4yES6QLoUgGy1X7Wi1L9Z6u2lVtMcOKyzw3leIXjZEOuFSWb6hvkY6MmLxx2WtqEnA/GWRoNFXIzrYWJZWdteUXzHU67xh5tInjxkbvQeNlBxLS5qnzagzUFzSUs+JuQdrRWf8Aor/H8basfV6oYao7Dk05eXLBsq+lrX2jithyUj6Yv2u4ZhnitTVYkL8xYAHMlXKw30i3HiZn27uRTVFvxe/ECqtUM0WhqC1utlsD7GOjJ7c+DF4424rSeHuJq4FPty+SWPmLnQf+YnH6a1y9p06DwN4fSa8UKTXlNv8AhHKkK53vf9BCZ7WazTrj29A4wplPw4hHsORtJQLJHKMuXT9Xm8e/bJpqkxiaXmGmZdtQLjavNpHnxnreHo1xd57NtwbWJKjzBnJ0kJXqn1jfByq45V5FfNHVTcZ8fUmdkVSzjbaitOVKlHU3Gl4nkZ45Nu0MeNgcu4W8GJfFjjtUdTdtRKkJSdACY6abyV6ujJPR2Ch4Bl8FzKWZe6P9BNwTHk5sl6FOTW7otPrrkpJGV1yHfUx0cbNezm5GOl3GsWT7lc4hS1NTNJdaSPEXpGeOYvXbvwYprjmXoOjyFHlqA23LqAWEJvHozgjxdnh3ta2SYebsdP4umOIwl8O+OpCHE3Un3U6x5czMPWph7Y3faRiioUqnoeqD6y82hOYLGmg1hEubPTpjebuIXEZ7iTxXkcNy0yGpeUezOkaA2N7R1YsEZF8f/Om3cMTYUwZVMNtMzjMo6+tAZStSblOls1vWOi0eBxxyJvfTzTQa4nhJjSo4ffmDN08qIVlXcAE3FhyitJ8rsj4scUY4peI5B32MzD6mE3lzl1BF9BprHTGPowiu5aJ7VL48lW2Zhz2GtyAKm3FCyiAfdUOhjelO0J+LGl4knKSf4dWGFyr1rEKOnqD0NrxhOPrLSvtsrOIKa+xZ6duQnS17mN62tLlvTSuexVS5eXWlTwKjeyTrz/ZjnzVmVsbmmMnpHEZEkyyHpx9SUpbbGqbm2aNePMxC2Wuod84P4RkcD4YabmXGkTCxnczb3trfvHR1m8vPtDb044kZtf8AB6Y4XQr/ADHgdB2jkz5+jrw1N1JTXghKnGXXAbkrNjHFGbyOm1dBTjFlttSXp5DD7TZtYeUG3lv2va8Xw13KLRpZ4Rry8WUoOVRxkz2dWQtDRSQbAx6Vaahy2nTtnC2qCcbqUjpeTLaD12i2FhEt86d9Y3p9Xj2O4iygb36wCK2iYA/1iwRUAJ2gAUq8A2T89dIAFH7mAFX71gBVtAJAN+aAD4j6RGwiv6xcCowA+7ANp94wA/2gBOvygAPP0gMVADp9YBFQCQHgZbbb3ePkn3ptxKW0nKd4LQjsuZb7CFpZ1qV6aSlJ5xz2hvWqiqk8nPpuYvWqVRNTmVsp6mLzVbaC1NKVFOqYlZSsxqnnE6WW7L2YRS5vSQ258PXvCjO0nisZbZhYXUNegjon97Ix2mtJ29JcH8Esu4JllVFKCmqJzOpCSFFOYAZjz0At2j2+Nj1V8h+V5Or+l1jyfkJXDdUmJRXhLqtYEinwzoG2khKUkcx3i00ebjma1XWKaMrE2GkStayqLdPIbQnUJVplUIynHtGLPMWef8bcJapI4FOJnJp1cyhRS8Fm6igGwselrQvPhs78OTcHmMSVytcHUYaZkXFqlEeGjX308yYx5WbyVRaNy4O2JhTglVZkILhSpNjYEc4Uu6LVbBj7DctgSvSCaLVRPEsNzRVmB8NdgcunSLWttWMbc57HOIuLyqVhJtSWmfADjqkm5uBse+kTmp56aRgwVwQoqpwvdwxUQ2JpXjNqSXMwICkE7axXv/FxdXRXJ2n0qcRz9Lq+LpaVZpbcoy0lMs4AofmqTbzH6xNbxkResvSmHVYfkMJplFMhLvh5UpSb2FotMRVx3rZzSuTf+HZpVak3ighSlBPW1uUeZH6O7057jPjVXqxKhhtwotey+Y1jrxx3RuEDDVerjxM94y3QTmVY2ChpFcmLrLWsRp1Si16tV5yVmHm/BYk0khOa5McWfJ1grSsy1fFtPqtSqi1PvKLTqSU5vdSN44cWSIn06q20tsC8am8BqNOeezlI8NSkjQ2j1cWadenDyeP5W+ynFhnFk+xMe2FDalBKUdT1jLPSctlMPHjj1bJjHFU1SaKH0SrygWzkLZIi1sM0qUiMlnm+m8R5in4tNXfSQS4b36Q4+Pqm1Oz0Bhfj3h2ottSZqCA8sZA3l5nS33iORLP+Lt1DDkvRZzNOPNNIeWnOlSRqYjiUi0OfkZLRLlX4heJSMI0pUjTVLMxNKLaLHXXT9ItlxxEunBq8e3D6Xw9xdR6e1xGl6khD4R46kqFyUncRtqIjSY6y6VJY4xpiLArb0jTUtzABV4hO++w6xlSkb2rbrDzlVapVZ6vzTk8lwzS3ilzfMVbWJj0qVrCnT/XaOGeHXabJpfrEutK30+UKubg9ozy9Fu3+LPHWDKDUmfasPvWqYAsG0kFKhyJtCt3PSHM5ioYsSlVNxRh8T7THxNg+KOV72jSc2mk4eypLdNeUr2WpTsos7tuJJy9tov5IU8RkUunqcCp7FDuS/mQ22oEj1tDvtPjX9FrmH8MLP+GKGqbnDvNPAlfoDE/yIqmONFmwM1bHmLEuMuXkZdYPu7q/0mML8vbSMMY06SpuIaK0HEhLq9kZTYgxxWtMrRMBWvFTzwmJpTiXb+7m0EKzMK2mDH+DcXVp55+YmiMxORIudOkb+GVI5ES7Dwto0/RpEJm1XWPKOREdWLHLmy5Nu88KZcS/tc2NPbDdXcg8o1rVlOTbo9+V7ER01UmdsiyCX78+sAP9IIkJVl+cFSZri8TAA/vWLLgVr+kABNvN1gAJ1vAJ0gBUYDIBtO0AH9oAVak9osAVue0AN/tACo6CATYQAE/aAHleAFW5+UAlxADzPaAyA+fCJzw9Bz0j4996x6ZSB+9YLQhOTiArS1+UTM7XrVAmahv5hf1jOY23rVWuS8y82ucVcpTptHRWrn2pZiZzqOZQA29TGk1V2ZbfyqA66Rl1WiVzJqAAUFXvEaaxK1ZWcvlsdYyumUpCtAFKAudNd4UWrj2vcMYfnMT1hmkyKQQbKfctdLScwuVHZIO2vMx2cWva3t5/MzxhpOnsigttyNHZp7JAEs2htCb6i2lrdo+i6xWr4rkZIz3nahnMHy38PdRUXitEvPe3ITf4b+ZIjKzKM0dWzuTUjMJzS7iChaBlAVqE20+0TSsSyw2i1mo4sb9uw0/SXmQ60UqGVOmxuI4+ZXtZ34Y1ChwlhCVpUpM+1JsmbbAbSrQIVzMY+H9UWyalosjwqp6p6bmHGSpHtC1WWCAArciMIb+Zo89hzC1H4pN0+uzRfp77aibqHlUdvlGsRttXITCTuH8H8T516nBSpJZSGDy2OoMXjJ0ydUzitp1DGSZDFMr7Y3lzNnNmvfXlHNy58l+rPHbpPtxnidgdylU4YiZUhopX4hUhNzoQcwt6QpSaOnzRLUmuL1d/hOZE8C+0opSNiU30Ue5jXU3TusnsL8TQqsH/ABckuyzqMqlb5SQdbfSJ8XZSaS0GrTUl/GphTDqlSzj58M30KSbn00i9Y8ak1l6CwnRcN1xuSbpTfhNFlIcHU84re3eUTaYh0mRwpJUaVdU0StOXy6XEc2bj9oZ48tttRxFOSgeMq/kstOVKgoaaR41eNNJ9vVxfs53K8Of45VzLtOXK1lebfTpHp4LxWPZmyeNu9NwO3g+cYmVOEBpQzBWoHy5CNZyxWzLHvPVv+MsXU5/Bp8NIWW2zpf8ASNc2eJq5YpOKzyhSK8yvFgnK1LJfaLnlbToIvFdOv46ZReE01iCqPYkpc0JNlCw82hOltb2+0cmWu2F+R0bXQuNFZoT79DmmVqXJXRnym6gOcTjpOOEZcdcs+nIuKPEuexviNhc03lYlnE2Snc6i8a0xzln2mOPNI9O1V7ithSV4fS1Hl3EA+zhCkBIJUbRTNSYnTlpitIqFxd4fUnBKfGmgl1LeUNiwVfsN42rhnW1cmK0OT4L/AIdjbiUueel0ssqeLiUqVYK6Eg84TjtDsp7pt3LGVbpuF5uVkZ15DK3Upym4IA0t+scuSl3NT9rtypkrQ5ii52cjr76AUvJ62icV5kmOrVZzD09TUFM1JJWH1E5wDcCL3lpTIirwnh2XSZlVLSVPpuouNn3udjGUZpmURfbhmOGpeTxAWWVeCkj3cpt6Wjuwz2heI23vCdDkZ6iJqDy2/E0SQluxAjnv7UtacbpuHKK1NBhuVl0FqXRlPLMSNdecXx4O7ntlmzZZfB1JyeJP5Lq9xKVAkR304kS47cmYRXsGyLOeYTT5l1sKBzeGojfraL24cQrHJmWJUGSW5GjveY5R+WoG5+W8XtSF4bRSsI1Obaamqk8iTYuFFP8AzCPlGmOrHJaXRsMtBuoSVPp7g8CVbW6s31JNwPuYt1VrO29X0So3Klan5RVvWNiUbCLoD6wAq06iCJDf+YwVCo6domAJ1vFlwqPmgAUr9/OABWijm0HKAQqgB7wAqPNMAJIG28ACtAf7wAK/WLAVaDXrAD8MABPPlygB968AKtfmIBFG0APc6QAk32gMgEzD1gPnQqbT2EfHTd+jdESZn1a9R3hFjoq3Zp5ZOVRudorWrSK6EzJTD5usqF9otNV4vENwodFTMU9bDgvnBTGtYefmlrtf4cTsmDMSThcB1PMCNGePJ1aPONvyqvCeQUrSrpaKTDamRKkajlUlClAn12i9aNfK2aVmkqQPMLaX1jG9OjTr5JTGT47qG5chTizlSN9TtEVxzdbJkjBD0ZhLB8xgeTptGel0Gp1Jxh+aUUWUgKUCEqPIBI1t1EejxsfXL43xv5Dmeb46+yrJNZU38+W91XIJG1/l9o9WLav43jzaZFUHEzDKkKta+U90ncxXLRz0qpFK9lQPBVaybW6DlFKfq16mZ6cbWwttSRYjfrEZLa+NK1VTdYC2ywrQt6AX1tGEci9fjpr6MN1BplLycoUFgq9dIfF3k7jP7VL4yfmEvO3WOpAAJ2BjG99OzDb004vViXZTWWQ+psKCPECiQCNxf0isV01rEO1YDxc/PUNDL+dYCQD1V0Mc2Wu1b44lWY3xtM1ulTmHUyalhsZE2GoHWJjNafrKI04RUJBUq+ptTaiANAbgCPQwzWY9tIlIqFUM+1LtplUMlhsIJTe6zzJitp9hzDlLdq1ZlpNKkgLUM2YXtrC/wehcMUV+gv8As7DxACQrNyvtYfSOfFbSmaOzc1Ygm0SqmfF8wTbzHeLZb7ZY6ac1xNMTVQu4VAlsk/lnb1jy7U36ejjvpU0fiTL4YV4zjxW8DbSOnj4Jr7ZZp7I2OuLz2IqewmmrUh1aj4mUm9hteOq1WOLB4VnTahXMRYPTIqWUOOpKQrmT0jC1W1p7Oc13BNcwbNMTlTbQUFzMFX0Ijecs2rpnTJNvr0Hwxx1KzFFYbbZCXFDw3Lg2PePOnJbHbbPLStvrZF4foU5MOT38PbDjnvqy3vHfTH569mUXc+mODdFqGIpmbeWGmnL5E7C8Rht+3VrGRpeJOFtQVPOSNJSH0IBAzKJIitc2iMmlHhPhHVqxXPY55stSUsrK5dR82ovHVTkItm06Li7huzhlUvUMEtn2hCQV2UdCBHJOe1v2lasRkW+DMBzXEB1ur41mFKdaGRtOc20/8CEZf5P6ytMRjdPlWZXCzaJeXUkpYFsylmwEcWe9sV9s5nyHJPHlNrk3/DUTyFrSrKpOhAPrHdTkTmppnOLTZZqlU+clR7UtCCBdJB2EWngS5pvNHNOJVJwYzJlbiErcCRbKAdR33jbHx+jXHkm7SV8VsIYbpRkZeRK3QkflnrF5wQ2vWbfWoT3H/ESkqRQ5cSLRJvl1No1x1iqleJFvrZOGvH+cw+4qar2SbfWTkdeSSE/KKznmZ2wvw4lvNQ/Epi3GCUSNHkylCSAp2wCVa8tItk5UzGla8OIdKwVWH3JAPT5JeULrzJEWr6YZI9rGtYycbUiVbUkp2Kc19O9o6a5NKzHp1nh7T3GqK1VJrMh2ZbCQkp3Te4PpFu+zWm25um0Pq0ToUWQQqgB0+kAGa+yoAVcu8AhGkXAdYBPiMA25+9YAdPpAIoxWAP8AaLBu/O8AJO56QAnn0gB/pFgKvWAFW0APw+sAP6CADT6QCKgEgAXuIDID5oqRNL2Qox8RL9LS5OizU37za7HntGlYGz0nCKUgLU3cjUR0Vq5rZl2rCoSkLyAACJmrC2aU2m032ZJTlsSesKq2nssnJVtxGVSQR31jSYYTGmj4owTK1ILcS2lCjciwtaKzGlqy5TVsIz9KcUplK12JtYg7Qi2lptKDK1iYlVBp+6Dmsc2n3iY/6S1x8jq9L/hv4YzGJXpfGFWk1iUWoeyhwWCkpNy5Y62uMouNdxprHfhwRWHj/lOdMfHpCqMy8xPNTLzaFPNJVmtyKttewFo2pXWTyPBxW8kblWOPFt4/mBAOQpurW4JH30+saf8A2eRG4iWTE9lZKc2sa9uylaqeanN9TcpsPWM7elphW+15Q4lTlyfd33jGI/8AbWKq5x1KnFuZrFW2l40jpH1aEJ6ey+UKPfpGVY2tLTOI2FZHEkg45LoSJsDMhWXc2jlzVbY7ODuV2q4ao05hOdpwdlnHCpJUjVKr73ivfbeImGwcI8TStNmHJWcbV4RGqt7dvnE9ex7bNLzWHZ/Ekw9R1FUwVEFlWyuu4t0it6x/isTs1WMCy9cbdnFpSy+CpSUhOxiK1t/jSIcXq1LqVPmHZOoN2IUcqraW+Xyjov8ARs3C2lvOVFcwlX+XYp01JtC0+h2puc8NgKUr80jzdRHL8REdkOYnnPDdSlZKym6RET7axSIc8xFXPZGVsvZ0uLBGyt/kIxt/fSY9NEo9EqVem1KaAyElV1dI9C36U2nr2b1h/ArMlMImJmzpBzKTbQRyWzNLz2dJkEySPBaZbDYTqE2tGFszGY0oeMUvO1+Rl2JVoENEBShYWjScsVtpWJifja8AU2RpWGZdsoSHwjMtW5Jt0jacNclduTNEz8bImqBCQlCrj6Rtht4a9VepoTCnFlSr2O8Vpj1bstFQyri5OYU+0lBK73Khc+kVtg0yiUinNy6Zh2ZyoQt26lC1rmFcSto2mrLBUovNhYykBMXzdI/WF8czVlFl3JVJalElKVqJTytHLGPw/tC15my2mKD/ABBlyVnMyg8kpN9LHrGtsVeR7Z+To4/jejzOC6jLfwmWKALFTybkHzHfvoIUxRi9OzFbyLym4zxDiSX9ll3EMlCcqlZrXtzj1seWLML1i7WsTUnEj+VEu2p9a1Wz3uB3ima+kViKK6m8G5qcfFUrU8nxFjVKBvGETMr35MT8DXuENOZZPskwQo/UxlkmYKZZn4h4f4V09t8zVUmS8hGyQYtiiLQpOSXRKRLU+kpyycugN7hOXWLVpFp0r5JhuFJqVWqD7NNpcotczMqShttIuVKUbAfUx0OS/wBdi4c8GZyTnlVfGyUAMkKalQq5KjrdVr6dt4t1WmPTsWbMmybZQAAm1glI0CUiNIqiY0JObltF49Mp9FzH7xZLP3vABfeAEaX6wCX2vAIVZtouBJsOsV2AUdL9dYbAKOZIhsCDaGwPxQgCdfTvFgG/pAB/aARRgAOx1iwHb1gB+kAhtygAVon5QAK0vAZACowCQAqV2gPGcvg2Ub1sCB2j5GML7n+RKyl6DKosG27A/wCm0XjEfyJWTNLZbT7gFo06qbE/LtqTkSkWtrDqbV6pfKvygW15xGlpYpJTt16xrSWcwjvtpc8uQaxWzOfSjnqKw4r/AC063BuNIxtGyLKyi8HJXGtcYk0y5LRV4j6suiW/iv67R08bFOS23Pys8YqaevMK0mUw3QmpGUBaQwlLbaf/AI0JSMqQOn949y0da6fK5M3e+1dOTnjTS03AUQVaCw7xjMaRj9KaozTqmz4KkIWFJzZk3uAb6dNIr203mdoE1OJKleYgE3HaI7LdVXMzozeVRAHyh2T1VsxOZgVNqNvpGPdrFVb7W4p1wOPlYJ8uUZYd09TE1OJHlUo6bd4p3WiiC5UErulwkgDUDeHdrFFFWqdR6xKuSs/JoUlaSkqy2UOhB9Y5oo17banQcFpoU28qRmG1tOpyqbdRfQc79Y0iFtGHsJOUuuorlDeDBR5nG1G+Y3F7RGhuaZ5bv51sql6q1uD105Q0K2fotHq1zOSqVrJ1NrEdYRIOnUSl0fM5TWQ2oaDuIrZMSV5SVA5kXN9dYrNSIMNuMtzCHlAC4y9dozm3VpEGq3huXrEuVKY98k5iLbRneO/7rfZ2osO0oycy4ylvI0FEBVoy/leT9Fss7jTYHJhqXcc2Nhy1vEz+zOrTqrjJ6RqjTSXAlGax81hF68eZJhuSpx6rUVUwytJvqDe8R4epN8eM/hNualZNxc1Mla3TfLfQCOvFPVz3vjyNgbcVoU207xpEM/iQ3MZrpVoOcJg2JIczeIl1IA/1axnuVJnZxE0lxweImxGt084blWZTlT6khHhsApJ1N72i8QmLJ9PqTbdkuOlJvmTlTcgxtCtq7bQzVjNNo9qslQ2V1Eb0ttlaukHEDFNqDK5eZS24habjS5vGWWnZak6aoxQqfJ2TJyyUH+bNaJpXStsm05LbEunzKuBuM2kWtC1LIc5UmUoIl02A2HQesVtCI9KGcmlKOZdlE62veEQvFkVLYsQnY7wnGrNj3/Dt3U8+G2hcEqNrWBJF+WghH6qTLqPA+iIxRW5KaU4tlsrM0hOcpWGGkpIykanMSkG21z0jSvtWXqM2NsqRbRI1OiQN+57mOmvpnIwNouqw2gMzfWASAEq7wA/S8AO41gEUqAFUACvdt9IAOnSAH/ugBUrXtACb84uAUbbQCdfSAA79rwA36esWAfFAYraAHffnACrYQDat4BFesAkAijADp2gPNLfh/wAul4+dfaejy0NpTmSk2MTs9GlX5J7xXa2jKk5r8/6w2aRXGfNflGcoMKSLm94tURlNi9xbSI+omNor4Sq/IAFXraGiKOvcJ8My9KwyaxONLL8+pSkqBIIbSfKm3QnWPc42CKRt8vz803nTZqxVkstXSVXWPkDGsz3nTzPHqNtTZqniT3ncF8qk76RhMuu1NItRmjfOknKPejGWlK7Uz9RSu5Sskc9doz7S3iqtmJ3xLgr0Gm8O0p6q1+fyulu5sBffeM1+qvmJ/KfEQokHvBMVQXKgd8wJGo1ii0Ihm1XLmbUajWDWDD04kglwkH7RaVumkVU8rMVJ1IGmttIzm2logKagld1FaSNjrEdiKhE8ym/56AAb6qtYesOy8UB/H6YlWVVRlwR/9xMVrJ0EnEdLUrJ/EGNf/uJH9YtKvU4qflXv8maYV6OJP6RETsiAycmKtVJdlLqcgUM/mv8AS0YZIaRDcKxLvNSJlZdsBCUnzdwYztbpTqri9xtqU/MMyOVvOi6gM29r9L2jgw4+t+yu9zpq2JZxxhlb0ncnLdXQR6WKvsq5k9OOTswfG8+ZWZOsd9dQ0mHTcGpnJWX9ibWtdtch2AjC87Y5a47NylnMlvKbcoUjbCtcdU9Exlt5vvG1VJGJrw0qVqdLxpMM5kDbxcspSlJBufSK7hEymy7qcp81rgjUw3ColT5ZT4YUQBt3iIhMxpYSNQlHGylSDnAHmiy1ZWrNSCU5VKzdNdo0p6UuSZqHhtlwFJ+esaK1jasVWM1zmCT01iN6Z+NWzlQmHlFPiED13iu1ojRhLiiAm5sNN4aTJkozOFQVaxMaVhSbaSU5W0lSrGw1trEb2mIBS201qYXKuPBcoy4UvkJy5lb+GNwQNlH9YxuvFXozgG3LprE2ElCVJp+VpkJ9xIUASOlwBGuL2yl2rp/eOn4zkXu3MXVJe8BkAJV0gB92AH1gBzfKAQn5/OAEm/aABX6QAfpACTsIASbbQAG/8wi4yABStxAASIBDt2iwFO0RsApX2hsIpUSB2tzgB+2kAO9zACVQAlVu5/WATMYDy23Nf/cj5vs+56Jbc6lTeVRsR3h2OoVTGoF9DoYgmGNuJUr3tAYKzGxLSlQ3EFUN5OW94CGrXN2iKz6XDIya6lUpSnsoJU+6EegJFz9P1jXFj7S57307zVp9umyMvS5WyWpdpLSUjllFo974+SyT5rNOrFU/4cp8S4SddYwvZrGPUNWZq6GZ5GVSSFq67XjjjI6rYolZ1B9asybgBSbmE22p4+rWJp1LSjlzAjXfT5xja+21aq56eS6k7hQ315xWLpmqrmp1SbE3JG+u8T3TEK9ycUgnykggkAmxI6iHdeKK1yfGU3SRpf3gYp2X8UKyYq+ZRSHCPnDe1vHCmqGKlSoKFOggb3OsafWnVqtW4mPMrLcuyHLaaq0v1h02dWtv46xVOqUlqcTLIO4bTckdLmL9alo6IjMxNzzgbfmph4E3UpxxVh8hFJiFqVm67kaWV+7cgdRe8c/Z3140JiqWwElLrYJOo01h2a/x4RnKe4FBLLrrYGvlURf92inb/F44tdbdx/DxgMVZL2KJp6ZcVLOKl2WsxIsE3UpQ59o3xUn68bm38E6dUxMzKyKjLZkgKQVBJVra23reObkbc/GzxMOM12kT7Ly3VzYWwpRUlPJPaOSlph1xPaUNxozlOXJLLS3FjL5Qb29IvfJq6ZppqzOA1e1B2xCWjdKdbmO7ybozm/VtNNTOyKczLYBIIJ5xEM7Su5V8+CFKUADv2EbQ57QdlZxLzikZsoRtfY+kWorZYM5FKH5osTrvHRtjvRmeqMqw8G05hcgbRmtMnVPpASrMbHUawZyZdcU4fesBtERBY7LOKbUAlRN+8W0tSdJ7c0opNlEEDrvF6QraYIJp7w1KdUQDoBfWNFI0hTnjzDJbZmFMkm45xVSI0JvMhASpalkAAqJ1JiumkSMKscx2MIkYpXhtqfV7gGa8WiyukdU0JxRZlXPAWsAgjXTmYym+28U0vqG0hlSUsuKCEJSlLabZbJGp6knmTCsqWjTs34e1VZziBWpucly1KGipbZvsVF0X+0bUnTCXoPoesdETtnJD9o0VIVQCQCX/AHeAHf5GAFX8sAKtPUwCcr3gAUdxAArUZekAPRMBm0A316QA/FACoxcITvbeAA/cwA9YDFQAfSADrrzgB39BFgCukAitdIAVQA9zzgBgPHrM8o/Ft3j5bb9BlJE4VbKI+cNs5k+ib8vvXNusaKnGZopuc17wVmEtM3zuPrBEmnXPE+K3zgzmTX/LXoLhPXc9IVqvPxe8P220YiRNmxLBKU6fERr9I7uLHt5XJvqW012rFyf8NStCom+bn6Wjpvll4+PH1jbTahVtXW1WIUSfe25W+0YTfbXHPedNQqFQ8NRLZIIVmBzbRxTaYejjwzZZUrFzM+k06YeLc0B5VK0Ssdj6QjIjJxkeoVAeItKgQQrXrCPalKtfqE88i7zJAF72vvFbemvVUP1pLiglxZQfrFjx6Vzc02ylwJmHXg44XCVOXKSeQ00HaCfiumqg2yLNqUBbXW+kIhMUmWu1CqZCpTbo0F99Y0irWMMy1OqVJyaUpIuQdCc232hEteqsFPsrzXJVre20aRY6nPZcoyNp85MLVlSad2z0mhDwwnKbrAKlZd45rRLpxYurY2ZHwkhCEgG2neMduysSx2X/ANNzz0htadmFSYTqkEH3j3ty+d/tFJ/vpSa2xx7ezeC+BU0PBVNlgrI67L+0LWlNiSsXsdeQj38WGOkS+U/J5ty1/ihTakqeCUyCFKQkltaQQRzsR/vHncjUseP6cixlUafMUkyFSl3JCooNkq1CFEd9LRyUpEvSxXabQ6HWGVieQ6Xc11A5r35xwciNXdfba/a8RbSVqJQu/mTzjuxRujly1R/a2w2qzgIRzzaH7RrUvXSSy8laElF8qk6ciPlHTVy3tpLbzJTbKCeWXcQqytbZ9tzL5tdO8aTKsRs6HMys6koIsRYi8E7YtWZISnbNtvBGhBSU+RTeo77xfRJ9pTabKyjTvFtMpnQlPXN7WsfW8WrCk1kiphSl6JKjbpcARaURSQpJXcpSpPKxii8xo6lpSkntv0i2mcyjzT2QFtIUbbEDQxzzLSDDz5/hi1OTCUJbspSeeW9tfnFezWIVtNmEeIptvNYEgHnl6fOM49u6aOlYRk/EcaUU3sNe8dWOu3Hk9PQ3C8ty9UCTYF2XWjpsQQPtG3XTll1DNmtyjasM5KT5Tz0i6oCbd4DL6dIBNBAJm7QA8h1gAUdCemnrAB73O0Ah/wCq8AioAP1gB96AFR5wCbfSADvzi4bUbG3WADNpprAZfW+kBkACja3YwAq1gAJ8unSLBD5R6wA3+KAG/WABavLAJm6wHhyXn0p3Vb5x8h5H6RNU9ud8oObfvFuzC0JDc5tqPrF+yvRIRNpKT5h21i3Y6H25oaeaFVMlBKmhbexHfeLsq1JLzL0w6iXZbU444pKEJSLlSibJFotFd5OzLPbxxptlPebouJP4KXEEyaA3MOJOqnSLmw7XsfSOzHO77eFmye9krc0rxi5mIyLza7xnksrSOzS6pUUqUvKrYnnGUS7KYZlRzE34ySnKDbubxzXu7seOMaomUOOXcSMtje+Yi1unSOebuyuOMiBOYkmJdQZTMFZCfMoqJP15xtWNMcuFCcxSlxsJUVEkeYxr9UpTSunKsl05kuERLsiIQnZ5SveXcnaxt+kZzCtqxKvmJt9xRT44vaJiul6RCmm2XJhRSly5567RtFtLWrAmaQpKR+Wo3303ha+nLFSzkv7G0PMFLI36Dp6wrfatqrGl0fxMilNgrBCirqDy/fSJlWs9W4y8j4LSQE2N4xtDauUa2MqSoXJ5doxq17kMv5QrLrzi0xs7p+H6SisV6m0xSbJmZpppSuVirX9I6MWPyXZZMvjxS9/0+jy9Mp7cpLkANNpbTbYAACPoOvipD4jNfy5ZVdXbpAl1qrDKFFGqT106xxZMkaTTcy4bxEwph/EDaFS/hBDSioJUL3N+Z3jyc/uXr8edQ1dGHqbJyqFB5hpSE5SgL0V8orTD3Tkt1cv4lVhnD6AuXWC+6cqEp3v1sOUbdPG7eLhnK5UjFVcZmjMJnCtSzqCkW+kVrDa+JtdD4hsOuJZqbLkuq4T4l7pN43rDivh2zEONp2TcT7AlbdzcKFylaf6RMSpbD1bDhjFX8YCJeZQtt/Lm1GihFnPb02lDqdE8ibRanxlE7U2IsSO0YtIYlitTqspUpVgkdYV+rRG1lSJqYnpJqYmLpUsquL9Dy7RaFbyshfTzGw6bmNoZi8qrZVDXvrBEkU35wFZkrtcZVWuItEKpTakpTdth1Q+oHqYpMqMlWavWZ0U2k09+ddcUEpbk0Kd1PWw8vzMUmF4s6TS/w247m5ZM3W5dqjJH/LecK3TfYlCblI6kmKTjna1c2nHsbSM5hetVnB9QSFTslMFpfg6tKSPNcE6kEEEGMc89YexwcXnRqFqtG11Gyu0c+K/p18jVP1dYwqvM62lJAsRcJNyNY7cV/bx+Rhin7OzYOeTK4gpaw4SlyZLauQCVJIv9SI6L+pcMQ68TlAvyGvYxvWfStmA94vEsmDYxaJ0EUf1iBkAioACb9YAVdOsAB0SRAYdB84AL3teAFWpEAJV0/WAHbYwA91QAc/SAbV5rnYiLgcvcmAKAC+a46d4AL77aQGG/KADe0TARXrEgFnlAIVAQDatdVaQGQHgVxTjZuSdI+LrV+jd9nWahmslRAEdFaGtrBqaTluVRSGXY+3NJt70axB2Ppmk2977xpClrbOJmtfMoAEgetzCU0rt1HgVh5M/VJ/FruRaaCwXG0qF/zlAhJ7kbx1Yq7w9nk/lbdJ0p6TR3p7EE3VJpwpcW444Cq9ySom5+sWwTuNvGmO0bQ8UzDjLq7qBAF1G+5jPN6dfHpuWgzdUl8yi8QBveOLyaezTHGlS9WqeytfhvFZy+6NPvFJ9tpwzKkqFYdmAUpORB2T/vFq4trVrONUOOA9CbWjSY0ra20Fx7IbJtpFq+1IBmT8IBO8SpMSYcWoaf13gtWsyVmnPTCioN2BuL8xEzO2taTC5p+HUpQFKQk8zfcxWY2rfcHHpVLSwhKxp8IF7jnp6RXIRKrcorf8Sk3F53fGXmW0oWFwdPlDGraW30mjqTdRbABUbea4B6ekdEsrVWzkmnKNDpp84zmClNo65bfKNown019g9lzKA1F++kWr7PbauGVNTOcQqFT1JBC5hKvQjaOvj263cvK/bFL2hPTHsMn4biViySVaEm/Y9I9bkZN0fHVrrLLkmK6hOz3iOSc4pTTSSVtuEg37HnHkXyS9HDi3Ll2LsRVCm015TTJSSkqSVJIA06xh/Z6MY+sOY4IxNWsSV1+TnnUqQ2CpOVOg7XN42rbopenaWm8RG5icxFMzDhUUMKLaQn4QBsPnGOXL2e3wI6Q0zwcqrFO+gi9UZZJMSLjKUuOJBzHqdY3hzfUinVOakFWbUFoOhbXqCOnaKxO0XiJbVScfU2TcCZqilgqVdTjeo22t0i0S4b4tt8pmJ6LPhCpObRmIv5lAEfWNsfxyzXSdMU2l1lAbmW0P283vX5g8rQrHtjNtJSW22UBvKlCGx5cqhYDv0EWhFpQZjEFNl1lKnnHVo2bl0lZPz2EWVhB/xNUH3AqTpYQAbZnrknpcCxB7AGNIhaXSsB8NeLWNG0zEjQmWGVCwfmkqZb66KVckWIO1u8WiNsZdwwn+FymykwzP46riK2gNKU5JMtqabQ7mGWyxbMAL3016iIiqjtNBodJwvIil4dpstT5VF0hMu2EE6km6veVcknUneLxjUmyW5c3A26ZiAfpvExXamnjn8XmC1UfiFKYxZZIlsRyqEuWJsZlpOVQJ/1JAOvePM58afRfis/jcipjzKVBKiW9Oto5cVXdnwzk/Z0jCsx7OUTbK9h5lbk+gjtxV9vLz7yfq6i3U3lSjVSaQUmWyzCVKNrkEGwHXSK5MvtxTD0J4jbyEvN3KFtpULnWykg3Md2Ge0Oe5RYDyxqTBFH6xaJZsuB0vEhNe8AOiYDM3SAHpmttAB/aAFWt+hgA5AJgEP3gB93nABz80APvekAKukAh1uNbWi4Ec4ASem8A37tyNbwXJprbcwA/SCuiZtuZiYNB69YlAVHc/SABR62gAJ/WAHfeA8NVKTWyrVIKTHyUV6vtMebcqZ9ssq8ukVtZ30nZxiYVlAVEJ0kB7LfzWi0St1SWXkn3lX0i1LahE0PCYSlJUpXlAKvoL/0jTHO5IjT0xwGpb0nwnn64GfEdqdQUlCQkArQhOQnXlrf1j2c2LWCHyH5nLGTkeg4kp1NpRW6z+XkbCFZlWA7Ejc94ymuohjE7ckxM828yrwyjKs6lOt/nHBnu9Dix7cvryUs2Z0IUVd9I449vbp8apNOZEjax12jelW/xEcmElPICF6s7Rswp7ymxGkTCu0R5zNrzO8aQwv7B4irZdyYqLikUR+dR7Q+ghI5bQG0SdHVkTlSBqL6d4K2yrVbLMrLlKmwVW105Qc9rbahUm3PbMrSElzw1KCb9iP01hHx1Upuh7CzKZyrPeOhGbxENo8twk5dT6Rphj2cj9MTcmZFErnbQCCFHNvf1EbzVyYsm4K4nMR0GkZTVtWdya9n3y3jCY20mxPAUm558ukWrGmc2XvDdlyVx9RXPGCFmZSQrbKLa6xthjV2XIjeKXr6YeeVJoS+8XFBJSoA211j0s/uj5SldZZcixFKvTVTLU4lbDQPlOY2UN48SavWwZOldNY4gPU9vD0xLTKUuoDShm2y6aRattK0tu23HuElPbSZ6aSmxCjkV11P2jW0tM0dbK/G2HZqVcXVEILrT6lKc8t7Exy2l63D5cY6ueVSm+HZ5skI56XN40iXdFYv7hGVmmJVLbm6dehjaLMctf8AEVEvmVlUm4MRDOWexqCV3Bv8Ou0SxkymXKVZkhSSOhIi/ZS2KEtuankJCUTsykdA4oCLRZn4Ydh/Dbw7b4pY4dwpUK6uQL9PemG3FMKfzlqxKbXFjY7m8bUlz58UYavW9J/Bzwvp6krq1SrNVSSCW0uJlm+3ujN946NbeHOWbW9Ok4d4S8PsJJSih4RkJZYSB4imvEcPQ51Xue8XiFrNsSkt/wCXZIy5TYaEdLdITCsMVmJBzK0216cvTtCESxR1MaQzmA6a21+cLT2lNY7Vc+45YJ/x7w1qVNZSj2+RT/EJFxQuQ40CVJHqm4tz0jmz4dw6uFk8dnhCXV+YhWQkHdN9u3y2jxv6PqsV/wBW/YVcyOJfzG4031PrG9J7vP5F92dKnpnNhiaUpS7hHk8x0Nja0Xy4v224e+3ojCM8qewjRJ1xRK5inSy1K6qLYvHfh/rpx5Z2uc23Q9ovWGeT6QlOu940J+M67xdQhVADp9IDMw1/vAApX0trrACo/SABWu20AhN4AdtzACbmAFWuggBJt+kAIFoASf8AeAS4/Zi4BSk/DveAbJguG41tADfy6wTMhzJ05/OLM5Jm3vtAIo+lvWAbWfLy7QA3GioAYDxzOS6XkW0AEfL5H1OONS12elFZ9o47e3pY76hAclym9tLRZvFgZeqtIs2iTratct7aQmNQud8bKjLub/0MdHGjcsL20930DD7eE+FeH6GcpeYp7T7ht8axmV89RH1HJrrjw/O+VlnJm9uXYynmJh50FKFAgBXlFie4jzsk607cE7s47iKyX1Nt2Cc2iQLAR5nJrp63Fj25nix5SagltKjYIzDsSSP6Ry4/r16/Gszi8zeXmBpHVSVpuqi5lUUqPpC8kW2RakpSRz5xDK0o6s2isvl523gz+tiwzhtyoqM08hSUHRKVAiKNKt+lKWG2fdB+0Gd50kpkwgoUvRITmPeN5hz2hAqavZ5Z2acv7pyAak9ozTSm2qYflGqtUam1OP5UIkX31FJNylKbhN9xfbTrCvx23t46HuG4mVe1JZZT57OZlHUJGtte0dGCPbO//TE3+bdVMPOvEC5CUk2tmsI3l5+GPSCpJ0ANhGMumn0uXKkd4zrG2kwRScyTztFpjTOYOSHiN1CWcZcLakOoUFg6psq8ZxbV02jeKXrCaqSXqeJjxr3Skk7X8o1j0rW3R8vauskueV7ElPemLTjhQUDy9zHlRO3TmjpOnJOJWIpaZpy5dL2q/KdfeEVtDq42PftE4ey0uilJKUBpRSdlEk2EWidr8mNy29UrKTi/Z0gOJWkZsydCbReMe3Puaw4/j7DrOH6yjw1AsTQulvcJ+sZ6e1+P5Hlr7aBOya5V8qtdoq8vYX2i2nbEdrG0slSwpBy67ReHPJ8t++m1yALdoljJlUvvtERCltsEre2nPWLaZxt3j8Ic2qn8asNnxCkzLj0qbaXCmlafUCNcM+3NzKzNX0HT5kjMbkgZr6jQD+lo9KkPBpaKW9i0SbDaLRCLWDmy9r6wmFYsTOMvvECKgFqF75rCAHMLGyjcn5W6xake1a261adxUx1ScB4VqM1MzTX8RmJdbclLZsynXFpKQoJGoASb3Oh5xOedQ6uHTyWeFqfIu+6pJBJzXI1JOt4+f6930eOf1bPh9SkKWk3zDT98o6KV6OLL7k/jbiUzRKKuiy7wVNuJIKUpCykW3VpYWjot+0bcvXT2TgVpLGB8PMhWcIpcr5uuZpJ+140407nTjy+pX5IyjlG9YVyfQ+W8Jkn4y5/miyjP3vACVdYuA006wAnTpc6wAqV3gBzH9mATMP8AxAIf3rAIVQAX/d4BDqbwAkmABXPneAD9YuAUflfvAAT9ILhKtPLAAVHXXfvADmH9osMz3goFRgBUr6QDZI725QGXPb6wHjdU4l22u0fM/X2M10Ym5dLgzXA/rFfHtNb6UM0oocKCfvGXV01lBcc3ureHV0VkKXTmGVRHzjLc6a1++z8glyaq0nKNhS1PzDbaUWuVFSgLW+d/lHo8Hbk5laa9vbWNsWTVPedpKnm/DQlLacmlsqQkg/MR7efPFYfDxhifjms9+elxbqSFEX15x5lr+SXXjrbH8c3rbCRO5hzzA+sefnl63H+uSYvcT/HJltKyQ2Ep9Da5/WMscvVp8au89qfMTbTeOunpW6BNLBsU+8NTbeF/ZW2jZezW5k/eKqTbs2XCOGXqtMiceQpEsjyp01Ur06QIjTqclSkstBtNgANABoIbc97prjLcm3ZKQYnTLsrpp5Cr5lbC3cRSJ02ijXa9leIZbcsjLdVzsOZhM7axVq9Hee/jglpNoLM4lyVSV6WbUkgH62+kWp8bcmO1trDDrLtLqkzTp1S2nU+V5Nh5Vc0gjcWAEaUj2yye66b4oIeaT4CiShOUx6EvKRLK+LlGcw3pYLjiTbqIzr6a1kHiG3lUbc4zutMM8UNqBTmB1NuRjIrGq6d2w7iBdWwfLzGbztJ8Neu5HOOvFLxOTXVtua4mrH5y0ON3KSoebaPNn9HRit5HGcYVdb8820UoS0hWljvG2KG828bfMA1OVmGmJeXILgTdXoBqY1mmmEzEw2+VqfiIUWVWKVFRJ/lB29Ixm+nPWsTLlPEGqLqlcLYJUhgZUXNwFRXb2+Fx+rXCwmYbLMxotZ5cldYbej8VCmHZd8pVfymw/vCLMrVOZVBKlbqNrRbswtQ74aXGwvYjcRNVZqwN2APeLSymrrv4YZV5/jZg9LKinw59Tyv+lLThP2i+H3Zycn9aTD6HoWNOlyPsD+hEet8q+br6yTIs4VFonaJAoi456QmNkI7s0zLpLjzqG2wLlTigAPmYrvSf2a1V+JmCqLnTN1ppxwe63L3dJPrDunrZoeKuOkw9LLlMLyQlQ4gpU+/q4R1SPh9I55zw6MXHmHFag/OVWcXOVJ9brjpIU6okqN999vQRz3y7d1adVfL0kuLUpUlmU1qry+8nlbvFMa85pxpX8AdlyXJYZHLi45KHWNphjPJm7i+Oqe5I4inmXSshxxRF9z5b69rxlaXbW26votgB5tzAOHFJ0/8ApMoRl20bAMdOGNvI5Huy/wDEuka7x0QpMlvrFbe0M80Sozzd/rFghVb7xMASeat4sAUdOnIQDdzbuYDFf1gBuP2IDCehMAhUIAFfaAEq/d4Ab205wAk78jAN5vvEwBUT84sGyekFwqP8toASR84sG/W0FGZkp6QCKWmAbJ+cAJVvbeARbmUDLoYDxDKz6XOYj5KLvt71S1zAcSDrpGsZGXRR1JV3AsaWN94y7OmsKxxzvDs6KwjqdVrZRB9TE7hp27fG78EZqkMcTKDNVxSDLMTHiDxFABSwk5ASdPetHqcGYeZzcV7fHdqhial4sxxNYbZmFTEzLS/tsy4hSSgqUrzNhXUE3uYm8+R4eTjzgP1qQ9nZJJWMmZOVSlKIt32Pyila9UY8sf65pUGnHJhSgkGxskciSQI4M1Xo4PrhWKFuJr1RS6ClaZhaVfI2/pFcVXpV+NfmHPN8hGyLIbjmYZfrBha2kvDdHfrVWRJpSUtJVmdXfQJHIesFscO20WniUl0IlmyhKUgJTa1gBt6wMluq5aRkTle0J1iIlzTVEnnPEbyp/wAwe6OojSFq0VDqsiTmyhViU5hcX5XjmmdN4a9PJ9odUlSTY3Sgc1dVHqBCJ2ttr08yiVmWZltIW2kJvy8oUNfntHRT4mbdo2dnHEStYE0nIUugupczXN1Wuk/SNKfWM236b9Q5kvSoczApIse5jo7uGasmk3USkkD1h2KwgKXunmYT6bUnYQ5uncDQ94wt7dEQLxNlDYaRgm0anTdcB4sap7blHmXAhiZUMuuyuQHrHZieXzaajaBjVTbfjqUoHLmJ6a6xwcv9baZcaOrz/iSa9qmlKbNgFG0dGOP023zR2bLwxqzlNqiStwFLifDNze2aNLW2z8M6dkeTKycs7lsVpZKlJtrbdJ+ZjmtXbGmKduSTzalzLrzo87hzDsYy2+lwW9Kt5PhqzZjpqdYbaz7k1NM+0ZHkpVdflGp1MWiGcyiBPmKFE5keTfnFtM5OhvLbXSJqzk82jUmwMWllLvv4OaMqe4ttVRSfJRqbNTX/AHKTkT9yY14vuzz/AMh+sae4U7jzA63t00A/QCPWy+qvn9anZcwubRaI0pJpSruBKlEAkX15c4TOiHB+KbPEKv1x6TbpdQmJOXzCWl2JclvKFaOKNrKJ79I4rZJdddS0CeouL5OcFNew3W2nnLFP/BqIOmwKRYCMJyy6q1rKprScRUT8zEFBn5JBy5VPMKSlRJsBe1j9RGFpl0Y4iTsjNOTSVjwJcttqsfMAoK5gDnFY3KcnpcUp9x2TS4WXUPNqKTfLoCdD9I6MX1hMxkXUlLtTTgdU2lSW+RFxHTMMZrFXN+NvD+YmJiWq1Nk1DOoeKpKdTm01019I4sk6dOK24eouDUwp7hZQmnHip2UlUyzmYWJKTt9I6eNkcWb63HN7sdtvTEubXn9YrHtMQK/r9YlmTOB1v6xYJnEREhL9P1i2wKj9SIsAJ0gB/WAzMNIBDrACo20gBVAJf0tAASOUABV++kABVv2iYAE7iLAM3aCdhUb8wIGw3HWCwScsFAFfW0AJV/tAApXeAFTm/K0A24qA+fklUlNL8O+3ePjYl+h2xwvWaglTY137xtWzC1IDMKSpJVcaC8NorCmmlDMeVu8W26KoKleY6/eLb7LSbU8U2CTY3012PWLd+jOXUPw21JMtxXpkjNErTVEuSqrm5UopuL331THrfiq/yJmXn/lq9MG3pjiRSSyyHkKKSElJRrYKvr/SK5q6iYfL8PJ2iYcndk3EPpUNClQOblmOwjzs8PZrf9nmjFaZxmv1NuoWEyJpfia6Ek3B+hEY4409Ot/1USnM49I2qpkuiPIWpxGT3lKCU/OE+mdZdXwXh0UuRQ29/nOKCnOx/dob26LR1dAk5dxvMpOtzc+kPjC1zzjH5aEt6lxR+UKsYQZpO+azZ2ELNoUUwhzOtK3BZCST9Iwu2Uhcb0cdUc6kKV6JUf8AaK1WhS1VkTAUlKsqlpKldAn4fteN4Jk3IMvVqlCxQZqQuiZTltZKdAdukaQwvCwwzWSzml1XsSQnXvGsejNWLNsTMp028wjWJcsY4hHmmLp8RMXqrVDUrKBytFby6Kmw9a/aOe1V6yT2hNwtLgCgbp9RFYnS002tEzn+J6e9JPLtONJKUH+cRGaO7C+OaOW1jDM9JzhaVLlKRcXvv3jPHl8LKJ2scC0WYcrsuy2LAKClL3AKd4pF5XvaK1d4VTW3pNLKiC8s5luf6Ry9I1iZeXOSKW257irB87T3TOs/mNEHN2inj09Tjcysy0mYQrMU2B0tFZjT1NVywZb8VKSjnsNecX2mnxDmFoVMqVspY83ZSdD9ot2Z79jb83XnFa+md0iXZU4MtzqddeQ1/pFp9sdPZP4McOJkcK17Fkwzkdqcwmny6urbQzrt/wB6hHp8L1DwvyNuz0YHEG9v5QI6rzuXm4wqcT+zEwpNQ+InUczrCVq1Cp6105zbpmO0W6wntLErVl8ryxbayiLRXUKzMoNYp0tXqTOUSoXclp2Xcl1pVqQVJslQve1iBGVqR1a4/wCzyrhXD6paYmaZPN/mycwuXct8Sm1EKI9SI821Y7PQtH6ridbUxPNsSSGkCYNnVFWjQ6kbmNLM8W4TqCpLNTbl/bGUuqcS24HCcxNviGwMXpfSuWZlvFdpbfsLPtg8QKUFJ0vqk32+URlwxMMa29rzhs5OStLdkZqYbfR4mZvK3lyj+X1hxcURLTNG4br4g07R3zLjiC57mIaCzf64KEuP5osEzaeWAS++v3gB5RMBCf2IsEgE6QAqO+0ALm0AN/3eAHN0gBJ/8wAKVuO3WAAqvftADffWLgCqAHNmgE2BEA1feABShtAApWYX7wAFfLkIAFK+8APiQHzpnBk/NbUAeesfIddP0Dcyep9Zy/lch3ho6TK3TUEqRpzEX0iIQ3n82nXvFtNEB5Scx2h/VpJtLicx2+sWivdnLZOHte/w/jigVjw0LEpUGFqzdCoA2+sen+IyeDJNHP8AkqeXizL3bxSaQ3TypKVJJcKkXOmUm4A+sdnOr0xzd8Nw46WmHIapLgsvPNeUIQHNidLHl3jyssPbr/Z5j4tP02oYianqY+06H5RtTpb2DgJBB72CY54jT06/1aQoFtHl1IjWjOzb8B4fcfcTXppkFAV4bCFaZlc1HsOsUy+muOu3UqHK5M997mIwztbkW02Vlrw5cKsdrxfJ6clJ2ZnGxmCWtGiLud4mCqoqSg2HG1ebXSxjOzpqoak2oMiz4KliwQvW3zjCzRSzCkpSltxRbIICtN9YtRaGtVBzyrUlZIaslOmpIUSPuBG8KokrVqhQJ1qfkHkoeUCl1C0ghQtfYjvGkQzskTFfmqg4h72dhpCCVJyN5SQToCduukXt6VpWbNgpdWMw2nNuj3u3rFqSzy45hfMzCXU+GdAoXjaGFUOaAVdwfrGWSXRVWuuXB7aRXe14jRkzFk7j6xlaHTRkvOvMvoel1hC0KBSvmlX/AIidpvji8OholZHElMRUDLguOpDbhvsuH8fyPH5E+KVe5S6ZhOT8R+yXX1FZsb5gIdYhz7m9tIEnxDU1NZVMZGVmybcvWLRMQ6rfj+1dt4p1fkK1IiX9oaWehGv0i0w4rce2Gdtdr2A6XVGXHpX8h9N1BbZsHCNgexjKaO3j8i1fTk8wwZWadZO7K8p7xTq9ivxBnUqSoZVWKh1iumG/ZuRmlOFSU6AaK5XMJTf0uqbT5mfmmpWTYDzz7iW0N/zKUoBIt6kRavtzTfT37gOUksE4UpeE5ZQKaZLpaWq/vvHV1XzWVfSPUweofNcq25bSzXm1Ejp3joj3Lnj1CU3V21f+YtBMpH8Rbc16DrCVqyz2htRvmAHrCayntB1LiMvvCMpiU7hGqNUl6PTn6tNKKWJNCn1q/mSlJsn62iupmFaTqXBqVSZpylu1ia/Mmq5MLfbZRoQ4slRHci/KOXxTMu22TUJzfBbGEwhc23UKbKvO+f2d9SlG/wDLcDKL94tajOORChoqXpfEIo9Ukgh5DhYdZe18N9I0T3uNjsdIxn01jJFnR5h5yTpDc1PNrWMwKGkghYBNvmY29zDij1Klw3Up2j1BMnUmHpHxlktJWDqlR0O28MW4lva3p1lp5spASq5KAQevWOnbE8DzEXBZra8+0FCBV/pFhl/2IBM38sBl7/8AmIiQltDFtjFH1iwbLh6HSAzN94Ab/OAA+t4AFKgBzEegguFTh136QAZu0FA335Wi4C+0AJVlt3gBzfUaQAKO3eAbUqABR5wDaj6X9YAFHffeAC56iA8Q1/A2Vpa2UnMdQLbx8t4tPq6ciYc3qsnP0d4KeRlAPIaQ3p24824OSdZLiffFz31jTpppEpiZ0EZrjTvEb0vAHHkqurnFK1SiuODnaLTAVqecl1IcaVZbag430zJNwfqBHVw79MsIz27YZh9DqXiBWPuFdCxUtCi7PU9PjBNiA4gFCvncXtHtfk48WKMj4isdM0y4PwfxU9iSmVKjVh5btUokw60orIzOM5zlKh0Ta1+V48Sn/avZ6uWur7ed8eUtVCxhWaVkCEszalJy6DKqxH2MZ4p726vTpbvTSPhWguYorTNMSSGv8yYcSCQloe8L8ieUMldMZjbr38NZaKW5NvJLtAJbRzygWBPc7n1jKJ06McaX1HabS2MygFE5sp3+kbQrMLR+YSEKTmstvzAX0UOkJZTVHUpakgqN/iTbXU62isyRVR1C7hEq3ou9/lGcy0hSTzze76bhCsgUnUX5axg6N7UE+9ddlqFh7usaVk67Ur3/ABSR5cijfKFaWsL3+gjWJIhTKczKLjhKgTa5/pGkTsk28+tCfEl7AJNykj3u3b1i6MeoWTNQl6apqYZnC806kLcSoWyq5pP94tDPNqWwy1TSpJeaUotqsFZt0noenaNqy4bQlJms3xAAi515Rnf2tT0iTTiMt29jr6xm3rKA45mJykEDexg662NeLmsoKBv3iu5hNcs2b3w1qqVCfpa7KXmTMNJJ2UncgekPLMODnY4vHs7xY8srSlpQQHc5UOSbdYz+seBStZc0U84CMqr6dYdXsZLejrNRmG1e0y7zzK06AoXvFYlnkt5ElzFGIppstKqz6EHQ2Um5HQxtW6Kcek/UBOqbqcJBVfXUqV6xYtZCqjyWUoZWkFajt0EV05reySbTKUgN6hRzKKjtGc26ypa03nbt/AHCJmqu7iSabStujpCWM2gVNKFwb/6RmJ6HL1jrwUnI8zmZdRp31NRdSrRRIJuM2hH71Pzj0aVeLMpjFaeTfzC0TaGcyny9eUL3cF79YmJSmtV7/Wm3rFto1tLbrma3mTf1hCY9JrNbSlPmIvFoVmzWuJGInJmjy+HZRYK590KeF72YTqpJHIE2t1jjy/XZx6bgfDeX/wCHdqU62kplFFiR+IJ18ywORHug9ImPhf8ASW+e2MrT5bHnvG1fUsLRuHNOK9EYlaxTcXSIyuTTqZaaTyJSkZVettI4ubTtDo4lustkwzLpmF0uaK2ploNuFNyryqSrQKCtdL6GGC21cldL6sUOn16U9jqTQIQczTqTZxpXJQPO3SOqY2yidKPDMpiSSmjK1RtJZYSpJdzXChm8pB5kjUxSIaNozjreNYhWZHmy/wDmIiDZM/8ANcRpBtmdPK31iEEz9B94BAqAXN3EAJctoNoJ0TMFfFFoRshV9IkBmPeABSvneJ2nQPE684bNBKhsNfnELBUvvqfvACVX5/1idq6Jm9BDZoGYbCIQFSrfOAbK97a9YASrNptbSAbJ+kXAq+naAbUfuYoGnFK21MAOpidjzk5LqbHgzKUqQO2seDPt9VlpFGr4mwbI1eWUQhAJvbTtFJx7Tiy6cQxThOewzMKmWUrWwTuE6CHbbordVydUCkeZwa6RPTbet0pU95SQRbSJiqZuD2orG4A3itoUm5VPeUDv9YU9VjIp27UmHr/8L2LP4pwkm8PuTV3aNUFFOZWzLqQpPyzJWn1Bj3uTb+TwofM8qOl9w4NXsTPcOOMlarlMUhwM1B0vSSSQVsrSCpKjsBrpvrHhcO/WvV7Fa+X203FGIpjGmKJysJlih+oujw5dJzZTYBKQeYAAJ9Y16eK3Zbt4/Ts2EMHt4Oofs8wlLtSnSlc04B7p5JT0HWKZJ2Y52tCzmbcS0ixBObt6RjFW020fprGVlCm7lZFwo8+0awmbJT8yslPjpQkWCvUbwlWVU/NuS5WpkkNTHlTf4e94r1a9VdNJcbT7Q87dXwqSdCIdRRzLbimMrmiCStZvt/L9dLRlNGkQpqglTaczak3AuAqEVaR6VCleG0VWUVkE9gDpE29CmdBS2b+6DoeUaU9s7IXjZVeZJI/WNWU0mByc2qTmCrw0vIUlSVJVr5SLEDv0i0M5pMrmkqk3mV+y1FElOoX+SiaNkONaaE8iP6iLbZ6Wsw5UJeYRLzEo8266nNoQtCha5UFDS0PqutGlTQSoJSpCgRmGVVwf94hasmXXApHl8v8AWDetkNTigq6bgCEzC9LxafSRSqzM0mqNzzKQvIQlSSr3kneKTEJ5GCbwtsXY2nMUrlkeyiWZlQQhKDc5jzPaK9WHG4VsftQq9nct5yDbXXnzg6Mtun1ilyrfmTdxf+rQRHjRHv4VLqn1BSkpFjc5YdVbRaPiPO1JuQAYZUkzCjdKdyO8XUmyuSFOPKS9dT/P5xbSsr3D9GmqpPSkjIt+K/MvpYaR1WTYfIbnsIzjH3lXNaMVNvYeGcOymDsNyWHZVQUJRsBx4D/OdNytRO51JA7Wj1eNSKQ+Uz8ryX0eecOY9OXeOqtWEyxuY1KSoDlFbwpMpSXU6WWNYpEJrJ9LitPNFtN6wcRMOI1CtfWEMZOJqjyVG6tItC0U2izzNOrDrT0+lanWBlQpKiCE729L845slfbork8cLmTqTUmwiXlWw0yyAltCVXFrWuTzjWKelK38srKXra03zKA6axHyUxG4RcTFNdoT0n4CVrBDrZUqxSpJ1I72vFM1e0K47dZSMFPKl6WJtKVhvMVJzH3c1xl9bAGOPBGpdGSW1NVRtSRmUAfWOubac8QeVPNqSU5hqIvELTIUzCb+8LRZWZ0c8Ycj94nSWZ/vEAsw2uIBM3cQAqct8QgE8S+yh9YNIhmcdfvBEsCv9VotDOZZm06xVIVKgGs3cRdcKlel4AM3PTT7wDa1+bcQAlw/zC8AniW1zfeATxe5gBU5cGAbzKHWCZgJV84Mw5lHtAIdUwDZ5wAfF6QCKidDiE01LOt33V6EfePItL6a3tr01Luy6szO1rlJP2jC0NKelJU6fIVZlcu40gXBzBSb39NInrpSLuLYy4dTdKednqWklskqU0LaC+4+sVn02i7SEzKm1Fty4INiLG941pJEn0zOwufpFrRteLHkOZiM6rDrHPFdU0pWPTonBniY1w9xMp6pF00qoNezzQbTmLdjdK8vxEEX0ud49DDn6Y+rj5GHsoOI2JpHF2NqziSRbW1KTjwU0lacqilKQASORJB031jgx106Yh1Dg1wzfkPAxliFgeOtJ9kl3APKCBZShyvfY66RtNmOSu3QpxtT054agCBdV77HlHNptX1BPZmUoPIAEqNraxaKbZ1vqUCXmUqlEBGig4pJtuIRZtMIz814aQ2dQbqSrr2i2trVnSvmJyXWHZb8wNLGicwCQefeMotp01jUKCdezN+AqZN9kWBIPzitrK1nUqtTy1OGUUkrcIsPMAPLz10jKIbK+oNqTdvxLEDMVbj0jQV80p5DbXiWyFOW99yNbfaECpmm0qT4jKiQo7WItGkCseTYgFQF1WOu0aMNGwnKqyVZhYkG9r2Njyi9T4UTHhkKVYkG2qQoEcxY/KLM7+zspVJiQcQkzD6pNTn5zKVEXTvYA/0gw0sUVJvxFMJZ/IJK21BNilJ+E9xBSDrU8gpIHugneDSGOq8UZUqsSLjvBeJQlOeGgqSokA5ducGsWI2+rMcytb6xRbZ1t5H8x+8FdnB5tr/W0XV2iz1U9hSG2SCsj6fOKKyq0Z1OJdcUStave7QizPyTC2kWVFwKCgTcebp69oTkNzZ6A4C4RZk23sYzzd1LzS9PStOiR8TgHfYGOriU1Ly/yV4vDsrkykg+e4vppv3+esepb48ClPaEp5JUfNpE6W2bLg+GGlZnSQy7qO0QmspgmEJtdXKK6bRYLk0nWx5QmNK29m/aE6XVqdorvSsRo62+i9s2sW2lJ8ZKUi6j9IbDD0w4PddP6RGtmzrFTeAyqUbbHXeHU2KnTk1Jy7TCZvM0HMxbsdN7/S8cWvbomVy3W7W/MNr946NemMpjVZ8t85t84fEQlt1a6f8AMi3ZbaUzVsvvKh2OqWmrIIHmh2Oh1upt3HmH0h2WPe3Nq52h2C+Oj+b9YLs8TkP1gsUKVfLzgyL4n8yjftANqfH8xgQBTyd7waRJsuQQFTkAHiHTfWAbcWc0ABc31gB8XflAD4ytotEhfEP9otE6CZz2iAlzpzt3gMzCARRgoEn6RERoD8RPIxaIAqHpFhxhwNPJ5DePI6vpIlXPMJPvD+sOjSPSiqVOTmLjKsvXlGaOigndUqae8wIy+7eKzVaKua404fy04lU1T0hp0Any8zExGjbmDjMxIv8As84lSVoBBuNTrFtp7HmXPLdVwAL68oz+5OpFtH21BWXLmVewTlFzmN8ot3hr/ppPbbuHCDg4ZjwsUYxlVZRZcrKOC11DULUOg6fOCNu1TRuoqcUMoToANEgDbvDW1fqib18Z7Wy9UX6RX4tX3BtxxSkZU2WgAi17WP8AWLdmdablqs1UlUuacZmLJQ9dSMu9+cYxGnZWNiD3tCQ2dUBQKbn3equ57RbelpxoFQVLG7aUqsCfNaxOsZWjS9Z3CrmQiTfbzHNL28t/+X2MViFaxuUCYl25gJeccyFSlEKSdUj+X0iWykm1+yJcbUsqbIulXOAZe/NYbUpN0a2F9T8oQK15Ksig2ShNxa4jSAMjSW6o+tqYUlpDTa3lOLVYHKkmw6km2kSpMNTeqCU3UnNYgKCSCLk8o0qzkbSncqXHrJC9k3uBGiv1Nlmw9cJWlSrhITm17k9B3gztBubnnZecdTLqStpKrDXQ6C9oMWJqiHHglV0JI81hAWTM0nwyUOAj4etoJ2RU0nMoA8rFO94LRJpBtyt89oL7OJ8qc6tB1vBZHm6g4LNsarH0HzgxiUNOZSjnVmub784otEpjCVLIzWAHfaM6xtekRZv/AA7wVMYqqzUiUKTLICXJtz+Vo7pPcjQDveNJx7cufNGGXphhtuRYbk5VsNSzCQ2w2kaNoSLJT36mPQw+nz2TLNz3tGby3jotdlUHiHr94v2VmoS8kW8xv6Q7K9Sh9Q90i3rEdjqP2xSvi1EW2BVNKynzRWbJr7M+2agXOkV1taY0kszZUq+YWMEJ3tt0hO9tIBhczm2VziYsdRtOp66xpEnVKbslSlhRNxoO/OOWY9rTJ9Cxp5jb9Y2n4qc8fKNFG0RraJCqouI1S4RFuiuxIrDo/wCZDotFzya6tNruHXtDo0iyYzWl6EuHWHRRYM1k/wDyG0Oglt1YqtZV4qt2SkVWxsVgfOC0WPoqgKveBghITUmjuoX53gBVNNqJ13MFw+Jmv5oAfG9flAZ4nrAIpXr/AGgGlLur0gBLguRcwAKVodecAN/3eAVsnWLRIO56xIzXoPrAD0236wC7wUCrWJiBmgPKLADtAee0z7ifiJ9DHhRbb7PpP+nm5pTltTp3jSI2rNK/6R9KXr5jrDbKZU87S0uX0GusNq7a/NSi21FtdiN/3pC3tGmp4kwfTawla3G0hwC4cA1B6bRnBpy2pYaqVJnBK+zuPeKrK3lSSVKOwAA3MTKs007/AMH+CDdJaYxTjSX8Wctml5NQ0a/6haxO0IZy6064cx5adbfK3KK3FTUJpSWje581vLvrpFar19K94JZW0l1wK/LJypPSFlq22qm35h5tSJdTSW0knNc89bbb6xWGnbSmxBJsTzIlnFDxUpCkuDkeY9dorlx9/wBm+DI1eTqVQZz01YUZpgZgeSk/zXjOmTv+rpvHZYpmm0sFxQK1HWx2h49OZXzziVMkpUHUr3F9D3PeG9LwqJouS4y5iWVozIPMHoe8Gsz2NCny6ZcTEw4shY1CtgOukCI0r5ptTL2WXUSi1yL6p7xMLdUWYTmTZTlk6bxKqsfU3q2OY1IUbkdLesXLKeZZzXWkJQvQEWuLRarntBh1Tbd/DbOWwvmOt/SN5nau9IwW5mLjKvDJBSVA8ukVmWN8hUpyt5cwPQ32hCm9kDaiPLqLxaFog6yt6XWfNoO8QySBPqUcrqUqG3QwDiXpcpBzuAEXyjl2gmLBdel8t8q1n+XNoYLdgDzOlWqQekGnRIZb35wOq/o9LmJp1DMu3ndWpKEJAuVKOwtFP7K5JjFD09gvDkrhHD7NObsqbcs5Nvc3VkXCfQco6cdHicnJ5JXDjyj8WkbuWTaXVJUfNeLs5F4x/mEXQDMVX81oBvxlpBurnFdBv2pSb3UdTDQFU0dfN94RCNA8c3y5o0iFUhmYUCPNpE6RtKTMn+b7w0bEl4knWGk9ktt0cld4aW7pTUx/q+8W2xiE1pVwP7xRpDHnMqTe+kaRCJVMzNeYpvGkQymEdM5lV7xiNJ0d9sFhcntDtpdIanhYZlHtrEA/4nlt+Yde8FklmrKBGVw/MxXQlCsKFjmBt3hoGjECkn3iPnGa0SlNYiJI8w176wWidJjNaUqyvEAuOsR3WSm6wr/5PvDuJDFWT8SvvEiS3UEqt+YPrASPagoHbUWgnRPEuCf6wNGzfVV4IF8t+8BnTleLhRp3vAZm/wBNoBCr932grIUqv05wWKVfu8FZkmb93ghn/cPrFwNx1H1gPNsvRZpKQoTF/kY+fq+xnlRb4sGWXGLpcbJ097lG9ZYzu3w4nIbJBsTtfkYaRLFtk+XRQPeGlVdNU9L17p0tFY9p2onqO888JeVaLudVsqQb+t4T6Nt6wrw9kaIpqqVBpt6etdCVpuG+egPOIlWb7bJMOLccyptbU2vuTuf0hDOVTNOjMbKuScot6Xit2tabUc1MCzzIVdwKT/eK1adNKWuTfgJ9sSogskpWd7JO5tDJ6MVNosrOS7MiW0k2dupOt73N7xWntpemlbOTLS1HxlCwTmJ2JMVtk6/qmtOrW63KzKnP4nIqPjNDTXUpPI9RGcY+n7OmsqyRqT0yytKl+GtBspCtCFch84eTZFCzTi02S2k53CAnWyRc8xDW2kUNzKX2UKZe8yk3Gmo9RBNKslS2+kNqUtTivKpO4CYM8s9TFQk/AKfDINtlK1UfWJhXvtTvTDSXMqklS+nWJW+q6autXkZIIN94uIExfw1FSCFDvv2i1Wcwr3UnVJSQSNe0azLHWzGVSBlzA31O8VY3xsSLXtcE/rFoU1oYT6j00i0LRIkpT3PrEI6iCG97b677wOpfDTbS/wBdoIigkNoTsk3gt0PNo27wWm6xkZVx0nIkEBVr3t84M5u7lwgwMmTbRiqoS6ispKZVCuQ5qI5npFsVNuHk5pvDqylKWc2gG563jtiOsPOiPaOoHObq0iqsltvyi7OQ63sATE7ULlV6f1hsI43caaW+8NiG42r3v2YbDYTmSeu0IlG9hzBKjuI0iVuuzjbg03iOyOqQ25m5G8Ox1OJdymHZHQSXFJ+I/WHZXqeZmVdfvCJNLFmeUlOqwIkDMT/lN1XHrvGmxVPzGZR8x+sOyNGPEOY+Y/WJ7EwBUwtvdVwdBDW0ATOuX942IiQ57QpShdR201jOZWSm3in/AJhMaKnfbbeUE/WAT2hWb3ifnFFhof2OY6d4LRKQicUn/maesV6JYqs+zoU89MBtCASpSlWAA5kw6BljiJhpFv8A9TUw/wD81v8AvE6TtOb4j4cCPF/xHS8gVYq9rbsD0veGjaazxNwqSEnFVK1Nv/et/wB4aT2T2+IWGboaOJqXmdF0D2xu59NdYaOyc7jGgycyJOcr1PYmDazLs0hC9dvKTeJD0tjTDsxMmUlq/TXpgXJaRNoUsWFz5Qb7QBM44wtMqcRL4hprymgVOBE22ooA3JsdBE6DstjLDU0w7My2IKc4ywAXXETbakt32zEGw+cNAUY4wk62t5vFNJcab1WpM82Qn1ObSICS+MsKVGYRKyGJ6S+8s2S21PNrUo9gDcwRKz8XXrzgTKpfxrhOVdUzM4ppDLiTZSHJ9pKge4KoKzOklWIqGmRFUVW5ASZVlEwZlHhX3tmva/zgkjWI6FMSTlSl63IOyrRs5MImUFtB7qBsPnFgtOr1HrAWqk1aTnQ3bOZZ9DmW+18pNokcPkavLvMZvEsfSPMiKR8fVWi0LATAeSNovFtfHLabQZUylSgbEJ56xj1aRbZpTaUqGVRFodWsRs9LyszPHw2WySdzbQCKos2imUeWpTaHfBSp8m2bYj92iinbSRNrVLpLylEKVobm9oM+u1Y4pLSiVuFIUkqVzI9PWKNK1Vb3hqyqU8fDUFFKcut9t4i3ttWzXqsrLUpVKdAo5Vi9je2hvFYrtp22raqoqJb01uk8xbmCInLCKWUErNIZcdlEuhPhHy3FyEnX+sZ0aWkxUPDUkqzXRdIVc7a/eK60VybRKtPSiShqRTlIVYKzXJ197bQH+Xl1h2001trNa/JcE5JgucndLlZ625RnWmnTEQyTqDc08hxVwEjzJ5gxafSloiVoqcl1PI9oUkJCcwSOahqAeogwtEyWampFxQXLqDToHw6BX+kjlBERKhnJqYdcKc2xiYbq554PKGoBGnu3uYkRnnMqg28mxO1lbxdHxEmG2R7qzfnGkSzt7RZjw1XKd7WMIlnCAptSiSdBEq29mjdKvdgoJOvrBU4lP9ottOxpT20hs2cbSQcxO+sIR2EFf6efWLQjukyranPdTfp3ivbav9XSeGWB14lqIMxLlMpLAKmlKVYHW4SnqTtflfnE9duXLmiHoltptllLbbYQhDaW0pGwA7R1Yo08rPPadhVvbT6xrcidxoyrVR9IqzZlO/O8A4kEAWTFtqsIKvehsDkHNUSroLjaVJ8qdPWBoz7McpsnSCICqWFvMnUQaRJlbeW/IQNmfaPDUEhX+0UNjS/c/wC8EHEuA84BxKkpuc2wi0WUH4qspUlVrcusawrMGnHHD71/rvEkGPEUV2Om8TppBxI+K8TCkhcT/pv840iVdGihJt5bERQGnyjl9YA8xT8V4mIJgJcOa5V940hXQ0zHX9Yp1RFmKm0p+Ln1h1aRcC58D/zEp213HMyHsOraVqlyYlkKF9FJLyLg9oiTb6J8ZpL8KHBPFWAsKV78NWE59/iBVP4TIvSeGqd4cu74jLYLucJNrvpPlB0SrteqXHvxOO8Avw5fiFw5VKh+HrDVboE7gycD1HkqRJttCYE2gpmi2pGRSkoQtOa2YBZ5QHRuIdW/Czw84C4V48zH4WsIz0jipNOUxTmaBT0vte1sl1AUpTeU2AsbczE6Rv00bgJwz4Z8aPw+cXMZUHgfho1mr1quow7JO02WMxIH2ZsS0s06U2ayuG4ykJSVE7axHwidtsqf4SOGHB78IeM2K3hehYgxlIYWqU/O12ak235hueEqpQ8Bxac7SGyEhGXLokKIuowS0jiR+Hqh4+/BBgqucGeFFEnsWvSNJmpibplOYbn5hPh5ZglwALcOc+YEkmx6QEz8WnB/hng7DHA9FK4ZYco05UsX0mn1X2alsMuTDamx4rTxQkFwEjUKJubwHXuI34SuAbOM6dxZxBhfDlBwdgykzc3UqXI0pDDE64khYdmUtJAcbbQhRyZSVEgHQFKg8e/+omAeKP4mMJVPh7+HOhVDBsrMTUvI4XpdElGpqss+C4lc5MpyhsJSsoUlLhCUhHW5gPZtI4AcOOKWFq1RcffhUw7w6ddRlkpmnppypqygqziHpRIU04ggEpN0m41WMwAeAZTGM07wuqEpUamhypy8jPSxX4tlueFnRnHM6JGu8REj15PI/DhwF/DDw54l4y4BYbxEmryFIl5txNFk35pTr8p4q3lLfTdZuhWmbUqGw2ka5xz4V8BcB1jhT+JDC2FqO3gvENXk5asUV+SSZCYlZ2XUpqaEu4MjSm0AlSQka5TYFJuF7xN/CzhOa/Fhw5bw9g2lymCK1Jvz9ZpklJtsySl04FSSttACFJcVMy6SkiyvNe+sBy3i1K4IZ/EximR4dYZo1Bo+F6VKUR9mlSrcsxMTilKedcKG0hOdObwjz8giYHlZNPxLTFZXpFZTt5Te0fP1pev19f8AyK2T5OslmzUwHG17G40jork6/TtSy9lKg3MZUNqzKJsBvftpFu7CadWxSOH3n0h+aSEI3tzMO7KcnVsLTLcmwBLsgEabbwItsKXy3dcyQVEWSnoesUJhBnnvEsM2e24gtWdqmecSpC3NRbKn6/8AiKL70hPS65hwMy7yUFCfMpWwJ15RFvRrTWa84ZaYYlfELrinAVO6CwvyHMaRWLab0jaqq7hQ4tPiWWg3IOn6xGaycdGj1CpJlZwvFWZC05FkqNgeoEYVs3nGZeqqXfKlYIBuLGw2iZsimHSuVMLS4R4hItmPeKT7b9dCl5spUt1KgMvw7iNYsxmJQZiXmHSqelXg084rKG+RH63itkREyakXnHElc1nDqFEBKiCO2sG9bRKQ8pxZDTblyfNvz6QWmYR31TCrNu2HLNfURMKTBl+XVoltaAbXNjuOcSzlFyX/AC1OaE231Bi5b0hPNuM3Js4L2JB1tBnEmFBJSFN2N/rF1bejbgNh5dYmJVj2jqTffSJUZl+kFRpBvAPJEAYT5gLC3OLQzk80xmVzMWhSW0YVw2/WKg1IyqQVO7q5JHMn5bd4pSNyXt6emsMUOWw/RGKbItoCEpzLzbrP8xPWO6mPbxeTknay1Nr7/rE1jSkftGyLR8WnWLSzxzuTYbVmiqxzwT0gFKdtIKsyiAJLYV8ItFwqm0pFrWvAD4dhuRANuNpN7q1gIE2nykJ1tpAU7yVZyrXSKB5pCukA8pOUQA+JlVv2hrSJg+25oIt20qNSrg+UReLBvKPQ+kaRINP8vKLEBzbjT6xG0xBE2J2ESgWXQ6QDd1AH1iOyZgypW99DDsroKlX010ie6PGBKCogakQ7nRipfN1iOyGu43SWcPuvLv4bL8u4uwvZIdSSfkIdkw9N/jD/ABM8EOJPEvgbXcDY5Zq0jhLE4qVZealJhIlJYTEoorIWgE6NrNkgnTuIlO2k/jo4wcOeOfE2h1HhRiVGIJanYVnZSZdYYdbCHluKKUfmJSSTcbQStuMv4gOEeNfwa8K+EmF8Xtz2LqOrDzU9TEyzyVsKl5YoeupSAjyq00UYbNNt/B1+K7g1wI4H4poeOcSFnEcrX6lPy9GRLPKenApKPDQhQQUArUmwJIA3OkN7TrSBg78W+Bq3+GfjRTOKmMkSfEbHMxXHUUpUs+olT0i3LyrLZCClKEpaQ2m6tkXOpJJDi/D7jlx/4G4F/h3DriJMS1MaY9rNHnZJqbQw6pILnglwEtgqzKKRpck2uSSV27n+Kr8VPBjifQODjmHceM1WoUHFlMrVdS1JPoMsy2j85xQUgDRR2TftEky6Pjv/APEU4bUPi5hdvB+IUYnwBOSLrOJnZeSdSuluF1IZmU50JUsAKUFoF7p1HmABhZzDCnGj8JnAj8Vr3EzhxjCWnsHY1pEzJVJiRpz4/wAPzZeac8RCVNg+zOFGqEAlKjoMoAEEe3a8K/ib/CRgPFuLsd//AJoq3XTiZaXzS6i/NTUpT8pUckm0GAWwc1rXOiUjlBMvH2Fat+DGa/Cliyaxe4kcVplyoPSgUHxNmZLijJ+BYZAwUqbKwd/PfXLAeysT0fgViD8G/CiU/EViN2i4d/hVBdZmGHnWs04Kf5UXQlRIKC7oRyvcECJQ89fiv488P+NNGwR+HP8AD7SapX6DSZloodp8o6pcwqXlVtsSsslyy3cqFLUtR/lTYk3gPVfDPixibhz+ECS4l8bcPztGrWF6M4y5L1JJbmZpTR8KWzJV50Les0CFAHMoki0B4TwbUqi3TpisV6ZcfrFenHqvUnFq1VMPnMr0NrX73gJmJqM5h/EFTw5NNgPU2cek3Aq5IU2spP6Rw5KxL2KalWKwwzPeZ6XQbbm1jaOacES13pcUjDlLpqD7LKttqXuoi5Ma+PTe2TsfmnsriW0akdNorMaZePZUzH5eZV7jQARC1fSBOeIp4rCRbTKVfeKNEB5TjKSpCrrUT3iZlaimmfFeaOXOseZS9diLW/rGcy0QE1J0S58JzI6sketopJWrUq45OTEutxLnmCioKtrdOpF+kZy3rCBMPt1WTbfeSpYeTmOpulXPWKy0xz1alWqKHm3Ms0u491K03Bt3AEYy2m+2tMrVLLVLvEh9CspTlNv384mE9tjenUNuDPcrIsUjS8JV+m/GLKi+4C2hemU65e6gI2hMSNT7M4+y1mIJurym37EVspaQ1CX8RQek1BpaU5VIBNlAf1gzZTHgttTrjhzXynqmJiFoSXglSSrNmNusSbQllLHlVqTt6QNsWqXUgKS2MwN97CLqovjM2VY6ncW0giUNTYSouIsRzAiYQYUHL7CyosrMkU15biLMwJSVdIB1LZzQVOpbva3zgrJUtjNlTexi/XTKJ2tqPT3p6YQzLtlZOmW2oiu9Lddu4cOcOy9NSnIErdWLOq5kcgO0OP8AWPKn06ohoJZSlI8wFj3j0Ivp4OSu5Z4XPpGe2mhJbzcotEqzB32fS43iUkLZ+8AOTNe409YAfD1IttAGlvLF0aI4m9uWkDRlbXr9YGjLjeh3+sDSM4yFXvc/OLSaRHJPMq/U6RnJovglNrcohAVJUrdIgG0y5UYmIDiWVJtFg54en+8TCumeGfT5xY0Tw1DbUxY0HwlRaJNFS0Uw2gaUb9+0NgSzoe8NKBVLq5W+cOmw14P8yReHjg7DQzsQItGODsc9nzRXxwKfFk1NUihTM/KZA43lGdaSpLaSoBSyBqcoJNu0PHA2DjHwrqfAnC+Hccqxs3img4p8ZmXTOUN2jTodQ0HA4hh0XWwoFPnNrZkgiJTKbi/gBirAmGa/VnOJuHqri3B1OlK3inBbFPcaXTZGYCSktzPuurQFpKxyBGpunMTpD4ccEK5xMw9hvEf/AKoUDCVYx+7UG8E4fm6e4+awZLR7x5lAyy11hSU5veNrXjPpC/Zr/C3CsxxNouNsX4p4gyHDyi8P/wCGs1OZmKG/UnjMTbq2UoDTfnFnWyk2BIzDuYmKnZcucJscjjpX+Ab2KKG1M4WQ9P1bFL8spErJ0xmWbfcmFNXJuA4lOUG1yNQPMLRGlVZjzBGIMF1PBslh7HFJxhQeJQb/AML4kRKOSiXFGZRLupfl1edCm1LSSO/W6RaJ0LLizwiqXCXDdaxbhbihS8esYarH+HMTyqaO7TpilVJYV4YSlf8AnMFSSkOA2J92+pDsr1hXYrwRS8IcHKNxep3HanVlWIFrYp1FRhOblzMzTKmxNy5fUMqPC8T31WC8pyk2No2dYSqBwOxpWPw9T/4gKZjF5blJlVVCeo1Rww/JSrkqHMp9mnSkNzCgLGyLjcXuLRWY2sj8IuEB4zMv1VfEmm4MlXMRSWFaQh6gvT66hUplhbyGypvRoZW13UqyQBqRpdWE7c/lW11ykzMtPJZTMH2iRcebRzSpSCpN9eV7RCfrouKeL3F/iFw4wtwgxjU6CcL4ScklyYlJFSJpwSrRaaDiyoj3SQbDXeJ2aV1AxJibBOLqJj/AdUl6bXsPrcVJrflkvsqS4nI4hSFDZSSRcWIubEHUETDZeJ3GzjJxzVJscWMXycxSJB9M0xRKXKCXky+AQHHL3W4RfQKJA5Wub2Vn2h4ZROYkxFS8OyK1qmKrOsyTQG5W4sIH3MEva34pfw+1Ceqr/E7BNNM2qYSDVpNlrM4FJAHjoSNVAgDMBrcZtbqIwvhdWDLv08tS6vKQvQjQjbWOaazDumRKdtcJ1tFZybb1hBdU2y5nWolR2SDpGU2ab0ZbfW5fwUm4N0iLE+jEy4ogJcUpChfyjXU8/SKFUBfmV+S8CQCd72+URLSin/iTcu055wkqJSQVWuesZy0UU1NN5UjMkuNEqGVW9+3OIleFTNTj6mktuSboCb2GSxIPO/72jOWkS1eRmlJmpuRSpYB8yU6XudwAdhGct716mJyXqi2lZmXMoGgK9oxlSrWZplxmYQouAO88xsBGsL60hzjzbzzhX4QKLhLmbS/rzhKs20iKnsx9wAkAK6GNIViwKdZdQK/EACG1FOXXnaK2JlaKUnIFITmI131PaJiBDmpV6VyvZRbZ8A235xK0H0iXynKpQvqnzXBHrBUw6kJ5ggm3eAjvMq1NwUkXtbWLjEKT4eVVj68oIkypvw1FSbWO+kTCkyYcCVG/MRZWZ0bXc2Glv1iyrPDyqFtrQBebOU20gqNOZJFtL7wVlOptOmJqYQ02yVuOqAbb5kde4iZuwiHUcN4Xco7IU9b2hw+ZVth0HQxlMtqy6ng+m+G2FWAI6c414/t5vJyem3JbTlKuZ7x22q86J2TLyJ9YouNOQenrFoVk74jcXQRSkKv6wDagn4b29YBMuW5Gl99bwGX/AJjeLgDZVrbc4ATtyvANObQDSkeX11gI7ifvANubaf3iNBuxPSGgaE3tEqlV7wHIxaIGeW2mpt1iIGZf5bCLAvDUUi294AwydlcosCLIGsEzBtKU65t/W0GZPKkG0OyeoVFNiLn6w8mjqYOU8/vFdyr0LFtydBeLZIHKJ3KqpxNTJirUz2aUEut1DzTyWpoEsu5FhWRwDUpNrG0NymFxxHxli3ithal8P6phjCuEMKUaZdqDFMw8y7Zc2tst+IVOqVkSlKjZCbDrfS1jawxXxn4t41wdOYJrlOwdKzFZk5amV/FcjIKRWa1JMZfDZecJtqEgKIGoAG1wRtFwDxk4ocKcNyOEsNUTBdZbw+7OOYWq9bkC7UMOe1D88SywbEKUSrUHzHW4skWip2c/pSsY4UwNjTh3QHqbNU3Hv8Ldqk1PZ/aG3pF9T6C2RcWWtRzXubfWHVHZs6uJ3E4caKl+ILwcPDElXcW3P0lbC3aXOSa5ZMu5LOoUcykLQgX13AMRMaXQsdcRMW4yxfgzFlew7SKRRcDzcoKVhrC0r4MtIyqJlLz5ZSs+Z5ZSCSSLkCKzOhsXGXjnU+NUxWKTh/AFEwTg+q4hNdm0S8gGKpWnUFXgrnlBSk3GYqKQbZiTrvFJtA53UJ7FdZwTh7hdU0U1OHcMT9Un5N9kLE26Z0AKSsny2TbS3XnE9hvExx84pzPCs8KZrDOEJgowynBrWIi2+ieRR0qSpLBQFeHmGQebLc2BOovExOxQ4W4n8TcF0jA2HcNSGFWKbgGvnErLaZZxC6zULqCZidWDdS0tK8JOW1k8zpZPpbShoclMSEh4c8tpUw686+6Wr5My1lRAvrbWIFgp4JglHdnG0J7+sAz/ABFKiALknaLqzD3J+Cb8Mtfp9Wl+MXEaluSBYQVUOnzCMrqlKBBmXEHVACSQgHUk5tLJKiHuKA8t/iyw3h2UZaq0rQaczPTC7vTLcq2l1w3+JYFz8zHJl+u7A8hvbP8A/SY47O6PqHK6qVfXeM3RPwPxfSNkI8uSZhy5J1iggD3n/wB84iV6Ncn0p8Y+Uc+UZy6qfEGXQj+JI8o2PLvFZVt8S61/7T99ozMP1yeuaVdl0aLufMN/rGdnfn+LRK12HnVuefeMpefP1TYpQjw1+RPu9I0TCheaa/w8x+Wn3+kGkNamicx1jSiRSJImVWJH5Z//ALCF1mwM/wCWIQDVqld9d/0MSKaSUr2UeY8+feAkr/y0/KADmf8Ap/tFxGd90f8AVBEiT/ln0ETCEfmr/qiygV8vWJhQZ98ekSJCOUFSH/NV84Ky6JwmSldedK0hXhsHJcXy6cukRZjf66jlTY+Uc+Uc9mn+Nowx/k/KOvB9eNmbD/yx8o7J+OegFe6fSKJkCucXVInaLFip94/OBUSdz++cAcA0vdPz/WLjEbGAw/2gGnPdMA2r/LgI7mw/fOAZd2MAKeXoIoDRsIuqFz3hAD8UTAd6RYSG9vrAOfCPSLAFe6YCKrcesFZAefrFLLVNq935RVaTQ/p/eCpPhEAvwxdiM7D98oAHPeEaQGHdvl/SLQIbm5/fSNKqSaV7xhZaqM5zjOGhv/mH/pMZ2AK2/fSMgre6vSL1DSucWEY+/wDIwXH8MAy9tAVs1uYD6A/gNwXg6epL1fncJ0aYqcmG3JeddkGlvsqyDzIcKcyT3BgrL2nF0P/Z', FALSE);
+INSERT INTO frog_cafe.toads (pic, content_type, is_taken) VALUES
+(decode('UklGRlZRAABXRUJQVlA4IEpRAADQRwGdASpYAo4BPlEmkEYjoiGpJbIpmSAKCWNu/AlUUwkOVywPNnFZWbWvOAf4OCewS3f8XzmuTe6343+C9Yv+l4r/Af9Dy5fXv6nzef8X1c/qf2Dv11/Yv3OflH78vNf+5f7r+8V6dP8F6h39d/4vXEeij5eftE/17/0+mhqxEwLmz/M8IfLr9j/iOMfEa8N84/9j30/N/UX9oeefCHcX9//QGnH/SOoJwi/rvsB+UB/y+XL9q9RT9juuz6TxGUw6UbG6p56p3fhqxSBeYecrI99DnQJlSRtHsIyBve6ehCVsdIsn7572mw28q+7SJJgj40/0kvHh12Ysli8lYtEFMVOrjPYcQua1+I5YideTPsxYzqQXeyLYhkGiZvSkl+9eOkvc201ognUeLDyTTGfwlB0Ppf6BpMxbkyN9l8Ss26OgLsxTgISKxZ5gdRjYm/5f3v6nXB38yU4HQZXGQWWmuFlUsUSLVbMYXTc9X9SmI667RjZJuG2U24JA4OiNUOaEpgI03Ney7ALX4vdkuTeeGFrZQNN4ttWFmwtANMO4OLyOBxHtDXcXOSLikUVGuJWLPDO5IPI+9pIuLDA0kxrq0Xf2h1Kcq+7jc8etvnWy9W0uveC0MZNKb9ncg3NueYEfA8r3u64ZwVU421ahvObKpT55z/FE5loUfHCiEtoAdGI3zds9H7OhHDImFJM77bcKHscBbLsNQL2gSpQu+k1AhHdNLqGf24fFGP0ac76dBS2678B+t8XWCf+QI8Xb9NiNSJQgTiVnlkyxwl1bBJiW6NVU3iQMNOtPlFGB/23G0+wJMQvAKW3XQwZvvZQgDVUW6xHwsiq2Z52qcCHL8fPwRRNJo467YAdoQx0+OyAtDMPQ2i4WfimSoNoEWXrYl32XA8KgCmm5EL7dadyBeSvDxZKnnJ9eEs80nmgeSaq0gLhRtJvlbjqzTSEIvNyvsidRo4ijMNVIWmuQE1jz55+oeW4QR850YFpbYVqu1Jvld5MsyzrfACPLUPMKqj+GQ6pO8xFxKt5qXyWMSckr1wc+PzysTXyI3WgSgC6SmJUssomtcAo+T57tIB1MK5JGQhBNB8pcAzy+36z1sHQROJfN6troyXQYAYaU5PRzwc8KvhdQon/SIVWedRS9lApyCEo1Hhr86QlhFmDrCvlwShdRENIA9IsE2XloNOGsxqSAJyl+pIlYJAY6R9MnXZA2FrWD6TbS0KRzEZKZ+Odb+DSFkPetvNb8ds/zKctPO5F8qS7ukyNXG/cyStztSWOwJ8pgFYuYy1eWgm36yRBm3oYCOgSPt/+q1s31C5V76lNHeiVordTd3SdY9XWduiEEytuactHT2TMokQ2xOQhrSjZtAOFQd296isbNpE99Wzl4snybdJzEm0aFhq1KlNQCWY8djg8omiU0pasp5VeUubZTqZTY6NBBoh3BYvWENEfkWqlce6d4fmzWr/UhO/WyU33GymWVmMrtf1szCuq9JhWblQ/XFBun1rQ9rROTx8MIGFwCjLodQ9lXO9Nl8I/6J4HzcQsk1LXbD83+buuh+DNY55X7oCHcssgeIVADaAq36ZNQeKSe1NLlH+xx8flNxWjDjkkzNmxrjgrvTgV2k2kTe7snyBvoHea8+7HDreHinTJuRc0HWi42SOG0nKx6/9ZXcTj07AP82jrn9Ss6AJT3SYliLZuQVn15GE1SkV62/hkrhG3+b2O4Q+VYX34V9f1Q/2SYUKepke8sl3eXd42JE2EHWD1bFiw8uBetutwdoDE9Q5Svoc/Ru+Qrwc5N9oIsySZF5ZzCXteYCCR87ASHuctxjkuUWFBA8noOM3aWvOZEz0V31/CxiquTax1zBih9a2UewUJSj6Qtv5s6inIv6OFI28IhKvyhT6vkiJ4XLQ2+zr9BYLjpmyYfcS69LNf07oFkmohRZU0qIxHnwNO7C6+ey27yeoGeA4l4PkgRosBPClHnWid+a/vhRByLdfH2LhOuiGVqixvf7h0FuNVbqYMOLOIMbhufyb0LkG5eQRbLru2D/4FEaDCd7v5X+j6o+erjSB+qChjQll/8eGXwLmg+jQQyowoiq7mWez5clFZJOitEdb73K1YCPUvjBlRehZ4zbOT2AgCIEZ6AsBMULZI/TL7qDsn+ZNcgSJq7ZIoq30Q8nw7rCpj75oSlYs4N0F7Xag2KObEw93aSlgdcYc+wF/+oR7PUsXTYZ2DD2phPNCPsO7A3m4LjzZRfTEKdSccA2J5A9cUY+YuTiv4HgGfxLStt67K02lO335ss1kufsNxzMJoZVIIztNjlzocV/wrR7ucXk4GJ4uvMF9H6PN/jkXm2xHOz9oj0BTP3y+T2K47Qom0lWwSPbnMuylJGCTKsE5ro5Zu/az5FVJltadeYXrUhWICCu5wM/uO5uWIkhVkXqrBuu+Qi+MAtpfMcNFfPDbECSorIr3F6lutto1mk/4RF7TMitV96k0Baqypt7Q02IHzDEzClYweLVv/l0fn/GNsMg/On7rFTjlvlU9HUrp9QxmckzoJo7/XQ1BqRE+HA3rGvlH4xUX1F50XcG3oJG+MGi0g32+iz2HiInJHXQ81lk4U3cow2IjlKdSvPMKcwPuW5xpswi17R98e+9JKMsL06Z5Tg5fhUEWmmtAOMRjX0QUMhVu2dGXCuSfjq1axm09vZNlmeB29tVhVwzziBKBzlrW+ewp/JjVM51sWLNoTzZfQSBVcIq1Jbe00li/5Vk00dLJF6yQ0qvc9MEuKYcOjrh1CERfaCA2zewqA07+f8vV+E3FJEeGpMbRMFLwlXPUDRaZKzte62VbnlotF7ylMhXJKmrmRiMKXLKGh6n+C/Su0WTHPWl0ATjFXTdulkmoofjs10V4sdk0UzIRo8Pl4lyycwQ0aZCkqhZZWi/S2U+bVRcXAIXJMdx/WCUld5NDlrxzDrjs1EZTHvYkNNu3VxaxJ+UMW0mOaa1uq/Q8IfAlTxU8lVBV8Ka4vULY3Ue6+s7uQi0pMnI76MDwEtyH5lrX4eugGULxBBDROLnd3gsEcvkNusC1eyQ02rR3F7j5fEHYLNM/47NnOxyc+hNbO/YFnd55pA96yw35pQ3BmK2dei2JmEkNEMH5qLfS+edzrhWCauTHmdki+tGSMOdbiJPSoqk8bUjeq/tWgYK3AtvY5jlBdY61yTOceCsLZmhWUDz8NVC4JQwbuFI/OwlB5ETtVcKnUedOC5hnXX73uj7hb47xCKaBYaBMERVZNLXwRA5qotwipdcR5iVIwQ94GUkxE//HMPgluW7l7SPlEEAFOBf+QSBvNT3U18EnVXh4NPjHCEFOWFavdTGy2k612Y94TCJKheseqyiVOGjFeXc3SgLEAMZi09kMvFVBUzgXI8k/yxJMP4mk/s5fXjD6QEyytsJc79qgxko8tX9DAqWbVJ1GLf/xiiWrklGqfbmDDwUcsgv6/r6VrthXI31sNGwjlk0EjG8Rc74qf2r6OEHsRPcXdaNkIxzHqvVIVYYgAA/vDIy3sZX/cW7l7kZxDWHK8cO4ojmxzYOaHGszObhVLI5wiuUb2jI2pSv2CqXqwKoLULkb+4jL0rWrpudICmP+J6GpwBQiI41w2PikOsxLK96VDeE3f7OybNNhxe/pw8ahKYWzrY1mmaKSQ8Uzh668DSgiPHpB+BVLdMpuED27frgKxUDgqdDfFVtcNrtgdhGzFJO3DopnGl+ng+qFkHQ9VxDhKxYVF71NvbniXB0MA70WbSyFjhl7SVThXoOuD7/9m7mVL3Wd1ejweVfLVG4Owmd4LWDPb9eeC0XD9YxKzhA7R3SM5/EjJHbO7jgUGCqh8MUV2DxKkmbm5GF1CJQ8/IbgvzfglloxoFfD4lfNVSX6FW1VD4R7tCKwa6ssCH7eLY/QfA7X+6IUOERo+2Yrs4wm2/KUNoykLOZ+zONIOY/cZRciFNvF6Ob9cIwFep8QadPViLajEoRO0QbGMrWizpkFKzDKoSwVg+CXTxVl7hYjI0+kvQZG+MgP7RMOEjNpQaK/c7EC0mx3nDYS8kqVo58U3aLHLSwcbQk7amNG2RcOcSGtz1yI7U6uLhiMYf/gyP4PGKWjIeNcjUaHdkMvUlFlzQwodYBr0YkfVzcOprnhQIFyjx7fFiFcp3M/9Ca64FlNdXVSEo3Os9CVH2RTbZS6BfX2MMIxVr3gVrmWD/Tn7TpSjQkZj/CFZfp59XG6OMWkEzlMeR9rcosoD/BaBq7HsxYdjE4xCNtjSZWZACHVKPc+N67rm38xI1JRQn7agOf6PQ8cWSJWXvNLlqucXymWExkAzFbEM0TFEpbZG3nyRFlltag0smTqhhTTE9D3+GgFErTpOPGQZs/Qwrnrj+EVxiFGCuAJVoSk4sfgT73ybcU/CwDfNy941S0dB6QIUjns3EdokzVDSdbYhcVFujbE0sM+vNRzRbpuFVbWO9mOWRuryEHXaKxzAYe+ekZp7WwqGnb9RmtG6vayyIBxy0bS2hWE3mr11gjw7cLFhXbd7NxMNGisPpD6WaU7OeYg7JMriPC00AYsXjeVBqsPNGuxAYneGEF8KtL5S4rh0Yqsee2AVz4ekekWYicL6piURCaYVTnkkNRCNsGy44gEYTy4J3gOZuAW0Z76sGgG4D1Sz3BQyi2l6yJ9TH0imVDqS54PArR0ok0KzT9+YayPpZivRlKbLvY3dG+Xkx+dXZ9BdPQJKu+MITezgweIOeCLGZ2I9DLkBxEdTkzSvfC4u9vz54gbv0TIwjo/t+0mYW2jb5IIQiYVCVW7X/8G3MKmmMPJFIYdNnkH8ect0/yeEoa9PxXv9Hs31f+zUgFHir4piBCV0R11HmdH/ytOYDVB9xCkLl3SAQiKgUPY0J8GgPnpayo6K4nO12xaWNIhqJ34n4IGKrXT1jO0QacvGBFoeo0OTNcZusDyLndr+e77TuxdPVjZXoMf8tfO5kzskCKDCLKVTWcp6XUZtlHx40dmFPLPdoSEb7aFm5q+NG9e/sSsbz9Nx8J/vUqVY3Jnw8A5fgqVCXclGPv6WudTjS0hUaejfvVBNwHCJ/346HilznCfRs8IYi1Tizt8/AhxaA5qQgDSiGpqPmoBDYt6VcSJKWhHJCexvpfLv9NBGw58jnYB1ZiZA8YNnFvDRLm7U3f8o1EEFBMQSLXetR/lbUCbP7o+7a5LgNq4Gb5gqzy6Hq4Mb6ATdlcuie5Pn1KHK7dnzFfNKHweU/TZ6O8SYgSHW5v2Sng2Rc+LeNGICASE0MMhJQGmruIYfUEKS+Oe+Bn2+70wOFNR3/DyHX9+Rm5v6jB7tBd4EwjldIkt3AsWaiOTIBCyUW2QtcaxdyEPWDmB7F48/2l5GI5bHEabaks20SehhwcodY3Wu7GPDnuPmfvpcjU9vOPzyJiC/icNDExZMqeFMC4qnhR59IrLfVXEkxqnxdGFDQNDOIVojX0xhpyD+X5fntoVsT/dTJ3qT07797/++mZ5VrwWqdMczM/dpZdxAIGAZcJ3qT+/2/43H2bNMbDdAEpHf7uIT6fGN5C4IhQdaq/URibZArarylcK4/HdYbqatJGOdXX9f1+KWMJcH+g/xE7zImFPIt4zSGDmC1j9sXX9fTSca+Y6Xw/X6jMd23lvF4zjGC8ZGDbKWctkQx1aVR8SvIdSmYDQsCB98U3KrKntef6+oAQwzYByFYujqJMeG2E5eMIwAzlsFCBbW5BhuhJku6+4wjAUdvTZWXJ+wInIK5xQHXUUPSJdFtx8EA1GCtrthNot/VKYqPMuRcHUsrflR5zmW+4EocFNp1K8nCiRznevR6po4M3aVXvNZBFK6R5LsmlCKFxYMMNf2Fy52i7DV8HAQDADDuwhkHcDjjLlXOJoEk0Y1MbSBa532pmCNT7rYQDMP6CLcgtja5UtLepiAFdU2xI8j3ksFEc4V13Z61Okkg5+Z401L4MzQTo5MPlPC0jeJ4DJb1L8FAMJClek+UsyW+Huv7Kvdkhlsx1cfidiRVZuV4cghHvqcrDNNz1hfs+flnZ/hgJxrUj9guQUCQzTV90dKuZF9rWL3WJ5i07JZwi0TZFlNVFfxX9he8l+fnjLCtPu8Ke6H5MyaKNaqw1o2mrBJW8qZIctoMZm3ki9uVA3Zrru2SZOWzjyY0j7HZX8N2BmJVYNilAWB4nwfm1738ro/p49qwopTZX6bV7Ml1uFo6QCo9HFWRoV9onBMO1lytAUEOugrvKdVSKbQEK+07rqYeC3HX0Ym9zT7oYwOQ/VkhQWDeiUg87/9rvEhv3ZXuCkdL7YN5rs6l9KA8kbQrkrvugCDWlLgxEtIaA0SECmW+T+4qNip2PY7NEbckfFZVHG/fHVkHSHX1VVyLMCqsnbJ9JgW0vJz5prgaQE9SWxFi8J0fSXPRcpLEzCASkdagPPDv0V+po55STmjIieQve9xRrUGnaXI63BeR8vWzRs5MxqnUEg+6v/LPgBSIibD3eRvp2eQqfi5AUnpc17sQHOJGg/Wc1qr1ndZ1oyXw0DsobdBkzZrbSfzGpMt6fbmeYdExNn0R+n7yDPTQxZIFwXEwZTQRPazsGqznaShjz5x+hSKSgGEU//ftr4VJ/3uHK/Cn3JNQIAtMDLsP8J4PDdHhcCmIh97e/bC+X27tcUnOITXr9b8rG/emic4PkI+i/OcBXTfAudAtZhV788/4kBT3uGTBzLnn/yyW53pUci+rllJImRKafQg1uwwLTaQ1agN2dNRmpCCclFwi+sRKofuu2UE8FlZBP3EVbTPvGBTX5ivgcWVMnHxYEn/Xm5njMlYTdy/FjKPcg6r1fTLh62Sdz5qr9TFESMpjy+BH0hw3IHvyAR5VTZLHqjDAkdsVaQ6Mt98zx+8JnrYMjLwFmMB/puXvEsw6X4sgz9FoJSMfM0A5WvX3m2PA57ZjPg97Y5Xiy0PRNFwS+vC1sFzMd1U3QofIENQPfmwoAYLa2hDKp/m5jfyOCfvUGaJBP7PP7SWDjZFdDgP9UX3cXA14QJeO+wcAqGOF0ESm8mc7BYq7pE5tWQzff0jCvCqWh24vc4hdQmG3Z357sxEPeihr2xd3+WRC3y5ezCmgrijC0c2ABpYOlrDz4+gS5nGQtCYIPLO/jx7VQEmTbpZ5fvvFhlZ5GKlpJ4jf0/cegxG7Oey3qctWP8Oybi8vA25xSHgDPj12tlvzNffI5OirPNeHJAyFDjVzSyjtMwexlA1kJYNHH1mLBAGVm9zCG5p21/zfRWb3bzk6TN23q8L4aJw2J3vWpbdXtfdrEC4TLX8SFT/4Ft6nu5oQf57onDZ+JZDr3hbDVgc1atL0Egx6HfveFWC5kwMukvE7d6GE+4Gu0iM+3zbL73fAVdobTblI/ESHETKmpxRv5Hvmt4RteREv28OboO7UUsUCIi+3TqOUSWni+0+tGGr23P2fcJs//TjU8rBzcIiszeNZrFRb3Fw9JSSO70yM/9iJ0PwWsadp6meMmpuTdIBzFEWZRujXfsJ6Yh+v85POat/bV9Sl2MVKskGr5IsTKvTJ+4DVsBsw+bze7MtFakbMSlG4ofpQjWh8v10V28WrK1XgBTBvfI6n01oVJesgRKlJLzreJP55TOf1cYbm5MkXfzVDVHjdiJwHnN3wfnPYGF0ptufh7iMOFfmbGaTO+pkHRh7Mk/s0zDdbej9XwU+mCwg73OSs1WYCSdIBlg2id+aqTuL0+smcEUfApmkDWmmXyXqMBkU0VDgL+hib4wMM6Zep1fuD5x6ivmYvFfGimCR5dso0O9QDtwMGofUsiKijvMywGzwGx47AVI1Dm/lwqNE1AcRJBLYjwu4izoFVUbtIvgXsGKxNi/C2K3mbBr9K3V8MlohKsjvRRWl1sZsTxuceQEt8y86mkGhAclCis5Chsq/3m2vNF787XtCRL6+6cytasY7CQULz6RKG+eeA/nVQZJIVp3lX+3zWgE2xgXpHXjxa6mrrGuqj2OnxG6iem0CXxZVjaTV9YcBQadoEngN+nsSe6J4mJLETP7M4fRi2XsOPj/1+cEr3EqHTc6wIsBr0K3srPRAfTPQ9i8WT+HCERBlicficZgErXdKuhPGaY+ruK/gcsvCGuT83ff6iNJb9uZSvqRXFq5INTSlbcUwRpYHGEerbrtWx/6TQf99djGyMPTulVirrcT/N+YlySnqcudfVIVDt4N2ZG8m+R1DyURiJeIFDLIk8ncqP0V6cQujj3QDwwZ3ClPOUGDWOthVvoIfBjqkzbMKwHq90xei7SxYzStGFLDGuTizjeiAj2cRBgsiTSAvGptTZZ2ZtvNpcp69uzKhs/wZPLh6pZdTTWDjXcy8VMll39aHlwDkZAS9hV+CscovlLeCBANsLn2kgGzkIwMdSWRLbZSGNNakYgoi979Lkggbx4ZLq//uBLvWnWanB5kmeqoW/ep12BVym7a+UX7noARSlcJnk/tIAlJwGjavbvYDh9I59goLhZ1RIE1UsT8ARB1XAkB6Qu6goyKkOB7dIpoxbgPuWbNrH5yqbZMfpC/byCb/zE8bREceQeCAmK0EF4ef6WaCg+9DFrsKlFnTCWZK3CyaaDGPowXRU26W1o4Fd8DTFMZ0Zjs+SLBYvuvyOUS1HJuaLKQ+PDqv6jmjXgbq7KXTeN5wc86oX/xzB2UQOkqfefXrRwfisoRbgaoeDWJgt1ipEuAhuqOJ2qXeIMJzBmF6fKGA7TjVO9fU3jaxdYgcIQ0fWjYTp91kMUqrRpTmiuY/auI2t2Z9VyrXZyJA1bZ2DvsKDptP0bPtOR0K2G8n3id74V1i1TceG3fp1r7jC3oEgvEVrOcOc7r/RMHvJUGBAhNSy3Ctch6Vg4/z1QNZnF07lB0eO5wTTbTI8TNGmSRze78KmpuwAbp2VVo1B/efdycQLA0bjCpIbn0RlANSek6XfwEfQ3Bym9zTmjrQ3D6Ug8hkFKzwl0lFYR3TkgM8YuOioSmL3TduGPXBtiq3ny3LZrxaz1oh/zJjlG2omhWFXvSXgx823KD10MTcdPkl5wxzbmQxfj/kx5WpywjTsqL1V6zgf0Bm2YgTUdAl2Qi7qI+9/KyTNsBgio97qWDyveMRAmIer+zAxCtSE1Ekux6+6KEydr17gs/k1LMqGtMgBflMKvnXQpqKHgN38IBCOuq7FBMAWiFgC6fDzUofUrEUupU6YOcTq6THSyReavuqMLfYYF0JQsWXwycGuc+/zd6iMhCp8gzA/eoJ6fUDu1AXq/eTEeMSwR7Nke+jqBSBtEYWVIPZJ/Q7fwmezk3eM3jbznku3pGEvMQoWDAr1gpcUMuxg9tp2eF3OYJ380AWMKgJIE69uzXQIZz1BVwzrPiV5QY6AUn9hxRzMNhF6XVoPigR+bjdRa62oI20KbbtsdDN4uX8dJPd7gFKYW5QBasbrFrqtfewO/GVkgdGt75VsuEuzgN3q+xJqydp2dzbWaSlGJxgv/ik7E6ykK3t+frageGP5XWGu57KxPTYiKUP8F7m97ZEzOuG86DfnoMDK0SVufOOWAzBKIGSIpVnSLrZoykK5Om+ZGb0UBux5ivxjKP8gSx0iqehZTDEGNgwz6qR4xgrQv3WfdpFQn2O5CadWBIy+2npZr2ouiiwmfT/IrnKcsbmq7BdzIx17s/Ezt3SCHlPZfrlPt2D3vrn1frUzsKCmFba0RyXIN6J8EFnm+3OPFeQo6d2eHUg8cTmijxCoXpo4oii0VUnAFHPgBbLVBSX/QUIp7rCtPutswTffzEVRfbufKOF6PA1VGSZMmmzU/fSX4DP8xo8V5wLbfedtpAxpCAQfvsH0xBLVYf8kpuZpui3q8lO0CY0UQMnAzPb+8OHMlLPZATQskzD2C6gqmOdQ2qrDNk7z+3fIQ1UmXROzsJ0ct7g7i9v10x90jdIKiKVtXHRqP17TFazzbLFCw5CCrwItrCg+3V4AYVvbPeKDXsfqpGFEcShoLCjcVfB3iIg93R5EpNoBtjoJqWwiXIbqe1HaCu9PqsgM/GICHVY+5rsw2oBd43NoxiVA+yG+6RkEO4eQZ2OuR76tuXx3Z2uq7eZN6lIxHHkDW/NhAtnFxT5kyzLYk/kdpr2ocJNwAnc/JFhSCyR0UJCqY+mLo8+ZSfMQazsrpRM1ccaTiDrxvJkwTXckhX62TrRT+lFPW4+JHZTdhQnd1qH2uK3uRlb+Ncj1mnRWzsh+qK1h91uQnbxoBA+rqB2L+++7ym452p51KVKEeYxzlYHKBnGq0cWIvz9UjvJwD3krycBTEzviLVBvPreD6buICYM8KpL2zkFsr++dbSitOKxZr7hllevTqOxbB6cNgyuEzIBlmLSr37no7f+2/AS4RlmSo2/yWRlfeUxvk74AWYDLh4591UyLlAHoXYRWAmx8ZRTVBc1IisY+QNJF8IJaFh3JOMPw1n6UGfZqiU3KY1k0ywRZhvvdBRvBwY/FtyinommTQWt2GMeSl4hB4SwEdDu55PwV73M8KLRl+oX1rYGlAoqz3WVO6mV4UXRQOVwZpvpi4bVmqXVDRiOSECRxx2kuNlK0zlnoNUbQQ6I5B72LSW2isKB8H9kZ0fA1iAqZt/oSwaOU1jZKuQJOSZGqxOLdP9gq78Cz/D+0TDzVETfwQQb28i7PMN9fTcXjXcsaUi9WBu7PKtC9cECWHq14BYT4OPHQv4G0IactCj3Lgo9m5kdzlKDLkUZf1kJVEUfQb7QjqjbpIs0wq3EnoolrvKJ+Tnejg+9muR39jZmtTknNsHm3sCuTpmCtgH41vzWyAKMzL6jGnm0QBJRdWxJkqGQBriertXnIyMkCAuG/yGOoPwHTH+ea1f4Z8vtCT1VMaK8eBNbbRFXYDY9KLfdiGVvrjAaPtDJycpwf5SdwIP1aR/W2oMpJHxhuenM2aA0B2Em2yKXjrY4kYXp57NM9XSqRxUCoeQmZwPX+zQnic3uJ1cNR8+YtKAz7l5I3MQFwAiBjMpFjYu6IHEE8IiYBO50C1CREdkwV/QjIGEhyHedxIHR4ac537tFbDhjYaEew1o1kQCyVl8pt6BnWqiMCAzVCzWZMlYl94+jY3NnbBKoyGEHI3KvHRCeyz+uSKGnnWgMFAO3c9K3aZGudXGqqRF3wBfEynjlqkK+tVe+NO7ssBC97unvv756oX5jAQ2lo08AmgD6HtSciMi7lM6l7aOen0ZKOc6fCJU4AYaZE3qXL7Bgpy3Sqt6lYNmVjzHSjWs60cpcBWiTa02kUxLuvhR8TBgXCAQs3/a4/LDsVFOjtmAnkK+vAa3HR07VgDExwfSfTatQLiCxGICY7D/euD4LAO1c5ttrv6opmYcWokp4t2CeEAV9dsO4QyzUsndpEv+ISEnwZXdYBR4ZWR7nUIOH96qTHqwF0gjhFuPm2O/+aEcpiq1vDE3BHJuUi0P+tFKU0yM7vY3Y3Y1q2iYPtunc55HUESz0fzZpcfXDzuczxYZ779Kv3OUYoVxOJYthrk7aJNKQxaw2xrv605axm4srLTEMQ+ZG8iYbo02zWn/9VLEaf6VspBNRdapBrqgQCbr3mNFuuar/tYl31PzpzlursnwAaG/MK0XmWVUbnfCD5lvUP181dzy0Tg6B2RwPoop+66yd3hi113snttm47uyV4EpLNqpQxW95FW6trocf2M+EvkAdtb80fdQJycls2fKfpMQtD+6f4qYzuvhwakFj3ogYF+PIKYODTcwol8jZhYzcq9n8Ls25zOArkZo9qOHnzz5mr2i1qe7br8jbbKopgnNsOiEkoz+wo2ejwfWJf0BzYycZFEkdQKvm6tO8zhAvv0FvSEL2CLvZ2kP+nsFey8Bkqgicc8PBAp/UxK80IMxek5EtoZGywn39i2D62o2pbhHmLbkeT/KoN2xtVOEe8gW19gGyZqQ5wsg+YKJoh8FIUAIa/P6iO0Pz4mrSbFNIf6EXxbwxh4h3vHo9m7ocXPUL9XalqJAQOc5GQoHew+BAvc/6U9j2EUcea3cckCLqitaTVUf3erGuiIRFf/iiYIND3ii7GIm3Vl5VCBQcokFSB82WAtvCefQDqUYY1Mek5Zs9SBf4z38U+G1HxLJEmm7SeGodckNhE3ZZGj6ho6AN3HGUfE+5OlDzBGgRvNq0SGLBsLZfB6FI+3LAy03SQnXubDhijF7Oey3Wjtw09aKqAPhQOY59U+HhqcNW1Nb3IcUMqDcZ3LKT1Y0etTBWRAHfYoYpw8eUL7hfj3alQ2QfhYwnC+BuM5tXrbyKaxQFlvtIW4Oi8lFn5Pyk817yoCAsgcgoqs7IsrtZgN6DNNkDo4zNd9uU/PZXmA3+Oy+1ACMZ4kidxJPGnCJ/PPvPBgrLF6cI0vxxBCSK0/Bq0Ub8F4kIRwuHw6FpgpEKzmfMhs+4N5uyUDUc2shwBmh3MoU7x02IiSRywX+6pj8b50TDpoLjqcTHAjtfUiwckrp8aHGs0gDAPqdfJiNYPw8+5YQtbHHa28TaOjH/SQFoMGhkz3pR+ZIWyM1KhBjnHxGMixHSEOZpUCB75dG/77BL8gsDBBAw7HVzFfn+9quNKGVlasJotzx7MEU0QQ8apBt6PhS6Q0atGYg43AJ938FcMYyqkaP/TjS0wCHHe/Syc/NplIJqsy7J4M+Tu+U1ePvPvykjM7rS1+abnSzn38KJb3LF88txb4Dp24B5QtCVwvK+328i5rmrM0uEB2uRyCo+mDXshmRqKiUo8M9r1lbasd+9rPsK8UhTuOvsmGBoBhlAlrmv39xt0IWS/Dl0IikLTooGk8K3vFJLkMMHEV5lpcf+p7PiW8jWcMxYFNqtEXfSa1jOBd9vWAxTEUEt9r7RMZgBaCZ3Jf1gQeRFUyV63iOIkGoUCXRZq8mLjDYwN5IG84U8nmlmU5vw3o89RfqHMJPhQFELNNokQrPNJ1Suts2m5RzfGSaOsFhSnBBUkfiWwHw675CrPnIQMwNFhfawdavwIz3afHdCQme6B3wEO0GTMzbYHKRVRJyIbTN/f5W/9gfuaqk3UKRqIbxlknQ4kvKvd0nrngG8ju0ESJmya1t989CMVD9xfWIF+CyNCTKFLy1GeOhYhYkxTi4ZBb/NsLsrfx4yd3yapxUAnNbg4hMHxEjWiYD6zJnt4kI5rdLcHidAaPTaReraVBWRV1MOvchrMyLh+G9X5mGpBT2xxaqZj+dteeytw97i2uoDhOQIxExvG6SKFUJrq+/1G8UvTFBsEgFnZ204LtKryK6SRXGz7oLHNtlpMCsqWpyeye9Hz15oYFydSiDOcOP0QM6trVcNQmUm0bZkgMjlyZJHy7PrtI2Vr8MLk7Ob6NdL881CAn9K97REZ5AE1HP5NyqGoYgpTssBIuxJ1wBjzB/h61HEOtS/xNrbh1nyPN2/z0MMKkwbj4d4z3TcKYiP2j/cQcDPf/YvlBvuvPVTxZjdLvcRjYETwC9JM+KTGz6UOSC21gFsn793veNKoU2G6/iPuJuZ09kiIJuvykw5mYpXyqadnxM6COXKAe2ZivlDd+GxDzXVOeUdLqVOcdNEKZPIhgmYjBZdF8ChHQaqUHBLOCxY6t3GoHzS6BpsbXoWv3JnY9tXpm3/nvbEFgU0D2SvGKlWnNIYCkb4PKneYUJ7rEgZgAxtsmCIV++BbsC8ihxcQqGs3kugCALzJGk7VzP524LpI92xtKfRR7t3evnNgy+8YKtv1GQYQpCzOgehWhXITFNU1PZSb+dsJL16gwRV7qirTgrBMXX/Saf+NJD6Jg5h498pcTaBM+yu16z6bclDnCEILVbY5y1Z+QgGn7COq4NBX7ZSPxs0kCbpfqBlp8R8L8cMOTbQuYXIZoJRkXXlbMqSwg4nMdXLhEXJe3u5CwhovbjeDBetEd89jEzkmuSaeIjGASqjPFmVNVB3PAk2OUUIKVI4icngNRiX0X6SxMcKMbAIKomtkpee38A9y/L280J2h/e9woqhJRdk8vAjZU8WqTNFPK/0uTfE/inGQ4laGrzUAAMUpnm5apkTaddskCfdto0xwkM5bfQEbyUhZl+I7bcAcX+crYDDyHkvO7QEnoAXHRRT1y3pyGkB9U9771O1XHCuy/30nMGaX4ZUUu6j1Pme4+nwqw9vgVNcbp+/f+a5cNdGcRcAIT5LhoQHBGTkeOd6knmTmsSC9PxhU/ahnVAyT0gj4HACSPylOn1PPu/pZn/8r22TDiP/2pIP6bydwNO2SYPbKoNdbN32G4HUl9FL75rUFYSaHXcbQ6XZ/lAcXb9MuVLp968wA4Wf0YNu8KIaU1h4BKe/ouexO+PPO5fKTESvqUu8reCh+SdwXqwkdQNV6tlFBoKsTn6M/lGg8HE9sZInGorABBONnTtRh4iSrXwWRe2q62e82hT2YHnaxQTnCSG1qS3H5h1m0BW+284/H3ZOqwU5406e6dKkAD2gMZ4VHal/nauZ1HaoE1JE56F8OWytxG9G9Bn/4vYKMH7C2Y6AjgpFXdnOZGLTLDdzNwbpZzYzRZJArOl8KYqYO6P78BpDGp1bm+Vry7fUr/QjEKEu6mndGgsAEt+LFr1i0qeaGDhJxZPKNituAcwnoBGHNWJW7q27XmRbpAudYI4+rZgzXSU60QtwAzvV+NZUzxbaWoycuZ6yDys+FFsMr/VCYA1tTQeUXMzBHzsUOkegw/4VG5a7XBRDyeVwUrmWUGU4EYowjowbQFnQ+/znRf1BvNbwyDrcUvwWAACrT7NEgl80aMfGNhMnKobuOGvWV3PGymExxV++MxnqmudFTktkdlOqsIc5enz4rZV0vBuNbTrhPsv7zrFnipu0zaXwmvjq2a4XZNgxrkcREfprbt5kkA9rmpE1y8ZoL/WUNMBFTLOt2saYIM3ug1bZ0TakamkPwPL3LL0ZAdHsaGLsJQKR3qxG1oOL7/jOdexNRB4yBwI23d0kfzq+1cLdcA6AzMDwabhGTC14Gy0+Hu+R4nmRTcuQ6hg5cMSghzuSsuKOTgKb/i3R0Zud//4isIPYBsuwazW/KNl2UhMrsn1cJg2tHFySrjsZKfA4ZtyIICVSCwDZnXXF2KB8MyEt3ohRyDwRK8SlB/YWHJemZKbKJKi3+LNYqOLWbacrMA72HA5hCEGWxrmTRq5BfoNyOw8+90VZa6ixiR3gX6+B2aK8WQKb219PvZEZhEtcKr3iTwGhZ9q/Tg3DcmPt7D+RiJ46sLAfO32xExtZzIIV9YFmq9hUnnnzOa4zmoJKmhSnY5mCXOibBNtpz8pKPw3iRXFLrkuz6SbelqWTJFYkZBoF/2oTv7FUOT6oIODVpvsYTq4aEIsmRXom05AwGWGVIQmMEEMHdZv4iRAby9bUPK9S7BAeN3WHy4snitntOKIt+qEZvr81dv7T+cQmJHD6s00WjxFKj10eC5yc6ySvjTx456Rl/ejuBCf+lD4DpCaLuaXMaRN3BirPkWYVMtpAIbaShNEosOtG/H1S3/RsZB1k2+dvAvdzuovYDSppFTspVSK9noBiG9QO8fokg0jUfh7OinpNdCR7GfYPtXwLJzkw+7xgx/YYSX9hNRa8uQTVYu/tcIuDGUJImIW3BYvGQdV6HsqrXrXegoVpygNBoTT7IjD3evR6mDyv1I2a6161EYnfYmijuPok5+9XwvrxNZ1tWPiNDDmRMctT3LFlA+/XZQ9BIZSvdZ+P12Ag/SxW0y4yN1JQhjLRvZodWan2CkXnz+PPY0IN/DVJ3gkkhspzTAErEctajhSN4wb77kv46DsZOkKvabQ45KhdDb/G26IkO2CBG/Wp6boUSW2LBR0IaqkwcgNxgwhrdRiOSQC1yeRba6fVm702PUnMjxyquos7NExg4KyBo4uXuW9JSlLmr1DYbvC90tMVIEzcQ+9gAWKvd5DRWcmWLSSBLax/owFiy92vyFaxoPxjrX23sfQjIaylA1PEBXYNXj7sMO1vqlH5Q/XauuH1M4qKLIUkp+Bj5PmpgVYKZKep166n4BNuD5RH/pZU9dEvbqtpihukeBs+0fgj3pHTL1ZBgA3gPoF3/+c2uxCQ93YM80zjgLuoP6fj/ni0bzmu/Nq1bGcSkePDNvLdIsmKEqX10TD7zYOBDq1seVZmzZhmFeHxEgsOO5MVD2clIXM/duVT0abAFMEASowyo4YiGF/yMTCVOAuBOd/5YeT4LCJxqOtiBEtsKB9Pm42dHCjREXkZmuZin9v1zOanRemB2OCR0Q/nr3kuDSRdV91qnxSrJvgN5UNj5wKzkFnclst87FuVyE8Kq+Z3KNR04GEuE7SUpLEwMKKiUQpPm2CVmYMk18ZTRPuAsUG3iQQFWAsplZvXS8VsGGhMMOCW+Xf8MgoU5o/X3AOUBBu4apvIAabPEmMGcL9iFT/yBCzNKvd6nrgWjvSdCoj2N1ePvu4sUHXRc6GXJwolya6xLpD3gSvLlCC8LrC7IRSAP75P5JZtm8/LRoaCJBftlWyIX7UFBUUplHdZH3GPWdOtvJTqg8h1oFrQoXxUxPBXKOgB7kdN9GvuGbMdWOTyEUfctP+Tv7VaIkyXgcpn1orfhkR/IMzrCS4FvODUth31OJM5PNweuQ0J8pdvzciYAW8AIuObgA9eC6qHGVN8B2dc+178RM4YklzfP0IXUTGzptBWKkn8iA98aBuZirho0LVQpy85K/6lPwvrU7yNeFTayUnhRFImkQwwp+RcCsJl4KuCpN4nMTpdtEIbWlDPSJhqFZ1Z/6r88oGwLF9RefyiOR2ftmPorL2XO/9vblQ3a+35hWKVDdGBn9JegFyXCd5poaX3iIYFt1nXdSbUYDP2K3hRVg2ol0+nUdsPLGVfhbgI31FdSaDTfHNSPCc90FND4fBPqJsTNCQi1eW2NBEnXxhoqy4xVTv7JdnvCanchSxPm7FSXGjRYIw5N6Hx8HIaqaOfpjhvd2Xr15714d8p5EXzD2TWYcj02seZHKyvZ69ItrbBmk2iMuuEt04XANKwoLsxEFDqTiJUNooNs79/JPdr+B4SGG1LoWzt1rYEz5Qv+KYkg4pUv4g1ikmt5igE9+ypNvyjSt5ewGx389FvwxbN8XfWO+IjLTbZMum03dFdaBnw95uSt96skM8vSFERQKHdi32Z0BVnw7s/LCwlqUprn1GB4LAEB7nqJHYIfnz4zx/iJZOG/yPoUuuFvQYxCXuaEW8BGc/wks8PoHr/2rg7TxyJ+PR8YokqD8kzMXytP655z/kB8oJQCEMNP34VTvXcKeT8l2p2tp7ZfMHFwiP+2XNHYED1XL8sY68ttw6RueRXEQ34f9i1iOq7FuIidSkWTsSEqTYxVxkaOqnMJVgaTpBCjxH8gkoBGjDt9TxRaRDMq8XfIpHCllft+GZOLt9U3MSY/qiMQ1aGeJ9Frbs552bQJt3mellD1hgNc/yTAEbbF9ZrAunFOKllyog3eXbxacmkR2FeB/s6nj+n5SyU/EML4Ocj4atpRnFM6OOJ0UzQRSTuj7tOwtjepZO37gJQZBOPKUIsaoLjAzkx0EIgTtxK1KK2ucWIxDLRzAVxeDHJl72EVUdKHOLX9fEjPnTXHTca7m4YEF7BDFg2V2rIaI82cE6DZ0PCMdOX8C8geG/s84IMERRZTc8dGJ0Ty9YtSqygC/qqQan8ncT40bW7IfVBGTdfu7wGbbvQQuBsfhgzc1Ys/yyXWsGGSXtfblAWzlviO8yEQ2mv3fOXQVnQHuQTFr4FJks6CdSxkga5Ot4CULxl3/glWWXyJ8TsFjdBGRC6sgfZKJD3NIW0qZiRsTCessZ2xOvXsqM7JQjxdbxmIutZKhstdqDusR0HD61JtUSgxZYSHbxEGek6qj9bime8UQ4DPwOIfHoguJwXKhTdMTWbTn3C281DdrUcaADiOTLANbe5jRhEN4QZJkfNqjvqgP3ZP6f/NqGURn/BRcQBSeOrVVosO0yAZ5YPkstM4hMTtMsX716NTvXwfZq3H+2yp1x8S8vP7I5zb7N7EsDfFPiPGrko7xInPCJaBsVgCAStmx9PS3AX+pQepg1L3uB0lXtu1TE7AAwAB7siAhSkkPCwWOKPh1yrEXas3w6/OdDNmBhat2GO8jsSaGl9apVQDMyFcWRIR851NhW3H1wDe0IUhttW0eNTuqF0pBzKzC0r2xOpwAg993FZzQIXNa/k2EXf1KgsIpK8hv6S+fxTO05NMbqyPcGfhojRlT8TLPUD4V5Nn8MOTDHv9ctMMlU4XjCV9kSlGOXGTPm5gtBjU5T7p3hSq1Ho8AVPyiH9hVXfZX8JO9nDUpAWTBVkm7d86NpgcxkeHqpVWkQv1SoYhi82lrv2rYkfZfFMvCnlHfJr4u1PyMEnJ+I2H+F25y8yIMjRdyl8rJyBhPqKpdWezw3Y9AFcMc5AGPVEgcf6a/oNuKokj1vEnKi5Rn9fW46fgnSFM9CxETP51EIMLJE2UhcFI0gevxtYU3R9dQM7L+DsUEpU4fNgEUOwoeHWqSNYLqGlBjo6kPXORLMJ//ynkj++icFtBeZEh7FLM/Qn5eCBTsbvTRgAcjBmSbmDqO1kBb2VKFQw0xEZWcFRRLXtMl+p+2CP1n3zVtAcWie5tOAwqXhGG5N+eXQA5XokN+0lqco8I2uEVEpiHHsQHc1FH1GRG0RORBPvkvdR1YeGhEPLtz0Lkw+mx1IDdpu1R4nqrSfFvBNBt87eNbyefrfeP3Nk9wwl4dyxhsaTz4/q1Gz76McbMpcPApVjcajeY/yT9csV0YXQVwRyOcyVCsdbO3wjWx0AZ2YX6ZWjGTgrNu8gamdkVXKtPsIzQpFNQ8s+UQpbNzWLZ7m3ZpLlLQer+SKao0DjCwW9m820AsEmyzhCyPm9V3k3FjtIyLd6sbS4R1Skqv4SLE6yDN2L+5515mmyge7N64qqd0PzmVbFLD0fMFbrgwooJexCKfafLU7xwAUEcwaLBSwSKCGHvp+4LJXNjHiAG8xIAYxYqFey6SnqDMXTd/Gi1nig95KD11wyJXsc8ARihSKcrGjl+5is0tb4DppQeW//sopx1hE/WHliCRmSokWlBzMn2u12tkZM64qmVKuKaIRY3BhwKmuVH9M5OC7wlWK7tk2yQTGbXXSv2i97AhoajE0g9crto2C20D8hUvJlm5+sSX8Nh1Ai3fnw/7qJbA1mWrjBGnCkKHZgSpBI9RDd1WLIZBxaxNOVi7Qkb/ELg8qXSkA4YoW2M/g+5BzZMFTUU4hJ1VPA95GErt/U+Gdqu/iB2ZlOk6ogIWwJdZUoH9Wh/fyNX8Kh+V5q/Dreo9toF9Va2+rSk1z6uyg4pdIYXVEzSO5ltjwQR7lcQGT4Nzaaft3O74km3o5aVLknTfZ+fZkhPbPArZrPqDiu4J4z6brOZetJd1fC0rxDPlQsBIFIAo5sf5PhsvYruvI1gOgxy+jGAAVlh5aJ0721/7BPxNWi7alRFh3tWrgHtfHVKKrdedofeRX5KKXEoakJYe5pt2oTw5XGjWfBUe1/f4Vf8YXv/r4LgkkxgMKZQVVppHxk+FclOEBucytNlbB4l8y2DCaJQvFhMX12ueUd0VrazOYwucmK8CYNCX3mTWMIYJ7PKr1GDZfCbWnjEXKdBi0TWL5DpoH+F6CTzJg9TGZOF+vTi5oIsbgQQeTkrsBsdoCqzF1HV/hQP2awK0ax3p5MgMPFiZcSNjxekC+WyA8wbeJ+rmPGG7x0ao8yN5Gvx8fKrW3pb4vtoX8D5CXRkKVXggy9ulYBXN2L02ExH7QnVcXpJGxpCEFJKt6hxEIBLSbldXr9+VdB/LxH/vbkBA+EnRukNzPRptyFpAGBce+/mKuArKaX7vqk9oW3zku+yynV9/ncgTyz2JKudB8byFMBVqetRNH6haKtxT3RYRmZm4CW4XUuW0myYy/h0k7HLBmBx3vh+DZfsBi9/lk53ROIcyk44z4P4fDaJWoGj8Xve+Ykt/2yn7YI5qxpZvZRxyFkhzs8MY0tAneDI4CGdR1zTlemK5bH/rjydKtGdB2jC7BeKmy9R8+iZt3uS5ROGsNOhKplxmh9USr0H1phl5N2KSRzghG8hvyzrMQCnpGs1vY5yhA8bImgVUOI6PCEcxR1wazMZuiGRQ6RN3f1f8Otnr300RcaZIH8wV6Tl4qY2ymVvzyFpx3dhcZpxZ5uM/iY2p8P3AyTZeqEptmmi8RzF2UAsJoqZ6pnplU0QjMJlRDf7ZsA1ukiPrkz2EOuJmy6TugCabKaRNSEaS/JM4Uy4Ffu9Tx67udXY4+F56FPWcTzP4Gpnys/ySQ0CyIvyuIAOpjlMzZOEe97LM7oAWLyu8VSgPzCRvQ+n07bbdLIj9mCKf/z1IwKomxYz0ZREhF55ahlH/C3iFGT0P67cvJAu2s2iXkx68WfCm/zoxlwoP1io/Z3H/5L2Zt2/fs2XYbRxhUvVFlDRlDlP61U/KRIdiWjBPfdsnD9YRc7YN14GUj/aTQ3aNAg67Q0LDzBvgUDDCRq6fhzecvkl9dXW18hcV2heP6rvuAKUpKlMUHmNj+fo/X8BZbN9cSeWbxPWesMko2wx2pceV+LrsgaynU62cKl+uT5coG1Cd3QObwpCwteP2avybgDRmAFGBTAiL73EmJFrw12iIrNFTvoZ8FVHNZk82uhInEtnL3toSIb4CwN+IxCFJvJkjarEEfc7z29FP4MBYuGr8AgFb8aNEX+aWba8tonruXz75ZfWwzHTPSusNelicjmug9Dd1qb0Pkegh8lGS7V9OCFcJCTri8pZgWGRBQt1OalHcemK/jqn3VSxRlbKdt1mXbCcTuXv9IYkv4XA0GGyD5de4YtMGziGqeW34XosolHMYT48ndhd9ymHknVIEgvu5Rp/3x3VMtgSQye1Hjefq7OVI9oeIPUz2nLJmifG0kVehDZneN6v/rVfhOJI6b/GNLQVHqKoPpcLjl3riygHb1QvjNlmIQNMNRPI72h20ryk9BPQC4+m8RJ4pPh6iR+W61KyLrCZG5PoeUk+0Nu+3GMogaISfbHZRXMCn+bUbuHQrIARLoKOdlZ2NNg397WRYySkDlNh7gUuih+QgKiJBjUTfAsosB52te8IsNAhvZy7QoFSBoGF0hIWjrmr+8bnEM5eJjXZqWo7NGA+Mg8hGIdPNmCtuxcT7aQlt0+a46lNwvprkgEbyCauCOP5MNjaZbsApRjM+fzcHD32CA4jxKTZ1HmxxwLNrTK+c0ar1nH++U9ecNZPvFgs1kJpYVsLvTjofMEu+AbzfMRz6AgEx+3VyrOIqCtBOaQKpAIL3VgiZQMIT/sNHg67rvRM9aVhGeqw2fmf4w/16oHH6MgsThtdmA6QQ/ciDJpICOYfyDWs3hHDyObsvyDYaJA3RJOdsJrIIyz/XVyw13WWkL4zxgSz4YanO5gPTz5rQfQaMcofx/780BjI+m3K+xOqU/1PL/LgZz9mUB89ipHnXJONrNZzwFPDMMMrgRPPJ7nQoVDBix+MDuaamijuZW+qN+M8174VMpk7MEPZtwCVS2VSymVb6bhDeCkLxHV3nlHPXUruFX2J01CjZwAldLiCCvFb54irRv9y+VdDgTh0rE7tN6HGZI+OBDPuWgZK5/ggEgFiP7fmZ2TqnF8hbAJEevkXYWQzUwoLp+NLHUss2egfK7OWn4KsLYbW/VQedTzQzkfxMhNoEeo0uCOA8+rAJD/XTXSD2j5RBBY+/EPb114ICBG71eOxedHwWEtFmAuSCeuN67KOUDaGa8+kkxyQHWL2X0LuUrpr5IwhCNa/y4Zkc9aiZwRV4kGDYcXbRRljTHOysLYTJu/kZ+WC2IFjMh3ywlcmulSgSa9aUXsq7ABlpJQsox+AB78uagi3BoXahJeD35C+kDhZweKEDYzgnEpEgbAJVbhbE21A9LoUPLQTcpUn4NQk71lnprVvSBqQryCVygHe91BtQlUCOL5xH/WK4L1btD1A2JiGumksl5PTGdHrk8cQ3Vkd7vJaqHZDO8z9L5c7euNromF1DMzOALMpyFTiVqWdEbgTUCzVUqUTftXkHx2v3sVyvLHAgCjcWXQ5AydyG3Y2JEYK5bNAyp2y9UdL6kx+CfE+OzQm/TECcq0Q5izERHLheFgJxcR3VD9oZC5ZG6bLnrYl02G98qU8Qd+1t0JbOneaVpRpFUDBhapjRPdQq6mWFXvLw6OrjQk+sOzjff+tMdhlkYJbcCf65mhUsCno7zYQB5Tz15pnv6C/U9Gb77aPcU/hdZgc/MX80qWNxP3RjHiOceXmksRWKAAf0YESTvr7h70vlVO4lL+GKeVzbqOiKAKTNO8tY2bwMdcXponP7u5yyUkQV/+j85DNygxcQ1rtERyjs6mtlp9kSs+FgivPHUSfuYL3mC601pDTlhdWHaVKFlgPwRs0L8qJ91+eAIgoGAkSUAF5gwFfbujwd0qEwKJYXyqtkgQv80X7Ov8vcKFmN7zXVwFoL86vREY4tsBPrsyuNKtLCUjGDIVqMAMgAaRrqqwaMIQiV9q9IlELEmW3THvou+d9FbN2KN9azcA/WzxCtXyUxUt7Sb1KV0UI3Z10UbSOZ8mJ4vaDV/sF5JafuZdGsVIhopxW6gDQVDgmiR2OosXRL6m2q5BLTCKRLfp87EW9UbDVFh0wTe/j1vw4pIDlgpmvWIoEQBqfrvLPFJjtlBVEV3brCuGq8+H/m/bPfn+Uuz5gvxEbDOqcrkK7uR4+2pzBrwNYEtFiQzCrJ+Ecg/cuGNbs0abq/NrwTiNVbjgqmPpIOuQS7Te6NqvhXY//taUITXUA3y7mimUfhFibZxGHGtL1oXYMHAap/7Q+mHLthmr4oh/q95fKeoVGXeUsL+qzQwC9cKmweDXJf3OxCh7I36f7fIG/HHoSnDmTqSv9X9v0i4yNTLcMNWcK15hXAAASvpWqshzTrKBWfRqxOb1Dovx+mOQRozz/UtMjtnCW9Lxv0ZDYp9mLURpX+89oDpD2baGVWZXM7mwjzPMGvmyIusV09q+7dJM6yUOy0ZmpecokFrJTtA0ePyjFu5H52uwVXGMI5IH4DLL0mWrRopfJHCOkzfFX3eKOyOhg501Zqap24lSsrIadHkDMIOJiB/2rVCeyhLiTgIN1DveXNzcSn3HcaRWjZbvhEu+7K2LPbh0yapHoIlUrbnKw3i2U+Ir+bXZ3eDzk9snUl1+HlNW/+ki0EfUE0s1BIR2K8rh+LMRK8ZsrQepQpyvufzpACYflaJBdsf5051PJUbllvNBCMXrLTnwgHBVyEZQ1HGGEvhD37Pn8cVmEl/71NiSqVdKSR/gsfnuy7oqd7uM4TPoHNMLzdGHJHgS7mfJX7r7mxl5r2AAGWB0Fnut2Deva749nF48yapD/eLZabSFvxtsX/oV3MeN/9GLnqy08RiM68HE7/13PnfAm0WhRNAXcJ1Ns2lVFpQ9aM32ElqLb0qilhlOs+TOMeQ+H1nAKXN2Ir+mvEZBJS+ogMJEjQU/Kh1d0tSbw7hXPWV2nYrhdYPOTTJOaHEo2oexWT8ZfOHVIYXMb58TvaaVEg/9p3Sg1+stEJ3uuSUidLDUpfAv3Jr4ksEQZANV5Aia5fxKSH99dNQjpI30Lb5MCS/CUO84ICI3wNVsTMo7A5vJzlvtRwzRgJK3p+mnTnNYcOLPMzVpYbWDmNijvzzjR5ILE0LeFIg1BcrJ8u/Y60boYhbhnGvJ/OX3OaNK5gN6vDqT1CKh2fG3E40zmA9KIzG9uQOwGW1gB4Hc7GiqFyGl6xRnEbEkhMyG+xLzeGzKJuG8KgKQDk9CFjIp55LhGcTs7IJgOcWjBeyz1lew0k6EupH47z5iIOrkTzgaMaRHyZwAnsxzBsW4TsCRH/bWMWayr/1IBmWVwu4vnR9mVAe60SZwGJsioe0r2vAxN6pGYiuz6PupauwF/kPXcaDRvNtFjU2i1I8KPfAkMxK28ulj8w7SdVgPWTxuVRq5Kmg8D2tPc5gEdjKZnEnLErONZ4bm4ExFIXspw9nurUXno/lpG30c9J9RuWecoVT2xPcE6sN61BA0H5ZZeL7bsZHDqDduKv9RJyn5nEmk2X77iqobBs+KdSye9dQKybYlxFFfbyOIpXdnLAfaiOtAMFLP5cVHePxKrYSTIAMGMCKmKHfgSv+kjQXkRzdtIQOHNkwGDLaqQNuctqSx27+0qvA2zIEiveyxoImfWkMR+1kWr67ppeIKPP7c76FzsSXl3Mna+hS06e2zgMTR4PBJQscswXs5GMkKVhhYHNJ8vGAlSAvM4nhWBi7Ykilp88wNylbn88I78pvE0VmjwcfK7K7AvuaFPc2U46TUvovYS4Ppse6ZmCHEvLJGTSycYl6FBoBXBz5e4WMOWfM2Tabtg+PYT5m83e9ddY/ud380Cyu6dBZ5uSLPlxJIQI6gyK9JpVcfANW3fC+CwkVTPrCn8u7jaHDiSogUKFiz3tj0sVHwmfJ0S8PJWT9SV3K1jqcixjdcqCfovvpZBrfqgh6fBMflwQlDbyWYidfGLSfjJZVqzchLLR919zGGK4lzUWvf2G4DOwGxX96vQvGFCTU5mn+Y+BQkFnT+sZiLP6sx3dQJ0jSMKqc9T9v+SGsMaFIEDA8b+C39ZfudHmYfB5SAfXs9VqrP3TADPbdQUiYZxUBLf7PZTuqSPjmTocxTEGeNP0Hj0j4DB9LXVstJuXjLQoU7KEYx08EQ3R3ld2F9mH3of+8tfbr5Fhl/6nwaqGMPbPmb0Stb80T7I/CW9NxZkQVm53kR39Y2vUfL2okMSB4KJUGSRZ4WzY3H+nl0VyeakJ/YGqrdt3orr2Ih10jvr8pI2BBUDA5er2DqlUT8+6qJd+slpduxGw27lN/1G9Jc8JEvhIretKlf5fiNHzMnONvg8zh2gFx8SDz/rJvnsZCIvLJ4Nl+ulqR4ylmYRJ0wfLAqSNKF1GhAnh6t6Ae7/JB3DmQTWLjiYURZUrK0iIktrsCIfuazEl+PdgGPHlDANd333EiP/AD64t5XeCVCRl14NTYDFWR+Vl5tENkyt4E76DixN9hDO13d1DyzMyPtB6oHiTarAfIqs+KSUeuD6U9w+Qo2OIzk9pMmNf13CtYDFzopf+qnEF/hWlIFRzA723AJOrYHub+STVd4NQaWzSKa1f3Yo1zhiMkPwqiYivMkcryqx6a3aV53Fb9Kf6zyGiuzqZWNNjGja+Ra0goO3cchyMuwIBE4kh3/IBDwcADzBLEbCmAEDqluYA16Xnnsh8SlZiZXb4j/Z8tihnZuBm/myFI4EP1Eid3iHbMrtV7gKEUg/CNR3M/oIDZtTYgcwgAk4Gu3+zi9P1UzYF8agqwQxffakGypfK/CcKsKk9KOGlGWwe2w5g3kEw3UMycQYLXrMWoIgRu81ZTMRVoT3kdvucKOZuLvavr3nHOmqG0Xk/WfR9Zh/frJhIjjrqhpM6Ch7lIUV0oTukz6GjmknQrmDdnP80a/fHn83/RPw8pP2EPtPucewj8L74wd9PymwsqO7M1oxgC3CzbOsg5U58uHenV2eaRn6rkOYdSRi9EaCdlybbR2/iAGWIg0hWRaApGbs8aGZseAyLkIzVk7t/4O1v0cKEHf2mfur3yb7+DN6rftZED5YH/foiZWQqPt7fSDz/JjDc+AOJ3iK9x+L78V6Mvgkd3DYGxldAaXmXS3p2oMuN1AwNiSA780VJsxLAU0I36FZ6C2lC7mO3j0tKPwdZwUWC2ZEO98rqLVFJOwgLoslEVabyjQ0oKUx4zlABaLh3XxIK6dx23In0x/8JRT3n32p89Gwn/MqsUDHQGxnBO0o9P3clpH2jC9Jc1O+6giGwe75n4MYReok4dUptsPrtffWfwym1AFDWjIgG1j2/DR1Y9Oyr5NIKWOgxyz5scF1jo+CAA03/For1+WJrzl2z9CX8c7QmqwWoe7cPN2ProEG5U8eoNZnyS+P1aaaFSleucZnwW9pNqCOIDsdWvlmmIyEluwlAprYsfeE92hOrMu8wXUPYvZccJIGoaAAj3MKmuchKw+kW9X0mTfB/QPst/8WkABt1rfEve0NjfFgypP4d6bksUJXzbSYb2xHu2DHTdDlvPFgU6CpL8ToDqi0mM7knc9LptiUo/hgxcmxTZ35ukJhQUtfwV/GMlCZbev9w+e4tajQU2KJZruQgC6qsuVAdiK5CnzOsLGIz+T0NPbtRTSCGAfjfoTUHdtTHfRhaM0rsnMpNubDwEETT1SPBmtlVfrOBw/sgluhwVNTeJFfYsizbPEnFh8549oZCjLV39zLlHkPRbXj2hzIJmbbeJYDu/LUb4HdQUvtYguQfnO9BR0f1ruv5iOSI7RaBrcH6QJ/vjnlQaD2Sld60sdXV4zGVq7dUcuMR0UAd1zldMX8eMVj2c2u7eca3OlWCX1VM9F2q/2lHz8toLz266eUlP21SPn50Ylk9wX9uTtuKCNkBDy+Vg8tCd4e3xidHZzeWkSF9sTgqBdWDUqB9x8hgRh0bD/TeLKQ5et/jjnK/e8lySOgeA0UImt0hjWitkI+EiA3m+3yhSTwYZdYK4Dtj60bKQtOxBEo4lCiTyYCIiCcI0JykrPoHLkzOSuODLiEy/R/9yYGAVx9drA91OyU0qFnwoeQP5M1y79G6jxmYVJ63llIbukziZCjDDIwcff+eMU3VrHd3jv14kucbqJhCPqtK86gvwU+5IXbKbZsHxZRIcX2lh1Ko0StQRFZR6AB28CqSE4w62XotTy8w2J8iFUg/Fx7w/r0HsNpvjEQVxTVWjW9lj6NGeUriUJlhgjrNGzr5AHu/CwLkGWrzS6VBMQIVjfH5JD2sOczg9+xymU+u7VJbz9Rw0wevd4X7He0jvLK7rl5WRPNe44nOrqa2lMqKKwQ+sYAChPdvyEEUHNqFv5gKvEP9FgaAphHToqNzJt/ziABDpFbmlL1ehAlw4+fgko3V7ckQh6/o/D0CF5HnflAGFFKA0fkL8S386BgiBg5PaJo8cSK4ApbHGA3l08SqHRa0qNw7lHsR3r4wUDACiqGjkg2w2F8kUqzQpkDlALoSGTPqSMzGhVS9CC0HmmQ+LYHdL1BpuLdunQ6SRrZBsmjnpKp7aNJ8LQqQArc7vlFTgM3q54h+JsY4G0UafxqUsFzio5TVilzOHHxtoDcWCenfBoMJb3xpzvsoMlsgosmHKQNRV/0eVaJ9f1AViRfps7c0YELt+d4Z9USQY+ROCnJDBvrQkRoIuoyYtSMDmQkTb9lZJwasrOz/yCCVI9oTDzofY8TAPICQejyoiS0VxrBJEfhcgDxbRzUgcbDSP6dDv/dkr1POcEH4C9I6ONb23/k3rJE6wHBHg7yPVI7Ask2HkIDwd5M9H3hUItG4M2MDVEScWUUsD5eIU7LGKEv8JvBbW/i/kDKp3HJjluVoR9GwgqZEOJvh5a6XqfyJ26QqH3lOWHHw+HJ23e8cTn3qcQ+ff7SeeXwkdMu5DC3EJQjYpeP+DOgSBYyqSDuKqg3Y/tJ3exibVFt5BjzxebtTDtEWIbkQrYsU1Je8HsPW5BFdHoSwsrL2Miq+btn0bwuyfZnpkdJaUB6tMR/q5A9ckUFNU/tDeyz04ewwM9U2Zj9Ga/f6+6WCuIDkbMaoL2uAXye6oWjA09w6pWZNOBEpmuAPKmwJ3oQyQ+nYWlFOaA0hp1OaF0Bt8isWpwFgJPijAFj4fcNbCV4jaKQDlgEmnzYj18H85tVRCixBa6U4qyF35bpwzyYybcWNpIMcve/9AWeu4puI3b68NLBxmI0A8/t8yfOgVvXoDr1aieAAA==', 'base64'), 'image/webp', FALSE),
+(decode('/9j/4AAQSkZJRgABAQEAYABgAAD//gA7Q1JFQVRPUjogZ2QtanBlZyB2MS4wICh1c2luZyBJSkcgSlBFRyB2NjIpLCBxdWFsaXR5ID0gODUK/9sAQwAFAwQEBAMFBAQEBQUFBgcMCAcHBwcPCwsJDBEPEhIRDxERExYcFxMUGhURERghGBodHR8fHxMXIiQiHiQcHh8e/9sAQwEFBQUHBgcOCAgOHhQRFB4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4eHh4e/8AAEQgDIASwAwEiAAIRAQMRAf/EAB8AAAEFAQEBAQEBAAAAAAAAAAABAgMEBQYHCAkKC//EALUQAAIBAwMCBAMFBQQEAAABfQECAwAEEQUSITFBBhNRYQcicRQygZGhCCNCscEVUtHwJDNicoIJChYXGBkaJSYnKCkqNDU2Nzg5OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6g4SFhoeIiYqSk5SVlpeYmZqio6Slpqeoqaqys7S1tre4ubrCw8TFxsfIycrS09TV1tfY2drh4uPk5ebn6Onq8fLz9PX29/j5+v/EAB8BAAMBAQEBAQEBAQEAAAAAAAABAgMEBQYHCAkKC//EALURAAIBAgQEAwQHBQQEAAECdwABAgMRBAUhMQYSQVEHYXETIjKBCBRCkaGxwQkjM1LwFWJy0QoWJDThJfEXGBkaJicoKSo1Njc4OTpDREVGR0hJSlNUVVZXWFlaY2RlZmdoaWpzdHV2d3h5eoKDhIWGh4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXGx8jJytLT1NXW19jZ2uLj5OXm5+jp6vLz9PX29/j5+v/aAAwDAQACEQMRAD8A97PSgdKTPtRn1r5teZ6mwuRSHpnnH8qBx1o7fWqGHPUUZyeRR6cCkJ9jVpiYp+7SjpTc8dOKWqGBOP50Z9iKMd6T15PNUmTceD70e1J0pD3piA0ZOexoPb60oHaqTAPrTqbQOlO4C9enFJ+NHNHUU0SHTuaXvkUmKUjii4B/jSj0oHWgZ4HXNWAHr/UUHnmj6UUBcPw60vUnNHpQBg/4UEhjijvR/Wgjn3o3YCZzQOnFOI60Ln0plXEA5/CgcZ4OKXFKB15NBIgGKRs5pwHYUHqaOo0J2oXAGKU9+5FGCQRmgQYoAwKMYxTjnqaAG9efSlx83qKXBxjuaPqKB3G/4UAe1OGOvvSnmgLjQOeOlGOnFOA6gZNFJsYnejB5xSgc0pXOeTQAmOMUEe+KUevelxzk9aLgNGMcikxTgPr+VBFJgJj/AOtSdM07HvR/PFJAJ9aXjPvSfkaU/SkSIB1z+FKKMZ9hS9B1oGwHWj6+lHbBIoJ/LNSCDjApfWk70f4VIIP8KU8HikHTpzjmj0oKQvQ0DHSjrSUCbFozycUGkB5PpQCQvbpQDzzSZoPQ0ihe3pR25ozSZz9O1Jk2DvR3pOpGO1BwO3akUOH6Ud6Sk5/yaQDiRikzTc5GDR2oCw7P+RSZGDzSHpR64qbhYX60uab29qO9ABS54pByM0VIC+n1oFIelGaAFP50h9qCaKaAM89qUEDg9aSjOKQByT14oJ44pCeaO1UAoPJzRSZ/WlBoDcOtAIFJmincOgp5GKKKM0XAD1/Cj1o78Ug9KaY7C9/xoJ/yKOc0nfFFxWF4o/75pBR29qEwsKfvUZFJn60UPcaQH60nH96j64A9xRmgBelFJ16UE5OKChaQd6Q9aKBWA0Gjmg0Ba4McDNHcH2oNHPencQdRTaX160pHB5pFCdT70f55oA6ZNLQgEOaDRzj2o9xmmAnsKXsB3o9e9HWkAlHuaXFGOKVwAUh5PFL6UlMAwfwoxz0pR06Y+tHOaVwE+tB96XvQaGwEHpR2pfoKQ/nSFcQAd6U/SjHag9eOKBhSgj1pAKXrQAe4pAO5NLyBSdelSAUD71BH5Uo55p3JsJ75pT1o70EHt0p3AaetA60uKT8KkoQ0Y7Up60gxmq3AUcUg59qWj0oAT1pR92g9aTFADDRyeKCePWjqOKgBe/0FJz1pRxSEUAHv2o+n6UY4FLVoliDFLSZ7mlqgAc9aQ0vrTR0zVILCnOTS9znijPHPNLTEH1oHXnijvzS/zpgJTs8c0UAUAIcjpyKB06UpGBxQBzxVpkh2oHFB60YzTsgQDpwefagd6UAUAVYB36d6TFOx0pQB+NK4DcGlHBNL9SOKB19jTJExxn+dKBg9KOBRjA4/GnYAAzml60oFHXrS2AQj1oxx14px6j0pDyPamAnQe9LR6mlp9QG+vrQByKdz9KP0pAJ1bHelHX9aB160uO/50AN7c0vpS/SkzyecUAKMgdKWg9aD9KNwAdeeaAKTvzSnBFIaDv14pSDmk/zzQp5FAWDPHSlznHaggUh9hSsICME4FJilpG9KZQo96Qe9Ao/HrUWAWk578Uc5pT+tAADiik65oI4xmgGO/wA5oHH1pAMHij8KkEHelH6Ckz05pT1/CpAQf0o/WjPFIfxyKChf5UYFB6/SkbrRcAJwaATyTQKT1NIBR05paQe1BwM0mwA5+lHQkUmT+QoBpXCwv1pDzSd6OlJsdhc/ypMmj8aDx/8ArpXFYOKOfag/dozikO4elBPWjnNGMZpXEHXk0p5NN/Cjvyadw2FHf2peTTR900vbFSAZ5oo/WigAzRR24pM0ALQemaPb3optgHSigfeNIenSkAuKOeOO9J1paoAP3aKTtmlPpUggH3u1HAFB60e9UMKB0zQetHWhAH1oNFHencBO1KetAHH40d+tMBPej2pcc49qTrQNAe1B96Wk+lLQQc8DtQOxoHSj8xQ2O4Y/xo9/Wg+1HGe/1NCGAAzSClHXrQPyouAnbijrR60UwEFLSde1Kf61IIB1/wDrUHPWjnOM0dunNNAJ9aU9aKD1xQ2AmD/kUo46UYFIevFMA70vX0oPFFJgIc0DvilI6UAc85ouAA8c0GjtzSnj2pANPTigdKXrmlwPSgBuM4J/Sjr1peh7/jR6Ci4rDfQUY5zilPalHpUghAOOhoxS0GgYnU0lOHX3oFAAeetA9+KKQ4z1oAM0E59qM8dqQDOOO9BIpzTcfWl75/ShsdqChP6UetB7Ucds0AFKOO3NAPFJ+tAAeT1opfXn8aOtAEf+FFJ2o74qUAE9RR2penrRxjmmAH7tIe9O60neqQmB9BSDOPelxQByKpAwPT/61A+v50Uo6iqE2IOAODSnnpQB060uOtUgDH0oAyaXoPalHBpoQnY0oHFIcU7p0qgE70AYJpT0oGcU0SIBk0oHNLRTKEXmlPGKF6e9B6/hTRIZzigYxg/pR/FS+9DsAduTQMAd6MZo56CqABilx+NHfNKMelPqJiClPTHvSe1ByTmkIOhpSeKO9HSmAdueaOvtRmgDtR1HcBilxxjtRjmj3oEAoJG3n070vGc0mMdKAAjjrkE0YyetLjuaCPekAH6UgI9aXtz+lIKYC4pM4HY80Zzwfzo7e1FgA5JoHFAz3pc85PFBQp6UmaM+9ITSFYXJHSkPIBpMgcUdMVJVh1J60nHOKPpSEHQZpc0mec0p/wDr0EgOeemKM9MUhOPegGpZdhSeaOopM96O3FJhYXtR/KkJ49KM9BSuMXPFGeKbS596QBmjPFJ36UEHPtQAvpQOlGRmjNSAvvQcdxSdqCcHii4AR1o7UgI70fWkMKO9Jzmgng1I0KaOT3zQM80CgLBz/doo6UVIWAUn4jNKOT/Sg9D9aTBIO31pAOT6Ud+tKaLi6h1FFFGaLiQnryKXvRSZoGxaB7igfzpPwoELSd+c0vtQB0oAQc80GlHoaMYoHYQe9HTml7Zo9qYhMcUooxkUc59aBoXFIaXHvSdcfSncLMWkxilPXoaPbk0xWChv6UmaOp/CgbDnFA55NB+7RnoKAFxznBpBS0UAJjPFFB+8KKAE7Uv1o680UDQUhFHTijtQMD7CjvR15o5JoAPqf0pD1pcfSjrQAnQUUvagfp3oAO+aMUd8HFKOv4UAJn2pT7UgFLg5/wDrUAJjjkGj60evpml+lACY5o9aO9HOOQc0AHze1A6/SjrR83tQAHocUE5oNAHrQAh60U4fXFIegNArh1pKUe9JQhgPejFKenWkPWpAQnvQTijrQabAB7+lAo75xQB69aQCUUUv+FAkB78UlKOgpDjp2oGFHSjnPNBoWoAQMj3oP0pO1H1oAB92l70nvQOtAMXoKO3JNJ9aXpQBEOg9KX69aTPegHP9ahMBc9zR+PNJx/epfeqCwZNHSkOaUds9aaATqKXBA9qOoBpeoq0ADvTqYM4PenZ4piYcZ4oyORS9DijHJ/KmhCEnbTu+KTtTgeee9WhAM0tHf6UGgAxzQetA9qUDsadyRMcDrwKOnNOpAOM1SAT8OlHHelHp1o+oNMAz6fyoFHb1oz3p7gHPY0vWik4PGaaAcOnvR39qTtxRntTW4mKfvUlHr9KOnWmMcaPr0FJntQfT1pEhyV4oz6daT9KD/nmqSGhemaTOOaXJxn86TOBxRcQuecCjmkzSGkA4H1zSg8imDGPxozxTsVYdnrRnim5JozxikA7J/Ck4/KkzzQDkUAKCc040zJ4NKDnuaOoCk0c0lFLQLBmkJ+tL9aPWkyg70vc5poODzzRjjrSasApOaUHimntilpAApabz2pSePelYAGAetFFIBxUAKfTvRSE0DrxmkAvak70cdqCOaVwF70HmjI9OKQUXAXHOaTvS5OOKP88VLBATRS0hHrSYwJpO9L7ik5pBYB09KOvtS+/agUDQUnfOaXtmgjn2FLcLahRQOnHNHpSC4dxmjtR/kUc9qQXD/PSgdxQKMDrTJYGgdOnSlHP4UUgE9qAKUfeopMBMZPJoFL0xijPOaYXDuKB0o7UUAHQkUhzil5yeaDyKLgHej6Uh+8KXpRceocYopO2O1HQ59aaY1oLmko65xS9h7UBcKB0o/rQOKdxMTtS96TFKOv8AjSEJzS47d6PQ0e9UAd+aMf59KPrR2z60DsGOcUnbil64z60YouD2E/GlPSg9KDzUjWgnuaP5UvekHHPrQFwI9zQaP8KKaGJ2o9qCPQfWjrTAOo9aWk+tH40AH9KXp15pP/1UcjpQAtFJ/Kjv71IATxmlpPejtmmxWF/HvR9aM89qKYwpPqaO9HfNSLqL/DSHk+lGO9BpoYcn/Cjpmg0tDFYTOKT+L0oAxRjvSGJz2paKDQKwzOM8UpOaUUYGaBiClHI5oFKelADaO5xTgOlHqaAEPakFOPSjGKAExScHvS80Y96AGn7tKOe9LjPrQPagBpH40tL24FGDnpmgBOeaMHFLjiko0Ai6DH+RR/OlpO2ORWYWFOc4x+VIaXr1pP0qrgKevvS9PwpM8etANNALxjP86O/vSUpPTnrVIAA5NLxSA8/jS9s+pqwF9+tHfI/CkXrS+tCZFg70vU0h6ClFWmA6k9jSUp96YC0Cjvn3oFNAKaPx4pKKYrB1p1NH9KXr3ovqMWk4zRntSe3aqRIvH96gnB5NIfr0oBwTxTuh2F4IoJx6n04pE6U6qCwE0nb9aWm9Oc00Fhf60d+ppAefrR2OOtK4hQeKBnmm5wO/0oPX1pgOOMdaTPvSZpDzQA7NBPpSA85o9e2aAFJ460n65ozSd/xoKHDpRnkUnajvVEi0daPWkHTmpKFzzS/TikpQfmxQKwDpS038KPccUhi9Tg0ZwOKQdaD0oAdTfejpR9algHOKd+H600n2/KlGAKQbAelJ+FGaAO1AbDh05pPwpTQPu1mAU00vSloAKM0nalx8tIBOaWlA9aCOOTmpYCH7woGMjP40YGR3ox3xUtDDGRS9frRS44yKT3AQfepOtKP5GjHGOaB3Dt60Dg80uKDUiuIfrQR396U/QUnegLi8UhA9aU8daQ8e9IEg6c5o9c0nvSk/WgdhPy/ClP14oIz780fhQKwdqO9FB6Urgw7+lICetLRximIO9FFKaAEpD0xTl6UtADT0pOaWjt+NAAcnrRijjORSjilcsT8KPWlyPajvQhMQ+1HtjvQORR2x+tMm4etAPy0DrmgdKYwoHSkpR29aEOwAjFHek+nSiqCwp57cUe2aOKT6VIxT0opO/SigA9aMe1FBoF1Cg/X6Uc0mOlAxehH60g7UvU80AUAJzjmjP50tJj27VQBzR+NL9O3FIPapATmnUmOwpfSqAPpSGjtxQM5FFgFpO/Oc0vakPalcBaTtS0dqLgJ+HSjvS47UHrRcBMH1o+vX3pccUuMmkK408mjjGO1LjvS9sU7hcaaWik4xmmFxKXGDmj2/Gl/kakY0CjFKBQetACdaADil4oPSgBOQKXGKO3vQetABge9IadRQAneggYpR+dJjvQAnOaPWlxwOaQ4yaAE/nRj60vHt+VFACGgUppO1ICKkBpO5o/HFQMXvR70gOTketB4BxQIU+vSl6GkI9aPXFWAvb3pcnOKTt/WgdaaAUcUfTk0nNGf51VwF69KdnOaKaOlUA7PGOKX2pKO/an0JYvfigHjFJ60A4FVcELRRnnFBNMBc0uTTc9MUZ5xQIXNGaTtxzxTTmqTCxJ70hOKac0fjTQWFpc0lICcc0wHCg00nHFLn3oQBQOo+tJnkigdBzzTQCjntSgnGelNyPWjtyau2gC5zQc54pOcc9aCeTRrcAJ4oJpB/Ol9MVQAetKTxikoH3aLALnijHrSentS56/SgAz+B/nRzikzx7Cl/GgBQSeKOozSc5wKOnFSAZ496UcH3pMc0oAJ5qgDtz1pQc9aKBUgBzSHOOaWgDpzSYCCjj070o60CpsCAdKBxS445pT1oYITp70Y4paXjt1qGDE5z2pOadjn39KO1SAmKO/NLSd+9GwwHtSgZ/Gjt1o6cHNS2Jit1o59qQ9KD0/wpDQZ7UD73+FHcUY5pB0D1NKOoFC9KMcip6gJ3pe1AFAoYWDuKWgdBSL1qQFpO/NA7Ud6TKA8Zox0IxRwc0nJ4oAMdQaD0pe9IRnrQApx9aBwfpSdufxoPp60CuFH4UU6pJG0dKB96g9M5xTQwPHajNLnj6UlIGL1NHJOOhpO1KfWgEHejjFJSGqHYWj8KOe9A6UC6hR6UdBzQPvUFAOnNJ36AfhS8f/qoPXFJkhjkg5oHtR3o4ouUGaToaWg/epiYmT35o9fpSjpxSEUwQf4UYoGfWl6ChDDH1pO9LR6/SgSE7Up6Uoxz9KDjH4UDG49aAOOuKcQMnFIemP5UAFA6UppMcUAJ1FB560v4UuMHNNgNxxQKdjjGM0c4/nSJE6EYpMYFOPX8OKTHGKChO2aB1pT044oA5zjincBKXrRjH9KdSAaOvQUcelKBzR7UCYY5Hajqf8KPQClGAaBDe3NKO3NLS/lTuGo0DmjFHc4o7ZpAxCBRS4pPUUBcTpQP0p3GKSgoQUnXmlo/CgBB1FKMcg0DnilAOKAEP0oHJ/CjHcfjSgYNAAfoKQ80vHvR/wB80AA6UmOaX6Ug6Yo2AKDRj0o5ouAU3v7Uo/GkNIEFB9KdTT9M0AV/ejn6c0hOaMmskVYUdaM+49RSc4oyehqhC/5NAPOe9NPv3o+lNMdh4PHFIDgimg9aXnGDQIcp5NGenvTRgGjJ4NUmFh+fSgc5puef5Uq89OlWhDu1KD60zIGKXPOO3rRcB3SjNID/AJNBPTiqQDv880jdKM0hPvn8KpOwDh1ozk0mf50D9aYrCj7tHYZpAfTvRn+dMVh2cmmtR9fXFJVLcoMilOBx/IUh6UZPNWtEKwq9KWm9qXr0IFJAxaTNHbNHUc81ZIdOMUZ4paT68U0ApPag+vekPTNKfTNNbhbUQcdaOcUduKDyOKYCg8ijHWhaUdMUAJzSjpk0H/8AXR/SgBBgDPSlHXr1ox6560Y6frQAd+QDR1HSj9KUdKBXEFKB0GaSlHagYo5pfakHQYpen1qWAgHOSKU0Emj9algLSYOKO460DkUwF60UUHFQwEGDxml9Pej+tJ+dADvfj60EjvQtHeswsB6DrSZpcH2oHuKT1HYKUdMUAUHqKlhYSgc0D3FL26c0gQd6G60fQij0zxSY+guKKKKQhPX0o/lR9aWpAKKKb/nNAB1GKceaacY5o6cUmUHajtzR6/40UALzkGkBo46npSgUmK4nTijvmjuKPSmMB0Ioz1pR0NH+NST0E6milA55pMZGaAYHtmjoOacRSYoC4lL1NKc0dumaBCCjoKXvR9aXUdxOtIOlLjvSgcVVhCA+tGKXHTFGOaQDce1L2pc/SjrVAJj2xSAU49emKTkdqEg6iY96XFKOtHJNA2xvr7U6kNL9adxXEI5pP607+goP9KB3E4o60uOlLQIbjIpaKX360DuJjmjt9aU9DR1H60AJigilpfrQA3FABzS4Pelxg5oF1ExzSAcdvyp2BRigLjcc0YpSO4o6E0IYmBijH8qWg/e/GgoQjijoBSj7po70EiDPp3pMYIp2P50oHFAdRuDS06k7fhQK4mOKP8KUjigg4oBCEdaT2Pan465pMelA7jcc8UY5p3fFGKBXGY79aO/FO9OBR+tAXGr0o7U/GOMUY6UBcZjmlA9aeBzmkx3oAbjA4FGOafgdaDj14oC5GcH8qQj1p9IRwM0DQyj2pc88elNPBoKFz/jQcUh+tJSAKU4pM0hJz0oAUc0hNGeaQ9KAK2eM9qXPemA45zSkjjisEaWFzyTRnORRTffJoTGL/OjPJ9KTtRV3AcM4PNGeaTJxjrSD0p9CR3196Uenam/T3NL/APqp3Execc0o64zSdaUAYOKu4hTgDOaUHJpoPbFLTWwWFzx1+tL2pB34ozwBViFFHU49KOaOg55HamgFPSgf5FJml96oAHSjPakAp2KbAAcjNJ3pcdf60ZpoBp/yKBSt1FKOvSrATgClXrSA8dKXjrTAO1AoHU5o9BTRAL1pT1pO4pf6cVSGHag4z2zSY5o/CgQDnml7fSkApTn05p3ABjNL9KQdaOlMA6ilo749KKADoOOlGD2oxzS9BQAdTigDtS0Ad6AE70tFA65/OgAp1J2o/CouK4g606k70tAxBwcijvS0UAFFHajv1NQwDHpRigcUZNSwF4z7UvY4pOvXinUrAJ6ZNB68etBoHUVIwx+VH0pQODSYqWCA8gUdacfpTe1Sig9PrR1NAHtS+tDEw7UYoxS81LEJjtSEc+9LzzmgjrSAQ0fWlxRgUAJ2paTHFKBikx3E5z3NBFLS0BcSkHpTu/FGOM9RQFxuPagjJp3fNAHP40EsTmlxmgD2pcVICHg0mOMU7p2pcU2DY3H4E0YFOI6d6AKQXG/j9aMc9ad26UUANI/OlxSmjAwD6UANxRjnkmnkZFJj169adwG496XGOaXGBRgUwE7UY4pQO9Lg0AMpR0xSkc0YxRcBoHNA68elOxjA70oX06d6YDKDjinjpwMUmKAEwfSkxx606lA49KAG9vWlAHUUoHHNLigBvb0oFOIpMfhQAmB3pD0NOxRjtQAlHbmlwPSlxnoKAGdqXoOe1KBxntS4oAZg/h9aXBpemaMe9ACY70H6Zpcc0HPtQFxAPSgDnn6mlxn60v8AhQAwDjrxR36U4DgmloAb/wDqoHAp3br9aO2KAEx05pevalxzjijHOBQA3H4Uc54pT92lx69PWgVxMc0Y6Uo6UmM0BcQjnpmjnNOGc4pO9AxNvbFA/KlPegUE3G9Qcml7c0uAetGB3NBQn5Ufw/hTgMmgdDQAg/WkOfene9JQBGRxTW+tPPIphx+VA0NNNJpTz9TTCelIpC8k0hPNIetHepGH40ueeKaTRn2ouOwuQCc0ZxSd8UvXvikIq/kaMnI9Kb7e1KR7+xrI0SFB6UgPFGecYpOwFA0Oo6daOT7GkHcVSELSjtSdselO4J/CmgE9hSr/AFoHI4/Gjj8KokVf6UL1NHGeMUvI/XiqTJAdOacKaf8AOaUHJ4qrgOxScdulA+tB6Yx/9eqQCj71B5Bo7UZFUge4hzinDpn0o9KD0qkxB+PTinU2l9M0wDvSduKX+dABPJpp21YCHt1pR054FGPSl9qq4Dc/XNKcUvbNFUhOwnI6elHal7Yox2qwaDnrQBR14HagfoaOpIYzR1PNA6cdqUdc0wCkPQdKD04paoAwM8cUYyDR1NBoABSgfnRjjj8qUcGgBDS/Xikwcc4pfT0oATntil7ZoHJ/Clx70AJ6ULSnkZpQaBaiYJFBPXmgijHTmlYEGP0o6Uo+vv1o4pMYh6j+VLS4GR60mMfnSAOOlBBpeQM5peo4qQQmKMDj3pRjFKOtIGwAyBn0oA6UoH5Uo9ahgNoApSKMUmNMQZNGKdwB+NGM1DC4DpTcUoH5UuPxqdihOfwo/rTulJ/EaGSwxRijj1palg0Jjml9MUUY560gE9/Y0Y5xS0DvmhgJijmnYOc0g60hMbRjnNOHNFADaXjvml20vNADcZNLil78cUvQmpAaPXtSkcUuOMUuOO9UA3GCRQM5pw/P60oGAf6VIDeh6daMHdzTsUe1ADcUYNO7c0EcUEjcYGaUjilNJ2zVAGOlIBzTuaMZOKSAQjikI+alxxSjnr1phcbjg0HOKdxR6ZxTsFxoAo7dCaf0NJj3oC43Bpcf/qp2KAOaB3GgYHvQRzTsYGBS4xQJsYB82aMU/HPBoA45x9aAG45pQOvrinYPejHrQFxhGM+1GOfb3NOxS4qrBcYB6UbcCnFRjmlxkUrBcbik2kA04Dnnil96LFDAPrikIIp5ppzSAbRj2pxGAaQgmgVxMetGD6Clx60H6DrQMQYNHfHWjrS/4UAJzjBo6H+lAHHb8KOKAFxzR3xS459qOn0oAQcnmlHfg/lSgCgdcUAIOBQQMYp2DjtR16UEiY9OtIRxSnrQRxzQOwgA47UEdaU9aPrVBcbz7UAc05hxRiiwIb15o7Uo6elGKkYDqOKORS5Gab+GRVC6ifhSGnEevWmnr3qRjT1pjCnseO9MftRcaIzTW4ye9KaaTxgVDLEzxxR9KaeaXNIA9+1HPFGR60nTr1oKFz7UvQUnv0FJzj1oHYr/AKUZGaTsf60D8PrWNxoU9eePejOaKOBwKYxfYdKOOlGf5UHpRsIM8k0v+c0g6cdKUde1MSYZPYUuMDAODSDj8aXsM/jVoHqKOnvQOvNKP50DryM1SEHOKUDnjrR0o5zVAKv40vTB5NNHf1px9zTuSGOQD2oXv60Lz0oH3u9aAx3tS0UD1pIQmOaDRzS1dwDkD/69A96B1oC8Z5pgH9aMc80DrS96YCHkcCjHrTsdhSYqkwEGOaCOKXtSjkVSYCdfWk9z2p2DnANH51SIYgBHajBpRQecVSetgEHvSilK84NA4FVcA/rSflSjr0pR3oAbgdaX+LilI6UEH/8AVTSABzQBjp60uKXnHNFgGgc0oHGaWjnGKQriEUCloHvQMTtSjqKOnSg9eBSYBwP/AK9GMjrQRzjuaXHbNIBB1FL70d/ajjmlYAAFKB+tHene1S0A38Kdikpxz1pAIBzgUpHGBQD+dHNSwAjgUhHendaCMHj0qLANA9evvS80pHp196NuD6+4qWCE+lJ9RzT8c8cmjbSsO43H60EcmlxRikwuGOOMUDrS4PrR3pBcO/Skx+tOH60mDgGpEJ6Dp6UuDS/WiiwCYOOaXGOtOxxSGgBOhoxxS4oIpWAQDnBoA/LtTh3o7fLQA3BFKo/KnAUDjvQAgzijHNKc0UE3EA5zQOtOI79qMUWC4mPegClAFLj/APVRYVxh6dKMHGKeBQB7UJCG96CB1pxFJgYosO43HNLinHqaKYhnTmlIwaXHFLwTQA3uT0oAGKd+lH/fNACAA9aAODS980DpQAmOOlKBz6UAUvv/AEp2HcSgjpSjpS9hTBMQDrSU7vRimhDcU6jH1o468U7AIBQetL0FHoKVgG0U6imA2jt0pSDR35pNAMx7UEU7H1pMelQNCYFJ3pfaj1yKCxpHJFJ/OnkUntQA0/pR3x3NKRx+NB4JpoBope9A6DFOpAJ/OgDtR/Fmlzj8O9AC0nrR6UvqaBaBjigUDpR/KgLgCPyNFFHvTuK4e1IR+VLR+WaLgIe1DetL2/8ArUh60XGgHU5oI96O/NDdKQXAckD+VBI96T8cUtAxrHJ/rSE80v8AKmGi4CMcCoz0p56fjUbUmWMb9KZzintzTPr1qWUhD0pKOaDzUssO3vSfxe9LSGi4Du1FJnikzxnmi4Ir98c9aADx9aBn0NHPf86yQ0xT+dGBtwaAOuTk0dMcUwuL/hR3zmjGOQKUdTgilcQg9PypcYoA+v5Ud6tMBQOc/nS/0oA+vrRjoO1UkALyaUDscUDtxTv69KZIg7nrQOlL2oxzz0qlsK4YzxS/nSjFL361QhPpQBxTu9H8qq4CAHGaXk0vX60dDg07iEopcUVSAT+lKc4wD3oA/wD1Uo96pMAOBikH86caTvxQAY7dqAD170o6Uo44pgNwSaCKd05pP6VaJuw7+1HGPWlOTRjr6VaFcTnPrS4GaB09aPeiwC9B7Ug60o4zRVrYA/DvQB29aWhRimAmBgYPNKBzz+HtS/jxQBzQSxPx70vOfUZ5oxnmlx0oDYQjrSU7mkI684zVAwxzRj0pfTjkUdqkewY/L2pP0peaKAQnqRQMYpe9Lg9/woGJgUDrTgOOlKB9PwqQG9qXHNOwPSgelQwEA4A6Uvp0pe3JpQOKnUkQDnJoA4p3ejHFMoQCgjBpRS8A96zYDcHHNLgdaXtSdBUsAzj86McYpcDNGOPakA3FH+cU7rikIpAJS8Z5oxxSgZNJq4BjtzQetA496U47CpsAmO4oApxGKXqKQDR7ijA74zTgCDQV7GgBMewpMdxT8cUcUE3GgEc4FH504dcdaXFAXGgHAoxzn+VONAySKLEiY9O9HpS9hQKLAJjmjHAz6/nTvwpOtACe+OaXr0pfxAFJQAEewo70vXij0oAbg44zS8Y9KKKAExzRgY4paOg9aAE9qWg0UAN/DNLzijHpSkcUANxilxSmkHrQAtHfj0pcUD17VQCe/SgdaXAwBS96dgEHNBFKKXtTQBSAH/69Kego70xDcDFLjHWloosA0igClxRigLjTRg0uMGg859KTGNNIacenPJpDUsaG4/Gk/OnUhPepGhO/amk9j0pe/FNOCKCg/M0duKXpSA4PQ0X1AOopc4FIOnNB6UALn1pe3t1po684xSg4oAcOo/nSUfyoPr+NArACMf1paTt0oz0IoCwdc0dqBxRnmgYuelApM9OKQd6BWFzQCc9KT6cmjP1oGBHWg9hRn/CgnIoAB170n+NH0Bozx0oAae1IeppxptJjI2pp6dqVjzTHOajYpDe1M7U8nvTD0zQWhOM0UmeKCD1/WpKAd6TOfyp2CKaRzQAYOaPanYzmgDigCv29DRjgDoKdj3/D0pQOPeoAbgehpQOKUZzmlHTmgBMcUfhzjpTsHPFKvU0AN6dKXtSgGgdfwpoBB3pe30pRQPTitCQwM0o5oHP0pRxnFAISnDnGetIOn9KXvQhMAOTR6UdulLx1NXcQopKUc9DmjGR0piAcdKOpoH6U4j+VACe9KeBQAO4o44rRAJ3x7UcnoaXHWlx6VSAQ/SjGOtLjJoH3se9MTE+lL396BStntVoTYn1BowMUuOOtAFUITFH5U4j9aUDimA0Cj+IU+kxzVAAFJxTsdeOPSlwKpCY3FKBx256UoHPFLjH5UydRuBmlPBpcDAyKWmhjcZGaUDilIopgJgUnbtTiCehP1pPwoATHAxQBzzzzTuhFGMmgBAP5UY54/CloqQQEZNFA7ml7UDYmPWl6UYGaXvUghOaXvQQMDmlH3qhjD2FA6UAUAD9aRIo9aWlwKTFBQdqUAZ+tLj1xQvFZ3ExPSkPWnHkUnYDikDAfepccf1o/iFAHy0DADg0hHOM07HFA9TzUAJjpwaXbS/SloExuKMcUo70YqRARzR3pQeOaMjucUmAmPyo7+1BI7UFh60WJFA9TRxgUm8Y60bx607MLimlI45zSAjPWlBGKAA9OlLijvxS4oC4nakxTsYxigigBoHzUH360uM0uKVgG9sUd6cetJ3osAnbpR6cYpRwKDyaAExiimtLGn3nUHvk1E15ag/6+P/vqq5H2BySJ+etJyP8A69Mjnif7kit9D1p5pNW3BahgUvejHOCfej3FSAmKKUdOeKCKoBO+KXPHtQRRQDClFIBSj0psQDj60D9KBwDSnqKYwHvQRRxRQhWFx0pKWgUwEPQ0UHrSiqATnrmig9aKAENIeppW60lQMTsKQ049Kb7ioYCU08gU6kNIoafQ0nSlPWkbpQyhPxox6c0f5+lFTcLB2xR6CjOaPwzTQAPel6ikpeOppgAo/n1oPTrQOv8Anik2AL0o/ClpD707gKRx1pODS03t+NK4BS9TzSZo6etFxsUfdH0ox2pOePalB+bii4haTtxzSHqaX0oQCe4NA6UUn8qYIRuMEU0nmnH9aYfvUhjCKYRxUh6YprDAqGUiM0zAqTmmn7tBaEx+VBBpQOc0tJgNH60hBp2DRj60guNAyOaXHA607AA/nRxinYLlfAxxS4pQMflSgc9O1YjuNGS386Uj5ePWlxyOfpQRxTuFxKPzzTsUg5PBPFNBcMEijHNLgmjGaaEJ1PFKRmgetOUd6oBozTvelxSYOKaFcXHegdaUD1oP86fQQnejHGaUClx2qwAcCkpwGeaPamhCEUtB+lB5oAB696PalFK3arTATHuKXtn9KPyoA4poBcDNIRzSgd6XjH1q7kiLxQRzSgcUpHFUhMbgEGlH0pccY9aUCrAQ9RQOtOIzSKKpMAIo6GlxkClP9KYmN5/CgU4jA/Sgj8cVSEFFFHYUwDHFOpB+FLjJyOlUK4hGaMHvS4z0pe1AXG9KCP5U7g0mOaB3EPX2pSPaijHegkT60DBpexoxUlCDJpaOvHSj/GgdwHr2oGM9qBSgnualjEHTn0pwHekx06YoHXmpsAD1wKcB3po6/SnVLAB1peKQ9aXt71IriilFJjPNLnNS0MO2aDz6UDkf40HNImwYGaO3FGQO9MZwO9KwEtN49ahaVfpTGuB2NV7NibRayAM5pGdRVNrkY6ionul9cimqLZPOi+XA6U1plA61mSXgz1qvJfe9aqg2Rzmu046ZphuV5Oaw3vu27nvVeS//ANoZ9a0WGJlWSOgN2PWmm7HHNc41+f71MN9n+KtVhvIyeJj3OkN4OeaX7YPWuY+3e9IL84HINH1byI+tLudWt2OOf1qWO6GM559a5Jb87uucdeasRX+TjdUPDotV13OrWcHHNSLIM+tc5Feknr+tWobsk8GspUOxqqqN0OMUu4VlrcMB1pRd+pxxXO6LKVTuaeR60bhWeLv3/Kl+1e9DpMrmRfyOKCQFySKoG8UDJPArmPEvitLYNDAQW7n0pwoSnLlRE60IK7Z0mpazaWSnMoLegNclqvjJgdsb7c5AArgtS1qa5cvvkOeM9qzLi5JCliSe9exSwdKmtdWePXzGUtI7HRaz4ym5ETu7Hk/N0FY48X3IfBLD6k1kTYZgCp+brUEkTBS/TB6Vo4qOx5zr1JS3OmbxdqKENDLgcd66rwf49ke5W2vpAxPFeE+K9dl0+L7NbOv2iQcZ5wPWucT4jnwyywyqtxckZbaen1rjnBVrpnq4R1Y+9J6H3PbypPCskbAqakxXyv4G/aStYdkOqQFYzjoK958EfETw14thVtN1CJpD/BuGa4KuGnTV3setCpGWiOv7UtIMGlrAsTvS0Ac4pP8AGgGLSe1AFLTQXDtiigcigCmFwoz+NHT60cEUBcX8aKTP8qUmlcQUUhNFUAHrSZpabSuMXNIfakNHSpbAQmko+vrSE1I7B+dJ15oNIetDZXQTPNBP40H73oKQdMD86m47Bmgdc0mKKRYoOaO9J2oBouSLzRnjoaTPbPSl4x1ouAe1LnBpvfNKP0qhWFyaSgdKM+9T0HYB7UUh60Z9iKoBT96kzSE5+lB6UrgO60A03Py0E80rjsOxQeabmjNFxNDvakoz70madxWBs+vFNNOPam9KZYw01hxTutB6+9Q9RojpD7U49TSD0oAbS45pQMUdz60rgIPWlI6H1pQOKMcUwG96CKd2oxkUAV8Z5pacPf0oNY2KQ0ClPTHegdKXt70wEoxSijrQrgAFLxRggZo7n+VNAA6nj8KXpQOpzRjimiQox296Xrigd/arATGQaXvQBilxzQAg96Xoc0oGAaPSqsIQdKOAacAKMVSATr/nvQBilxzinY9aoBo78UYzj1px9cjNBHpQgEwOfypcDHalx6UdKpAHQ0AGlPP5etHb6VZGwg/SloHT1pQBjmmmAAetAFL3xQOpqkAADNLjvQOvIpQB6VQnoJjpQRzilA7HpQQM1SFcTA9qMenWl6ZxQB61aAAOaPY0vWjk5pkiYp386AM807HNNBcYOhpQAOKcBRimK40Dnj1owcU4UhU9c0wEA55oxS4/WjoaB3Gn9KBxgU7FIOoOOKTGho6k9KUj86cRxik9KkLiAYNHPPIp1IB270rDuAx6UCjGME0AHH8qlhcF60tGOc9qWpZQAZJoA/lSnmlqbAHGKAaQsAKjeVR3o5bkt2HlgOn0qN5QAOaqz3AA4OKoz3i5681tGj3MpVDRlucD2qrJdAdTWTPe81RlvexaumFDsc868V1NuS8A71Xa9z3/AFrFe6JOQ3FMa5PrW6oaHLLFrobD3nHDc1BJe4PXoayjMx6H361G7nPX+lP2KMXjHsaUt6eQP51VlvGx96qbMec5zTCcjv8Aia0jTSMpYmTJnu3znrUf2hsnHNMZeQTgigbR1wTWlkjB1JPqSGVz14prStUMsqgkA847dqry3Iwc/pST1Jci2JSe9DTZAO41mm4YucZx61KsjY5Ofeq5RKRdWbDfePSpBc4X72e3pWcxI5GSaY8jAYIP55qXFFe0aNYantbGehq5a62q43c8VypWRznBP0p4hc4GcVnKnGXQccTNPQ66TxFHjjkVGNbWQ/K3X1rl/s2BvkYkelWomiT5VYE9MZrNUIrc1jiqh1KaljknHOaUasMY3dD1zXOIzMSAcj0qrd3XlIV3cjrmh0I9DWOKkbGteIRHCY42JPoD2rhtSupJ5WZz1PWm31wZ3PX6A9Kib7+CS2PetIwUNjlxGIlUfkMVMKQRj8SasWWlajqdzFZ2UHmzSttjUNgtVzSrSKbUrNbmFntnkAkRX2lh3APY1614L8GaNGYNRgeQwyysI0k2s6Ljv7+4raMU9bmFOlKbsjxDVNMvdK1F7K8ieCeP78b9RVS7mEMDlwRleOMkV698b9G0y1Npd2tuY5pHKu+WKsB0/E14b4vnWK2cZJ3YVMdz7Vz4uSgtNmaQo8tTkPPNav1SXUNVlIZYVIUDpuzgCvIbmaS5uGmlYszkkmvSPiZcmDQ47QRonnzZIHUgf0rzdMDsPzrlwfvQc31Z7duXTsIBgdcVqaDr+p6HqKXmm3csEqHcCDwee9ZxXI4FMYZPNdlmLc+0/wBnv44weJUTRdekWK/AGxj0evoBWDqGU8EZr8udJvbnT72K6tpWikjcMrA9Oa+6v2b/AIir4w8MR213J/p1uArZ715GLwypvnjt1OqlVcvde5693zSdR7UZ5o7Vxmwc0dDQetJ3/CgLAOhNGaP/ANVJ2qQsL3P0pab17fjSE1VwsOyKTrTe9L/nNK4WF70ZGcfrSE0nFFwsOyO2aaOlGaTPGQKVwFz6UhOaOeO1Jz7UXKsLTSeRSE8UUrjSFP50056UHPtTalspC89hScelHekPQ0rlC9KOc8d6aTng0H2NFwFFHekySMijPHvQAvfig9KQnmgtxQJoUHpQTTc80EnPvRcLC5GOaM8UhJozR0Cwvfignik9c9qQnjNAx1JnH60h+9SA0DsO9qM0najPNArDgRRkZ6UwGigLD++aARgd6aSc0Z9vehPoKwpNITz70cYpD1ouMD+FN96Xmmmk2MOoxSYpaTNK47AewpeOfemk0oPegLDh0pDyemaTNJuoCw6m9fpRn1pM0XGkMxx1o60uBQAOwxUAJjBzSgDHU0uKBRYVwxyKMYpRS9eOtUguN9xS+1LjilAoQXGqB70uDmnAdaAD6VZNxAvFAAxzTqPr0oQXExxRjn2p2KCPwp20AaAcUp6U4D9aCKpEtiCkHI5pwBzRjimFxOtLzSkYxSgZ6UANI4/ClHXvS/ypKaABzxSdsUtL09yapDuA6UcdfxpQPagVXQkF4BoI/KnY70YyRVoBB607A/xoA444oAz9atIlgevFKBRjmnAcVSJG49eKDyadijHIqkO4mMe1JgDNOx+VHtTQriD0pcDFLjmjoKtCuBFAHOaPrSg80xXEFLRRximMQgdaCBigelHanYT2D3oI9hQDSr3pDEPTpTcDqeacelJ1pMaEHU0YxS96DSYCY/OjGKX39KO/SkAntSijtS9eKkBMClHNKRzSE+pqGi7i8YpjOBTJJAAelU7i54NVGDZDkkTzTAZ/xrPuboDJLcVWu7zGfmrJubzrzXXTpHLVrqJdurzPRv1rLuLvJwGzVK4uzyM5J/SqjzA8Z59q7IU1E86rim9i3LcsWwCfzqEux53H8ahAmY5CNyeeKlEE2AChHP5f4VrZI5HJy1ZIDkZz24p2c5wMY/WkWKQL90/lTJDt5PB+maGxdB2cg80x5ADz+NRmZcY4zVW4lKnIyT9KglyRcEik9ePXFNMqdD+dZ7XDkcKelQ4ndshT+dFyHI0Zrj0OOOOfWmh2JPWqSRTFueMjqauwQ4GOB+HSjcLsayF846H0/Sozbkk5yR6Yq4Rx6ZpTjt2p2GytDboGzxxipGVB07dqkxtz/So2wSMHH1qri6DWZAecZpmVPPBHpmkKAtgtwfWpTHGIyQcexp2AhnmWMcDj6VUe8dm4GP8AGrEyA9CMflUSxqWyBz70uUT1EUSTDcznpT47XaAeQB6ioZ7nyG25IpjasQ4QDIPena+oJLuXZpzAp3HgfkOKw726eQM+cgdxU+oXwmTYiDPrmsq7kCLtXOcc57VDQ5TdtCCSZmHUAg4OP0qRJAHVlPzHHbmqhG3PPc/WpYyRJtYE5GQMe1Fjn5jpdOl09oZBP57s6jZ5Zxgg9O/9K9d8E6dBpXhu1v8AV7xrW2DmaMTbd6jsCw5PHUY/KvFdO82KAyCMojNt3mLjOR0JHWui1fxXqWpaTBpmoy+bHCBtAGCRjv61POlo0dFOaWr+X/BL/wAVfF0Hie7hgtY2S3t3IQ5+8a8n8YahbaVq+kyXMCTQzThCr9DkV09vbwF2dACrEttJ7+xryT44Xty0tr5UUkYs5dxBPO7sR61lWh7VLsdOHblU55b/AORw3xknlbxEbYuhhjJaIKeADXDLkEeldj8SLkasNP1sq2+5jxJ8oAyvHbrXJAf/AK6xw0XGEYvdaP1R6s2nJsnhUMh6A1TkyshHWp1fbTJfnOSK676GaGoehr1X9nbxRN4e8YwHewilZVYZ4zXlGNvWt7whM8GqRTJ95WyKwqxU4OL2ZcXaSZ+l1hcJc2kU6HKugI/Kpz0zXG/CzVft3hGxkJyfLArr0cMAa+eu1ozvHUZo9OaSnzALnNJn2pCcj0o4FLmHYAeKDSEikz75pXGkLnkUH0603NGaLjsOB460Himk/lTSSKOYLD88e9JkDvTc96TPBpXGPJ54pM03PpSFhSuOwpP60nfBpCfzpM896B2FPNGaTPFJ2zQMcTk0lJnHWjP86VwsKMetIDyOKSkz2xRcLai5xQPeg9PWk6YpdB20Fz6CjIApp4FHJzR0HYUnNBIzSE88c0HPrRewrC0hoFDdaoBcnPWjP0/KmkjFBxU3CwpPNGcd80wn86Udc0XHYUnjpSnrkGmZwBRnmi4NDwaCRTM4FG7vRcLDwc9+KM8H60wGk3dvei4WH7uOaM00mkJxRcLDiaac0mev1pCeRmkx2FyaTJPBoJFJmi4C5pc80wnPejNIB2eeTQSKbn8aTOBTuOw4kdKM80zIxR7YpNjsS9qBzS0EdKEZ3Ck6c0o7mge9OwgGMUuKP0p2PWmAe1AHPeil+tUAhHrS9qXHvS4yPehIVxuOwpcc8U7Hp+NKO2apILjcUAHvTselLj26VRI0D9KMdM07BxkfpRj8aAExSde1OOcnNGOKAQ0jp0pR0/pSkDg+9H60AJj5aT0p3pRgelUh7jKdQRS9uetNCsHPFApccZ7UL1q0AoFKANvHFAH50N1qiWLjg9KOlLxmirRIfyoox6UvNUgDFHQilOKB1/CqAQDIoxTu/pSYqoiDiil/D9KOxNWAlNp30pPerJF7dKTvzT6bjjilcBMUhp3I6n/9VB6UyhBxR3xigUtSAh6cUcYpaQ0AthO9HSj6kUVLGFLmkpRSAOtL3PNHGKiklA71IXHu4XrVae4VeODVe6uQM/MRj3rIvb4DPzVpGGpnKaSLtzdjBOf1rKu77GcH25rOur7cxG6s2W4Lg5PFdcKR51bFKOiL9xdsx4/SqczuxIyCahVhnkjHvWLquqMHMNvliBjI6Gt7xgefKo5as057i0hXdczjrgKnP61WfxHpsQ2wwksO7nNc5J9ouEb5HOTzgVE9pg/NCcj1/nTVW2pk5tbHSTeK1CErCGA44POaov4s3oQ0TID/AHjwPwrDmgVyWCnd6DtVGe1Y5dnZsHpnk03PnMJ1JnV23iVwfMyuzHRT1+hrSttfguEVWdA3o+MH2z6155HG7MWAz2xnmnIJTOMuwx156jtSd0CryR6Y01nhmDcex6Uy7jIi3oNw65Gf8iuAtrmaCX/j5kAHTHStKy1q4t7gkFth5IY5Bo5u5tGrGW6N/wA7aTkcA/WrHnFYhIFG2oYLuyvYjIzKDgEshzirEFsgQGIh19R3qmh8rvoOilLxBtuBimecTLt3HirSkBcBPxqu7RZ4AJzRYGiUuoUZ47VGkvz4UCo52by/3asxA6CqvmXZG7aRjsBnFWQ9DRacLnIHfvTGlDHOO/NVN8qx7nUjPr/KmNfKsiiUiJM4Y9f0qQuWw2f4Me/pUbRyO33iFz0FRXOo2JlU27Suq9cgD8hVKfxBHESBbkc8ZPX3ojJNXQNpblyVZhIFjjLgnBJOB+dOWKQElnVf9nvWV/at3ct8iMi+uCBVix+1zMw3hz3OziquRz3ZYe0VwZZJlz6HpUcdpA8ZfcTx2HSrUdoygtcXG/PIQHOf/r1ZSzIA2Ac9jxz61pGz3Gl3Mr7GMMEiJLDg9qzrixaFWMrrnrgd/wAK6Z7ebBWOMl/UcCqE2l3MzMXbdnA6cfhRV5Le6J2OUYYyuQ2PbmpLFsTFScsD05rYuNElgIlaeJW3Z2nOfrVeaGRZizBRu5yMYNc/oRY37fxpqiaLFos3kyafEwYRGMDODkAn0qXxv4nh102txHptrZlI9m2JOTz3Pf0/GuSZP3h3EevBqC6vo4ioePgnqOcVnzvZm3tG1ZmlHMTl0O0+hPX/AOtWF4s0pdb0S7iRGecxnCB8bjjI57EGp7e6TzCrEkenWg3Dq2/PynHSlqtQVRxd0fNt/cP/AGNPo80ZWWzlLKG4YDoRj61zyyc4wK9U+OGjKl/D4gs40VJTsuNv97scV5bcwGOfCsGHXK9KFa7a6ns0antIcwE8UHNKqE9TTjhTjPTvVu6LI8ZPJ/OtbQjsu4wSfvDpWWvJODitrQYTJdx4HO7nJrOb0Y47n2h8D78jwjahv7ozz3r1C0uw68NXiXw4lNjoFpEcr8oPWvRdL1EYHPX3rwXC6ua/WFGfKdukgYYBp+f5Vk2d0GA5/WtCOQNWEtNDsi09iXNIx70dqaTxSLsLmkycdaM03P1qWOw7NJmkJ/Ck9aEwsOJpM5pvbrSE+lUOw7PekJ4/+tSd6TPvSuHKOyKTP0pPzzSZA60rjFzke9BP/wCukoouNIXJo7/jTc0GpCw48GjNMJ5oz70MBxNJntTc8UZ5zQUOzSZ9OKbn0oz+dFwsOBoJwKTvgUgP407gOz0pM89aO9FFwAk4zQTz/gaTqKQ0gDPPSjJwaKQ4FDYAT+VKDTfyopsodnIzSZyaT3opXJA8UEnHt25pKTPT6UDsOJ4pM96TNJSY0PzyKM9KZ70uaLhYUHjmgk8Z9aTORg0hz+NFwF/lR70nNH40DsFFH8qQigQueKQ4zQPu0h/CgLAD1oJFJ696OQcUAWMen8qdRjj3ox+vFMyEHH86cB3pBxTsGgBMUo4oAPWlI5q0hXAClx70o6UoxVJEt9A2+vNAFL3xS9faqAQCl70pFAH50IBD+dGOfelGMYoxVJE3A+vejgUUmKGUH0/GjrS4x703oDSEhaTOD+FKaPegYf40hpOn1peM1Q0Hegev4UtID8vNUAvpS9zRjijvT6CFHIHfn8qWkHTpSnrVoloO1KKPWgHj3qiRc9qMUmcn3pwqkAnIHSl7470fjQTzVoLDqQ/SkJp2cimKwg60ZoPWkzjnFXcBefSkPf6Urcd6O+PUU0KwnSigdKKYwpD3oJ7UZoAAaMim5oHWqAcTxSHtSHJpM54qGNDqO1ICe9L+NSAooOOvSkYgCq88wCnmgNh00oUdazru72k5qG9u8A4OfSsW9vcggHr0q4x7mFSqookvr1hnJNYd5eMzdec0y7uHcnHNUicHk/hXRCPU8iviXLRD2cnrk/40j88570zIB6ik3DIwe2a25jibuyrrF9HaWjuz4AHJxmvNdX8Ratd3L22iWskeDy6rub9eBW38QtXg0+NjcMGbGVQV4T4w8b3935lpaylIyeQnygflWcIua5md9Ogt5HoEdl4yvrjZHJKZ/wC4uoRpJj/dDZrQh1DxJoN7HBqc99aK3Kx3ke9W9cM2M59j+NfO8zy7vMDtu7tnmuu8J/EjxVokIsZL3+1dKYjzdO1EefA4HoG5U47qRSnSk17rOnkg90e/6X4h0/UcQXEf2G4ztB35ilP+yexP9010Xhqaws/EtpJqcMktrkpMgUEhTwTjvj0NeZ+Hm0PxhYNdeE08iYQ+Zf6PI++SHb1aMn/WR989R3rvbSO1l8OQ3keoJNJDtjuYHwJ7d/4Swz8yN2cdCMHBrGjUmpOM1aSOavhNOeB2HxA+Hg0+wk8QeH5/t2lsA4dHy8an1Pt6/nXnMK8FSQNvf1ratdV1S0gltftLrBIMPGSSp9yM4NZSqwl3oocMc9M967HUUlc8yootpxX9eQ5oUkGDkdenTPpUMybRzkKeenWta3hDh3lDlFA3GNSQCelN1C1SKRlJWQY++OQQf8+lSyHGxk/a5t4ZjyuApAxWrZeIbpSqS3OccBCoBP4/41lXAH8OARx71EkTyrhNrd2GK1hIlSa2O7s9Tt9Sj2xPskHB52nrU0Vtfwsd8aTr2BOGFcRZtdwZ2TH5eNuM4PpXR2GqzswWWBz0w2eK05kdCqJr3jSkmnUFFtSAT1Peq8r3CREjZG5PGegFaInnddotjJyCrBx0qBtMhln81rBRIepL/wBKbsxS8jGla8ZdstyrDoSvOPahYJWbIVpCT1z/AIV0UdjGm4iJBk/3eT+NOa3LMB91PalbuTymLBaQCQxMjKwXcSOMfjVO5ulguEjh0uR07s3c+tdQIQP4QQOtAtxuLGNd3TpTBwM23t1lZQ8QjJGQjDp+VXZIkTYh4Uj+Dj+VWYoHBDuUVfRef1pZZPJjONp56+vNCdirJFPbOFT7PFGQw5LA7hj61biEcQJ6kjLKnPNM3TsCY9oOMgZ5/KoppbjbmYx2yZ5YnJ/Skp9xKSLwdA3zLhexNRXUtvEpDyoCe2awdR1ZrdzDE8cv+2M/nWRLcvLkuAW9h3/rUuokw5l2NTVLiN2IRm6HIrKnnjQMzbvQk0sJaZTudiR05zzVLUnSOLGeTXNOd3ZAouRBeToM7TjuCOxrHad/tG0ufqOOaXUZGXBJGGGB2zVAMVcMCQfrSHyuxoR71JOcIT2q07+Zbk5B7Eg9frVewcFSjjKt29TTmBhBUfdHQkdK1jJNWM3oYfiW0j1PSLuymUZkiIXaM8jpivGbLTjO91Y7YhLCpddxwWweQPevd7xV83eMNuHX1/CuR8ReFbe53X9kwtb1TlcD5GJ9e/1qO/c78FO3us8fuA8b7CpGPbrUJ+nWuzvNNG4+faeYg4lAOGQ+xrPfw/Zzvmz1NI8/wXC4I/4EODWf1mC0k7M9NRe6OejXJ7813Pw+0x7nUYVwMbhnjOKz9O8IahJOoWW2kU9CkoNeu+DNCg0ax3SNuuCOvYf41z4nFwULRd2XCDbuzu9Nu44okgU42AD+ldHpt5txg8Zryq01KSO+dW6bu5PrXa6TehwuWAB74rk2Vjy6srzckemaVfZC8+ldHZ3QYDntXnGm3TLjnNdNpl70G72Fc9SJ24XE7JnYxvlaeSazbK4DLnIq8jAgHmud3PYi1JaD6Q9OtJ3NIam5Qp/nQabS5NACHpQe/vRSUXGBPWkJ4oyRmkyMZoQC5NJR/wB9Uc96CgzRmk9PT+VFCAFPWgn0pOaDSBC55pMj1pOp5o79KdygPWjig0gpCsGePejrQRQKBi0ZpD/SjtQAtHtRQKaAKKB0oHSgmwUh6UtIaOoCc4ooopFB1pDz+VLnikI5oAQjgn3pKU5x6ZpM4oAKPajHNJ+NAaBmgdeKXGaBk0DuHfFFAHHPpTqBDQOc0DpTqTFAMSk6mneh9ab/ADoBBSHNL2/+vQeo4pIqwgHfrR04oXpjrS9qYiyOR1oI5o6UvGasxE9fpSjkdaP0pR+tBL0Adad36mk7UoHPWmhXFHTFKMZ5/lSDpTsiqQB2NGKB3xQDVAPpoz049s0p5ozTAOMcflRxSemaUntQAnHbNB6UmeOaM4xQAuSP8aQ9PSkyPWkz3/Si4DqTvSZpM9cdaLjsKP1FKSOueaaDwPWlznrQFhc9qQcDrSA0uePrVLQB2aXuaZ6ClBB7GqT1AWng/lTM4GeOtKvTGDVoQ7rR296RelGc8VV0S0O70DvTSaUHPOaaYrDlNGe1NJ9qUmrT1GkLmlBpmetKOlWmJxHZpM0fxGkHSqRNhTS5puaTPPFUgHAj1oJphPFIT0pphYeT1FJmm5557UZ/+tSY7C5/OjPJ5pM0n+eaAFJ5NOpmeKUYz/WgLC5o3Ck3YGahmkwp5pMewlxNtWsi/u9oPP1pb+625w3Nc3qV71wf/r04ROarWUVcff3x5G7vjg1lTTszHB4qtPMWOc1HubOM5zj8K2SPFrVnN6Fhmz6+9RHH4mkV+Pb69KazjPJyDV8xzOVxHJX8Peq91dLa28lw5wsak81PnPTj2zXBfG3Wzo/g+cqwWSb5FweaV76GlCHPM8U+KHiybVtanhhkIjRiGIJ+n5Vwy/M3Jz7ZpjsSSzElmOST3pzZjgWTI3NXUketayI3bJ9hzXsH7KvhvwZ4j+JCW3jWe3FnHCWignk2JO/HysfTvjNePOR+dOSVlIKMQfUHBq4SSZM4uUbI+5f2lLX4ReE/BhudEXSNK8TwlW019LIWcMPXafu465614d4Q8Xad4gmS5vIoY7hlMFxAiABN38a/7JPvwcg9q8LnunlOZHZz3JJOfzqxouotYalHcquV+667iMj6j86wxNNVo2benW+o6SdNt9+i2PpkapJ4T1ew0bWZc2V9HnTb12yuehhkJP5E/jXTrZ77kKkgAYguV7L7dj9K8n8Z6xH4l+FS+daf6RpbrmTORk8ZBHPIxW38HvEd+dK06ayu7q8mG60ubaTEgUDoef4SMEelYYPmlC094u3+TMcVQgnzRPpHw94W0K78NyWnh/V2utR8nFy/llFcsSVWQDtntz061j+NPB6WGhQSzadJaXsa/O0dx5ytjqWB5X1yMjtgVzOg+Jrjw9rrS2RlgedCr+WB0645BHX1qxqvxH1LUdZsn1uUoLd/lEESggEYbIIw2fQ8f07209zglKm4tNa/h/w5x+p2mx2Vt4YHkcj/AD0plpbSSMCisOBnAz+ldt4x8YabrgjVdNsYJ48Ktz5ZDuvuuSoHsc1zEcqo4Ky/MOhBwKya7GEoJPRki2NxuUrEwY8ZIrUsNPuJgERSuOrdAPaqK6jcsVCzEKBxuHFaCa7cGADzQ7dDhB/+utIcn2gUUa8GnvGmxWVT1bC5yavJC8Y+UAY4ya5ZtQ1BjgXT7c/dGOPXmopbq8zveeRiPVq0dWmtkzRJHWsyAlTInuOKimmjjUl3UL12k1yBvZthVpGGegBxVVrpuRvc9uW6cVjKp2RLZ1F1rtlbEZCv3wp/Ss+fxRkny7VVTsWf+lcxeyB/lB5xVNpP4TyR1NHMyHNnUSeIriXAiAJPU4wB/Wnpqt4GP+kBc9OMiuVy0YyrHB/OnpdOWxk8dRUu4KXc3rjWb4M032t3l+7vJ5xWTc6vezgJJI3HcnOKrgyM7Mc8DgUkipjlmJPoKSkyZN9C1BLHISWYk9xnOKkHIyuMZ5HeqEUWeMkcdBWlbwmMb+v4c1Miqd5EynyYiXJB9OT/ACrl7+5me88yXcEGQO2RW9PIz5O0nPBDdv8AOKxNWgM9rK6M3mAfKoPB96mKsz1MPFK5VM0NzFJEu3cOcE8jioI9xflsY6YHNU9NvF+aCa3KXyEbh2kX+pHpWq0a8OuFXHc+vas53RhiIKL0CzibDkpjGceh9xV5lX7PhlDk++COKbao2Pkj+Q5w5HB+npU6275O8oBnaMHGfenGWhwS1ZSFufKWUkBCQPm9fpVPV4W2xtbZd92PoK6GOwK2jxM3mso/iPP6UklnCm2MSo+TklRx+dNyRpSk6crnAtc2kNw8d5tjkfOWP3T9fSsm98P6bNcCVH2s54x0PpzXrP8AY2kSQgz2VrKzMSWdQTWLqXgzT5GElk7WxBztU5X8jXLXoQqe9FuLPTp49R0cTktD0i0t7qPDPlepBz+tdlp0Xmaj5cZxGoGOeaw00+/sZ9si7tpwWFdd4XsndhM45xyPWvLnRdLWTudrxEa1owMrUtJC3bMn1GAataY8luVySB0ralg/0tsqfUc1BLaANuC4xXTRfNFXPOxVPkk2jb0u53KAfxro9Pn2spY5z+Nchpx8t1BHT0ro7R+mM/lUVo8uxhTlqdjptzwMmt62lDAYrhrK4YEc4wa6XTLncANx965J2Z7mErc2hvA5GRSD17VHC24cmpO1ZnoIDmkIzSnmkJ5oAO1Ie9L9aRutAIDSUfyoPrQhid/ajOCaD9cUccmgoQ0vfFIelB60AJS+n0oPU0hpXKA9aKB1o7HFNEhSH6Cj2oHPWhlAetHPWlptABTh0pB/Wl9aAD0oAHeijFAC9OKWk/Kg0XAZSmlpDQKwCkpfxpKAsFFKTQKBjcUY4p2KO1ArsYaTGafgUDrn2osFxuMHpR0p1A6UDuJRR0BpPwoAWjpRRQMQ0lLihetAhpBIxnig5z1z9adjP1ox7UWAbjHSjGB70/GexpOopWAs0npn1paT8etaGQvWgdaB9aMDFADh1HX8qWm0o60E2FFKMDrTecetOHWqWwhQeaXoKaOOvFGeCKq4DqQkjtSZ5x3pCeDRcLDvSkJ5waaTxikJwcii47DiTikzxTSfWkJpXHYdnnFJmk3e+aTNCY0hSeB60c4pM9PpSEincLDsjHNLnjg0zPH4UHqOadwsPycUoPY0wHil9qaAeW6e1LzTCcYNAbNUmBID0pOcCkBFGeMmrTFYdnBxS5PHsajpc1aZNh5J5ozzTc4IHajPB7VVwsPBpKaD0oGc1SAkHPNGaYD1+vrS7vTGadhMUE9DSg9elMJwaM8HqKu4WHk5703JpM/zpD14qhWFzRmkzn0zR8o5p3HYdSZ45pvSkP3qYx2c+9GcflSZpeQaBWDPHvSjqPrTeD60OwA560BYbK+F6isu/udqEZ/KprycKprm9UvOvzcUrXZhVnyoi1K8OSM1gXEpZsnGPrTrufe5OffFVufy9K1SPCr13N2ELHAGMDPNABxjoKVgcfWlC56cZp3sctxOcgfz7UoycYPHuPrQy9f8mlGCcVNxDQCRyw5xXh37UE8g/su0B+UuWPua923qp+YgY5ye1eD/ALTjKX064XadrHFJTtUivM78HHVvyf6HikcR5JH0zVWUnOG7VoJIGU4HJPaoJ0DDPBOK9Rw926OlSd7MqLzxzTtjKxDDBBwQeCDSLlelbfjXxTrPi3UYdQ1u4W4uYbdLcSCNVZkQYBYgDc3+0eTSSjyO710Ld72MFgQeeaRWwemKMZpCKzYzstD1xYfDuo2101yDPCFUxsNjY4ww716r+zX5dv4Z1TUZi43z+Wg3HBOOTivCrB5TZXECRlgV3MeuAO9e6/CJmh+G1qA5AllkZs9OvWnBfEzlxkuWmjtmlMkxbh1HoaydQd5JQC44OV4/LmraEi0R0SUZ4Zj90/TisW6mYXBVR8vUfWhKx4kn1NC3JkUJK+CffitOGQsoXfwc4z0rMt55JzEZWVscfMR096040AAIOQOhx0otoVF3Q9lYgopPzHk55FSQ743PzElRgHPWojgTZYnOMYFTxnzfmLD5eOaotElvK0Z4PHoc8VaS5jGVeTJ4xkY+tY+rXkdvEOSBnB4IGfrWfJP9rZE3eTtOQzdqze9j0MLSU1d7HWvCjoWLrkelXfDXh+PVZpGlukt409cEn6f5zWFFdJ9mJRgfl5wetVkvp0LhJCoPPBPXvTg11QV6MYl3XbaGG6lit3EkaMVDj+L3rCnjKyZyo65xWoWMsfz9fU1G1sJVIAIxxVM4pQ10M0SZ5J/WnsVBLgjPBzikmheNyrqQQe9MdApLknI646UW1M2TQMzkndzjnHapY0MsojPX9abpMSzzKrOEyMA9P09auTWz29zt8xWYAbWU8MKEluFmJHb+S/zA+nNWGdCq4JXGM0sayMC0pz+ApjwHBYcZ7+tRNWVzalKz0IPEVpb3rxm0meMAfOAeCf6VT8hoYghJbAxn/P4VedSGOB9MdqqylmfJHH+e9YOTsX7Zpmc9laT3KyTR5cdG9KsxRp54BZdoGabMrZJA5HUg0xXcLuC8qecVlaUt2KVRzjqzRcEodqMwHHBxmkWYkBHXcep4GcfWkW48tFyNyHrgVJJMZFAIBPr6+xrZJ9TnYErINocqM8dsf4VVkjlR3UsCR90sc/rU7qozkMPUL39gKY5KrhVzx9QabiSij5t2pDBsZPIz0rRtLuU5V0YnPWoEba+3keuRzU8coLcnb6cVzzo3NozaVie4fzVJePcw9R+dQ2+ptbgqE249KnFwFKgKevcVLcWcVzH5wGHxzxXPPDxduZnTRqyjrEyZdZzdbiec9+9dBYyLdQZyCR1xWBNpKyfvMY46etbOh7rcCNiTg96iTjBaHck6m5fij2sPT+da9gMgH9aq+TkbhyKtWZw2Og4rKrJOOhySouEtTSijKjNbGmOV2jtWfb8jkVZgbY4HeuSx20I8rTOqs5QQMH9Kuo24dawLCfkc5rVgkBHBrOzR7EJXRc7YpDikRs04j0pFje9JTsDFIaBoTnrR2p3SkPTpQO431+lHrTiKTFAXE7Unse9OPSjvQMTFIelOwDSfSkgExSU44zzQOmaZQ2j69KU4pKACg9KQelL7UAGPxooHBo/WgA7e1L2pKKAHUnSko/GgANIeeKO9BoAWm0UEZ4NACjt1o6HFHalxk0ANpSKdwKDT2JG4pMelOI9Tmk6UAIR3zS4o/wAaU9aLDuJg4oxxSjkUdyfegVxpHaiiimxBik/pS0d6ksTtR9KD1pO//wBenYBT+tN7Yo+lFICxml/Cm/40Z4ppmQ4nnrR+tNJpRz/jVAOHcdaXPem5/nQT1pXAd270uR2FMzx1pevtTvoKw7PNBbP+FNzmm5//AF1VwsSZ9aTNMzikJ96Vx2HfWjPXnrTCfegn1pXCw7ODSbuB3ppPc0meKBjic896OnpTc88UE+tBSQp4we1GabnNFUA8GjPuKYOnp/WlB5p3Adj0pQaQdT9KWqTJFzn60v1NMz0pQadwsPo/nTMnpS7u/atL30EOz15xmgHjB5ppOQKB0PNUnYVh+cigHimZyMj04ozVJhYfn1NBIpmTjr+NGTVoLDwTjHSlJ7etMzj0596M/lVILDyccUhP8qQkZ4pAeOc9KsTHH71G6mk0lAh4OR1pMn6U0dM0enPaqGOzz60E+2aQH+dHtVCHCj3pM8j3oJxxQAueKrXMu0cHtUkr4BrI1K52ocUGc5WVypqt3gEA9K5bULje3HQHmruq3JJIBOfSsRmLH371aPFxda75UICS38+3elBGM80hHygnAwKQHHQDHWg816McR9R2zT0BAPvUQJLZz71OmDxnP4Urkpgy54xnmpMKiZJHSgYGD0OfX2qhrN2IYG57cHFJysjWMbsytZ1NYCwU4+leV/FmEeIPDrFGUzW8ma2PFOq5LKrEVzWkvPcmdXXdDIvzDaeOetYRhKbcl0PSoNU5a7HjkCvDKySqVK9fanyRk/dIFdH4x0w2d83GAehwcGubJaN/lJwPWvWoVlKJtOFnoQLD8/zEAVFONkmABgVbMisPmXFVZss2ePwrabjZcoo817siH3qU4A4/OnCPAJzinwwNK+xQfyzWJRZtFYWsr+S5AXbu28L6ZNe+fCcrJ8PLKIAkDcR+Z4/lXjJVF8OPZJBJ5slwpDA4B9sV7d8PNOutL8I2tndgI6gk7TnjqM1VOXMpaHHjleCRrTXe6w+xGOMKJN/mbmDe4PYj8M1itlrh89B3ArSu4iEIwMA4Gf8APFU/LCy4clQehA4B7Uqkuh4sm7lzTxD5QDszPnOd4K49MY6itPKwxfMd4BwB3WnRLb4jKxKpXl8DAY9j9fpSkoxVcE8Y+7ggfQ0J6WKSsRweYyF26YyBnPFXbUhEODu5zxUCSiNwgcEDtjgD0pFdzLuSHA3du/4Vm5Nl81jZ0aPQhqRl8RWklxZmMjCMQVbseK5PxLZia+lj0fe8WcozHkLnpkda6i2VJoykiKfw4zS28dvYQSRoMFzkkHPWiNXTlZ6GHrqEbHPaZayWlkEdyTjkHmrlrtVh5g6Hr/OnSsSx6hev41AUIAY5wOnOKuHmY1azm7loMhfgj2xUsDGJiwyB1xjiq1tgjKgA+9WUO7g421bRje52uheDU8S+HZL+3kbz1BwB90EHpXDz6bNb3T20qbWQ7WGK9Y+Eeqz6PpF3GQk0cziRFx82cYP4Go/Ffg3U52Osq0Ks77/K6lQT69O/St1DmjdHRKknG6PJ7vTXt2UBHXnOGH8jV+ytg7B2yTnnJ5PHqa7XWNHu4LJJbmHCKPmIycE8fhWFBJFHdncAeMEkZ/OonHl3MvZtFbUYoltEZMo5ADDtn+lZ8bZbZyfQ4rY1aKKbJRduOQMD9cVkxReXMCMZ/Hmueq1sWotC3MOIjgDIFZc8L4BYYbvxzXRGMmLp+tZt6gyQelc0nZhKHUxyu4Bc4JFRgFXYMuQR0NXpLfa4APtjGc057cuASQffFOMjBpx0KCHG7uO3pUyYXnqM+vT6Ustu6Z2DIP6e9R5bAC4yT1x/Stb3JJPMEnyd8/ezjGKlUEgjJ685WqqxyK2dwBIyOMj86sknjglfbt+FDZcU2LcxQkB0UqFXoD37VWVSkhGWx0qVj8i9eeOeRSwrhhk471hOdjdU2+hZt4y3GOO/rWiqFYinJIFUIXVcM5JJOelXYmMnTp1rgr1uiO2hRY2MBnP3SBU0ceJAwwfWnxwF3xjgVdt7UqF3Z9zXnVK1z0qVC2pYjOIQSOnWiBjv46fhUdwxiiAOPpSQOCueD/hWlPWNzlxS99GzDOFQcjj2okvAhBLD1rCu7zyh1xxWc+plpMBmUd60pQujop01Y73TbzcM81u2lyMDnivOtLvdrDnGfSulsb3KDk1cqSexsnynZQzj1/GraMTXOWV1nHPatm2l3AcjNc86bibwmmi7jIoJPb8DTUOcinH9KyNBOx6YpOgpevpxQetDYB3pB60HOaWhgI3SkPrQeRRQUGetHagdTxSdKkAHBzR6gE/SgDJoOe4/GqGhDxSfSlIzR3pXGJ/KjNHUUpx0pgJjBpOhzTu+KQdKAG07NAFIe9ACUvvSmgUAIP60p96Tkn6UHp7UALSDocUoPrR/nimgDHGaXODxSAjHNH40Nki+9IelGabQwFzzRnAo6HmkJHTvSAX/ABo+lJkZoB5phZi5o96Q9KP8adwsLmkzSEHJNGeMVI0hfekPWkbpSZoGLmkPGKQmkLUrgKD09frQcY5pucdaTdTCxZJzR/nFJnvSZ59KCOW46im57UbsDmi4JD8mgmmZ5xQTincLD88delJk03NGRnnrSuFh+Tk80mc+ntTN1GcY5ouxjwaTNNzSZ70XCw8mkyPxppJxRmgdhwbPGaTOeQaaT+FB+uM0ByjiR60Zpo6//Woz1podh3pQDzzTfrQCc81SAeD+VHH6U3NL1p3uxMUnkUoORTQe9A6cVSGOBpc9ab3/AJ0VS0JHZ6GjOBzTadkgVqAo+tJ2HtR9KAc5p3JF6flQDjNNP9KUnnIqkwDNLnjOKbn070E1omFh2euelKD05pmTjoaM8U0IeTzQMUzOaXJ64rQB3cc0n6cUmffNL0NAC5/nSknj0pvfFGfSqEx2eeMUZwKO/ekU0E2F4oJwuKOgqGd8DrVAV7yUKpOea5rVbleee2etaeqXG0HnFcnqVxv3D6ihbHn4qryrQr3cm9yT61WOOfr600vliAeKTJxyR+FaHhTlzO49SMf5waQ9eRx/KkA+b06CrAgkYE4NTcy1K44x6k1OmBySM8daYybDyOnXNVL26WJD8w46YPWkyoxbH398sSt8wwAea5DXdZRoXBcHg4561S8Ta6qqy7uRnHzVwV3qUt1NsDHBPasHeTsdUElqPv3kvtQCLlsmu58MaXBBbLviQlh8wPOeKyPC+kbnWaVOSAenWu3gi8uMADkf/WrspxUY6C9o5PQ86+IPhfzg/lrk4LJxzjFeN6lZtBOyOpBXqD619M+MLd301ZE5dOhxXluoxaLqbmDULd7a4HBngxk/VTwazg3Btx26ndRqcy5ZbnkpXI46expu3Hbn6V6RH4L8PSXLLceK1gQDP/HqdxH4nrVabS/BmkESR3d9rjqeI2QQxn/e5J/AVr9bp3td/cdHs5HIaHomoaxO0dlAXVBmSQ8Ig9Se1bFta2NvcLaWkkspOPPnC8N7IPT+db11eXeq2DRGS00nT4yP9Gt8KPp6n8a1vC8FhZWWVk84jIRZBtP+9modaUm+n5/MHGyuVNJ0iO91+CTZ5NlZ8x+aM7vVjn3r1PwzcwakJhC4SOJyqg8cY7V5pJfH7Qba0gaR3YkrGhPBxkDHUV7DomhaamlWqLGY7lUDtPE3zZ649/oa66cOWGmiOLETjtIyNXUw3KkgqM9qS1024vnRopI4AFY7pBgHjgfjWrdWEU0zM564B7Z96fsAuVWMO20chueKzvrqePJLmILG2ZoA1zqMA2jGHXgkdq0IQJxHFIqBv4ptpBA9MelNKgBgYVKnpkYwe2PSmZXJyzEg+lVdsNiMwKJsqqggYBxwcVIiq2TgE9GOKVpRtxgg5796WSSFmUJhTjqKHB2GhBujfbHyAO5x/wDrqO4Jc5xjjgik8xt/BBXPOaeNrZAwT2pxjZ3GQQxYBDjI+mTUd1E23A9avbdrYz1p0qIyLt655rUpK5lJGVfIyOcVKHIGQcn271O8RK7cY9/WmmEqOAT9aLj5WjqvCF+kLos0kgAbIUsQuRjr/jXo0viy3uEWzyNvG7HKgfXvXilu8scgIG0g5zWnZGdpwS/AHA7U/rPslodUHc9e8Qajps+iNZFhuddvXn/eFecHSAkv7sfmTjPrViwtTv3uzZ9zmtmKaCIAA8454rmrYmVY6Y0OZbHOz6dKF+6Rj+VUprdomwUI+lb93rVos7REgHoeayru+tHY4I9KxSlYv6sVZcmE47VTkt2khZ+Tjrirc4xE0gdSCM4/xrltR1a5t3eNW2rn9O9Uo9y1hr7k+5XYjJ3A9CanRlJA6H1rgbm+u0vkkLOAW5YntXb2d/ZvArtIMgc+1ZyVtjGthH0LHlrg579CaoOoDspUHuMf1q8txHPGzR8D9KhSNnckjjPpWDxHKzJYST6FReWAUDmhwVzk5x37gVc+ylXDZwB0NWbe1iuGzHtYr04wDUvFxtY2p4OXYzI1yuBwM4yO9SwwTOeh2juOgraFsnniPBUqOvpU0YthKRINoH61yTrt6JHZDByMWC1cllI6nA9a2NMsvLH7w+47cVIEjmb9xHhhxn0rTtbCRypk59gOlZKjUqM7oUY09yGFV3gJHuBOc44rStbYsNzj8BV63seenFWJoRHEScYxzTlh4wRonc47xPIsbhU5x7elVtOYmIZIyelTaynnXhzng9f8/hUlnb7FG0cdqjVKx51aDlO6M/Vidm3oT1zWLDvEu5uv9a6HU4yVPGOMZrKkg2sSvUH0zxXVQV0dkI2Ras3wevatvT7vAXJPSuaR9rdeP51ctbkheTx3rqjHUzqqx3Flc4xlhj/PWui065DAc/nXnlneHcuT0966fSbvJGCD60q1O6M6c2pHaW77lqxWVYzhkHPWtKNgcV5FRWdjvjsP/wA4pMUtBpDExzSe9KeDR70AhOgpKdTc0rDQUelH86TNMYoxmkHek70fwk0DQvpSetGeKD196kYCj29qTJoNUKwdaO2aDSZ49qBi8cGkz1NHSkB60AL9KB1/pSdBRmgVxcj9KB0pOhz60ooGH5UlHFHv2oAUYxQfWjNJnmgApDmgmkJouAvekPJFJ9TR2pXAVulKDz1pmfTrS0mwFzRkZHNNPHXpSEmmmA/PY/rSE03qKTsPrRcLDs8Umf8A69JRxn2qbjsBPGKaTgjJpT3P9KaT9aLjsA4/Ck6Z6k/WlyPrTcmhjLGcUZpuaM0XIsOyDRnjNN/HFGeKAsOz6c0A46U0nijPHbilcLDiT3oJ9KbketJuycZouFh/oaCaYDmkJ4HrVJhYfn0oBP1pmf0oz1JpX1Cw/dSDr1ppOev6UpxnIp3CwueCOaUdaQc0tUMUfpSdTSA5OaXNCAOKXv60n8PvS8g5wapbCsA6ZpfrScGgdBVIB1A+7Sf1paaCwD6Uv0FJ35pc1oAZpR+lN7UE4ppiaH8Un0NIOvSjNUhC9aM9aaevakzVIdh2Tkc0U0+tGO/61omKwp9qM9RSD2oJ6Zq0yRw560A4pO9HbP8Ak1SYbC5+lKDzTe30pf8A9VNMGO7c0fyoA4yaKsQ4HnigdBRSdun51QmK5wOKoXkwGc9fc1ZnfA6isTU58A8/lUmU5WRk6vc8EAnP55rm7mQs5JzV3Upyz+x5rNYjPt6itEup8/iqvNIQDP45o3NjgH15oABJzT8DGMcim2cRc0uAzSj2NbsltHHCeAMDjNZWkusfJq1qOpIsR+YYxWU73sXBKxj6pMkJO04P4VwnijWFjjchyoHA561c8U6wE35c9+T2rzbVLya+uDsJIzxUtPZFx0KOo3E13cFVz1rY8NaCzkSyxgjjgjir3hvQt37yVDnI9a7W1s47dVAAxjp9K2hHlMqlRvREdjZrbj5FAH06VqWyHG7PIFJCOBjIq9Ci7cdPpVrY2pR0bMzVbfzomiI+XGB3x+deVeKNA2XTywr+8U8Z7V7HdlDHjFc7qdnHdowA+cdCK541/Zyv0ZrBvm0PGPs0s4AeILKnDf1+oqU2MUbK8ds0jYw5Y4/T0rtNU0lG3R+RtcHqBzUdl4fl2rEq4RhyWySM1vKlCp7yZ1QxSitTi/LjtLpri6MXlnpEeOfb/wCvWjoWl654ruBFZW5t7Uffnf5Rj2Fd7oHgPT4rsTXkazn0IyBXeWyWOn2yQ2kCxRqMACqgoU9tTCtjb35TH8JeGrTwxbItsoe4YZMpALfhV6/1BYw0bIXZiQeMfjUGo3U7FRErk5+UqOn1qtDBdzASTyKByBnqa0lV5ndnmuXmRea0rADDAnsPQ96lCbF+/wC/9ak8qG3t9qNgqd2e9V0IeQ5JGBxnjiiOruQiWRhvAj59wP1oDbYyORgnFNjmQ/IGJCn8acTkfKeK2Wg7DWYsScDBPrk0CMnoQDzg1YCoBgAcdwfeoZZCM+nY+tFykiVSRFh1471HEMOG2kBqfbozDdyB1zViFBjcFxjsas0UbhGNzANn+VRXs6W7HaoB/SpYXDTHbgjvzVmSBJSNyjnj3qZTSN40zNNxiMSEADOOfpWjpsaXyblxx6VjeImVI/IjXnjOO1SeF7/yCIHfOelTJ3OyNBNHQrpKcu3BXqOuR61ds7RdwIOQPeqk1/biPbu+Y9BzxU9vdLBEsjPgH1rmmnLRGkMNZmhdu0UJ284XpisNJLs3D5BwTnFa0d2s6Z/hNOWJX5UAqRTilFWOtQsrGMtnHPIZZScjHOaztbtoYyPJbnuM810lxaMgbYOcVg3VvIZcSqfaqcktjaFJMz4JpwmxmZh64rL1O0lu7vcq4APf9a6sQIIwMZ9f8KaYojxjkHj1rNyubqlys43VdNR4o49vzAdcZzVBrSSPCKpLexziu0u7RHGSarNZRCVCi5Ydqyk2jSNO5R0aOZQIcDc3PPQ1rT6ZdGJWDggj1q7ZWDyMjC1ZiOmRgCtKSx1GQBRIqJnBULk4rlnFN3K9nHqZdrosklpsnbZkdm6fjSWtpbWDqiyEgcEdSTXQQaNKdoluGlHfHH5VopoltGflQZHepVOKeoPlWxyttbXUsjtFCV3H7z+lX7bRCSHnJY5zgdK6WC1iQckAfSpHktYsiSQZ9sVadOPQn3noZNpYqrj5ABjgYrZsrWNVDbcfWsy71SJB+4iJPr0qhNrFyo4YLx2qZVJNaE8iOsmaGAZd1XHasXWtVgWIxxsCcY4rl7zULmR/3krZ64NVfOLnDfjXM7t6ik30LQcyTE47nArTjUeWOR09awpLqGHBLbcfpU9hqiSgKrZ/ClvsYKHcsX6jqcYx/nFZEyfLwBnnp1/OtG9uVZeP0rMlkyc+vYmuqhFpGuxUk+8ePcc0+DIxhT7dqCoJ6/mKsRxHBKjFdkY9TKbuLHNsbPUVv6RfAFctg1z8qbe2KSyuTHJj5vxqpL3Tjnoz1LS7vcoGRXQWsuVBrzrQ70naSTXZ6fcBkU5rx8TCzO+jPmRuhqUn1qCF93epc/lXNc6LC5pCe1IetIepouCVhd1ITSGkJGaLjFzQDTcmikA72ozjIpuRnFGeelBQ6imA+1KPvUAONGabkUdxTuAopKQHPelNFwCk6GikBzS3CwueKWm5FGeRTQrDs80mc0Z9DSDoR60XHYcDRnr/ADpM/jTfrRcLDiaQnJo9TSd6VwsA6GkP9aUcUhpAhO9HQfWnd+MU0+tAwyf160q9OfSkzxSZ5oAcexpvQDBAo+lDdqVwAHn8KKT1+lJTKF/Kl60mKd1B9qAGNnFNbBJp5xjn+VNPNADelIemQaXnPFFAD80u724ppP6CkbpWYDtxzkcmjd69abnnnmjPBpoB2fSjdzwM0zPTtSgGmmAuSKM0nbmlqQFzzmk3dKQ/rSfj0qrgOz270oJ5pvelB5xjmqFYU9f5UvRue9Nxx3pw5IoGKO/NKOBjGaaPYZpwH1+tMAHvR0FLz3pB+NNAL6Gjr19KDxR04poTClHSkFL9KsQvel6DNJ39KXiqAD1FHWjvRTTEFDdKO2KKtAAPFA4FA+vNJ+PFUgsH1o5oPIobjiqADSZ+ajtQeDmtEAv4UD8aQe1KenSqTJFpMdeaWj+dWtxMB27UvBP40Y49qXvmqEJTgOtAGRmlHr3qkIWmsTQWAqvNLhcg1VyW7EF7KArHPNcxqtzgkZ71q6lcYRsfzrk9VnLNjOfx5qkefiqtkyjO+9ySc1EM7hxSdTnOR2596fgscc8VVzwpu7uOVDz709Rnt+PpQuemcjPp0qUAYBx+H1qZMzEZ/LBIIJHTFYOuakUjYbiDz1NbF422MkHp0NcP4mkZ2dFJHUHntSTuNOxyuuXcl3cMgIOT2arugaICwZ1zzxS6RpbTXAZ1yD39fwrt9Ns1hiGEOSOK0irK4pSvoJY2aQxj5ccdKlkUAgZA96shccDg1HIhPv7VPUzsJAvzA+9XRwuzAOeOaox7g+Mde1XYuEywycdPWlKWh0QlZFe4UuoOCeeKzL2FosSo2Mdu1boXIyxAB4qleRI+QuCvTk1lyX3BycdTn3liYHMYDdM9f/1VPazxYAjj3uenFXo7eFDgrk/TrVtFhQFQgHJJ4pxpOL0ZDqt7orWs12y/LAUAODn6datDhQZHznqAeKjkuGdQAx/T9arSM2zIOWxkmt1Ezd2yaWVRIFUAAnBYVFJNkhVIZSeQTzmgR70LkEKfQ0iRoGLDJ3dQX6f4VSsLlZDcSFxgLux3ziokVscDJx03dDVm4VFX2OMnPSogVVsDOeuOn6VtEFHQbHEQ23Zj3ParUFsSTvfHUcVIjmQAbSD2IGM0243RheMkdPpV3SNlT6knkrERu7nnmlMaEZABY5/zioy3mgAhun5dqltEzJtbOCeuKTnZFKNwh3KmOnSpHHzAjBGeRmrcliFCOvbqKmggi8vc56Cs3M7KdCTZRjtCHMqZz356U+S5t7YZmYBvQ1W1PXIbINEqjdkgc1y2spc6m6yJI4XPQZ6Ur33O+lhnZaGlrE0NxvaPacY5zWXpcu2bJTLY/wA8Ve0jSpIY1MjFieMHtWvZadbxS+c2Cc5xiq5tDshh7LUoSrdSSLIFYLnnPFWAt3dYjXK49vpW20sHl7QFHGM9adaSxR5YRliD6Vm2dCoroi3pdg4hUSvgd+autcW9nCFLZI7DnNZhubuddqrtHf2py2Tsd0hJNYOZSp9yeTWATtSM1n3l28g/1JPNXhYAfMFOO9SG1UD58HHWoczVRijEc3LgbYTz60+PT7uY9l/pW2QFC4XI9MdKmiy2MAH+VQ6pfyM1dGUx5LbievNaNjZ2sKjIUnPf8qdNG8i7QxUfTrUYtzgAMxPX1JrN1GTY0RPbRNt3qD2FNa9T/lmhZvTHFU0tMnc6n2qwICMYBPA6VDkiNEM+23bPwqoOwzn8acbu5ByZfwA61IbZgcHrTHg56c1HMF02RTSySsAzO2fU1DsIONuBx0FaMEIIBK1I0Ix0GaTkJ7GDdggHnnmqL5KkZ9s9K2r6HP4Vk3SFQcZo1Yk7mZdnAJyenJz/AJ5rPmnKBiM5FXp8lhgcfTrVK9jxG2MHjr1rdRXUzZyOv6rP5uwM2ewJrR8N3EhVXYnoMk9KzdQtHkuAxB646Vp2EXkxDIwegqppOyRmlbc3Zbk7ADnp3NV/NLSAZH+FZ8k7Y6Ywe/SnQSMWxkkda6YU7GUqhrW53EHGPw6VowkbenUfhWbaKxbIBP8AWtKBWI5B9q3sZc1xs65Tp2rNn+Rywbv1rYkT5c9Dj+tZN7gMc+lZSM6iujU0a8Kkc8eldvo93uCkt1ry6yudko7djn1rtdAu8hcfoelediEgw7adj0OykBAGavKwxWHps2V5PSteFgVGK89nqx1RKTRSE0ZqblWA+1N70Z54oouFrBmkzSHpR6UX7FC5oz3pKXB60AGT0NAOGpOgpQOetSOwueKKTFAppiA0g6UuefwpOvNO4Bz60Ac80E0mfagBe1KKaCcc0vf/AD1ouNCij8M0mTRn3OaAYpPNISKOtJRcQZ//AF0ZyeaTjt1pDQIXNHNC9aWgYnfFGOcUp5PtSEGgBPQ0Hj6UuM0u3nIqShozRnn1pdvalAxigBuOvpQBkU4UAfpVAN/DrS4wOtKBQMfT2oF0EIxSYG6nYopXER984/Kgjjpin470hHNMpEfWgZ70me5o6/SouAd6B93rRzuzQBnpnGaQARxml70D2H1pcd6AE7YwaMfnTsAdqTApoAPWkIHT1p2OaMYx3NNAGOpFA96Xp0pKoBQOOBSgc4NJgnmnDG6kxMPelHaijHP04poQpFIKXvQenemIKAPalHNIRVDAdKXt0pOg44pfQfnTEwxjnvRjsOlL3PFAyRx+tUAhoFL6UuBzVpgJjiiloNNMBMd6TrTqQ/dq0wE7Yo7UuKUDiruAzBOKXHOetOGDRTQDQPSlAyKXGKB0FXcVxCCDS/Slx6Ufw1aZLEpw680c+lFWmKwvQe1Nd6a74B7VUnmCjriqjqS2luSSy471QurnC8Gq9zdjk7uay7u7BB5rZROSpV0uM1K4yCc1zt4+ZOv51dvZyxPes6TJY9qGeRiavMNj+nFTKO2PypiLk5645NTqATzgDsKls4WIg465AqcLhKEU9OmPWnkELzisZSEkZupKxjIGciuavbHzJCSOfr2rq7wZ+ucfWsuUDB54rSk+oSRR0+ySMdAf61q7QOo4HXiooM9eOPSpypJ689PetGzO2mhE5/wx6U08npU2zcehzmlKBevGOlJlISNQevWiQheh9xgUwyAHAI6EfWqN1cckA0lJPc3UG43LEtxgYFVGl81jgkVVaQkgg5zwKdGJNwK4Dfn/AJNZykuglDuCyssnJ9evpStOWBwAAO9MuEcHLAepPSodxbK4yO5HerjMiVO2pahbzcspHHOO9NVnwMNkg59qgSJ85AODwOatxBgRtzz14zir50NU32JELMGjfB9MmoQADt2rkZHHrV2OEnAYH2OBT3gtwRuddxPC561PtEjRYeT1sVWj3ImMZz0qT7G+0ZGMj61YS3jWPk8ehqCW4aG18yBfPjX0bnHfFaKt2OiGEk3qTW0J8zAXBxwf8auy2TSQ7toBBrMj1Vyp8uzkc4449fWiOa8nYtJIsJ29FOcmhVL9DrhgujLsNqCckhSOuT1qeCBI5f4vY1QUGRgNzOcchB71r20F/KgEdpJx3fgUNtnTHCxQ26SaUiONzGCOtSWlkIY/LmlBHTkirv8AZmoSAFikQHdeTUi6MhbLSO7YxyePypOVtzeFONzl9V0azuZswRtIeuR0qxYeHLjb90KoP511cMENqMMFQDn0pZb+AALF8/uKh1Dpinaxjw+HyPvNk9sdqnGgQL179z2q6k08oyhA9qfEJXHzN9RUOo2WkzP/ALIgB+7nipPsMUQComelaEKsj5wfTmrKqhOemfakpX3Fd3MY2xjYMox61MICV5B6dq2WiQjJUH8aZmDOwfUioY1JmekYKnj6Ui24Kcrn3q5NNAEK4PHYCq0U0jDEcB+prJyNYsgFuVbd8v40+JAqlvy4qYWksrguxA9KuC2EZxjI4qdyXURmLBLIxKjj1NWobUKOeT0zVtQI2IAwDUwQkZXAxUmbm2UjEO4/+tSrECMr69PSrSqMkdeKZt2tkevJoFciKjAyP0qPYAxOOKsueKiyOmc1LGmJsBHTmkZMDnIqQYI68VFLIMHB4pbibMzUMAH0H4/hWJcAk9vStq7O9sDue9Z8sR6/l/n862hEm9jLkiOS2B071n3UeQR19a2plAPAx/Ws+6UYyefb1rddhHN3MKq25sZ9O9U7idUYqOuPwq1rkhhUnnvXLy3RMgBI5461MLX1OXEVuVWNm3JkOMnGep71o2UBJH15FZOmsrkHJx9elb9k6ghifpxXZKqktDgnWsjZ0+2GARtJPtWklvgA4qnYSAxgdu+O9aKyrsHJrBVpMyjiitPCdvC9utZV9bZzggHsK25GBPODn1qtKoJOQOBxTdS+5qsSmjlTHJHLwMgHPBrqfDzk7M81RmtA8nQkVtaLbhSpAGep5rjrrqjooSi5WR2Ok9AT6Vv233RWFpSEKPpW9APlHFedJnqw2J+4Hc0nrijPNH4VBYmDigj86WjFO4xMcc0UE03qaEAueeaAeKUeuaKGAmKToTS5o7+9INQ/GkpevXmkwaCg75pM0pB7UY9aAEPFHSl9KMc5qgE7fnS+lAHFOxzQSMA9qM08r+dJ2oC4nv2pMc07GOKPfvQA3vRjsadxijHtQJBjA4pPal5paBiY/OgjgilxzS4z1oAafpRtyKdjt60oFAXGYNIelPxRQAzHY9aB0NOPWjrQA3HNGD6U7FIRQAdqQ9fel7c0mO/tQAh70decUpH+RS4oGisemOKAOfb0pSKBmsxhyO/FHOM0uOfSgDg0AGDn8aUDt1pQOaOmetUAh7YpfoKUjjPYc0DPegkQAk9P1pcfz9aX1o7UmFxoB6CnADnHvR36f/Xoz1xTKFA7GjuMUnSnH9aoVw/LmgdKKKBXDrS9jQaO1WAfTpSHpTqKEAnalHWk7fjRn3oQC554NFIKOtWhMd7/ANaB96k79KX8KoGGaO9Ifu0p5GcU0ADmjgmk7Uo5FWgE70p6GjHPFJ0z3qgFXijHIo4IxS981SEwPT0+lGKO1JVIQ7OaKTv1pccGrQC9qa7Y6fjQxwOtVriTA64q0S2MuJto61jX11wTmnajdAKRnI6Vz1/d7iRzxx1rppx0ucVWoiW7u+vP61nzXBbv9KqTSuzcAH1pAcj3rSWh5las3oh8jNnGfz70xueTye/NISc856dKQfeI7Vm2cMtSaIfLyPyqeIHjFQxHkc/nVyFCce9YSkQ1cdGmc4qXyiV4wDVmCHcTx39KuLafLwMCsJNs0jBs566hO0VkzxHJPXt0rqtQtm8s/Lg1i3MfUYPNVTnbccqTMyBCMDHA6cVbUcAHp70xUG454qZAPvAEY7it+YwtYbjA5xiqN5LsAI6/lWgEDvtbB59O1T3elq9sGHPPTHSr5W1oVBanNfaGKkknHriql++5SAcGrN1E1tPtcZx0qA2guZBu6DGRXM7rRnbSaaIdPPz7T7VpxPGHAPXvmrFh4eDsGRiR16damvfDkxIKyNtGMZrRUHLVM7I0YtamVeGORiAwyO3rVeNRwAATmr39hTSXWwFvpnrW7YeEwwV235Pua0WE13K9nDsc4X8tfmcLxjrU8TBlxleRnPWuwtvCttv+e2Vvrk1ow+GrZUCi2iHplc4rZYTuUoQRwTvLHGBA0JbHGf8ACm29rLNIzBZSzjLIE4B9q9LtvDluAP3MfB/uitJdHtolIUDjvj+dX9WilexomlseaxaZqbjAtcL0/eH+lTx+HtQVBERFGvfapr0ZEiFuM4BU8kcVWv7yOFkdVDdfu44/A9afJCJpzSbONtPCEu8NJNKD0wnyitmz8J2aYZogx6gscnrWo+povO5SMcAgVFLqqhSVRm9QKl1IpDUJMng0m0h5CKPwAp8scEKkgjB59KyJtRuXP8MY9Ac4qCSSWXIdyQPU1k619i1S7ss3Wow42xAyE8HArPkmuN5IcqCegHSnRojHB61bjhGBxngVzybZuuWOxQYGYgSuWB9af9lCrtQ/KwxWklspHC9KlEIUZI5FJXW4+cxIra4V/lYlB2NTlbhRkLg+wrVMeSMccd6Ro8ZHGfSi4cxlRpM3zOze49Kn+zy5GHOB0q2qgtt6HNSbRtKHt901LbG5ECQNggykfQ063gTeTzn6055GVQWHp2pqsd+4dvalZslyLEUMYz8owKVVAYkgbf5UoJxv9acuAMletVYhybADbJ2IPrTpQaCD1GSM96eSBzjipaC5Bt5DEYqXbtbrkGhsDDdQabIwwOah7FbiScGomPGQfypkrseM/nTVPy85rPqMV8n2qInFPOSTzwKY2c4xTsA0t7moLgkd+tSSHB96gmwcdDgVSiwKhXJ6+3So58AcjOKtBRg5qGdM8V0RRm2ZM/OfTvxVC4KhSMc/WtS6h2rx+OKxbjIzjg56VSQ+hzuvrkHsoz0rj54trgjg5rttXxs555OT3rk77AY8c9znrWUmkeXi9x+nzFSfm/DGa3LW4+70J9q5eFyvOCcdCPar9vMRjk+2f60J3djzps7TT7jgZ7+9bELll965DTLkqcngewrftrgeUATnH6V004Lqc61ZdkkI+8aalwrdTg9zVW5n4HJIqh9qCscEfyzVSirCbs9DcV1buDzjGK2NKcAr0rj4r3j73HYntWrpl8VcBjyDXJUi7HZhq3LLU9K0xlI6g1uw4IGDXG6Ffbwo3GurspQyda8uorPU+kozUo6Fo9c0GncUY5Oak2G0nrTiMigjmpFcaRwaT2p/vSY9qodxKTrmnY9KQ4x9aSHcQUoHNL1FIB82KQXDpRxTsUHqM1QhMetJjilH5UUD2EA6UuOvp3pfTNHfigLiEflS85zS4Hf8qUDBpIVxhBzRjIp+PT1pCKqwDdvNGOtOHSipsFxmKXFBNHOeDTC4YoxzRzzS+1Abh3pKUCl4x6UDshDmjNJS+uaLCsJS/WkJozUgGPz7UH2pCTSN0qhoXvzQOtJn9KBzQULzSN0oyOlISKLisB+9Rg+1G4E0FqBkZHFJ6e9L+NB6+9ZgJx+NHrR3zRnnk/SgTFHY5pfWmjnkUqnNUMU/lS8f3aSgdKAFJ6UetIDnFHGORQTYccZ60ncikHTnmlHsaCgPelB601T0J/Wl6VRIuaWkyKQdBQJju1Opue1HY800AuaT+dGaB1459qAAHtQTzSDp07daB2qixw69KB15o+lAxTRDF5/Cl9s5pMDrwDS8H/69UAlKT3pKDj8apB1Djv1oxQOnpQegFUgF6dKQeoNFHT1qhaiilOc0n4ilPWrTGApaaaM8/hVLUmw70pRgGm980jtgZzV3EyOZ8A1lahcYB5Gat3cu0H2rndSucyFeufStaS5pGFadkVb2RpeFyc9aqGyaTnbn1xzWlZQ+ZgnGD61rwWY2jAr2KdH3bs8WvUc5WRx8tkEz8pFVGjK/LjHTiuyv7T5MMo9q5i+j2MR0JNc1ZWZjLRFHBB5/GkAyfb2qQ8nt1oReSSea422YWJLcE461p2ce7GapW69AM/WtuwRQQSB14rJrmKhT5i9ZQHbyD+VWZjGi9cVC88cMZJIFct4i8RRxKVVuQfWtoUrnfTopbmxfXURUgGseXbK3GOfSuZbXGlYkOffnpVrT9VXzMO2Oferlhramrpxasar2rBd20HNQbWUFcY7VuWk0E8IwQM8gA1XubXL5UGueScTgrYdx1Rm4Zfm9PTtV21nkZfKbv196ngsGkHTnFEdo8cwXaRzVRm0YKEuhBNoC3qFto9s1gyac1lclG+70weor0WxXbHtI6+9c/wCLoNkTTJ2GRxWypqSud1KilqJprKEX1x2q5JcwsvJH5V55D4qFrM0D5yO+anfWxd4ZHPPrx+dXySid0XpY7azMPm7h9ema6GymhIA7j0ry201OaL5kcn1FbNrrzgB+Rz0zQqljVQuelRyxYxxS+fGCc1wP/CRtt6nP5VFLr9wyn5vbrV/WGV7E9DF3Eo4KgYqhqOpKgI3g+uDXEjVLlxxK1MeWZ+WcsSeeetZyqtlRoo27vWZGGxEH1PJrOuLp5Ww5Zu4yagGRGcjOe9S+WCiuD84/SsHJs3UUieBh0I6dO2avKnPTNUbNHJPYg4OK1ExsUenpQkxN2IJsjG1eOlBCkgg/UUOSrnB4p8YJyxGM9yKqwuZgY0UqwOc1ci2bBjn8KrBMnAqVAAu0ZyO9S0TfUsqdq596ieQtMFyAT+tJNIqocE9KqRSK8nmFsEGoY0jRIO7rg4qOVyX56jvTm5Ge+KiZdye9Q99CxOd+e+e9TBlc+/8AKoFGenJ9D3p6HBJPX3pxJYlw2Dt9RSxgBQAM8VDcozEEH8ant1IXac57ZqrdCG9CaLJGxu1DsYxjqKcg5xTpF5BPNU1Ym5HE2/jv9akXJHHbtQigcU5gACT1rNstDJACmDkEe9QtninyPyAOD9KiZjnpismy0Mbg+tM3D3+lSPyDzVeVcDIJzSWoyRm64qJ2POTTQ/HNRu5JOP0rWMLkt2GySE9P0pI1JPPShIwT6EVOqgcmt1GyIciJgB2x7VCQCeetSTkg8UxcADnvxQhblC+GQfbvWLcxAqw4z1revELHnisyaM9CBjBq4qwJ6nLauh2liORk5FcjqERDsMcZ9K9Ev7QupB965TWLEAthe1c1eDtoceJptrQ5fb3AO7ufUVNAwLgdT0OKbNGVZg2T9f8APtTEJyCGxg9feuenPWzPKlG5s2shGBwPwrUtrzamPb1rnY5SnXjnpmrFrO00oij9epFdUKrWnUz5LG5cXe4fL1/WoAzbicYz396u2GkySLyu49wD2p1zY+Sc7R05FdqhJq7IlGxTRyOpA6ZOatwSlWB9OoIqo67W6Yx1p0JKkDJ/nWVSmRHc7Lw7ekOAXOQa9D0a53xrz9a8g0iYpMMHr79P8/1r0jw5cAqvPGOK8jERsfQYGTtY7WM5H1FO98VDasSvWp+lciPWEopce1HHbpVAJigjNKaDQAmKTqKXml5oAQDik43dRTsd6OaAEptOx1oNACduho5HYUuaO2M1IB1opMj1oB5OKpMBTS5pufegGkmFh2cDtR3pM88GjNFwSAj0o/lScUZ4ouMDQetITSZ5o3BDjR2z+lN/nSFueaGFiQUhPao93vQGNFwsP6HrQTjqaj3fnSk+valcLC7qQn8/rSe2c03+GgdkO300sSKQntTQOOKVwQ4seOlG845xn600574ozSHYdnjjP40ZPrTM/rQSeeucVQDi1JuJpvX8KOcc0XAf2z6Ck96OfSjHOTUgL/KgY6UfjSc47ZoAX36HtRnnrR3oXqapALk460E4PvSdsUvelcSAnjJpD06UUcHHtTGKMH6/SjpRnn1FJVAOPFAA78GkJHWgYzigkWlPam5wTS5oQDj94UmeMmkBJoHTn+dFx3HE0A9xTe2ePWlz+VUhCg9aD94U3nHpSjtTKHA88/lRxSZ70gOOtNCsSDkj2o9qaOlKvWndiYoOKDgmkzRz36VYheaQ+9Ht/SjHemgsLnkUmaQ9QaP6VYx2ehxQT/LFIM44oJFUKwueKOOKTOaD9KtaAO5qGZsKakPFU7t8KcnFNsmWiuZupThQQT+Zrm5pt1x6dsVo6tMfmAPr+Nc68v78EevQV6GFjY8rE1bJnX6IikZroY0AjBrnNBmXYORmugSVNvXNevzJRPMp66le/UbD7e9cZrKYlIHPOPrXW6jcDackD2rkdSYyS8HvXnYl6FzWhmgYPAPSncDpT9hJ4pdnzY4rgbMbElt97j8aty34t0+9+RqGCMgZP51heKJWjhbacHBxTpK7R0UY9SDxJ4rWKJlEmOvevOr7W57y6wrPjPGazvEjzy3RXcxGcVY0KzLMMjn3BwK9KMUkder0Og04SeWNxzx1PanXbyp8yA+3PWtGxtwIwduOKkubUNGwCgn2oNOUbofiCWN0jdjgnuK9F0a7juoQzEbu4NeQzWpWXOCee4rofDeryW8iRs3HTNZVKakieXuevaeIwT8tPngTduAqhoFzHdQhg4579av39wkERJYH/PasoU7bkxpJbkM0ywpz19BXP+JLuGW1cbhjHeszxJr+xjGjewxz+NctPdXV1G3zHaR6/wCfeuiMbmuiOa1q1D3bsh4zwQaSyEkeF3Zzxmrs8MquWYd+ar7CH6cf4U3cIJbmlaXOFGWz9O1bVtKjJgdTXNxIxIOMVpWbFXA7d/TFc8lY6YGvGm/ggj0qxDbh+CcDHHNQWzhsHOCRzmrUTbOScAdhWcVdlt22LUEJj65+gq7DGxcHbmpLNFlRT29q0VhCjOMfhVtdSFJkX2eMxAkc1CYWEmFzyK0o0BAyBinugGMDjpWctGaKTKkMQVhnhjxVpBgEH1wMVXd2a4CAYwfWrSdMMcHrU3AR4AygDnPNOSMhcY5qUDBBwCB1pzDIouJkawlgCRyKWJCM1Kp42npSqB+dCYyq8e4MpGc9MVnpZyb+T361uog3EMPcZqMoFZuOKzaGirEHK4JGQPWpiBjFBGBnoetOgO5SzDqOnakrAxrRgD2I9KFAAwce1SMrflTJQuOOCKpaENkBJAPoDmp4PmwtUxNmXBHHSr8KgEFTxTRJMq85x0pzEFeaCeSBxUbHK44HNTKQ0hScDIxTJGJHHSlbaAMY/rUbng81i3c0QxjuX3pg6AUvfjgUxjg9aSVwuIzY5qN2O3nPp1odvyqFz2reFPUhyIJmIfgcY+tAYdOvpxUuzJ6UqRAHFdCSQr3eokb8DOAPpUrGmMmOR+tJjB54FRJ6FJETn5iTQgG0DH6cUODuxSqCOlZuV2Uo6EcsYY/w81SniO7pxWqq7j+PFQzRZ4AqozsS4mJLCCDx04rD1ayDIcjrXWvDx0rO1GEOvSqb5kTKOh5TrFt5bEkHisoEDPOCOMZ/Ou18Q2fDHge3rXE6gTC7DGBz361xVaTveJ51Wh7xHNMobavFbPhFRK3I+8cHoeK4+5nLzELjOfyrrfBknl8suR3HtXVhKVnzSOSouU9T02COOBSAuSOaydfZBIV4z6VNFqKJbDaecViX85mlZmP3j27V66S5TiqyuimxyCDz+NCgAgY/GnvjoACc+tQEgOAO3esJxsjKL1Rp2Mh80EH5c9fSu/8ADU3Cf1NedWj/ADDB59+/+ea7jwzKAEINeHilqe9gWek6e3ygVdWsfTJsquDWoj8VwbHsJkvNB700NS5/KlcsUdKOvcmkPTg0U7gKCD0pOxoPWkH3aLiQ7sPrS03OBQetMaDNNJyaU9aYakEBPNGf84pCeaTt9f0pJlWHZpQab26YoHXpxTGKaX0PNJk0Z+lArC560hNApOnFAbDs0vtTMGnA/nQDQUnenYppxmgLiHpSZp2PT0pMUDG55pM4FO280BPWixNxB1paUL1+tKfpSSKG9R0pOelP/A5NGM0iWMK9aNnGaeB2pQp4qkCdiIp+tJsxU22kK8U2h3ISvHApNtTbeMH+dG3vikMi28Uu32NS7R3pdox0oFchI4yD+tHGetHak7g02MOMnHSkzx0oBJ4pP61NwHZPrzSKeaM9PrSZGTkUgFJ4pCR1znPakJozQA4Gjj1pvSgemabYDiaM4NN9CaUcjGTTQC0o9MU3gd6XOf607gLwfxozikz3o9MZpgL6Glz0xTaB92lcB3bNANJnoaX+KqEwPQin0wdfrS+gpoELn0/KkBwKUdaMVSGHpTgeaSl45oJAdKO4oPSjqaq4C8mg80DocdKAfaqADRj3pOp9/Sg+9WmAvaj+dApRzVIAPWgGjAxzRVJg0MlPasy/cbDnpWjMflJrE1R/kIz0prV2MartE57V5OWHXPWshQWYHH51d1Ftz85zmqcVerS0PCxEuaVjX0u48lQMkj0rajvcqPmwfr1rmUfbyGOO1WY5sr9411XaQRhoaV7cZHLk/Q1lSqXNSF9wJzk9s1IiZ+tcVZtuwTj0IFjyRxx6VIIsc1OVAHaoJJghOMZzms1THGkOkIjQ5/ya5TxM6ujICDWvqF8oT5SM+gNchqt1vfAbrkVrSp2dzojDlRzlzYCW4Lds4xt4rV0u0EargY9M0QJuYttJPT6VdWRY+O3b2rrWxaRYBC4xgcd/rRLIGB9RVKe6VQNvpUP2gM2MmlYdx11tJyMZ7cVRYmORWDAEc5qd33kEA/XFV5opCCFQnPOSKaRNzovD3ihrJcMx47Z4rXu/Ewu0wH689eteZXUV1G/QgemKfp144cKWyc8H1pOKJUjspYBdyhyQT9a0bfT9sW1QSMd6xdMumDjrwM11VnexmLnGfr0pJlox7qx6jHas/wDs7J+6MnqP8/Sut2RynHHTHJpj6eADhRz+NDY7HLLZ7RwOfbv0p32dlY8fhW9LabTgdDUDwbcdxWbszWLZVtF2HP5Gr6fMfm7j1qEQkHdg5qxHGcg98/pUW7FORq6c7Rrz+ta0dwrccnisVGKLxzTopXY5ORihxuiE7G35meBUgJOD1xWdBMAucYFXFkUj8KylFmiZMoBkJx7ZqUDPOBUIIyOalDAcH0qOXQu5KW+Wnxj5cGoAwxzxTmlCjBPak4gmT46jtRu5/rVcTBhxzR5u49jU2aH1LQY8EnmmO3HHX3pFfJpQASCaLBceF6dvan7Bg49aF680qvgGlaw73HBfkwaqzp1xxmrBILc/zqvNkk0risVliAUsw5zU9uewqLtzyKVGw2c+tSnoFi3nrkn6VCWwf1pC245HFMB3Y5qHqNDjxnHamg5Hp6UhbjA/lTOuMdaajcTYpbBqMnIxyaVuCOeabnjPStoRIbI5Tt6c0saEjNOCZ61KFAH41o3oKxE4CjnrUYbBqaVcj371WY5bHbNJspRJAelD4C84FPAwOajlbHY8VlKRqlYhA5yeaftGAc0zoSSeKf2A9ayuNksQHfn2odOvTP0p0XIye/WnYAFNPUCpInHTis69j4zjP1rXfAA5wPWqF4vUe1WmSzjNdhBRj6V5x4nhK5YZHUmvVdVQFWGPy7V5/wCJIkZmBziuujbqcdc4JIme5wVbGcfjXXaITAoyDnHesuC3VZSwAOK0Y2CADqcZznGK1tqeViNjf+3seFJA9PanRTFhuPWsm3cnABPuD6VejOOvYV1wjoeXK7J5pNqls98fequH5HHbvTpX+UsFyBVYtzjJz1+lKpHQqG5p2TkHrwccZ/z7V2Ph2bG088YzmuJsWJcd+ePTFdToTlSo64NeFi42Z7WDPTNJlHlgbs1swycdq5TSJmKDJ5xXQWzHtXnOJ7dOWhqowxmnjHQVBF0qVV6GsmjRMd06UE9qCOKDQMQHnNLntSUqnjFCAX+VGT+VIKB1qhXEPNIetOI460hHpSsMZg0Y/wA+tPC9fWlC+vIosO4wDpil288dafjpSlaYXIwDjApcHtT9tGMHpSSFcjK+tJjAFSlaQjjmiwXGD7tFO2jp+dHXrSsFxtGOaf6elA9zTsA3bmgLin9ulGDTAaF5xRt/lTgDmlIP5U0K43FJin4PpSEEUBcaQMCg4FBB601vSkCFB5NLn3NIMd+KXtQgYuaCDSjpQaYhh4HNJzTz06ZphwM1LKQDrSnpzSD7tLnikBXHT8aQ+tLn0oPpTZY05HIoPOR6Up6mkwOagA6U3tinAetGOetACY7etNzwM07pQelACHrmj0oH1P0o+tACqefwpR1xSZ9aXv8A1oAMc9qMcZ/Wlzz+NA4oAMewoOOlAx0H50p9aoAA7daTp2yaXvmgYx0qgYAcUvXr60ccDHelHShCYUoHIPSkGenSnU0xiD14paQcUvbmquAuKO/rxSHtS96dwD15pM8cUdqD0681SAB2oBGfrSkDNA9e1UShM8UHpwKCPz7U72pplCDOetL3AoxyTS+9WmAmcA0DJ9aU8j6UEe3WqRKK9yDjPT+tYGrE7W7V0F1901zurHg4NEfiuYVtjmLxvmz71BF1/GprvmQiowCP/wBdetRPClG8x5bHYe9OVskYqLPXj/61PhOXGTzXYldHQlaxowLkDI7Yq0q4X+XrUNtg478VdCAqR7cVxzQONzNvZSiHceB2rnb+/bzCN2OeldHqsQ2HJ6VxGqKwlJ7E9z/StIo2tYg1G9ZlcA559KxmnLSncRz0zV14jIny/hUCWrmUcNg9R1rZaE2LVuoK8/hUV2So69+3FX4owBg4x3qOa0MjbVB549e1UNvQ5u4uX37VHXirmkWs9y43g4zxurbsvD5aUNtyTyTnpXV6RosUGG24x2AqXNRRlKSW7MrTNBLYLL09s1rxeH48DKCugtoURQMYGMVMZEFcs8Q+hhLEW2OM1bw7EY2+UDjPWuE1jR/skxdIgBnoB0r2O5ZWUg+lcp4gslkRmIB4yfes/byuc7xDucLpd6sTKjnHauhsrtJFGCe9cvqdm0MpK53ZqpDfzRd8Ct4zUjqp11I9HtL7YQwJC1tWt7FKOO4ryyPU5HUAH5vrW/oWoEnBOD9en+cVpbQ6YzR20io5461E9uGPAqlHdnaDknNWop+RnnNZtGyY0w7W5/H/AAoVChBwPyq2CHHJpGQ8YprQTEiXcAOopWVB25qeOPA6VHcRexzQSOVTszQssittB4qOGbaNuf16VLGNz5OKViixBO2fmNWVlLHqecVAiqeh6UMwTp/Ok0hps0UwRnNNlIZdvrVA3WAQpyQPSljmdjhhx9ahotFtVxUgGG5qLd8lETHf1qWrjLStjrUm/IG2oQC3WpFGwc+3epaAmD8Y5z34pATj3pgYbjkH/Gl5OcVDRSH7sjA61FIzdKezADnmmOePpUbD6ldz1P600MTweop8gx36CoiQGGetCWgEsTH9KcuSKh81B3HPvTxID06fzoaGrjm44FM3E8d6RmJxyKBxT0BoRg2fanqvIPSlGACetIvLYo5rEND8Yzgf1of7tHsaY+CvGRUuRSQxmBqPIGCep9qjmYLknrzUBfJrNyNEi08g29RUG5t2OfqKYXO3FNYcjOD1qLjRNknJB9c09Fz0H1x1qCNiSM+vGTU8ZXHPr6UAyZeO1BODULSYUjPtULzAHIJP1/lTTuJk0j8f4VRun4OCBTppx6isXVNQjiU5YA9q1imzNuxR1udVB/n6VwOuTlnIDA8961fEGsR7CBJ+HrXF3l+sz8MO4GK7qcXGNzlqSux+8K5yACe2fxp3ncAD+dUzKD8/8PTJ/WmwfPIuckHoO1axd2eXiNmb1kXIBUAnuexrRXeATgkY/iGKZosIAXKjgcjua1riNNjBcccdq7EtDznHqZLFgeR0qvI5Pr7D0q3d43HqPUiqUp79O+KVTYUNy9YsCegPP611eit0bgA964+yPIIJHpnrXU6O6gD5vpXh4tanr4aVjvNIYbV/x610tk+QSeTXG6VMAQM/lXS2E4OOT1rl9i2evBnRW/KggVZAI5FUrSVSOTV+MiuSUGjpTEx3o28elSUVlYaZFtNAXPbmpcc/hRj2HpTsFyLaacF59qcBj60YJp2C40AZ/Cgr0zTguBSkcCgLjMUYp+2k/pSC42in8dMc0hI56UWC405780vP/wBagYxTj1ppA2Jg/SmlSR1p/HcUmfyoJGbTRtPanmgEcmixVxoU8UoXgU4ZoIoBsQDFHHWjOKaTRcEO4pTjB+tMBycUvWgGKaQnmgn0pOo9xQAhppp5HFMxkDFJghtOBoA5o7ZpWKHZoPrRtPGeaCDnvVdBMYSMU0nmnEUhXkUmNDMmjJ9qft96CKkdyA4weD6UE4GfWk478e9L+FK5Qd+gpPwFC/1pCRjHQikAds+lJ3560vb0NNz15zQMU9KD0opD7UCF/X6Ug6d6MnJx3pMdv0oHuOz0FGcikUc/54pQKBCnAFAPekx2zS459aB7BnPSg56dKOMGl60CA9RS8+lAxmnDJ/8ArVQDcHIpwGTQcelOqhMaB+dKB0HoMUH8uaUdqSEAA7j8qXFHSgdKpFBjtS4ox6Uo61SJExxmkI9RTiOOtB7UwGgd/SjHHPanAeuaQY9/xqkwEI57Uq9KO9L2qigxS4FIOmKUHmrjuSJ256UHrQfYZoyc1SAgueVOelc9qo4I9q6G4GQRWLqiZU0k7SMqqujk7pf3lRgdsAYHrVu+Tax96oGRcn9a9ajseQ4WmEnHQ/gDSROAwPHvntUckoI/zmovMBI+Y/nk12xdlYtI2rKXnOeO9bMDKY+cZrl7SYBsZ/8A1VrxXOFHT86wmkXZD9WxsPbtXDamMyNnnk4x+tdfqFwrR4PP05rmruPfIcdD6UIpIpW1txkqPanvbrkAj8KuRIQAQAB14p/llnxxj3GK1TJasVoLYlsZ/Kta1sFzlhz6GktYcckdPwq+j4GAe3WsqlSxzVqyitCSCBIwABVpZETnI61nS3QHRh7VVa6O4885PvWGstzzZVnJ6m+ZQRwcVBJMPb2rIS/xg5IpHu94+91o5FYTmrGhJOCMk8fzqneqHTPrVdrjnhqa04KjBOfTNLlMbmBq9irl2x25rlbzTypYlcHn8K764VWycDGKybm1DZJABHfrUXaZUJcrOPSBh9evStTSN6TALyCPzq9NYZIC4FXtJ0xgQcHPrXXSleJ6lCXMtC/Z5ZFH3q07dWOCB+npUS2roBxnn1rQsozsAwB061bOxJkkKlByPzq3AoZeg9zUbLx0wKLd8HaaljLscYwPpTZodwI2ip4AWGexpzEBiec/zrNmkTCuIXRyccZ9KWOYjgZrWlSORcdfc1VFkAxIxilzGnKmNgdiTjpinSK5yO1TRJs6d6mRVbGR1xRzC5bFSCEhuegq7GmFHy/rT0iwQfWnrjGO9LmAj2HtQi5IHSpNy9MdKfjB4HajmE0xwb5SMZOacDx3600LnvilIIJP0NQ2NIXndzkU5GxnHFNByee/6UrA9Qe1ZtlJAWOcenaopJAo4/8A10184/Wq0z4yM8VNyrFa4u5N5Uk4/lVd7sk8ZzTbsZ5AwfWoYkUn5hk+5ouVYvQsS+e2eeKuxnC45qnbEcHAx/KrauMY7+1DCxMue9LgHnNMDijfgcfrUNjsSjjpzzxTQQDx0pjScN83aozKuT7VNxcpZZ/U+9RSyBV+lQNKSOKru+RgnP1qW+w7CytvbOfpUTOAT1xRuHSmtySe9TsMkRgetDEkVFGTx/U1Ig4HHFKwD4u+OvfNK0mB264ppbA4P6VXuJNqk07dib6jp7gDnPHbn9Kz7i9Vd2Tjn8qq31xjOCBXN6vqLIjMHII9Oc1vTgKUrG1qWtJEhO8jjrnrXA+KPFKoWQS8HHfrWR4k12XY2HwOhrzbV9SmmlbJ4rupUUtWck6l9EbmseIJJ5CqucZ57VXtb5nIyTXNQmSWQ85IPFbmnW/Cj061vYxkdBDPlAcDeAPxq5YSLuzjqQKy4QcAdj6+lX7Q4GCOuOTWdPc4ax2WmXCoAQecVZuLndvCNlfbjNZekwedGH6jtmtJ7RSpAZlb1NegloedK9ipM5K9/wAaruCXXJPPtUxUBSCFyO9RSkhwQAD3OcVlUCJPZkq2CTkH610mlvjaynP41zNqeSOOvbmug09toHTArx8Uup30GzqbO4IAyTwOvp2rdsr7BHOPWuNMpRd2SKdBqLI4O7HPX+VaUIKUT1FNo9RsL0Ecmtq2uMnOa830vUSwHzdfeujsL8kDk1FXCJ6o6adU7COUEcVMrKRWHbXYIB3c4q9Bcq3evNq4dxOhSTVzQ4zkfjRnIyBUCyjOc0/zAR71ztWG0Sdhj1o4/WkDDHb60d+eeaVxNC59OPWkz60YzwKP5UMLiHrSE5BFKR/+qmnpUsaBiTx6UhJzRjvSgc0xgOlOHNJ0FLxQhXD6GmnpS5xzmk3DpQFhe9B5PWm7ietKGxRcLMdz6/rSGkz3xSEnr1pBZgaTikzSGlcsf3HrSjgVGvWlzTTFYkGMUZHGODTaU+xFNaiYhNB7cUY/yKMcZoATBzR04o+lH86B3Anv6UZz1pOKM+lAXA0elBpMjFK5VwxSEe1APvSE0riS1K/8qQ88YpR6Uc8VBYn86TFO70Hpn3oAbz0oxz7U4jJo75IzQAzt7Uo96XB6daOvTqaAE4JNA6fSl/CjgigdwHfHWjgg96AO470uO9FwDtzR37UH8Pzowc9qBAtLjHpSL047Uvt3oAX3pfX0pBzz3pR05600AoHr19aUc0nPWlpisHvR9KO1A9zVDFHSgHjpigdeaUdOlMAFLQOtHeqJCjvQPu0i9aLi6in7v4UDp0oBoPWqQC96QY+goPWirKQuOlHGKRcnn1pccUxBxjikpaKpMERyjI5rL1BMoxI/GtdhkVUuotwPp2NDQpK6OK1VOD/Suau5tkmOg/Wu51W0JDfliuN1myky20MBXdhq1nZnFVo63RlyXq5xu5PSiK4GeSMZ/r61kXgmibG1unBpYJWyMZHr6CvUWxy2Z0KSkMDn0yc1bjvSsYGfpWJbuSBzxn86sAOQD/Ks5MuMWzQmut4+vpUIAJz3/Kqw3dTU8TZAHQdqhSNuQuQR5APuOnSrKQdOOf0qC2HIIx7e1W5WCoc9KqU7I56rsmxkhCZxwBVOa52jhsEUy9ugCQSfTmsme6O7vjPJ9K5Iz5meHWk5PQvyXBBJBNVpbjk4P+f84rNkuuhzg46ioXujyDzXVFWOdI0WuWxx+opEuzu6jnp2/wD11jPcZORwfpTPtgUk5HX86UrDs7HRrcZzzipBL8uBj+Vc9DegHk/4VL9vAHDfrWLkVGLN3zec8nA61FIyFSD0J6+lZQvl6k54pyXBmk2p82cCs9ZPQ0jTvoalpD58uMAnPrzXT2NgiRKStU/DlgxxIVxjGP8AGumCLGgGeK6YR5UexhqXJEy2gG72+lTQQhcD8MVYYDO4CljUAcjiq5jrsMMAYAUosjjOP1q1Dgtg4q9HGGXmi5NjPjj2DHOPpTZkyCR2GK0HiA7AYqB0ySBUsqJhea6zbCDxjrVyNtwHrT7i2BbdgCoGJQ8Y9MVhc3RK+AeMnNMRucjpTJGOOck96WE5UZpXGW0kyMEU8LuHt6VAGxjmnLOATnFFwaJPLOeMk1Yj4IBqBJQ34cc9qfvweMdqbAs4H4D0prLn3qISnGATijzADmpZJKox160FgBkGoJJgenX61BLONvWoZViaQr0qlct1HSopbnHGTVV5yamUjRRCUrzgjFIh2npn0qFyT1anxng5qVK47FlHA9f8akE2O9Vt3603fk4PBoTbJLZuPfH0NKJX7Z59BVTjOecUu/HQd+tNAW/M4PvxTHb3quZsnOeKjebP61MkBZLg+2e1QySg9eBUDyfWomc4IBPFSkwLBn5AA5705JNwB696pDLNk9qtwdie/arsS2WIxxzUhyoPP61CJMCmPMMEZGf50RiyWyR5Ao7j8Kzry4wCM80TzZyemDWXezYGd31+lawhqS2VNRuBtPzfTiuL8QXJIbB6DnB4xW7qt0ASOrd64XxBeKAw/PNd1KCWpy1Jt6HLeIbnOTnPqK5SZg0mAPrWnrd1udiDjHSsVHzLx+HFbERNPTkBbvy3eukso12g9cfpXN6cQuOePY10VnIOFAPT1qhTZfCkNjGfbPQdau6TEJZFU4PTj1qrGc8hcjrWjox2XCtg8HJ5rCm7zOGsz0Xw/aeZACIkOBzxTtbhZFLKoCkc4xxU+hTQraqUlAGM8moNcmWQHDll5zkdeK9OKujknZROXlcBiRjk8dhVZn7ckg9etEpzI3UevH4VC24kHBX6VzVTGJctWy2M456VvacSUBxgY7dK5+13B+R+ldDpvIPBPHpzXk4l2TO7Cx1LU7gR5yc9ef6VkSXRWUDHfvWnqGRGSQcgHtxn3rk7y5xcbTwc/rWmCloerKJ3GjXZwPmGK6vT7t88nPNed6HcdPXHaux0+YbeoHHH9K77FwV2ddbXfHBAFaFve4AxXMwy4U46VYW4IA571hOkmdEYST0Osivct94VetrgMOTXGQXZDgZx+NbNhdMwAz+teZiaCWx0xT6nURvnFShsmqFoxIFXF615T0YNEmaKQfdpfT60XJsJ60hPFOOMcU04pDSGnPGTQBzxzS96Ud89KEUHbigkijPy01mpk2A/1puR6UE4pMnH0qblDu/QUo6Y700HODRmhMNRw4HPSg/r60xjxS5ouKwfrQeOabSkUhiE80A+tGDTcGi49CTNLnpUfNKOc0JiH5NITSZ70hNO4rC7ueKCQfU+1MzmlAzzRzBYcSD6U3P+RS9qQii4xM0mRnmgg5pCOagfUB/kU4+xpAMUuKCiDHX3oz0/SjtS8cZAoAOOx4oPSjHv3oGMdc0AIfpxQffmlPBFHqPegBvbrijvil/Ck6n1oDyF9aKQ/oKU9vekOwDI6UepH8qBxS560BYQ9aCO9BPPelwPfNNC6BwOe9A244o49aX07UAKPxooUd+9AHagBc8Ae1GfxoweMijqcVSYB+dLjpSD1oA9fwqhMd3oHSgfhRgGmhijrnNAyfalox3oEwpPxp3GPekJ71QhBSntQBgUAUxB+NA+7S4yaB6VaGIOtL3oFKF9aoVxM8UuKUD1FAH4VQmJj60yRC1Sgc8elLtyKdrhcyry1356Vz2p6WHJ+X612bxgiqlxa7s8U1dO6BpM8u1PQ9zFgo/75rEl0ZlYbRg/SvWbrTt/OKzLjSRn7tdtLEtKzOedFN6nAW9hIjZx2zkCrqwYXkZxXUy6WFJypHpiqd1Z4B+X2yOK19tzBGnymEYxnJ69DUeMNir88OGxiqrRnPANaQtcTLNtwM+ntTro/IQfT0plucdxjGOlJdEFOMHHX0pVr8rOKt8LMG+Y7yMkjNZUpYn09a1L0He39RWbKvJ78/nXJRbvZnjSjqVZWY9O/Y9qqOxxjJwPc1ekXPfrz0qEqM9B6+uK70mYuVirtk69B9MVFJI6jB6e3etdY42Azjiq81urAKmOf196mVO60BSTRmef1GTuHrQ8zkDBznvU1xaEEsO3Ws+4LxqTg4zx3xXLODSOqCiyb7UVcDP0JOK6bwqnmzKW9cH2rg1ugbnaxAH5V3PhG4UMuGIIrow0LK7OylTSZ6vpKItuuPTPPrU83J4zj6VlaXckxJ0JxzWqjq3Pbr9a2Z2LYjKHbk5z64pVUn8euBVgYxjtSBQOeeAazkaxYyBCXB5AxWinyrjvVVCFJNSrINpAPXikpA0SMwIHHTioXPNDuKjZs8npUuQ0hJAPf24qvLCD6VKD13Uxjn/61YtmlynKNox3pi/d7/lVmSIOBxkio/Kxx1NAJkJYA+tO27ven+UQ3OKHwKdrDuMyV75+tKJXBwcn601m9OPSmnHah+Q0rsmW4xn/AAoacc1WGOe49qRm46+4NRctK5LJMff24qB3Lc9eOtNZsN96oWkBB55qWykK5GCKjds5568/hTZG4596Q53dT17+uKjcd0KT6elODdunv1qI46mhpAOAOp71SiJsmYjGBx3FIDhTjpiq/nZJBAoMx28cVaiRcsl+nJPtTSfwI71V8w/d7+nSk80DjP5U3GwXJywyB2phYseRULTDHJH5VFJMAByD261m4piLIf5vWlbheapi4G44PXpUc12o43Yq1Bk8xf3qD0GT7U5Z8DIrJN1zjcPoOh5qOS7GB8xPODxVqmS5Gy10AODnHJJqtLeYyMkcjtWLJfAfifWqVzfqM5Iz047VSpk8xtTXo2feHP8AOsXUb8AE5zjjrWbc6koVgGz7Vz+ramxzg5J9+lb06epnOZLrOpEbhvWuF13UPNVsH6/nVjVtRzn5wO3WuT1O83knJJ9RXSlY59ynfXG6XPGM9qr2zEvgk4NRTPuYdKltV+cbsfnSbH0NezHQ8gkVtWOSw5ABPSsmwQFVxxnjNb1lF0BA69+KroZzL6MQpBIHfpWjpjEt8oIzjHtWbEv7zsDnpXRaNAjYyCDyPxrKlH3jiqbs3dOvvJttpy+O3f8AOnX14ZwQFwOvToaie3UR/KSDjt3qlI7bwOePfrXc3pocjT6h5SlepPODzTWQbc9PqOtTBlC5OR3NRu/zZ7VhNoElcfbKA+SAMdCa6PSR8gI79cCuctssQOe/411GkqRGCc9PWvIxb1selhYpMXUVIhPPQda4fUA32w9+ewrvNVwIT2PauKmj82/IUZPQVpgb6nozXumnowdQCQQAPpXXWDlME9enpmqWg6WBErsvPeujj08JHkDBxXpoUHZ3HW8xwOc1MZ8jHoaomMq2Md/8mrdvA0hUfjXNVq8p6dK0oksUuZBjpW/pJZu5qhaaccjgHHXNdDp1ptAG38K8nE4lPQ05bGtZE4FaMZPpVS1i2gAirsajp3rzG7vQzY4HignpRgdqWmQN60nNP6d/wpCakdxoB9KXHPNGR1pQRmqGN7UmMjtTsim5xSuAhBxQBxSkikzzRoAAYoP1oJphbnrSGhxxjnik/Wk/GikwsOXpTu9RhqN1FwHnrSHnvim5oJFIVhccD6UU3qaM5NUgHZ+XrTSaQtxmmlqkaHZ6mnKeCKi6nqaUZoAmByBjvSUwZ9KdzVIQ496acA0E0xs0MYpYAdaaWppzSYJHTNSNCDgc0Z9cUnJ570o6YoGL36UDtxQBQBgGgA9KSnAUAAE0CuNPajmnYpCMcUWGJ1pOcDPPNOxS7eegpA2NI5zRyDS4P9aXHNOwIafSlxz9KMcdM0oBosAfnSj+tAAOKcBTSATHAzS96XHajFOwCY9qPwpwpOtOwriDp3oGc5707GaMVSQmJTh06UAHNKBgVQmwxigU7HAooAb2pfoKcRS8DtTSAYOaMHrmnYHOaSqW4CAc0oHelNKPu1QDccZpwHel9qXH/wCqmSNx6Zo/CnAHP9KM9sVYriYOcYJpR0zmlxmlAwOtAXEoK7vx6U4f55pRjIFabiuV3iUqcg1BJbA5+Wr9IQPShILmPPa99tZV/acHjjtXTyICOlZd8nyk+9Wm0wOLv4dhPHFZZUBjgc10OqoMkAVz9wArMD+ld1J3Mp6DIepxmnzxnb1PrmkjJ3AZP1qyyhl6dvrWk1eNjkqK5zuoR4+bJGe2Oay5R1wRjtxXQanFkfdGc/nWLIPmZT1I715zXKzyakeWRQYEH0+pqF1PLEZ7elXZVA7/AE9arSfKCO/TOK9Ki7o46kSs0jIwByBn8qkR2JG7njvQyBuADgGlUYyTnHtzXTymCY9lU4BwD6DjNZ99Z+ZF0IB59sVc3AE4PX86miCuDnHPp0rGrBGsKjRweo2MsUu8DgdvStzw1feQwWTjBx14Fbl5YRzDkc+w68Vzl/YvasSM4z/KlTl0PWpVFLc9P0XVFdFJfcD78+1dNaXgcZzx1HNeHaXrz2uI5MgdCa7TRvEsUmAXUNj1pyidcZHpcc2cHIFSiUYHP0rk7PWY3ABb9a0Y9RRgPm4x361i49zRM3BMM5zSCUgHnP49qy0ulJ69aX7WAD7e/FQ0aKRpiXnrSls/59qzUuhjr681Zjm3DjP+f/11LiVcn3ZH1pBnjH401TxnscUZIP8AnpScRtj857Z+tHQDigEfU00txjjHrSsFxJCPXtVOeUL+NWJCNtULlSxz09DQUh6SBlzx+dK2O5qJFI79RSsSByPpk9aRSGuxLdaYGycZ96bISfY1GWGcYOM8VLRcdiR2B5qMg56njtQTk4z+PP8AntSFgB1A/GjlFezEfHftUbtzjNNmmUZBPPf2qtLcAAkHHrinygrsnMoyST19qgmnUdxjPrVG4uwCf9nrzWbcXmP4gR7nGadgehrtcjOc5yOtILkZwCcVhG7JOcmmC7bpk89ya0UW0ZuSR0DXIAxk+3pUMl2fX/GsY3TFcc47ZqJrn5jyRn07VfJchzNZ7zOQ3eoTeHkk559azBPwdvX07VHNMoUc9O1DpC9oaDXnXnn34qB7slsknrzWXJc8kbiAO/FQyXY7H9a0UNCHO7NhrwqwG4g4z1qtPfHJy3FZD3gHfp09qpXV9wSTjk981XIJzsas9/tGDjHqD0rPutRzkBsYBxWPdXpB4bpzzyKzLq+56nIBIyelWoaGTqNmvfaiMEgnryM9q57UdQ5O5+cVSvdQOxsMT75rBvLxiCA2Pp/jVpIhu7JtRvSSxLdffpWNLKxZjk0lxKXZj69arhsj1FJlIdvOcgn6elWLUguAeOOKqdDxn0qzaglhipLex0elMCoOT69a6SBdo+7z168Gub0gEKADnByeK6CJwqKCeneqkc03qW0bbg4GfbvW3plxsTPyjHaufhfBPAPOelX4I2IyTjPNOn3OObOgl1NWUoD24HrVZrjdJkZwRxzWZsbkMr+/ap7dXI+bPTvW7bsct+5ejlJAIAH+NKWO4EdO5xUIBClT/KnoTgDP1BH8qwmyo2bL1guWyOc9ya6/S1Ag4I7cVyWnY873z26V1li2yL1HuetePX1lc9PCrcj1twIM9sc5rmdLRX1RSRk54FaniO72xldwGRyKxdDkzdBt5zu69a7MJGyuek48yPU9DgTC546cCugMKhD1xiud0K4TylJ7cdf51uvdJsx0+lenBJ6EpdDOuIVM7DPc9q1tNtugxgdKzPNBlOT39a1tNuFBHOfxrz8XTutDpoStub9nbDA6fWtKCEDqO1Z9lcoccitaCRWHFfM1VJOx2yJVGMYFP3eopp7etFQjJ6jg3FGabSGnckfmmk8dRQBSkH60wAcijvmgCl2kd6oBrGmlqeVppWoBPuNBpQaUpzShfSkDGnNNIPNS7R60oUZIqrBexFj260FSDU4UUhUUNBzEBBz0pvNTMBUZ6e9KxVxADmnBCacuM09cAUiWyPaaNlTcZpcj1FXYVyuY/amlPbj1qwxHNNyMUNDu2RBMD+tLsx05pzMPrTS+BUDHKvFOVc1EJBmnLJ15q1YTJCnFNKAUhlFN80U3YSuK0Y70bQOtNMlML8+tSXG4zFL6e1OxxzSgGhILjcc0f5xTwtGOOOooEN60EGnAYHAoxii1xsbjj3ox60/Ax7UEc+1FrCGAYBoxxzUm3ikx3/OiwDcUhFS4FJj9KLBcZt4pcU8j1xRjkUbhcZtFLjpTzn2oxTQrjcUoHrSgUo5pgJjGKMDr6UY4zijHrTsCD0oxS0fXimhMQdaXrS9KOOtMYnPSnAc/SkyMZ60ZxmgBcZoIpM9qXODxTTEw60oHFNz9KUZ/pTTCwuPWjGPwpKXJ61SEL2oJpo9aUHvVXCwv09KOvFNzjigH3FCYDh1wKXNMyM+lLnHGatMVh/GaXqeKZnuRSg+mKpMVhxNISMUmeKazADr9apbBYbK1Zd+/yEZq3cSYGAaxtRnABHatYx5mJuxjas2QxzmubuyQxPStfUbjknNYNzKCSO3867qdNo551E2PRscZ46VowkMox171jLJkg88citGylzxnpzWriZML+Hchx0J6Gueuo9jnPArqp1Doc85zWBqcYJ7Y9xXHWj1ODEx6mJNkPxxgfWqr8tj/AOtVq7HBBHI6Z7VRc4BGPyNVQnY4pxugz3ANNkc9sD0pqkYHBwKa5zxnn+ld0Z6HntNaEcrnk46H9akiuCpxwTULKFXcc4pm7A7E+/eokD8jXhuMqBg/4Uy8gjmjIPQ+hwKoJKVI5+b6VbgmzgEAe/r/AJ5rNrU6aNVpnKa5prIcxdc1zyX9xZvjdgDpz0r0bUoBNCeOcda4bXbDErMRg54OBWkJ30PXpTUkaujeIpsr+9bnpz/n3rrrHXndQxPfnnrXk1k5jkIbIFdTplx8oGela6M12dj0qz1VpFHJz0GfWrqXbtggj+ma4zT7nacg7l7V0mmSb1Hp2zUOKQ4s37eVgfmPXNaNvMe54rIt8EAAZHWr8RJOCe3r2rNxNEzWSUbR/KpPMUj1FZqMcbRxj8qf5mM5P1qHE0TL/mDuaXzOBVATdxwetOWX5ckjFQ4lXLL8j+n9KgbA465pjzYPJI/pUEs2MnoKlotMncrj0qEsC2CevvVaafB61SmuR+OKXLcvmLzSr1HTFRNMueCazZrkkk5x/LrUDTvu6nimoE85q+eAfxqvPebTwW575rPluSASWB/Gs+6uGwfmAA4xT5dB3RduL7Byx4J461Qn1Dbn5v8A69Zl3ckj7xyO341TmnPJ6/5601ATnY0ZrvOMHP8AEKqvcd85NZc1yAuOn8s1WN8VHOR71rGmZSqmz9oUHhuPSozcgDBIzWM9+vQMDVeW+AU8jFaKnYzlO+pum8JHD4we5qI3vvxjiufa9BJJIxnjPWoJr7B4c+3PWrUTNyZ0v9oYwAc/WoJ77AzkMRzXMtqHBBI4PHbNV5dTGevXtTSIbOhk1DqCQRn16VWn1Ad24HpXNS6iQpwQcHtVKfUT2Y8807C5jqJdR5xnA+lZ0+o/M3OM/jiufl1FhnIPoDmqkt4WDfNg4p2Bts2bnUMAAt78Gsy6v+cbsgVmyXDFcF8k1TllyTihgizdXRcnHXriqE0pYDJHocVG7t71Gc/QUmUhxbnikB44IpArEjgkflT1XPGMiodxpioOewPrV2xjJcY5+lV4YmZgAK3NNs/mycFevWlbqNySRo6bGI41JOR3rQZ2GFz9Bio4kEcfTGO1I7HJyDnt70N3ZyzZpWL5P17AVv2CqVGSMfToa5SF2VvmLde1alpe7VwWOQB27/0rWDSOSd2jpjDGygFcEnqaaqKCy5yPTFUIdRDLk59Bz1NTRXII6gjuBx+lXKSOe2hYl+7xnoMZ4pq4JGMEj6c1GSDlqljCs64IOBnkVx1paGtOPU09MQmTH8h0rpAxSAZPXjjoKw9LT5SSMj0q/e3Gy35Pb0615Mp6nsYWGhzPiq9xIRuyOucVB4em/eAkjjPGKwvEt80l0QpBBJJP41b8PyncvG4nr7V2U6uqR6tOnZHq+iytsXBH07ZrdRmYD5vxxXMaA5IUFa6m2GQMZ4969RSujKcLPQjkLLzn6U0Xrx/xGrM6ZBz/ADrMuEbB4Oe9ZVJKxUI6nR6PqZc4LGu00ufeuc9a8z0ZJBOB8wr0DRQQoBFfPY1Rvoda0idInIpxA61DExx6c08tXAmZvcXAwc+tIQAetGecUtBIfWj+dITzSU7gh4NLnmo6Og700Fh5PWmk80hPHNISfSncSQpbnp+tG7ApmfalINK5VhS/OKN/5UxgfwpMHNK4WJTJ8vFI0hzTCpxT1TtT3CyQwsaTOal8vHamlPSlYLjAeeadu4o2896DGRn1pagG88Uu6jbxSqmOTT1DQTcSKTnjmpVXjp3o2d/yp2FfUgbpjNRlT071ZYAUm0UWHcrYOadg1Y2jIzzSbRRYV7lbBPPFAU981YIAPFJxU2GQ4yDxShKkyMnmnjAFOxVxgFA5p4H0o21pYzuIKMcY607bS44oSC4zGPWgjrTiKKQJjQOP6UhHPWn9RRgUmMQDJox+lL7CiiwMQDNGO1Ln86QZBJpAKOBRjB6UnPpRn3poGGBS0maCfSmiRR0/Gj6UUCmUL2xSZooouSA/pRRn/Gii+o7BRQTRQhgetFFFUAUehptOoCwoNLTaCeKEwF3Zoz700daQ56cVSYWH5wKTNN7YNGefwqkFhc8cUAnFN+lHFNCsOzijOevNNJ5zSg+3arQx4P1pwyD60zOaMnd1qkSO7H681FI3FKx45NVppPetIpsluyK93JgE9KwNTmwCfQdK07ybBPWue1GXIbnrXfSp2SZy1JtmJqMxBI6Vjs+5jyTWhf5di2c+lZdxxnIJGa9GFPQwsSo+Acn6+lW7WXDex5rKVyBngkeo61agkGeuSRUzhYa7G8jkpg/nms/UIwVPGe+Ks2koZSCRS3UYKAcZHGK46sLozqwurHKXa7ThQOe1Zkmd2TzgfnW9qMeCRjqO9Y064JH1rkhLldjzJprQpk88f4UwthR1xUj5wRzj6+lQtnJyf0xXVTmzkqQ6gXywz39Kjbn7uTj6UbSMnc34jvSMeRxnmtmYMUdBtH+f6U9CUzlufX0oVsEAnGMdBmpFGQF/I1DBE6ndjcSRyOlZer2XmpgKcgdB2rXiXCjIAwc/40syB0HHSudycZaHdQqctjze/tWifOCNvcd6WwuNrAdABgY/Cui1yxUKzbQOcjjrXLSL5cnTr0A9K74Surnq3ujqLC853A59a6nSbwKv31AB6Zrzi0uTlcgDvxXSaTdAFcnaB7da03QloemWU4YL69etaUMme9chpl6pCnnHHfpW9bXKt6/nWTRonc2lbK4FBYHgHjqKpLOCMKeOKeZc9QTz2rOxaZaLZHXimPLxwTVd5e+RUUk/1HpUuNy1IsyTcnDD8TVZ5jnGefQ1Vmny3DcA+tQtMM9gcdcUuQrnRPLNwcZqpPJkkbuDximSXA9eelVZZ1XPPHeqUCXMmZxzkjPpVZ5gG4OT+VUri8wxGetZ91dkdz/hVKBPPoas92u3OfqKyrq8HJ5yev0rOub3qN2OnOORWTfX/Jxk85wDiq5Bc7NG8vRuyTyeOKoyX3zEZ5B+lYdxfbj16jkmqUt8ScKaajYHJm3c3hIwH981TkuyXIJ79fSsV7ssMYIHvTJLoE5DDPWmZtmu13155zziq8t0QDhjz3rKlulB5OMDsapTXg2nJyT056VRLehsTXpGRu6VUlvWLZBI+lZM13ls5wT+tV5ro4IJ69eaoDVe9JyoOaryXoxw3H9ayXusDAzioXuGOctRoBpPebtxP4Y6Gq013lcg4Hes55MnqenrUZc+mPalcTRfa5OepI7c0hmJIOTz1qkGxz61LGO+eOaYIsE54OAKiZexx7VMnI5zz7VKkW7HP40DKLREn+dKIO3tWrHbD0x70vk5BA5wcZFFl1AyxCTnIOas21oxPc9M4FXY7cbxj09K0LK2wpwowDxmk0FxLDT0KZI5Gce9a9vAqbe3So43SNQpGSCecYpZbnnkgrUvayMZyHuVBKqxHGOKjCcjrgnkmmCTP0q3AFY+/wDKiMTFyHW9sSMKM9hUr27ICy+vXPerdsUL459zVsxKyZ2jpkcVfLoYtmVF5g4DEEVoQTMFznp3xxSm2JPbGeuP0qWG329Btzxj1rKTsRFj45s9Tj1x6VoWhLuMg5Jzg1SSEg/LgjjArY0y1JC7sc8+lcNebsdNOPM7GlaPsQnkdh61n67dnySFbOa0J08uIjp3Oc9a5XVZQQ2DkE8fWvLvqe3Rhoczebpbtjxn3rovDltI0gwDj1wKo6daiWYZB5616H4S0jJUleOMY7ULEWZ6MEbfh6yfyl6genvXVWtnLgdv6Vf0HSVVFIXHA7V0sGmptGRn6810xzFpWY5QTd0cqLGVhjJ/L9ali0YvjIzzzXYR2CDPy/XirCWaLgjGKyqZg5bE8qRzmn6OEcHaRXQ2NrtHA7VZjhUHpU6gAYxxXnzqOerHKQqJgYpwXnFLnAAo3/NxSRkw2n1p22mb+advHrVCF2DPPpQUoD4PWkMgxnNNJC1EK89qTAzSNJTGkHPPSpe40rkhAx1pCBURlHc0GXmlcZMoGf6U7HyioVkHr3p3mYAp3uDuPIHrTSPWk3/SmsxI4pAh2QDT0cCqzMcfWkDHP1p3BotlxjtmmFqgBY0hJPU03IOUn3DPNBcYqA7h0phJHPp7VKdgsWS4A60eYPpVN2bHWm+Y3FHMNQL3mjHFI03oao+YxHNSxgkDFHNcOUmMvv1pPMPfNM2H+lI68+3pRdhYl84DrTGuAD1zVdwc9KTyyfUUcw+Um849qaZjz1pFhIFO8qkmPlEMx7mjzyBxSGLrTTFVJ2GkaPSlyaFHvmjNa3MBRyfSij/GjikAmDRjJozRmkyhD6+9KBS03ANAC4xmkpf8ik7cD9aACiim0AgycUZOcUGk6VIC80Zo7YoqgFzSim9sCl7UIVgJxig9TR1pKTCwDoT+FKPSg9MUlMYpzQP6UlHbjgUBYUdKSjml+lAADx70dqBR3xTGAPFBxRijFUAmeelBpcUfyoAT5vagZNFOqkFxuOOaTHFPNFWIbt96AKUkfhTS2B6VcYtgx3Smu4HSo2lAB571UmuMcZzXVCizJzRLcXAUGs6e5B4JxVW8u8ZBI4rMuLwE/e6dq66dFLc56lW5Nd3G45HNY93JuBHc1LLNk4Jqsctz2rupU9TDVsoXC9z9ay7pCWPTj25rZmQn/wDV2qpLCWGQOPpXakkjTlMGXcpG4gAetKlxtAy3X07VeubYlSdvXpxWXPE8fXOTyKwnuLlu9DYsrwbsbhnp1rU80Om3P9a4Z7p43IBOeeo6c1rabqYkGC2R15P8q5ZpBONtzS1BN6bskYrCuV5IBJ/Dmt9mWROD+PrWVfx4J+ledUWp59eGuhjzgoc4A/nVN/lbnj+ZrQnHOCPr+VVZISXyOnfJq6cjgqLQiTPIPU9MmkcEKDweOhNP2EH8fXFRyk8c4btmuxanLNaEeQrYBH0zU8MnJx1PT+VVH+/zwcDtUkRIJPr2PapdjNGlE+WC8E9/erMWSRzk8dqoQMSQuMEVo265C46GuaasaRk0Z2sQboWODuI7CvPdZQJJk88+tep30AaHg/iPWuE8QWHzMe/JHpXTQeh7OHndHNxTBG+90GK17C8AI547e/0rBmQxHqfw/rUUd2UIByDngV03sdbjdaHo2m6iocZJOP4s10NjqS4/1nI615bY6jhhuPIresNSIYEtn6Yp2TM9UemQ34K1YF5k9ec1w9rqgAU7yOavx6kDgsx/KpcCrnVNcjaRuAP16VFLdDr796wE1NCfvHjvmmS6iCM7h+eMUuUFI2Zrlc/MfzqrJdjB5A9OaxZb8E8uAOnNU5dQyOCP5UcoXNuW+Bzhh161Unuxz82Pb1rDnvztzuHX16VSuNQwSdx46YqrIVzYmuxg9Tx1rNu70FSSRwfrisa51QAnLDnrzWLf6nzkNzmmM2L3UQ2eQSvb1rIu78MCNxBA49hWLdaidxw3Pr71QlvSc8nA/UVII2ZL0jofwqrJdYOeAMdM1ktdkdOpqKS7Jz82fwqQNZ7wYIOc+marte44J9utZTXBwcHio2mPGDVEmi94d2c5P86hkuCQc5HrmqXmHP60xmJ5HH40Ba5YkmJIyaiaXlgKiOTjP60nb9KLisKWODzSMT0oA44pdpz35pXHYYckk4oxipAm0kGlKcelLmCw1RyO1TRnHQ9RTSpU+9OUbugpqQ0rFmJiDyRkmrcB+YYx2+oqjGjFuhyK0II8EHtj61SEyzEmRnrUgjyAPekt0OOMZFWoUOQWIP6Zqm0Q2LbxAANxj0xVoqEXAx054qMfKetIX7nINZSZNxs7MB681BufdxgZAqcoWIIBJFPEOWwVz6ChIllWCUgY9Tx7VoWs7ZCsBjP5ioRallzz/k1IluUIIBH171aMmbGnzBgM5PTA71qJJ90dDjGK5233qc7c+h9KuxTMo4bt3p3MXA3Igu4EoM/1qwqqCDnBzx3rJt7pcrv6f0rQt5wzEFs5P41jJiUDStYC7L909PpXQWFsqxg46DnIrI01gxGe3X3reWZI4NxwMDrXm1229D0MNHW5R1oqiMDn2wOlcJqsm+YqvIz25rpPEN+D8qv0OMVz9naPdz8IxzXBUXLFtns04mh4ZsWmlUAY7jivYPCem7EGQD07VzngvQSux8Hp09K9U0XT1iRRsHA44rzpSbZ1x0RpabAERRgCtaJVAAqvbxbVA61YHHbpSuxtkoxzmgt/+umr1IpwHpQmQ9Az83XFOU0beetOAqkS2Ix6Uh3dqeAOOKCv59quwrkRJz29OtGT6cVJtGKTA78Uhjck/Wk7cU8DmkOKZNhhJ/Gozuyam4zzTD9aTKIircc04DA7inDpRmlYaERiPp/Kl3H0ppPakOe1MLC7iSKeDxUYHI5zSgGpCw89PelUfMOlMwcc461IOtArC/SlAGKQHrS5xiqAQqDSOufSl3jNMLfjQAwoCOlKIRnOKXfyPWnhx0NAXY1YR3HNPVQMe1AfA9+9I0lPQWo+m4FMZyBUbPkUmxpEuFPpS4A9KiD9M9PSgsc+9AyfIx7004zxzUQZiTSr97k0rhqSHGKQ4DdKaxxnmmc8nPWmCLgpT2pP8KbWxiOooPU0napuULR+BzSZpM4zTAcOlHcGm5OKXnrU3AUdOaKPegVQBSHqaWkI5oFcQ0nWlNIDg1DKD6UuOBSDGaXNMTF68UY4pM8+1GfyoAKcB82aaCaUE59aLgHGKXiikxxx0qgDjt6UnQYoIOaTNACk0Z6+lJQP1oGOzSA0Y4HrRTQXuOFIDntRz3o+lOwriUuKM80xnIrSMJMLknA70DFVjLgc9KY04B6itVRk2K5bLAdM/nTWkFUzcD1FMMwweeK3hhW9yHNIsvLUEtxgdaqyzd81TuJwAfm5rtp4exlKr2LU91zjNZl7efKar3NyD1NZt1cM2cHk+nauyFExd2Je3bNn5qp+Yx7nn2qOTczGpIUPB29e3eumNKxHKSpz2PPrU2zj14p0Uft1Hap1j5BrZKxaiUxACckZp32UEknGf1q/HGO1WFiB5HP4UXNFEw57HcOBisbU7HapG2u0eH5OlYWsoAjDpxWFTUageZ66pj3Hjjtn61gWmteRc7C+Mt0xiug8WOArEDAOcZFeW6zctFKCpIOc+9cc5pM2cVKNj2vRNSSeNVBOQMda0bpN8ZOGry7wHrRkbDtg5xjNeo2kglhB6g+tc1dI86rTdrWMS4jK8gDIPAqNVBOCfStbUYCBlTn9KzHwrEjsK5Yy6HmVYMrTKME+nWqMy/QZ71oSHA5PQd/8+1VZsEcEHjGcdK76crnnTXQgiXLjlfyqRVXYVBP40inDZwTnnNAPOeeK3USVoXIUAbIOT71fgG3jHaqNvxjPpVyMsxC5PA9aynELlg5dOAOmc9axtZsg6H5S2e3rW7CM4Jb8fSpZ4FePOMj0zUUvdZ3Yaor2Z4z4gszExODj8hXJ3DFG5ySODXrPivTdyOQuR2P9K8q1uMwyEZ59RXY9rnr0p9GNgvGU4yABzWpZaiVwCxArlWmIYfMfYU+O8OeT7ikp6FSSZ3ttqrbR82PTNWotV5ALNXn6ahjDE/jVqPUieN4z7mtE7mVjvf7WAH3uuabLq+ej+4ri/wC0scBs+nHIprahkfewB1OetO6FY6yfVmBBZuvXmqkmrlTwT+NcvNfHPUnA/wA5qrJeHsSOKnToDR1M2qZBYt161m3Ortk/PnmuemumKkBjz2z0qlJcNuOGIobKNu51UkYDbR6VnT37t1Y+/FZrysepPpTN7HByai4Ftrk9Ace1RGUnqT1xUXPc/U0mCfzouA8vxjJP8qQse1AUlQDShMng9vSlcdmNycZGeO9AyfepFjzjAPPrT1i7g0uZC5WyILzkfWhVJyMZqyIgDx2pywEr904JpORSiVdhIGck04IM89Kti3fuDU8FizYAB/Co57lclncz1j4AyemKesRJ4GM9sVuw6SWxhSTxxV6LRsYyv4CqSdhM5hIGYkFTgHmpEtGZumcdRXVrpJGFwTn2pzadhMgAU+Vi5kcutlIwGAPripUsSMgryByK6VbNEH3cY6Cop0SNW557fWqURN6mQlsEXJHQ898VIsZDH5elWANxGOQOlSR24BycY7jFPYykxkEZCk9OOAR1qdEXAGDmnrkHbgccgdaOVG7p0pbmd7jSh5z360gVd2OCKJJV9fyqpNcNtPOeCcinYC8AAwYnB/SjzEUkfz/z9KpCclRxnNIfM3cOQatEs1raRXXI5q4iqSMYA7HHSsm0JUc7iSPpWnASVXkH8KZD0LiRAls8k+tL9nXG8AZH4c8UJzjBOfUVahG5R1x0471LIepUML9QTnGBxVqyicsBgnJq9FCOOMZPNaNhZq0oPUZrlqS6CW5PpaGNAcc45/Ol1fURFHtzyB0BrQaNIIMgj0xXI6qslzdBIySBxwK8+q1HW562Hg9LkCPNfXB2jOTiu78H6A77HcdfbiovBnhoswaROvOK9a0HSI4EUbfTtivJq1eY9WnTaV2O0LSlhjT5eQBXUWqhFxmo7eBUUYHWrKpjNczZtYlRhkVMjZ69qrAGpVOOM8UILE+QM4p6kYqANk9uaejdqa0IaJh7GjPFMDDOM0Fh61dyLEoPSjcKi39PSgNmhBYeSTSE0gYY696QsAPxouMVie1MJOOmaUsM00njpQwAHjt70EE49qTPPWnbh+NIYAcZNLjByTmmlximNLzVATY45oCjFQedSCU0BZljABpOOarmUk05XI7ZqbhYlZwADSLIM81XkJxTVY5xn8qLjUS3uHU015AD1qqznk1GWY/lQ3YfKXDIKjZ+arqHJBqZI26mhsLEgbIzSFz0PNOWLC9f1pvlk8UBoAlJHHHtShsGm7CD1pWHQ1QCPIMHrim7wVpRHng07y1A71LBWI1b5h1p7PjilYKBTSy8c0IBRJx0oEpxzTGdcZx2qMyLn2qgtcmaQknv9aaZCOAKjLdx+VKrDvUtjtY1R0pKbk80ZrW5hYdn3pMjH40hpKLjsOPWjI/Gm0UrgOLD1oJpOcUdKQWF3cYpc0gApccUCYuaQmlxwKB9KpagNP15op/1/lQevFFgTGe1HQYp2DRipDcQDp60AcH60o9+KB0qgF5H9aMc4ope+aEMTFHbFLmkNOwgpv4c06kJpjuIQM0e1HtSZxnvSsDHHmkzUbuB3qF5vSt6dPmYizvx9Kaz89aqGbJ60bznrXdTwl1qZuaW5aLetQu/HUimq2RxSN0xXo0sMkc8qjZDMxx061VeYjvVphx161TnXB6muj6ukJNsaZscCmNOajkBB6HNMIJ9aqNFBYWWQniqkzMy+v8A+urZTOOKYYQRV8qjqVYy5VY8nmq7w57kDuK1pIR6cVA8QHY/T+taKSBmYsHzHip0gwQTU5jHUDilIxVcxFhFHbAHvUiLxkf5NIMZA9KlQA4qXPQ0jG5LCuDVuNeQKjhTjt+FT9ATiolM6I0yteEKhrkvEEwVGBPGK6TU3xGcE57471wXiW64YDPHArmqVVY1jTRwfiu4Ad8nAPcmvNNVPmOeARnjmu08SytLKyj5upxXKTW4ZchRk49q8mtX5maqlZlfQLs2l4oLYUnqTivY/C2rCaBAzD25/SvGntmDLx/jXUeEdRlglWNi2C2OvFVGopqzOWvRPYnAkjyRk47VlXkTI5PIzV3RZxcwL3PXA+n/AOurt3ablyAc45OK55XTujya1G5yVwSCwOePX+lVZSwPPX+ta97asgOBzz2rLnUhT82B6YrsoVLnlV6VtWV4+oyNxFSxgbQevp+f86j6MflAOPzpyMQxYfU5rvjI4WjRhXIUnPFWIVYv8oBqnasrFcHjvW5aRoVBJHT1q3DmQJXIowydeMVaik3ADJyfUZqGfYFOOSD6022bD5J4zWE4WZa92Wgalpq3MWAAT615l4x8MOQ7BCD14r2azZHUKwx/Sm6no8V1HgKDk9hV06qWjPTpVk1qz5F1azuLO4KujDB7VnmQjqTXvfjLwKbglooxuwTnFec6h4Bvo5GKR5Q5OAprZJS2OuNQ4nzWVRycU5JXBBya2L/w5eWvymNgcnn1rONlNGSCjfgKfKy07jopWzwcCpVdtoBOOmKYluwzxx61YSE7QMEcZzSuXy2ImY55yTUTtgHrn6VZMW04I+oPeq0429aWqEV3YkH696hbj2p7kdeaYR7mlcBhH+c0qqcdDTlHqM+wp47CpchcowJj65qRU7d6kCcninqny9OD1zUuZSgRBDnpx0p6rz746U8LgdaeiEsdrAH3qHItRsNiiJ49RV+3sy2B5YxjpT9Pt92ABzkfhW7aWu5OAOcinBcw1Gy1MuHT+cEf4VOmm4GD07ZrahgUruAHPTAz+NXY4AVyRkEeldHIgULnOxaaSSCBn6Vo2WngDoPr1rYW3UY4yRx0p8SgEjt/IYqlCxDjYrR2oTacDA61ajhTGVAGO1MlkC/MDx6CoWuOB0+lNqwnG5aZUBPygccmqV4U28EDJ7VHLeAEsAT2NZ13cO/tkdTUENW3Iru62NhWzz0HrVFpmlOCeac0TSN0x2qaK3C9Tn1FBlKQkMeSpPrVgkbSMtnHNI2AMD8vaoWmy2c9RjFBm9R5fbkk8Z+hqC7uMKQMfnUUkpYZzgCq5BkI64qhIQylmIwc+lKkZPOeBxk1L5W1hjj+dTxoMgAHcOOBQgY23hbAGOPrV6CBQecZ9MZzSQpx8uQR61egj3YJ6dyBQyGNhhBBIP596uRxBduO36ev1pyQ5XJHTirCR5AAXGen41DlYQsKgnAGOMZPGKv2secDHXBNV4YXHPbrWjbkQ/e+UnB5GPrWUp3CMDSsrEMAuDg/pWtHAlvuYnoM9ayYNUjiH3u3p/WpDeveELETg9x3rkrTUEzpo0Lu5Hq97lfLTOc44qx4Z0ZridWdC2epxWjovhuS7mEsi574I4r0bQ9BS2RcIPyrwsVinN2ie7h6HKrsf4f09IIVXYBwM109thUwB9M96jtLXaMY6e1XI4CAOtcSb6nUSxNn+tTA+1NSPA6VKqDPSi7DQaGAIIpCxxUgjBJFO8oVVyWyFXPapAxx7VIIlGcU4Rr6VWnQltWItzUmW98VZEa0FAAcU7EcxXDH0NOUtnnrUrKN3TmkxyOo+lGw9xvODTWzgfrUowB9aG2ntimIh53daNp9aeSBSFhihMdhoU+pp4Q4NM3dxSh6dxAU45NL5Qx1zTS9KJO1JMNRPKAPJ+tSLEAM46VEXJbv70pcletDCzHFFz1pfkA4A/Oq5dqcDwTQOzHttpjsM4pDknAoxn3/AAouAAAjNOVRxgcUoUY9qNw6dPpSGOAXd0708EAYxTAwBHNNZ/TNMW4+R/Q0wMRzTS3GMU0Nzzz7UXKSJMknI7e9NYnOP5UjSY6Coy5zz60XCxKWP6UDcerYqEuTz/KopZXVcDvRuFi3IB681CEyTmofNc85P0p0TMW5zRbQaViUqNoGeaYVAPOKY7uXC0kqsRxxx6VQ0SnYOppS0YGM1TUOWJOakYEdj+FTYLG3j+VGOaXoPejtzWpzjaXtgUHg8UdvepAMcUAUtFNgHOM0HrSHil7880gAfdpew5FIOtFAh3pSimjNOHSqTAUUnQ0vpRihvQYlIaX1NAHAzSuAg/yaXmjFKOmRTEJQPT/IpRjGaBweaBiY/OlPTAoHpQDVCEApCKk46U00BcbgVHJxn0qQn1qCUnHFBSK1xKBnBqi0259uafeNgkiqKORJ6V6+Dppszq6LQ0kfjHH1p2eKrRNk5qYsMV7caUbHMo3JY3AAHsKlVlPfOaoyPgU1JeSD/OtOeENB8hakdRiq0pye340pbPFMJz0rGpiECgyFgfQ/Sm7Tx61YVCw5qVIeBmuaWJj3NFTZVWM56U8x8H1q2IgD0pkgGDUrEKQ3TaM+RMVTmOOOlXrhsH2rNuHOTz0rppy1MG9SORuMmq80wAycD2pk8u1TyPyrJvbwAdQMjv2q5TdtBpXND7WPMPIwKv2cu8Dn3rkopmaTu2DxXSaOTgdK4quKUDrp0mdBbKSvJxxT5iBmi3HyZ56VDfPgVwyxt+p1KF0Yet3GEbPbnFeb+JbnJfPPY47V2XiG4IDDIrzjW5C0rgrkH1Nc9TFOV0aRppanN3cZlmYg/MT60iaX5gyV9PpWtZWzSSbdnU11Ol6TuTAXP9K4pysjW1zhW0IsDlCOo+lVf7MNvKHVSDnnA7V67/YeVzt+pqjf+HwAT5YPpxWPt5J3E6fMrGN4SvSu1HyCvr9a762VJYwcZyK4UadJaTgqMLn8a6nR7sCMKTz6YrvpVVUSPMrYbl1E1axBQkKPXgVyepwtE348ZFeiTASxE/zrl9csSSdobHatotwlc8jE0bo5Bj85VTz0+oqVEYk55569z71KYCsnIOc96ljjAx+uOa9GjO54lWHKOt1I+bJP4VdiuGjH3uDwAKp8Y3ZGfUmiOdFOATnHI/z+Ndqlocydtyw9wznOMDPNT203zAAjPfA5+lUDKHJYAZPHNaOlWxcrjpjvWMnd6j6m3p2cgYPWuggHyc8DFVdI0xwoYr6HitKSIxL05/nWcqT3sWm0is9nDM3zKDn25qneaDbOpOxTn2qyboRvtJB9s1ZjleRehx34pKTizso17HnXiHwnFLu2xDGecDpXC6p4R2u2Yj7+le/vZrMAWH09qytR0aJlJ8sZxxxXXTrp6HdCpFs+drvww6uSsYOODnvWVcaLIpb5SPUEV7rqOgpvchOT6jrWHd6JvQ5QEHriuj3Wro2TPGLrTnRT8v51kXlsyliRxjp6V7NfeH1YH5fmx161haj4VV1IRG59T0rOUGO7PJXjbpg/hTVXkcZru77wpKv3Y881mT6FIrcx8j9axlCRSkjmlQjOOOO4p4Q46fWtz+yX5+UgH+dMGmsMDBI6+9YSUl0NI2ZmCM4x2HNSqhAIIBrRXT23bjznvThp7H+EbRyKxbdzayM1YznkAelSRoN2DVz7IeM8ZHSm/ZX3DaCeMnjFFmwskXdNRQVBB5Pcda3YIwUAA4xwKwrON4wCucA1t2b8fPkbfbtXRR7B0LcUfRhxnGKnRcDg49aRTgZLDkYJqMyBRs6f1rsurDS0LBkVV6jH061FNOBnLe3NV57jBJHWqUr7yF5JB71LYcvVk9zPzncBjJ6VSkmbcRnIPbNOCO2CB/jTha87tuTUNmE5kSIznG7tUhtRtJP45q1AiR46gA/l/nNPkZGXGcDHc9aDllIoNGEHAB/SoJZNuRkc9eamuJlAOMD3Pbmsm/uB82MAE5oSMmOkuQDg4+marM7yPjJzxjmqoZpZAvOM9a0oYfl5BA7k1QFdVKgljjjripUIBHPA96n8tmOMDJ7CnfZCcevWkhXIFLOwxgg9iKswKRnJ6/kat21kzOB1HbnrV+HTw/YjnqO1Fxla2Q4XjHpWpaQgnp1p6WYQBjgcU03SwNnPbnmpbCMbmgIAoyQOB9KdH5QYZA4/Suev9fQIQhz9DxWYNamllCqOp/SsJysaRptneCWFV3Ej8ay7m7ldtsYOfU9Kz9LF1eEDaR6HFdvoHhwyMrSL+ff/AArycRjVE76OFcuhz+kaPfXk4LHK9fpXp3hXwv5ao0i9MYz61q6JpEMAX5ACfTiuptFSMAAdP8K8qriJVT0adBQ3JdK06O3jGFXjj61uQRqpGBgewrPhfjp3we1XIZOfT8awua2uaESqOuanHSqsUmRUm+pbHyktLvx3xUJfP+FG7P09qaGTiTBJp4k4xVVT6ZpC5Bpk2Lu8YNAkAqkXbb1oBc9apCsXxKDxTt4I61RG4Hk0oZsdeBVXJcS9uGD70wkZ61Wy/b+dKofPOevrQ2FkTbwB3pG5HFMCH3/OpAhPv60BYj4xjNLkAc05ozTPLY9+aAuJnkflTSTn3qQRHjJxz3oMZzQO6IiT2FIM49zU3lj1oIGaBEfbPNL2pwC9qTHXtRsFxhGenelwBnpimkndgUqoT+eaChwwFyaUMARmmrESe+PrUiwc9aBXSE8xSCM4NNyM9etSG3UDPSnJGoHNFibq5XU7s0cZ6ZyKshEHT1pyhcHiiw+YpsCT0xSBG3A9Ku7Vzk9DSkL/AAiiwJlIKV4NI8Zxn2q5tBGcClC560W1DmKAR2PAoNvIWHy+9accY+90p6bTyBVWYucy/sxJAxj1qwLcIB69KsMdr8DrTZMnvilYHJshaBOp6+1KYUA7U4qcZziowpJwT1o2HdiJGhJIpTDG3XFKYmTPpQIt/IYY7UahdFr8KQg0u7r0/CkYnFWZWFopAeaTNAWHe9GD3pM+1Jk0DsOIGKUADB4po9c0ueeKBWHADH4UduaT60h9c0BYd3yKN3BpvWj6UAPB6UE0wHjml4oAKUnpSUh6igocDQD603NIGGMd6BWH5x0oz7U3cKTdg5poVh+frQT70zdjvSFwKbaHYlyevWkJz3qLfijf3zSuKw9jxTJQMGml8UhfIOfwoTKSM+6TIJrNZCDnjp2rYnGRxis+VcNmvRw2IUWW4XQ2ByDirCnIHeqoUA+v1qUHj1r0/rsUjL2A6U5OM+9AUY9BSqhzxU8aVx1cbd6GqopLUjWMn0qRYsHkYqxGvHTIp4ToDyf51wyxMpD5UiJIwB0596kCgCnhQOpqN2C9xWXPJsLoHwBzxVC5kGM5p1zcgE8jpWReXWQcH9K9LC0pN3ZjVmkguZgSRVCdu/pSPMCeCP8A61V55RivZhGxw7spahL1AP0rEnLySdxWrMjSnB7e1SW2nFsHaeevFcWKxHJE7KFO5S063Z8Egkf1rqtLttqjtg9KXT9NCBTgVtQ2+xOOK+dq1pSdz0Ukthg+VcYrO1OYIjEkcVo3GVX8K5/Vgzg/nisk2wOV1+4BB5zXE3cLzzDaoIJNdxeWBlJyP09qfY6F8+dnPpgn8q2TsPmSOd0TSWZlyh5IzxXd6TpgRB8v6dauabpIQj5K6CztFRfuj3yKzk7ic7lCGwG3G0Z9hyar3OnKQw2flXTJCAMAfhTZrcEZxWDFzHnuqaWNpAUcH0rn5oXtm47dsV6bf2YbICj8RXJa7YnaWx9K0pzcWmhNqS1IdMuA8YBwKmvbZZYicA574rnLe5a2utp6ema6GzukmiBB4I7/ANa9mlNVIJnlYinZnK6lZmKQ/Lk54rLlbaOQAP1/Ou01K2SRCVA9q47VYmiyRgAHj/PatYy5HY8PE0Hcz5rjbwPp1qsJt0mAeT6moLgu0gC8/NyKuaZAzOCcn9a7YVG0eZUjY09Gtt5BcZz3xXc+HbWISpuAAGOMVzFhEIwMDnHPFasF99nbdkDAz7V1QS0bMU7Ho8CQxwZAUDHtmsDX72OHIVgQR0rBm8UlYwgYn2xWPPeT6hcZLErjGK0qVYpFOqtkXo7oyzZzwc4ro9NGQDgH8KwtNswuCQM9TXQ2m1V5x2FcPLzsdNtbl5Tge9RTnIO4dau2kAdQe56mmX1uqDscelRyO+hupNamHdW6t2BPt3rJubNfSuglxgjp2qlMoJ4PIOK3g5o2hXkjm57EMM7eSOKzbqzVAflHfPHNdi1suOOKoXthvBAX1rVVGdNPEX3OJntYDkMq+mKrS6NDKAcD1HFb11pcquRg7fp2qSK0kQYbgf1rbnR0qpGRxl34fiwWCDn24NZs+hxqThRz04ru7uIhCWA/GsK9O1hxz1wBjmloyoWObOkJuAwBjrj196hl0kL820nPPSukhG7IBGPrTpoAUPI9+KiyNm30ORk0wAlCBtHXimLpo3ZKjOO1dJNAc89CenrzUSxAc8fQDp/k00kCb6mG2mDGdo9vXt/jTFtNjbccjp/+uujEfGcHPc4qCaLI+UdvShRNYuy1Md0KjgfgaqksBk9MZrdaxZzwvvtweee9A0oAZIAH0pu6L50jACOw21JDa5HPGf1rdFiqjJHvnFRTQeUWAGMevekzCU2zPSABc469KR1C45OPQjrUs8h57ds+9UrmcIvUYHpTsjB6le7n8otjqM9B1rON/hcEAgcZ9aqancszFS2fpWNNKQSc9Dx3pN2IcTSvLxuRu5zzkis8s80hLHj3quGklkCqCTjoBk1r6Zpk0jbmj4HWpuS1Yl0+1JAZgP8AGtMQY6KAB3HFW4LB4UG4c+1E0ZjPbrVdDNkKRZJJHPY4yK0LO0MhAxwDUNumW+ZeT6VsaeUQhzxtPGRyKQralqDTkRAWwfTPaq97LFaqTmpr7UkWLapIzXG69fSTsVDk/nRsaKJcu9eDMUUg89RWRe3rTAheOfrVG3s55pAwXP1FdVovhyaZlZwTnnkVw4jGQprVnZSoOWyOZtLC4upAFDnJ+tdj4e8KSSOrumR9K7DQvDccW0+X82Oe1dlpumIgGE4I6YrxMRj5T2PSpYZJ6mN4f8PJbqAycgDmuwsLIRgEJx9KsWVmFAwvHtWvbW2cEKePSvL1e7OxJRVkRWtu2Rg4rRgtnBqza2/IB/lWpb2ucHA/pTsJsz4LZ8DIz61ehtiOxq9Fb4HSp0jA7UWdxcxVjgPpiniHtirQHPtS7eAaLC5iusHNSrBxyKlRacOatolsgMVCwDqanIpzYC47+lCQXZX8lcDinLCvPFOBweTQWHqKYhPLXJGKNijt2qRME9e9ErL607CuNAQUrFc8Dk0g24znmm7lD9f1p3Ddi7gOwpA/HApS0eKRXQd6L2DUUscdKQSEduT0pWdB3B4qJpYzkcU7hYc0h6jpUTSsDjvS+dHk89OtMaWMZNK5SVh25sZzSkHr1xUSzqe9SB8jpQMeq9TRgbTkmonlGD/hTVkycD/PNArEg2hqkyoGQKr7xngEil80YwOTQtBMn8wjoooMvHA5qLzsJjbUfmk9qASJvMkJNN3Oxximec4QjbzUXmS5yBRcfKXE3LwamHAye/rVFZWznNNd5HYHeR+FO+ouVl4n1PSnI8YHytmqJLBeWOaIIiEYlznsKBuOhe82PZnOKY9zGijkH+VUFAP3jyKcyZXhcincXJqWmvFwQDxTBfRgY3VUeNsYPy0iwRxkbjnNTcpRRZbUEzxn61HJek9OBTBBHuznIHanEx5xlRTuFkh8V0dvCmiS4kxkKcUyT7mVZcetKJYvLxIwyOOlUFkRvcyucEMMU6O6dRhYyR601HQPkdDTvtMCtsA+bGaleQWRqnpSMcc0m7gimluKu5lYdn60ZyOaj3c/hS7jQBJ3Ht1pCcE84qPf6cU0v1AoCxOCMU7PcGq+/k5NAfrnvQFizu55oYioN/cdKQMSKLisSFu1Ju4qMt2x+dN3HrSuUkThvWlLjnmq5Zh3o355pXHYnL9e9Jv461CGNIT6mmKxL5g55pu8YyeeKj9s8e1HB7UDsiQydPSkMntUecA/nSEnP0oTDQk34/rTS/fNMzwTigfXvincaRIH/DNAY+tMGTkdqcAQOQfyoCw4HPUUnPr0p3PtSHOen0obAjcZFQSRZPbNWT0zzSY6dqlOzKRU8rmlWMelWtmeopdnB6Vp7Rlc1iFU56VKigU8qPUUAYFS22TzDlPGMfhTwc/lTF9PenlhiqSIYx22qaz7ufGQD9KszyjBGayb2QE//Xr0MLhubVmc5qKKF7MxyM5NZk0jMcE+xPqKuz4Yn2/WqzoADx9K9ynTUUcjbm7lQyFT7561AZNzbR/On3HB4PFMt4yzj3qK9ZQRvTpXdi5ZWwkxn/IrdsbMccfhVTTYemR3rftIwEHWvm8VXc5HdGKirEkFuBjrxU5jAXpSrwetOJ4z781xMZTuItw6VmXNkGJBBrcYA0wxgnpSvYDn10xOhUDNXILBV4C1qrEMdKdtA6Cr52PQrQwKo4FWI1CjoBSmmliBUN3EybdTWwaiLH60Fj0pBYhuEBFc/rFvuViB2roXyQapXcO5cYzmgdjyrxFaNG25QQM9uDWXYalJbSBHb8CK9C1rTPNRuCT+dcDrOkzRyF1U5HtW+HxDpSM6lPnR0FtfLPCDuyCPpmsrVrXzlYBevcViWN1NBIEcFeeBXS2UyXEYJ2/n3r101UV0eViKNlqcsdLcS8pwOvH51etIFjAyBkdOOlb91bJsLYAH8qwtSnEWQvG0dq66c+Xc+dxFGSdkTNcxxIBnjPHHUVmXuqKCQpxjr3HSsi9vZHJ2kn1qkqyzEccGurmukc0qVlqb1hM1xKdvr1xXWaTbDYGz0HpXOaHa7GV+/r6V12nuAgHf0qZJN6GKjqWWYxDCg5pv2+RXOQRz61aHluvVQc9c1SuYE5IOeKpRsU01qja0/Vxt4JNF/q+7gHr6HpWHCAhIXoKuJbCXrnp3rZRu7milJ6DJNQJ7/mKi+15fLE5zjr+tWH0/Bzy2fWq1zaOi8E8e1EtNQs0W4rpDwSADzVmJ45OSR9DXMySPG+DnjpnrUi6gyqQDn68UlJGkZvY3J4kZugOeTimPaIEJ2g96oWt5vIJbIrRSUSDAH60m0zeMjD1OwGxsAdPqQK5LULCTzyq5PoOteni08xDkdeAKqto0Zl3suec//XojJnfRcpI8/sdGmcKzJ+daX9iSeWQVPPfHOK7mOxijAwq8etOFumOFrdRuekrKx5zcaAxHKj1+lVW0OVSTgj1Ar057BTztXr0xVSSwjycLnHtTsVyw7Hng0eTgbSBjp+VWF0JwQxjO0d8c16Pp2lw7vmUYHsOKuX9nbRQE98cjrmpuRLsjy2XTBApBXp75xWbcqiBgeAOtdbrjRrkDgjpXEapLtY7QDUtmVmyvPKq8ZABrKu3znjpzmluJnYkZyOxrOuLgITuHQc1k52NVRK99JsTJ4wccdawNSu/mJJP07Va1O8BVhgYIrCum3AkY655NQ6ttB+yRXuZSxPQ/Wq6xvI2OSc96sRxPKxVVyenSul8P6E0gDtGce471Km27EuKW5R0bSyzq7AgfSuptRBEApUfStqy0YCMAJxjB4qteaaI5ecgfkD+ddMdDklTbehNaWouYgI1B75xVW60qXdgrj3Haup8LwxbQoHTrW9eafbiLe2Dgd/ShmTgeXNamDJYYPuPSqd3eLCvDBs571teL7qKNmjjGD0yOlccttcXb7Vydx4OPWlOagrtjjByeg+W+aYhAck8E+tWNM0qW6kHGQf1rU0HwvO0qmVT16EV3+kaCIE+6fyrxcZmSTcYHqYbBt+8zG0HwzEBGSgAByB612Wm6NFEqnZkj05qzZ2jRso28g/lWxa2zjA2kkcDPavn5VJTd2z04U1FWQyysEUDC5I6ZrasrNBtG0YxTbW0cYO3kc1p21uwAwOKlyKZLa2qZzxz1+mK0re3jUAZ79arwIynmraK3UdKu5LTLUSRKQAKtRugFUgDgCnIcd+aLk8poLIm3qacsycHFZhkOMZ9qVX5zmpchuBqGZRyCDTDOBzVJWyOWFPLrihSDlJzc80huyB6VWHXmoZ3Ocdqdx8qLpu2z3pjXDluKqh6A4DY79Kq4cqRaWRz1NCu397pVdWYgn+lJ5hH86QrFnzXGACenNBkdupxVdZMj60rEj1pg0Tbyvc0mWZs5qN2OBxQshU9DTSFsWGyVwWAPvTXXC4BqBmkJyATSFp2PCkVVtBLUmPTGT/Q0oVcctUQWY87cU3ZMT0osMkKZJyR+NSJEmDuP51XZJ8jrT4oJmPfFANkiRxjnNPZ1Pyrj3qJbedmxjH41MtrKrdeMdqBNoRdpzk0u2IHJINPFm3XNPWx+TGfzosTzIj8yPbjFRsyLlu/pVgWaqSd4+lI6wAZyMjsKdn1DmK7NvXP9KjEgBwRzVg+WF4FBhUsp3YqWUV3mG/HWgTNjJQn0q0YrcDlgTUkbWqMEYqMc00F0ZhmfeQqHP0qQNMMnYauyXFpuxGATQLiPGVRmNJhfyKJWdj908UrtOOoOPSr6yEvlk2jFNmvowQPJYn6VQczXQpJFLIQ2CuKkWCUYIY5FTfb5wuI7U81G8986jZEAO/tS+YXd9hk1vKWDBzn0qP7M7tlyc1KzX27AjBBHJxTkS82ngL9BRsFyOOxmOcFse9CadvYhm+v+FTwfawfmy3+zxUHlahJMfnI9l9KLgSw2mxjG67x6ZpsunQ5ypAHOBnmlW3uxnk88ZNRmwu2cl5yQeM4ppIV9dx5tY15yDjp2pJGtCw3soJ9KVNOkVdvmOw75qT+y4SM7iGHU07PoO66sl3UpbNQjkc04EUzMf7/0pMgjOe1IDx096T+H27UAL7ZoOO5pM0nWiwAT7inAkU3HcZp3pmi4Chuadxj0NJxzT/r+NDAbyab3p5znrSEDPtQBGcnijpTyPrQ31pWAaMnPIo2GnY5+lPAHemNjdvP0o2H60/PNLkdRQIi2exppTnGKmppwDx/+ugCHbS45/Gn9sUYA70FCBTnFOUAc0dTijtigBenSkP3qazY7U0n8/X0oJHE5oB7VH+FKMkA0MtkgPSnLgcmmLzTvanYTFJGeKaW+XkilbjB9Kq3MwX/69VFXAlacA56VXmvFA4IxWddXgU4JxzWZc3x/vda9KhhuYmTsal1e4zg1nz3m44z19qzJ7tiD/IVAJsnvXsU6SgjCUXLU0fNBwc5FQTy8nBNVmmIGQevHWkizI2McDr+FOpVjFFxpWH+UZCOvFX7GzORxUljak/X+Vbtpa4GcenFeDi8TzaHXCPKRWlqwXPetCOPA/GpI4cL79qmWPpXmWbHzEIU9c4p+0461OsfJp2weneq5CHIgCZxShPm9KnC9M0oXn0qWguQ7Dx3FIUPpVkKMUhXjilYLlUoc9KQx5+lWSo5pCB6fjU2C5X2HNJ5Z/CrAxSEgZwaLBdlby+5qN4s1a478U1gKQ7mXc2gYYKisDVtGWVGwo/EV2RUEcjioZokIxigaZ4xr+gtG7Oq4x0xWPazy2shV88cf/Wr2TVNNSZTkZ+o4rida8PnLMiZOfxropV5QemxM4c5hvqYeLBJOelZdzE1zISgJ6dutO1axntuzHr+FR6NdYmCSnuPqK9ijVVQ8vEYVbsZ/YBZSwBzjqakg0owuu4DArtLBYZYxgZ460l9ZrjgDIrv1ieHiMP1RgRIsYGOMVat2PvkU/wCxys+cMBnr3q1a2bIoBH6UnM4PZST2ERpQoGeB2pryyH3465q4YsAD+lQyR87sYHrTjVuiXBjbZWYgdBWvBmNNx/nWVDJ5Td+vGPWpn1DIGDyRjpXTGoluUtNzTMu5uMfT0onZXUr17VlpdblBx09akRncjHT3rVTTQnIW604SjzFGM1gX9i8LHuPYV2tqpMWCueKz9WgVlOVrCcdbnRSimc5ZPhlUnHODmuo0xYsckfQnv/nNee61ePZzllzwapL4vmjPlITnoRnNUqV9TvhQSZ6800SEgHn1xSqQ6k4+uK820bXLm5lBYsRnv6V32iTGVQM1o4JI7KMUiW4BXg56f1qCKTa3PT2FX7qM7c4OOOc1lSoQ3BJpqVjqijQEi7QQeKilPzZ4PrVON3PfoOatRjK5Jz9abdy7Eiz7Fz3Hr6Vn6leuVK7uoOBViRgAQvFZGokBT056VDFGBy+uTNltp47e5rjtQc5ILZHXgV0+uOqq24jjr9a4TV7xUY7eSDycc1zVaqidEaNkRXsqouTgH2Fc/fTlmbqewJFW7hp7g7VXOf8AP9TVzTvD1zcv9wnJwOK82eJ1sjT2ZzBt3lYDuTxVuDQbiYriM57V6doXgiRwDIue/PXFdxpPhG3j2jYD9RW1OlUqK5m0keO6H4OlZwzRN15BHOPeu90Tw4sYSMxgY9QK9GGhR20eDFjPfs1QparHKDGO/PNehTpqCOecbnOzaA1vAGCgcfd74+tc/qlgDuGB78V6bfmR7by8DGPSuP1SEqWLLj2FW9EZxgziY5H0+fcOOeBnvUmo+IpJITGrc7ccelWNXsZZNxjQgDkntXOwaXNNdeWAW/GspVlBczM3Q5noYk1tPqF9n5myc13fhXw5GkcbyxYzjjFbnhjwZIyrK8YXJ6V21l4f2KqhflA4/wAK+dx2OlUlyx2PUw+GhS1ZgWWnRRBQEBx0x3rWtrRVXG0HHQ4rct9EwASM/WtCPSlCkAD2zXlWbZ086OegtRkEYxnNadtbhT0A/CtaPTEB555zmrSWca4GB9TTsLmRnRwjGFUdKsrERjA4q7FbovOcVKEQHdQwvcrRRtnOP0qaGIk8VYTaP61MmwdaSbBsqmFicAGkaBj2rSWWIdRS+dHjpmqtcnmfYyxbyZBx2qRLWTI4q75wzwuasJyB8tLlE6jM5rdyeBx60C3kH1rQLsTjbTJVk64NPlQuZlP7NIwzSrZE53Dirq7yOlSbTjPOafL3E6jM5rE5IGMU7+zuBzV4ZFKSdvBFOwvaMoCw2DJbrSm0QjtVz5icP0prR7hw2BVKK6BzvqVUtokODipRBCfQfjUsUSE53CnNFGAfnAoSYORAUgBxx9aWRIMZxzipfKtwPvA0AW69SCKdhcxXEkK/LtzTzIoUfuuPpT3ltI+wz2qMXkRGFUEU9g1YjyMcBIxmog8i8eWfyoW+XzTtj6U9b6M/MI8+uaW49UthrvNgYiqSJrn+5+GPanfb0K/cPFAvcAER1VrE6voIqXWSx6U5/tJxjAxUTahKxOyOo/tV0x2qu2h2DUslbqQctj6UiwTbP9YSKQi8aMANz3poN+igZU0aAKbWRwVMjYx61EbAgEBxnPNP/wBLPVxz2ApHt5gpG9gTzQ7DTa6gLI4AdvwqwlojoFU4I6fWqv2S6ypeUjPQE05IJYpf3kgwenNJA79y3HYrGQWZc042tooLMVNVBZh2yZmyB68Un2ddh3E4Bpvl6C16sm2WqHKhfzpwELDauBjvjvTFhtgVGQuO5PWmLLbxtwwx6mp1H6EsaoDgjinqlsz/ADJkg+lVprmEjcHAOe1JFcw7iBIuT39apCs7E7zRK+wRkD6UNfRDC7dw+lVTdQr/AKwKaI7/AE7jAO7/AHaSd9h8pZWeR8lEwPenwzBlw4weuapNqMDL+6idsf7PBHtUaaiZBj7M6r0yRxR8xWdti81yUlxGmc9cnJppkmJJjQg4zzxUEl9nHlwbc85xyaIr+UyFAihiOMnAptlKL7EsMtxKpBAQj17UD7QcjcSRz/8AqpYJ7g581Y8442mlZ2QcBmJ9qVxa3Itl1IMCV1+vBpDY3DR5a5b6E1Yl+0tEGiUYpYVvJIgsqrx0OcH86Ewu/Ipg9c804Zz65pMeopQvP/16odw9OvFFL7mkA7/5FLoAZ47Up9v50d6Oh5pgGeKUfSkH3fSlHToaAHDrTh1PpTF75p3agB2aCeKaSM5NITjjrQKwueBQTzTc8cUZ59KVxCkntS7uBxzSY59qMYpgKW5pGbikIP40mD0oAcX78Uobcc+1RnpknHuaBkGpHYk4PPaj6VHk/WnA+9N2GSLycUAUinBFPyMelCFcYwI/Kmhe9SMcf/WpmfemFhAuR9acExQOgPtxT880NCEApcZxSjpSE/rQAjDI/Ws2/BCkitBmHrVO9G5W6mtIuzTLRyuoy4bFZzsSeprY1G23MeDWW1uyknofpXtUa8bFcjvchK5U5pSmOmeOnNS+SQD/ADxUiwknmtpYlItR7FRkLNgDrWjp9vyMrjFPgtMuMLmteytwvOPXrXm4jE32L5bFmwg2qOOa1IkAAz6fhVaEBRjNTbz/AJ9K87WTM3dFhcdMVKpAqmJf9rmniX3q0rGTRbDKKaXFVjIeeTTWc9qGg5SyZB60CQE96p789KdvI6VjIpIt+YB+NKZB61S8w/X3pPNPNIaiWzJximM49aqmVsex9qYZCallcpaMufpTfMz0qsWY9aMnoMfjUNgkWC+e9NMnPNREt3NAU+5pXY0ibePWjIpixmn7KVw0GsAfeqd1aRup4q+V9KQpkHj9Kd7CT1OG8QaGsiEhOorgtU0G4iuN0Yf1r26W2WXgqDVObRoJR8yfpVwqyg7plStJank2kS3Nt8r5wD3roYbtJAA+AT6V0134ajKnaq4+lY11okkOdoJ9sV7NDM1a00ebWwd2+USJYMc4zjHSnSTQKp+ZeOtYWppdW6nar57H/wCtXJ3+p6grFdrYGRXoQxVGp1OKWGkuh3/mpI+AwP8AWnyQ8HofeuD0PW7gzhZAxA/E11seohkHI59T1roUItXRzSoLqhyWZlcLnH4VqR6EzIH6/hVG01CNJBuII966zTtQglg428CmqdjCeFi1oc5Jpoi6pT7VESQbgBmtnUMSu22syW0fIYflipScWccsPKLNuJIvIDLgkiub1uTazfLxyMgd62bBwse1icVnawI2fjGc8muhK6OrD03e5wGr2D3cjDae54NYNz4aeKTOwgdcYr0+zs4mYMVzntVq60+FlAwOmOlXex6CjbU8/wBItGtkHByBzXXeHdRSGVY5G68D61LJpyBTsGCe2axrjSLr7SJIg6qD0GeaJ1Y01eRtTpuT0PVYkt7q13rgnAyM9feue1SxAc4O4djVTQ7m6tYlSRjjHerV5eGVsk/U1n7WFSN4nSoNPUzmQoen86dvKjG7FSNMjDkjPTqap3Eqg8GkpmnIyO5nPIGce1ZV/KSuO9X5WUqT3rKvsMdqkjPaoqVeWNzop0zj9fkd2ZVJ659sVkWvhq61CXcyPhvX/wCvXqOgeF0vZxLJGCMjP+Fd1Z+G7W3iACL+C189i8U29GdFkt0eU6J4LRI13xkH02109h4ftoiMxg/hXdrpsa8bf0qK5sFQEqOlZ4Sqvae8ZzldNI5xoBCu5EHPXjvTYLwxThnDfzrSnTjn8apvaiRhgYPTivpKc9Dktcj1TWRKuxVGDwR61WtZd+M5OT681ak0eUjeq570sekXaRb9gC+5zWnO+wrRRHPI7rjA9+Kyrm1eV/u9z2rbUKi4Oc+hp8aRkFiBScw5exyWsWjQWXlQw5d+pxnFHhHwxI0vnPFwOfu10ixx3N0quARkCu102zhit0VEHT0rwsxqte6mbU48quzKsbBo4wqxAY9qti0k4O2ttY1A6fpSrGTwB+leS9CnJ9jMjtmx05p6W7g55rUWD19Kc8QHTrU3C5mm2cnPOKkS1yRzVzClQM/40wFRIMMBSaZRCLTB/nUq2q4AJxUjsMD5ulAYf3xS0FqMW3QNzSeVED2pcDu9IqxZJDc/Wiwx+2Aeg/GlDQhunT2qMiPdknipAsTDJAFAgaSADIFM+2KONtOEcIPB5+lKwtwfmAzTFoQ/bCCcIfpQbxzz5dWIxDyeCKRzH/Ch4qkGj6EIuZiPuYpPNnIOAKl3Z/h47U4ORwFpXYaEKtO/GaPLud2C/BqUs6fdTJPtSu7AZbikIrywzHoxNO8qTyygbmpQ7lcqKg3XAfPPWncNWJ9mkU/fx+NOEK8hpOvfNJIk7jIY4+tRfZJTgFiDVJlfMsfZ492TJx6ClKW6/wAQNRfYJCeXOM8mpF01QMsxb3p+gnbuMlFuUOSuMUiNalcJgCpTp+eA3HpQmnoowFLZH5UrMV0t2Rq1oPmOMduKRrizxgLgfSrMdiqj51704WQPRBgmqSfYltX3KXn2ynKrkmpnu4FizsNS/YvYdfSnfYDgiVQR6ZxihKXYHKLKa30P8MXA46U1r85/dW+VHtWkthCE27Qfanm1SNQFUCq5ZW2EpxMpL67cHZCF9zmiS6vAoLAA9BitXyMgNwKBaq2SwBH1xT5ZWDnj2MxRdNHveQChWkLACTJ9QK1o4gpI/h9KeVgB4jHPXHShQbE6i7GQROhADsPenT27PhzIzkCtUrH/AAnj0NOESbcvxR7J7C9quxjCCUEFmxx0pfs7uoQl8fpWi62oJHXNBljWLbvC59+DR7Np6sftPIyhYz4IXjB/vZpVsGZGWUqSepHetWKSPoWHPfuKbHcWasysck+/Wjk8xuo9TNWxQMqsCPfFA0+JMukefQ5rQn1C1VsFSCPQZqEX8XIVCVOMYFJxS6jUp9iuLESAZVQAehHSpI7AE4CJkdeKvNIgCOh4PamPcDcT0PWnyJdSeeXQrvYBTgDb7AVIbRGtzGCGPUHoRTprtiu48HPNQf2iUxtUNkf3eDS924e+x8FowUrvL4PRhmnCzh3HCg/hUM95MwGyE8jjP+FJHcXYUmRMc8dKdoWC0y2IYyOARj07fhUixkNt+6Prx7Vnyz3JGV3E+4pjveMRulOAOx6UXigUZdWaTRkOQjDHX1oYeWu1wC3fHFZyJK5P791bsaYkNzv+a53j0J6U+Zb2HyXerFK/WjbwCBUv1xSHHGamxVyPGDx6UAd8fnUnHbmk47ClcQ3aeMUgXtT/AEPpQTkUwIyCaXHP86UnAppIxxSuUhc4pC3tgUwtxmms3JGTTHYlLUm7nrURfjJxRuwcVNwsSjkDHrT+vaog2TT1PYGhMTRKMAcfrSjt2qLfwe1BfiqFYlIA5puB6Y+tNL5oVsrg0DDHT6U0gU7dz0pGqQQ3jHtSE+lKQaY2c57UFC7uR1pwc4qLH1pyjjA59aaAfvzSBsn0puDnpTth/GmLYerZFKGPXvTQpxxzTwvIoE2BPvTC3HWpNvWl8rPWgVyEnNRSjcMVbMXPSgxdeKGykzHuLbeMAZqm2nZ5xz9K6Mx47UGIZ6ChVZI0U7HN/wBnHqF/SpEsMEEgYre8pf7tIY6TrSaK9ozKitCp6Zq1HHtFWfL9qVY2P4VCbkxOdyDaRx05pQpzVpYad5POD/8ArrZIycikFOOc04K3Bzmrnke9OWEccdKdxc5VRGPX86d5eewq2IwD/OnFBilJi5yl5XT607yuDVnaBS4GazdylIpmOkEdXNoxRsHbFQPmKXkk9qQw+1aAQUhQAUWDnuZ4i5pREOaulB1xSFfapaHzFXy+KeEGfSrG32pCp9KLBzEIAC0uABin7T0IppU/WkFxBx9aABnOaCtKo45oQCMmBk9KVVANO25GKUACjQVyMoOhAqGW1jlxkDn2q1jFORRgDNNBcwr3RLecEMgwetYl14PtpP8AlmM+oru8AdhTGUccc0xXPNpvBkSNuSPB9hWbqOiTW4O1Dx6dM16w6KccCqd1YRzAhlzW9LFVKezIlShJao8PuluIpOhI9a09O1Z4Fw2QTnr1r0O68LwyZwnXt2rB1LwiADsTjFexh80UnaaOSphF9kz7PXY2k/eNwTW3Ff28sY2sCenWuL1HSLq1ckZwORU+lRyj5WYgHFerCrCa0OSVGUd0dcilzlDTV05pnOSfpUVk4AwWB46elXTNIgO0/hXRT5bXY6dNIy9Qt2tHGAMA9PWmRySMoBIJHf1qS8d5m+c55pEIRDkDipnJdDqUbon0tRLMEYj866y10uFoV3KM1xOlTOdRATPU9ORXodg7eSAVIr5vMsQ3LkTOujDlVzl/Edg0Kl41IxXKC92uY5TtOe9eoX9t9oXBXORjpXJap4TeeQvGNp9q5KGMlT0OlKMlqYeY3HXBNQSoxOVYHH4YrTHhPUYyNrE47k1dg8NXuBvA9jXpxzKm9yPZpO9zk5Ym4A5JPHNXdE0aW5mDsDjPPFdlaeF1yDKM+oxWzaaUtsoCJiuLE45y0ibJqKsUtJ09LWJQAAcVeK8das/ZZOmKX7DJjrXne8zKU0VkQHrTLmNBGcmtCOxOOuKSbTWYEdfSmlJO6I5kcRe3cAuTFuAb0qEbPvKevStTXPCUkzmWIsGzngVjDTNUsziRGkAHXrmvaw2PXLaQnTT2ZZjvpoicYP4VYn1q6ktXg2Iue+BWZ8+TujYHnigycY2n8q9KONVtGT7BN6lcozEkvkk5zUqKVjJb0p8aSSviOMk4z0q2mh6hdYyCiE8/SuarjIRW5ryI5iye6n1wRwqTGDyew/zzXq+mpthTepziqWg+HbbT1DsoMh6nFbqLEpGSMV4Neo6suYJzilZEYIB4FBJzgCpwsZPXp7U9gmBis+Ux5ig7SBiMcVDcvMU+Q1p4jzgsKYwgH8a8VLiy1JdjHSO4bGc1KlpMT945rRMkAAO5etSC4th/Gv50lC/UHUfYoLZsv3ienrQbV+CCcVca8tscvk/Shr23jXLcVTghc0n0K6WpIG4mpBaDGcGmSapACcJTRq2B8kTH8KSjFbsPfeyLBt1VMYzxSCDdnI4qsNQmJJMdMbUptx3IcDpxTfKHLMurbAe9K1opOSBWa+oXZ5SPj6VA+pXxO3YaOaAck77m6lug4BAo8lMcHp7Vg+fqJ+YIwP0pyNqbj7wHaq54DdN9zc2RL0I/OnII8dVFYT2t6Tu3EMe3anQ2Vx1kmcZ7A0Kcb7Eun5m80cXHzikYQdNyg+9YL2kxlwHcDPc0+WwmwFWRm47npVe0j2EqdvtGwDAAVyPrSDyiQNwxmsyCwkRPnk59jU/kALhnI/z6VPOuwOnbqXlSBo8ggU0rCq+YxGAeTVLymQZEvFSRojoUYkg+9PnT6EuNtblmSVCuVxt7mhHXacEH0qgDbw5TcpBPTrinbVxu89Avbmnzaj5Ey4kmPvAD8af58IwNwJ9qqssYA+bIPrRtgQbl54oTYuVMsi7Qk5wyjt1pZrnYgKLx61niaAPkI49SRVmIwld5bPbB4xVqb2E4Ja2FW9Qn5W+bOOKT7W5l2cYz0zUDyQQsF8tzn+IDNPkKIA4iJbAqW5dx8qutBxupQ3MQx2qGe5uhKPLiBQ9/SlDMV8wqOOo/+vQLiSTP+jqFPejm8x8qWyHRzTknzUxgZGOtOMznDIrfQ1C7yk8KCg/u0pkOcfaNnsVpKXS4cvkSs00kRYZBzwaiiS7RmJlBHcYxTDFJ5hbzGOepBo8mbeSJpMEdKVykrFglyQd2DUcsUxGPMwvrniq8lshJZDKGHXac8+9SIk5AVidp4yTQpdBWQv2fCH5jn604QKmAWVgeoOMUC1cfelyo6A/403yfLfeN2Oh54otqCa7iC3iWTAyrEd2/lT2t2k+7Lxjg5p3lsQAqHGeeMYpWtizZ3Fcds0rX6BzeY3bEhCzMpPfPWhvI+8GUjqMLginyW6SOpdDn+93pPs6RDaqggnqDzVNabCUkRxyqzFM4PXAUjNLKyhxtQuT2PHNStEEGTwfQ96dFaBvnJ2+ozkGmosLpakTTxDgcNjoRmkhljcZQKR14HFTsiEFSinnqaWNY0+6yg91PGaHFkp6FfzN0mwjaB0wMCmSzzK/zW+9ehI61ddeAGwB70wugbbuGfrRytDUvIpl5NgKhlHYVBP8AanUKvB6j1rTcQ7Qdw59aaJoF6sh9jRyvuXz9kZai8YYVwpHB61ILa6xujIBPvV5rq1Gdygn2FIl9AvKZpKHmHO+xBu+tJk0AcUn86oQpbHGabuOfwpcCkI4JpAN3HNJuJyeacUPGATQIyOooKbIyxxSEtmpvLz/+qlMf41NgvYrnJpMEE9easGOkCE9qodyHBpdpqcIRRs59anlC5EV4707FSeXgetKsf4U7CbIsHvnNIOuanWLOTxmjy/50xXIPalHTNTiIelAj61IJojA9qAM81LsHcEUoXmqC5EFPegx5NWAB2FGACOKTFcriIjinJEce4qcDnmjFCC5GI6cIuT/WpMU4YqkhcxGIxj09KXYBUnb2pGHvQS2MCCnYGAaKBx6fhQFwwCe9KR60D/OaXI9KEUMIHamnrUhI9P0poFKw0xm3/wDWKaRyM1KB1GKQrUuIcxGBzyacq8U4AZp3Y46VSiDYgHHSn4pN3t1pCxzVpCHZ4pM4+lMBPfpRkk9c07oS1Hk85pCeKQZNLt4zUy2GNpM8+mKcVpjL6D9KzH1F3cUbwAe1RlSecHim7DnvU2Y7k/mAfSgyDFRbG9KXY/pSuPQkMg3Ub+enWmhD3GKNh/CgHYeGHFD4puw1IFzzVEkZINM3ECpvK5pwhBqbD5kVTkk0qKcZwauLCM9qXyVo9mw50UyDijParhhX1FJ5Ao9mw50U808H2qfyl/ClWNR1p8jE5og+Yjp0pPm/CrgRMn6UbUA6U/Zk85U2Me1SJE3pVkGMEdKXzY19BT9mgc2QCI45FNktFkzleMVM1wgGcU1rxM1SggvIx7/QYrhW+UZrm9S8MSohMI2kdCK7k3g5wOKhkuC/GwEVpCtKl8LHZyWp5cbDUre4wwIAPGc4FaCswjAYV2lzbrMOY+vtWfLo3mfdGOOnauqnmk18RSoxZyxTcx459KtQaZNdEqvGelbsWhBW3MCc1q2tuIRhVwadXM3NaF+yjEo6D4citsO4yfeukjt4UGPSqiSSHoMUhEpbrXA5qWrJdzQKxAc7abmAc8GqJjkYffINN8lxnLH86nnS6C5fMvs8HtkHimtLAvTH4VT+z5/iNH2dc8sTRz+Q1HzLP2iIdwKQXUXTioWhTBweKayRKBzU8w1FFs3Eee1J9pjAqrmI/wAQpv7sdcdaPaMXIi0byNSe9IdQUnpxVTbC3cUgMSH5sYo9o2Hs4ostqKY+5zxUcs8Mo5iB/CkH2cjdxT0eDdwB+VHM3uNJLoZV1HFIxHkDn2qsdNRjkQA/hXQYhUkkDHY0nmoW+VaPeWxaqW6GdaWPkgbYgOOeKuASqMKBmp3kyBhaQMeeMVNmDm3uivtmPfnNRlJd3JJq1HIN2CDTnOBwBSYuZlTEzcAkCkkjnI4ZquRkleVFKzyAD90cetHzBy8iitrKRkuTnsTSfYXZeHP51pBWcYC80LE+0rjBo5WyfaFGGy+UAsT9aGtUQ/Nj8aueVNnDAg1DNbSSNgMxocdAU/MjS3jx1GccGleCLGS6nj1oWybG3LfXNKdPXbyzAmlbyKv5iBLbaCzJ+dJ5lsMqGHHam/2f8+AM59al/s1T0jB9cClyt7IXMurKz3FuuMGle5t2IUqWDdKuR6ZGo5HPr1qY2ap0xk1XJLohe0gUBc2yDYFPXpileZTykOfwq+kMYU5VM9d1PZIwuVZDjqc1SpyI51czFubhjj7Of5VJG0mN5XB9KtO0eQQw/Oh5rQr/AK6MHoOafK2DkuiKjy3bklQqj86ULOyg556nA61M2pWUDbDJg4+uajbVrMLlHyM8jbRyPuNSfYR47pxwVUdvWkEV0MB5CD7Cmy61YqQDnr1Apw1ZJJCEjZvfrT5V3H7/AGH/AGeRwQzlvqah8l0YKA7A8g1Ot+gUkxEn6ULqCsc5ZWxzlaPd7iXMuhG1izZaTg/U0C2EakE/L3Jps+oPtOEJ29ADmnC+eQhlhfbjnjmi0b7guceltEUyq4z0+XikWFFJJiDY9KjF9LJ9xRuz1HemPNdKQVHln0PQmmrDtJl3apCpEm4kdx0pojYkZcIQcYNVmkuWjOzG7sarwSXjMVlYAjselEpJohRZoSW7McPMQPbipIrVVjCht+OvrWcBev8AIsi7QOO9OhS8DYe4yp4IU0JxHytrcvmJAMAnOe55pHVduC42+h9ao/Y5w5MdywDdARTFt2eJo5GdjnGen6U7pBa6tcvStEAAHwe+CKiaSEHiX5u65FUV05ljOGYnpt/w9KLew3PmVJCR6mlcpRSW5e+02St87kd+elBu7ESffBPXnmqraUN7ZL7W5wTkj8aj/seFfmDMT7jmjm8ieWD6luTV7FeRHnHGAOOKautWTLlYyPQYpo0+3cbZYiD2YYxTl02BD90HuDV+0fRAowW4HWIwfkhDZ9RjI+vampqWSWl+UH7uB+hqV7JNoAXJHtSCzTbkrmlzSatYXLDoRz6oCQFiLZ6c1J9sYRBgOf7uOaetqhUDyRj2/nTzZKCCuB2JxzS1HeBUTUpWcqYiMdiKa+pSZBSIt16VcS1IJGc+nFC2aI3C+9Hv9AvApPdXc75jTYMetPja/VSdoYjkc1f8hOGUY9aVFVTjJNNc3UXNHoUN15MpbeqHHII60JFdKQTMSMc4rQaNScilCcdKLSuLnRmsZBLt8wt+HNH2SZ8OZ2HoK0vJTP3RTRG0fC8ihxfUftF0KEQuDJs3PjPSm3FiGcsHcE+9aW0nHAz9KEhYknr60KLDn1ujPji2IUZmb6mmLbkvkDitcW4PzNTRFGDkkZpcjD2nYzxAM4PH1pTbKB8oyO1XnRM5HNOwMDjimqWovaGeemcUY5p4AwcEcU7b0p2GM289KcFGKfgYxilAxwKLBcj29qXaB2xT8CjnP1oSFcaE5zS7BinduKXNOwNkewHPHWl2+1SAZpdvFFhXIStG01KRQBz7Uh3I9tLt5p46AYpdtArjAvXIox7U7HbNGOKAuNABowMUoHfFKRx0pBsRHPejHPWpCuaTZ7daLFdBgPbigfhipAnFHl00hXG80c1IEFKFUDFO1hXIx+FOHXsadgetKMD6+9FgGc4x0oAJGaeMY4pwxkYFVYQwLjNBXHan+vNL2pWFciZT+FNINTcGmnFFirkW00oBzz0qTj8KTiqsFw2nNLikLYoLDAIpWQgC856UbeD0oL9jTd9MaHbehoKj0phdgKaZTmkgsSFetLtHIz0qIyMQR70oZqdwSJQAOc0cY61Gd305pCCR6VDY0S5GetISvrUBDZpGDg9am4cpMdgA6DFG5Paq+GPenbTwOaVx2JhIoppkWozGeTmmmPr2NTew7E3mrmmmUVEUxg+9IAOnTmk2Uokxlz07U7zh3/KoCB2pP50uYOVExuOaQ3LDoKhOATTlwRyT+dHMw5USi5bnr1pVnY1CduelIzEdAaOZj5UWjM5FN81icZNVw7EjrUibj2NCkyHGxIZCaZ5hB601lk6gGkEMhHGad2OyJllOeTS7yR1pi28gODTxbyYqlzCaiGSeppNue9SLbuepp4tmz1470csmLmSK2wHqSRSsiAdKsi24zn/69Bt1zyaXJIfOioQg7CnAoB93mrf2VMZzQII+nFCgxc6Khdey9KaJOfuVoeREooWKHnJFNU2P2qKIbOODSMWzwprR8uIdMUbYuhIpumw9qrlFN2OlKN2ehqyzwJnJAqFriHIwQaXJYOa/QYSw7VE/nEn9eKnNxBjqD+NM+1wAHIGaLDTl2Its5xgGmPDOx4Y1cW7ix2qA6gquQE3e1S0u5ScuxH9muGXkml+wSnClzTzquxceUR71HJq5b7kVHLDqw99j101lOTzUv2DI5/nUEeqSbsGPj3qZ9Rk2jamc96f7sT9oJ9gxypNH2MH745qBr245JAFNa6uz8wwRU3gPln1LiWqKMACpBaqGHIrMS4uZMsJCPbFOD3eeZSaE4JC5JdzWS1VuuDR9mRDnKjmsgvfE4ErBaDDO33p3yfQ1XPDsHs5dWazpAMbnXPbmmhrdeWdePeslrOTr5jv7ZpYtPaQ8lh7mkqivsDpruaksloSD5ij8aZJc2kfV1P0qmmnIBg5NKdPjDgsGx9ablpohcse5cXULJASSM03+0YCM7uPpTPskQGQg/GmiGPkbATS532BRi0K2sW6ZIVj+FRjWUcZETjnuKPKw2Aq4zzxU0dsWUjA5HHFHtJjcYLoQy6qwkASDMZ7nvSHUpiG222OPWrH2cjgqAPYVE9rEX4DFx0x0ocpsm0CGLUZhGzPAQaX+0pCB+5Oc9Kti1cxhdmB3zTYrILwTgUrTKvBld7u7Bx5SfX0ofULwJsRU3mraW6A52gjoCTSPbhzkYOPamvaLZiThsZ8lzqSLmUZ78DpUUb6hKxYyOFPStlLfkF2yuO/SnNCqP1yp/Shqb6h7SC6GCINRyT5jbe3OKb9hvGc5nYf8C5NdBsTAAG7PSkWNSQzAdPrijkfcr2vkYT2aKuJXlc9DiphpkDAMxfPbPetgRqNz78r9KGDHjcSo7EUuTuS63YyoNOSIOwi8wHJwy5/KpI7RJCZfs4TjjitLyFK4LZPUZ5FPSGU5zngfhVKl2JdYzEsY3bb5f3eoqZbPB+VUGDzg4P8A9etH7Oir1C5GOvSkESSABm79Tx+ta/V2kZ+3bKf2YOhKuit2B6CiKIBgDsLfTir5gCkjke56gU1kTaEXkg8Zp+xa6C9qym8EWC6rg+mOTQsKgYBUZ54Oc1aMbCP5v4e3pTPKIOQSM9c9qn2fWw1PzKpRQxCqMjqF9PWlltkJBd+MZGKmBVWHIb3xml/d7slixB6dsU+QfMRBEXHyjHbtSmBWO5VQ++OhqR5YjlmHToM4zSRTRCRgeCew4p8q2Yry3RE0L715AXPBGOtOeBUXPBz1Ap0l5GRgshA6fWmjULVW+faT3560ciuF5tbAIAqc7dnXBPFPWBCTk49M1G2pw7AScY7jrUX9p2+NzZyPbiqcY33F776E5iQcYLNTtrEBvLPH6VXfV4VTKLv/AAqL+2gxGFZc+1O0Fuw5aj1sXVh3nlXH0NTPCNnCsD0JxWU+szoMeWGOeoHNOGruV5jYHvTTprqDp1DQNtleM59CKI7U4z0A9DWauqTSHG1sVKdRkC7VVs96nmp7jdOoXPs+GB649TTygJAAFZovJv4uDnuab9vn7qOe9CnAPZzZotHg7cdaTBzhu3vWU2oTBsFc9s0G6nZg+8Y9MUnOBXspGqF28gjHvSbo85LCs37bvwrNtP1ph3ZLb8r60nUXQPZPqarywZB34PfNNaa3LDBUVkIA7YZ806WBBghiT9aTq+QeyXVmoZYVGd2fpVaXULVW2lsn1qqqIw2buo9aZ9mgBy5yaTqt9C1TRcbVLfHBzUH9rJn7hx+VRpHb5GOlK4gzhkz+FHO2CpxXQcdXH3UQ49aU6w4UfuyOKh2RnBWOo2C7ipQZFHtZIpU4PoSPq0+fuHFMbUZT821gKVljI6cUYVV5XI+lQ6knuVyx7DX1KYN8qmmvqF4yg7QPwqURqwyqim9BggU1NoLR7GhjvTwuMU4AAYpTgVoYXG4pNtSjHem59KkVxgXjNLtp4pR1podyPZxT9vNA6Uce9VYm4Ac5pwXijPpSjGKYXEK80u3g0FqTd7igNQAHekb9KQuO9M8wVLGkPOMc8+lFRb6QtmpGS57UEiot3NG7JzQFiQmkzzUZJBzSjd6U7gTA5FFRLuxikJNNSFyk+R60wuAKiy2fxqMhiOo6mm3caROZOab5o6ZqHaSBSqh4yKgonD+hp+/gc1EiEDgZp201QrDtw9KQyU3HFJtPWhsY9nNN39uaTaeBS7D6UlcTE3HtSgn1oCmneWarUWg3nvQCeKlWP6UeXx160WDmREOlKBnrUu3BpyqMZNHKJyI9g20gTJPNTgDuKXC+tXyi5mQiIAZApypzyKnXb7ZpfkzzQohdkJj9qTZjnFTl055qNpUHelKKsCbIyuT0puwnkDNOadBxkUguUBxWdlfUeoCI4zj60vkkdhSNdqF7c1G17npRZBaRL5ZoMGTUAumPHNONySMgVL5WP3h/kZwab9n9TTPtD+maa1xIeADSaiNcw8269M0C3UHk1XMs55pokuN2Oah8paUrbl7yYwKaY4xVQ+eT1bmnCOUgZNPR7Cs+rLO1KNsWOaiEL5604QORnJpfIGxcxr2GakSWEdcVELVmHWgWR3etNX6IWnVk4nhA7UhvIgeOvvUZtOBkGlW2A7Vd2ugrLuPN6i87c0xtQU9FNPFvuHSkW1xxtoUpdEFo9SL7e38K037fMTjafzqwbU5Hy04WmRk/hxSTmO8CobmdhxgVG0lyxzk1ofZsLyBSCP2qXzDUolRJJujE04NKOQxqyY/mOBThH7c0Wl3FzR6FUSyHjke9IHlBPJq8LfJBxSiEDjH401CbDniUm85vuk01Y5mbGTWjsCjAppX5yBV+zYlUM97YPnLEH61H9m28AFq0iu3NIAewqHC41UKS2ak9Mf1oe1UDFaARiTgdKd5Y2nPWn7JtB7Vpmd9mXjFOFsOuzpWlHbjjkGnSRYG08Zpqgxe26Iyja7hwKclsoP3Oa0TGoXAIpnAb73FS6NtAVVszzAC20DGDSi32ZIGKtyeVuHQUMyEZpezSK9oyu1ujrlu1KEQnAQYHtUnmAfL8p/HrTk8s5BdeaXIgcmRiIMMAYxT/ACAP4RkUrSRJx5gBNQyXCo2Czc8VXLFILtkqxqCcAZp0aKWwVGc4zVd7yFDuU7qZ/aiIu0Dn1oXKtxOMmXPLO/gEfhTsBiVzjHrWcdYkVyuzt2ph1nnGxyTxwtPnph7Op1NcIiLkAk9qURu/VT+VZMOsyZ2LasW7ErinSavdldojCvn14q1KnbVidOouhpCI7WBUjmkEOxSFTdk+vSseXUdRUFsLzTIr6+Gd74PYA1LnSTG6Mu6N4K6gfKox60FZHBACr6AVhLPd5Mssm7P8JJ4qc3rlMI+Dj7x7UKrAPYvyNXYUOGcAketPiURfMXQetc/9plD580uB75AqT7XtYbSJCexfpS9rC+wexk9Ezabe7Ekkg9ADxUeSuFO0k9QP61hx3c0jsiyYHOfSpllKMdzlvYnkUOtG4fV5I02ZQcNIAM+vSjcMkmYBR2FZs0kSKGk3JjnHeo/PtwSC5VCMnPIP5VPtE+hXsnY0XubczBVl3ZHrnND3NsjBCTj68VkGe0WQi2XG4cilbUrZS8UkPmcdNufyxSc9SvZeTNU3tqqnYcjtUf8AaETxFgNhzkgiskXgjYgW2xG6EjFKlxNNwtpnHeh1GN0kag1KAjbGwO7kjGKjm1MpsWOPkHBPY/hWaJ542LfY03dz1zVqF5XUOAinGCCnQ+lCqN6XE6cVrYsf2hORtFqQSeCDgVNLe3IXJXHGOvSqM1zdbwohC9jnpSyCSaIkFVJ+971SnK25HLHqi2t1NJgABfl69v8ACq/2m680eWgyvq/FRxebENobdnqfWlndUBBfAx60ueT6lKEUywLu7xsIwP5UySS/ZRiWMYPOO/1FRoqRqHEwbPTnNRSmJvvycZ7cU+eTWrDlj0RbW6uTEHkcbRwSORSPcvt27wMd89aqRNEAULH6E0zEQfBkyue1Tzy6sfJHsWWzIh3T7HB4zzRIwKqGlw361WK2byZ80k+melRzywK4B+bHpT1HYu+bHt2sxJB5z1qO7kjkUKXfd7elQGSOSL5QeO3c02KdSceWTjgA0XsCiPQRrmP5mGeCaPs6NhuT7Zxik82TJzCQtSx3DjhU/Sp16j1AQxuBxk/SiRRGfuED3pFlnRwyxcZ9KWaaWU/MnP0puwtRBuIyEAz6U3bLncqAk/nSbpuoXAp3myKoKruxQmOxG0Uxfnj04qRkk4yRTftDyHJUril+crnORTbFZhh4zuUjNSxSNjcWGeuKiAzz3pkm9vu8e9SrBa+4XBcv8rYzSReaG+ZqQLIMcbqk8uU9EP4VQ9Bs0cp5WQEdaRA4wHapBBc4LEnFKLOVsHn60BfuxjQKOd3NWItvlbWbg0z7HO3BJxSx6fL3Yk/WgTa7j0EaZOec96UmJsc5NH9nsSMn8Kki0/DdTjuKdmybx6siQIOMAU5hEwwf5VY+xcY5+lP+xKMDJpqDJc13M5gsTfLkilGGXABz2rSFioOcZp62qjjGDT5JC9ojNjQj1prJlslc8Vri1BIp5tkH8Io9lMXtkYqxsTyKe8LEAcmtb7MvUDmkMahsHFP2D6i9unsZUcT8gKacbdieeDWp5a4pQFA7GmqNg9qVCwxSbxz9Kjw3XPSkwaLjsS7+T9KTeOtM2nJoCeuaYNEhfgUokx1pgQdKcqDNBOgu/juaNxz1pQtAUCjUNEJuPtQXpdo9aXAHbNFmPQj3E+9HzZ4p2B+lIOpo1BDGDHjNKqEn60/gdqcDz2qQvYjEfvThGMfyp+8DNJvFOwXEEYpdmDilVhmlLA1VibjdgPelVKQsMYoD9u9Gg2OKjH1pCoJNM30hZvSloA8IvFO2L6frUYZh2pQzelUFmSBAOeKdsWogzUfP70roVmPwoprEU3a+O9NaKSl0KFZl9aQuCc4pvkNznJNKID3poBd470vmDpSiHBH+eakW3HpTSYm0RGQZ60hnA7VObcZ5HFJ9lGenah3TC6IftHHSmmds8AmrItRjpThbADpzTtJheKKTSvnjrSeZKemTV8W49KctuP7tPlkJzRQV5D2NSL5nuPxq75CgdKcsS56U+WQudFFfMx3xTtrY71e8pcdOaXyhxwKfIw50Z/luc80hhY+laIjXODikKqOuKTpsftDMa3bPJoFrz3rU/dYzxTcxjrio9iHtvIz/ALLxjFPW0A7VdaSEDORmoZLyFOcih011BTk9iMWo7DrSi24ph1KIcU19SUcA96XLFD95kwthkHApwthj0qsmognkH8qnF/FjvSUYdQfOPFqvani1XPT61C2oRL3pDqsWOP5VahT6kv2nYs/ZV55qPydrDFUptYHO1W/KoDqsjfwcd6mXItilCozVKLTkVQuKynv5SMhetNF/MQcLg1PtIofspNG4NoHAGKbld3bGKxheXDHGAKjluJiwG7nNP20SfYs38x45I/Okby/UVip5pX/WU0GUEHzT7Ue2j2D2LXU3VKdOKR2TGRgViCdgPvGkaY4yXPsM1SrxtoCovubQljAByKb9pizyR19axCwcZ3k/jTVaI8M/NR7byL9h5m1Je22Nu7tUf2+BOeDWTiIAnDMKUNEwwEIx61LrvsNUUaX2+AksAOKQahFu5UZ+lU0aNQcRHn0FRPNtOFh596n2jepXsltY031IgjZFmkN7Iw4QCsyaecRgpBke3Wo1muShPl7AelDrS6sboxXQ0DeXG/PFNN7KvzHlqobroY+UEe1O/wBJzzCCD3qfaSfUr2a7Fl7y7YbhGMVAtzfMeMfSniGV+GOB7U6OOVflUik6kr7jUYroOgmvgOZF96cZ7zkiUZpBHIPv0BGA3HpSUpdxWQ9JLlHBaUnmpJ5p3XIds+wqGVJGHfHtSNgx7TKVP1p872J5YvUkhkuSm0N0HU96awnJy0m3FRAxIoQzck8ZOKV1gIyZ1IB7NQ5StuVyoW4A+8xwPUU1ZBIv7tyfxpVFvCgEr8H+8aTzoCCEGEXv2qR2GzANHtkYgD0pUiwu5HOccEnNBuLcR7i6sPzpyXKLyJEI9KWrHqhgjIAaVwW9qfMrCMLvLfWo5L61GNxGScDbTnuYhGGXLd84osNtiFlijywAb6VG0zKCRb9e4p5lhnXc8MmB2HP5UqXkbDZ9nKp3BH9KNUHyIY33MP3ZA7gjrUhkkwVWFPY9xTnvEQ4WLHHBzUD30kpCxAIwz360Ds30FDXgfcHUZPBbmoSt3LJv8tHx1ycVKZ7xlJjRd3ckU3dehxgRxHGCCODSTQ9uwkg1CSTyjsTA+mad9mus8y7QfXsajMF6ZC5uSo6fdzmnPb3DLkuR344odmF2TrY3BjPnXxZSOw/rSPp0APMznPIw/Wq6294+WR3x6k09dPduWdyPrgfhRdE6rqTJb2sXBnKswwQGyTTIxAZAUCOBz1/WoxYv5hEcRdR3JzUn9nNndjax6YNLfoP5kkkunfeaYCQckLT4Z7GQgLOpOMjd8pFQLpqs4Lphu+D1qcWEEJIWEOT69RVr0E+XuJJLA4Kbd/rnkf8A16YDbk4RcMRg5XpVkQBFAWNcdgRS/ZdwLquHx0pNMm8bEMcUEQ3MCc/nTd9vGwbyi2eeBnNWTA5Zd4BA9qSSFRkqP/rUKInJX1IHu4uAYz8vT5elQNdlWGxCWPPA/rV2aAOAxXH+0D0pkcBViM8fyp69A90ri4eSM74wvvinSXTIgaNc5xnPpVhYUDZLfhmpSsOQSF/Omk9+oXiuhVkkn8vKqD7Yqozzs3yxnBrV/d7cIRnoMHpSKIUGWYHHUU3zCUkuhk+VcyEASiNu/wBKb9huC4DynI4rUaS3EuduD1BxT/MTAITPpRyvqyvaPsZzWDKhHmE/SoxYqsm5y5PqDWo5ZvupimEXIYLsBH0pNIXtGUTpvmtkSMAfepTYxoQMnpjINWfIuM5ViPbFBt7lupOPpTtZBz+ZCdNhKgk80qWEIcbyGBqWSwmyDvNWILBzkPISPTFNRbeiJdXzK620IbKYIHapCkAfIUA/lVhNP54Jp5slB5zWnJK2xnKou5Wd4FQkgZ+lQq8TDhSK01tIucjmpVtokGdo+lUqcmR7WKMrk4XZ+NPSF8fdJrT2xjGFFLvA4IAq1RfVi9s+iMvyGJ4XApv2R88Dj3rSdlU5OBml8xOtL2K6saqytsZZsSwyQPrT47Ek4OMVomRc8AULIgPWj2K7g6symbBVxx71IlhHjmp5J1AqP7SueGGKt04JkqU2NWzjTsKl8mMYIUVE1yB1IpDdp03U0qYPnZOscZ7dOlJJCoOarm6Cng9sUG6z/wDrp81MnlmWlRDwQPyo8tR0xzWe10wPGc0wXUr464pc8EV7OT6moypg9Bn0pFZFPGKzGlnYcA00NNv75qfaR6D9k+5qNMijtTPPTjkcVm7J29akS2l7k0e110Q/ZLuXhcL7Ux7lPaqjWr9iadHZtjJY0e1l2Dkit2WFvFFI14pOcnNRCx9zS/ZMHIo9pMTjTHfawMDqKie5O4HtUi2wHUU4Wyd+c0NzegvdRAtwWHel89vSrIt0A4HFIYkA6VNplc0ehX9cYFJg07aacEPWlYq4zH50v86cEbJpfKbGaqzC4wnkUE9af5THrR5JoExu4elG8elO8o9xR5J7HrzRqLQj3ZoyTxx+VTJACeuKeIlx1p8jFzFXmhQe9XPKGKNijPf60crDnKmG6UuCasFVHpTTtqeUfNdEQjY9aPKJqdWXP4Uu5c56iiyC7IPLI+lOEZNSblz7UqSKOtNRQXYxYGOO1KLc55HFWVZD1pWkX2/KtPZqxnzSKwtutL5Hr0qXzl6dR3pryr7UuSK1HzMaIR1p6wjoR3qMTAd6PtAB60LlTH7xL5IH1p3krntVc3Q45qNrrHGRTvFC5ZFwIgHNLtT2rNe9560w3bH6Uc8R+zkaDsoPUVEzr1qi0zn/APXRvYg5PNZSlcpU7F7zlyaPtKCs8KxI5waaEYnBo5yvZo0/PXI5qQTJydwNZhjIWnK2AR/WrVUTp9jU89BkCkMykVlPKQ3XFIJmI6nNV7UXsjV80DnNO89SOoFZJlboCfxpWZgDzR7cPY9zSedcZBqMXIHeqBd8YPWoWZ8+mal1bsqNJGm95jg4/OojeHseKzTuNKM4APFJzZapRLj3j5wDxUZvHI6kVBsyDlh+dMkiJHBpc0ilCJZFzLzlqUysRndVeGPPylgKc0G1uTSbbHypDnYkZLE0xtpGCc/1p4jXFKIkPbFYNu4tENREOCfypdiA8D9aeCiNz0pWdeoFA7jiihQSOKjZlGeBTvPGMYpnmofvJSugRHKcplRmoo2YdQcCp2k6ALxTN7A48sn8KktELnLcKSfpSBpM4CcVMgff8q0yT7QH+51pNlaAHlHGOKekch54puyfPPIpUV5BsDbcULUluxJ5LnkOKkSE4yWFVJIrlGzvJHqKnS3lePOWzj0qtCfmTrCM5D/rThCnVnqpDZTN1kYH+dPSwk3ZaQg+nNNCtbqSlbbdywpkhtl+6c+/pUyWSY2sM59af9kVUwVGKYuZJ7lHzrdTxg9selOmmtAMsv4irb2Nu+WKjd9aEtoxw0Yx61I+eLKUV3bqv7sEn0xTzdRbNxjYZ9qum0ibHlxBT6inCBRlZFBOPanysXtIleC4Xy9wXHtRLNHjLLg1ZS2hyTgBuxpBEhbDNRyyQlKLKrTDGVGeOMD+dC5dDhRx2xV0RQj5QQ2O4FLGY1JBwPrxRyMXMuiKQLRgFYzTpNzJuGVJ74qckO4VAcZ55qdliGIy+T/FihRbYcy3ZT+dYugc4pkXm43FCrdhVxVjVsZzk+lStGhXCknPJJNHIw50Zzvckj5AF9ajxKzFEJx34rTAjAIGHx6DNJFgMflI9Mf4/wBKfs2+o1URkvaXDj/WyDPbPSmpp7hCJXZvxrbIjHXkHt0x7+1RkJu+UNj+dJ033KVV30Rlf2WgQOBuA/h54oXTiHyItueMg9a2gAYyQpH6VEvy/eyCOgz0o9n2YlWdjPGn7owCSSOiij7A33hCGPZQcVpSc88jHoOTSQlpHBkiwOhPrQ4ISqS6GdHaAgiRe/TFDWKocpFye+cVeKDzDiNzk9c4qVkGMZwR2JOBS9ldjdVlD7KzKJHt4B2/GhI+Np2HBPIWroCKFjdsr1yDSSrH8wUpj045FV7PTQXtGUltnALeYHXsP89Kb9nLA+agXoQCetXt1so2uwB9zj9aRliwAJCzEZX6f1qfZ3H7VleG0jV8BQ2f4ieaetvb+YwZAWHTHUfSpovKKkMvXjOOlKFhjy2OccHrVezRLmyNreNWXDd+KS4t4mHB4PGQamRlbGASBzgCmo8hYqqjaeo7GhqIuZjILbAA3ZOOQfWpzCisqjBGeVppScjhdvGOOaFtp2kyXAFVZLoJyvrcVY4YhgtgdRSBFUblIB/nSvaSFskkinfZiCNpI/pT5W/sk83mMRl5dfx4pNylipc7cZNTi3GMcHPNH2WMNuJ/OnyStoHPHqVwVTlPnX1HagSIxyB9RVpLdUyQcqRUccCBjt/LrScJIakmQtLtP3f8aiMzqDheD3HWrzxIG5wT2pBEm0nBxT5JdwU49TPmeYhSikmkhjuGX5wK1NsRHAHTtSKyY6jIpew7sXttLJGT9luuofC98U8Wr5A3YNaRdehYYoUwq3zEGn7BdyvavsUPsJY9Tn3pwsycKw6VdkuYgOCMDvUX2yJlOG6UOlFaNiU5taEYsVUgjinfZYwclfxpkl6m7kkioze88KTStTQfvC0LeLOdo609YEDYA4ql9ubI+Qn6083km7AQ4NWpU0S4zvqWRCoJA9al8qPGSOaovM5wV64pjPcbcjNNVIJ7C5G+pojyhgBRxTt8YXHHNZKtcM2OlO8uYAgn8qv2y7A6Xdl/zEJ4xTRcRr3qmkEv8TcUrWrFxycfnS9q+iDkXVlhrtVfOR+dNmvBt3ZFRfYx9aBbA8fzqfaTBRghRer680j3pUe1AtFVs45qRrZSOeeKXNUK9wqtfMTwKd9odhkj8KnWBBxs/OnmEAcChc7Y249EUGllPOD+FKGuGxhavCMZPFPMWOcc0uST1uL2kVpYqJ5xyOc00xS7uGJq+qEnmnBeMHFUqbJdRFFraV1+8R9KjSzYHLMa0jnfQcEZqnTD2jRRNrxSC0AbJq5wAO5pGYdj+dT7KIc8iuLZSDnr2pRbge9SAg08bemcU1TQOTIDDHnoDT1iUDIUVISgORRvSq5F1J5mwjCgcilkRM5AFRO69Sc+xqNrhR3yaq6SsCi3sWFUegzijPt0qo12v+RTftQ45qeaKK9m7ltm/wDrUgkwOn5VSa6z3pn2jPSpdTsNU2aYkzihnAFZv2jHrQZ2PSj2oOmXmcY603zVHeqRdye/40h3k85pe0D2ZeFwKja4BPWqpR8cZ/OkEMhGTkfjS9oylBGmAo7e9PG3jn3rOW5LUNcEHHatOdE8jNDcvtR5i4PTOay3ncHPP5UzzpD0Bo9qgdM1GlWmGQZ61SDSHFNdnBPJqXUKVMv+YMdaaZR7VR81gvUU0sSeuKXMPkL/AJ+Oc8d6Dcjb16Vn5Jzznmk5B9QetLnYuRGh9pHTNJ9o571QUEnPapVAwcgUKY3BFppuOvWommJpnUfzNIOtJyYcqSHece3SjzW7800gdhSAgfWlcqy2H+aSMVG0zhuDSscj0qJs9DRzAoonW7I+Xt6077UW71UMZPrSopHb/wCvQqj2DkRM07Z4NIZnPQ1CynPFC5xjBocmOyJPMJyN1JliM8k0FD6c/SnIrEDAyPpU6hZEZZunNHzN61MYmJHFSJC/IA4+lUgbRWCE9qkjiIxkGpfJcfWpPLfpigm5DtABphYYIzipmgkLcfyprWrNzg5pDTI94B4NMaYAkZNWPsLH1prWJ5zmlqO8Rv2lClMEik5FTrY4wBUyWQGOKpXE5RRS3AjoaBj+7V/7Kg5wKk8hAB0q+Vic0ZoJzwtCyNkDBHpxWgsaA9qcqxZ6Cl7Ni5yg28jhetMMczH7uK1o0jYDpUuyMcGqVJi9pZmJ9mmA64+tDWkjKOenpWw+wDJxSAxYySMfWj2bH7RmTHaSDgk8e1PFsRWkZIFydwqJ7mBT1HX0ocLB7R9ioLQ7shsU42+cknJqc3cIHBH1xTFvoeRk/lRyhzSES2Zlxt6d6mFmw+8Bio01CLGM4py3/JUZxT5IpakvnAWKMTxSm1XnIqJ79kkxsz70j6gSCFXt1rNqBSUyVrHuMYpYrJGPzDJqBb+UdYwae9/IOwH0qeWG4WqEz2iD7qjFO8heOFzVB7+RuQCfpSwzzsCVz9DR7i0Hadi20Khs4564pDErJ1w2elVWluN3zKW9hTHa7JwsRA9aluNx8rLyW5Hy7fxqMxxAkHYpz61WUXrPguyD6VDLp08jkGZsn15FJuK2Gk+rNIG2TG91x3pJry2iX5SpB96zotMkRCGkJ54FPTSPnydw9utPm7IXLHrIlF/AE/dnJ5zTxqNmgzKxz14oi0dQwO7OB0Iqc6bayMGkT5161Uea+wm4dyrJrFuQAi5yKRdWhK+WyP8ATFXl0+3HCqoA6U5bOHaGIHHc1py1G9iOamtjKXU13nbbv9cVK+oTyACO0+uRWn5EDYIwRSmOFc8j6d//AK9TyzG6kX0Mtby6AwLfd7A4NPNxdNjMIQjnDGrbGPAwUJ9etIzxoFcEc/jUtT1TZV49EVJmvdxKBQOuDSpFcuPmlxn0qz9qhYkHBx02j/OKd9rt1ViFPHVduKXLf7QuZrZEawyIPlHGc56808wyE8Jz3zSf2kh5VG6dD3pG1O6kf91BgDuT1/wqrU1pzBao3sTG2kODJxTxDsQlMFuhGKoPe3j8eSN3YA9PrTSdUZzyFUjkYzUuVNPRjcJdS+8RGM7Dn06fhRJHCAu+Xv6cGstbG/kf5rk4zkYXGfbrUh0+4dtskjhR3HBo5k+guVWs5GghhBH71PqODSGe33/NKoHUNnr/AI1nppMqAlZZNpPdqfHo8RcNlic9ycZqlJ9Ig4wWvMTz31hbkbpVJJ6jmlXU7Jj8u4ep28Gmrp0GCHVTj1FIthETkICF9eooc5/yiSp73Em1KDacKTzwQOKg/tKQnK25UgcE1fhs4iu0ADI5/wA96nFpCB8xLe2elHLVkPmpx6GSt7dyFlEIVh6joPWhpdQcYRQoPVsVsLDFGcqoBXjr0pwERXII68j/AOtT9jN7sXtY/wApjyxX8oXfclFHQpwT9aQ2MruXNw5J9OK15Xh4LYH44qNmUJkFQPaj2LvqxKq+iKIsyyDDuD6nNSQWCHh5MHOcZqys0YUgHAqNZU+8SPbHep9nBD556gLCBSWYYx74FSLa24G7GCfzzULTxnJLZ9B60n2uFSMHp0ppQXQT55InVFxhsfWnpEmw5APv6VVa9w4Gw4Peopb6QE+VGT68VV4IShNl0bVbp07YpyupYYHP0rJe5uZAAiYOcn3FKTc88EVLqRRfs21qa5kGcE80wy7WJzx7VkBbtvvMR9RTpLS4IH7xsH2pOv2QexS6mubhQmQw461G06ZDNJ+RrO+ySjADNmj+znwDu5qlWfYXsody9PdW8Y3eYB6jNV5L6HaCSTiohpqbgW5qY2UYwu3jtmk6kn0BRprqKL+PYOCfpTXvox8wTH1p8FmgGDipGtI9wGKOaoxe4mVZb5tgYJg0xL6VkPyc+1aP2aMDGBihbVAcgfhihqp3Dnp22Mhp7sngcGnE3LHhuTWuYIwdxApBGobIWpdOfVle1j0RliG6YH56Fs52bmQ4rUIXBAApchB29qfsddWHtX0KC2B+6xJpw01FORmrRk5zkYoMwNNU49SOebIhaRgYIyfpS+Sik/KKl8wEihmG3OeavkiJykMWFSOFoSLBxt4NPikWnM6L1PSjkT1FzPYDECM4pNvQYpRcJg1EbpQ3SraiJcxL5QznApwTrxUEl0o6VGt4eufrxT9xByyZb2EGkZT14Aqq94euCKT7Vngc/hSc4goSLmRjtTcj2zVB7g5zzx7UeexHAJ/Cl7SJXs2i8cHk0hZQMEiqBllzwpprCZhwrE/Sh1IhyPqXS6BuopRKmcf1rO2XBPcfhSrFNnHNQqnkV7NLqaXnJyaa13GBg9aoiCUjqfxpxsnI5z17Vaqy2SF7OPVlh75BnFRm+yeTUX2FuvNC2mDyDUupPsPlgSm77k9Kb9ryTQ1ocZNAtRnkc0c07haCI3uT26mozcMeoz71cW1HAxz/ADqQWyA9OKXLJhzxiZ6TydgacZZCBgHNaIt1A6fpS+Qo5xT9nMHUj2M8GY9jSZl9CBWoI0HOKCiY6CqVJ9yfarsZvlysOQaQ2shGMkVpgKpp3yk44FNUbrVi9qzJ+xMOTTvsfFaeV2+tNJX6UOig9qzOFmueelOS0HpkVeJWm7h24pexS1H7RlYWg7Cnx2qjtUzSLxQJF6g/hVKmkS5yGi3XHvTxEmOlNaYfjTTPwKdooV5DjGg7UjYx2qJ5smoml96lyiilF3P/2Q==', 'base64'), 'image/jpeg', FALSE),
+(decode('/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDAAMCAgICAgMCAgIDAwMDBAYEBAQEBAgGBgUGCQgKCgkICQkKDA8MCgsOCwkJDRENDg8QEBEQCgwSExIQEw8QEBD/2wBDAQMDAwQDBAgEBAgQCwkLEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBD/wAARCAHCAlgDAREAAhEBAxEB/8QAHQAAAQQDAQEAAAAAAAAAAAAAAgEDBAUABgcICf/EAEgQAAECBAQEAwYEBAQFAwIHAAECAwAEBREGEiExB0FRYRMicRQyQoGRoQgjsfAVUsHRFjNi4SRDcoLxFzRTJWMJGCZUhLLS/8QAGwEBAAMBAQEBAAAAAAAAAAAAAAECAwQFBgf/xAApEQEAAgICAwACAwEAAgMBAAAAAQIDEQQSEyExBSIUMkEjQlEzQ2Jh/9oADAMBAAIRAxEAPwD6K8R+I7WD2k02moS/U3xmAVqlhPJShzJ5D5nvNaMrZHDqpiTEFceU7WKzNTOcnyqcOQeiR5QPQRrMxVWLbalibFVMwvJ+JMed1dwhu+55X7R5vIv5kY8U5bbcVr2JZyrTT05Oulxw7J/lTfQCOfHHjfRYcfWumqTNQHmVluT8N9YrezqrVQzdUT4hCiRf4YwmdumtVJOVBCjbyg3PvC8VmXRWqpnZxOUWUg6n3RaM5l01hUvTeit9+kZXdEISp5Kb5gb+kZNIg2qoJsbE/wDTHPZpFUdyof6MvprFYdNANzoObzXv94RDSxRMKVdzMNNBrFmcScRVP5gUW6QUlJl6iCNIrMMpqmMzjSiPzTe8IjTCarKXnEhaTfn1jWL6Rpe0qcSpxGXfMNzG1f2s59dZew+A/iHAbanDoX1FGvLnH0fFrqr4z8nP/eXSeY6AR1Q4NsGxiyoosoyAyAyATKDdW3zgBI5dDAZAZAZAZAZAApPc/eATL8V/vBckBkBkBkAaf6QAqgEgMgA+IwAr5esEzJFbQQGAD4vlBMSyCCKgEgEVtADAZAJ07d4mAKv10jSAKjFQKtvpFFjcFakV7o+cG1SL3ETDMPWNIA/P7xVfuEjc5r2gdyf3gobVsPWAFXzgdzWXMT1GsDuFSco5bwRsC+Q7QNm1bfKCDC/dgGS3/eAsKNivE2HZhL9Dr05KFJvlS4ch/wCpB8qh2IgPRfCTi4xjtlVLqzbctWJZGYpRoiYQN1pHIjmn5jmBlaulottxzEdXermIJ6rPOFZm31KR2ReyU/JIA+UTS3pjaGs4mxJJ4bp/tUxq+slLSCfeUOVul944OVnmstsWPbguIMQzVVn3pycmA4tZIylWgT/KI5Ynq9vBxYpG2vzk824n38qU+6q+pPftFZtt1Y/2nTW6jNqF/wAxCydR5rGMbWdNatdnKhmvmSUqvYXVeM4nbprVWPTmgSpQKr33hLoiqumpvLbzdee0Zy1iFa9PJVfKoG29jtFLto+oL09/q9NYybVhFcnvL733jGzompkzmmhisQtX0b9t8xJNtesFrCE8NfMPrFmYhPJze8PrBEezkvOKbt+YLHvFU9U1me2ObYw2ymqxlp/NZOYXJ6xEq9Wz0RxxxxCUakKT8jHXxv2u4uRPWZe8uFVIVR8B0qVcBS4tnxV5gQcyje1o+swV1R8F+QvvPLcR01hDi2Ic+sWW2WLIZAZAZAZAIraAHKe8BljrvALYwCQGQGQAlPwwXBl1gFyq6QV2QpI/8wNlSLmBsVsoOsDYVGCxIDIAPiMAK+XrAIraCYgMCYB8XyghkAi/7QCQCK2gA6wC8j3gBQLX0sYuEVb03gAX73faARW30iixva2bSCIIqDSGW0+UXUCd1QAq93flBUB568oAeXLSCwFbfOAbVbSDICraeb7QAqtvBESFX9YLwaXbXrvBJpQ/lOhgGlDXTrAMPNp6gQFphKtPYbxRS64w4pJlJpCl2Nszd7LT6FJI+cRb2iITKlVJWkyLtQnFBLTCcysxtpyt6xx8jNFa6TixTll59xdjCZxLUn5t1xSEAgNN30bSP69Y87Fbdtvc4+CaQ06cnkqUta12BFrX1PeNLWdFKqKqVRaR7wNtrH9YwtLeKbUk5UvFvchMZzd00w6Uk1MalXiAgHTfeMps7KRpBcmb2VfUmKLRCvmppOoKwINIVD01lvZQNz1il3RCE9NZviH1jDTWqMuY094RM1XidGFTRTpfQRHRaJD7TfXMNYjqnuz2j/UIdTuzx1dfvDqdzzU0P5h9YdTsntTHmF1DeE07ztWL9lpT3MzgVfnca2jW9dRpS0Oy8EsIvYyxdIU9KVlhC0zD6gLjKkEm5+Vo9L8bxJyZPI+f/J8iKV096MNssMol2UhLbYAR2AFgI9+sbyafE5bd7bO/pFpVgQ+e0YzC0F/vFoQWJGQGQGQTtkDZPLBDPLALAIUgwA5T3gMgM59/WAGxz7H6wB2H7MAm8BkAioBpXPeC5bdf1gMgAV78AKoIj0Q7QaRIYEyHn84M59kgkihAD2gFgAUBpAZADfU7b94tsCr5Q2AVrrFUww2gkCxdIy6wCK/esBkXAqBvAIdoBs+78oBtX+8FQK5+sAA9YAd/lAIrn/eABXL+8A2pKeZ1gG1J3SPUd4BpQ36EwDLiUnmLwDaxsBcwHNeLmN1VKeFKkXP+ElFEnzX8RZ7jlHzuXJOSdPZ4+CKS5VNVBXxLKVfM37RFv+cbel60qpupBN/NcgaQmy0VazWKgVKKvEIiky68dNqRypZUk+ISducYy65iEBU4Vk3cKeehiEGHpgpsQ6tWvMwWhWTE95jzvBpEK6ZmFK200MZS2hAecUb2hENamfEc9DtFkzOjanFW6GKKzJouOJ52A7xPUGl05Qdde8OoNL3faHVEDbc1Gu5h1aQsGVFShvcGNenSNsqzps1BkHp6ZRKy7JdcWtKQlNzck6CJwV8s6YZc3V9Afw+8L2cA4XFQqDf/ANTqISpzQHw02uBH1GGkcXF6fBfk+XN7adbsmwyiLb608jzZ9V2wJPyiFoF12iJhaCwhDIkZAZkV+zAIf3rAZc9IDMwgFynp94DIDIDIBMogMy94BMpgEsf2YDIDIAVQDZ58oLlgBJ+sAkAKtYJmCesFJkMCJCr9ILxBIIZACpP1vAZACrVMAPwwA8z6wCKgEGsEwS247wSBWnpERIxSbxpAHtAZ94Bv4YAFe7pANH3j1gG1e76mAE7C0FSJ2gAV71oBFbwAq+8A0rVXqIBtSfvANKSn5mAaKCfl94Dy9O1JlK/M4SQomxN7/OPmuz6iuNRTk6i63MxvlMOzeuPbX5yoam6j9IrNm9aKOpTSnL2VtvGUy6a1VM3NN6ZCe+kJl0RVAcmPhCjvEE1MKmtxmJuIJpVCW5qfNBr1RnHB1JiiIlGcV5TaDSJMqPz/AKwT5NgUVb6iB2NqV5esREJmSBWnP6xbTOSNqsfrF6V0rNkxlOZQ6nvC86aVsuqbKqWsJKVXJ9OfI9YnFW2SeqMvI8Nfb2V+Fjga2ltvHeJJUlCADJy602Ob+ZWke9xuJGGO0vjvyPP/AGersqTb1sCByA0Fo3l8/MjA26QhnMl/vFoVgMS0gtzBJb9ILRJQMsFS37CAQ27awUZAImw6wXHp2gGzr6QCp5wCwGQGQGQCK2gBHOAyBs2rW3pBOgnnFpWIojaKhIAVK+0BkAh2gA+KAU6wAfEYDIDIBDbTtFoAH3frFQPwwAkb7b6awCHrAJ16GCYlh971gkKh94mAkWAKT+/nEQMHOLQGz7v1iAJ909hAMn3j84AFe7ACqCmgfCLQSEbmAFe4gBXAArr84AFJgG1DUwDeW+sB4tnKoh5XlUgadY+U7Ps5jSqmJ4f/ACAn1h2b442pp6eTcpubnbWKdl4Us5O2SrU/WK7bRKqXN3UdTF20SadmBawJvExBMoi5jub+sQtWUZ15Xp84LTJnxDzVeCgVK3O0DYc5ynKRz5xMwnRt1R11jM2a8TYnUxeITsoVm2uPnFtJ2caTrteL1ZTGlnJSmZy2pI1sOcZ3hpWHoj8NvBdzH1abnZyWWmlSSg6+pQNlG98oJGp01j2+Birkr3fMflvyHWdQ99ycnLyMq3JybYbYaQlCEJ0ACRaOrtOW3SHzmW/ljaSlJNjy9YmWMjOXrvCGchFtotCxYkDY8rmCYkuUiCwt+cFGZe8BhFoBAD3EAtvKIDMveADn84LigMgMgMgMgMgAgMOsERJtWnSDSAqMWkCDFRkFdhUNeWveBtkFgqMAKjltzvAYdlekAMBkBkAMWgCrUHlFQIUDAYTaADrAB/eAVR9PrBMSzexiIlIFaKAi2wKv6xMDPneLQGyqxy7xABW3ygGzuqAA63TAN/6fprBMwHqIM5D8UEhXuIAV7QAkaCAA7CABVtP3ygAOn/mA+fE9UHpKaU1MAJCdM3Ix8lt+k3wVv8Rnqp4ibpUkk/WDHpOL4qJqezKzFRHzjPaJorpqazAjN94bWrVCU4fv1i0NDLj5UemnWLCOXd/7wTsCncw6QNg8SBAc24gts2SrXzafOI0bZm0yk6xKssCM1usNKxJ5pnzDnfWLaaRZYS8qpNlOJsDt3i1omsforMxV1Hg7wtrXEjEDFKkJNRZSr857KQGxfcnnHfweJOef2eL+Q58Y30ZwHgek4Dw1LUOlsgBpIClWsXFc1H1j2Mvt8jmzeaWzJSdOQ9N4yqxvbUC6bf3iykEUe8GkMiyrIDEjaAJW0FybgQUFAZAZAZAZANJ3guKAyAyAyAyAFW8Am0Bh2gmDavdHYQWCraAQi0AkFdMOvYwNBgsRW0AChmty5wCK80AkBkAKlcoDIBvrAIlNuYOsAqvdMACoARpbvAKr57wAjlBEQH+8GkB+L6wQxW/ygGlfzdotAFex9ItACIAc+f1gG7aiCZIrl84M5gChygkCv94BFQAfCIATsIBtXu7X0gE/e8B89sQtpdSfLfMfW0fKTGn6Phrav1ok3OOyrxSVEC+Ud4wtbTqmkWNieS6k5tT6xDmsacf3/wD9f7QViUdyY06/ONIX0jqmTmPl+8WNGvaMyjsPnFkBL222p6wClXf7wTISr5wV2yJmDYgP3aM5WhKZava0TtXSxlpVSVBWUHna8W2l0jhTwlxBxMxAzT6XJqLDavznFaIQDzvzj1OHx4j+7xufy5xvobwy4Y4f4YUFqk0mWBdCbOvFPncPW/L7x6UTFP6vleVlnO3ZKir3thtE29uXHXUDv2tFYjSKx5J0TMIkZ8UAsWGJ7wC89IDDeC7B0goL7QGHTvAZAZACVQAp2guWAyC4cxgCgoyAFSb8/tAZb1MAKoJgCkwWJAIoQAjaAyAFQtaARW0AMAHxfKAW28FiQA5f3aAxWsAOXvALlEAik6GABSfKYAbfu0Aiv1MBkE6ArlBAD728AKvi9IBtUWgCrWLQBVziACv6wAHcQAq5adYJ0RW0FdGlbHfaBoKjA0BfOBoCv6wQzeADa0B8+qmrMjYH5x8f32/QqWaPXZXxCRlJJ1unW0W6bdlJarNKelVEC5H3h0ZSbaqBPkUoXMW6M5OGZFtwfnCKaJk2p/fb6xor2B4mt9D84ro7ywOZt9Law0d5HmzfFa0Ig7DTb+aLHY+02hV8yiABppETCInZ5hnxFehjOYb0nSxl2fDtm1PKI1uTvMQ3nhtw/q2PK9LUulyi1qdVlUqxIQOp7R34OHOSHkcvneKX0U4R8LaZwyw41S5VtHtK0f8AEO2HmVbXX1j6Cs6h8nyuR559N+bScvQ/W8YfZcVvUC6cjEoFp2gsz/uiIgLGkDIgZAKN4LigMUBAJsNBALAJp9YKzAYEMg0hkFWQAQIZBpEsggqVQBQU2RW0E6NddtYLMVtABpvAYraAHrAZACqARW0AJ5QREEtqYNIYrY+nWCA7QGQAcz2gMG5gMTtAIraAFXumAG+l4AT70Ah2gBgAgAPvQRMA/pBIPii0Aba3hCIgCvei0JB8UQEVy9YDIBvrABuIBtfOABQ/vAJ8UFQueUdYD54T7wKd4+Niun6HWmlDNJzXtYX+kbRbTpr6a7UpTxL3SLwiyJhrM5KKbWVJuLRbszmEEPLSTmUdIRbaswcTN3VvaNIYzB32hvTzfeGjvA/ESq3hqHfWGjvBwKPUaxVbR1KjpFog0lspK7am94pMtK1Wsk0G0ZjqRtGcy01pe4boc5iGqS0jKNlx+ZWlCG0pJsSecdPFp5JcfL5Hiq+i/wCH3hBJ8M8NMTUxLtCqziAp1VgVJ8u22ke5SYww+O5nJ8lnV05reYC2bMe5jbfp52Ouo2eTr6X9Izp7lFf3nQvrFtKhhpYSYtoLEDIBBygC+GDTQgf3eBpitRvyghkAP1grEs+sFgnpALAZAIqAGC7IDIDIAswgziQq/rBpAE7QCK+KASAQ7QA/EYDIBCNt94J0S3YwNBy7bwW0H4oIYdlekAPWAyAHyjrAJ06wGHaADe3YWgEUd4BIAeZgAXAISP2YBs8+hgB3JgvoGveCNAVsesWg0HryhCdA6+sWhQPWICK5dbwCK2gG/hMAF/Ke0AKkwAq90QAdN4KhX5gb/rAfOSaOY7/9vT5x8ht+jxCumFJ1ym+kNtoVkwjNc84sopZ5jNm8ovFlVDMSasx0GsTSFLSgPMKSTfQAxrtz2g3k9frFts+g0KUnckdNYqnqkNzAHvaxSYWiqSh9CiDt84tX00iE6XmkpUEje8VmesNdxSnWG04bp01XJ6Xp8mkl+YcShICb2uYriwTmlGbJPHxdnvz8Pn4c6fgOXYxJXEomaktCVtpUi4bJ7czH0mHDGCHxX5Ln+W3p39KNzaw5crQmItLyb5JvUaNdFX+sSg8kWEFmK2iITMs6f3jSJZyQbxC5b9jAZ9YLsTvAHfsYDL9jAZfsYBCqAG/07QGcucBnyMBl+xgMv2MAMF2QGQGQGQGQAqN4DIBOUVCAXidjCnT/AHhsBl39YbC29TDYE8ohYKvL2iwG+W0AkBkACu0AmYwXIdIAcpgEUTAJ5oI6g8xgdSQOofNr3gdQqubesEhUnQ+kAmXeAHa8A0r3TACr3hANq+2sBltIALcxGmwKuUNgTpDagFcu8NgdMvO3rEATsIAVe6IARtACrnAfNmYmBlCeV/n9Y+Pfo8QgvLglDec81usXFfMCLKq19rMo23i9WUztWvy5JMWlnMbQ1M5bxG0hLQV8MWVkqWU32iYg2d8PKRpFZ9G1hT5TxHRmuLHXvGUz3dOLBN8feXqz8JPCl6vYlRXpqXIlZGznmSbKN9o9XgViHkfleZ1x9HvptvLbKo2SkBPKwj0s8zM6h8benb2Pza66HvFOk1jalNfDm1rc4soXNbeCxdSYKbFEbSHXvEpiRQaQQX/ZgnTDtA0W/SCC3/d4DM2394BDrAJreAWAHMPUiATXXzGAIbQCHeC5IsMgMgMgBVm+8BkAlj+zAYdhy+cVCwAFSee8Al/3eAWABX9YLBVFg2r9L84BvMrTUwB2H7MFtMNv2YGiQW0RUDRIGgQNEV7nygbDA2FX9oG2QNhXy9YGgq90wNA6wQE7qgGle92gAPvQAZdYDL6QAxdOiK5epgaAvaCDavMPSAbPu+ukEzAVHvz6wZhVrAZACrL2gPmY84FC55R8bD9IRXXkm9o0gRHVpud9O8SrKI44Dziy1URxSSo23MW2rau0V5O/WJ0z66RFNnnERGkm/CHSLb0r1ElkX925i8TpFq7SWZXOQMtyYyyWXpib/wAN8B1DF1ZYpNPlluLdWAbC4AvG/FwTntthz+Z/Grp9LOEHDuT4dYZYpKQBMOELcUlNupt949y+PxV0+F5fJnPbbfEEkEnnE19OfY0pT10hb2bOQVZEaGDT03iQtzFdBIbWisCv+7w20isBuO/1iO0o6QzMOv6xbtJ0hmZO0VjZ1hmZPQfSJ9nWGZj2/vE7k6wJKh+vWK7k6wXToItMaOsB56RXtpbpBLA+9Fosz1DPL0EJna0RAvpEnWGf90DrDMoidp6k07w2dSHnyiAI96LBVRGwg+vzhsZ9ogCesBitjAM67wBJ1OXodoAjzgEc0EA2rl6RZYCvigmCZdu0GkE101MFWQGQAr5esAitoAB+sBivigBgEX/aASABX7+kAKt4AF205CAFeh9TANq3+cAKvpACreAHS0AI2gBVy+cACjzgAVpp1gBUBaABcWgNnfSJUIowGQHy/fcPU/WPj36PtHdXvaBtDU7rudYumxlxY1iysI6lekIWidmlebQesaRDO0gU38oT6U7A8MCMpnSxxtsc7XJ0ivkaVqsqdKLeeCUXN9O94n+zevp75/CPwlZoNF/xVVJS0y+lPg5xchPNQJj6PiY4wxt8P+X5fltp6WRdV1FRtc2v0jW2TzTp43WKxs4n3egizDYx5YGy5+5+sUggGfvGkQ0hmb1N+8UNDBTprFtGi3TtfX1jJWKyRSk7b/O33g0isgU80lNnFtgf9VjeM4ywv0lHcqEmhJ/4hCT/ANV4t5YOkgbqkiR5p1u4hGWFvFJ1NUp/u+2tG/aLeWDxSc9sklWyzTSh/wBVojyQr45GmalirKl5o/8AdF+8Hjk5nQrytuoJ7G4+sZRk2tOOYJm+FStRvrGsU2ymJgl0ny5jppvGcxo8cszJ67RpWNp8Zcyfn6xKvWWZk8v1gdZZm6K19YziV+zLb84vB2ILgjTSIiQUWGQGcjADAJygBVt9YBu+g2gFSPTXWAOACABW0WWAReC7PhgBVz7QGQGQAr5esAitoAYAFcu4gMgBO8AhNoAO94APegAKoAd9ekAPP0gAUfvAIpMFDcBg5wXN31gB/wBUAKlXSe0AHwj6wDaveMWgD17m8SAUPMYDCbc4I0+XLjniR8hp+iGHFev1hoRXDvExCsyjqXGkMpApST2iEhgEtfmRCFoKlPLr3hJJ9lonRNiSYrX1GmlbzM7df4C8OZjG2M5KTDZLDbgW7ppl0j1eDxq2ncvN/Ic3pGn0so1JlaLT2KbKpSlqXbCEhO2gj1sltvhs37TtM0HpGMTpWa7jRwK2i21OpcyU2MNbW0TOlOp1+cVmy2mKWlPYc4rN4W8aLM1amyl/FnGQQL7xW2aIaeDupp3HlHlvdcC1crdY5rcqIaV/H9lJM8SfOUy9gDsekY25Ltx8DSjnsfTjiz+dYHuRGFuRLrjgq5zFk07f8/7mM4zy3pxNI5xIvMfz9TvrE+aXRGDRl3ETxT5XM3ztaI80ytGCDIr00o/5hTy3OsO0ytGCEpmtTKk+aYPbzGJUnjVPprEzm8swb/8AUYK/xqpLeIqsyfLOONgdyRCsaRbj1ssZPHlYlSM0x4wH8wsDHTW+nLb8fWy8kOJjYOWpS4AOuZvW0aVzy5r/AI2tY9NkZxZRZpsONzGfT0Mb15EuC/Fms+gJxPTL6KOkTHL2rPDlJbxDTHf+eBFo5MyieJKQ3UJV6wZeBvp6xMSjwT/p9LidFco0g8Vf9GpSdVJ3i3TSPQU6nnE70jrEj10784iEFiyrDtAANoATzgEy94BYDIAIIg2qLNIIf7QTDILQQ7QJDtzgrLLiCQXEAhIgiJB8IgtE6Jv8oICr96wGQAqgBJsIBtzYfWAAnbvrACTbT5QA7X7wDcAiiCYM4gMGgT7v3gBVomAbVuIBNhAAdrwAj9YAPigB+IxcCr9YD5ZuObdPWPkn6AacV+7wEVbl1RfSdGlHzCIVmpN+usDTEjXvA0LL3isEsCfqYSQtqLTXpuaal2EXW4oJT1BPaJw/9baWy3jHSZfRH8MfCqXwXhFFVmpce2zrYUVXsQk2/qDH0WPjWx13D4zm8jyXmHckC3y0jWsdnl19xsvf9iF66Y1v70W6UpzWuYiY0ms7RZmoysqguTTuQDbXW0ZzbTprTbVKxxMkZH8qU1163jktkdlOHtpFU4m1CaV5Znw0HS1457ZpdlODuGuTmLXHFXdmyf0Mc85pl1Y+DpVqxO3mUr6axjO5dUcfqZVXws5k7jaE5Gni0A1k+/cX9Yzm8Na0MO1xWu2o6wi0LVxmRU8yb6C2u8axMLTiOt1ZV8qSBbvCJhXrKYzPuPeXMLesaRaIRqUxuedTZII0PWI2znHZYMzqlKF9TaG2U0smpf8AE0Nh84tEnS0HUrbTobG3eLGrFDp3SRrrvGkWhFsdhNziknyqA+dovFoYWpH+pLFUVs4dYruCccH/AG4pSVePyvvFu+lfHBUYmdllAJeJI2iK5pWvgi0elnI8RZqXISXCRfURvXM4b8C1vjbqXj6mzwKZhRQskDNeN4z7ceXizVs0vMMvJDjCgtJF73vF4tty9Jg/mFtOekawTAeXSLKs/e8V2qTpDYFe376RYLAZAIo2EAH94IgPxGLNIAreCYYP0gtDDtAk2vcwVlg1gqQ62gEItAN307QWiSJ2gkhN7+kAKoAb6QAu+7AD0/fKAA7j5wDat/vAIr3zAIdoAfiMAN+XK0A1zMBi9j84BofqYBF/rAIdoAE7QAr931EA307xcYrlrzgPla4rbWPkn3phxXcRYMqVvfpAAVb9oDMyu/1i0H0o58+0Vst8ONpKeusVrO/qJ/Y62z4qhlUNNbXjSa0n62xxp3j8M/Dc4yxnLPTDZWxLKDjmhtp3jt/GYZv+0vA/M8nrGn0SlJWXk2GpdlIQhpASlPYR7F79v1fHzabzs+lO/UGGlq6EVJCSrkN+gh2WnHEtSxRjeTora223czp0Hm0EeffN6duHje3IcScQpycdXmmsoN7ebaOG+b29fFxNw0acxSpTn+cT844pyS76YpiNKWYxEhV/Mq8TF5Wpx5idozlaWpIHjG/rGXbTp8WmN1IlQz2JJi3k0nWkxM4rLdLoA6XinZaSe2rT5gofWK7Ro17csr8yhaJrCawMTatO8dFVplJZe2sQSe8WJlYy8wE2uoC3eCutrSXmBcXF+kOqqe3OZVDkDDqzmExMwc2ZWnrGmlYg4ic82hFjtFtK2OiaTzUAeesWiUzJfE8Q5Tzi22Mk9qCVnMQAe8RNtqzWYGzOeIfDuLbDXSJrDKeyfT6W5OzHhy6s6yddbgd40rTakcmZ+tmksC5kpW8oqKuQNgfnHRXDtpGSLfU1zhxLpSVMTS21kaWVe0Ix6UnUpVFpWJKC+nw5wutA/Fe0aRGnJkw9m7Sk8qabHjtltwHXS1/SL1tLgzY0oqjTvLlr6YFX93X5xSJ6pie5Y2ieyJnqRRHMxZRn0gFiNhFHSLRIDS+8QiICNzFmkAV62ggMFoYfdPKBIbGCooAPiMBitoBoi6RACPdI3MFoJy6QWgioGw5u0DYVf1ggJ3HrANq59rwA/EYAVduekAivdMAB2PcwAcr8zAB/qgB/8QAj+8AKveEAitoAYBvpACfegBV/WA+UzilR8u+82ZcV6A9ItEGzalHN05RKAq+p9YAs3ltzgtT2JKre7rGV1rejiCpegvFYnt8XpVaUmUU8+2hsEqWoJT6/u0JwWstaer6Ifhd4fJwlg9qoTDSBNTaM2YpsbdI+ox0jiR1h8H+V5Pkvp3EJJUNCbaRX/ezgtMUpsaVZbhW5vaL2tphSk7aHxAx0zRJZctLnM4oa2VtpHJbJp6eHBNoef8TYydecWtx8rJv8W0eZfN6e1i4+pc8qmJs18zxvfXzRw3ze3sYsOoUaq8pSj51H5xzeeHTbHFZ0xNQDhGZ43Oo1i9c0NrUisbPszjriv8wGxinZE1hbSy9ApSh9YtEbZTRObWbXvoO8X0ziBqdH80W6rRBlThzeU3v3i8QjR1t45d9Bp840Z3lMl3PMNdu8IIlZsq3VyvGkNYhbMOXSMtz1MadWKdLqGXzakG8OolszGfylJHSLaRo75lJPhoJSfdI5RbTK0G/DeF73Nudt4RVSSKnHc6Q4TYbZd7Xt+sW6sZKqUrC2y6qnqCddcpsT9Ii9NFc0WVblSqUsfzJN9IO/kV/aOacnV01rFl1QcWO02ZbezANqICsx19I6aZdOfNgrHx2Oh4gl6jJJmmnEHQXSFbR11zuGcEzPpbCpNBIKlAfOHkb1xSxVWZCRdSSLw7NfAcRWGdMqhcajvF4ywwy8PcJDNbTmsoD/AFdoTlh59uEtG5lp5IU3Y3313jfHXyOXJi8RwqAtt9Y2mvjcs/uA8zyMWlUqdvn3jOQWh5/eIWCr96xaAl/3eJToI59LxZBFCAbT+9YLQy28CWQVZADACqAH4R6wDad/l1gtBFD+0FoJbeDMJ5JgBVp2F4LkVyMA0rn6wAp/rAN/FAYqABRgAO3zgB+GADl84BBtACdx6QAqOh9IAFbwA9IAedv6wAK/WA+UKnLR80+7NqVm964trAApWsFYITeCxU5rdonSaejjabm3zjO0t49pbLaVKCU87xEROSWkVint6A/DVwZnMcVyWq85LrRJMLSrzAWVv/aPW4uCYh4f5XmVj1D6CUynytMlGpOXbCG20hKUjY202j0Znb47JO03xEoSb3300hHplWNtexhiSXoFLVNOKAWpJCdd45OReIh18am5eWcbY0cnZhbzzpAKibXJAjybZY2+gw4fTk9dxFncUMytVaC8eZkybe5ixaa3MVJS1G7ht+kZRO3fWvojcxcjM5vGcNr+09lWYo82wjSGPxbSAczZlaD1i9YUldyx0G3fWOirGYTA4q2VPOJ7MtaIp4J3VFuy0WNuTBSknNryi61Yi6Uy5+WnLqT5jygzvWKJUu9mV0tFtQy66WsrdRHnAAjSsQdrQsUvKZtmslGwJVpExfav7z9TWX0lVw4LEcjpF49nTf1Nl3HL+G2kkHVSgL2i0TMlsdoXcmWzbTS3yHa/WNIpMue0zC2l5Vx91DbUutwKAIS22pR+gETWZuwvf/8ASbTaNMMzpTTqT4j6lnyzDagCoqGtyLAAC9o2jHEfWG//AOtiewYqZaW5Wp13xlLKm2pd4FhCe1tzF+sWcdbWj/VdU+GntEulmTqE60EAKAzXFuV+oif4sWb1y2j/AFola4d1iltrcTLpmUkklbY847kRhPFmG1eRWFbJVyZwlMIY9vK2lq/NbJN0DuPWOa8TjdNYrldAlq4zNS4fl5guIWARYn5xHazamOY+JTdXCT7/AC6xPaV7Rk/xNZrGyidIvCm4TG6ol09j0i207p/p5NYmJXzMqJAO2aJjJMOfJgi8NgpOKpWcUluZSAv3QdQI6aZ5eRm4vSV/mzEWsUq2PL6x10ju821OrDudLRNo6IiYGLZYhn2J8Ri52J9YiExIdAI0iUliA1bW0AtrX/vAD8RgEUdDACNoATqLQAKVACOsF2K80AO1+8FAq01O0ACtU9YLhvtAAqAD+0APeAA/7wAfFAIrb5wCHb1gGztrAJACdx6QDatTACr34AVKgEO0AMTofJdx9wfDHzL7s0qYc/lMA37Q5r5TBnAvaHP5DBtA25pfuqSesRFtkekiXezqttpCa7dFPbovCHh+5j/FkpSAFeEpweJ0IvteOzhYYtPtwfkOV4qTMPplgXBdIwPQ5Sj0lkNBtsZjlsSbR7M1jHD4XLyrci8xLZRcqJO8TNXPa2zcxNJlW1uPOAISCTrptGF7aa44eZOL2PjUZp2WaeAaQohPmte0eTyMszD2+HxPbz1iauuHNd21zyNxHk2v7fSY+NqGmvzjkwoqKydbiOe8PRpUiFKV7xitW/xJbT+YPMYQfVtKq2jSIZW9LuTctpzvF4hitGXMtsx2jSJRMJCXs1kp3PyidKRGxZgu/rrFtLdNq6emilYQk/ELxO1aY5osWZhKsmW9ykC1tzDZfHN01tQbV5iU/wA2YED015xNazLO8dPctlw7RKxiJ5LFDpc3PrKdmWlKCe6iBYAd47sWGZhw35laOif+iWMJZMs3VVJky4ApXiLSAlPdSiEgesTXE47fmKT8XbPDfhzLJ9mqmNWpOe0CT7Yl3xD0ASnKB3v6xvWmnLb8rv4dmMM4Op7zMph+XmcVzq05lNUuYKkt8vOoJyg87XMa9Yhz2/IZpbVI8M6mmURO1nCzNKkXleVArIW6Ff6kpTcH5mJ8kQ5b8zNLW8WYkwHw7nPYZyjVGfeOqsjriQFHcBy19+kZ8e8XJr/+muyPFrh/PTiJao0icp8utzNb2p1aQL8zmBvFs9Z/wjHv/wAk7FGIuCqpfwafXp6WWdUuykwtam+1lXBjCtphaIpP+qGm1eXCmRL1rGr8utNy4iRFyn+YG/8AWN655hpFK/8AtvFLp9Sq0mHpHGlalGTon+ISgQ4g9SNbj+8Vzc+KqRW0rJeB6LiWVEtiGXnxPgf+6bcbBWOSkg21PcRy1zRmaxybYmrTXDmawkpxyenK9KUwnyTNQpiVtDofFZJAHqI6ZpEOrH+XiJ9pMxh2oSdPNRl6xTJ+SGU+0SswXEpvsFADMk+oG0ZTMQ9DH+ax/wCorLFX9iM8zIzExKgEl+XT4yBY63Kb2+YisuvHzcGT4GSrSVJ8rwUBoMpveImW8xiv7hJcrlrJS4SD87Re1ohTxTUy9WkpyqS8AsHkYiMkQpbh+Vt+C8eKcmE0+ecSWlmyTe5BjpxZ+rwubwukOkZsyhrcKSCDytHX28jxPFMSzNe8XV6ii51ZAAofv5xG0xJYukEAKlawCQAk6wAqgA5dzABAIbWFucFywAq01gAV7ttCYAdNOkANtbwDUAn9oAU7QAW1t2gEI/d4ADqmAAncdIAVe7ACpVoABsYAep+UAJ94npABufSAE84DInY+TBzi2duPmNvvNB36CGzRUp8w0iNorQ7lb/lGm8NrzUKkoXcJSR3iKzpeuNKkaa5MLCUpPe94rezaMb1x+EfDrbWIEOZQFJsrNbe8er+Prp85+ctuHthvUgq1sLR6Vp3L4+Ppz+ZSbaRNv1hFZ1DlvGTHLdBpi5Fl9PiKOVWu3+0cGXJEO7i4JyvG+LsUKmJhzKrMQolRvoSY8K87fYcPFNXPKtUFTCgVKNidr7RzzD18dtI7KsyhrYcorp0JaFWvASW15lBVz9YppEysZVy9v7xaGcrSVeVmHc9Y0hSY7rVlSjbzDfrGkQpM9EjxPDGZSthyuftGvWIVpWIImYsklSrA6jXlEaaW3CnrE4GVCyjnUMyRY7df36RFbXyepVmaRG5l07CHCjFVWp0tUqwpVElZlvMwh5hS5mYB28NhIzW55l5RbW8ehg4ta+5ePyvy/wDGnVHQUYYwnhVyQk6bQZabxA4kIUuvKUJZkc3DmVlJF9EgL+XPS80tO4h4PI518sut4Xp+HW6JMTmLuLIEqEnJK0taZOXcWndJyWuOmgPaLWz9Y1EPNzTOSFbXpjgzSPZ3sSMsOMVFAUwHn1uqeGtlBRUbDltyMZWydf8AxWwzNTND4Z8IsTTn8SfedEgsjK1KvKd+SSNhEVzx/wCmmTLKjxfxOwZwaqDmHsB4RWsG6nnXXHEEHkSN1HXaEY63n2Vif9V+FsWcf8YF2u4XordTkb5lKmJFLYHZOY9OdzHZ/Ex69y03H+ui0HHlNeVL4fxxQVSlZWrzS/h+IFq2OVRSRa4MedPfH7qm2Kub9krHVDw5UKVMLxNhNAaEuVJS82EWHI3SBpbnFZ5Nr+rJpSt/1eHnqlLtTUy3LpUsiYui5AFuQ0j28WS96sfFD2hw5xBKYu4bUpUjiBbTsgyW3m3gn8tQGw0va/WPD5uS9LfG9McFrq25OlvprOPm5Z1CVKQc6Qsi1wEi0cuLHOWW03jE8sVzGU9UKo5OTFWdfUi6UuF5RJSFWBABEfQcXjTSHDmzeR6Q4H1p6YwyuWl8XN1VlSbqazOJfllEXKbEkEG3cdY8/mbxztfj4+7cJStUnCslN16s0oyEo6pIfq0iwh1KidEqeSACLXsSAR9o5a5PLGnRlxdGt4iw7K4unW6xg+cNOL7YWxiKhkltS+aH2AQdd7iOmtpidywjyV+NVmHsQYVqCRxUopq9KzBArEigKDZ6qCAFJB0JuLi2l9Y6Mtq5K6axyM9fja04Bwviqku1fDNSDIHmbclXVTDRB2zNqOYX9U+h3jG07ddOfas+3PJzCeLEyszUJenqm2pNxTcwGUnO2RY5i37wBBFrX5xSK7exx/yEWj2p6dWFNzaVN3StBvYmxBB1BvsfWK//ABuzlRj5FfUvRmDK1/GaMh7MCUpAOvyj0OPfvD5Ll4/Bb0vkj6CO/ppxRLB+9Yb0raS3/d4ttQJNotEp0GELdSeWLbOptQzKBFhFdoKTyENgf9XWLbAKMQBVy+cERAYNIJ0gMUYAYATvAAo5YDIBrT694AFHL8+8AidoAfi+UAitoAEwDf8ANBP0CzBbqBWsE9NEzGCug/DBUPUc4AVb3tAIdoAP7wHzNmqTLK91ki8fLvvoVLtGbv5WyNYNIgKqUmx8utoqvFDKqWrKfKfpBM1S5KkpUoeI2SLXgTbTbKRSWU5Clsab6b8ot02pObT1j+FOlLZmXpxSQQki2na0e1x69YfLfl7benm+Q3JBPpHRv2+YV9brDNGpr088oIsk2udu0Y58uob4MfkeLeL2PXK1V5lSnLoKjlsrbUx42XLMy+k4GCKuHVKdU86sa6q6xx1nb6LFSIhWzTaktlarkDaLTVvSPYJVWYgZopMNk7YHzXtGcwHG1352iNK7T5N4dYrItZXzKACtzzjSrLt1WTb2W6Sq1u+kb1g6+RKllOTSksy7Tri1nKlKQQddrkXtf625RelJs5b5JxRt1bCfA/8AiAU7iXETEtLtozqbk3CpdtLpvluD1VpaOynEmzyeR+ajFOm6u4VouFZdqrYdw/KU9gOBsVios+QrT/8AtWCCp1y17qUcuhIG0W5FqUtqHkZPyV88frLq9Jp+MH6aalQZqbROPy5bRVKgjxVNpUN8igNBuE7cotbHa9dw8vNm1O7vLPE7gvjim8QpKcqia1jNTuWYfCnF/npCrqSQnRsG+lhpaO7hY72jcw68eamSDXESYqVWq0slzhrJYJkZRGSXp7ZWtTirWzLKj5j3jXLPWddStYvLecA8McEVaRl556l4kqDzCEqmVTySmWKidG2gNUi+t9tYy5F9f+LObxD0jhWtUvBcoxTZLA9nVICW2GkBIQT/AK+ZHOMMVpn/ABja8SsZ/B9PrEs5VsUYclJh8EuNpsFLSRqE7am1t458+G2OfS1eTF/jh+KvxNT8u3P4Z4aUOYEzKNqS54jYbDFtCqwtf6R04eNkyx9X8c3+IvCLFnFrEzTNXqDjRAcV+bMMArCRyB3HONcvTj03ZOOtqfqkfiU4uKp2G0UufmVuztQQW0+YgoRzB/2jzMEV5d/1bzhti/Z5DeeS9lMo95lqvm1FzH0/FrSIedbJMO0Ufj1RaHwqOA04NQ1WUIKFVJt8Z85PvEczHPyeJTLPxviyS5XVq7XK06iZqU8uZdQDlUVq0HLSM8X4+MXtW+aciG28LIMwVNuo90g2BEdnWKwziHT+Acw8riJTpduoPobfWUueGogKCk2sbb7x5X5HjxNNuvi5Oj2PiDDE9S6Sug4aVJz7EyCHVOE2Zva5UlXvWNtI+awz1tp3Xv3aDgnhhxL4T1pfsrlMqlIqakuPtOKVLKQbk5kEXB1O1to9LkZYiu4YRTJH10Sryk23KPzvszTwUFLW1LpAW6kJJUixGVVwbX7x5mLLa9tNY3H1w2iy2EcdVidTw6nKng3EMmpWeRKlFDgGyijQH0EenvaIiuT4fp/FSsYMxEadxBpIM6zdsz8mktOuJABzKGyxueu45RtSu2OTtj+Ltuc4fcTnFyxm5BDrpC2p5r8ibSSfdUgjKv8AWL5sXZri5mSn2W14CoNVwjOTVDqjyH0qBVKvI0S6m+hI+E25czFsFeicuTz/AFvDemutvpHpTdxRVmb4rE31jOZVtVma/I/WNGcEPobxaGsQBSvNzP8ASLSgJ3tFdhYlEhgzkJ2VERKYkCt40hpAIhQKoDLmC4T0gMVADACd4BLiAAbmABfmOmltYAfiMAHxQCKMAGw+cA31PWBvQXNvn1gmL6ArWCfJsg59oK9g9RACr3j6QCKEAkA2dxAfON4FXQR8tt+hdUVbNj/tDZ1AWb3iuyK6G3J5jte8WiSZ0spWR5ZQNIrEaUm21tIy7iVBI0jaLaYzj29jfhop6pfC7k4rQuKsNI9/BHp8r+VvuXayrIRbTQA/KLzT28bW4cL4/cQG5WTcpMo8AVXzWV3t0jxuVk3D2fx/G9vHWJKoZh5alXJzEg33jx/9fU8fFENXUouOZje5MK+nfWExLfis+ZOgBFotPtaZUq1+xvBCrgE+WI+L0T5dxKrjNv8AaK9lrVOpcynQ3hSOyuj0q4pN7nWLWjqrpbyU0EpObQptvYDvrFI3eWE44yz3u6Jhvh/MVKUp1VxRODD1LqygmQXMsKdmKiSq3/DSyRncF91GyQbax6WHF3h5/wCR/IRjr0o9G0PhfRcJ05HsXtUhTloS8UhIcq8+/Ygh51YLcskAaIbClWOqhvHdGamnzGbld/qjrCuJ0rNSFPotDkqNSHXkqcZee8RTo/neVYrWeeW5EZRlpthWlLfXVKdg+cfnJSfqGIFVb2VtJbW+ckq0r4vBaGiRy1JMbU63js5Zy9j3GTjJiDDNPlMO4RlTO1GZb8Nvw2ypDV9M2xzH1tE0yVyz1UnDW/0vBet49o+FZlzFlNSKjNuKeM0+AXgDskdANbDleOq2SONXoyvHj/qgY4wlTahUmsa1taW35dIcvMJskgHUgHf6R5drWpbu6uPHk/s3PAeN6U2yahJS7MyyUAJQykWt30I+0d3E5Fq01dlmwxtBx5iKZTT56tSqUMTJbUJdQuVEnawFtY4M/a990dGKIrDzNI8euJGGMUycjjSemZanTKsrnjJschNsyeY0j1a0jJj1ayclIn49ATHD/g5xCkUVily6Zpx1tKpmZZ8qlHe102J+d44uRbw060srS00bFheRw3w3kHJhoJ9gaT5EurBDY5g33MZ4s/aNJind4/8AxbYzpuOMUyLlBlUIYazICmrHOe1hzj0+LXU7laI8bn2A+GOPMXVSUlmcLzhlXXEp8YtkICTqVEm3K+kehy7VwR6c9f2et65wm4N1ClSFBxJR5OkTktLJb9rZT4ZWoD3iq28fMZ+dMz6d2PG57iz8J7jjiZjhzXUvNBIJTMLuHE9EnnE8b8rOS3/RbPhjXpxvGHDvGmD3j/ifDrzbTS8vjJTnbIvuSNr3/SPc/m4uv15VsVt+lHR6pUMP1Viepc0th9t0Oo8NR06ajaLZMdORHprj3iewOCnGqQx86xh/Eji5OvSqVKYeSogTFgNFX0vt1j57mcO2OfT0ceftDaK1xGxRJV5+Vb4f1Wdp0tbxJpkaKVa+gP7Mc18V7SnyTPtsFDxNTcWyLVeorcygZiw/LzBLS2HEjZSbnTf6Rz5aXxw08sz6cV4yUdyn4qp2NJfE8tTH1FthxmVTkeCb+ZYI96401Ed3Ctmy01LWJjGk4olMGcQ6SG0YqTNVCTsplxx4LcSLC4tYd+Z3MaY7zxr7mGGTWRodLor1DVNM1Sn+1yy0kMTBKkraVf3klJ0P1jpvmpLOtG64LxRV5FwSzM5MTsgFBaPbF5wlQ08pGv15xz+ajScbp9P4hSbJSnEDTsk2qyUzKjnaUo8iQLj6R105Plc2TeJtsvMMzTaJiVmG3WHdW3EEkZeu0ddcdJ9y5pyTcar66nTsQPrGuseOvqVp7QBTrfmCZhs5Pe8wuIzxTG9ojJMEQ4HG/EbeQtNveCtD6HnGk1rHxabbIk3vqO3+8R2mPhFtMzekRCWJjRXRIstoHO3fpBGwwNkUB3gqSw6wRADp3g0iSHvE7GX2iAJ949oAVf8AVaAHrABtf0gB6wAdT2gB+IwA3vp84BtRuYJmdhUnN2grMbB70FIglvuINCK37wAK3vAIowAKNu9oBID51uM9o+VfoHc05Lq6QO4UyqgRpeKHdJZZ2i0M7SsZdrKfeOxhtE+k6XzJtY63tFohXyae2+AkqZfActnSQVHMO8fTY/1h8d+S92bbi6vN4fo8xNvOAKCTYX7Ry5M/WXPjx7q8O8TMXPVaozMwt4nMpXO/OPByZJl9ZwOM5TOPe0eZSu0Yw9iuKYMy8vmczG4EUlus2GwFFA1BEWr7ZXlUYgkLth1KblO3aJmNpxWUknOKZWUuHY6xXo6ZlapmW+Sr31vFrR42PZLzuAtZmSA/l8MpObPfYJA1JPIbmLUjyK9noLgbwRen3DijFVNamBT0ocVT5i+VpZUCku/DYjXIfMdjHr04EVrt8t+Q/KzW3SjdMQcUpSk42m6bh5wOYpdR4KqwqX9pXLDLZEvLItoo6AEWSkXvrE8eOttPPmZtHe7s/DqSkcB4daVjOeRVMRzredCZlYIZUoEqSR8StdxrbQxetcWnnXr/AOkfjlXmafhOTksOpeFVfcCXVISCWwRcqTlHl3tFa0xbc+rx8SeB1WnJbDa/8bS7zzylH2ZtzSybEZlE6neOvJlw4Y6rTX/02WnjBkpMP4gxRNsByXc8RkeIEJbA22970jLDkw0nspOO/wDjSZzijVuIVacofDlkKS0uzlQdSMiRfUptudIyyTOWe0tZr4/7NR4+4ZrVNw//ABLEGLp+Zm0BITL+43126GK5MtIjrLfHHk/qseGfFjDM1gmTk6rOSEg622W1Ib8i1K01V/eNOVetv6F6TMum8PqlhlKvFmp5upoWr8pKiFBF9zFePlpi/srbHMQ5zxhwpg3F2LZFTzbeQqUhLiU7JzajXvHNk5k3yda1a4sU/wCuk4Fw7g3DMkuSZqTUo0hsKV+aLKIHeNsFfJfV6s8+SMby3+LDH8rP15FHw3iN1TLCSiYZl3LIKgbDUb3i3H42rEX6uLYD8OexVRm515xbTU0g5c2iTfXXnHr3p4qtYjyPpLK1CXkJGUdl/BQplhKW05QAbczbcx4fJ5NsvqVMeLTlXE3EWBcTVqRwTiCcfcmZp26lNqyZT68wI48eOJ+uuJ6tkxhilng7gSQmcPyK6s0zZtzxF3DabXvrqY2nhVzz/wA2HaZn2rsC8XqHxcafpcxh9hDiGw84lZC8yedge8cvI4mXjx7l24a1n61bizwBw/jSimrYPkWpGryd1BltOQPJ6EDnE8T8lfHPtTLxYlwtrhtxOoUxS6g9Q59hTLwU45LXLiUA3Uqw10AuBHu05NeRHtxdPHL1jh3HmFKhKiTp+LJh0tspDyp4+zuqVl3UFW1Bjwr+Wsu/FWJrs7h2Yw3S5VyTw7V5KZ8d1b8w57SlZKle9vt8ukYZa5ckGKIm2nIeP2BMUVyusVilpQ+1LsBLiQ4QQNwUjn3jt/HZ7YPVjNjmXIZPBmMWZhK2Ka4Jhs2UG1WJ5i5PLWPZnkca/wDaHBO6Ogy7+PmpJEvOU4TKUpCSlKgSB/qjitGJ00s2Git+DTyqSySj5uXkKSSQbna8cOW+KsujairnEdVFfdpZcZf8t3VLN1lJ022v33jt4uHbl5Foum4N4jNSKmpSlzNVaSgqzteJnSoHmCdb9to68uO1fjLFSIWFf4uU6m+K1MT1VqJWFJLOcslCgLgExxUx5LW1Mum9KufU3HGKsUVIKorgl5ZCtUKUbqHUneO61Zw12w8cOhyuPMfUFtpqakZho3SoOIs4hQJ0sOvaMK3tH1WMbe8M8WFTzKU4hkwwFnKJhvUZr6BQ+GOmueI+k43Q0qu2FBwKCgFJINwUnYxrDIoUdt/nGi2hK2+cETANoM5Im0FdhO4gszQCCPgDz15QNhV3iIloTTSNIA9fWIAq1gAUf1gEUYADokQA/DAN/BACmAb+L99YIidlv8oLRGwWy8yQdYIJ0gAVACr34AFa6QAH3j2gBuddbQHz8cT5hyj5V99oSmc2qQIrMmmeDfpEJgSGrRdWyS2gfF06xWnqqutyfk8zky0ymxKnEgd9Y043uyub1D3rw1l/4fgmntKSBZpKlXPaPpMn6Q+J5eWbZdOP8fseKUXqbKuXCQQqxOu3ePE5OXcu7h8Xy39vKOIJ8zLi7XJPUx59o2+swfrCml2vG+UZxVr5faW1LnKLW3MXaVTpaXso7k2gzyGqkwFS6kgA3GsREaVpeYaLUpRTLq7XA3hN2/aZDS3JmcnGpGXl1vzDyw02yyCpal8kpA1UT2EdFcM5E5clMHvb1Pwl4G1bDcv/AIgr84iWqDQWlUsy2l9cqoiylkkFKXEXKTuAbkbR248Xjh8t+T/J/wDp6E4fYZaeweG2SWKWXAZdhTqluzr5VbxFH3lqPInnHZWPPHZ87eZhWt4UwLw4ViHH1VEqKvMIS1Ky6E3WlzYZSfdPUCK1ybnqUmWw4JwIy5h9rHmJ3gufdSpxDjilFKU/ClKCbDfU6mNcnHrjx+nNfk5vN1WODeIFLqlYmmZ6nhclLaqcSyFlxXcnl6WiuOfHj9J5GDJ27NWxriCr4+rUxScIONSQuW1PquAlI7CMf+d7bbVr1hy6t8CuIU8otKxMH0FWb31AHqbE7GPRr4OupWpk1LauBqsU8PZidojOH1zBQoqU/luOccuTN1jdGnKxVu2vGkzXcXTS3K1T2JyXKbOMPLKTltYWPKxjjrybZJ1JxcFauGK/DjiitV5fs5aYYccKkZFk5Uk3AuI7cXOiP0XyT424K4N8ROFtPfq0piCYKwjyJy3Rb+8Y8iv/AJmPkbaDhvEWJcX4mFGqeI/YlrJvMPKACFc7etozjjY7z7dk3VUrg3jFjbFk1Q8P1qcmZQPqaTOFRDTgBtoBHdhw4MX1x5LIvEn8OeO+HkiqtYmcEyH915iDfoSd42teJsxxW7Q0fAbzMviqmszjyGGPaUBTylXA8wH9Yvn1NXTjr7fR3DblGnvZfzTNyoSlKXAbZwemkfPTWLz+yJmatH44YTwiZxjELckXXaSoPJ8EWLxO6SQOUa2yRhj9WuOZs2DBdQwzxSwi1J/wdapdCC26y557KGmulzGd48k9saL38E9XL8G8JcQYV4wPpoMwJaRl0l1OYW8RpRN07DUXiL5PJHXI6K+o7O8zFPq0w+4ZBbIdQFKHmAJFtrdY8qvHjN9aRk6KuUmqxJ1AOziWGG0/5jl7FCvRRO/M2jaJtxf6K2t5HCuPHDlzGz3+LaHMlBYSv2plnTxCk6KSRbT6x6XDzTM+1eRji8enktVcqlLmXm2aq+w6h3KjK4Um9/dsDrHv1xxkh5N5nFPp6S4T1/iliCi+2PJztsICGnppROY20T6d48TJ+P18dXmquqlQ8WV6YW7W8Rykm4j3mWVgW7EjeN8HHtRXy1FR8MzDLyW5WtNPrJ1Up83v2imTFZO6Nknf4tIyvgv05MytKSApvUKH63jCKWq2pakOZ4kwvhuvTC35pmZps44qxcULJJ+m0dWK/hVvSMjaMB4FRhuVD09MNz6XT+Q4hN7n15GOblZrZPiaY4o2jE3DlvE8q1PJk0OPi+e6bZlWtYnnaOLFyckfW+9mcL4ZTQU+0Lk2ZRZ/LCFNpIzDtaN7Z5t9VmNt5U2zVpf2RySCGwAV2b0Uo+nTla0Upb0W+uZY2xBhzC9VXKTCQlLwV5XCBew00GtriO7jY+8sct9Q6LwlxLK4iwvLticDjwTnSc1/J09b2jqw21GmEw3m+W3Ubxvj9TtnLM3YRohilbQWgMFWQAKVBXRORgtEAUde0FyRYCo20EAO0AMAGhEABNoBCd4BtXS/SATbX+sANtzr+zAAR6wAm2oG57wCKNhAAr3f94BvNdPqYBDYdoAFc/XrAJAfP/yqve/1j5OZffbONqP9IrM6NlOYKCb6RKYGlJylWt4urY4Cq5STpY8ozn1VbHG5TsLy6pzEMlKpVqt5I+8dHB92Y8v1D23XK4zhXBbLbisq0ywSnW2uWPZ5mXUPkIrGbM8d48xC9Upl+YW4brUq+seBb95fQcXj9LenNJglxWa5J15xSJ29T5B6VbyDTc6wmWdPcnVAhQHIaxDqrKbK8zvBnkk5MNhbdiLk7xfW2c3irWa1I3t5QCo5U2NyrokC25i9cHYjkQ7vwf4Grwnh6Y4gVaYYka6tr2lt5aR4tLlEgElvNp45BuFbiPSx0ij5vn82/wAb9VMRVSf4X5cL0l2k0BQSlc0q4dU2DdKRfVRJ1Uo6qOpicl9vL/8An9y2/g/iPFgbl5ORlXTMrZEuxNzA8rCVHzOJFraA3HpGtLeGOpyJiraeI2E6XOYiouGW5gvkKExNOWup1Y11PLU7xamLU9nDXPES2/HEhI0fB4VO1f2ZDbeRpnNYBNraj1MRyYtFdKYr2zZO6ow69SaXwzmfYaa2WnEkrms1rm1yb84tMdcO5bTkyZsnRRYCVS6RTXalJzCJkzKitWozIIO14yxeO8bbz8bTNYzlZWizLkwyguLGYKWNUjoDGFtdtQyx49y4FQ/xKTGHcRzsi9S2nZRx1TZe3tcn+8dHEx9Me7u2ePazrVBrFSxHL/xFmktiUdRqoi5N9b29I5u9b5JiFPFajW8acZJHAL6afJNqW+2oKUop93lb7Rhhxzb9kzXzNNxT+IRzGDLNPl5aZmiryuNkkDX0jqtl7/qvXi9XPnuGtYW/M4hn2WpBgpzNpbuSkjUADqeveOuM2KPjTq2vhVxkbwUGZGeZW3+cVpUrp1PrGGTV/jG9CcbuM9X41zDWB8NyTjjTS0pzAklV9DrF75JiyuHDqF/gT8KFHSmUqGJZhQeKkqTLpBNlCxufnGfI5UxVrH6y7XjqfVgHCaFSkky3KSy0lS0qyltI5d44M0Tln9V8cxkLgqvUjiBRUzErZxlAJUlWoN97xHjmkfs1mYxpE5WaBwUork9LspYD6lOBtJuVE9Iy8/W3TG570889mkYHmOIOO8UnHy0iUpoXlaZWLLUnX6x1+PrHbI6K+46utpZmaml55lDbLpUTmvbLbePIpabT6aXx9nIKw/OYzxJM0iXmJttMolTb7gUUpWbjW/PUx6GOaxH7stdE/CsvJy8mrDpceeVIKUl5DoNlpO5SefSOjBMRPplabUj20ln8NOG69jaXxI5RTKSaXlOPoUCEqUNU29dY9vDNph5ufNEz7bnihun0+lzEjh95umU6UaKn5hRCUDTZI5nSOrxa+uCtrS8d1uoYwqFUmZ6kzE7MS7riglSlKCcoNhY8+vzie1aOmtbSuaHWK5Sm2HJysTbDwUR4fhmxPPWKxStl647N2leKE1R3pVTVaM+XVeZtQuEC9rH5xhkxVhaaXh0H/F+H8QSKJPFFGQx7T5W5q2UdlC28effFptW81a5PTlS4XKFWkZ9c7h51xN0OKuWs2tx6RlF6V+t6zN3VaTWHcXYXH+H6wUJKUutPZ8xSon4hzHYxx5smOPjaJ2smWa03ItfxiXYem1DIpbeYt3HxC8csW7NY9rdv2iWp/iKmCELCSsZrEge9YDtFpt1Vn3Lw5+JziJLyXESek2ZaUW/KyqEpecUo+Y31SOR13j2vxk9nNyK+m9/g1xZVJ6jzKppwhEsq6De4y3uoXOv9opNtW0i0PZylBXmT7pF068tLfaO6v9dsZ+l7iNFWd7wWgPWC2iZh+zA0H3RBXQeWtoLRAVawQFR1iwS99YAFfvWARUAF9PWAbP3MAmloBIBs/O/rAYqAGAAnvAArlAATv6QAafLlAIo3+cACvMfnAZAfPoLTHykw+9OtvNJ339dozkSvKrKpKrjn3i0yts6keX1hEmyG2u3SM8k7lFfUti4UtsvY6p/jaBLwJ9BHpcOdOPmzuHXeN2NkPvGny7/5TSLG30hyckTDx+Lgntt5wq9QL7q7rNjHnR7l9BMfrpVIRm9LwTHtJSCkj7REyvFDmS9lcyYiWs+pT5dtKU9+cWqzzfDrjfkGbKSSetkp6nvGlo7SratY9t1wDh+Uw/I/+olck0zq0flUinrbsH5lxeVC1BXIG57gC8ejxa9YeN+Q5NY9Q6hVp5zEErS+H6fFeaanEzVaqFifKTdKewuSLCwAAjXyTGXtR4mWlcnx0jFaqbih6g4EZlxLUtC21JyJIC2k78tj3je01tbtkc/WcZnihj+j4BYFNwi62t1NkJNhZsJ0II9PrGF62i3WUVyWmNS5fhTiJiatYhE3mXNPOKy+JzQDvaw20jSeNipHaxjjU7l09OF65jmTnaliaqLalZZq6Ws2gA5m8Z9K/wCL6c8/xBiDE0nK4Joj6kSLUypteRWriL2uRGtKf+kTbq3HEGF57h/S2ZhM4SHynS9rEDpGeSnX6mmXtk7NxYoK67hdc048nI40PLYb2jKONTJ9TbL1ydnjXHlP/wAN4zcp6XkKYXMJVyOt/wB7xvx7enVa3V7N4Z42pdPwrKs+CnOqXAVmtYafaK3z+KduLJj8rk3EDhy1jStGqJqRaDjmZQTsRe/9Y5ceeMbav/Kera+HfD7CuHao0qpFpbNhqoDU8464y1ytctOkdm8Y1nME+Cim01tt5biVHLZPptGfKriif0Y4IzRHt5zrnBuqVqoqelUltpw3G/lAN7CM6ZaUj9nTWt5n26Lg6h4K4Z0xFbrACKlLXVmUm1wefc+sP5Fci2tOm4F4gq4hvIfk0oYlEmxc0BPfaKTjizky12s+MVDps9heZkJyaDjam9BmABPK/wA4tmjxZd1RxLUuj8DeHrdBwoJZUyFLfPiKKVDypik/976s05OSmNqX4isG4rr07TV0WV9oYlHEqOU3BseYjLHhx4bdolrgyd/rqWE3pp/D8jKuUsSy5dkJUhKbEKA30HWMZyTbLuGmaKw57W8QYzwzjKbblZJM5TphObJstKudvWMvHqVr6yGGa9Mzin3hRF01azaxTqs/2jS9+sK1pFU5DKnpVdRDgMwhNlJSQCRfnHXw/wBnNnjcL2exYhWHyxmLCwwVe9qLi1/tHv4LeN4+XHO3iHiZxSqONuMtM4f02YWiiU9xKZlLK9HVbqzX3i3K5ERDq43GmZeg6bh+lpl2WfY2sgSMqQnQa6XA5x5tcvaXfavihYv8PaTUEqTNMtL8UeW6QLH5R6VIck5OjVJ7hRRR47KZZPipGYZU20HeF6kW8jjHE6oYtpsnNyLUiubp6GwEJQbONqSfeBGoHYRzTqV/HFmi4C41VDEjc1w/xEQttTZbQpw+dI2HztHNf06ceKKtp4NcW5ng1ip7D+Jluv0h1WVDhNwE3uLekceam0y9W0bj1hGtPNyEnKzamH0nw1LBIH8tu8c1cKk201bE2JOIlPxFMVTDHgzdJ8MOIlX0jOi+itbXuDrvHVbBSfhFtvM/GThzUMV4kYxOqVdln5x1QmZd65KRyKb8t4vTJ4fjSIdL4PrlcE16i8PpGlvTk3VpFUw57M2bMoVceIsnZJ0HqRG32WFp29mJ8raG/EQS2hKfKTY2ABIPyjqxTpjoaVbR0dk6KvYRWUbZFgHW0AKtYAFwAnYQA76wGZrbxYAowALWnlp84pAAnUxpEgCr62iAJI6wAqUD8VoBL9IAb9TeAFStoAT2gAUdvvAAowAnnAIowAf3gEJVygPnu3311j5e0Pv9GZ1LmUFkkHlGM/TSZIqcU0nxLgp313iJVWCVC2sIEd54pV5VEfOImFp+rnh/UPYcQImkkAtlRJv6R0Yr9WOfH2guN8QLqFQdc8TRdyde8c+XJMo4uCNbaQ47mV5tbnTWIxe3RMe9HWlZR5tb6iNJIro7mBUOlrRjMrx6SG/XnEyX+pjKxoOf3i1Wd/cNtwHQf8T1lDM5ZdOk1JcmRmyE2N0tg23JBuf5bx3cenaXl83LbHTboeIa5LyuJsJ1+ZpYmKQ2mZqNPkGxkQ4UkttTCx/8ebypSeSc3OPTjH1h8xE25N9S61huiSdPwWKlNOJXVa2kzUyUJ2UVH7WOnaMuRMRTtiKbp9V1PwjWmZSZxhPTzoQE5QkrV+W1ySOnpGHW1sfbItbNEtfb4WzHERc7iOsVBxpgpOXzWslIuk2jfBjy5Y72R5KzOobFwiwbTaAgIebGrpzLIsopB2v3hOWt56WU5EajcKrjFjaflJycodBZIaeSUHw7+7bY25XjCMV6/W+GvdzjhPXjhnFXtE4DcAeMpw+W42AEdNMvX61ycd1DG2L3eJ87J02RSGky69FA6G3/AJjjycjyfGUcfpTsjYjxrU6LImiycxeYCQ2lptV82ltBGUWtX4vHG8mPs8qcSsN4qw7iZGIMXSTqWJh1LqEpWcpFwbEfOO+a+OdLzTu3WvfiOafkpKTw7TxJMJaDThSbWKRa/wBYzz4e8bXrjirauG/GicxI0xSZiRSh1nQrT7zlzoTHNk4klsPeeyVxUxzVKC14zbxbdScoSom9vSKUpbG16xljqouBmMnMRY0VPYhqmcIAASpRA9I6IrTDP7mSLRX09dVCqYYVKo9lRZ0AKGVQsDaGbxZY/VwRXLM+nHOM0w5PUUy0i2jMghxd1DYb/KPM4uO0y7rQ5twr4kYroc6WafT3X2CoqNkkBIB5aR6vWawwtXbqWIafxJ4vLZl5N9FOkiPOFE3V0vGOC277spWMXHWVHxpXuD2Sg4mnFvpaTlSpJJ0HSMMl95tVbxjxcluuGPxC4Xqku4lWcqzHN4iTpHPGHJGPtMp8Pj+Nuo/GTC71lSU00666rLkBFyekXxZK46blhfBbL8T5ZdOqNVmJytKbyOjM3l0sDunvHPXN2le1Jo5rjzFLGGZwOPOobkphRQ0SPdTfcnrGmWNwtSJs0+r1yYkm3HJOZUpK05syVaFKhvHXxbdEzj20l7Fk7VZaanUTbi1SzC2A2F6C3xfO32j1cWXs48mCHmLhzhxzE+Kqtih6qOy8zKzbnh2J8ys2xPSMuZaYb4Zirsbf4jMRcMZqap+IMGTNcYlAlzxpcEgNgamOfjfsvlju3rAP40uDuMlmVrKncPTCElTZeFwe149ulnm5cfZ0SarVPrkr/HsOV6WnJfw82Zl0EkEcxGlpZ0jo5LiacVMeK3kSGrlKiFDUR5HJy+N6PHwzLhjGFaArjdLNsJPgzMkp5eQ2IcB0vE8afMvnrNG68QuGrcwpmbZlVLSEeGXEnUX1tF70cWLL2dS4SyNKw7T2ETmR0iyGisXy22Ue8ZaiHV026S/iTDtQcQmVSQtBupShZBUNSB6xxWran0immtViXbxG0FTiEoWXwE5hoQPdsextGmOO/wBZZMnVfcMeEw/9Q6txLql0+EhFKpqUkhKmUJBU581nT0j0K0ZVnbtSr+52te3Lf9Y6K10tMFT+kViyJF0jWGcyxW0WSDke8AMAHP7wCKgB5C8AKtYAFnTTSAbVb7QAKPzvEbAZu+sXAqtlN+kAkAJKfnAJr/MYACf1gAv0EAijy5nWABR6QAq09YATzvACReAwqgPn1l0sNI+SfoAQnNZsm5Gt4CUynKQehiJUqeccypMZyWQZpw5/KbRWGtKnKJNeCp5aVG6b6315RtCmWqsqU/4kws5jbbeKq0qhtqzqG+kWh0xCYOW+sVQeSLWUbWtFLCS2pKkXFt4jW/atvcpEqh151DDIzqWfKke8pd9h2i/TuvaesO3SNH/wnwrZkZWaCMSV9QCG0aqu4rKLjcBKMxvyvHuYLdavjvyNu9lxiSk+JW6fL1RoGppWn2oqXZDEqhKQ22nkLAAEdYY8nS23nWnddNxxVxSwbgOpLpUwpUzllhfKfKlZFwkBMVyU8s9lfFtW1DjdRXMOOyAnEFhaQ4lkHzKUfhMRb946qzx5ScP8QpCpS1OokrMLabn1JQ4baJFwClR5aR0cfH0Uy7qvsfV+VwyUfwsqWAlIKW9Re28c3MjsthnsSm0mjvYUOIKiAmZfSpRKx5gOUa0pjpH1ecX7vP8AiKXVXMTJkqLdsLVbxAbDfnaMZmJn09WJ6UdAnKDUuHuH1VBU2C6horDg1+Em32jlyYtMoy+eXnCl8cqwnGzGIKu94stLLUktpuOehjq436tsuLdVtx141yvFNuSp9GkylDQGfTUq00H0+8a5Z/Zz8ak19tSwfwrr9eyqnGzLS6rkpVzBN4pmz9auibxadOxYLwSnBU0mebezr8qUlRvtHJfkWiFJtqep+tYNrXEqvOuTM0tICyU5bm45Q49rZJa2t/Gjs1PFXDfE3DNSqtJuaJspQVcG1r6xryLzht1lSOR5BYU/EFWGZRbNUUFrSMqPMTb1hbDE17Si2PsuabNYq4kTbdUfqRakiot+E24oXT0I2OkZ4sFKfWn7Vh6dwNgeiyVBaU2lsL8PKoqSLmw9I7oxUs8jl5rxKrqnEpjh64fMQsA5UpN80eJfJM5ezupwoyRtXU6qM8QpgYgrdLDjQIs2sAWTfU6xvXPNbdlq4a450f8A4ThWTNQp8hSZZLlQGVoKKbpJHLTSOn+TDLJE2xqXCfBPElKrbVQnJptEulXiIQhV9zpGN8vZrhv0xt9xnjKn4alUPVSZsuXN0gHUkf1jyb1l0Ut5HmP8QfFuqYhZlaXTWZlEoQHVrebKOtrH5x3cbD2hXLpsWCMXTeJMDsuKbzuyzXhuJG+gtHVavRSv9WvMTM5hjEAZnWyiRqSALqOgJvuPnHThvtw3ruXOcOzCcH4yrNHeUlpEw+ZqX5JcCu0Wz/tDbF6dWl6vTy5nck2ptp5AbeStN0uJI1SRbbWOXjx1l0W9qXEH4Y+A+N6bNVim1Kcw3UgkgsS7gWyonmEK2vzAj36dYeVpzOXwHxG4Iyi6zg/iBLVeTaul2nkLGdO3u3tpz7xjlzVhrSm2i4o40cRnlKTOMCSLhJ8qSL36HeOeuOMkNJ9Nt/DrLVXEWJp7FFUUqYeDPgNqUTcKPK5jTFSMcua9nqqWpLysP+zzKPFWlJUrnZUTljupjq1psKpgW3MXyOHRF9RHn2r1l2xXTaKFlVKmV8FYBJLXiai/X1ik37J0slTbKZFcvPEl1gFKLG5zHaNKVNu1YCnlTmFZJpVm1sN5FN7aX0juxfHPMth7X2jSv1SS/SNEFO0AHvW7RMBFbxYINoAN9YBFQDauQgAUdfnAAdbQAKgA6coAfi6REAY0iQiogJANnXntACVfaAE8hACfdPU6wDd/KVHvAZzJgAVrAIqAGwgPAbidY+SfoAfDtrpAOJVtrziJUqJxV7xnJZWVBzKo6626xnEt8cobc97PLuJB1MbQZFQqa8Q3vzvApVMl3BoTzi0NtLBKh5f7xSETA0q1HSEszqXNk7CLUjddqbbNhOnh9VQrK7BFGlfac2QmylKslN+/mjr4VO9tOLl5ppDpeA01aoY1YxtiRnw5KkJQ+hlVwUoy3QAO/wDWO+kf4+UyX7+5dJ4iSaJTBNUxTPrtP1JKXmEEWJKj/S+sUy06+3NWdzp5jnJ6UVSqlOVaem3Kn4yES6QLoUgGy1X7Wi1L9Z6u2lVtMcOKyzw3leIXjZEOuFSWb6hvkY6MmLxx2WtqEnA/GWRoNFXIzrYWJZWdteUXzHU67xh5tInjxkbvQeNlBxLS5qnzagzUFzSUs+JuQdrRWf8Aor/H8basfV6oYao7Dk05eXLBsq+lrX2jithyUj6Yv2u4ZhnitTVYkL8xYAHMlXKw30i3HiZn27uRTVFvxe/ECqtUM0WhqC1utlsD7GOjJ7c+DF4424rSeHuJq4FPty+SWPmLnQf+YnH6a1y9p06DwN4fSa8UKTXlNv8AhHKkK53vf9BCZ7WazTrj29A4wplPw4hHsORtJQLJHKMuXT9Xm8e/bJpqkxiaXmGmZdtQLjavNpHnxnreHo1xd57NtwbWJKjzBnJ0kJXqn1jfByq45V5FfNHVTcZ8fUmdkVSzjbaitOVKlHU3Gl4nkZ45Nu0MeNgcu4W8GJfFjjtUdTdtRKkJSdACY6abyV6ujJPR2Ch4Bl8FzKWZe6P9BNwTHk5sl6FOTW7otPrrkpJGV1yHfUx0cbNezm5GOl3GsWT7lc4hS1NTNJdaSPEXpGeOYvXbvwYprjmXoOjyFHlqA23LqAWEJvHozgjxdnh3ta2SYebsdP4umOIwl8O+OpCHE3Un3U6x5czMPWph7Y3faRiioUqnoeqD6y82hOYLGmg1hEubPTpjebuIXEZ7iTxXkcNy0yGpeUezOkaA2N7R1YsEZF8f/Om3cMTYUwZVMNtMzjMo6+tAZStSblOls1vWOi0eBxxyJvfTzTQa4nhJjSo4ffmDN08qIVlXcAE3FhyitJ8rsj4scUY4peI5B32MzD6mE3lzl1BF9BprHTGPowiu5aJ7VL48lW2Zhz2GtyAKm3FCyiAfdUOhjelO0J+LGl4knKSf4dWGFyr1rEKOnqD0NrxhOPrLSvtsrOIKa+xZ6duQnS17mN62tLlvTSuexVS5eXWlTwKjeyTrz/ZjnzVmVsbmmMnpHEZEkyyHpx9SUpbbGqbm2aNePMxC2Wuod84P4RkcD4YabmXGkTCxnczb3trfvHR1m8vPtDb044kZtf8AB6Y4XQr/ADHgdB2jkz5+jrw1N1JTXghKnGXXAbkrNjHFGbyOm1dBTjFlttSXp5DD7TZtYeUG3lv2va8Xw13KLRpZ4Rry8WUoOVRxkz2dWQtDRSQbAx6Vaahy2nTtnC2qCcbqUjpeTLaD12i2FhEt86d9Y3p9Xj2O4iygb36wCK2iYA/1iwRUAJ2gAUq8A2T89dIAFH7mAFX71gBVtAJAN+aAD4j6RGwiv6xcCowA+7ANp94wA/2gBOvygAPP0gMVADp9YBFQCQHgZbbb3ePkn3ptxKW0nKd4LQjsuZb7CFpZ1qV6aSlJ5xz2hvWqiqk8nPpuYvWqVRNTmVsp6mLzVbaC1NKVFOqYlZSsxqnnE6WW7L2YRS5vSQ258PXvCjO0nisZbZhYXUNegjon97Ix2mtJ29JcH8Esu4JllVFKCmqJzOpCSFFOYAZjz0At2j2+Nj1V8h+V5Or+l1jyfkJXDdUmJRXhLqtYEinwzoG2khKUkcx3i00ebjma1XWKaMrE2GkStayqLdPIbQnUJVplUIynHtGLPMWef8bcJapI4FOJnJp1cyhRS8Fm6igGwselrQvPhs78OTcHmMSVytcHUYaZkXFqlEeGjX308yYx5WbyVRaNy4O2JhTglVZkILhSpNjYEc4Uu6LVbBj7DctgSvSCaLVRPEsNzRVmB8NdgcunSLWttWMbc57HOIuLyqVhJtSWmfADjqkm5uBse+kTmp56aRgwVwQoqpwvdwxUQ2JpXjNqSXMwICkE7axXv/FxdXRXJ2n0qcRz9Lq+LpaVZpbcoy0lMs4AofmqTbzH6xNbxkResvSmHVYfkMJplFMhLvh5UpSb2FotMRVx3rZzSuTf+HZpVak3ighSlBPW1uUeZH6O7057jPjVXqxKhhtwotey+Y1jrxx3RuEDDVerjxM94y3QTmVY2ChpFcmLrLWsRp1Si16tV5yVmHm/BYk0khOa5McWfJ1grSsy1fFtPqtSqi1PvKLTqSU5vdSN44cWSIn06q20tsC8am8BqNOeezlI8NSkjQ2j1cWadenDyeP5W+ynFhnFk+xMe2FDalBKUdT1jLPSctlMPHjj1bJjHFU1SaKH0SrygWzkLZIi1sM0qUiMlnm+m8R5in4tNXfSQS4b36Q4+Pqm1Oz0Bhfj3h2ottSZqCA8sZA3l5nS33iORLP+Lt1DDkvRZzNOPNNIeWnOlSRqYjiUi0OfkZLRLlX4heJSMI0pUjTVLMxNKLaLHXXT9ItlxxEunBq8e3D6Xw9xdR6e1xGl6khD4R46kqFyUncRtqIjSY6y6VJY4xpiLArb0jTUtzABV4hO++w6xlSkb2rbrDzlVapVZ6vzTk8lwzS3ilzfMVbWJj0qVrCnT/XaOGeHXabJpfrEutK30+UKubg9ozy9Fu3+LPHWDKDUmfasPvWqYAsG0kFKhyJtCt3PSHM5ioYsSlVNxRh8T7THxNg+KOV72jSc2mk4eypLdNeUr2WpTsos7tuJJy9tov5IU8RkUunqcCp7FDuS/mQ22oEj1tDvtPjX9FrmH8MLP+GKGqbnDvNPAlfoDE/yIqmONFmwM1bHmLEuMuXkZdYPu7q/0mML8vbSMMY06SpuIaK0HEhLq9kZTYgxxWtMrRMBWvFTzwmJpTiXb+7m0EKzMK2mDH+DcXVp55+YmiMxORIudOkb+GVI5ES7Dwto0/RpEJm1XWPKOREdWLHLmy5Nu88KZcS/tc2NPbDdXcg8o1rVlOTbo9+V7ER01UmdsiyCX78+sAP9IIkJVl+cFSZri8TAA/vWLLgVr+kABNvN1gAJ1vAJ0gBUYDIBtO0AH9oAVak9osAVue0AN/tACo6CATYQAE/aAHleAFW5+UAlxADzPaAyA+fCJzw9Bz0j4996x6ZSB+9YLQhOTiArS1+UTM7XrVAmahv5hf1jOY23rVWuS8y82ucVcpTptHRWrn2pZiZzqOZQA29TGk1V2ZbfyqA66Rl1WiVzJqAAUFXvEaaxK1ZWcvlsdYyumUpCtAFKAudNd4UWrj2vcMYfnMT1hmkyKQQbKfctdLScwuVHZIO2vMx2cWva3t5/MzxhpOnsigttyNHZp7JAEs2htCb6i2lrdo+i6xWr4rkZIz3nahnMHy38PdRUXitEvPe3ITf4b+ZIjKzKM0dWzuTUjMJzS7iChaBlAVqE20+0TSsSyw2i1mo4sb9uw0/SXmQ60UqGVOmxuI4+ZXtZ34Y1ChwlhCVpUpM+1JsmbbAbSrQIVzMY+H9UWyalosjwqp6p6bmHGSpHtC1WWCAArciMIb+Zo89hzC1H4pN0+uzRfp77aibqHlUdvlGsRttXITCTuH8H8T516nBSpJZSGDy2OoMXjJ0ydUzitp1DGSZDFMr7Y3lzNnNmvfXlHNy58l+rPHbpPtxnidgdylU4YiZUhopX4hUhNzoQcwt6QpSaOnzRLUmuL1d/hOZE8C+0opSNiU30Ue5jXU3TusnsL8TQqsH/ABckuyzqMqlb5SQdbfSJ8XZSaS0GrTUl/GphTDqlSzj58M30KSbn00i9Y8ak1l6CwnRcN1xuSbpTfhNFlIcHU84re3eUTaYh0mRwpJUaVdU0StOXy6XEc2bj9oZ48tttRxFOSgeMq/kstOVKgoaaR41eNNJ9vVxfs53K8Of45VzLtOXK1lebfTpHp4LxWPZmyeNu9NwO3g+cYmVOEBpQzBWoHy5CNZyxWzLHvPVv+MsXU5/Bp8NIWW2zpf8ASNc2eJq5YpOKzyhSK8yvFgnK1LJfaLnlbToIvFdOv46ZReE01iCqPYkpc0JNlCw82hOltb2+0cmWu2F+R0bXQuNFZoT79DmmVqXJXRnym6gOcTjpOOEZcdcs+nIuKPEuexviNhc03lYlnE2Snc6i8a0xzln2mOPNI9O1V7ithSV4fS1Hl3EA+zhCkBIJUbRTNSYnTlpitIqFxd4fUnBKfGmgl1LeUNiwVfsN42rhnW1cmK0OT4L/AIdjbiUueel0ssqeLiUqVYK6Eg84TjtDsp7pt3LGVbpuF5uVkZ15DK3Upym4IA0t+scuSl3NT9rtypkrQ5ii52cjr76AUvJ62icV5kmOrVZzD09TUFM1JJWH1E5wDcCL3lpTIirwnh2XSZlVLSVPpuouNn3udjGUZpmURfbhmOGpeTxAWWVeCkj3cpt6Wjuwz2heI23vCdDkZ6iJqDy2/E0SQluxAjnv7UtacbpuHKK1NBhuVl0FqXRlPLMSNdecXx4O7ntlmzZZfB1JyeJP5Lq9xKVAkR304kS47cmYRXsGyLOeYTT5l1sKBzeGojfraL24cQrHJmWJUGSW5GjveY5R+WoG5+W8XtSF4bRSsI1Obaamqk8iTYuFFP8AzCPlGmOrHJaXRsMtBuoSVPp7g8CVbW6s31JNwPuYt1VrO29X0So3Klan5RVvWNiUbCLoD6wAq06iCJDf+YwVCo6domAJ1vFlwqPmgAUr9/OABWijm0HKAQqgB7wAqPNMAJIG28ACtAf7wAK/WLAVaDXrAD8MABPPlygB968AKtfmIBFG0APc6QAk32gMgEzD1gPnQqbT2EfHTd+jdESZn1a9R3hFjoq3Zp5ZOVRudorWrSK6EzJTD5usqF9otNV4vENwodFTMU9bDgvnBTGtYefmlrtf4cTsmDMSThcB1PMCNGePJ1aPONvyqvCeQUrSrpaKTDamRKkajlUlClAn12i9aNfK2aVmkqQPMLaX1jG9OjTr5JTGT47qG5chTizlSN9TtEVxzdbJkjBD0ZhLB8xgeTptGel0Gp1Jxh+aUUWUgKUCEqPIBI1t1EejxsfXL43xv5Dmeb46+yrJNZU38+W91XIJG1/l9o9WLav43jzaZFUHEzDKkKta+U90ncxXLRz0qpFK9lQPBVaybW6DlFKfq16mZ6cbWwttSRYjfrEZLa+NK1VTdYC2ywrQt6AX1tGEci9fjpr6MN1BplLycoUFgq9dIfF3k7jP7VL4yfmEvO3WOpAAJ2BjG99OzDb004vViXZTWWQ+psKCPECiQCNxf0isV01rEO1YDxc/PUNDL+dYCQD1V0Mc2Wu1b44lWY3xtM1ulTmHUyalhsZE2GoHWJjNafrKI04RUJBUq+ptTaiANAbgCPQwzWY9tIlIqFUM+1LtplUMlhsIJTe6zzJitp9hzDlLdq1ZlpNKkgLUM2YXtrC/wehcMUV+gv8As7DxACQrNyvtYfSOfFbSmaOzc1Ygm0SqmfF8wTbzHeLZb7ZY6ac1xNMTVQu4VAlsk/lnb1jy7U36ejjvpU0fiTL4YV4zjxW8DbSOnj4Jr7ZZp7I2OuLz2IqewmmrUh1aj4mUm9hteOq1WOLB4VnTahXMRYPTIqWUOOpKQrmT0jC1W1p7Oc13BNcwbNMTlTbQUFzMFX0Ijecs2rpnTJNvr0Hwxx1KzFFYbbZCXFDw3Lg2PePOnJbHbbPLStvrZF4foU5MOT38PbDjnvqy3vHfTH569mUXc+mODdFqGIpmbeWGmnL5E7C8Rht+3VrGRpeJOFtQVPOSNJSH0IBAzKJIitc2iMmlHhPhHVqxXPY55stSUsrK5dR82ovHVTkItm06Li7huzhlUvUMEtn2hCQV2UdCBHJOe1v2lasRkW+DMBzXEB1ur41mFKdaGRtOc20/8CEZf5P6ytMRjdPlWZXCzaJeXUkpYFsylmwEcWe9sV9s5nyHJPHlNrk3/DUTyFrSrKpOhAPrHdTkTmppnOLTZZqlU+clR7UtCCBdJB2EWngS5pvNHNOJVJwYzJlbiErcCRbKAdR33jbHx+jXHkm7SV8VsIYbpRkZeRK3QkflnrF5wQ2vWbfWoT3H/ESkqRQ5cSLRJvl1No1x1iqleJFvrZOGvH+cw+4qar2SbfWTkdeSSE/KKznmZ2wvw4lvNQ/Epi3GCUSNHkylCSAp2wCVa8tItk5UzGla8OIdKwVWH3JAPT5JeULrzJEWr6YZI9rGtYycbUiVbUkp2Kc19O9o6a5NKzHp1nh7T3GqK1VJrMh2ZbCQkp3Te4PpFu+zWm25um0Pq0ToUWQQqgB0+kAGa+yoAVcu8AhGkXAdYBPiMA25+9YAdPpAIoxWAP8AaLBu/O8AJO56QAnn0gB/pFgKvWAFW0APw+sAP6CADT6QCKgEgAXuIDID5oqRNL2Qox8RL9LS5OizU37za7HntGlYGz0nCKUgLU3cjUR0Vq5rZl2rCoSkLyAACJmrC2aU2m032ZJTlsSesKq2nssnJVtxGVSQR31jSYYTGmj4owTK1ILcS2lCjciwtaKzGlqy5TVsIz9KcUplK12JtYg7Qi2lptKDK1iYlVBp+6Dmsc2n3iY/6S1x8jq9L/hv4YzGJXpfGFWk1iUWoeyhwWCkpNy5Y62uMouNdxprHfhwRWHj/lOdMfHpCqMy8xPNTLzaFPNJVmtyKttewFo2pXWTyPBxW8kblWOPFt4/mBAOQpurW4JH30+saf8A2eRG4iWTE9lZKc2sa9uylaqeanN9TcpsPWM7elphW+15Q4lTlyfd33jGI/8AbWKq5x1KnFuZrFW2l40jpH1aEJ6ey+UKPfpGVY2tLTOI2FZHEkg45LoSJsDMhWXc2jlzVbY7ODuV2q4ao05hOdpwdlnHCpJUjVKr73ivfbeImGwcI8TStNmHJWcbV4RGqt7dvnE9ex7bNLzWHZ/Ekw9R1FUwVEFlWyuu4t0it6x/isTs1WMCy9cbdnFpSy+CpSUhOxiK1t/jSIcXq1LqVPmHZOoN2IUcqraW+Xyjov8ARs3C2lvOVFcwlX+XYp01JtC0+h2puc8NgKUr80jzdRHL8REdkOYnnPDdSlZKym6RET7axSIc8xFXPZGVsvZ0uLBGyt/kIxt/fSY9NEo9EqVem1KaAyElV1dI9C36U2nr2b1h/ArMlMImJmzpBzKTbQRyWzNLz2dJkEySPBaZbDYTqE2tGFszGY0oeMUvO1+Rl2JVoENEBShYWjScsVtpWJifja8AU2RpWGZdsoSHwjMtW5Jt0jacNclduTNEz8bImqBCQlCrj6Rtht4a9VepoTCnFlSr2O8Vpj1bstFQyri5OYU+0lBK73Khc+kVtg0yiUinNy6Zh2ZyoQt26lC1rmFcSto2mrLBUovNhYykBMXzdI/WF8czVlFl3JVJalElKVqJTytHLGPw/tC15my2mKD/ABBlyVnMyg8kpN9LHrGtsVeR7Z+To4/jejzOC6jLfwmWKALFTybkHzHfvoIUxRi9OzFbyLym4zxDiSX9ll3EMlCcqlZrXtzj1seWLML1i7WsTUnEj+VEu2p9a1Wz3uB3ima+kViKK6m8G5qcfFUrU8nxFjVKBvGETMr35MT8DXuENOZZPskwQo/UxlkmYKZZn4h4f4V09t8zVUmS8hGyQYtiiLQpOSXRKRLU+kpyycugN7hOXWLVpFp0r5JhuFJqVWqD7NNpcotczMqShttIuVKUbAfUx0OS/wBdi4c8GZyTnlVfGyUAMkKalQq5KjrdVr6dt4t1WmPTsWbMmybZQAAm1glI0CUiNIqiY0JObltF49Mp9FzH7xZLP3vABfeAEaX6wCX2vAIVZtouBJsOsV2AUdL9dYbAKOZIhsCDaGwPxQgCdfTvFgG/pAB/aARRgAOx1iwHb1gB+kAhtygAVon5QAK0vAZACowCQAqV2gPGcvg2Ub1sCB2j5GML7n+RKyl6DKosG27A/wCm0XjEfyJWTNLZbT7gFo06qbE/LtqTkSkWtrDqbV6pfKvygW15xGlpYpJTt16xrSWcwjvtpc8uQaxWzOfSjnqKw4r/AC063BuNIxtGyLKyi8HJXGtcYk0y5LRV4j6suiW/iv67R08bFOS23Pys8YqaevMK0mUw3QmpGUBaQwlLbaf/AI0JSMqQOn949y0da6fK5M3e+1dOTnjTS03AUQVaCw7xjMaRj9KaozTqmz4KkIWFJzZk3uAb6dNIr203mdoE1OJKleYgE3HaI7LdVXMzozeVRAHyh2T1VsxOZgVNqNvpGPdrFVb7W4p1wOPlYJ8uUZYd09TE1OJHlUo6bd4p3WiiC5UErulwkgDUDeHdrFFFWqdR6xKuSs/JoUlaSkqy2UOhB9Y5oo17banQcFpoU28qRmG1tOpyqbdRfQc79Y0iFtGHsJOUuuorlDeDBR5nG1G+Y3F7RGhuaZ5bv51sql6q1uD105Q0K2fotHq1zOSqVrJ1NrEdYRIOnUSl0fM5TWQ2oaDuIrZMSV5SVA5kXN9dYrNSIMNuMtzCHlAC4y9dozm3VpEGq3huXrEuVKY98k5iLbRneO/7rfZ2osO0oycy4ylvI0FEBVoy/leT9Fss7jTYHJhqXcc2Nhy1vEz+zOrTqrjJ6RqjTSXAlGax81hF68eZJhuSpx6rUVUwytJvqDe8R4epN8eM/hNualZNxc1Mla3TfLfQCOvFPVz3vjyNgbcVoU207xpEM/iQ3MZrpVoOcJg2JIczeIl1IA/1axnuVJnZxE0lxweImxGt084blWZTlT6khHhsApJ1N72i8QmLJ9PqTbdkuOlJvmTlTcgxtCtq7bQzVjNNo9qslQ2V1Eb0ttlaukHEDFNqDK5eZS24habjS5vGWWnZak6aoxQqfJ2TJyyUH+bNaJpXStsm05LbEunzKuBuM2kWtC1LIc5UmUoIl02A2HQesVtCI9KGcmlKOZdlE62veEQvFkVLYsQnY7wnGrNj3/Dt3U8+G2hcEqNrWBJF+WghH6qTLqPA+iIxRW5KaU4tlsrM0hOcpWGGkpIykanMSkG21z0jSvtWXqM2NsqRbRI1OiQN+57mOmvpnIwNouqw2gMzfWASAEq7wA/S8AO41gEUqAFUACvdt9IAOnSAH/ugBUrXtACb84uAUbbQCdfSAA79rwA36esWAfFAYraAHffnACrYQDat4BFesAkAijADp2gPNLfh/wAul4+dfaejy0NpTmSk2MTs9GlX5J7xXa2jKk5r8/6w2aRXGfNflGcoMKSLm94tURlNi9xbSI+omNor4Sq/IAFXraGiKOvcJ8My9KwyaxONLL8+pSkqBIIbSfKm3QnWPc42CKRt8vz803nTZqxVkstXSVXWPkDGsz3nTzPHqNtTZqniT3ncF8qk76RhMuu1NItRmjfOknKPejGWlK7Uz9RSu5Sskc9doz7S3iqtmJ3xLgr0Gm8O0p6q1+fyulu5sBffeM1+qvmJ/KfEQokHvBMVQXKgd8wJGo1ii0Ihm1XLmbUajWDWDD04kglwkH7RaVumkVU8rMVJ1IGmttIzm2logKagld1FaSNjrEdiKhE8ym/56AAb6qtYesOy8UB/H6YlWVVRlwR/9xMVrJ0EnEdLUrJ/EGNf/uJH9YtKvU4qflXv8maYV6OJP6RETsiAycmKtVJdlLqcgUM/mv8AS0YZIaRDcKxLvNSJlZdsBCUnzdwYztbpTqri9xtqU/MMyOVvOi6gM29r9L2jgw4+t+yu9zpq2JZxxhlb0ncnLdXQR6WKvsq5k9OOTswfG8+ZWZOsd9dQ0mHTcGpnJWX9ibWtdtch2AjC87Y5a47NylnMlvKbcoUjbCtcdU9Exlt5vvG1VJGJrw0qVqdLxpMM5kDbxcspSlJBufSK7hEymy7qcp81rgjUw3ColT5ZT4YUQBt3iIhMxpYSNQlHGylSDnAHmiy1ZWrNSCU5VKzdNdo0p6UuSZqHhtlwFJ+esaK1jasVWM1zmCT01iN6Z+NWzlQmHlFPiED13iu1ojRhLiiAm5sNN4aTJkozOFQVaxMaVhSbaSU5W0lSrGw1trEb2mIBS201qYXKuPBcoy4UvkJy5lb+GNwQNlH9YxuvFXozgG3LprE2ElCVJp+VpkJ9xIUASOlwBGuL2yl2rp/eOn4zkXu3MXVJe8BkAJV0gB92AH1gBzfKAQn5/OAEm/aABX6QAfpACTsIASbbQAG/8wi4yABStxAASIBDt2iwFO0RsApX2hsIpUSB2tzgB+2kAO9zACVQAlVu5/WATMYDy23Nf/cj5vs+56Jbc6lTeVRsR3h2OoVTGoF9DoYgmGNuJUr3tAYKzGxLSlQ3EFUN5OW94CGrXN2iKz6XDIya6lUpSnsoJU+6EegJFz9P1jXFj7S57307zVp9umyMvS5WyWpdpLSUjllFo974+SyT5rNOrFU/4cp8S4SddYwvZrGPUNWZq6GZ5GVSSFq67XjjjI6rYolZ1B9asybgBSbmE22p4+rWJp1LSjlzAjXfT5xja+21aq56eS6k7hQ315xWLpmqrmp1SbE3JG+u8T3TEK9ycUgnykggkAmxI6iHdeKK1yfGU3SRpf3gYp2X8UKyYq+ZRSHCPnDe1vHCmqGKlSoKFOggb3OsafWnVqtW4mPMrLcuyHLaaq0v1h02dWtv46xVOqUlqcTLIO4bTckdLmL9alo6IjMxNzzgbfmph4E3UpxxVh8hFJiFqVm67kaWV+7cgdRe8c/Z3140JiqWwElLrYJOo01h2a/x4RnKe4FBLLrrYGvlURf92inb/F44tdbdx/DxgMVZL2KJp6ZcVLOKl2WsxIsE3UpQ59o3xUn68bm38E6dUxMzKyKjLZkgKQVBJVra23reObkbc/GzxMOM12kT7Ly3VzYWwpRUlPJPaOSlph1xPaUNxozlOXJLLS3FjL5Qb29IvfJq6ZppqzOA1e1B2xCWjdKdbmO7ybozm/VtNNTOyKczLYBIIJ5xEM7Su5V8+CFKUADv2EbQ57QdlZxLzikZsoRtfY+kWorZYM5FKH5osTrvHRtjvRmeqMqw8G05hcgbRmtMnVPpASrMbHUawZyZdcU4fesBtERBY7LOKbUAlRN+8W0tSdJ7c0opNlEEDrvF6QraYIJp7w1KdUQDoBfWNFI0hTnjzDJbZmFMkm45xVSI0JvMhASpalkAAqJ1JiumkSMKscx2MIkYpXhtqfV7gGa8WiyukdU0JxRZlXPAWsAgjXTmYym+28U0vqG0hlSUsuKCEJSlLabZbJGp6knmTCsqWjTs34e1VZziBWpucly1KGipbZvsVF0X+0bUnTCXoPoesdETtnJD9o0VIVQCQCX/AHeAHf5GAFX8sAKtPUwCcr3gAUdxAArUZekAPRMBm0A316QA/FACoxcITvbeAA/cwA9YDFQAfSADrrzgB39BFgCukAitdIAVQA9zzgBgPHrM8o/Ft3j5bb9BlJE4VbKI+cNs5k+ib8vvXNusaKnGZopuc17wVmEtM3zuPrBEmnXPE+K3zgzmTX/LXoLhPXc9IVqvPxe8P220YiRNmxLBKU6fERr9I7uLHt5XJvqW012rFyf8NStCom+bn6Wjpvll4+PH1jbTahVtXW1WIUSfe25W+0YTfbXHPedNQqFQ8NRLZIIVmBzbRxTaYejjwzZZUrFzM+k06YeLc0B5VK0Ssdj6QjIjJxkeoVAeItKgQQrXrCPalKtfqE88i7zJAF72vvFbemvVUP1pLiglxZQfrFjx6Vzc02ylwJmHXg44XCVOXKSeQ00HaCfiumqg2yLNqUBbXW+kIhMUmWu1CqZCpTbo0F99Y0irWMMy1OqVJyaUpIuQdCc232hEteqsFPsrzXJVre20aRY6nPZcoyNp85MLVlSad2z0mhDwwnKbrAKlZd45rRLpxYurY2ZHwkhCEgG2neMduysSx2X/ANNzz0htadmFSYTqkEH3j3ty+d/tFJ/vpSa2xx7ezeC+BU0PBVNlgrI67L+0LWlNiSsXsdeQj38WGOkS+U/J5ty1/ihTakqeCUyCFKQkltaQQRzsR/vHncjUseP6cixlUafMUkyFSl3JCooNkq1CFEd9LRyUpEvSxXabQ6HWGVieQ6Xc11A5r35xwciNXdfba/a8RbSVqJQu/mTzjuxRujly1R/a2w2qzgIRzzaH7RrUvXSSy8laElF8qk6ciPlHTVy3tpLbzJTbKCeWXcQqytbZ9tzL5tdO8aTKsRs6HMys6koIsRYi8E7YtWZISnbNtvBGhBSU+RTeo77xfRJ9pTabKyjTvFtMpnQlPXN7WsfW8WrCk1kiphSl6JKjbpcARaURSQpJXcpSpPKxii8xo6lpSkntv0i2mcyjzT2QFtIUbbEDQxzzLSDDz5/hi1OTCUJbspSeeW9tfnFezWIVtNmEeIptvNYEgHnl6fOM49u6aOlYRk/EcaUU3sNe8dWOu3Hk9PQ3C8ty9UCTYF2XWjpsQQPtG3XTll1DNmtyjasM5KT5Tz0i6oCbd4DL6dIBNBAJm7QA8h1gAUdCemnrAB73O0Ah/wCq8AioAP1gB96AFR5wCbfSADvzi4bUbG3WADNpprAZfW+kBkACja3YwAq1gAJ8unSLBD5R6wA3+KAG/WABavLAJm6wHhyXn0p3Vb5x8h5H6RNU9ud8oObfvFuzC0JDc5tqPrF+yvRIRNpKT5h21i3Y6H25oaeaFVMlBKmhbexHfeLsq1JLzL0w6iXZbU444pKEJSLlSibJFotFd5OzLPbxxptlPebouJP4KXEEyaA3MOJOqnSLmw7XsfSOzHO77eFmye9krc0rxi5mIyLza7xnksrSOzS6pUUqUvKrYnnGUS7KYZlRzE34ySnKDbubxzXu7seOMaomUOOXcSMtje+Yi1unSOebuyuOMiBOYkmJdQZTMFZCfMoqJP15xtWNMcuFCcxSlxsJUVEkeYxr9UpTSunKsl05kuERLsiIQnZ5SveXcnaxt+kZzCtqxKvmJt9xRT44vaJiul6RCmm2XJhRSly5567RtFtLWrAmaQpKR+Wo3303ha+nLFSzkv7G0PMFLI36Dp6wrfatqrGl0fxMilNgrBCirqDy/fSJlWs9W4y8j4LSQE2N4xtDauUa2MqSoXJ5doxq17kMv5QrLrzi0xs7p+H6SisV6m0xSbJmZpppSuVirX9I6MWPyXZZMvjxS9/0+jy9Mp7cpLkANNpbTbYAACPoOvipD4jNfy5ZVdXbpAl1qrDKFFGqT106xxZMkaTTcy4bxEwph/EDaFS/hBDSioJUL3N+Z3jyc/uXr8edQ1dGHqbJyqFB5hpSE5SgL0V8orTD3Tkt1cv4lVhnD6AuXWC+6cqEp3v1sOUbdPG7eLhnK5UjFVcZmjMJnCtSzqCkW+kVrDa+JtdD4hsOuJZqbLkuq4T4l7pN43rDivh2zEONp2TcT7AlbdzcKFylaf6RMSpbD1bDhjFX8YCJeZQtt/Lm1GihFnPb02lDqdE8ibRanxlE7U2IsSO0YtIYlitTqspUpVgkdYV+rRG1lSJqYnpJqYmLpUsquL9Dy7RaFbyshfTzGw6bmNoZi8qrZVDXvrBEkU35wFZkrtcZVWuItEKpTakpTdth1Q+oHqYpMqMlWavWZ0U2k09+ddcUEpbk0Kd1PWw8vzMUmF4s6TS/w247m5ZM3W5dqjJH/LecK3TfYlCblI6kmKTjna1c2nHsbSM5hetVnB9QSFTslMFpfg6tKSPNcE6kEEEGMc89YexwcXnRqFqtG11Gyu0c+K/p18jVP1dYwqvM62lJAsRcJNyNY7cV/bx+Rhin7OzYOeTK4gpaw4SlyZLauQCVJIv9SI6L+pcMQ68TlAvyGvYxvWfStmA94vEsmDYxaJ0EUf1iBkAioACb9YAVdOsAB0SRAYdB84AL3teAFWpEAJV0/WAHbYwA91QAc/SAbV5rnYiLgcvcmAKAC+a46d4AL77aQGG/KADe0TARXrEgFnlAIVAQDatdVaQGQHgVxTjZuSdI+LrV+jd9nWahmslRAEdFaGtrBqaTluVRSGXY+3NJt70axB2Ppmk2977xpClrbOJmtfMoAEgetzCU0rt1HgVh5M/VJ/FruRaaCwXG0qF/zlAhJ7kbx1Yq7w9nk/lbdJ0p6TR3p7EE3VJpwpcW444Cq9ySom5+sWwTuNvGmO0bQ8UzDjLq7qBAF1G+5jPN6dfHpuWgzdUl8yi8QBveOLyaezTHGlS9WqeytfhvFZy+6NPvFJ9tpwzKkqFYdmAUpORB2T/vFq4trVrONUOOA9CbWjSY0ra20Fx7IbJtpFq+1IBmT8IBO8SpMSYcWoaf13gtWsyVmnPTCioN2BuL8xEzO2taTC5p+HUpQFKQk8zfcxWY2rfcHHpVLSwhKxp8IF7jnp6RXIRKrcorf8Sk3F53fGXmW0oWFwdPlDGraW30mjqTdRbABUbea4B6ekdEsrVWzkmnKNDpp84zmClNo65bfKNown019g9lzKA1F++kWr7PbauGVNTOcQqFT1JBC5hKvQjaOvj263cvK/bFL2hPTHsMn4biViySVaEm/Y9I9bkZN0fHVrrLLkmK6hOz3iOSc4pTTSSVtuEg37HnHkXyS9HDi3Ll2LsRVCm015TTJSSkqSVJIA06xh/Z6MY+sOY4IxNWsSV1+TnnUqQ2CpOVOg7XN42rbopenaWm8RG5icxFMzDhUUMKLaQn4QBsPnGOXL2e3wI6Q0zwcqrFO+gi9UZZJMSLjKUuOJBzHqdY3hzfUinVOakFWbUFoOhbXqCOnaKxO0XiJbVScfU2TcCZqilgqVdTjeo22t0i0S4b4tt8pmJ6LPhCpObRmIv5lAEfWNsfxyzXSdMU2l1lAbmW0P283vX5g8rQrHtjNtJSW22UBvKlCGx5cqhYDv0EWhFpQZjEFNl1lKnnHVo2bl0lZPz2EWVhB/xNUH3AqTpYQAbZnrknpcCxB7AGNIhaXSsB8NeLWNG0zEjQmWGVCwfmkqZb66KVckWIO1u8WiNsZdwwn+FymykwzP46riK2gNKU5JMtqabQ7mGWyxbMAL3016iIiqjtNBodJwvIil4dpstT5VF0hMu2EE6km6veVcknUneLxjUmyW5c3A26ZiAfpvExXamnjn8XmC1UfiFKYxZZIlsRyqEuWJsZlpOVQJ/1JAOvePM58afRfis/jcipjzKVBKiW9Oto5cVXdnwzk/Z0jCsx7OUTbK9h5lbk+gjtxV9vLz7yfq6i3U3lSjVSaQUmWyzCVKNrkEGwHXSK5MvtxTD0J4jbyEvN3KFtpULnWykg3Md2Ge0Oe5RYDyxqTBFH6xaJZsuB0vEhNe8AOiYDM3SAHpmttAB/aAFWt+hgA5AJgEP3gB93nABz80APvekAKukAh1uNbWi4Ec4ASem8A37tyNbwXJprbcwA/SCuiZtuZiYNB69YlAVHc/SABR62gAJ/WAHfeA8NVKTWyrVIKTHyUV6vtMebcqZ9ssq8ukVtZ30nZxiYVlAVEJ0kB7LfzWi0St1SWXkn3lX0i1LahE0PCYSlJUpXlAKvoL/0jTHO5IjT0xwGpb0nwnn64GfEdqdQUlCQkArQhOQnXlrf1j2c2LWCHyH5nLGTkeg4kp1NpRW6z+XkbCFZlWA7Ejc94ymuohjE7ckxM828yrwyjKs6lOt/nHBnu9Dix7cvryUs2Z0IUVd9I449vbp8apNOZEjax12jelW/xEcmElPICF6s7Rswp7ymxGkTCu0R5zNrzO8aQwv7B4irZdyYqLikUR+dR7Q+ghI5bQG0SdHVkTlSBqL6d4K2yrVbLMrLlKmwVW105Qc9rbahUm3PbMrSElzw1KCb9iP01hHx1Upuh7CzKZyrPeOhGbxENo8twk5dT6Rphj2cj9MTcmZFErnbQCCFHNvf1EbzVyYsm4K4nMR0GkZTVtWdya9n3y3jCY20mxPAUm558ukWrGmc2XvDdlyVx9RXPGCFmZSQrbKLa6xthjV2XIjeKXr6YeeVJoS+8XFBJSoA211j0s/uj5SldZZcixFKvTVTLU4lbDQPlOY2UN48SavWwZOldNY4gPU9vD0xLTKUuoDShm2y6aRattK0tu23HuElPbSZ6aSmxCjkV11P2jW0tM0dbK/G2HZqVcXVEILrT6lKc8t7Exy2l63D5cY6ueVSm+HZ5skI56XN40iXdFYv7hGVmmJVLbm6dehjaLMctf8AEVEvmVlUm4MRDOWexqCV3Bv8Ou0SxkymXKVZkhSSOhIi/ZS2KEtuankJCUTsykdA4oCLRZn4Ydh/Dbw7b4pY4dwpUK6uQL9PemG3FMKfzlqxKbXFjY7m8bUlz58UYavW9J/Bzwvp6krq1SrNVSSCW0uJlm+3ujN946NbeHOWbW9Ok4d4S8PsJJSih4RkJZYSB4imvEcPQ51Xue8XiFrNsSkt/wCXZIy5TYaEdLdITCsMVmJBzK0216cvTtCESxR1MaQzmA6a21+cLT2lNY7Vc+45YJ/x7w1qVNZSj2+RT/EJFxQuQ40CVJHqm4tz0jmz4dw6uFk8dnhCXV+YhWQkHdN9u3y2jxv6PqsV/wBW/YVcyOJfzG4031PrG9J7vP5F92dKnpnNhiaUpS7hHk8x0Nja0Xy4v224e+3ojCM8qewjRJ1xRK5inSy1K6qLYvHfh/rpx5Z2uc23Q9ovWGeT6QlOu940J+M67xdQhVADp9IDMw1/vAApX0trrACo/SABWu20AhN4AdtzACbmAFWuggBJt+kAIFoASf8AeAS4/Zi4BSk/DveAbJguG41tADfy6wTMhzJ05/OLM5Jm3vtAIo+lvWAbWfLy7QA3GioAYDxzOS6XkW0AEfL5H1OONS12elFZ9o47e3pY76hAclym9tLRZvFgZeqtIs2iTratct7aQmNQud8bKjLub/0MdHGjcsL20930DD7eE+FeH6GcpeYp7T7ht8axmV89RH1HJrrjw/O+VlnJm9uXYynmJh50FKFAgBXlFie4jzsk607cE7s47iKyX1Nt2Cc2iQLAR5nJrp63Fj25nix5SagltKjYIzDsSSP6Ry4/r16/Gszi8zeXmBpHVSVpuqi5lUUqPpC8kW2RakpSRz5xDK0o6s2isvl523gz+tiwzhtyoqM08hSUHRKVAiKNKt+lKWG2fdB+0Gd50kpkwgoUvRITmPeN5hz2hAqavZ5Z2acv7pyAak9ozTSm2qYflGqtUam1OP5UIkX31FJNylKbhN9xfbTrCvx23t46HuG4mVe1JZZT57OZlHUJGtte0dGCPbO//TE3+bdVMPOvEC5CUk2tmsI3l5+GPSCpJ0ANhGMumn0uXKkd4zrG2kwRScyTztFpjTOYOSHiN1CWcZcLakOoUFg6psq8ZxbV02jeKXrCaqSXqeJjxr3Skk7X8o1j0rW3R8vauskueV7ElPemLTjhQUDy9zHlRO3TmjpOnJOJWIpaZpy5dL2q/KdfeEVtDq42PftE4ey0uilJKUBpRSdlEk2EWidr8mNy29UrKTi/Z0gOJWkZsydCbReMe3Puaw4/j7DrOH6yjw1AsTQulvcJ+sZ6e1+P5Hlr7aBOya5V8qtdoq8vYX2i2nbEdrG0slSwpBy67ReHPJ8t++m1yALdoljJlUvvtERCltsEre2nPWLaZxt3j8Ic2qn8asNnxCkzLj0qbaXCmlafUCNcM+3NzKzNX0HT5kjMbkgZr6jQD+lo9KkPBpaKW9i0SbDaLRCLWDmy9r6wmFYsTOMvvECKgFqF75rCAHMLGyjcn5W6xake1a261adxUx1ScB4VqM1MzTX8RmJdbclLZsynXFpKQoJGoASb3Oh5xOedQ6uHTyWeFqfIu+6pJBJzXI1JOt4+f6930eOf1bPh9SkKWk3zDT98o6KV6OLL7k/jbiUzRKKuiy7wVNuJIKUpCykW3VpYWjot+0bcvXT2TgVpLGB8PMhWcIpcr5uuZpJ+140407nTjy+pX5IyjlG9YVyfQ+W8Jkn4y5/miyjP3vACVdYuA006wAnTpc6wAqV3gBzH9mATMP8AxAIf3rAIVQAX/d4BDqbwAkmABXPneAD9YuAUflfvAAT9ILhKtPLAAVHXXfvADmH9osMz3goFRgBUr6QDZI725QGXPb6wHjdU4l22u0fM/X2M10Ym5dLgzXA/rFfHtNb6UM0oocKCfvGXV01lBcc3ureHV0VkKXTmGVRHzjLc6a1++z8glyaq0nKNhS1PzDbaUWuVFSgLW+d/lHo8Hbk5laa9vbWNsWTVPedpKnm/DQlLacmlsqQkg/MR7efPFYfDxhifjms9+elxbqSFEX15x5lr+SXXjrbH8c3rbCRO5hzzA+sefnl63H+uSYvcT/HJltKyQ2Ep9Da5/WMscvVp8au89qfMTbTeOunpW6BNLBsU+8NTbeF/ZW2jZezW5k/eKqTbs2XCOGXqtMiceQpEsjyp01Ur06QIjTqclSkstBtNgANABoIbc97prjLcm3ZKQYnTLsrpp5Cr5lbC3cRSJ02ijXa9leIZbcsjLdVzsOZhM7axVq9Hee/jglpNoLM4lyVSV6WbUkgH62+kWp8bcmO1trDDrLtLqkzTp1S2nU+V5Nh5Vc0gjcWAEaUj2yye66b4oIeaT4CiShOUx6EvKRLK+LlGcw3pYLjiTbqIzr6a1kHiG3lUbc4zutMM8UNqBTmB1NuRjIrGq6d2w7iBdWwfLzGbztJ8Neu5HOOvFLxOTXVtua4mrH5y0ON3KSoebaPNn9HRit5HGcYVdb8820UoS0hWljvG2KG828bfMA1OVmGmJeXILgTdXoBqY1mmmEzEw2+VqfiIUWVWKVFRJ/lB29Ixm+nPWsTLlPEGqLqlcLYJUhgZUXNwFRXb2+Fx+rXCwmYbLMxotZ5cldYbej8VCmHZd8pVfymw/vCLMrVOZVBKlbqNrRbswtQ74aXGwvYjcRNVZqwN2APeLSymrrv4YZV5/jZg9LKinw59Tyv+lLThP2i+H3Zycn9aTD6HoWNOlyPsD+hEet8q+br6yTIs4VFonaJAoi456QmNkI7s0zLpLjzqG2wLlTigAPmYrvSf2a1V+JmCqLnTN1ppxwe63L3dJPrDunrZoeKuOkw9LLlMLyQlQ4gpU+/q4R1SPh9I55zw6MXHmHFag/OVWcXOVJ9brjpIU6okqN999vQRz3y7d1adVfL0kuLUpUlmU1qry+8nlbvFMa85pxpX8AdlyXJYZHLi45KHWNphjPJm7i+Oqe5I4inmXSshxxRF9z5b69rxlaXbW26votgB5tzAOHFJ0/8ApMoRl20bAMdOGNvI5Huy/wDEuka7x0QpMlvrFbe0M80Sozzd/rFghVb7xMASeat4sAUdOnIQDdzbuYDFf1gBuP2IDCehMAhUIAFfaAEq/d4Ab205wAk78jAN5vvEwBUT84sGyekFwqP8toASR84sG/W0FGZkp6QCKWmAbJ+cAJVvbeARbmUDLoYDxDKz6XOYj5KLvt71S1zAcSDrpGsZGXRR1JV3AsaWN94y7OmsKxxzvDs6KwjqdVrZRB9TE7hp27fG78EZqkMcTKDNVxSDLMTHiDxFABSwk5ASdPetHqcGYeZzcV7fHdqhial4sxxNYbZmFTEzLS/tsy4hSSgqUrzNhXUE3uYm8+R4eTjzgP1qQ9nZJJWMmZOVSlKIt32Pyila9UY8sf65pUGnHJhSgkGxskciSQI4M1Xo4PrhWKFuJr1RS6ClaZhaVfI2/pFcVXpV+NfmHPN8hGyLIbjmYZfrBha2kvDdHfrVWRJpSUtJVmdXfQJHIesFscO20WniUl0IlmyhKUgJTa1gBt6wMluq5aRkTle0J1iIlzTVEnnPEbyp/wAwe6OojSFq0VDqsiTmyhViU5hcX5XjmmdN4a9PJ9odUlSTY3Sgc1dVHqBCJ2ttr08yiVmWZltIW2kJvy8oUNfntHRT4mbdo2dnHEStYE0nIUugupczXN1Wuk/SNKfWM236b9Q5kvSoczApIse5jo7uGasmk3USkkD1h2KwgKXunmYT6bUnYQ5uncDQ94wt7dEQLxNlDYaRgm0anTdcB4sap7blHmXAhiZUMuuyuQHrHZieXzaajaBjVTbfjqUoHLmJ6a6xwcv9baZcaOrz/iSa9qmlKbNgFG0dGOP023zR2bLwxqzlNqiStwFLifDNze2aNLW2z8M6dkeTKycs7lsVpZKlJtrbdJ+ZjmtXbGmKduSTzalzLrzo87hzDsYy2+lwW9Kt5PhqzZjpqdYbaz7k1NM+0ZHkpVdflGp1MWiGcyiBPmKFE5keTfnFtM5OhvLbXSJqzk82jUmwMWllLvv4OaMqe4ttVRSfJRqbNTX/AHKTkT9yY14vuzz/AMh+sae4U7jzA63t00A/QCPWy+qvn9anZcwubRaI0pJpSruBKlEAkX15c4TOiHB+KbPEKv1x6TbpdQmJOXzCWl2JclvKFaOKNrKJ79I4rZJdddS0CeouL5OcFNew3W2nnLFP/BqIOmwKRYCMJyy6q1rKprScRUT8zEFBn5JBy5VPMKSlRJsBe1j9RGFpl0Y4iTsjNOTSVjwJcttqsfMAoK5gDnFY3KcnpcUp9x2TS4WXUPNqKTfLoCdD9I6MX1hMxkXUlLtTTgdU2lSW+RFxHTMMZrFXN+NvD+YmJiWq1Nk1DOoeKpKdTm01019I4sk6dOK24eouDUwp7hZQmnHip2UlUyzmYWJKTt9I6eNkcWb63HN7sdtvTEubXn9YrHtMQK/r9YlmTOB1v6xYJnEREhL9P1i2wKj9SIsAJ0gB/WAzMNIBDrACo20gBVAJf0tAASOUABV++kABVv2iYAE7iLAM3aCdhUb8wIGw3HWCwScsFAFfW0AJV/tAApXeAFTm/K0A24qA+fklUlNL8O+3ePjYl+h2xwvWaglTY137xtWzC1IDMKSpJVcaC8NorCmmlDMeVu8W26KoKleY6/eLb7LSbU8U2CTY3012PWLd+jOXUPw21JMtxXpkjNErTVEuSqrm5UopuL331THrfiq/yJmXn/lq9MG3pjiRSSyyHkKKSElJRrYKvr/SK5q6iYfL8PJ2iYcndk3EPpUNClQOblmOwjzs8PZrf9nmjFaZxmv1NuoWEyJpfia6Ek3B+hEY4409Ot/1USnM49I2qpkuiPIWpxGT3lKCU/OE+mdZdXwXh0UuRQ29/nOKCnOx/dob26LR1dAk5dxvMpOtzc+kPjC1zzjH5aEt6lxR+UKsYQZpO+azZ2ELNoUUwhzOtK3BZCST9Iwu2Uhcb0cdUc6kKV6JUf8AaK1WhS1VkTAUlKsqlpKldAn4fteN4Jk3IMvVqlCxQZqQuiZTltZKdAdukaQwvCwwzWSzml1XsSQnXvGsejNWLNsTMp028wjWJcsY4hHmmLp8RMXqrVDUrKBytFby6Kmw9a/aOe1V6yT2hNwtLgCgbp9RFYnS002tEzn+J6e9JPLtONJKUH+cRGaO7C+OaOW1jDM9JzhaVLlKRcXvv3jPHl8LKJ2scC0WYcrsuy2LAKClL3AKd4pF5XvaK1d4VTW3pNLKiC8s5luf6Ry9I1iZeXOSKW257irB87T3TOs/mNEHN2inj09Tjcysy0mYQrMU2B0tFZjT1NVywZb8VKSjnsNecX2mnxDmFoVMqVspY83ZSdD9ot2Z79jb83XnFa+md0iXZU4MtzqddeQ1/pFp9sdPZP4McOJkcK17Fkwzkdqcwmny6urbQzrt/wB6hHp8L1DwvyNuz0YHEG9v5QI6rzuXm4wqcT+zEwpNQ+InUczrCVq1Cp6105zbpmO0W6wntLErVl8ryxbayiLRXUKzMoNYp0tXqTOUSoXclp2Xcl1pVqQVJslQve1iBGVqR1a4/wCzyrhXD6paYmaZPN/mycwuXct8Sm1EKI9SI821Y7PQtH6ridbUxPNsSSGkCYNnVFWjQ6kbmNLM8W4TqCpLNTbl/bGUuqcS24HCcxNviGwMXpfSuWZlvFdpbfsLPtg8QKUFJ0vqk32+URlwxMMa29rzhs5OStLdkZqYbfR4mZvK3lyj+X1hxcURLTNG4br4g07R3zLjiC57mIaCzf64KEuP5osEzaeWAS++v3gB5RMBCf2IsEgE6QAqO+0ALm0AN/3eAHN0gBJ/8wAKVuO3WAAqvftADffWLgCqAHNmgE2BEA1feABShtAApWYX7wAFfLkIAFK+8APiQHzpnBk/NbUAeesfIddP0Dcyep9Zy/lch3ho6TK3TUEqRpzEX0iIQ3n82nXvFtNEB5Scx2h/VpJtLicx2+sWivdnLZOHte/w/jigVjw0LEpUGFqzdCoA2+sen+IyeDJNHP8AkqeXizL3bxSaQ3TypKVJJcKkXOmUm4A+sdnOr0xzd8Nw46WmHIapLgsvPNeUIQHNidLHl3jyssPbr/Z5j4tP02oYianqY+06H5RtTpb2DgJBB72CY54jT06/1aQoFtHl1IjWjOzb8B4fcfcTXppkFAV4bCFaZlc1HsOsUy+muOu3UqHK5M997mIwztbkW02Vlrw5cKsdrxfJ6clJ2ZnGxmCWtGiLud4mCqoqSg2HG1ebXSxjOzpqoak2oMiz4KliwQvW3zjCzRSzCkpSltxRbIICtN9YtRaGtVBzyrUlZIaslOmpIUSPuBG8KokrVqhQJ1qfkHkoeUCl1C0ghQtfYjvGkQzskTFfmqg4h72dhpCCVJyN5SQToCduukXt6VpWbNgpdWMw2nNuj3u3rFqSzy45hfMzCXU+GdAoXjaGFUOaAVdwfrGWSXRVWuuXB7aRXe14jRkzFk7j6xlaHTRkvOvMvoel1hC0KBSvmlX/AIidpvji8OholZHElMRUDLguOpDbhvsuH8fyPH5E+KVe5S6ZhOT8R+yXX1FZsb5gIdYhz7m9tIEnxDU1NZVMZGVmybcvWLRMQ6rfj+1dt4p1fkK1IiX9oaWehGv0i0w4rce2Gdtdr2A6XVGXHpX8h9N1BbZsHCNgexjKaO3j8i1fTk8wwZWadZO7K8p7xTq9ivxBnUqSoZVWKh1iumG/ZuRmlOFSU6AaK5XMJTf0uqbT5mfmmpWTYDzz7iW0N/zKUoBIt6kRavtzTfT37gOUksE4UpeE5ZQKaZLpaWq/vvHV1XzWVfSPUweofNcq25bSzXm1Ejp3joj3Lnj1CU3V21f+YtBMpH8Rbc16DrCVqyz2htRvmAHrCayntB1LiMvvCMpiU7hGqNUl6PTn6tNKKWJNCn1q/mSlJsn62iupmFaTqXBqVSZpylu1ia/Mmq5MLfbZRoQ4slRHci/KOXxTMu22TUJzfBbGEwhc23UKbKvO+f2d9SlG/wDLcDKL94tajOORChoqXpfEIo9Ukgh5DhYdZe18N9I0T3uNjsdIxn01jJFnR5h5yTpDc1PNrWMwKGkghYBNvmY29zDij1Klw3Up2j1BMnUmHpHxlktJWDqlR0O28MW4lva3p1lp5spASq5KAQevWOnbE8DzEXBZra8+0FCBV/pFhl/2IBM38sBl7/8AmIiQltDFtjFH1iwbLh6HSAzN94Ab/OAA+t4AFKgBzEegguFTh136QAZu0FA335Wi4C+0AJVlt3gBzfUaQAKO3eAbUqABR5wDaj6X9YAFHffeAC56iA8Q1/A2Vpa2UnMdQLbx8t4tPq6ciYc3qsnP0d4KeRlAPIaQ3p24824OSdZLiffFz31jTpppEpiZ0EZrjTvEb0vAHHkqurnFK1SiuODnaLTAVqecl1IcaVZbag430zJNwfqBHVw79MsIz27YZh9DqXiBWPuFdCxUtCi7PU9PjBNiA4gFCvncXtHtfk48WKMj4isdM0y4PwfxU9iSmVKjVh5btUokw60orIzOM5zlKh0Ta1+V48Sn/avZ6uWur7ed8eUtVCxhWaVkCEszalJy6DKqxH2MZ4p726vTpbvTSPhWguYorTNMSSGv8yYcSCQloe8L8ieUMldMZjbr38NZaKW5NvJLtAJbRzygWBPc7n1jKJ06McaX1HabS2MygFE5sp3+kbQrMLR+YSEKTmstvzAX0UOkJZTVHUpakgqN/iTbXU62isyRVR1C7hEq3ou9/lGcy0hSTzze76bhCsgUnUX5axg6N7UE+9ddlqFh7usaVk67Ur3/ABSR5cijfKFaWsL3+gjWJIhTKczKLjhKgTa5/pGkTsk28+tCfEl7AJNykj3u3b1i6MeoWTNQl6apqYZnC806kLcSoWyq5pP94tDPNqWwy1TSpJeaUotqsFZt0noenaNqy4bQlJms3xAAi515Rnf2tT0iTTiMt29jr6xm3rKA45mJykEDexg662NeLmsoKBv3iu5hNcs2b3w1qqVCfpa7KXmTMNJJ2UncgekPLMODnY4vHs7xY8srSlpQQHc5UOSbdYz+seBStZc0U84CMqr6dYdXsZLejrNRmG1e0y7zzK06AoXvFYlnkt5ElzFGIppstKqz6EHQ2Um5HQxtW6Kcek/UBOqbqcJBVfXUqV6xYtZCqjyWUoZWkFajt0EV05reySbTKUgN6hRzKKjtGc26ypa03nbt/AHCJmqu7iSabStujpCWM2gVNKFwb/6RmJ6HL1jrwUnI8zmZdRp31NRdSrRRIJuM2hH71Pzj0aVeLMpjFaeTfzC0TaGcyny9eUL3cF79YmJSmtV7/Wm3rFto1tLbrma3mTf1hCY9JrNbSlPmIvFoVmzWuJGInJmjy+HZRYK590KeF72YTqpJHIE2t1jjy/XZx6bgfDeX/wCHdqU62kplFFiR+IJ18ywORHug9ImPhf8ASW+e2MrT5bHnvG1fUsLRuHNOK9EYlaxTcXSIyuTTqZaaTyJSkZVettI4ubTtDo4lustkwzLpmF0uaK2ploNuFNyryqSrQKCtdL6GGC21cldL6sUOn16U9jqTQIQczTqTZxpXJQPO3SOqY2yidKPDMpiSSmjK1RtJZYSpJdzXChm8pB5kjUxSIaNozjreNYhWZHmy/wDmIiDZM/8ANcRpBtmdPK31iEEz9B94BAqAXN3EAJctoNoJ0TMFfFFoRshV9IkBmPeABSvneJ2nQPE684bNBKhsNfnELBUvvqfvACVX5/1idq6Jm9BDZoGYbCIQFSrfOAbK97a9YASrNptbSAbJ+kXAq+naAbUfuYoGnFK21MAOpidjzk5LqbHgzKUqQO2seDPt9VlpFGr4mwbI1eWUQhAJvbTtFJx7Tiy6cQxThOewzMKmWUrWwTuE6CHbbordVydUCkeZwa6RPTbet0pU95SQRbSJiqZuD2orG4A3itoUm5VPeUDv9YU9VjIp27UmHr/8L2LP4pwkm8PuTV3aNUFFOZWzLqQpPyzJWn1Bj3uTb+TwofM8qOl9w4NXsTPcOOMlarlMUhwM1B0vSSSQVsrSCpKjsBrpvrHhcO/WvV7Fa+X203FGIpjGmKJysJlih+oujw5dJzZTYBKQeYAAJ9Y16eK3Zbt4/Ts2EMHt4Oofs8wlLtSnSlc04B7p5JT0HWKZJ2Y52tCzmbcS0ixBObt6RjFW020fprGVlCm7lZFwo8+0awmbJT8yslPjpQkWCvUbwlWVU/NuS5WpkkNTHlTf4e94r1a9VdNJcbT7Q87dXwqSdCIdRRzLbimMrmiCStZvt/L9dLRlNGkQpqglTaczak3AuAqEVaR6VCleG0VWUVkE9gDpE29CmdBS2b+6DoeUaU9s7IXjZVeZJI/WNWU0mByc2qTmCrw0vIUlSVJVr5SLEDv0i0M5pMrmkqk3mV+y1FElOoX+SiaNkONaaE8iP6iLbZ6Wsw5UJeYRLzEo8266nNoQtCha5UFDS0PqutGlTQSoJSpCgRmGVVwf94hasmXXApHl8v8AWDetkNTigq6bgCEzC9LxafSRSqzM0mqNzzKQvIQlSSr3kneKTEJ5GCbwtsXY2nMUrlkeyiWZlQQhKDc5jzPaK9WHG4VsftQq9nct5yDbXXnzg6Mtun1ilyrfmTdxf+rQRHjRHv4VLqn1BSkpFjc5YdVbRaPiPO1JuQAYZUkzCjdKdyO8XUmyuSFOPKS9dT/P5xbSsr3D9GmqpPSkjIt+K/MvpYaR1WTYfIbnsIzjH3lXNaMVNvYeGcOymDsNyWHZVQUJRsBx4D/OdNytRO51JA7Wj1eNSKQ+Uz8ryX0eecOY9OXeOqtWEyxuY1KSoDlFbwpMpSXU6WWNYpEJrJ9LitPNFtN6wcRMOI1CtfWEMZOJqjyVG6tItC0U2izzNOrDrT0+lanWBlQpKiCE729L845slfbork8cLmTqTUmwiXlWw0yyAltCVXFrWuTzjWKelK38srKXra03zKA6axHyUxG4RcTFNdoT0n4CVrBDrZUqxSpJ1I72vFM1e0K47dZSMFPKl6WJtKVhvMVJzH3c1xl9bAGOPBGpdGSW1NVRtSRmUAfWOubac8QeVPNqSU5hqIvELTIUzCb+8LRZWZ0c8Ycj94nSWZ/vEAsw2uIBM3cQAqct8QgE8S+yh9YNIhmcdfvBEsCv9VotDOZZm06xVIVKgGs3cRdcKlel4AM3PTT7wDa1+bcQAlw/zC8AniW1zfeATxe5gBU5cGAbzKHWCZgJV84Mw5lHtAIdUwDZ5wAfF6QCKidDiE01LOt33V6EfePItL6a3tr01Luy6szO1rlJP2jC0NKelJU6fIVZlcu40gXBzBSb39NInrpSLuLYy4dTdKednqWklskqU0LaC+4+sVn02i7SEzKm1Fty4INiLG941pJEn0zOwufpFrRteLHkOZiM6rDrHPFdU0pWPTonBniY1w9xMp6pF00qoNezzQbTmLdjdK8vxEEX0ud49DDn6Y+rj5GHsoOI2JpHF2NqziSRbW1KTjwU0lacqilKQASORJB031jgx106Yh1Dg1wzfkPAxliFgeOtJ9kl3APKCBZShyvfY66RtNmOSu3QpxtT054agCBdV77HlHNptX1BPZmUoPIAEqNraxaKbZ1vqUCXmUqlEBGig4pJtuIRZtMIz814aQ2dQbqSrr2i2trVnSvmJyXWHZb8wNLGicwCQefeMotp01jUKCdezN+AqZN9kWBIPzitrK1nUqtTy1OGUUkrcIsPMAPLz10jKIbK+oNqTdvxLEDMVbj0jQV80p5DbXiWyFOW99yNbfaECpmm0qT4jKiQo7WItGkCseTYgFQF1WOu0aMNGwnKqyVZhYkG9r2Njyi9T4UTHhkKVYkG2qQoEcxY/KLM7+zspVJiQcQkzD6pNTn5zKVEXTvYA/0gw0sUVJvxFMJZ/IJK21BNilJ+E9xBSDrU8gpIHugneDSGOq8UZUqsSLjvBeJQlOeGgqSokA5ducGsWI2+rMcytb6xRbZ1t5H8x+8FdnB5tr/W0XV2iz1U9hSG2SCsj6fOKKyq0Z1OJdcUStave7QizPyTC2kWVFwKCgTcebp69oTkNzZ6A4C4RZk23sYzzd1LzS9PStOiR8TgHfYGOriU1Ly/yV4vDsrkykg+e4vppv3+esepb48ClPaEp5JUfNpE6W2bLg+GGlZnSQy7qO0QmspgmEJtdXKK6bRYLk0nWx5QmNK29m/aE6XVqdorvSsRo62+i9s2sW2lJ8ZKUi6j9IbDD0w4PddP6RGtmzrFTeAyqUbbHXeHU2KnTk1Jy7TCZvM0HMxbsdN7/S8cWvbomVy3W7W/MNr946NemMpjVZ8t85t84fEQlt1a6f8AMi3ZbaUzVsvvKh2OqWmrIIHmh2Oh1upt3HmH0h2WPe3Nq52h2C+Oj+b9YLs8TkP1gsUKVfLzgyL4n8yjftANqfH8xgQBTyd7waRJsuQQFTkAHiHTfWAbcWc0ABc31gB8XflAD4ytotEhfEP9otE6CZz2iAlzpzt3gMzCARRgoEn6RERoD8RPIxaIAqHpFhxhwNPJ5DePI6vpIlXPMJPvD+sOjSPSiqVOTmLjKsvXlGaOigndUqae8wIy+7eKzVaKua404fy04lU1T0hp0Any8zExGjbmDjMxIv8As84lSVoBBuNTrFtp7HmXPLdVwAL68oz+5OpFtH21BWXLmVewTlFzmN8ot3hr/ppPbbuHCDg4ZjwsUYxlVZRZcrKOC11DULUOg6fOCNu1TRuoqcUMoToANEgDbvDW1fqib18Z7Wy9UX6RX4tX3BtxxSkZU2WgAi17WP8AWLdmdablqs1UlUuacZmLJQ9dSMu9+cYxGnZWNiD3tCQ2dUBQKbn3equ57RbelpxoFQVLG7aUqsCfNaxOsZWjS9Z3CrmQiTfbzHNL28t/+X2MViFaxuUCYl25gJeccyFSlEKSdUj+X0iWykm1+yJcbUsqbIulXOAZe/NYbUpN0a2F9T8oQK15Ksig2ShNxa4jSAMjSW6o+tqYUlpDTa3lOLVYHKkmw6km2kSpMNTeqCU3UnNYgKCSCLk8o0qzkbSncqXHrJC9k3uBGiv1Nlmw9cJWlSrhITm17k9B3gztBubnnZecdTLqStpKrDXQ6C9oMWJqiHHglV0JI81hAWTM0nwyUOAj4etoJ2RU0nMoA8rFO94LRJpBtyt89oL7OJ8qc6tB1vBZHm6g4LNsarH0HzgxiUNOZSjnVmub784otEpjCVLIzWAHfaM6xtekRZv/AA7wVMYqqzUiUKTLICXJtz+Vo7pPcjQDveNJx7cufNGGXphhtuRYbk5VsNSzCQ2w2kaNoSLJT36mPQw+nz2TLNz3tGby3jotdlUHiHr94v2VmoS8kW8xv6Q7K9Sh9Q90i3rEdjqP2xSvi1EW2BVNKynzRWbJr7M+2agXOkV1taY0kszZUq+YWMEJ3tt0hO9tIBhczm2VziYsdRtOp66xpEnVKbslSlhRNxoO/OOWY9rTJ9Cxp5jb9Y2n4qc8fKNFG0RraJCqouI1S4RFuiuxIrDo/wCZDotFzya6tNruHXtDo0iyYzWl6EuHWHRRYM1k/wDyG0Oglt1YqtZV4qt2SkVWxsVgfOC0WPoqgKveBghITUmjuoX53gBVNNqJ13MFw+Jmv5oAfG9flAZ4nrAIpXr/AGgGlLur0gBLguRcwAKVodecAN/3eAVsnWLRIO56xIzXoPrAD0236wC7wUCrWJiBmgPKLADtAee0z7ifiJ9DHhRbb7PpP+nm5pTltTp3jSI2rNK/6R9KXr5jrDbKZU87S0uX0GusNq7a/NSi21FtdiN/3pC3tGmp4kwfTawla3G0hwC4cA1B6bRnBpy2pYaqVJnBK+zuPeKrK3lSSVKOwAA3MTKs007/AMH+CDdJaYxTjSX8Wctml5NQ0a/6haxO0IZy6064cx5adbfK3KK3FTUJpSWje581vLvrpFar19K94JZW0l1wK/LJypPSFlq22qm35h5tSJdTSW0knNc89bbb6xWGnbSmxBJsTzIlnFDxUpCkuDkeY9dorlx9/wBm+DI1eTqVQZz01YUZpgZgeSk/zXjOmTv+rpvHZYpmm0sFxQK1HWx2h49OZXzziVMkpUHUr3F9D3PeG9LwqJouS4y5iWVozIPMHoe8Gsz2NCny6ZcTEw4shY1CtgOukCI0r5ptTL2WXUSi1yL6p7xMLdUWYTmTZTlk6bxKqsfU3q2OY1IUbkdLesXLKeZZzXWkJQvQEWuLRarntBh1Tbd/DbOWwvmOt/SN5nau9IwW5mLjKvDJBSVA8ukVmWN8hUpyt5cwPQ32hCm9kDaiPLqLxaFog6yt6XWfNoO8QySBPqUcrqUqG3QwDiXpcpBzuAEXyjl2gmLBdel8t8q1n+XNoYLdgDzOlWqQekGnRIZb35wOq/o9LmJp1DMu3ndWpKEJAuVKOwtFP7K5JjFD09gvDkrhHD7NObsqbcs5Nvc3VkXCfQco6cdHicnJ5JXDjyj8WkbuWTaXVJUfNeLs5F4x/mEXQDMVX81oBvxlpBurnFdBv2pSb3UdTDQFU0dfN94RCNA8c3y5o0iFUhmYUCPNpE6RtKTMn+b7w0bEl4knWGk9ktt0cld4aW7pTUx/q+8W2xiE1pVwP7xRpDHnMqTe+kaRCJVMzNeYpvGkQymEdM5lV7xiNJ0d9sFhcntDtpdIanhYZlHtrEA/4nlt+Yde8FklmrKBGVw/MxXQlCsKFjmBt3hoGjECkn3iPnGa0SlNYiJI8w176wWidJjNaUqyvEAuOsR3WSm6wr/5PvDuJDFWT8SvvEiS3UEqt+YPrASPagoHbUWgnRPEuCf6wNGzfVV4IF8t+8BnTleLhRp3vAZm/wBNoBCr932grIUqv05wWKVfu8FZkmb93ghn/cPrFwNx1H1gPNsvRZpKQoTF/kY+fq+xnlRb4sGWXGLpcbJ097lG9ZYzu3w4nIbJBsTtfkYaRLFtk+XRQPeGlVdNU9L17p0tFY9p2onqO888JeVaLudVsqQb+t4T6Nt6wrw9kaIpqqVBpt6etdCVpuG+egPOIlWb7bJMOLccyptbU2vuTuf0hDOVTNOjMbKuScot6Xit2tabUc1MCzzIVdwKT/eK1adNKWuTfgJ9sSogskpWd7JO5tDJ6MVNosrOS7MiW0k2dupOt73N7xWntpemlbOTLS1HxlCwTmJ2JMVtk6/qmtOrW63KzKnP4nIqPjNDTXUpPI9RGcY+n7OmsqyRqT0yytKl+GtBspCtCFch84eTZFCzTi02S2k53CAnWyRc8xDW2kUNzKX2UKZe8yk3Gmo9RBNKslS2+kNqUtTivKpO4CYM8s9TFQk/AKfDINtlK1UfWJhXvtTvTDSXMqklS+nWJW+q6autXkZIIN94uIExfw1FSCFDvv2i1Wcwr3UnVJSQSNe0azLHWzGVSBlzA31O8VY3xsSLXtcE/rFoU1oYT6j00i0LRIkpT3PrEI6iCG97b677wOpfDTbS/wBdoIigkNoTsk3gt0PNo27wWm6xkZVx0nIkEBVr3t84M5u7lwgwMmTbRiqoS6ispKZVCuQ5qI5npFsVNuHk5pvDqylKWc2gG563jtiOsPOiPaOoHObq0iqsltvyi7OQ63sATE7ULlV6f1hsI43caaW+8NiG42r3v2YbDYTmSeu0IlG9hzBKjuI0iVuuzjbg03iOyOqQ25m5G8Ox1OJdymHZHQSXFJ+I/WHZXqeZmVdfvCJNLFmeUlOqwIkDMT/lN1XHrvGmxVPzGZR8x+sOyNGPEOY+Y/WJ7EwBUwtvdVwdBDW0ATOuX942IiQ57QpShdR201jOZWSm3in/AJhMaKnfbbeUE/WAT2hWb3ifnFFhof2OY6d4LRKQicUn/maesV6JYqs+zoU89MBtCASpSlWAA5kw6BljiJhpFv8A9TUw/wD81v8AvE6TtOb4j4cCPF/xHS8gVYq9rbsD0veGjaazxNwqSEnFVK1Nv/et/wB4aT2T2+IWGboaOJqXmdF0D2xu59NdYaOyc7jGgycyJOcr1PYmDazLs0hC9dvKTeJD0tjTDsxMmUlq/TXpgXJaRNoUsWFz5Qb7QBM44wtMqcRL4hprymgVOBE22ooA3JsdBE6DstjLDU0w7My2IKc4ywAXXETbakt32zEGw+cNAUY4wk62t5vFNJcab1WpM82Qn1ObSICS+MsKVGYRKyGJ6S+8s2S21PNrUo9gDcwRKz8XXrzgTKpfxrhOVdUzM4ppDLiTZSHJ9pKge4KoKzOklWIqGmRFUVW5ASZVlEwZlHhX3tmva/zgkjWI6FMSTlSl63IOyrRs5MImUFtB7qBsPnFgtOr1HrAWqk1aTnQ3bOZZ9DmW+18pNokcPkavLvMZvEsfSPMiKR8fVWi0LATAeSNovFtfHLabQZUylSgbEJ56xj1aRbZpTaUqGVRFodWsRs9LyszPHw2WySdzbQCKos2imUeWpTaHfBSp8m2bYj92iinbSRNrVLpLylEKVobm9oM+u1Y4pLSiVuFIUkqVzI9PWKNK1Vb3hqyqU8fDUFFKcut9t4i3ttWzXqsrLUpVKdAo5Vi9je2hvFYrtp22raqoqJb01uk8xbmCInLCKWUErNIZcdlEuhPhHy3FyEnX+sZ0aWkxUPDUkqzXRdIVc7a/eK60VybRKtPSiShqRTlIVYKzXJ197bQH+Xl1h2001trNa/JcE5JgucndLlZ625RnWmnTEQyTqDc08hxVwEjzJ5gxafSloiVoqcl1PI9oUkJCcwSOahqAeogwtEyWampFxQXLqDToHw6BX+kjlBERKhnJqYdcKc2xiYbq554PKGoBGnu3uYkRnnMqg28mxO1lbxdHxEmG2R7qzfnGkSzt7RZjw1XKd7WMIlnCAptSiSdBEq29mjdKvdgoJOvrBU4lP9ottOxpT20hs2cbSQcxO+sIR2EFf6efWLQjukyranPdTfp3ivbav9XSeGWB14lqIMxLlMpLAKmlKVYHW4SnqTtflfnE9duXLmiHoltptllLbbYQhDaW0pGwA7R1Yo08rPPadhVvbT6xrcidxoyrVR9IqzZlO/O8A4kEAWTFtqsIKvehsDkHNUSroLjaVJ8qdPWBoz7McpsnSCICqWFvMnUQaRJlbeW/IQNmfaPDUEhX+0UNjS/c/wC8EHEuA84BxKkpuc2wi0WUH4qspUlVrcusawrMGnHHD71/rvEkGPEUV2Om8TppBxI+K8TCkhcT/pv840iVdGihJt5bERQGnyjl9YA8xT8V4mIJgJcOa5V940hXQ0zHX9Yp1RFmKm0p+Ln1h1aRcC58D/zEp213HMyHsOraVqlyYlkKF9FJLyLg9oiTb6J8ZpL8KHBPFWAsKV78NWE59/iBVP4TIvSeGqd4cu74jLYLucJNrvpPlB0SrteqXHvxOO8Avw5fiFw5VKh+HrDVboE7gycD1HkqRJttCYE2gpmi2pGRSkoQtOa2YBZ5QHRuIdW/Czw84C4V48zH4WsIz0jipNOUxTmaBT0vte1sl1AUpTeU2AsbczE6Rv00bgJwz4Z8aPw+cXMZUHgfho1mr1quow7JO02WMxIH2ZsS0s06U2ayuG4ykJSVE7axHwidtsqf4SOGHB78IeM2K3hehYgxlIYWqU/O12ak235hueEqpQ8Bxac7SGyEhGXLokKIuowS0jiR+Hqh4+/BBgqucGeFFEnsWvSNJmpibplOYbn5hPh5ZglwALcOc+YEkmx6QEz8WnB/hng7DHA9FK4ZYco05UsX0mn1X2alsMuTDamx4rTxQkFwEjUKJubwHXuI34SuAbOM6dxZxBhfDlBwdgykzc3UqXI0pDDE64khYdmUtJAcbbQhRyZSVEgHQFKg8e/+omAeKP4mMJVPh7+HOhVDBsrMTUvI4XpdElGpqss+C4lc5MpyhsJSsoUlLhCUhHW5gPZtI4AcOOKWFq1RcffhUw7w6ddRlkpmnppypqygqziHpRIU04ggEpN0m41WMwAeAZTGM07wuqEpUamhypy8jPSxX4tlueFnRnHM6JGu8REj15PI/DhwF/DDw54l4y4BYbxEmryFIl5txNFk35pTr8p4q3lLfTdZuhWmbUqGw2ka5xz4V8BcB1jhT+JDC2FqO3gvENXk5asUV+SSZCYlZ2XUpqaEu4MjSm0AlSQka5TYFJuF7xN/CzhOa/Fhw5bw9g2lymCK1Jvz9ZpklJtsySl04FSSttACFJcVMy6SkiyvNe+sBy3i1K4IZ/EximR4dYZo1Bo+F6VKUR9mlSrcsxMTilKedcKG0hOdObwjz8giYHlZNPxLTFZXpFZTt5Te0fP1pev19f8AyK2T5OslmzUwHG17G40jork6/TtSy9lKg3MZUNqzKJsBvftpFu7CadWxSOH3n0h+aSEI3tzMO7KcnVsLTLcmwBLsgEabbwItsKXy3dcyQVEWSnoesUJhBnnvEsM2e24gtWdqmecSpC3NRbKn6/8AiKL70hPS65hwMy7yUFCfMpWwJ15RFvRrTWa84ZaYYlfELrinAVO6CwvyHMaRWLab0jaqq7hQ4tPiWWg3IOn6xGaycdGj1CpJlZwvFWZC05FkqNgeoEYVs3nGZeqqXfKlYIBuLGw2iZsimHSuVMLS4R4hItmPeKT7b9dCl5spUt1KgMvw7iNYsxmJQZiXmHSqelXg084rKG+RH63itkREyakXnHElc1nDqFEBKiCO2sG9bRKQ8pxZDTblyfNvz6QWmYR31TCrNu2HLNfURMKTBl+XVoltaAbXNjuOcSzlFyX/AC1OaE231Bi5b0hPNuM3Js4L2JB1tBnEmFBJSFN2N/rF1bejbgNh5dYmJVj2jqTffSJUZl+kFRpBvAPJEAYT5gLC3OLQzk80xmVzMWhSW0YVw2/WKg1IyqQVO7q5JHMn5bd4pSNyXt6emsMUOWw/RGKbItoCEpzLzbrP8xPWO6mPbxeTknay1Nr7/rE1jSkftGyLR8WnWLSzxzuTYbVmiqxzwT0gFKdtIKsyiAJLYV8ItFwqm0pFrWvAD4dhuRANuNpN7q1gIE2nykJ1tpAU7yVZyrXSKB5pCukA8pOUQA+JlVv2hrSJg+25oIt20qNSrg+UReLBvKPQ+kaRINP8vKLEBzbjT6xG0xBE2J2ESgWXQ6QDd1AH1iOyZgypW99DDsroKlX010ie6PGBKCogakQ7nRipfN1iOyGu43SWcPuvLv4bL8u4uwvZIdSSfkIdkw9N/jD/ABM8EOJPEvgbXcDY5Zq0jhLE4qVZealJhIlJYTEoorIWgE6NrNkgnTuIlO2k/jo4wcOeOfE2h1HhRiVGIJanYVnZSZdYYdbCHluKKUfmJSSTcbQStuMv4gOEeNfwa8K+EmF8Xtz2LqOrDzU9TEyzyVsKl5YoeupSAjyq00UYbNNt/B1+K7g1wI4H4poeOcSFnEcrX6lPy9GRLPKenApKPDQhQQUArUmwJIA3OkN7TrSBg78W+Bq3+GfjRTOKmMkSfEbHMxXHUUpUs+olT0i3LyrLZCClKEpaQ2m6tkXOpJJDi/D7jlx/4G4F/h3DriJMS1MaY9rNHnZJqbQw6pILnglwEtgqzKKRpck2uSSV27n+Kr8VPBjifQODjmHceM1WoUHFlMrVdS1JPoMsy2j85xQUgDRR2TftEky6Pjv/APEU4bUPi5hdvB+IUYnwBOSLrOJnZeSdSuluF1IZmU50JUsAKUFoF7p1HmABhZzDCnGj8JnAj8Vr3EzhxjCWnsHY1pEzJVJiRpz4/wAPzZeac8RCVNg+zOFGqEAlKjoMoAEEe3a8K/ib/CRgPFuLsd//AJoq3XTiZaXzS6i/NTUpT8pUckm0GAWwc1rXOiUjlBMvH2Fat+DGa/Cliyaxe4kcVplyoPSgUHxNmZLijJ+BYZAwUqbKwd/PfXLAeysT0fgViD8G/CiU/EViN2i4d/hVBdZmGHnWs04Kf5UXQlRIKC7oRyvcECJQ89fiv488P+NNGwR+HP8AD7SapX6DSZloodp8o6pcwqXlVtsSsslyy3cqFLUtR/lTYk3gPVfDPixibhz+ECS4l8bcPztGrWF6M4y5L1JJbmZpTR8KWzJV50Les0CFAHMoki0B4TwbUqi3TpisV6ZcfrFenHqvUnFq1VMPnMr0NrX73gJmJqM5h/EFTw5NNgPU2cek3Aq5IU2spP6Rw5KxL2KalWKwwzPeZ6XQbbm1jaOacES13pcUjDlLpqD7LKttqXuoi5Ma+PTe2TsfmnsriW0akdNorMaZePZUzH5eZV7jQARC1fSBOeIp4rCRbTKVfeKNEB5TjKSpCrrUT3iZlaimmfFeaOXOseZS9diLW/rGcy0QE1J0S58JzI6sketopJWrUq45OTEutxLnmCioKtrdOpF+kZy3rCBMPt1WTbfeSpYeTmOpulXPWKy0xz1alWqKHm3Ms0u491K03Bt3AEYy2m+2tMrVLLVLvEh9CspTlNv384mE9tjenUNuDPcrIsUjS8JV+m/GLKi+4C2hemU65e6gI2hMSNT7M4+y1mIJurym37EVspaQ1CX8RQek1BpaU5VIBNlAf1gzZTHgttTrjhzXynqmJiFoSXglSSrNmNusSbQllLHlVqTt6QNsWqXUgKS2MwN97CLqovjM2VY6ncW0giUNTYSouIsRzAiYQYUHL7CyosrMkU15biLMwJSVdIB1LZzQVOpbva3zgrJUtjNlTexi/XTKJ2tqPT3p6YQzLtlZOmW2oiu9Lddu4cOcOy9NSnIErdWLOq5kcgO0OP8AWPKn06ohoJZSlI8wFj3j0Ivp4OSu5Z4XPpGe2mhJbzcotEqzB32fS43iUkLZ+8AOTNe409YAfD1IttAGlvLF0aI4m9uWkDRlbXr9YGjLjeh3+sDSM4yFXvc/OLSaRHJPMq/U6RnJovglNrcohAVJUrdIgG0y5UYmIDiWVJtFg54en+8TCumeGfT5xY0Tw1DbUxY0HwlRaJNFS0Uw2gaUb9+0NgSzoe8NKBVLq5W+cOmw14P8yReHjg7DQzsQItGODsc9nzRXxwKfFk1NUihTM/KZA43lGdaSpLaSoBSyBqcoJNu0PHA2DjHwrqfAnC+Hccqxs3img4p8ZmXTOUN2jTodQ0HA4hh0XWwoFPnNrZkgiJTKbi/gBirAmGa/VnOJuHqri3B1OlK3inBbFPcaXTZGYCSktzPuurQFpKxyBGpunMTpD4ccEK5xMw9hvEf/AKoUDCVYx+7UG8E4fm6e4+awZLR7x5lAyy11hSU5veNrXjPpC/Zr/C3CsxxNouNsX4p4gyHDyi8P/wCGs1OZmKG/UnjMTbq2UoDTfnFnWyk2BIzDuYmKnZcucJscjjpX+Ab2KKG1M4WQ9P1bFL8spErJ0xmWbfcmFNXJuA4lOUG1yNQPMLRGlVZjzBGIMF1PBslh7HFJxhQeJQb/AML4kRKOSiXFGZRLupfl1edCm1LSSO/W6RaJ0LLizwiqXCXDdaxbhbihS8esYarH+HMTyqaO7TpilVJYV4YSlf8AnMFSSkOA2J92+pDsr1hXYrwRS8IcHKNxep3HanVlWIFrYp1FRhOblzMzTKmxNy5fUMqPC8T31WC8pyk2No2dYSqBwOxpWPw9T/4gKZjF5blJlVVCeo1Rww/JSrkqHMp9mnSkNzCgLGyLjcXuLRWY2sj8IuEB4zMv1VfEmm4MlXMRSWFaQh6gvT66hUplhbyGypvRoZW13UqyQBqRpdWE7c/lW11ykzMtPJZTMH2iRcebRzSpSCpN9eV7RCfrouKeL3F/iFw4wtwgxjU6CcL4ScklyYlJFSJpwSrRaaDiyoj3SQbDXeJ2aV1AxJibBOLqJj/AdUl6bXsPrcVJrflkvsqS4nI4hSFDZSSRcWIubEHUETDZeJ3GzjJxzVJscWMXycxSJB9M0xRKXKCXky+AQHHL3W4RfQKJA5Wub2Vn2h4ZROYkxFS8OyK1qmKrOsyTQG5W4sIH3MEva34pfw+1Ceqr/E7BNNM2qYSDVpNlrM4FJAHjoSNVAgDMBrcZtbqIwvhdWDLv08tS6vKQvQjQjbWOaazDumRKdtcJ1tFZybb1hBdU2y5nWolR2SDpGU2ab0ZbfW5fwUm4N0iLE+jEy4ogJcUpChfyjXU8/SKFUBfmV+S8CQCd72+URLSin/iTcu055wkqJSQVWuesZy0UU1NN5UjMkuNEqGVW9+3OIleFTNTj6mktuSboCb2GSxIPO/72jOWkS1eRmlJmpuRSpYB8yU6XudwAdhGct716mJyXqi2lZmXMoGgK9oxlSrWZplxmYQouAO88xsBGsL60hzjzbzzhX4QKLhLmbS/rzhKs20iKnsx9wAkAK6GNIViwKdZdQK/EACG1FOXXnaK2JlaKUnIFITmI131PaJiBDmpV6VyvZRbZ8A235xK0H0iXynKpQvqnzXBHrBUw6kJ5ggm3eAjvMq1NwUkXtbWLjEKT4eVVj68oIkypvw1FSbWO+kTCkyYcCVG/MRZWZ0bXc2Glv1iyrPDyqFtrQBebOU20gqNOZJFtL7wVlOptOmJqYQ02yVuOqAbb5kde4iZuwiHUcN4Xco7IU9b2hw+ZVth0HQxlMtqy6ng+m+G2FWAI6c414/t5vJyem3JbTlKuZ7x22q86J2TLyJ9YouNOQenrFoVk74jcXQRSkKv6wDagn4b29YBMuW5Gl99bwGX/AJjeLgDZVrbc4ATtyvANObQDSkeX11gI7ifvANubaf3iNBuxPSGgaE3tEqlV7wHIxaIGeW2mpt1iIGZf5bCLAvDUUi294AwydlcosCLIGsEzBtKU65t/W0GZPKkG0OyeoVFNiLn6w8mjqYOU8/vFdyr0LFtydBeLZIHKJ3KqpxNTJirUz2aUEut1DzTyWpoEsu5FhWRwDUpNrG0NymFxxHxli3ithal8P6phjCuEMKUaZdqDFMw8y7Zc2tst+IVOqVkSlKjZCbDrfS1jawxXxn4t41wdOYJrlOwdKzFZk5amV/FcjIKRWa1JMZfDZecJtqEgKIGoAG1wRtFwDxk4ocKcNyOEsNUTBdZbw+7OOYWq9bkC7UMOe1D88SywbEKUSrUHzHW4skWip2c/pSsY4UwNjTh3QHqbNU3Hv8Ldqk1PZ/aG3pF9T6C2RcWWtRzXubfWHVHZs6uJ3E4caKl+ILwcPDElXcW3P0lbC3aXOSa5ZMu5LOoUcykLQgX13AMRMaXQsdcRMW4yxfgzFlew7SKRRcDzcoKVhrC0r4MtIyqJlLz5ZSs+Z5ZSCSSLkCKzOhsXGXjnU+NUxWKTh/AFEwTg+q4hNdm0S8gGKpWnUFXgrnlBSk3GYqKQbZiTrvFJtA53UJ7FdZwTh7hdU0U1OHcMT9Un5N9kLE26Z0AKSsny2TbS3XnE9hvExx84pzPCs8KZrDOEJgowynBrWIi2+ieRR0qSpLBQFeHmGQebLc2BOovExOxQ4W4n8TcF0jA2HcNSGFWKbgGvnErLaZZxC6zULqCZidWDdS0tK8JOW1k8zpZPpbShoclMSEh4c8tpUw686+6Wr5My1lRAvrbWIFgp4JglHdnG0J7+sAz/ABFKiALknaLqzD3J+Cb8Mtfp9Wl+MXEaluSBYQVUOnzCMrqlKBBmXEHVACSQgHUk5tLJKiHuKA8t/iyw3h2UZaq0rQaczPTC7vTLcq2l1w3+JYFz8zHJl+u7A8hvbP8A/SY47O6PqHK6qVfXeM3RPwPxfSNkI8uSZhy5J1iggD3n/wB84iV6Ncn0p8Y+Uc+UZy6qfEGXQj+JI8o2PLvFZVt8S61/7T99ozMP1yeuaVdl0aLufMN/rGdnfn+LRK12HnVuefeMpefP1TYpQjw1+RPu9I0TCheaa/w8x+Wn3+kGkNamicx1jSiRSJImVWJH5Z//ALCF1mwM/wCWIQDVqld9d/0MSKaSUr2UeY8+feAkr/y0/KADmf8Ap/tFxGd90f8AVBEiT/ln0ETCEfmr/qiygV8vWJhQZ98ekSJCOUFSH/NV84Ky6JwmSldedK0hXhsHJcXy6cukRZjf66jlTY+Uc+Uc9mn+Nowx/k/KOvB9eNmbD/yx8o7J+OegFe6fSKJkCucXVInaLFip94/OBUSdz++cAcA0vdPz/WLjEbGAw/2gGnPdMA2r/LgI7mw/fOAZd2MAKeXoIoDRsIuqFz3hAD8UTAd6RYSG9vrAOfCPSLAFe6YCKrcesFZAefrFLLVNq935RVaTQ/p/eCpPhEAvwxdiM7D98oAHPeEaQGHdvl/SLQIbm5/fSNKqSaV7xhZaqM5zjOGhv/mH/pMZ2AK2/fSMgre6vSL1DSucWEY+/wDIwXH8MAy9tAVs1uYD6A/gNwXg6epL1fncJ0aYqcmG3JeddkGlvsqyDzIcKcyT3BgrL2nF0P/Z', 'base64'), 'image/jpeg', FALSE);
 
 INSERT INTO frog_cafe.menu
 (dish_name, image, is_available, description, category, quantity_left)
@@ -0,0 +1,28 @@
+-- Корзина хранит количество вместо строки на каждую порцию.
+-- Существующие строки (order_id, menu_item) сворачиваются в одну с суммой.
+-- Скрипт идемпотентен: повторный запуск на уже свёрнутой таблице ничего не меняет.
+
+ALTER TABLE frog_cafe.Cart ADD COLUMN IF NOT EXISTS Quantity INT NOT NULL DEFAULT 1;
+
+CREATE TEMP TABLE cart_folded ON COMMIT DROP AS
+SELECT MIN(id) AS id, SUM(quantity) AS quantity
+FROM frog_cafe.cart
+GROUP BY order_id, menu_item;
+
+DELETE FROM frog_cafe.cart c
+WHERE NOT EXISTS (SELECT 1 FROM cart_folded f WHERE f.id = c.id);
+
+UPDATE frog_cafe.cart c
+SET quantity = f.quantity
+FROM cart_folded f
+WHERE f.id = c.id AND c.quantity <> f.quantity;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'cart_order_id_menu_item_key') THEN
+        ALTER TABLE frog_cafe.cart ADD CONSTRAINT cart_order_id_menu_item_key UNIQUE (order_id, menu_item);
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'cart_quantity_check') THEN
+        ALTER TABLE frog_cafe.cart ADD CONSTRAINT cart_quantity_check CHECK (quantity > 0);
+    END IF;
+END $$;
@@ -0,0 +1,27 @@
+-- Картинки жаб хранятся в бинарном виде (bytea) вместо base64 data-URI в TEXT.
+-- Тип содержимого вынимается из data-URI, ETag считается базой из самих байтов.
+-- Скрипт идемпотентен: если Pic уже bytea, ничего не происходит.
+
+DO $$
+BEGIN
+    IF (SELECT data_type FROM information_schema.columns
+        WHERE table_schema = 'frog_cafe' AND table_name = 'toads' AND column_name = 'pic') = 'text' THEN
+
+        ALTER TABLE frog_cafe.toads
+            ADD COLUMN Content_type TEXT NOT NULL DEFAULT 'application/octet-stream';
+
+        UPDATE frog_cafe.toads
+        SET content_type = substring(pic FROM '^data:([^;,]+);base64,')
+        WHERE pic ~ '^data:[^;,]+;base64,';
+
+        ALTER TABLE frog_cafe.toads
+            ALTER COLUMN pic TYPE BYTEA
+            USING CASE
+                WHEN pic ~ '^data:[^;,]+;base64,' THEN decode(substring(pic FROM position(',' IN pic) + 1), 'base64')
+                ELSE convert_to(pic, 'UTF8')
+            END;
+
+        ALTER TABLE frog_cafe.toads
+            ADD COLUMN Etag TEXT GENERATED ALWAYS AS (encode(sha256(pic), 'hex')) STORED;
+    END IF;
+END $$;
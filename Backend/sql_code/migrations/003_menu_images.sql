@@ -0,0 +1,12 @@
+-- Варианты картинок блюд (WebP), адресуемые sha256 содержимого,
+-- и ссылка на миниатюру у позиции меню.
+
+CREATE TABLE IF NOT EXISTS frog_cafe.Images (
+    Hash TEXT PRIMARY KEY,
+    Content_type TEXT NOT NULL,
+    Data BYTEA NOT NULL,
+    Width INT NOT NULL,
+    Height INT NOT NULL
+);
+
+ALTER TABLE frog_cafe.Menu ADD COLUMN IF NOT EXISTS Image_thumb TEXT;
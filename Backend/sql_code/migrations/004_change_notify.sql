@@ -0,0 +1,39 @@
+-- Триггеры на orders, cart и menu шлют NOTIFY в канал frog_cafe_changes.
+-- Payload: {"table": ..., "op": INSERT|UPDATE|DELETE, "id": ...}
+-- плюс order_id для cart и status_id для orders.
+
+CREATE OR REPLACE FUNCTION frog_cafe.notify_change() RETURNS trigger AS $$
+DECLARE
+    rec JSONB;
+    payload JSONB;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        rec := to_jsonb(OLD);
+    ELSE
+        rec := to_jsonb(NEW);
+    END IF;
+    payload := jsonb_build_object('table', TG_TABLE_NAME, 'op', TG_OP, 'id', rec->'id');
+    IF TG_TABLE_NAME = 'cart' THEN
+        payload := payload || jsonb_build_object('order_id', rec->'order_id');
+    ELSIF TG_TABLE_NAME = 'orders' THEN
+        payload := payload || jsonb_build_object('status_id', rec->'status_id');
+    END IF;
+    PERFORM pg_notify('frog_cafe_changes', payload::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS orders_notify_change ON frog_cafe.orders;
+CREATE TRIGGER orders_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON frog_cafe.orders
+FOR EACH ROW EXECUTE FUNCTION frog_cafe.notify_change();
+
+DROP TRIGGER IF EXISTS cart_notify_change ON frog_cafe.cart;
+CREATE TRIGGER cart_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON frog_cafe.cart
+FOR EACH ROW EXECUTE FUNCTION frog_cafe.notify_change();
+
+DROP TRIGGER IF EXISTS menu_notify_change ON frog_cafe.menu;
+CREATE TRIGGER menu_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON frog_cafe.menu
+FOR EACH ROW EXECUTE FUNCTION frog_cafe.notify_change();
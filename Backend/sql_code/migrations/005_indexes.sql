@@ -0,0 +1,21 @@
+-- Вторичные индексы под запросы API и уникальность имени пользователя.
+-- Раннер выполняет файл в одной транзакции вместе с записью версии.
+-- cart.order_id отдельно не индексируется: его покрывает cart_order_id_menu_item_key.
+
+-- Список заказов: keyset-пагинация по (created_at, id), с фильтром по статусу и без
+CREATE INDEX IF NOT EXISTS orders_created_at_id_idx ON frog_cafe.orders (created_at, id);
+CREATE INDEX IF NOT EXISTS orders_status_id_created_at_idx ON frog_cafe.orders (status_id, created_at, id);
+
+-- Проверка ссылок из корзины при удалении блюда
+CREATE INDEX IF NOT EXISTS cart_menu_item_idx ON frog_cafe.cart (menu_item);
+
+-- Поиск свободной жабы при создании заказа
+CREATE INDEX IF NOT EXISTS toads_free_idx ON frog_cafe.toads (id) WHERE is_taken = false;
+
+-- Логин ищет пользователя по имени; дубликаты имён надо разрешить до миграции
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'users_name_key') THEN
+        ALTER TABLE frog_cafe.users ADD CONSTRAINT users_name_key UNIQUE (name);
+    END IF;
+END $$;
@@ -0,0 +1,12 @@
+-- Справочники статусов и ролей тоже шлют NOTIFY frog_cafe_changes:
+-- каждый воркер держит их в памяти и перечитывает при изменении.
+
+DROP TRIGGER IF EXISTS order_statuses_notify_change ON frog_cafe.order_statuses;
+CREATE TRIGGER order_statuses_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON frog_cafe.order_statuses
+FOR EACH ROW EXECUTE FUNCTION frog_cafe.notify_change();
+
+DROP TRIGGER IF EXISTS roles_notify_change ON frog_cafe.roles;
+CREATE TRIGGER roles_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON frog_cafe.roles
+FOR EACH ROW EXECUTE FUNCTION frog_cafe.notify_change();
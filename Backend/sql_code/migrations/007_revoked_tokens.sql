@@ -0,0 +1,35 @@
+-- Отозванные JWT (по jti). Строка живёт до истечения самого токена.
+-- Триггер шлёт jti в frog_cafe_changes, чтобы отзыв сразу увидели все воркеры.
+
+CREATE TABLE IF NOT EXISTS frog_cafe.Revoked_tokens (
+    Jti TEXT PRIMARY KEY,
+    Expires_at TIMESTAMP NOT NULL
+);
+
+CREATE OR REPLACE FUNCTION frog_cafe.notify_change() RETURNS trigger AS $$
+DECLARE
+    rec JSONB;
+    payload JSONB;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        rec := to_jsonb(OLD);
+    ELSE
+        rec := to_jsonb(NEW);
+    END IF;
+    payload := jsonb_build_object('table', TG_TABLE_NAME, 'op', TG_OP, 'id', rec->'id');
+    IF TG_TABLE_NAME = 'cart' THEN
+        payload := payload || jsonb_build_object('order_id', rec->'order_id');
+    ELSIF TG_TABLE_NAME = 'orders' THEN
+        payload := payload || jsonb_build_object('status_id', rec->'status_id');
+    ELSIF TG_TABLE_NAME = 'revoked_tokens' THEN
+        payload := payload || jsonb_build_object('jti', rec->'jti');
+    END IF;
+    PERFORM pg_notify('frog_cafe_changes', payload::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS revoked_tokens_notify_change ON frog_cafe.revoked_tokens;
+CREATE TRIGGER revoked_tokens_notify_change
+AFTER INSERT OR UPDATE OR DELETE ON frog_cafe.revoked_tokens
+FOR EACH ROW EXECUTE FUNCTION frog_cafe.notify_change();
@@ -0,0 +1,30 @@
+-- NOTIFY об отзыве токена несёт его срок (exp, секунды epoch): воркеры
+-- держат jti в памяти только до истечения токена.
+
+CREATE OR REPLACE FUNCTION frog_cafe.notify_change() RETURNS trigger AS $$
+DECLARE
+    rec JSONB;
+    payload JSONB;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        rec := to_jsonb(OLD);
+    ELSE
+        rec := to_jsonb(NEW);
+    END IF;
+    payload := jsonb_build_object('table', TG_TABLE_NAME, 'op', TG_OP, 'id', rec->'id');
+    IF TG_TABLE_NAME = 'cart' THEN
+        payload := payload || jsonb_build_object('order_id', rec->'order_id');
+    ELSIF TG_TABLE_NAME = 'orders' THEN
+        payload := payload || jsonb_build_object('status_id', rec->'status_id');
+    ELSIF TG_TABLE_NAME = 'revoked_tokens' THEN
+        payload := payload || jsonb_build_object(
+            'jti', rec->'jti',
+            'exp', extract(epoch FROM (rec->>'expires_at')::timestamp AT TIME ZONE 'UTC')
+        );
+    ELSIF TG_TABLE_NAME = 'menu' THEN
+        payload := payload || jsonb_build_object('dish_name', rec->'dish_name');
+    END IF;
+    PERFORM pg_notify('frog_cafe_changes', payload::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, HTTPException
+from src.schemas import SlowQuery, LogLevelUpdate
+from src.dependencies import require_role
+from src.querylog import slow_plans
+from src.logs import get_levels, set_level
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+# GET /api/admin/slow-queries — планы последних медленных запросов этого воркера, новые первыми
+@router.get("/slow-queries", response_model=list[SlowQuery], dependencies=[Depends(require_role([0]))])
+async def get_slow_queries():
+    return list(reversed(slow_plans))
+
+@router.delete("/slow-queries", status_code=204, dependencies=[Depends(require_role([0]))])
+async def clear_slow_queries():
+    slow_plans.clear()
+
+# Уровни логирования этого воркера; PUT меняет уровень одного логгера без перезапуска
+@router.get("/log-levels", response_model=dict[str, str], dependencies=[Depends(require_role([0]))])
+async def get_log_levels():
+    return get_levels()
+
+@router.put("/log-levels", response_model=dict[str, str], dependencies=[Depends(require_role([0]))])
+async def update_log_level(update: LogLevelUpdate):
+    try:
+        set_level(update.logger, update.level)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Неизвестный уровень логирования")
+    return get_levels()
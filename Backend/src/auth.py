@@ -1,16 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException
 import logging
-from src.db import get_db_connection
-from src.schemas import UserResponse, LoginRequest, TokenResponse
-import bcrypt
+from src.db import checkout, get_db
+from src.schemas import UserResponse, LoginRequest, TokenResponse, TokenRevoke
+from src.passwords import check_capacity, verify_password
+from src.dependencies import decode_token, oauth2_scheme, require_role
+from src.tokens import revoked_tokens
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
 import os
+import psycopg
+import uuid
 
 router = APIRouter()
 
-# Настройка логирования
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Секрет и алгоритм для JWT
@@ -21,23 +23,40 @@ ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_EXPIRE_MINUTES", 60))
 def create_access_token(data: dict, expires_delta: timedelta = None):
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
-    to_encode.update({"exp": expire})
+    # jti — по нему токен можно отозвать до истечения
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 @router.post("/auth/login/", response_model=TokenResponse)
-def login(login_data: LoginRequest):
-    logger.info(f"Login attempt - username: {login_data.username}")
-    conn = get_db_connection()
-    cur = conn.cursor()
-    query = "SELECT * FROM frog_cafe.users WHERE name = %s"
-    cur.execute(query, (login_data.username,))
-    user = cur.fetchone()
-    cur.close()
-    conn.close()
-    if not user or not bcrypt.checkpw(login_data.password.encode("utf-8"), user["pass"].encode("utf-8")):
-        logger.warning(f"Invalid credentials for user: {login_data.username}")
+async def login(login_data: LoginRequest):
+    logger.debug("Login attempt - username: %s", login_data.username)
+    # Очередь bcrypt полна — отказываем сразу, не занимая соединение из пула
+    check_capacity()
+    async with checkout() as conn:
+        cur = await conn.execute(
+            "SELECT id, name, pass, role_id FROM frog_cafe.users WHERE name = %s",
+            (login_data.username,),
+        )
+        user = await cur.fetchone()
+    # bcrypt считается ~250 мс — в пуле процессов и без соединения с базой:
+    # шторм входов не должен занять весь пул
+    ok, new_hash = await verify_password(login_data.password, user["pass"]) if user else (False, None)
+    if not ok:
+        logger.warning("Invalid credentials for user: %s", login_data.username)
         raise HTTPException(status_code=401, detail="Вы кто такой? Я вас не звал")
+    if new_hash:
+        # Стоимость bcrypt поменялась — тихо пересохраняем хеш, пока пароль под рукой.
+        # Не вышло — пересохраним при следующем входе
+        try:
+            async with checkout() as conn:
+                await conn.execute(
+                    "UPDATE frog_cafe.users SET pass = %s WHERE id = %s AND pass = %s;",
+                    (new_hash, user["id"], user["pass"]),
+                )
+                await conn.commit()
+        except (HTTPException, psycopg.Error) as e:
+            logger.error("Error rehashing password for user %s: %s", user["id"], e)
     # Генерируем JWT-токен
     access_token = create_access_token({
         "sub": str(user["id"]),
@@ -48,4 +67,27 @@ def login(login_data: LoginRequest):
     "access_token": access_token,
     "token_type": "bearer",
     "role_id": user["role_id"]
-}
\ No newline at end of file
+}
+
+# POST /auth/logout — отзывает токен, с которым пришёл запрос
+@router.post("/auth/logout/", status_code=204)
+async def logout(token: str = Depends(oauth2_scheme), conn=Depends(get_db)):
+    decode_token(token)
+    await revoke_token(token, conn)
+    return
+
+# POST /auth/revoke — админ отзывает чужой токен, например с потерянного планшета
+@router.post("/auth/revoke/", status_code=204, dependencies=[Depends(require_role([0]))])
+async def revoke(data: TokenRevoke, conn=Depends(get_db)):
+    await revoke_token(data.token, conn)
+    return
+
+async def revoke_token(token: str, conn):
+    try:
+        # Истёкший токен тоже можно отозвать, но подпись должна быть нашей
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM], options={"verify_exp": False})
+    except JWTError:
+        raise HTTPException(status_code=400, detail="Некорректный токен")
+    if not payload.get("jti") or not payload.get("exp"):
+        raise HTTPException(status_code=400, detail="Токен нельзя отозвать: в нём нет jti")
+    await revoked_tokens.revoke(conn, payload["jti"], payload["exp"])
@@ -0,0 +1,223 @@
+from src.db import get_pool
+from src.events import event_bus, RESYNC
+from src.registry import status_registry, DELIVERED_STATUS
+import asyncio
+import contextlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+TV_STATUSES = ("Готовится", "Готов")
+
+ACTIVE_ORDERS_QUERY = """
+    SELECT
+        o.id,
+        o.created_at,
+        o.status_id,
+        COALESCE(
+            json_agg(
+                json_build_object(
+                    'id', m.id,
+                    'dish_name', m.dish_name,
+                    'quantity', c.quantity
+                ) ORDER BY c.id
+            ) FILTER (WHERE m.id IS NOT NULL),
+            '[]'::json
+        ) AS items
+    FROM frog_cafe.orders o
+    LEFT JOIN frog_cafe.cart c ON c.order_id = o.id
+    LEFT JOIN frog_cafe.menu m ON c.menu_item = m.id
+    WHERE o.status_id IS DISTINCT FROM %s {extra}
+    GROUP BY o.id, o.created_at, o.status_id;
+"""
+
+
+class ActiveOrders:
+    """Проекция невыданных заказов в памяти процесса, по id заказа.
+
+    Загружается один раз при старте, дальше обновляется обработчиками
+    заказов и корзины напрямую, а изменения из других воркеров приходят
+    через шину: затронутые заказы перечитываются одной пачкой.
+    Табло читает только её и в базу не ходит. Хранится id статуса,
+    имя подставляется из справочника при чтении.
+    """
+
+    DEBOUNCE_SECONDS = 0.05
+
+    def __init__(self):
+        self._orders = {}
+        self._listeners = []
+        self._dirty = set()
+        self._reload_all = True
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self.loaded = False
+        # Растёт при каждом изменении: по ней табло понимает, что готовый JSON устарел
+        self.version = 0
+
+    def on_change(self, callback):
+        self._listeners.append(callback)
+
+    def _changed(self):
+        self.version += 1
+        for callback in self._listeners:
+            callback()
+
+    # --- чтение ---
+
+    def _with_status(self, order):
+        # Ровно поля TVOrder: табло сериализуется без повторной валидации
+        return {
+            "id": order["id"],
+            "created_at": order["created_at"],
+            "status": status_registry.name(order["status_id"]),
+            "items": order["items"],
+        }
+
+    def tv_orders(self):
+        """Заказы в работе и готовые, от старых к новым."""
+        tv_ids = {status_registry.id(name) for name in TV_STATUSES}
+        orders = [o for o in self._orders.values() if o["status_id"] in tv_ids]
+        orders.sort(key=lambda o: (o["created_at"], o["id"]))
+        return [self._with_status(o) for o in orders]
+
+    def display_orders(self):
+        """Все невыданные заказы, от новых к старым."""
+        orders = list(self._orders.values())
+        orders.sort(key=lambda o: (o["created_at"], o["id"]), reverse=True)
+        return [self._with_status(o) for o in orders]
+
+    # --- прямые обновления из обработчиков ---
+
+    def put(self, order: dict, status_id: int):
+        """Кладёт заказ целиком (id, created_at, items); выданный убирает."""
+        if self._put(order, status_id):
+            self._changed()
+
+    def put_many(self, orders):
+        """То же для пачки заказов (у каждого свой status_id); табло узнаёт об этом один раз."""
+        changed = False
+        for order in orders:
+            changed = self._put(order, order["status_id"]) or changed
+        if changed:
+            self._changed()
+
+    def _put(self, order: dict, status_id: int) -> bool:
+        if status_id == status_registry.id(DELIVERED_STATUS):
+            return self._orders.pop(order["id"], None) is not None
+        self._orders[order["id"]] = {
+            "id": order["id"],
+            "created_at": order["created_at"],
+            "status_id": status_id,
+            "items": [
+                {"id": item["id"], "dish_name": item["dish_name"], "quantity": item["quantity"]}
+                for item in order["items"]
+            ],
+        }
+        return True
+
+    def remove(self, order_id: int):
+        if self._orders.pop(order_id, None) is not None:
+            self._changed()
+
+    def clear(self):
+        self._orders.clear()
+        self._changed()
+
+    # --- синхронизация с базой ---
+
+    async def load(self):
+        async with get_pool().connection() as conn:
+            cur = await conn.execute(ACTIVE_ORDERS_QUERY.format(extra=""), (status_registry.id(DELIVERED_STATUS),))
+            rows = await cur.fetchall()
+        self._orders = {row["id"]: row for row in rows}
+        self.loaded = True
+        self._changed()
+
+    async def refresh(self, order_ids):
+        async with get_pool().connection() as conn:
+            cur = await conn.execute(
+                ACTIVE_ORDERS_QUERY.format(extra="AND o.id = ANY(%s)"),
+                (status_registry.id(DELIVERED_STATUS), list(order_ids)),
+            )
+            rows = await cur.fetchall()
+        fresh = {row["id"]: row for row in rows}
+        for order_id in order_ids:
+            if order_id in fresh:
+                self._orders[order_id] = fresh[order_id]
+            else:
+                self._orders.pop(order_id, None)
+        self._changed()
+
+    async def ensure_loaded(self):
+        if not self.loaded:
+            await self.load()
+
+    def mark_dirty(self, order_id):
+        self._dirty.add(order_id)
+        self._wakeup.set()
+
+    def mark_all_dirty(self):
+        self._reload_all = True
+        self._wakeup.set()
+
+    def handle_event(self, event: dict):
+        if event.get("op") == RESYNC:
+            self.mark_all_dirty()
+        elif event["table"] == "orders" and event.get("id") is not None:
+            self.mark_dirty(event["id"])
+        elif event["table"] == "cart" and event.get("order_id") is not None:
+            self.mark_dirty(event["order_id"])
+        elif event["table"] == "menu" and event.get("id") is not None:
+            # Переименование блюда: перечитываем только заказы, где у него старое имя.
+            # Прочие правки меню (например, списание quantity_left на каждое
+            # добавление в корзину) табло не касаются
+            name = event.get("dish_name")
+            for order in self._orders.values():
+                if any(
+                    item["id"] == event["id"] and item["dish_name"] != name
+                    for item in order["items"]
+                ):
+                    self.mark_dirty(order["id"])
+
+    async def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._sync())
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._orders = {}
+        self._dirty = set()
+        self._reload_all = True
+        self._wakeup = asyncio.Event()
+        self.loaded = False
+        self.version += 1
+
+    async def _sync(self):
+        while True:
+            if not self._reload_all and not self._dirty:
+                await self._wakeup.wait()
+            await asyncio.sleep(self.DEBOUNCE_SECONDS)
+            self._wakeup.clear()
+            reload_all, self._reload_all = self._reload_all, False
+            dirty, self._dirty = self._dirty, set()
+            try:
+                if reload_all:
+                    await self.load()
+                elif dirty:
+                    await self.refresh(dirty)
+            except Exception as e:
+                logger.error("Error syncing active orders: %s", e)
+                self._reload_all = self._reload_all or reload_all
+                self._dirty |= dirty
+                await asyncio.sleep(1)
+
+
+active_orders = ActiveOrders()
+event_bus.subscribe(["orders", "cart", "menu"], active_orders.handle_event)
+# Переименование статуса меняет табло, а смена id выданного — состав проекции
+status_registry.on_change(active_orders.mark_all_dirty)
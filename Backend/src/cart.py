@@ -1,63 +1,62 @@
 from fastapi import APIRouter, Depends, HTTPException
-from src.db import get_db_connection
+from collections import Counter
+from src.db import get_db
 from src.dependencies import get_current_user
+from src.menu import menu_cache
+from src.board import active_orders
+from src.registry import status_registry, CREATED_STATUS
 from src.schemas import CartItem, CartAddMultiple, Order
+from src.responses import TrustedJSON
 
 router = APIRouter(prefix="/cart", tags=["cart"])
 
+order_json = TrustedJSON(Order)
+
 @router.get("/{order_id}", response_model=list[CartItem])
-def get_cart(order_id: int, current_user=Depends(get_current_user)):
-    conn = get_db_connection()
+async def get_cart(order_id: int, current_user=Depends(get_current_user), conn=Depends(get_db)):
     cur = conn.cursor()
 
     # Проверка: владелец или админ?
-    cur.execute("SELECT user_id FROM frog_cafe.orders WHERE id = %s;", (order_id,))
-    order = cur.fetchone()
+    await cur.execute("SELECT user_id FROM frog_cafe.orders WHERE id = %s;", (order_id,))
+    order = await cur.fetchone()
 
     if not order:
-        cur.close()
-        conn.close()
+        await cur.close()
         raise HTTPException(status_code=404, detail="Заказ не найден")
 
     is_admin = current_user["role_id"] == 0
     is_owner = order["user_id"] == current_user["user_id"]
 
     if not (is_admin or is_owner):
-        cur.close()
-        conn.close()
+        await cur.close()
         raise HTTPException(status_code=403, detail="Нет доступа к заказу")
 
     # Получаем блюда из корзины
-    cur.execute("""
-        SELECT m.id, m.dish_name, m.image, m.description, m.is_available
+    await cur.execute("""
+        SELECT m.id, m.dish_name, m.image, m.image_thumb, m.description, m.is_available, c.quantity
         FROM frog_cafe.cart c
         JOIN frog_cafe.menu m ON c.menu_item = m.id
         WHERE c.order_id = %s
+        ORDER BY c.id
     """, (order_id,))
 
-    items = cur.fetchall()
-    cur.close()
-    conn.close()
+    items = await cur.fetchall()
+    await cur.close()
     return items
 
 @router.post("/{order_id}", response_model=Order)
-def add_multiple_to_cart(order_id: int, items: CartAddMultiple, current_user=Depends(get_current_user)):
-    conn = get_db_connection()
+async def add_multiple_to_cart(order_id: int, items: CartAddMultiple, current_user=Depends(get_current_user), conn=Depends(get_db)):
     cur = conn.cursor()
 
     try:
-        # Start transaction
-        cur.execute("BEGIN;")
-
         # Check order exists and get its details
-        cur.execute("""
-            SELECT o.user_id, o.status_id, s.name as status
-            FROM frog_cafe.orders o
-            JOIN frog_cafe.order_statuses s ON o.status_id = s.id
-            WHERE o.id = %s
+        await cur.execute("""
+            SELECT user_id, status_id
+            FROM frog_cafe.orders
+            WHERE id = %s
             FOR UPDATE;
         """, (order_id,))
-        order = cur.fetchone()
+        order = await cur.fetchone()
 
         if not order:
             raise HTTPException(
@@ -76,99 +75,135 @@ def add_multiple_to_cart(order_id: int, items: CartAddMultiple, current_user=Dep
             )
 
         # Check order status
-        if order["status"] != "Создан":
+        if order["status_id"] != await status_registry.get_id(CREATED_STATUS):
             raise HTTPException(
                 status_code=400,
                 detail="Нельзя добавить товары в заказ с текущим статусом"
             )
 
-        # Check menu items availability
-        for menu_item_id in items.menu_items:
-            cur.execute("""
+        # Схлопываем запрос до количеств: [3, 3, 5] -> {3: 2, 5: 1}
+        counts = Counter(items.menu_items)
+        menu_ids = sorted(counts)
+        quantities = [counts[menu_id] for menu_id in menu_ids]
+
+        if counts:
+            # Блокируем все позиции одним запросом в порядке id — без дедлоков между заказами
+            await cur.execute("""
                 SELECT id, dish_name, quantity_left, is_available
                 FROM frog_cafe.menu
-                WHERE id = %s
+                WHERE id = ANY(%s)
+                ORDER BY id
                 FOR UPDATE;
-            """, (menu_item_id,))
-            menu_item = cur.fetchone()
-
-            if not menu_item:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Я дико извиняюсь, а вы о чем вообще"
-                )
-
-            if not menu_item["is_available"]:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"А все, а надо было раньше"
-                )
-
-            if menu_item["quantity_left"] < 1:
+            """, (menu_ids,))
+            menu_items = {row["id"]: row for row in await cur.fetchall()}
+
+            # Check menu items availability
+            for menu_item_id in menu_ids:
+                menu_item = menu_items.get(menu_item_id)
+
+                if not menu_item:
+                    raise HTTPException(
+                        status_code=400, 
+                        detail=f"Я дико извиняюсь, а вы о чем вообще"
+                    )
+
+                if not menu_item["is_available"]:
+                    raise HTTPException(
+                        status_code=400, 
+                        detail=f"А все, а надо было раньше"
+                    )
+
+                if menu_item["quantity_left"] < counts[menu_item_id]:
+                    raise HTTPException(
+                        status_code=400, 
+                        detail=f"'{menu_item['dish_name']}' схавали"
+                    )
+
+            # Списываем остатки одним условным UPDATE
+            await cur.execute("""
+                UPDATE frog_cafe.menu m
+                SET quantity_left = m.quantity_left - r.quantity
+                FROM unnest(%s::int[], %s::int[]) AS r(id, quantity)
+                WHERE m.id = r.id
+                  AND m.is_available
+                  AND m.quantity_left >= r.quantity;
+            """, (menu_ids, quantities))
+
+            if cur.rowcount != len(menu_ids):
                 raise HTTPException(
-                    status_code=400, 
-                    detail=f"'{menu_item['dish_name']}' схавали"
+                    status_code=400,
+                    detail="Не удалось списать остатки блюд"
                 )
 
-        # Add items to cart and update quantities
-        for menu_item_id in items.menu_items:
-            # Add to cart
-            cur.execute("""
-                INSERT INTO frog_cafe.cart (order_id, menu_item)
-                VALUES (%s, %s);
-            """, (order_id, menu_item_id))
-
-            # Update quantity
-            cur.execute("""
-                UPDATE frog_cafe.menu
-                SET quantity_left = quantity_left - 1
-                WHERE id = %s;
-            """, (menu_item_id,))
-
-        # Get updated order details
-        cur.execute("""
+            # Add items to cart одним многострочным upsert: повторное блюдо увеличивает количество
+            await cur.execute("""
+                INSERT INTO frog_cafe.cart (order_id, menu_item, quantity)
+                SELECT %s, r.id, r.quantity
+                FROM unnest(%s::int[], %s::int[]) AS r(id, quantity)
+                ON CONFLICT (order_id, menu_item)
+                DO UPDATE SET quantity = frog_cafe.cart.quantity + EXCLUDED.quantity;
+            """, (order_id, menu_ids, quantities))
+
+        # Обновлённый заказ: база сразу собирает весь ответ (body) в JSON,
+        # он уходит клиенту без разбора; items — короткий список для табло.
+        # В корзину добавляют только в созданный заказ, статус известен
+        await cur.execute("""
             WITH cart_items AS (
                 SELECT 
                     m.id,
                     m.dish_name,
                     m.image,
+                    m.image_thumb,
                     m.is_available,
                     m.description,
                     m.category,
                     m.quantity_left,
-                    COUNT(*) as quantity
+                    c.quantity
                 FROM frog_cafe.cart c
                 JOIN frog_cafe.menu m ON c.menu_item = m.id
-                WHERE c.order_id = %s
-                GROUP BY m.id, m.dish_name, m.image, m.is_available, m.description, m.category, m.quantity_left
+                WHERE c.order_id = %(order_id)s
             )
             SELECT 
                 o.id,
                 o.created_at,
-                s.name as status,
                 COALESCE(
                     json_agg(
                         json_build_object(
                             'id', ci.id,
                             'dish_name', ci.dish_name,
-                            'image', ci.image,
-                            'is_available', ci.is_available,
-                            'description', ci.description,
-                            'category', ci.category,
-                            'quantity_left', ci.quantity_left,
                             'quantity', ci.quantity
                         )
                     ) FILTER (WHERE ci.id IS NOT NULL),
                     '[]'::json
-                ) as items
+                ) AS items,
+                json_build_object(
+                    'id', o.id,
+                    'created_at', o.created_at,
+                    'status', %(status)s::text,
+                    'items', COALESCE(
+                        json_agg(
+                            json_build_object(
+                                'id', ci.id,
+                                'dish_name', ci.dish_name,
+                                'image', ci.image,
+                                'image_thumb', ci.image_thumb,
+                                'is_available', ci.is_available,
+                                'description', ci.description,
+                                'category', ci.category,
+                                'quantity_left', ci.quantity_left,
+                                'quantity', ci.quantity
+                            )
+                        ) FILTER (WHERE ci.id IS NOT NULL),
+                        '[]'::json
+                    )
+                )::text AS body
             FROM frog_cafe.orders o
-            JOIN frog_cafe.order_statuses s ON o.status_id = s.id
             LEFT JOIN cart_items ci ON true
-            WHERE o.id = %s
-            GROUP BY o.id, o.created_at, s.name;
-        """, (order_id, order_id))
+            WHERE o.id = %(order_id)s
+            GROUP BY o.id, o.created_at;
+        """, {"order_id": order_id, "status": CREATED_STATUS})
 
-        updated_order = cur.fetchone()
+        updated_order = await cur.fetchone()
         
         if not updated_order:
             raise HTTPException(
@@ -177,18 +212,20 @@ def add_multiple_to_cart(order_id: int, items: CartAddMultiple, current_user=Dep
             )
 
         # Commit transaction
-        conn.commit()
-        return updated_order
+        await conn.commit()
+        # Остатки поменялись — снимок меню устарел
+        menu_cache.invalidate()
+        active_orders.put(updated_order, order["status_id"])
+        return order_json.passthrough(updated_order["body"])
 
     except HTTPException:
-        conn.rollback()
+        await conn.rollback()
         raise
     except Exception as e:
-        conn.rollback()
+        await conn.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"Ошибка при добавлении товаров в корзину: {str(e)}"
         )
     finally:
-        cur.close()
-        conn.close()
+        await cur.close()
@@ -0,0 +1,167 @@
+from fastapi import Response
+from starlette.datastructures import Headers, MutableHeaders
+import gzip
+import os
+
+try:
+    import brotli
+except ImportError:
+    # Без пакета brotli отвечаем gzip'ом
+    brotli = None
+
+# Сжатие ответов API. Кодировка выбирается по Accept-Encoding: br, если есть brotli, иначе gzip.
+
+# Ответы меньше этого, байты, отдаются как есть: заголовки дороже выигрыша
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", 1024))
+# Уровни для ответов, которые сжимаются на каждый запрос: быстро, но заметно
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", 6))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", 5))
+# Снимки (меню, табло) сжимаются один раз на изменение — можно сильнее
+STATIC_GZIP_LEVEL = 9
+STATIC_BROTLI_QUALITY = 9
+
+# Уже сжатое и потоки: повторное сжатие только тратит CPU, а поток его ждать не может
+SKIP_CONTENT_TYPES = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff",
+    "application/gzip",
+    "application/zip",
+    "application/octet-stream",
+    "text/event-stream",
+)
+
+
+def choose_encoding(accept_encoding) -> str:
+    """Лучшая кодировка из Accept-Encoding, которую мы умеем, или None."""
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+    wildcard = accepted.get("*", 0.0)
+    for encoding in ("br", "gzip") if brotli is not None else ("gzip",):
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str, static: bool = False) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=STATIC_BROTLI_QUALITY if static else BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=STATIC_GZIP_LEVEL if static else GZIP_LEVEL, mtime=0)
+
+
+def etag_matches(if_none_match, etag: str) -> bool:
+    """Слабое сравнение для If-None-Match: сжатый ответ уходит с W/-ETag, клиент присылает его обратно."""
+    if not if_none_match:
+        return False
+    etag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def _weak(etag: str) -> str:
+    # Сжатый вариант не совпадает с исходным побайтно — ETag у него слабый
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+
+class Precompressed:
+    """Готовое тело ответа и его сжатые варианты.
+
+    Сжимается один раз на снимок и кодировку, дальше каждый запрос
+    получает уже сжатые байты.
+    """
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self._variants = {}
+
+    def encoded(self, encoding):
+        if encoding is None or len(self.body) < COMPRESS_MIN_BYTES:
+            return self.body, None
+        variant = self._variants.get(encoding)
+        if variant is None:
+            variant = self._variants[encoding] = compress(self.body, encoding, static=True)
+        return variant, encoding
+
+    def response(self, request, headers: dict = None, media_type: str = "application/json") -> Response:
+        body, encoding = self.encoded(choose_encoding(request.headers.get("accept-encoding")))
+        headers = dict(headers or {})
+        headers["Vary"] = "Accept-Encoding"
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+            if "ETag" in headers:
+                headers["ETag"] = _weak(headers["ETag"])
+        return Response(body, headers=headers, media_type=media_type)
+
+
+class CompressionMiddleware:
+    """ASGI-middleware: сжимает ответ целиком, если клиент это умеет.
+
+    Сжимаются только ответы одним куском не меньше COMPRESS_MIN_BYTES;
+    потоки, уже сжатое (Content-Encoding) и типы из SKIP_CONTENT_TYPES
+    проходят как есть.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+
+        async def send_compressed(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                # Заголовки придержим до первого куска тела: там станет ясно, сжимать ли
+                start = message
+                return
+            if start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            response_start, start = start, None
+            body = message.get("body", b"")
+            if message.get("more_body", False) or not _compressible(response_start, body):
+                await send(response_start)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding)
+            headers = MutableHeaders(raw=list(response_start["headers"]))
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            if "etag" in headers:
+                headers["ETag"] = _weak(headers["etag"])
+            response_start["headers"] = headers.raw
+            await send(response_start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+
+def _compressible(start, body: bytes) -> bool:
+    if len(body) < COMPRESS_MIN_BYTES or start["status"] in (204, 206, 304):
+        return False
+    headers = Headers(raw=start["headers"])
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    return not content_type.startswith(SKIP_CONTENT_TYPES)
@@ -1,16 +1,134 @@
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from contextlib import asynccontextmanager
+import psycopg
+from psycopg import pq
+from psycopg.conninfo import make_conninfo
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
+import weakref
+import time
 import os
 from dotenv import load_dotenv
+from fastapi import HTTPException
+from src.metrics import Gauge, Histogram
+from src.querylog import InstrumentedCursor
 
 load_dotenv()
 
-def get_db_connection():
-    return psycopg2.connect(
+# Параметры пула соединений
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", 2))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", 20))
+# Сколько секунд соединение может простаивать, прежде чем его закроют
+DB_POOL_MAX_IDLE = float(os.getenv("DB_POOL_MAX_IDLE", 300))
+# Соединения, простоявшие дольше этого, проверяются перед выдачей
+DB_POOL_CHECK_AFTER = float(os.getenv("DB_POOL_CHECK_AFTER", 30))
+# Сколько ждать свободного соединения, если пул исчерпан
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 10))
+
+
+def get_conninfo():
+    return make_conninfo(
         dbname=os.getenv("DB_NAME"),
         user=os.getenv("DB_USER"),
         password=os.getenv("DB_PASSWORD"),
         host=os.getenv("DB_HOST"),
         port=os.getenv("DB_PORT"),
-        cursor_factory=RealDictCursor
     )
+
+
+# Когда соединение последний раз вернулось в пул
+_released_at = weakref.WeakKeyDictionary()
+
+
+async def _remember_release(conn):
+    _released_at[conn] = time.monotonic()
+
+
+async def _check_if_stale(conn):
+    # Свежевозвращённые соединения не пингуем, чтобы не платить лишний round trip
+    if time.monotonic() - _released_at.get(conn, 0) >= DB_POOL_CHECK_AFTER:
+        await AsyncConnectionPool.check_connection(conn)
+
+
+_pool = None
+
+POOL_CHECKOUT_WAIT = Histogram("db_pool_checkout_wait_seconds", "Ожидание соединения из пула")
+
+
+def _pool_stat(key):
+    return lambda: _pool.get_stats().get(key, 0) if _pool is not None else 0
+
+
+Gauge("db_pool_size", "Соединений в пуле", _pool_stat("pool_size"))
+Gauge("db_pool_available", "Свободных соединений в пуле", _pool_stat("pool_available"))
+Gauge("db_pool_requests_waiting", "Запросов в очереди за соединением", _pool_stat("requests_waiting"))
+
+
+async def open_pool():
+    global _pool
+    if _pool is None:
+        pool = AsyncConnectionPool(
+            get_conninfo(),
+            kwargs={"row_factory": dict_row, "cursor_factory": InstrumentedCursor},
+            min_size=DB_POOL_MIN_SIZE,
+            max_size=DB_POOL_MAX_SIZE,
+            max_idle=DB_POOL_MAX_IDLE,
+            timeout=DB_POOL_TIMEOUT,
+            check=_check_if_stale,
+            reset=_remember_release,
+            name="frog_cafe",
+            open=False,
+        )
+        # Не ждём заполнения: база может подняться позже backend'а
+        await pool.open(wait=False)
+        _pool = pool
+    return _pool
+
+
+async def close_pool():
+    global _pool
+    pool, _pool = _pool, None
+    if pool is not None:
+        await pool.close()
+
+
+def get_pool():
+    if _pool is None:
+        raise RuntimeError("Пул соединений не открыт")
+    return _pool
+
+
+@asynccontextmanager
+async def checkout():
+    """Соединение из пула на короткий блок: нет свободного за DB_POOL_TIMEOUT — 503.
+
+    Незакоммиченная транзакция при выходе откатывается.
+    """
+    pool = get_pool()
+    started = time.perf_counter()
+    try:
+        conn = await pool.getconn()
+    except PoolTimeout:
+        POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+        raise HTTPException(
+            status_code=503,
+            detail="Нет свободных соединений с базой данных",
+            headers={"Retry-After": "1"},
+        )
+    POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+    try:
+        yield conn
+    finally:
+        # Незакоммиченная транзакция (например, после исключения) откатывается
+        try:
+            if conn.info.transaction_status != pq.TransactionStatus.IDLE:
+                await conn.rollback()
+        except psycopg.Error:
+            # Сломанное соединение пул сам выбросит при возврате
+            pass
+        await pool.putconn(conn)
+
+
+async def get_db():
+    """Зависимость FastAPI: выдаёт соединение из пула и всегда возвращает его обратно."""
+    async with checkout() as conn:
+        yield conn
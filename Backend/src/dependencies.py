@@ -1,33 +1,56 @@
-from fastapi import HTTPException, Depends, Request
+from fastapi import HTTPException, Depends, Query, Request
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from typing import Optional
+from src.tokens import token_cache, revoked_tokens
 import os
 
 SECRET_KEY = os.getenv("JWT_SECRET", "your_secret_key_here")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
 
-def get_current_user(token: str = Depends(oauth2_scheme)):
+def decode_token(token: Optional[str]):
     credentials_exception = HTTPException(
         status_code=401,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    if not token:
+        raise credentials_exception
+    # Один и тот же токен приходит на каждый опрос — подпись проверяем один раз
+    user = token_cache.get(token)
+    if user is None:
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        except JWTError:
+            raise credentials_exception
         user_id: str = payload.get("sub")
         name: str = payload.get("name")
         role_id: int = payload.get("role_id")
         if user_id is None or name is None or role_id is None:
             raise credentials_exception
-        return {"user_id": int(user_id), "name": name, "role_id": role_id}
-    except JWTError:
+        user = {"user_id": int(user_id), "name": name, "role_id": role_id, "jti": payload.get("jti")}
+        token_cache.put(token, user, payload.get("exp"))
+    if revoked_tokens.is_revoked(user["jti"]):
         raise credentials_exception
+    return user
+
+async def get_current_user(token: str = Depends(oauth2_scheme)):
+    return decode_token(token)
+
+# EventSource не умеет слать заголовки, поэтому для потоков токен можно передать в ?token=
+async def get_current_user_or_query(
+    token: Optional[str] = Depends(oauth2_scheme_optional),
+    query_token: Optional[str] = Query(None, alias="token"),
+):
+    return decode_token(token or query_token)
 
-# Проверка доступа по ролям
+# Проверка доступа по ролям. Пользователь берётся из той же зависимости get_current_user,
+# а FastAPI кэширует её в пределах запроса — токен разбирается один раз
 def require_role(allowed_roles: list[int]):
-    def checker(current_user: dict = Depends(get_current_user)):
+    async def checker(current_user: dict = Depends(get_current_user)):
         if current_user["role_id"] not in allowed_roles:
             raise HTTPException(status_code=403, detail="Access forbidden")
         return current_user
-    return checker 
\ No newline at end of file
+    return checker
@@ -0,0 +1,80 @@
+from collections import defaultdict
+from src.db import get_conninfo
+import psycopg
+import asyncio
+import contextlib
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Канал, в который триггеры frog_cafe.notify_change() шлют изменения orders, cart и menu
+CHANNEL = "frog_cafe_changes"
+
+# Событие, которое рассылается после (пере)подключения слушателя:
+# уведомления за время обрыва потеряны, подписчикам стоит сбросить всё
+RESYNC = "RESYNC"
+
+
+class EventBus:
+    """Шина изменений в памяти процесса поверх Postgres LISTEN/NOTIFY.
+
+    Каждый воркер держит своё слушающее соединение, поэтому изменения,
+    сделанные любым воркером или контейнером, доходят до всех.
+    Обработчики синхронные и должны быть дешёвыми: сбросить кэш, поставить флаг.
+    """
+
+    def __init__(self):
+        self._handlers = defaultdict(list)
+        self._task = None
+
+    def subscribe(self, tables, handler):
+        for table in tables:
+            self._handlers[table].append(handler)
+
+    def publish(self, event: dict):
+        for handler in self._handlers.get(event.get("table"), []):
+            try:
+                handler(event)
+            except Exception as e:
+                logger.error("Error in event handler for %s: %s", event, e)
+
+    def _publish_resync(self):
+        for table in list(self._handlers):
+            self.publish({"table": table, "op": RESYNC})
+
+    async def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _listen(self):
+        backoff = 1
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(get_conninfo(), autocommit=True) as conn:
+                    await conn.execute(f"LISTEN {CHANNEL};")
+                    backoff = 1
+                    self._publish_resync()
+                    async for notify in conn.notifies():
+                        try:
+                            event = json.loads(notify.payload)
+                        except ValueError:
+                            logger.warning("Malformed change notification: %s", notify.payload)
+                            continue
+                        self.publish(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Change listener disconnected: %s", e)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30)
+
+
+event_bus = EventBus()
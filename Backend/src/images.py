@@ -0,0 +1,135 @@
+from concurrent.futures import ProcessPoolExecutor
+from fastapi import HTTPException
+from PIL import Image, ImageOps, UnidentifiedImageError
+import asyncio
+import base64
+import binascii
+import hashlib
+import io
+import os
+import re
+
+# Картинки блюд: исходник декодируется один раз в пуле процессов,
+# из него получаются WebP-варианты, которые хранятся в frog_cafe.images по sha256.
+
+IMAGE_WORKERS = int(os.getenv("IMAGE_WORKERS", 2))
+MAX_IMAGE_BYTES = int(os.getenv("MAX_IMAGE_BYTES", 10 * 1024 * 1024))
+
+# Максимальная сторона варианта в пикселях и качество WebP
+VARIANTS = {
+    "thumb": (160, 75),
+    "full": (1280, 82),
+}
+
+DATA_URI_RE = re.compile(r"^data:([^;,]+);base64,", re.IGNORECASE)
+
+# Принимаемые форматы. Тип определяет Pillow по самим байтам: тип из
+# data-URI не проверяется и в базу не попадает
+IMAGE_FORMATS = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "GIF": "image/gif",
+    "WEBP": "image/webp",
+}
+IMAGE_CONTENT_TYPES = frozenset(IMAGE_FORMATS.values())
+
+# Картинки отдаются без авторизации с origin'а API: браузер не должен
+# угадывать в них HTML по содержимому
+IMAGE_HEADERS = {"X-Content-Type-Options": "nosniff"}
+
+_executor = None
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=IMAGE_WORKERS)
+    return _executor
+
+
+def shutdown_executor():
+    global _executor
+    executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def is_data_uri(value) -> bool:
+    return bool(value) and DATA_URI_RE.match(value) is not None
+
+
+def sniff_image(data: bytes) -> str:
+    """Content type по байтам; не картинка из IMAGE_FORMATS — 400. Читается только заголовок."""
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image_format = image.format
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, ValueError):
+        image_format = None
+    if image_format not in IMAGE_FORMATS:
+        raise HTTPException(status_code=400, detail="Не удалось прочитать картинку")
+    return IMAGE_FORMATS[image_format]
+
+
+def decode_image(pic: str):
+    """Разбирает data-URI (или голый base64) в байты и content type, определённый по байтам."""
+    match = DATA_URI_RE.match(pic)
+    payload = pic[match.end():] if match else pic
+    try:
+        data = base64.b64decode(payload, validate=False)
+    except (binascii.Error, ValueError):
+        raise HTTPException(status_code=400, detail="Картинка должна быть в base64")
+    if not data:
+        raise HTTPException(status_code=400, detail="Пустая картинка")
+    if len(data) > MAX_IMAGE_BYTES:
+        raise HTTPException(status_code=413, detail="Слишком большая картинка")
+    return data, sniff_image(data)
+
+
+def render_variants(data: bytes):
+    """Выполняется в отдельном процессе: декодирует картинку и кодирует все варианты."""
+    with Image.open(io.BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source)
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+
+    rendered = {}
+    for name, (max_side, quality) in VARIANTS.items():
+        variant = image.copy()
+        variant.thumbnail((max_side, max_side), Image.LANCZOS)
+        out = io.BytesIO()
+        variant.save(out, format="WEBP", quality=quality, method=4)
+        rendered[name] = (out.getvalue(), variant.width, variant.height)
+    return rendered
+
+
+async def prepare_image(data: bytes):
+    """Строит варианты картинки в пуле процессов; возвращает {вариант: (хеш, байты, ширина, высота)}.
+
+    С базой не работает: соединение берётся уже под готовые байты.
+    """
+    if not data:
+        raise HTTPException(status_code=400, detail="Пустая картинка")
+    if len(data) > MAX_IMAGE_BYTES:
+        raise HTTPException(status_code=413, detail="Слишком большая картинка")
+
+    loop = asyncio.get_running_loop()
+    try:
+        rendered = await loop.run_in_executor(get_executor(), render_variants, data)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, ValueError):
+        raise HTTPException(status_code=400, detail="Не удалось прочитать картинку")
+
+    return {
+        name: (hashlib.sha256(content).hexdigest(), content, width, height)
+        for name, (content, width, height) in rendered.items()
+    }
+
+
+async def save_image(conn, prepared):
+    """Сохраняет варианты из prepare_image в транзакции conn; возвращает {вариант: хеш}."""
+    async with conn.cursor() as cur:
+        # Одинаковые байты — одна запись
+        await cur.executemany("""
+            INSERT INTO frog_cafe.images (hash, content_type, data, width, height)
+            VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT (hash) DO NOTHING;
+        """, [(digest, "image/webp", content, width, height) for digest, content, width, height in prepared.values()])
+    return {name: variant[0] for name, variant in prepared.items()}
@@ -0,0 +1,119 @@
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import json
+import logging
+import os
+import queue
+import re
+import sys
+
+# Единая настройка логирования. Запрос только кладёт запись в очередь,
+# в stderr её пишет отдельный поток QueueListener — медленный вывод
+# (docker logs, переполненный pipe) не задерживает ответы.
+
+# Общий уровень и уровни отдельных логгеров: "src.tv=DEBUG,uvicorn.access=WARNING"
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_LEVELS = os.getenv("LOG_LEVELS", "")
+# json — по записи на строку для сборщика логов, text — для чтения глазами
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json")
+
+# Логгеры uvicorn настраивает сам и пишет напрямую; переводим их на очередь
+UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+# Токены в query string (поток табло получает JWT в ?token=, EventSource
+# не умеет слать заголовки) в журнал доступа не попадают
+_SECRET_QUERY_RE = re.compile(r"([?&](?:token|access_token)=)[^&\s]*")
+
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def redact_query(text: str) -> str:
+    return _SECRET_QUERY_RE.sub(r"\1***", text)
+
+
+class RedactQueryFilter(logging.Filter):
+    """Вычищает токены из путей, которые uvicorn.access передаёт аргументами записи."""
+
+    def filter(self, record):
+        if isinstance(record.args, tuple):
+            record.args = tuple(redact_query(arg) if isinstance(arg, str) else arg for arg in record.args)
+        return True
+
+
+def parse_levels(value: str):
+    """"src.tv=DEBUG,uvicorn.access=WARNING" -> {"src.tv": "DEBUG", ...}"""
+    levels = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        name, _, level = item.partition("=")
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging():
+    """Вешает на корневой логгер QueueHandler и запускает поток записи. Повторный вызов ничего не делает."""
+    global _listener
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(sys.stderr)
+    if LOG_FORMAT == "json":
+        output.setFormatter(JsonFormatter())
+    else:
+        output.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    records = queue.SimpleQueue()
+    handler = QueueHandler(records)
+
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(LOG_LEVEL.upper())
+    for name in UVICORN_LOGGERS:
+        logger = logging.getLogger(name)
+        logger.handlers = []
+        logger.propagate = True
+    logging.getLogger("uvicorn.access").addFilter(RedactQueryFilter())
+    for name, level in parse_levels(LOG_LEVELS).items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = QueueListener(records, output)
+    _listener.start()
+    # Дописываем очередь при выходе процесса
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
+def get_levels():
+    """Явно заданные уровни: корневой и логгеры, у которых уровень не наследуется."""
+    levels = {"root": logging.getLevelName(logging.getLogger().level)}
+    for name, logger in sorted(logging.Logger.manager.loggerDict.items()):
+        if isinstance(logger, logging.Logger) and logger.level != logging.NOTSET:
+            levels[name] = logging.getLevelName(logger.level)
+    return levels
+
+
+def set_level(name: str, level: str):
+    """Меняет уровень логгера на лету (только в этом процессе). Неизвестный уровень — ValueError."""
+    logger = logging.getLogger() if name == "root" else logging.getLogger(name)
+    logger.setLevel(level.upper())
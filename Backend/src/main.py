@@ -4,9 +4,26 @@ import os
 # Load environment variables from .env file
 load_dotenv()
 
+# Логирование настраивается до импорта остальных модулей
+from src.logs import setup_logging
+setup_logging()
+
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.db import open_pool, close_pool
+from src.migrations import migrate
+from src.events import event_bus
+from src.registry import load_registries
+from src.tokens import revoked_tokens
+from src.board import active_orders
+from src.images import shutdown_executor
+from src.passwords import shutdown_executor as shutdown_password_executor
+from src.metrics import MetricsMiddleware
+from src.compression import CompressionMiddleware
+from src.responses import ORJSONResponse
+
 from src.auth import router as auth_router
 from src.menu import router as menu_router
 from src.users import router as users_router
@@ -15,13 +32,40 @@ from src.order_statuses import router as status_router
 from src.toads import router as toads_router
 from src.orders import router as orders_router
 from src.cart import router as cart_router
-from src.tv import router as tv_router
+from src.tv import router as tv_router, tv_board
+from src.menu import backfill_menu_images
+from src.metrics import router as metrics_router
+from src.admin import router as admin_router
 
 from fastapi.security import OAuth2PasswordBearer
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+
+# Миграции применяются до открытия пула; картинки блюд, оставшиеся
+# data-URI после миграции 003, переносятся сразу после.
+# Пул соединений и фоновые задачи живут столько же, сколько приложение.
+# Lifespan висит на внешнем app: у смонтированного api_app он не вызывается.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if os.getenv("DB_MIGRATE_ON_STARTUP", "1") == "1":
+        await migrate()
+    await open_pool()
+    if os.getenv("DB_MIGRATE_ON_STARTUP", "1") == "1":
+        await backfill_menu_images(app)
+    await load_registries()
+    await revoked_tokens.load()
+    await event_bus.start()
+    await active_orders.start()
+    yield
+    await event_bus.stop()
+    await active_orders.stop()
+    await tv_board.stop()
+    shutdown_executor()
+    shutdown_password_executor()
+    await close_pool()
+
 # Disable automatic trailing slash redirect
-app = FastAPI(redirect_slashes=False)
+app = FastAPI(redirect_slashes=False, lifespan=lifespan)
 
 # Configure CORS
 # Адреса фронтенда и бэкенда можно задать через переменные окружения
@@ -41,10 +85,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
-    expose_headers=["*"],
+    expose_headers=["*", "X-Next-Cursor"],
     max_age=86400, 
 )
-api_app = FastAPI(title="API")
+api_app = FastAPI(title="API", default_response_class=ORJSONResponse)
+# Сжатие — внутри метрик: время ответа в метриках учитывает и его
+api_app.add_middleware(CompressionMiddleware)
+# Чистый ASGI, без BaseHTTPMiddleware: на запрос — пара счётчиков и perf_counter
+api_app.add_middleware(MetricsMiddleware)
 
 api_app.include_router(auth_router)
 api_app.include_router(menu_router)
@@ -55,6 +103,8 @@ api_app.include_router(toads_router)
 api_app.include_router(orders_router)
 api_app.include_router(cart_router)
 api_app.include_router(tv_router)
+api_app.include_router(metrics_router)
+api_app.include_router(admin_router)
 
 # Mount the API app under /api
 app.mount("/api", api_app)
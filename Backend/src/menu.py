@@ -1,73 +1,206 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from src.db import get_db_connection
+from fastapi import APIRouter, Depends, File, HTTPException, Request, Response, UploadFile, status
+from src.db import checkout, get_db, get_pool
 from src.schemas import MenuItem, MenuItemCreate
 from src.dependencies import require_role, get_current_user
+from src.events import event_bus
+from src.images import IMAGE_HEADERS, MAX_IMAGE_BYTES, decode_image, is_data_uri, prepare_image, save_image
+from src.compression import Precompressed, etag_matches
+from pydantic import TypeAdapter
+from typing import NamedTuple
+import asyncio
+import hashlib
 import logging
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Disable automatic trailing slash redirect
 router = APIRouter(prefix="/menu", tags=["menu"])
 
+MENU_COLUMNS = "id, dish_name, image, image_thumb, is_available, description, category, quantity_left"
+
+
+async def store_image(request: Request, conn, prepared):
+    """Сохраняет готовые варианты картинки и возвращает (url полного размера, url миниатюры)."""
+    hashes = await save_image(conn, prepared)
+    full, thumb = (
+        request.url_for("get_menu_image", name=f"{hashes[variant]}.webp").path
+        for variant in ("full", "thumb")
+    )
+    return full, thumb
+
+
+async def prepare_menu_image(image):
+    # data-URI раскладывается на варианты ещё до того, как запрос возьмёт
+    # соединение с базой; у внешней ссылки вариантов нет
+    if is_data_uri(image):
+        data, _ = decode_image(image)
+        return await prepare_image(data)
+    return None
+
+
+async def resolve_image(request: Request, conn, image, prepared):
+    # Внешняя ссылка сохраняется как есть
+    if prepared is not None:
+        return await store_image(request, conn, prepared)
+    return image, None
+
+
+async def ensure_menu_item(item_id: int):
+    """404, если блюда нет. Короткое соединение: проверка идёт до тяжёлой обработки картинки."""
+    async with checkout() as conn:
+        cur = await conn.execute("SELECT id FROM frog_cafe.menu WHERE id = %s", (item_id,))
+        if not await cur.fetchone():
+            raise HTTPException(status_code=404, detail="Блюдо не найдено")
+
+
+async def backfill_menu_images(app) -> int:
+    """Переносит картинки блюд, оставшиеся в menu.image data-URI, в frog_cafe.images.
+
+    Миграция 003 данные не трогает: старые строки раскладываются здесь, по одной.
+    Соединение берётся только на чтение строки и на запись готовых вариантов.
+    Возвращает число перенесённых блюд.
+    """
+    async with checkout() as conn:
+        cur = await conn.execute("SELECT id FROM frog_cafe.menu WHERE image LIKE 'data:%' ORDER BY id")
+        item_ids = [row["id"] for row in await cur.fetchall()]
+
+    done = 0
+    for item_id in item_ids:
+        async with checkout() as conn:
+            cur = await conn.execute("SELECT image FROM frog_cafe.menu WHERE id = %s", (item_id,))
+            row = await cur.fetchone()
+        if row is None or not is_data_uri(row["image"]):
+            continue
+        try:
+            prepared = await prepare_menu_image(row["image"])
+        except HTTPException as e:
+            logger.warning("Menu item %s image left inline: %s", item_id, e.detail)
+            continue
+
+        async with checkout() as conn:
+            hashes = await save_image(conn, prepared)
+            full, thumb = (
+                app.url_path_for("get_menu_image", name=f"{hashes[variant]}.webp")
+                for variant in ("full", "thumb")
+            )
+            # Блюдо могли изменить, пока картинка обрабатывалась
+            cur = await conn.execute("""
+                UPDATE frog_cafe.menu SET image = %s, image_thumb = %s
+                WHERE id = %s AND image = %s
+            """, (full, thumb, item_id, row["image"]))
+            await conn.commit()
+            done += cur.rowcount
+    if done:
+        logger.info("Moved %d inline menu images to frog_cafe.images", done)
+    return done
+
+
+class MenuSnapshot(NamedTuple):
+    version: int
+    body: Precompressed
+    etag: str
+
+
+class MenuCache:
+    """Готовый JSON меню в памяти процесса.
+
+    Версия растёт при каждом изменении меню или остатков; снимок,
+    собранный для старой версии, при следующем запросе пересобирается.
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._snapshot = None
+        self._lock = asyncio.Lock()
+        self._adapter = TypeAdapter(list[MenuItem])
+
+    def invalidate(self):
+        self.version += 1
+
+    async def get(self) -> MenuSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == self.version:
+            return snapshot
+        # Одновременные промахи ждут одну выборку, а не идут в базу толпой
+        async with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.version == self.version:
+                return snapshot
+            version = self.version
+            async with get_pool().connection() as conn:
+                cur = await conn.execute("SELECT * FROM frog_cafe.menu ORDER BY id;")
+                rows = await cur.fetchall()
+            body = self._adapter.dump_json(self._adapter.validate_python(rows))
+            # ETag по содержимому совпадает у всех воркеров
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            snapshot = MenuSnapshot(version, Precompressed(body), etag)
+            self._snapshot = snapshot
+            return snapshot
+
+
+menu_cache = MenuCache()
+# Изменения меню из других воркеров и контейнеров приходят через LISTEN/NOTIFY
+event_bus.subscribe(["menu"], lambda event: menu_cache.invalidate())
+
+
 # @router.get("", response_model=list[MenuItem])  # Route without trailing slash
 @router.get("/", response_model=list[MenuItem])  # Route with trailing slash
-def get_menu():
+async def get_menu(request: Request):
     try:
-        logger.info("Attempting to connect to database...")
-        conn = get_db_connection()
-        cur = conn.cursor()
-        
-        logger.info("Executing menu query...")
-        cur.execute("SELECT * FROM frog_cafe.menu ORDER BY id;")
-        rows = cur.fetchall()
-        
-        logger.info(f"Found {len(rows)} menu items")
-        cur.close()
-        conn.close()
-        return rows
+        snapshot = await menu_cache.get()
     except Exception as e:
-        logger.error(f"Error in get_menu: {str(e)}")
+        logger.error("Error in get_menu: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), snapshot.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    # Сжатые варианты меню считаются один раз на снимок
+    return snapshot.body.response(request, headers=headers)
+
 
 
 
 @router.post("/", response_model=MenuItem)
-def create_menu_item(
+async def create_menu_item(
+    request: Request,
     item: MenuItemCreate,
-    current_user: dict = Depends(require_role([0]))
+    current_user: dict = Depends(require_role([0])),
 ):
-    conn = get_db_connection()
-    cur = conn.cursor()
+    # Варианты картинки считаются без соединения с базой
+    prepared = await prepare_menu_image(item.image)
+
+    async with checkout() as conn:
+        cur = conn.cursor()
 
-    cur.execute("SELECT id FROM frog_cafe.menu WHERE dish_name = %s", (item.dish_name,))
-    existing_item = cur.fetchone()
-    if existing_item:
-        cur.close()
-        conn.close()
-        raise HTTPException(status_code=400, detail="Блюдо с таким названием уже существует")
-
-    cur.execute("""
-        INSERT INTO frog_cafe.menu 
-        (dish_name, image, is_available, description, category, quantity_left)
-        VALUES (%s, %s, %s, %s, %s, %s)
-        RETURNING id, dish_name, image, is_available, description, category, quantity_left;
-    """, (
-        item.dish_name,
-        item.image,
-        item.is_available,
-        item.description,
-        item.category,
-        item.quantity_left
-    ))
-
-    new_item = cur.fetchone()
-    conn.commit()
-    cur.close()
-    conn.close()
-    logger.info(f"User {current_user['name']} added new dish: {item.dish_name}")
+        await cur.execute("SELECT id FROM frog_cafe.menu WHERE dish_name = %s", (item.dish_name,))
+        existing_item = await cur.fetchone()
+        if existing_item:
+            await cur.close()
+            raise HTTPException(status_code=400, detail="Блюдо с таким названием уже существует")
+
+        image, image_thumb = await resolve_image(request, conn, item.image, prepared)
+
+        await cur.execute(f"""
+            INSERT INTO frog_cafe.menu 
+            (dish_name, image, image_thumb, is_available, description, category, quantity_left)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            RETURNING {MENU_COLUMNS};
+        """, (
+            item.dish_name,
+            image,
+            image_thumb,
+            item.is_available,
+            item.description,
+            item.category,
+            item.quantity_left
+        ))
+
+        new_item = await cur.fetchone()
+        await conn.commit()
+        menu_cache.invalidate()
+        await cur.close()
+    logger.info("User %s added new dish: %s", current_user['name'], item.dish_name)
     return new_item
 
 
@@ -75,15 +208,13 @@ def create_menu_item(
 
 
 @router.get("/{item_id}", response_model=MenuItem)
-def get_menu_item(item_id: int):
-    conn = get_db_connection()
+async def get_menu_item(item_id: int, conn=Depends(get_db)):
     cur = conn.cursor()
 
-    cur.execute("SELECT * FROM frog_cafe.menu WHERE id = %s", (item_id,))
-    item = cur.fetchone()
+    await cur.execute("SELECT * FROM frog_cafe.menu WHERE id = %s", (item_id,))
+    item = await cur.fetchone()
 
-    cur.close()
-    conn.close()
+    await cur.close()
 
     if not item:
         raise HTTPException(status_code=404, detail="Блюдо не найдено")
@@ -95,44 +226,102 @@ def get_menu_item(item_id: int):
 
 
 @router.put("/{item_id}", response_model=MenuItem, dependencies=[Depends(get_current_user)])
-def update_menu_item(item_id: int, item: MenuItemCreate):
-    conn = get_db_connection()
-    cur = conn.cursor()
+async def update_menu_item(request: Request, item_id: int, item: MenuItemCreate):
+    await ensure_menu_item(item_id)
+    prepared = await prepare_menu_image(item.image)
 
-    cur.execute("""
-        UPDATE frog_cafe.menu
-        SET dish_name = %s,
-            image = %s,
-            is_available = %s,
-            description = %s,
-            category = %s,
-            quantity_left = %s
-        WHERE id = %s
-        RETURNING id, dish_name, image, is_available, description, category, quantity_left;
-    """, (item.dish_name, item.image, item.is_available, item.description, item.category, item.quantity_left, item_id))
-
-    updated_item = cur.fetchone()
-    conn.commit()
-    cur.close()
-    conn.close()
-
-    if not updated_item:
-        raise HTTPException(status_code=404, detail="Блюдо не найдено")
+    async with checkout() as conn:
+        image, image_thumb = await resolve_image(request, conn, item.image, prepared)
+        cur = conn.cursor()
+
+        # Миниатюра сохраняется, пока картинка не поменялась
+        await cur.execute(f"""
+            UPDATE frog_cafe.menu
+            SET dish_name = %s,
+                image_thumb = CASE WHEN image IS NOT DISTINCT FROM %s THEN image_thumb ELSE %s END,
+                image = %s,
+                is_available = %s,
+                description = %s,
+                category = %s,
+                quantity_left = %s
+            WHERE id = %s
+            RETURNING {MENU_COLUMNS};
+        """, (item.dish_name, image, image_thumb, image, item.is_available, item.description, item.category, item.quantity_left, item_id))
+
+        updated_item = await cur.fetchone()
+        if not updated_item:
+            # Блюдо удалили, пока считалась картинка: варианты откатываются вместе с UPDATE
+            await conn.rollback()
+            await cur.close()
+            raise HTTPException(status_code=404, detail="Блюдо не найдено")
+        await conn.commit()
+        menu_cache.invalidate()
+        await cur.close()
 
     return updated_item
 
 
 
+@router.put("/{item_id}/image", response_model=MenuItem, dependencies=[Depends(require_role([0]))])
+async def upload_menu_image(request: Request, item_id: int, file: UploadFile = File(...)):
+    await ensure_menu_item(item_id)
+    data = await file.read(MAX_IMAGE_BYTES + 1)
+    prepared = await prepare_image(data)
+
+    async with checkout() as conn:
+        image, image_thumb = await store_image(request, conn, prepared)
+        cur = conn.cursor()
+
+        await cur.execute(f"""
+            UPDATE frog_cafe.menu
+            SET image = %s, image_thumb = %s
+            WHERE id = %s
+            RETURNING {MENU_COLUMNS};
+        """, (image, image_thumb, item_id))
+        updated_item = await cur.fetchone()
+        if not updated_item:
+            await conn.rollback()
+            await cur.close()
+            raise HTTPException(status_code=404, detail="Блюдо не найдено")
+        await conn.commit()
+        menu_cache.invalidate()
+        await cur.close()
+
+    return updated_item
+
+
+
+# Варианты адресуются хешем содержимого, поэтому кэшируются навсегда
+@router.get("/images/{name}", response_class=Response)
+async def get_menu_image(request: Request, name: str, conn=Depends(get_db)):
+    digest = name.removesuffix(".webp")
+    etag = f'"{digest}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=31536000, immutable", **IMAGE_HEADERS}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    cur = conn.cursor()
+    await cur.execute("SELECT content_type, data FROM frog_cafe.images WHERE hash = %s", (digest,))
+    image = await cur.fetchone()
+    await cur.close()
+
+    if not image:
+        raise HTTPException(status_code=404, detail="Картинка не найдена")
+
+    return Response(content=image["data"], media_type=image["content_type"], headers=headers)
+
+
+
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(require_role([0]))])
-def delete_menu_item(item_id: int):
-    conn = get_db_connection()
+async def delete_menu_item(item_id: int, conn=Depends(get_db)):
     cur = conn.cursor()
 
-    cur.execute("DELETE FROM frog_cafe.menu WHERE id = %s RETURNING id;", (item_id,))
-    deleted = cur.fetchone()
-    conn.commit()
-    cur.close()
-    conn.close()
+    await cur.execute("DELETE FROM frog_cafe.menu WHERE id = %s RETURNING id;", (item_id,))
+    deleted = await cur.fetchone()
+    await conn.commit()
+    menu_cache.invalidate()
+    await cur.close()
 
     if not deleted:
         raise HTTPException(status_code=404, detail="Блюдо не найдено")
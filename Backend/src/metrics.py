@@ -0,0 +1,164 @@
+from bisect import bisect_left
+from contextvars import ContextVar
+from fastapi import APIRouter, Response
+import time
+
+# Метрики в текстовом формате Prometheus. Счётчики живут в памяти процесса:
+# при нескольких воркерах каждый отдаёт свои, а складывает их Prometheus.
+
+router = APIRouter(tags=["metrics"])
+
+# Границы корзин гистограмм, секунды
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_metrics = []
+# scope текущего запроса: по нему запросы к базе узнают свой маршрут
+_current_scope = ContextVar("metrics_scope", default=None)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names, values, extra=""):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._values = {}
+        _metrics.append(self)
+
+    def inc(self, *labels, amount=1):
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self):
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in self._values.items():
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+
+
+class Gauge:
+    """Значение считается в момент опроса: func() без аргументов."""
+
+    def __init__(self, name, help, func):
+        self.name = name
+        self.help = help
+        self.func = func
+        _metrics.append(self)
+
+    def render(self):
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} gauge"
+        yield f"{self.name} {_number(self.func())}"
+
+
+class Histogram:
+    def __init__(self, name, help, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # labels -> [счётчики по корзинам (последняя — +Inf), сумма]
+        self._values = {}
+        _metrics.append(self)
+
+    def observe(self, value, *labels):
+        entry = self._values.get(labels)
+        if entry is None:
+            entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+
+    def render(self):
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, (counts, total) in self._values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{bound!r}"'
+                yield f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(total)}"
+            yield f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}"
+
+
+def render():
+    lines = []
+    for metric in _metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+REQUESTS = Counter("http_requests_total", "Запросы к API по маршрутам", ("method", "route", "status"))
+REQUEST_DURATION = Histogram("http_request_duration_seconds", "Время ответа API", ("method", "route"))
+
+_in_flight = 0
+Gauge("http_requests_in_flight", "Запросы API в обработке", lambda: _in_flight)
+
+
+def route_of(scope):
+    if scope is None:
+        # Фоновые задачи: синхронизация табло, перечитывание справочников
+        return "background"
+    route = scope.get("route")
+    return route.path if route is not None else "unmatched"
+
+
+def current_route():
+    """Маршрут HTTP-запроса, в котором выполняется код (или "background")."""
+    return route_of(_current_scope.get())
+
+
+class MetricsMiddleware:
+    """ASGI-middleware: счётчик, гистограмма и in-flight по шаблону маршрута.
+
+    Шаблон ("/orders/{order_id}") известен только после роутинга, поэтому
+    читается из scope уже по завершении запроса.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        global _in_flight
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        token = _current_scope.set(scope)
+        _in_flight += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            _in_flight -= 1
+            _current_scope.reset(token)
+            route = route_of(scope)
+            REQUESTS.inc(scope["method"], route, str(status))
+            REQUEST_DURATION.observe(elapsed, scope["method"], route)
+
+
+@router.get("/metrics", response_class=Response)
+async def get_metrics():
+    return Response(render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,110 @@
+from pathlib import Path
+from psycopg import sql
+from src.db import get_conninfo
+import psycopg
+import argparse
+import asyncio
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+# Версионные миграции схемы: файлы NNN_название.sql применяются по порядку номеров,
+# применённые версии записываются в frog_cafe.schema_migrations.
+
+MIGRATIONS_DIR = Path(os.getenv(
+    "MIGRATIONS_DIR",
+    Path(__file__).resolve().parent.parent / "sql_code" / "migrations",
+))
+
+MIGRATION_RE = re.compile(r"^(\d+)_([\w-]+)\.sql$")
+# Транзакцией управляет раннер: свой BEGIN/COMMIT в файле отделил бы миграцию от записи версии
+OWN_TRANSACTION_RE = re.compile(r"^\s*(BEGIN|START\s+TRANSACTION|COMMIT|ROLLBACK)\s*;", re.IGNORECASE | re.MULTILINE)
+
+# Ключ advisory lock: воркеры, стартующие одновременно, применяют миграции по очереди
+LOCK_KEY = 0x46524F47
+
+CREATE_TABLE = """
+    CREATE SCHEMA IF NOT EXISTS frog_cafe;
+    CREATE TABLE IF NOT EXISTS frog_cafe.schema_migrations (
+        Version INT PRIMARY KEY,
+        Name TEXT NOT NULL,
+        Applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    );
+"""
+
+
+def discover(directory=MIGRATIONS_DIR):
+    """Возвращает [(версия, имя, путь)] по возрастанию версии."""
+    found = {}
+    for path in Path(directory).glob("*.sql"):
+        match = MIGRATION_RE.match(path.name)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in found:
+            raise RuntimeError(f"Две миграции с версией {version}: {found[version][2].name} и {path.name}")
+        found[version] = (version, match.group(2), path)
+    return [found[v] for v in sorted(found)]
+
+
+async def applied_versions(conn):
+    cur = await conn.execute("SELECT version FROM frog_cafe.schema_migrations;")
+    return {row[0] for row in await cur.fetchall()}
+
+
+async def migrate(conninfo=None, directory=MIGRATIONS_DIR):
+    """Применяет все ещё не применённые миграции; возвращает список применённых версий."""
+    migrations = discover(directory)
+    done = []
+    async with await psycopg.AsyncConnection.connect(conninfo or get_conninfo(), autocommit=True) as conn:
+        await conn.execute("SELECT pg_advisory_lock(%s);", (LOCK_KEY,))
+        try:
+            await conn.execute(CREATE_TABLE)
+            applied = await applied_versions(conn)
+            for version, name, path in migrations:
+                if version in applied:
+                    continue
+                text = path.read_text(encoding="utf-8")
+                if OWN_TRANSACTION_RE.search(text):
+                    raise RuntimeError(f"{path.name}: миграция не должна сама открывать или завершать транзакцию")
+                logger.info("Applying migration %s", path.name)
+                # Файл и запись версии — в одной транзакции: упадёт одно, откатится и другое
+                async with conn.transaction():
+                    await conn.execute(sql.SQL(text))
+                    await conn.execute(
+                        "INSERT INTO frog_cafe.schema_migrations (version, name) VALUES (%s, %s);",
+                        (version, name),
+                    )
+                done.append(version)
+        finally:
+            await conn.execute("SELECT pg_advisory_unlock(%s);", (LOCK_KEY,))
+    return done
+
+
+async def status(conninfo=None, directory=MIGRATIONS_DIR):
+    async with await psycopg.AsyncConnection.connect(conninfo or get_conninfo(), autocommit=True) as conn:
+        await conn.execute(CREATE_TABLE)
+        applied = await applied_versions(conn)
+    return [(version, name, version in applied) for version, name, _ in discover(directory)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Миграции схемы frog_cafe")
+    parser.add_argument("command", nargs="?", default="up", choices=["up", "status"],
+                        help="up — применить новые миграции, status — показать, что применено")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.command == "status":
+        for version, name, is_applied in asyncio.run(status()):
+            print(f"{version:03d} {name}: {'применена' if is_applied else 'не применена'}")
+        return
+
+    done = asyncio.run(migrate())
+    print(f"Применено миграций: {len(done)}")
+
+
+if __name__ == "__main__":
+    main()
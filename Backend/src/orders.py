@@ -1,120 +1,169 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from src.db import get_db_connection
-from src.schemas import Order, OrderCreate, OrderStatusUpdate
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from src.db import get_db
+from src.schemas import Order, OrderCreate, OrderStatusUpdate, OrderStatusBulkItem, OrderStatusResult
 from src.dependencies import get_current_user, require_role
+from src.board import active_orders
+from src.registry import status_registry, CREATED_STATUS, DELIVERED_STATUS
+from src.responses import TrustedJSON
+from typing import Optional
+from datetime import datetime
+import base64
+import json
 import logging
-from psycopg2.extras import RealDictCursor
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/orders", tags=["orders"])
 
+orders_json = TrustedJSON(list[Order])
+
+# Сколько заказов можно перевести одним PUT /orders/status
+MAX_BULK_STATUS_UPDATES = 500
+
+# Курсор пагинации — непрозрачная строка с (created_at, id) последнего заказа страницы
+def encode_cursor(created_at: datetime, order_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), order_id])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+def decode_cursor(cursor: str):
+    try:
+        created_at, order_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(created_at), int(order_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Некорректный курсор")
+
 # GET /api/orders — все авторизованные пользователи
+# Следующая страница: ?cursor=<X-Next-Cursor из предыдущего ответа>
 @router.get("/", response_model=list[Order])
-def get_orders(current_user=Depends(get_current_user)):
-    conn = get_db_connection()
+async def get_orders(
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    status_id: Optional[int] = None,
+    current_user=Depends(get_current_user),
+    conn=Depends(get_db)
+):
+    conditions = []
+    params = []
+    if status_id is not None:
+        conditions.append("o.status_id = %s")
+        params.append(status_id)
+    if cursor:
+        conditions.append("(o.created_at, o.id) < (%s, %s)")
+        params.extend(decode_cursor(cursor))
+    where = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+    params.append(limit)
+
     cur = conn.cursor()
-    
-    try:
-        # First get all orders with their status
-        cur.execute("""
-            SELECT 
-                o.id,
-                o.created_at,
-                s.name as status
-            FROM frog_cafe.orders o
-            JOIN frog_cafe.order_statuses s ON o.status_id = s.id
-            ORDER BY o.created_at DESC;
-        """)
-        orders = cur.fetchall()
 
-        # Then get items for each order
-        for order in orders:
-            cur.execute("""
+    try:
+        # Одна выборка: страница заказов и позиции всех её заказов
+        await cur.execute(f"""
+            WITH page AS (
+                SELECT o.id, o.created_at, o.status_id
+                FROM frog_cafe.orders o
+                {where}
+                ORDER BY o.created_at DESC, o.id DESC
+                LIMIT %s
+            ),
+            order_items AS (
                 SELECT 
+                    c.order_id,
                     m.id,
                     m.dish_name,
                     m.image,
+                    m.image_thumb,
                     m.is_available,
                     m.description,
                     m.category,
                     m.quantity_left,
-                    COUNT(*) as quantity
-                FROM frog_cafe.cart c
+                    c.quantity
+                FROM page p
+                JOIN frog_cafe.cart c ON c.order_id = p.id
                 JOIN frog_cafe.menu m ON c.menu_item = m.id
-                WHERE c.order_id = %s
-                GROUP BY m.id, m.dish_name, m.image, m.is_available, 
-                         m.description, m.category, m.quantity_left;
-            """, (order["id"],))
-            items = cur.fetchall()
-            order["items"] = items or []
+            )
+            SELECT 
+                p.id,
+                p.created_at,
+                p.status_id,
+                COALESCE(
+                    json_agg(
+                        json_build_object(
+                            'id', oi.id,
+                            'dish_name', oi.dish_name,
+                            'image', oi.image,
+                            'image_thumb', oi.image_thumb,
+                            'is_available', oi.is_available,
+                            'description', oi.description,
+                            'category', oi.category,
+                            'quantity_left', oi.quantity_left,
+                            'quantity', oi.quantity
+                        ) ORDER BY oi.id
+                    ) FILTER (WHERE oi.id IS NOT NULL),
+                    '[]'::json
+                ) as items
+            FROM page p
+            LEFT JOIN order_items oi ON oi.order_id = p.id
+            GROUP BY p.id, p.created_at, p.status_id
+            ORDER BY p.created_at DESC, p.id DESC;
+        """, params)
+        orders = await cur.fetchall()
+        for order in orders:
+            order["status"] = await status_registry.get_name(order.pop("status_id"))
 
-        return orders
+        headers = {}
+        if len(orders) == limit:
+            last = orders[-1]
+            headers["X-Next-Cursor"] = encode_cursor(last["created_at"], last["id"])
+
+        # Строки уже в форме Order — отдаём без повторной валидации
+        return orders_json.response(orders, headers=headers)
 
     except Exception as e:
-        logger.error(f"Error in get_orders: {str(e)}")
+        logger.error("Error in get_orders: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Ошибка при получении заказов: {str(e)}"
         )
     finally:
-        cur.close()
-        conn.close()
+        await cur.close()
 
 # POST /api/orders — создание заказа с автоматической жабой
 @router.post("/", response_model=Order, status_code=status.HTTP_201_CREATED)
-def create_order(current_user=Depends(get_current_user)):
-    conn = get_db_connection()
+async def create_order(current_user=Depends(get_current_user), conn=Depends(get_db)):
+    # Get initial order status
+    created_status_id = await status_registry.get_id(CREATED_STATUS)
+
+    if created_status_id is None:
+        raise HTTPException(
+            status_code=500, 
+            detail="Не удалось найти начальный статус заказа"
+        )
+
     cur = conn.cursor()
 
     try:
-        # Start transaction
-        cur.execute("BEGIN;")
-
-        # Get available toad
-        cur.execute("""
-            SELECT id FROM frog_cafe.toads 
-            WHERE is_taken = false 
-            ORDER BY id 
-            LIMIT 1 
-            FOR UPDATE;
-        """)
-        toad = cur.fetchone()
-        toad_id = toad["id"] if toad else None
-
-        if toad:
-            # Mark toad as taken
-            cur.execute("""
-                UPDATE frog_cafe.toads 
-                SET is_taken = true 
-                WHERE id = %s;
-            """, (toad_id,))
-
-        # Get initial order status
-        cur.execute("""
-            SELECT id, name 
-            FROM frog_cafe.order_statuses 
-            WHERE name = 'Создан' 
-            LIMIT 1;
-        """)
-        status = cur.fetchone()
-        
-        if not status:
-            raise HTTPException(
-                status_code=500, 
-                detail="Не удалось найти начальный статус заказа"
+        # Жаба и заказ одним запросом. SKIP LOCKED: параллельные заказы
+        # не ждут друг друга на одной и той же жабе, а берут следующую свободную.
+        # Свободных нет — заказ создаётся без жабы.
+        await cur.execute("""
+            WITH toad AS (
+                UPDATE frog_cafe.toads
+                SET is_taken = true
+                WHERE id = (
+                    SELECT id FROM frog_cafe.toads
+                    WHERE is_taken = false
+                    ORDER BY id
+                    LIMIT 1
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING id
             )
-
-        # Create order
-        cur.execute("""
             INSERT INTO frog_cafe.orders (user_id, toad_id, status_id)
-            VALUES (%s, %s, %s)
+            VALUES (%s, (SELECT id FROM toad), %s)
             RETURNING id, created_at;
-        """, (current_user["user_id"], toad_id, status["id"]))
+        """, (current_user["user_id"], created_status_id))
 
-        new_order = cur.fetchone()
+        new_order = await cur.fetchone()
         
         if not new_order:
             raise HTTPException(
@@ -123,246 +172,320 @@ def create_order(current_user=Depends(get_current_user)):
             )
 
         # Commit transaction
-        conn.commit()
-
-        return {
+        await conn.commit()
+        order = {
             "id": new_order["id"],
             "created_at": new_order["created_at"],
-            "status": status["name"],
+            "status": CREATED_STATUS,
             "items": []
         }
+        active_orders.put(order, created_status_id)
+
+        return order
 
     except HTTPException:
-        conn.rollback()
+        await conn.rollback()
         raise
     except Exception as e:
-        conn.rollback()
+        await conn.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"Ошибка при создании заказа: {str(e)}"
         )
     finally:
-        cur.close()
-        conn.close()
+        await cur.close()
 
 # GET /api/orders/{id}
 @router.get("/{order_id}", response_model=Order, dependencies=[Depends(require_role([0]))])
-def get_order(order_id: int):
-    conn = get_db_connection()
+async def get_order(order_id: int, conn=Depends(get_db)):
+    async with conn.cursor() as cur:
+        # сам заказ + статус
+        await cur.execute("""
+            SELECT
+                o.id,
+                o.user_id,
+                o.toad_id,
+                o.status_id,
+                o.created_at
+            FROM frog_cafe.orders o
+            WHERE o.id = %s;
+        """, (order_id,))
+        row = await cur.fetchone()
+        if not row:
+            raise HTTPException(status_code=404, detail="Заказ не найден")
+
+        # позиции заказа -> MenuItem
+        await cur.execute("""
+            SELECT
+                m.id,
+                m.dish_name,
+                m.image,
+                m.image_thumb,
+                m.is_available,
+                m.description,
+                m.category,
+                m.quantity_left,
+                c.quantity
+            FROM frog_cafe.cart c
+            JOIN frog_cafe.menu m ON m.id = c.menu_item
+            WHERE c.order_id = %s
+            ORDER BY c.id;
+        """, (order_id,))
+        items = [dict(r) for r in await cur.fetchall()]
+
+    return {
+        "id": row["id"],
+        "created_at": row["created_at"],
+        "status": await status_registry.get_name(row["status_id"]),
+        "items": items
+    }
+
+# PUT /api/orders/status — смена статуса сразу у пачки заказов, все авторизованные пользователи
+@router.put("/status", response_model=list[OrderStatusResult])
+async def update_order_statuses(updates: list[OrderStatusBulkItem], current_user=Depends(get_current_user), conn=Depends(get_db)):
+    if not updates:
+        return []
+    if len(updates) > MAX_BULK_STATUS_UPDATES:
+        raise HTTPException(status_code=400, detail=f"Не больше {MAX_BULK_STATUS_UPDATES} заказов за раз")
+    order_ids = [update.order_id for update in updates]
+    if len(set(order_ids)) != len(order_ids):
+        raise HTTPException(status_code=400, detail="Заказ указан в списке дважды")
+
+    status_names = {}
+    for status_id in {update.status_id for update in updates}:
+        # id от клиента — только по закэшированному справочнику, без похода в базу
+        status_names[status_id] = status_registry.name(status_id)
+        if status_names[status_id] is None:
+            raise HTTPException(status_code=400, detail="Статус не найден")
+
+    cur = conn.cursor()
+
     try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            # сам заказ + статус
-            cur.execute("""
-                SELECT
-                    o.id,
-                    o.user_id,
-                    o.toad_id,
-                    o.status_id,
-                    o.created_at,
-                    os.name AS status_name
-                FROM frog_cafe.orders o
-                JOIN frog_cafe.order_statuses os ON os.id = o.status_id
-                WHERE o.id = %s;
-            """, (order_id,))
-            row = cur.fetchone()
-            if not row:
-                raise HTTPException(status_code=404, detail="Заказ не найден")
-
-            # позиции заказа -> MenuItem
-            cur.execute("""
-                SELECT
-                    m.id,
-                    m.dish_name,
-                    m.image,
-                    m.is_available,
-                    m.description,
-                    m.category,
-                    m.quantity_left
-                FROM frog_cafe.cart c
-                JOIN frog_cafe.menu m ON m.id = c.menu_item
-                WHERE c.order_id = %s
-                ORDER BY c.id;
-            """, (order_id,))
-            items = [dict(r) for r in cur.fetchall()]
-
-        return {
-            "id": row["id"],
-            "created_at": row["created_at"],
-            "status": row["status_name"],
-            "items": items
-        }
+        # Сначала блокируем строки по порядку id, как корзина — позиции меню:
+        # две пачки с общими заказами в разном порядке иначе могут взаимно заблокироваться.
+        # Порядок строк в самом UPDATE ... FROM зависит от плана и не гарантирован
+        await cur.execute("""
+            SELECT id FROM frog_cafe.orders
+            WHERE id = ANY(%s)
+            ORDER BY id
+            FOR UPDATE;
+        """, (sorted(order_ids),))
+
+        # Все переходы одним UPDATE; позиции для табло — тем же запросом
+        await cur.execute("""
+            WITH updated AS (
+                UPDATE frog_cafe.orders o
+                SET status_id = u.status_id
+                FROM unnest(%s::int[], %s::int[]) AS u(order_id, status_id)
+                WHERE o.id = u.order_id
+                RETURNING o.id, o.created_at, o.status_id
+            )
+            SELECT
+                u.id,
+                u.created_at,
+                u.status_id,
+                COALESCE(
+                    json_agg(
+                        json_build_object(
+                            'id', m.id,
+                            'dish_name', m.dish_name,
+                            'quantity', c.quantity
+                        ) ORDER BY c.id
+                    ) FILTER (WHERE m.id IS NOT NULL),
+                    '[]'::json
+                ) AS items
+            FROM updated u
+            LEFT JOIN frog_cafe.cart c ON c.order_id = u.id
+            LEFT JOIN frog_cafe.menu m ON c.menu_item = m.id
+            GROUP BY u.id, u.created_at, u.status_id;
+        """, (order_ids, [update.status_id for update in updates]))
+        updated = await cur.fetchall()
+
+        await conn.commit()
+        active_orders.put_many(updated)
+
+    except Exception as e:
+        await conn.rollback()
+        logger.error("Error in update_order_statuses: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Ошибка при обновлении статусов заказов: {str(e)}"
+        )
     finally:
-        conn.close()
+        await cur.close()
+
+    found = {order["id"] for order in updated}
+    return [
+        {
+            "order_id": update.order_id,
+            "status_id": update.status_id,
+            "status": status_names[update.status_id],
+            "updated": update.order_id in found,
+        }
+        for update in updates
+    ]
 
 # PUT /api/orders/{id}/status — все авторизованные пользователи
 @router.put("/{order_id}/status", response_model=Order)
-def update_order_status(order_id: int, update: OrderStatusUpdate, current_user=Depends(get_current_user)):
-    conn = get_db_connection()
+async def update_order_status(order_id: int, update: OrderStatusUpdate, current_user=Depends(get_current_user), conn=Depends(get_db)):
+    # id от клиента — только по закэшированному справочнику, без похода в базу
+    status_name = status_registry.name(update.status_id)
+    if status_name is None:
+        raise HTTPException(status_code=400, detail="Статус не найден")
+
     cur = conn.cursor()
 
     try:
-        # Check if order exists
-        cur.execute("""
-            SELECT id, status_id 
-            FROM frog_cafe.orders 
-            WHERE id = %s;
-        """, (order_id,))
-        order = cur.fetchone()
-
-        if not order:
-            raise HTTPException(status_code=404, detail="Заказ не найден")
-
         # Update order status
-        cur.execute("""
+        await cur.execute("""
             UPDATE frog_cafe.orders
             SET status_id = %s
             WHERE id = %s
             RETURNING id, created_at;
         """, (update.status_id, order_id))
 
-        updated = cur.fetchone()
+        updated = await cur.fetchone()
         if not updated:
-            raise HTTPException(status_code=500, detail="Не удалось обновить статус заказа")
-
-        # Get the new status name
-        cur.execute("""
-            SELECT name 
-            FROM frog_cafe.order_statuses 
-            WHERE id = %s;
-        """, (update.status_id,))
-        status = cur.fetchone()
-
-        if not status:
-            raise HTTPException(status_code=500, detail="Не удалось получить новый статус")
+            raise HTTPException(status_code=404, detail="Заказ не найден")
 
         # Get order items
-        cur.execute("""
+        await cur.execute("""
             SELECT 
                 m.id,
                 m.dish_name,
                 m.image,
+                m.image_thumb,
                 m.is_available,
                 m.description,
                 m.category,
                 m.quantity_left,
-                COUNT(*) as quantity
+                c.quantity
             FROM frog_cafe.cart c
             JOIN frog_cafe.menu m ON c.menu_item = m.id
             WHERE c.order_id = %s
-            GROUP BY m.id, m.dish_name, m.image, m.is_available, 
-                     m.description, m.category, m.quantity_left;
+            ORDER BY c.id;
         """, (order_id,))
-        items = cur.fetchall()
+        items = await cur.fetchall()
 
-        conn.commit()
-
-        return {
+        await conn.commit()
+        order = {
             "id": updated["id"],
             "created_at": updated["created_at"],
-            "status": status["name"],
+            "status": status_name,
             "items": items or []
         }
+        active_orders.put(order, update.status_id)
+
+        return order
 
     except HTTPException:
-        conn.rollback()
+        await conn.rollback()
         raise
     except Exception as e:
-        conn.rollback()
-        logger.error(f"Error in update_order_status: {str(e)}")
+        await conn.rollback()
+        logger.error("Error in update_order_status: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Ошибка при обновлении статуса заказа: {str(e)}"
         )
     finally:
-        cur.close()
-        conn.close()
+        await cur.close()
 
 # DELETE /api/orders/{id} — удаление заказа
 @router.delete("/{order_id}", status_code=204)
-def delete_order(order_id: int, current_user=Depends(get_current_user)):
-    conn = get_db_connection()
+async def delete_order(order_id: int, current_user=Depends(get_current_user), conn=Depends(get_db)):
     cur = conn.cursor()
 
     try:
         # Check if order exists and get its status
-        cur.execute("""
-            SELECT o.id, o.toad_id, s.name as status
-            FROM frog_cafe.orders o
-            JOIN frog_cafe.order_statuses s ON o.status_id = s.id
-            WHERE o.id = %s;
+        await cur.execute("""
+            SELECT id, status_id
+            FROM frog_cafe.orders
+            WHERE id = %s
+            FOR UPDATE;
         """, (order_id,))
-        order = cur.fetchone()
+        order = await cur.fetchone()
 
         if not order:
             raise HTTPException(status_code=404, detail="Заказ не найден")
 
         # Only allow deletion if status is "Выдан"
-        if order["status"] != "Выдан":
+        if order["status_id"] != await status_registry.get_id(DELIVERED_STATUS):
             raise HTTPException(
                 status_code=400,
                 detail="Можно удалить только заказы со статусом 'Выдан'"
             )
 
-        # Free the toad if it exists
-        if order["toad_id"]:
-            cur.execute("""
-                UPDATE frog_cafe.toads 
-                SET is_taken = false 
-                WHERE id = %s;
-            """, (order["toad_id"],))
-
-        # Delete cart items first (due to foreign key constraint)
-        cur.execute("DELETE FROM frog_cafe.cart WHERE order_id = %s;", (order_id,))
-
-        # Delete the order
-        cur.execute("DELETE FROM frog_cafe.orders WHERE id = %s RETURNING id;", (order_id,))
-        deleted = cur.fetchone()
+        # Корзина, заказ и освобождение жабы одним запросом
+        await cur.execute("""
+            WITH cart AS (
+                DELETE FROM frog_cafe.cart WHERE order_id = %s
+            ),
+            deleted AS (
+                DELETE FROM frog_cafe.orders WHERE id = %s
+                RETURNING id, toad_id
+            ),
+            toad AS (
+                UPDATE frog_cafe.toads
+                SET is_taken = false
+                WHERE id = (SELECT toad_id FROM deleted)
+            )
+            SELECT id FROM deleted;
+        """, (order_id, order_id))
+        deleted = await cur.fetchone()
 
         if not deleted:
             raise HTTPException(status_code=500, detail="Не удалось удалить заказ")
 
-        conn.commit()
+        await conn.commit()
+        active_orders.remove(order_id)
 
     except HTTPException:
-        conn.rollback()
+        await conn.rollback()
         raise
     except Exception as e:
-        conn.rollback()
-        logger.error(f"Error in delete_order: {str(e)}")
+        await conn.rollback()
+        logger.error("Error in delete_order: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Ошибка при удалении заказа: {str(e)}"
         )
     finally:
-        cur.close()
-        conn.close()
+        await cur.close()
 
     return  # FastAPI автоматически вернёт 204 No Content
 
 # DELETE /api/orders — удаление всех заказов
 @router.delete("/", status_code=204, dependencies=[Depends(get_current_user)])
-def clear_orders():
-    conn = get_db_connection()
+async def clear_orders(conn=Depends(get_db)):
     cur = conn.cursor()
 
     try:
-        # Start transaction
-        cur.execute("BEGIN;")
-
-        # Delete all orders
-        cur.execute("DELETE FROM frog_cafe.orders;")
+        # Delete all orders: корзины удаляются вместе с ними, жабы освобождаются
+        await cur.execute("""
+            WITH cart AS (
+                DELETE FROM frog_cafe.cart
+            ),
+            deleted AS (
+                DELETE FROM frog_cafe.orders
+                RETURNING toad_id
+            )
+            UPDATE frog_cafe.toads
+            SET is_taken = false
+            WHERE id IN (SELECT toad_id FROM deleted);
+        """)
         
         # Commit transaction
-        conn.commit()
+        await conn.commit()
+        active_orders.clear()
         
     except Exception as e:
-        conn.rollback()
+        await conn.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"Ошибка при очистке заказов: {str(e)}"
         )
     finally:
-        cur.close()
-        conn.close()
+        await cur.close()
 
     return  # FastAPI автоматически вернёт 204 No Content
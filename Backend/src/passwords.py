@@ -0,0 +1,90 @@
+from concurrent.futures import ProcessPoolExecutor
+from fastapi import HTTPException
+from src.metrics import Gauge
+import asyncio
+import bcrypt
+import os
+
+# Хеширование и проверка паролей: bcrypt занимает ядро на сотни миллисекунд,
+# поэтому считается в отдельных процессах, а не в потоке запроса.
+
+PASSWORD_WORKERS = int(os.getenv("PASSWORD_WORKERS", os.cpu_count() or 2))
+# Сколько операций может быть в работе и в очереди; сверх этого — 503
+PASSWORD_MAX_PENDING = int(os.getenv("PASSWORD_MAX_PENDING", PASSWORD_WORKERS * 4))
+# Стоимость bcrypt для новых хешей; старые пересчитываются при входе
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+
+_executor = None
+_pending = 0
+Gauge("password_pending", "Операций bcrypt в работе и в очереди", lambda: _pending)
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=PASSWORD_WORKERS)
+    return _executor
+
+
+def shutdown_executor():
+    global _executor
+    executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def hash_rounds(hashed: bytes):
+    # $2b$12$... — стоимость во втором поле
+    try:
+        return int(hashed.split(b"$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
+def _hash(password: bytes, rounds: int) -> bytes:
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds))
+
+
+def _verify(password: bytes, hashed: bytes, rounds: int):
+    """Выполняется в отдельном процессе: (пароль верен, новый хеш или None)."""
+    try:
+        if not bcrypt.checkpw(password, hashed):
+            return False, None
+    except ValueError:
+        # Испорченный хеш в базе — как неверный пароль
+        return False, None
+    if hash_rounds(hashed) != rounds:
+        return True, _hash(password, rounds)
+    return True, None
+
+
+def check_capacity():
+    """503, если очередь bcrypt полна. Вызывается и до того, как запрос займёт соединение с базой."""
+    if _pending >= PASSWORD_MAX_PENDING:
+        raise HTTPException(
+            status_code=503,
+            detail="Сервер перегружен, попробуйте ещё раз",
+            headers={"Retry-After": "1"},
+        )
+
+
+async def _run(func, *args):
+    global _pending
+    check_capacity()
+    _pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_executor(), func, *args)
+    finally:
+        _pending -= 1
+
+
+async def hash_password(password: str) -> str:
+    hashed = await _run(_hash, password.encode("utf-8"), BCRYPT_ROUNDS)
+    return hashed.decode("utf-8")
+
+
+async def verify_password(password: str, hashed: str):
+    """Проверяет пароль; вторым значением — хеш с текущей стоимостью, если старый пора заменить."""
+    ok, new_hash = await _run(_verify, password.encode("utf-8"), hashed.encode("utf-8"), BCRYPT_ROUNDS)
+    return ok, new_hash.decode("utf-8") if new_hash else None
@@ -0,0 +1,98 @@
+from collections import deque
+from datetime import datetime
+from psycopg import AsyncClientCursor, AsyncCursor, sql
+from psycopg.rows import tuple_row
+from src.metrics import Counter, Histogram, current_route
+import logging
+import os
+import random
+import re
+import time
+
+logger = logging.getLogger(__name__)
+
+# Запросы дольше этого, миллисекунды, пишутся в лог как медленные
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", 200))
+# Доля медленных запросов, для которых снимается EXPLAIN (ANALYZE, BUFFERS)
+SLOW_QUERY_EXPLAIN_RATE = float(os.getenv("SLOW_QUERY_EXPLAIN_RATE", 0.1))
+# Сколько последних планов держать в памяти процесса
+SLOW_QUERY_BUFFER = int(os.getenv("SLOW_QUERY_BUFFER", 50))
+
+DB_QUERIES = Counter("db_queries_total", "Запросы к базе по маршрутам", ("route",))
+DB_QUERY_DURATION = Histogram("db_query_duration_seconds", "Время запросов к базе", ("route",))
+SLOW_QUERIES = Counter("db_slow_queries_total", "Медленные запросы к базе по маршрутам", ("route",))
+
+# Последние планы медленных запросов, новые в конце
+slow_plans = deque(maxlen=SLOW_QUERY_BUFFER)
+
+# ANALYZE выполняет запрос повторно, поэтому объясняем только чтение без блокировок
+_READ_ONLY_RE = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+_WRITE_RE = re.compile(r"\b(INSERT|UPDATE|DELETE|MERGE|FOR\s+UPDATE|FOR\s+SHARE|NEXTVAL|SETVAL)\b", re.IGNORECASE)
+
+
+def _is_explainable(text):
+    return bool(_READ_ONLY_RE.match(text)) and not _WRITE_RE.search(text)
+
+
+def _compact(text):
+    # В лог и буфер — одной строкой; значения параметров туда не попадают,
+    # в тексте остаются только плейсхолдеры %s
+    return " ".join(text.split())
+
+
+class InstrumentedCursor(AsyncCursor):
+    """Курсор пула: меряет каждый запрос и помечает его маршрутом текущего HTTP-запроса.
+
+    Медленные запросы пишутся в лог без значений параметров; для доли из них
+    план EXPLAIN (ANALYZE, BUFFERS) складывается в slow_plans.
+    """
+
+    async def execute(self, query, params=None, **kwargs):
+        started = time.perf_counter()
+        ok = False
+        try:
+            result = await super().execute(query, params, **kwargs)
+            ok = True
+            return result
+        finally:
+            elapsed = time.perf_counter() - started
+            route = current_route()
+            DB_QUERIES.inc(route)
+            DB_QUERY_DURATION.observe(elapsed, route)
+            if elapsed * 1000 >= SLOW_QUERY_MS:
+                text = self._text(query)
+                SLOW_QUERIES.inc(route)
+                logger.warning(
+                    "Slow query %.1f ms on %s (%d params redacted): %.1000s",
+                    elapsed * 1000, route, len(params) if params else 0, _compact(text),
+                )
+                # План снимаем только после успешного запроса и только для доли медленных
+                if ok and random.random() < SLOW_QUERY_EXPLAIN_RATE and _is_explainable(text):
+                    await self._explain(text, params, elapsed, route)
+
+    async def _explain(self, text, params, elapsed, route):
+        try:
+            # Отдельный курсор: результат исходного запроса остаётся нетронутым.
+            # Клиентский — параметры подставляются в текст, EXPLAIN их иначе не принимает.
+            # Savepoint — чтобы ошибка EXPLAIN не сломала транзакцию запроса
+            async with self.connection.transaction():
+                async with AsyncClientCursor(self.connection, row_factory=tuple_row) as cur:
+                    await cur.execute(sql.SQL("EXPLAIN (ANALYZE, BUFFERS) ") + sql.SQL(text), params)
+                    plan = "\n".join(row[0] for row in await cur.fetchall())
+        except Exception as e:
+            logger.error("Error explaining slow query: %s", e)
+            return
+        slow_plans.append({
+            "captured_at": datetime.now(),
+            "route": route,
+            "duration_ms": round(elapsed * 1000, 1),
+            "query": _compact(text),
+            "plan": plan,
+        })
+
+    def _text(self, query):
+        if isinstance(query, sql.Composable):
+            return query.as_string(self.connection)
+        if isinstance(query, bytes):
+            return query.decode("utf-8")
+        return query
@@ -0,0 +1,103 @@
+from src.db import get_pool
+from src.events import event_bus
+import asyncio
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# Статусы, на которые завязана логика заказов
+CREATED_STATUS = "Создан"
+DELIVERED_STATUS = "Выдан"
+
+# Промах по справочнику перечитывает его не чаще раза в столько секунд
+REGISTRY_MISS_RELOAD_SECONDS = float(os.getenv("REGISTRY_MISS_RELOAD_SECONDS", 5))
+
+
+class Registry:
+    """Справочник id ↔ имя (статусы заказов, роли) в памяти процесса.
+
+    Загружается при старте и перечитывается после CRUD справочника;
+    правки из других воркеров приходят через шину изменений.
+    Горячие запросы фильтруют по id и не джойнят справочник.
+    """
+
+    def __init__(self, table: str):
+        self.table = table
+        self._by_id = {}
+        self._by_name = {}
+        self._listeners = []
+        self._tasks = set()
+        self._miss_reload_at = float("-inf")
+
+    def on_change(self, callback):
+        self._listeners.append(callback)
+
+    async def load(self, conn=None):
+        if conn is None:
+            async with get_pool().connection() as conn:
+                return await self.load(conn)
+        cur = await conn.execute(f"SELECT id, name FROM frog_cafe.{self.table} ORDER BY id;")
+        rows = await cur.fetchall()
+        by_id = {row["id"]: row["name"] for row in rows}
+        if by_id == self._by_id:
+            # Ничего не поменялось — подписчикам (проекции табло) перечитываться незачем
+            return
+        self._by_id = by_id
+        self._by_name = {name: item_id for item_id, name in by_id.items()}
+        for callback in self._listeners:
+            callback()
+
+    def name(self, item_id):
+        return self._by_id.get(item_id)
+
+    def id(self, name):
+        return self._by_name.get(name)
+
+    # Промах бывает, если запись только что создана в другом воркере и
+    # событие шины ещё не дошло: перечитываем справочник, прежде чем сдаться.
+    # Не чаще раза в REGISTRY_MISS_RELOAD_SECONDS — иначе поток запросов с
+    # выдуманными id превращается в поток запросов к базе.
+    # id от клиента проверяются через name()/id(), без перечитывания.
+
+    async def get_name(self, item_id):
+        if item_id not in self._by_id:
+            await self._reload_on_miss()
+        return self._by_id.get(item_id)
+
+    async def get_id(self, name):
+        if name not in self._by_name:
+            await self._reload_on_miss()
+        return self._by_name.get(name)
+
+    async def _reload_on_miss(self):
+        now = time.monotonic()
+        if now - self._miss_reload_at < REGISTRY_MISS_RELOAD_SECONDS:
+            return
+        # Отметка до await: параллельные промахи не перечитывают справочник каждый сам
+        self._miss_reload_at = now
+        await self.load()
+
+    def handle_event(self, event: dict):
+        # Справочники маленькие и меняются редко: просто перечитываем целиком
+        task = asyncio.get_running_loop().create_task(self._reload())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _reload(self):
+        try:
+            await self.load()
+        except Exception as e:
+            logger.error("Error reloading %s: %s", self.table, e)
+
+
+status_registry = Registry("order_statuses")
+role_registry = Registry("roles")
+event_bus.subscribe(["order_statuses"], status_registry.handle_event)
+event_bus.subscribe(["roles"], role_registry.handle_event)
+
+
+async def load_registries():
+    await status_registry.load()
+    await role_registry.load()
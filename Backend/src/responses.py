@@ -0,0 +1,43 @@
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+import orjson
+import os
+
+# Прогонять «доверенные» ответы через схему, как это сделал бы FastAPI.
+# Для разработки и проверок: медленнее, зато расхождение со схемой сразу видно.
+RESPONSE_VALIDATE = os.getenv("RESPONSE_VALIDATE", "0") == "1"
+
+
+class ORJSONResponse(JSONResponse):
+    """Ответ по умолчанию для эндпоинтов без response_model."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class TrustedJSON:
+    """Сериализатор ответа из данных, которые уже имеют форму схемы.
+
+    Строки из базы и проекция табло собираются нашими же запросами,
+    поэтому повторная валидация response_model им не нужна: orjson пишет
+    их в байты напрямую. response_model на маршруте остаётся — для OpenAPI.
+    Схема компилируется один раз, при создании сериализатора.
+    """
+
+    def __init__(self, schema):
+        self.adapter = TypeAdapter(schema)
+
+    def dumps(self, content) -> bytes:
+        if RESPONSE_VALIDATE:
+            return self.adapter.dump_json(self.adapter.validate_python(content))
+        return orjson.dumps(content)
+
+    def response(self, content, status_code: int = 200, headers: dict = None) -> Response:
+        return Response(self.dumps(content), status_code=status_code, headers=headers, media_type="application/json")
+
+    def passthrough(self, body, status_code: int = 200, headers: dict = None) -> Response:
+        """Готовый JSON (собранный базой или закэшированный) уходит клиенту как есть."""
+        if RESPONSE_VALIDATE:
+            body = self.adapter.dump_json(self.adapter.validate_json(body))
+        return Response(body, status_code=status_code, headers=headers, media_type="application/json")
@@ -11,10 +11,14 @@ class TokenResponse(BaseModel):
     token_type: str
     role_id: int
 
+class TokenRevoke(BaseModel):
+    token: str
+
 class MenuItem(BaseModel):
     id: int
     dish_name: str
     image: Optional[str]
+    image_thumb: Optional[str] = None
     is_available: bool
     description: Optional[str]
     category: Optional[str]
@@ -74,21 +78,31 @@ class OrderStatusCreate(BaseModel):
 
 class Toad(BaseModel):
     id: int
-    pic: str
     is_taken: bool
+    image_url: str
+    content_type: str
+    size: int
+    etag: str
 
     class Config:
         from_attributes = True
 
 class ToadCreate(BaseModel):
-    pic: str
+    pic: str  # data-URI или base64
     is_taken: bool = False
 
+class ToadUpdate(BaseModel):
+    pic: Optional[str] = None
+    is_taken: Optional[bool] = None
+
+class OrderItem(MenuItem):
+    quantity: int = 1
+
 class Order(BaseModel):
     id: int
     created_at: datetime
     status: str
-    items: List[MenuItem]
+    items: List[OrderItem]
 
     class Config:
         from_attributes = True
@@ -99,10 +113,21 @@ class OrderCreate(BaseModel):
 class OrderStatusUpdate(BaseModel):
     status_id: int
 
+class OrderStatusBulkItem(BaseModel):
+    order_id: int
+    status_id: int
+
+class OrderStatusResult(BaseModel):
+    order_id: int
+    status_id: int
+    status: str
+    updated: bool  # false — заказа с таким id нет
+
 class CartItem(BaseModel):
     id: int
     dish_name: str
     image: Optional[str]
+    image_thumb: Optional[str] = None
     description: Optional[str]
     is_available: bool
     quantity: int = 1
@@ -111,6 +136,7 @@ class CartItem(BaseModel):
         from_attributes = True
 
 class TVOrderItem(BaseModel):
+    id: Optional[int] = None
     dish_name: str
     quantity: int
 
@@ -124,7 +150,7 @@ class TVOrder(BaseModel):
         from_attributes = True
 
 class TVDisplay(BaseModel):
-    orders: List[Order]
+    orders: List[TVOrder]
 
     class Config:
         from_attributes = True
@@ -139,3 +165,14 @@ class UserResponse(BaseModel):
     id: int
     name: str
     role_id: int
+
+class SlowQuery(BaseModel):
+    captured_at: datetime
+    route: str
+    duration_ms: float
+    query: str
+    plan: str
+
+class LogLevelUpdate(BaseModel):
+    logger: str
+    level: str
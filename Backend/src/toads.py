@@ -1,71 +1,160 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from src.db import get_db_connection
-from src.schemas import Toad, ToadCreate
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from src.db import get_db
+from src.schemas import Toad, ToadCreate, ToadUpdate
 from src.dependencies import require_role
+from src.images import IMAGE_CONTENT_TYPES, IMAGE_HEADERS, decode_image
+from src.responses import TrustedJSON
+import re
 
 # This router is mounted under `/api`, so the prefix should not repeat it.
 router = APIRouter(prefix="/toads", tags=["toads"])
 
+toads_json = TrustedJSON(list[Toad])
+
+TOAD_COLUMNS = "id, is_taken, content_type, etag, octet_length(pic) AS size"
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def toads_base(request: Request):
+    # url_for перебирает все маршруты приложения — для списка жаб зовём его один раз
+    return request.url_for("get_all_toads").path.rstrip("/")
+
+
+def with_image_url(request: Request, toad: dict, base: str = None):
+    # Версия в URL: при смене картинки меняется адрес, поэтому кэш может быть immutable
+    base = base or toads_base(request)
+    toad["image_url"] = f"{base}/{toad['id']}/image?v={toad['etag']}"
+    return toad
+
+
 @router.get("/", response_model=list[Toad], dependencies=[Depends(require_role([0]))])
-def get_all_toads():
-    conn = get_db_connection()
+async def get_all_toads(request: Request, conn=Depends(get_db)):
     cur = conn.cursor()
-    cur.execute("SELECT id, pic, is_taken FROM frog_cafe.toads ORDER BY id;")
-    toads = cur.fetchall()
-    cur.close()
-    conn.close()
-    return toads
+    await cur.execute(f"SELECT {TOAD_COLUMNS} FROM frog_cafe.toads ORDER BY id;")
+    toads = await cur.fetchall()
+    await cur.close()
+    base = toads_base(request)
+    return toads_json.response([with_image_url(request, toad, base) for toad in toads])
 
 @router.post("/", response_model=Toad, status_code=status.HTTP_201_CREATED, dependencies=[Depends(require_role([0]))])
-def create_toad(toad: ToadCreate):
-    conn = get_db_connection()
+async def create_toad(request: Request, toad: ToadCreate, conn=Depends(get_db)):
+    data, content_type = decode_image(toad.pic)
     cur = conn.cursor()
-    cur.execute("INSERT INTO frog_cafe.toads (pic, is_taken) VALUES (%s, %s) RETURNING id, pic, is_taken;", (toad.pic, toad.is_taken))
-    new_toad = cur.fetchone()
-    conn.commit()
-    cur.close()
-    conn.close()
-    return new_toad
+    await cur.execute(f"""
+        INSERT INTO frog_cafe.toads (pic, content_type, is_taken)
+        VALUES (%s, %s, %s)
+        RETURNING {TOAD_COLUMNS};
+    """, (data, content_type, toad.is_taken))
+    new_toad = await cur.fetchone()
+    await conn.commit()
+    await cur.close()
+    return with_image_url(request, new_toad)
 
 @router.get("/{toad_id}", response_model=Toad, dependencies=[Depends(require_role([0]))])
-def get_toad(toad_id: int):
-    conn = get_db_connection()
+async def get_toad(request: Request, toad_id: int, conn=Depends(get_db)):
     cur = conn.cursor()
-    cur.execute("SELECT id, pic, is_taken FROM frog_cafe.toads WHERE id = %s;", (toad_id,))
-    toad = cur.fetchone()
-    cur.close()
-    conn.close()
+    await cur.execute(f"SELECT {TOAD_COLUMNS} FROM frog_cafe.toads WHERE id = %s;", (toad_id,))
+    toad = await cur.fetchone()
+    await cur.close()
     if not toad:
         raise HTTPException(status_code=404, detail="Жаба не найдена")
-    return toad
+    return with_image_url(request, toad)
+
+# Картинка отдаётся без авторизации: её грузит <img>, который не умеет слать Bearer-токен
+@router.get("/{toad_id}/image", response_class=Response)
+async def get_toad_image(request: Request, toad_id: int, conn=Depends(get_db)):
+    cur = conn.cursor()
+    await cur.execute("""
+        SELECT content_type, etag, octet_length(pic) AS size
+        FROM frog_cafe.toads
+        WHERE id = %s;
+    """, (toad_id,))
+    meta = await cur.fetchone()
+    if not meta:
+        await cur.close()
+        raise HTTPException(status_code=404, detail="Жаба не найдена")
+
+    etag = f'"{meta["etag"]}"'
+    size = meta["size"]
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=31536000, immutable",
+        "Accept-Ranges": "bytes",
+        **IMAGE_HEADERS,
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in [t.strip() for t in if_none_match.split(",")]):
+        await cur.close()
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    start, end = 0, size - 1
+    status_code = status.HTTP_200_OK
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range == etag):
+        match = RANGE_RE.match(range_header.strip())
+        # Поддерживается один диапазон; остальные формы и синтаксически
+        # неверный диапазон (конец раньше начала) игнорируются — отдаём целиком
+        first, last = match.groups() if match else ("", "")
+        if (first or last) and not (first and last and int(last) < int(first)):
+            if first:
+                start = int(first)
+                end = min(int(last), size - 1) if last else size - 1
+            else:
+                start = max(size - int(last), 0)
+            # Верный, но невыполнимый диапазон: начало за концом картинки
+            if start >= size:
+                await cur.close()
+                return Response(
+                    status_code=416,
+                    headers={**headers, "Content-Range": f"bytes */{size}"},
+                )
+            status_code = status.HTTP_206_PARTIAL_CONTENT
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    # Из базы читается только запрошенный кусок
+    await cur.execute("""
+        SELECT substring(pic FROM %s FOR %s) AS chunk
+        FROM frog_cafe.toads
+        WHERE id = %s;
+    """, (start + 1, end - start + 1, toad_id))
+    row = await cur.fetchone()
+    await cur.close()
+    if not row:
+        raise HTTPException(status_code=404, detail="Жаба не найдена")
+
+    # Строки, сохранённые до проверки форматов, могут нести любой тип — такие картинкой не отдаём
+    media_type = meta["content_type"] if meta["content_type"] in IMAGE_CONTENT_TYPES else "application/octet-stream"
+    return Response(content=row["chunk"], status_code=status_code, media_type=media_type, headers=headers)
 
 @router.put("/{toad_id}", response_model=Toad, dependencies=[Depends(require_role([0]))])
-def update_toad(toad_id: int, toad: ToadCreate):
-    conn = get_db_connection()
+async def update_toad(request: Request, toad_id: int, toad: ToadUpdate, conn=Depends(get_db)):
+    data, content_type = decode_image(toad.pic) if toad.pic is not None else (None, None)
     cur = conn.cursor()
-    cur.execute("""
+    await cur.execute(f"""
         UPDATE frog_cafe.toads
-        SET pic = %s, is_taken = %s
+        SET pic = COALESCE(%s, pic),
+            content_type = COALESCE(%s, content_type),
+            is_taken = COALESCE(%s, is_taken)
         WHERE id = %s
-        RETURNING id, pic, is_taken;
-    """, (toad.pic, toad.is_taken, toad_id))
-    updated = cur.fetchone()
-    conn.commit()
-    cur.close()
-    conn.close()
+        RETURNING {TOAD_COLUMNS};
+    """, (data, content_type, toad.is_taken, toad_id))
+    updated = await cur.fetchone()
+    await conn.commit()
+    await cur.close()
     if not updated:
         raise HTTPException(status_code=404, detail="Жаба не найдена")
-    return updated
+    return with_image_url(request, updated)
 
 @router.delete("/{toad_id}", status_code=204, dependencies=[Depends(require_role([0]))])
-def delete_toad(toad_id: int):
-    conn = get_db_connection()
+async def delete_toad(toad_id: int, conn=Depends(get_db)):
     cur = conn.cursor()
-    cur.execute("DELETE FROM frog_cafe.toads WHERE id = %s RETURNING id;", (toad_id,))
-    deleted = cur.fetchone()
-    conn.commit()
-    cur.close()
-    conn.close()
+    await cur.execute("DELETE FROM frog_cafe.toads WHERE id = %s RETURNING id;", (toad_id,))
+    deleted = await cur.fetchone()
+    await conn.commit()
+    await cur.close()
     if not deleted:
         raise HTTPException(status_code=404, detail="Жаба не найдена")
     return
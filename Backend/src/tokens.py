@@ -0,0 +1,122 @@
+from collections import OrderedDict
+from datetime import datetime, timezone
+from src.db import get_pool
+from src.events import event_bus
+import asyncio
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# Сколько проверенных токенов держать в памяти процесса
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", 4096))
+
+
+class TokenCache:
+    """LRU уже проверенных JWT: подпись проверяется один раз на токен, дальше — поиск в словаре.
+
+    Запись живёт не дольше exp самого токена.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def get(self, token: str):
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+        user, exp = entry
+        if exp is not None and time.time() >= exp:
+            del self._entries[token]
+            return None
+        self._entries.move_to_end(token)
+        return user
+
+    def put(self, token: str, user: dict, exp):
+        self._entries[token] = (user, exp)
+        self._entries.move_to_end(token)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+class RevocationList:
+    """Отозванные токены (jti) из frog_cafe.revoked_tokens.
+
+    Отзыв в любом воркере доходит до остальных через шину изменений,
+    поэтому проверка на каждом запросе — поиск в словаре без похода в базу.
+    jti хранится вместе с exp токена и выбрасывается после истечения:
+    истёкший токен и так не пройдёт проверку.
+    """
+
+    def __init__(self):
+        # jti -> exp (секунды epoch)
+        self._revoked = {}
+        self._tasks = set()
+
+    def is_revoked(self, jti) -> bool:
+        exp = self._revoked.get(jti) if jti is not None else None
+        if exp is None:
+            return False
+        if time.time() >= exp:
+            del self._revoked[jti]
+            return False
+        return True
+
+    def _add(self, jti: str, exp: float):
+        # Отзывы редки, поэтому чистим истёкшие при каждом добавлении
+        now = time.time()
+        self._revoked = {key: value for key, value in self._revoked.items() if value > now}
+        if exp > now:
+            self._revoked[jti] = exp
+
+    async def load(self):
+        async with get_pool().connection() as conn:
+            cur = await conn.execute("""
+                SELECT jti, extract(epoch FROM expires_at AT TIME ZONE 'UTC')::float8 AS exp
+                FROM frog_cafe.revoked_tokens
+                WHERE expires_at > now() AT TIME ZONE 'UTC';
+            """)
+            rows = await cur.fetchall()
+        self._revoked = {row["jti"]: row["exp"] for row in rows}
+
+    async def revoke(self, conn, jti: str, exp):
+        expires_at = datetime.fromtimestamp(exp, timezone.utc).replace(tzinfo=None)
+        cur = conn.cursor()
+        # Истёкшие токены и так не пройдут проверку, их записи больше не нужны
+        await cur.execute("DELETE FROM frog_cafe.revoked_tokens WHERE expires_at <= now() AT TIME ZONE 'UTC';")
+        await cur.execute("""
+            INSERT INTO frog_cafe.revoked_tokens (jti, expires_at)
+            VALUES (%s, %s)
+            ON CONFLICT (jti) DO NOTHING;
+        """, (jti, expires_at))
+        await conn.commit()
+        await cur.close()
+        self._add(jti, float(exp))
+
+    def handle_event(self, event: dict):
+        if event.get("jti") is not None and event.get("op") == "INSERT" and event.get("exp") is not None:
+            self._add(event["jti"], float(event["exp"]))
+            return
+        if event.get("op") == "DELETE":
+            return
+        # RESYNC (уведомления за время обрыва потеряны) или событие без срока
+        # от триггера до миграции 009 — перечитываем список
+        task = asyncio.get_running_loop().create_task(self._reload())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _reload(self):
+        try:
+            await self.load()
+        except Exception as e:
+            logger.error("Error reloading revoked tokens: %s", e)
+
+
+token_cache = TokenCache(TOKEN_CACHE_SIZE)
+revoked_tokens = RevocationList()
+event_bus.subscribe(["revoked_tokens"], revoked_tokens.handle_event)
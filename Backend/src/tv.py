@@ -1,133 +1,184 @@
-from fastapi import APIRouter, Depends, HTTPException
-from src.db import get_db_connection
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from src.board import active_orders
 from src.schemas import TVOrder, TVDisplay
-from src.dependencies import get_current_user, require_role
+from src.dependencies import get_current_user, get_current_user_or_query, require_role
+from src.metrics import Gauge
+from src.responses import TrustedJSON
+from src.compression import Precompressed
+import asyncio
+import contextlib
 import logging
+import os
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/tv", tags=["tv"])
 
+tv_orders_json = TrustedJSON(list[TVOrder])
+tv_display_json = TrustedJSON(TVDisplay)
 
-@router.get("/display", response_model=TVDisplay)
-def get_display_data(current_user=Depends(get_current_user)):
-    logger.info(f"TV display request from user: {current_user}")
+# Как часто слать keep-alive в поток табло, секунды
+TV_HEARTBEAT_SECONDS = float(os.getenv("TV_HEARTBEAT_SECONDS", 15))
+
+
+class RenderedBoard:
+    """Готовый JSON табло: собирается (и сжимается) один раз на версию
+    проекции, дальше каждый опрос и поток отдают одни и те же байты."""
+
+    def __init__(self):
+        self._cache = {}
+
+    def _get(self, key, render):
+        version = active_orders.version
+        cached = self._cache.get(key)
+        if cached is None or cached[0] != version:
+            cached = self._cache[key] = (version, Precompressed(render()))
+        return cached[1]
+
+    def tv_orders(self) -> Precompressed:
+        return self._get("orders", lambda: tv_orders_json.dumps(active_orders.tv_orders()))
+
+    def display(self) -> Precompressed:
+        return self._get("display", lambda: tv_display_json.dumps({"orders": active_orders.display_orders()}))
+
+
+rendered_board = RenderedBoard()
 
+
+@router.get("/display", response_model=TVDisplay)
+async def get_display_data(request: Request, current_user=Depends(get_current_user)):
     if current_user["role_id"] not in [0, 2]:
-        logger.warning(f"Unauthorized access attempt by user with role_id: {current_user['role_id']}")
+        logger.warning("Unauthorized access attempt by user with role_id: %s", current_user['role_id'])
         raise HTTPException(status_code=403, detail="Доступ запрещён")
 
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
-
-        query = """
-            WITH order_items AS (
-                SELECT 
-                    o.id as order_id,
-                    m.id,
-                    m.dish_name,
-                    COUNT(*) as quantity
-                FROM frog_cafe.orders o
-                JOIN frog_cafe.order_statuses s ON o.status_id = s.id
-                JOIN frog_cafe.cart c ON o.id = c.order_id
-                JOIN frog_cafe.menu m ON c.menu_item = m.id
-                WHERE s.name != 'Выдан'
-                GROUP BY o.id, m.id, m.dish_name
-            )
-            SELECT 
-                o.id,
-                o.created_at,
-                s.name AS status,
-                COALESCE(
-                    json_agg(
-                        json_build_object(
-                            'id', oi.id,
-                            'dish_name', oi.dish_name,
-                            'quantity', oi.quantity
-                        )
-                    ) FILTER (WHERE oi.dish_name IS NOT NULL),
-                    '[]'::json
-                ) AS items
-            FROM frog_cafe.orders o
-            JOIN frog_cafe.order_statuses s ON o.status_id = s.id
-            LEFT JOIN order_items oi ON o.id = oi.order_id
-            WHERE s.name != 'Выдан'
-            GROUP BY o.id, o.created_at, s.name
-            ORDER BY o.created_at DESC;
-        """
-        logger.info("Executing query: %s", query)
-        cur.execute(query)
-        orders = cur.fetchall()
-
-        cur.close()
-        conn.close()
-
-        # преобразуем null в []
-        for order in orders:
-            if not order["items"]:
-                order["items"] = []
-
-        return {"orders": orders}
+        await active_orders.ensure_loaded()
+        return rendered_board.display().response(request)
     except Exception as e:
-        logger.error(f"Error in get_display_data: {str(e)}")
+        logger.error("Error in get_display_data: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/orders", response_model=list[TVOrder])
-def get_tv_orders(current_user=Depends(get_current_user)):
+async def get_tv_orders(request: Request, current_user=Depends(get_current_user)):
     if current_user["role_id"] not in [0, 2]:
-        logger.warning(f"Unauthorized access attempt by user with role_id: {current_user['role_id']}")
+        logger.warning("Unauthorized access attempt by user with role_id: %s", current_user['role_id'])
         raise HTTPException(status_code=403, detail="Доступ запрещён")
 
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute("""
-            WITH order_items AS (
-                SELECT 
-                    o.id as order_id,
-                    m.dish_name,
-                    COUNT(*) as quantity
-                FROM frog_cafe.orders o
-                JOIN frog_cafe.order_statuses s ON o.status_id = s.id
-                JOIN frog_cafe.cart c ON o.id = c.order_id
-                JOIN frog_cafe.menu m ON c.menu_item = m.id
-                WHERE s.name IN ('Готовится', 'Готов')
-                GROUP BY o.id, m.dish_name
-            )
-            SELECT 
-                o.id,
-                o.created_at,
-                s.name as status,
-                COALESCE(
-                    json_agg(
-                        json_build_object(
-                            'dish_name', oi.dish_name,
-                            'quantity', oi.quantity
-                        )
-                    ) FILTER (WHERE oi.dish_name IS NOT NULL),
-                    '[]'::json
-                ) as items
-            FROM frog_cafe.orders o
-            JOIN frog_cafe.order_statuses s ON o.status_id = s.id
-            LEFT JOIN order_items oi ON o.id = oi.order_id
-            WHERE s.name IN ('Готовится', 'Готов')
-            GROUP BY o.id, o.created_at, s.name
-            ORDER BY o.created_at ASC;
-        """)
-        orders = cur.fetchall()
-        cur.close()
-        conn.close()
-        
-        # Преобразуем пустые массивы в пустые списки
-        for order in orders:
-            if not order['items']:
-                order['items'] = []
-                
-        return orders
+        await active_orders.ensure_loaded()
+        return rendered_board.tv_orders().response(request)
     except Exception as e:
-        logger.error(f"Error in get_tv_orders: {str(e)}")
+        logger.error("Error in get_tv_orders: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
+
+
+class TVBoardBroadcaster:
+    """Один продюсер на процесс: по сигналу пересобирает табло и раздаёт его всем подписчикам.
+
+    Табло строится из проекции активных заказов, всплеск изменений
+    схлопывается в одну сборку, а подписчик, который не успевает читать,
+    получает только последнее состояние.
+    """
+
+    DEBOUNCE_SECONDS = 0.2
+
+    def __init__(self):
+        self._subscribers = set()
+        self._changed = asyncio.Event()
+        self._latest = None
+        self._task = None
+
+    @property
+    def subscriber_count(self):
+        return len(self._subscribers)
+
+    def notify(self):
+        self._changed.set()
+
+    def subscribe(self):
+        queue = asyncio.Queue(maxsize=1)
+        self._subscribers.add(queue)
+        if self._latest is not None:
+            queue.put_nowait(self._latest)
+        else:
+            self._changed.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._produce())
+        return queue
+
+    def unsubscribe(self, queue):
+        self._subscribers.discard(queue)
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._subscribers.clear()
+        self._latest = None
+        self._changed = asyncio.Event()
+
+    async def _produce(self):
+        while True:
+            await self._changed.wait()
+            await asyncio.sleep(self.DEBOUNCE_SECONDS)
+            self._changed.clear()
+
+            if not self._subscribers:
+                # Слушать некому — снимок устареет, пересоберём при следующей подписке
+                self._latest = None
+                continue
+
+            try:
+                await active_orders.ensure_loaded()
+            except Exception as e:
+                logger.error("Error in TV board producer: %s", e)
+                await asyncio.sleep(1)
+                self._changed.set()
+                continue
+
+            payload = rendered_board.tv_orders().body
+            if payload == self._latest:
+                continue
+            self._latest = payload
+            for queue in list(self._subscribers):
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(payload)
+
+
+tv_board = TVBoardBroadcaster()
+Gauge("tv_subscribers", "Открытых потоков табло", lambda: tv_board.subscriber_count)
+active_orders.on_change(tv_board.notify)
+
+
+# Server-Sent Events: табло приходит сразу при подключении и затем при каждом изменении
+@router.get("/orders/stream", response_class=StreamingResponse)
+async def stream_tv_orders(current_user=Depends(get_current_user_or_query)):
+    if current_user["role_id"] not in [0, 2]:
+        logger.warning("Unauthorized access attempt by user with role_id: %s", current_user['role_id'])
+        raise HTTPException(status_code=403, detail="Доступ запрещён")
+
+    queue = tv_board.subscribe()
+
+    async def events():
+        try:
+            while True:
+                try:
+                    payload = await asyncio.wait_for(queue.get(), timeout=TV_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    # Комментарий держит соединение открытым через прокси
+                    yield b": ping\n\n"
+                    continue
+                yield b"data: " + payload + b"\n\n"
+        finally:
+            tv_board.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
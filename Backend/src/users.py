@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
-from src.db import get_db_connection
+from src.db import checkout, get_db
 from src.schemas import User, UserCreate
 from src.dependencies import require_role
-import bcrypt
+from src.registry import role_registry
+from src.passwords import hash_password
+import psycopg
 
 # Routers are mounted under `/api` in `main.py`; using `/api/users` here
 # resulted in paths like `/api/api/users`. Use a relative prefix instead.
@@ -10,60 +12,61 @@ router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.get("/", response_model=list[User], dependencies=[Depends(require_role([0]))])
-def get_users():
-    conn = get_db_connection()
+async def get_users(conn=Depends(get_db)):
     cur = conn.cursor()
-    cur.execute("SELECT id, name, role_id FROM frog_cafe.users ORDER BY id")
-    users = cur.fetchall()
-    cur.close()
-    conn.close()
+    await cur.execute("SELECT id, name, role_id FROM frog_cafe.users ORDER BY id")
+    users = await cur.fetchall()
+    await cur.close()
     return users
 
 
 @router.post("/", response_model=User, dependencies=[Depends(require_role([0]))])
-def create_user(user: UserCreate):
-    conn = get_db_connection()
-    cur = conn.cursor()
-
-    # Проверка, существует ли пользователь с таким именем
-    cur.execute("SELECT * FROM frog_cafe.users WHERE name = %s", (user.name,))
-    existing = cur.fetchone()
+async def create_user(user: UserCreate):
+    if role_registry.name(user.role_id) is None:
+        raise HTTPException(status_code=400, detail="Роль не найдена")
 
-    if existing:
-        cur.close()
-        conn.close()
-        raise HTTPException(status_code=400, detail="Пользователь с таким именем уже существует")
+    # Проверка, существует ли пользователь с таким именем — до bcrypt,
+    # на коротком соединении
+    async with checkout() as conn:
+        cur = await conn.execute("SELECT id FROM frog_cafe.users WHERE name = %s", (user.name,))
+        if await cur.fetchone():
+            raise HTTPException(status_code=400, detail="Пользователь с таким именем уже существует")
 
-    # Хеширование пароля перед сохранением
-    hashed_password = bcrypt.hashpw(user.password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    # Хеширование пароля перед сохранением: соединение в это время свободно
+    hashed_password = await hash_password(user.password)
 
     # Вставка нового пользователя
-    cur.execute(
-        """
-        INSERT INTO frog_cafe.users (name, pass, role_id)
-        VALUES (%s, %s, %s)
-        RETURNING id, name, role_id
-        """,
-        (user.name, hashed_password, user.role_id),
-    )
-
-    new_user = cur.fetchone()
-    conn.commit()
-    cur.close()
-    conn.close()
+    async with checkout() as conn:
+        cur = conn.cursor()
+        try:
+            await cur.execute(
+                """
+                INSERT INTO frog_cafe.users (name, pass, role_id)
+                VALUES (%s, %s, %s)
+                RETURNING id, name, role_id
+                """,
+                (user.name, hashed_password, user.role_id),
+            )
+        except psycopg.errors.UniqueViolation:
+            # Имя успели занять между проверкой и вставкой
+            await conn.rollback()
+            await cur.close()
+            raise HTTPException(status_code=400, detail="Пользователь с таким именем уже существует")
+
+        new_user = await cur.fetchone()
+        await conn.commit()
+        await cur.close()
 
     return new_user
 
 
 
 @router.get("/{user_id}", response_model=User, dependencies=[Depends(require_role([0]))])
-def get_user(user_id: int):
-    conn = get_db_connection()
+async def get_user(user_id: int, conn=Depends(get_db)):
     cur = conn.cursor()
-    cur.execute("SELECT id, name, role_id FROM frog_cafe.users WHERE id = %s", (user_id,))
-    user = cur.fetchone()
-    cur.close()
-    conn.close()
+    await cur.execute("SELECT id, name, role_id FROM frog_cafe.users WHERE id = %s", (user_id,))
+    user = await cur.fetchone()
+    await cur.close()
 
     if not user:
         raise HTTPException(status_code=404, detail="Пользователь не найден")
@@ -73,52 +76,57 @@ def get_user(user_id: int):
 
 
 @router.put("/{user_id}", response_model=User, dependencies=[Depends(require_role([0]))])
-def update_user(user_id: int, updated: UserCreate):
-    conn = get_db_connection()
-    cur = conn.cursor()
+async def update_user(user_id: int, updated: UserCreate):
+    if role_registry.name(updated.role_id) is None:
+        raise HTTPException(status_code=400, detail="Роль не найдена")
 
-    # Проверим, существует ли пользователь
-    cur.execute("SELECT * FROM frog_cafe.users WHERE id = %s", (user_id,))
-    existing = cur.fetchone()
+    # Проверим, существует ли пользователь, — до bcrypt, на коротком соединении
+    async with checkout() as conn:
+        cur = await conn.execute("SELECT id FROM frog_cafe.users WHERE id = %s", (user_id,))
+        if not await cur.fetchone():
+            raise HTTPException(status_code=404, detail="Пользователь не найден")
 
-    if not existing:
-        cur.close()
-        conn.close()
-        raise HTTPException(status_code=404, detail="Пользователь не найден")
-
-    # Хешируем пароль при обновлении
-    hashed_password = bcrypt.hashpw(updated.password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    # Хешируем пароль при обновлении: соединение в это время свободно
+    hashed_password = await hash_password(updated.password)
 
     # Обновляем пользователя
-    cur.execute(
-        """
-        UPDATE frog_cafe.users
-        SET name = %s, pass = %s, role_id = %s
-        WHERE id = %s
-        RETURNING id, name, role_id;
-        """,
-        (updated.name, hashed_password, updated.role_id, user_id),
-    )
-
-    user = cur.fetchone()
-    conn.commit()
-    cur.close()
-    conn.close()
+    async with checkout() as conn:
+        cur = conn.cursor()
+        try:
+            await cur.execute(
+                """
+                UPDATE frog_cafe.users
+                SET name = %s, pass = %s, role_id = %s
+                WHERE id = %s
+                RETURNING id, name, role_id;
+                """,
+                (updated.name, hashed_password, updated.role_id, user_id),
+            )
+        except psycopg.errors.UniqueViolation:
+            await conn.rollback()
+            await cur.close()
+            raise HTTPException(status_code=400, detail="Пользователь с таким именем уже существует")
+
+        user = await cur.fetchone()
+        await conn.commit()
+        await cur.close()
+
+    # Пользователя успели удалить, пока считался хеш
+    if not user:
+        raise HTTPException(status_code=404, detail="Пользователь не найден")
 
     return user
 
 
 
 @router.delete("/{user_id}", status_code=204, dependencies=[Depends(require_role([0]))])
-def delete_user(user_id: int):
-    conn = get_db_connection()
+async def delete_user(user_id: int, conn=Depends(get_db)):
     cur = conn.cursor()
 
-    cur.execute("DELETE FROM frog_cafe.users WHERE id = %s RETURNING id", (user_id,))
-    deleted = cur.fetchone()
-    conn.commit()
-    cur.close()
-    conn.close()
+    await cur.execute("DELETE FROM frog_cafe.users WHERE id = %s RETURNING id", (user_id,))
+    deleted = await cur.fetchone()
+    await conn.commit()
+    await cur.close()
 
     if not deleted:
         raise HTTPException(status_code=404, detail="Пользователь не найден")
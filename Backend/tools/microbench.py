@@ -0,0 +1,387 @@
+"""Микробенчмарки эндпоинтов на засеянной базе.
+
+Для каждого размера (число строк в корзинах) скрипт пересоздаёт схему frog_cafe
+из InitDB.sql, засевает её заказами, корзинами, пользователями и жабами
+и гоняет эндпоинты orders, cart, menu, tv, toads и users внутри процесса —
+через ASGI, без сети, с настоящим lifespan (пул, справочники, проекция табло).
+Каждый эндпоинт меряется отдельно на каждом размере: медиана, p95, минимум.
+
+Засев детерминирован (без random()), поэтому прогоны сравнимы между собой.
+Отчёт можно сохранить (--json) и сравнить со старым (--baseline): при
+ухудшении медианы сверх --threshold скрипт завершается с кодом 1.
+
+ВНИМАНИЕ: схема frog_cafe в базе --database удаляется. Имя базы задаётся
+только явно, остальные параметры подключения берутся из DB_*.
+
+    python tools/microbench.py --database bench --sizes 10000,100000,1000000 --json bench.json
+    python tools/microbench.py --database bench --sizes 10000,100000,1000000 --baseline bench.json
+"""
+from pathlib import Path
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import sys
+import time
+
+try:
+    import httpx
+except ImportError:
+    sys.exit("Нужен httpx: pip install httpx")
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+INIT_SQL = BACKEND_DIR / "sql_code" / "InitDB.sql"
+
+# Позиций в заказе при засеве: заказов = строк корзин / ITEMS_PER_ORDER
+ITEMS_PER_ORDER = 3
+# Столько последних заказов не выданы и попадают на табло
+ACTIVE_ORDERS = 300
+MENU_SIZE = 200
+TOADS = 500
+
+# Запросы с параметрами уходят по одному: extended protocol не принимает несколько команд
+SEED_SQL = [
+    """
+    INSERT INTO frog_cafe.menu (dish_name, description, category, quantity_left)
+    SELECT 'Блюдо ' || g, 'Описание блюда ' || g, 'Категория ' || (g %% 10), 100000000
+    FROM generate_series(1, %(menu)s) g;
+    """,
+    """
+    INSERT INTO frog_cafe.users (name, pass, role_id)
+    SELECT 'bench' || g, 'x', 1
+    FROM generate_series(1, %(users)s) g;
+    """,
+    """
+    INSERT INTO frog_cafe.toads (pic, content_type)
+    SELECT t.pic, t.content_type
+    FROM (SELECT pic, content_type FROM frog_cafe.toads ORDER BY id LIMIT 1) t,
+         generate_series(1, %(toads)s);
+    """,
+    # Старые заказы выданы, последние ACTIVE_ORDERS раскиданы по активным статусам
+    """
+    INSERT INTO frog_cafe.orders (user_id, status_id, created_at)
+    SELECT
+        u.min_id + g %% %(users)s,
+        CASE WHEN g > %(orders)s - %(active)s THEN 1 + g %% 3 ELSE 4 END,
+        timestamp '2025-01-01' + g * interval '1 second'
+    FROM generate_series(1, %(orders)s) g,
+         (SELECT min(id) AS min_id FROM frog_cafe.users WHERE name LIKE 'bench%%') u;
+    """,
+    """
+    INSERT INTO frog_cafe.cart (order_id, menu_item, quantity)
+    SELECT o.id, m.min_id + (o.id * 7 + j * 13) %% %(menu)s, 1 + j
+    FROM frog_cafe.orders o,
+         generate_series(0, %(items)s - 1) j,
+         (SELECT min(id) AS min_id FROM frog_cafe.menu WHERE dish_name LIKE 'Блюдо %%') m;
+    """,
+]
+
+
+def seed(conninfo, cart_rows):
+    """Пересоздаёт схему и засевает её; возвращает id засеянных сущностей для сценариев."""
+    import psycopg
+
+    orders = max(cart_rows // ITEMS_PER_ORDER, ACTIVE_ORDERS)
+    users = max(orders // 100, 10)
+    with psycopg.connect(conninfo, autocommit=True) as conn:
+        conn.execute("DROP SCHEMA IF EXISTS frog_cafe CASCADE;")
+        conn.execute(INIT_SQL.read_text(encoding="utf-8"))
+        params = {
+            "menu": MENU_SIZE,
+            "users": users,
+            "toads": TOADS,
+            "orders": orders,
+            "active": ACTIVE_ORDERS,
+            "items": ITEMS_PER_ORDER,
+        }
+        with conn.transaction():
+            for statement in SEED_SQL:
+                conn.execute(statement, params)
+        conn.execute("ANALYZE;")
+        row = conn.execute("""
+            SELECT
+                (SELECT id FROM frog_cafe.users WHERE role_id = 0 ORDER BY id LIMIT 1),
+                (SELECT id FROM frog_cafe.users WHERE role_id = 2 ORDER BY id LIMIT 1),
+                (SELECT max(id) FROM frog_cafe.orders),
+                (SELECT min(id) FROM frog_cafe.orders),
+                (SELECT min(id) FROM frog_cafe.menu WHERE dish_name LIKE 'Блюдо %'),
+                (SELECT min(id) FROM frog_cafe.toads),
+                (SELECT min(id) FROM frog_cafe.users WHERE name LIKE 'bench%');
+        """).fetchone()
+        cart_count = conn.execute("SELECT count(*) FROM frog_cafe.cart;").fetchone()[0]
+    keys = ["admin_id", "tv_id", "newest_order", "oldest_order", "menu_id", "toad_id", "user_id"]
+    return {**dict(zip(keys, row)), "cart_rows": cart_count}
+
+
+def tokens_for(ids):
+    from src.auth import create_access_token
+
+    def headers(user_id, role_id):
+        token = create_access_token({"sub": str(user_id), "name": f"user{user_id}", "role_id": role_id})
+        return {"Authorization": f"Bearer {token}"}
+
+    return {
+        "admin": headers(ids["admin_id"], 0),
+        "tv": headers(ids["tv_id"], 2),
+    }
+
+
+class Case:
+    """Один замер: запрос и, при необходимости, подготовка вне замера.
+
+    prepare(http, auth) возвращает kwargs запроса — так, например, корзина
+    каждый раз наполняется в свежий заказ, а не в уже заполненный.
+    """
+
+    def __init__(self, name, method, url, role="admin", prepare=None, expect=200, **kwargs):
+        self.name = name
+        self.method = method
+        self.url = url
+        self.role = role
+        self.prepare = prepare
+        self.expect = expect
+        self.kwargs = kwargs
+
+
+def cases(ids):
+    newest, oldest = ids["newest_order"], ids["oldest_order"]
+    menu_ids = [ids["menu_id"] + i for i in range(0, 40, 4)]
+
+    async def fresh_order(http, auth):
+        response = await http.post("/api/orders/", headers=auth["admin"])
+        response.raise_for_status()
+        return {"url": f"/api/cart/{response.json()['id']}"}
+
+    # Гоняем один и тот же активный заказ по статусам «Готовится» ⇄ «Готов»
+    statuses = itertools.cycle([2, 3])
+
+    async def next_status(http, auth):
+        return {"json": {"status_id": next(statuses)}}
+
+    # То же для пачки из 20 последних заказов
+    bulk_statuses = itertools.cycle([2, 3])
+
+    async def next_bulk_status(http, auth):
+        status_id = next(bulk_statuses)
+        return {"json": [{"order_id": newest - i, "status_id": status_id} for i in range(20)]}
+
+    return [
+        # orders: горячий путь — первая страница, глубокая страница и фильтр по статусу
+        Case("get_orders", "GET", "/api/orders/", params={"limit": 100}),
+        Case("get_orders_deep", "GET", "/api/orders/", params={"limit": 100, "cursor": deep_cursor(ids)}),
+        Case("get_orders_by_status", "GET", "/api/orders/", params={"limit": 100, "status_id": 1}),
+        Case("get_order", "GET", f"/api/orders/{oldest}"),
+        Case("create_order", "POST", "/api/orders/", expect=201),
+        Case("update_order_status", "PUT", f"/api/orders/{newest}/status", prepare=next_status),
+        Case("update_order_statuses", "PUT", "/api/orders/status", prepare=next_bulk_status),
+        # cart
+        Case("get_cart", "GET", f"/api/cart/{oldest}"),
+        Case("add_multiple_to_cart", "POST", None, prepare=fresh_order, json={"menu_items": menu_ids}),
+        # menu
+        Case("get_menu", "GET", "/api/menu/"),
+        Case("get_menu_item", "GET", f"/api/menu/{ids['menu_id']}"),
+        # tv
+        Case("get_tv_orders", "GET", "/api/tv/orders", role="tv"),
+        Case("get_display_data", "GET", "/api/tv/display", role="tv"),
+        # toads
+        Case("get_all_toads", "GET", "/api/toads/"),
+        Case("get_toad_image", "GET", f"/api/toads/{ids['toad_id']}/image"),
+        # users
+        Case("get_users", "GET", "/api/users/"),
+        Case("get_user", "GET", f"/api/users/{ids['user_id']}"),
+    ]
+
+
+def deep_cursor(ids):
+    from datetime import datetime, timedelta
+    from src.orders import encode_cursor
+
+    # Середина истории: keyset должен стоить столько же, сколько первая страница
+    middle = (ids["newest_order"] - ids["oldest_order"]) // 2
+    created_at = datetime(2025, 1, 1) + timedelta(seconds=middle + 1)
+    return encode_cursor(created_at, ids["oldest_order"] + middle)
+
+
+def declared_schema(app, method, url):
+    """response_model маршрута, который обслужит запрос (без префикса /api)."""
+    from starlette.routing import Match
+
+    api_app = next(route.app for route in app.routes if getattr(route, "path", None) == "/api")
+    scope = {"type": "http", "method": method, "path": url.split("?")[0].removeprefix("/api")}
+    for route in api_app.routes:
+        if route.matches(scope)[0] == Match.FULL:
+            return getattr(route, "response_model", None)
+    return None
+
+
+def schema_mismatches(schema, body):
+    """Сверяет ответ с объявленной схемой: валидность и ровно те же поля на всех уровнях.
+
+    Нужна для ответов, которые уходят клиенту мимо response_model (готовый
+    JSON из базы или из кэша табло): FastAPI их уже не проверяет.
+    """
+    from pydantic import TypeAdapter, ValidationError
+
+    adapter = TypeAdapter(schema)
+    try:
+        validated = adapter.validate_json(body)
+    except ValidationError as e:
+        return [str(e)]
+    return list(shape_diff(json.loads(adapter.dump_json(validated)), json.loads(body), "$"))
+
+
+def shape_diff(expected, actual, path):
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        if expected.keys() != actual.keys():
+            yield f"{path}: поля {sorted(actual)}, по схеме {sorted(expected)}"
+        for key in expected.keys() & actual.keys():
+            yield from shape_diff(expected[key], actual[key], f"{path}.{key}")
+    elif isinstance(expected, list) and isinstance(actual, list):
+        for i, (e, a) in enumerate(zip(expected, actual)):
+            yield from shape_diff(e, a, f"{path}[{i}]")
+    elif type(expected) is not type(actual):
+        yield f"{path}: {type(actual).__name__}, по схеме {type(expected).__name__}"
+
+
+async def measure(http, auth, case, repeat, warmup, check=None):
+    samples = []
+    for i in range(warmup + repeat):
+        kwargs = dict(case.kwargs)
+        url = case.url
+        if case.prepare is not None:
+            prepared = await case.prepare(http, auth)
+            url = prepared.pop("url", url)
+            kwargs.update(prepared)
+        started = time.perf_counter()
+        response = await http.request(case.method, url, headers=auth[case.role], **kwargs)
+        elapsed = time.perf_counter() - started
+        if response.status_code != case.expect:
+            raise RuntimeError(f"{case.name}: {response.status_code} {response.text[:200]}")
+        if check is not None and i == 0:
+            check(case, url, response)
+        if i >= warmup:
+            samples.append(elapsed)
+    samples.sort()
+    return {
+        "median_ms": round(samples[len(samples) // 2] * 1000, 3),
+        "p95_ms": round(samples[min(len(samples) - 1, len(samples) * 95 // 100)] * 1000, 3),
+        "min_ms": round(samples[0] * 1000, 3),
+    }
+
+
+async def bench_size(app, ids, args, problems):
+    results = {}
+    auth = tokens_for(ids)
+
+    def check(case, url, response):
+        schema = declared_schema(app, case.method, url)
+        if schema is not None:
+            problems.extend(f"{case.name}: {problem}" for problem in schema_mismatches(schema, response.content))
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+            for case in cases(ids):
+                if args.only and case.name not in args.only:
+                    continue
+                results[case.name] = await measure(
+                    http, auth, case, args.repeat, args.warmup, check if args.check_schemas else None,
+                )
+                print(f"  {case.name:<24}{results[case.name]['median_ms']:>10} мс", flush=True)
+    return results
+
+
+def run(args):
+    # Имя базы — только из --database: схема в ней будет пересоздана
+    os.environ["DB_NAME"] = args.database
+    sys.path.insert(0, str(BACKEND_DIR))
+    from src.db import get_conninfo
+    from src.main import app
+
+    report = {"config": config_of(args), "sizes": {}, "schema_problems": []}
+    for size in args.sizes:
+        print(f"Засев: {size} строк корзин...", flush=True)
+        started = time.perf_counter()
+        ids = seed(get_conninfo(), size)
+        print(f"  готово за {time.perf_counter() - started:.1f} с", flush=True)
+        report["sizes"][str(size)] = asyncio.run(bench_size(app, ids, args, report["schema_problems"]))
+    return report
+
+
+def config_of(args):
+    return {"repeat": args.repeat, "warmup": args.warmup, "sizes": args.sizes}
+
+
+def print_report(report):
+    header = f"{'size':>9}  {'case':<24}{'median':>10}{'p95':>10}{'min':>10}"
+    print(header)
+    print("-" * len(header))
+    for size, results in report["sizes"].items():
+        for name, row in results.items():
+            print(f"{size:>9}  {name:<24}{row['median_ms']:>10}{row['p95_ms']:>10}{row['min_ms']:>10}")
+
+
+def compare(report, baseline, threshold, min_delta_ms):
+    """Возвращает список регрессий медианы относительно сохранённого отчёта.
+
+    Разница меньше min_delta_ms не считается: на быстрых путях это шум.
+    """
+    problems = []
+    for size, old_results in baseline["sizes"].items():
+        new_results = report["sizes"].get(size)
+        if new_results is None:
+            continue
+        for name, old in old_results.items():
+            new = new_results.get(name)
+            if new is None:
+                continue
+            limit = max(old["median_ms"] * (1 + threshold), old["median_ms"] + min_delta_ms)
+            if new["median_ms"] > limit:
+                problems.append(f"{size}/{name}: median {old['median_ms']} -> {new['median_ms']} мс")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Микробенчмарки эндпоинтов на засеянной базе")
+    parser.add_argument("--database", required=True, help="база, в которой схема frog_cafe будет пересоздана")
+    parser.add_argument("--sizes", default="10000,100000,1000000",
+                        type=lambda s: [int(x) for x in s.split(",")], help="строк корзин, через запятую")
+    parser.add_argument("--repeat", type=int, default=50, help="замеров на эндпоинт")
+    parser.add_argument("--warmup", type=int, default=5, help="прогревочных запросов вне замера")
+    parser.add_argument("--only", type=lambda s: set(s.split(",")), help="только эти сценарии, через запятую")
+    parser.add_argument("--check-schemas", action="store_true",
+                        help="сверить первый ответ каждого сценария с response_model маршрута")
+    parser.add_argument("--json", help="сохранить отчёт в файл")
+    parser.add_argument("--baseline", help="сравнить с сохранённым отчётом")
+    parser.add_argument("--threshold", type=float, default=0.25, help="допустимое ухудшение медианы, доля")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5, help="меньшая разница считается шумом")
+    args = parser.parse_args()
+    # Строка лога на каждый запрос исказит замеры
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    report = run(args)
+    print_report(report)
+
+    for problem in report["schema_problems"]:
+        print(f"СХЕМА: {problem}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            problems = compare(report, json.load(f), args.threshold, args.min_delta_ms)
+        for problem in problems:
+            print(f"РЕГРЕССИЯ: {problem}")
+        if problems:
+            sys.exit(1)
+
+    if report["schema_problems"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""Нагрузочный прогон «вечеринка» против запущенного backend'а.
+
+Гости логинятся, смотрят меню, создают заказы, наполняют корзины и опрашивают
+свой заказ; телевизоры опрашивают табло; админ двигает заказы по статусам
+и убирает выданные. В конце — пропускная способность и p50/p95/p99 по эндпоинтам.
+
+Прогон воспроизводим: каждый виртуальный пользователь ведёт себя по своему
+генератору случайных чисел от --seed, а гость делает фиксированное число
+заказов (--rounds), поэтому объём работы одинаков от прогона к прогону.
+Отчёт можно сохранить (--json) и сравнить со старым (--baseline).
+
+Запускать против отдельной базы: скрипт создаёт пользователей guestNNN
+и поднимает остатки блюд до --stock.
+
+    python tools/party_load.py --guests 50 --tvs 3 --rounds 3 --json report.json
+    python tools/party_load.py --guests 50 --tvs 3 --rounds 3 --baseline report.json
+"""
+from collections import defaultdict
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+try:
+    import httpx
+except ImportError:
+    sys.exit("Нужен httpx: pip install httpx")
+
+
+class Stats:
+    """Задержки и коды ответов по эндпоинтам («METHOD /шаблон/пути»)."""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.codes = defaultdict(lambda: defaultdict(int))
+
+    def record(self, endpoint, seconds, status_code):
+        self.latencies[endpoint].append(seconds)
+        self.codes[endpoint][status_code] += 1
+
+    def report(self, wall_seconds):
+        result = {}
+        for endpoint in sorted(self.latencies):
+            samples = sorted(self.latencies[endpoint])
+            codes = self.codes[endpoint]
+            result[endpoint] = {
+                "count": len(samples),
+                "rps": round(len(samples) / wall_seconds, 2),
+                "p50_ms": round(percentile(samples, 50) * 1000, 1),
+                "p95_ms": round(percentile(samples, 95) * 1000, 1),
+                "p99_ms": round(percentile(samples, 99) * 1000, 1),
+                "max_ms": round(samples[-1] * 1000, 1),
+                "4xx": sum(n for code, n in codes.items() if 400 <= code < 500),
+                "5xx": sum(n for code, n in codes.items() if code >= 500 or code == 0),
+            }
+        return result
+
+
+def percentile(samples, p):
+    # Nearest-rank: без интерполяции, чтобы числа было легко сверять руками
+    rank = max(1, -(-len(samples) * p // 100))
+    return samples[int(rank) - 1]
+
+
+class Client:
+    """Обёртка над httpx, которая меряет каждый запрос."""
+
+    def __init__(self, http, stats, token=None):
+        self.http = http
+        self.stats = stats
+        self.headers = {"Authorization": f"Bearer {token}"} if token else {}
+
+    async def request(self, method, url, endpoint, **kwargs):
+        headers = {**self.headers, **kwargs.pop("headers", {})}
+        started = time.perf_counter()
+        try:
+            response = await self.http.request(method, url, headers=headers, **kwargs)
+        except httpx.HTTPError:
+            # Обрыв соединения или таймаут считаем как 5xx с кодом 0
+            self.stats.record(endpoint, time.perf_counter() - started, 0)
+            return None
+        self.stats.record(endpoint, time.perf_counter() - started, response.status_code)
+        return response
+
+
+async def login(http, stats, name, password):
+    client = Client(http, stats)
+    response = await client.request(
+        "POST", "/auth/login/", "POST /auth/login/",
+        json={"username": name, "password": password},
+    )
+    if response is None or response.status_code != 200:
+        raise RuntimeError(f"Не удалось войти как {name}: {response.status_code if response else 'нет ответа'}")
+    return Client(http, stats, response.json()["access_token"])
+
+
+async def setup(http, args):
+    """Готовит базу к прогону: гости и запас блюд. В статистику не попадает."""
+    scratch = Stats()
+    admin = await login(http, scratch, args.admin, args.admin_password)
+
+    for i in range(args.guests):
+        await admin.request(
+            "POST", "/users/", "setup",
+            json={"name": guest_name(i), "password": args.guest_password, "role_id": 1},
+        )
+
+    menu = (await admin.request("GET", "/menu/", "setup")).json()
+    for item in menu:
+        await admin.request("PUT", f"/menu/{item['id']}", "setup", json={
+            "dish_name": item["dish_name"],
+            "image": item["image"],
+            "is_available": True,
+            "description": item["description"],
+            "category": item["category"],
+            "quantity_left": args.stock,
+        })
+
+    statuses = (await admin.request("GET", "/order_statuses/", "setup")).json()
+    return sorted(statuses, key=lambda s: s["id"])
+
+
+def guest_name(i):
+    return f"guest{i:03d}"
+
+
+async def guest(http, stats, args, index):
+    rng = random.Random(args.seed * 100003 + index)
+    await asyncio.sleep(rng.uniform(0, args.ramp))
+    client = await login(http, stats, guest_name(index), args.guest_password)
+
+    etag = None
+    menu_ids = []
+    for _ in range(args.rounds):
+        headers = {"If-None-Match": etag} if etag else {}
+        response = await client.request("GET", "/menu/", "GET /menu/", headers=headers)
+        if response is not None and response.status_code == 200:
+            etag = response.headers.get("etag")
+            menu_ids = [item["id"] for item in response.json() if item["is_available"]]
+
+        response = await client.request("POST", "/orders/", "POST /orders/")
+        if response is None or response.status_code != 201 or not menu_ids:
+            continue
+        order_id = response.json()["id"]
+
+        picks = [rng.choice(menu_ids) for _ in range(rng.randint(1, args.max_items))]
+        await client.request("POST", f"/cart/{order_id}", "POST /cart/{id}", json={"menu_items": picks})
+
+        for _ in range(args.polls):
+            await asyncio.sleep(args.poll_interval * rng.uniform(0.5, 1.5))
+            await client.request("GET", f"/cart/{order_id}", "GET /cart/{id}")
+
+
+async def tv(http, stats, args, index, done):
+    rng = random.Random(args.seed * 200003 + index)
+    client = await login(http, stats, args.tv, args.tv_password)
+    await asyncio.sleep(rng.uniform(0, args.tv_interval))
+    while not done.is_set():
+        await client.request("GET", "/tv/orders", "GET /tv/orders")
+        await asyncio.sleep(args.tv_interval)
+
+
+async def admin(http, stats, args, statuses, done):
+    client = await login(http, stats, args.admin, args.admin_password)
+    # Статусы идут по возрастанию id, последний — «выдан»
+    chain = [s["id"] for s in statuses]
+    id_by_name = {s["name"]: s["id"] for s in statuses}
+    while not done.is_set():
+        await asyncio.sleep(args.admin_interval)
+        response = await client.request("GET", "/orders/", "GET /orders/", params={"limit": 500})
+        if response is None or response.status_code != 200:
+            continue
+        # Порядок обхода фиксирован: от старых заказов к новым
+        for order in sorted(response.json(), key=lambda o: o["id"]):
+            status_id = id_by_name.get(order["status"])
+            if status_id == chain[-1]:
+                await client.request("DELETE", f"/orders/{order['id']}", "DELETE /orders/{id}")
+            elif status_id is not None and order["items"]:
+                # Пустой заказ не трогаем: гость ещё наполняет корзину
+                await client.request(
+                    "PUT", f"/orders/{order['id']}/status", "PUT /orders/{id}/status",
+                    json={"status_id": chain[chain.index(status_id) + 1]},
+                )
+
+
+async def run(args):
+    limits = httpx.Limits(max_connections=args.connections, max_keepalive_connections=args.connections)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as http:
+        statuses = await setup(http, args)
+
+        stats = Stats()
+        done = asyncio.Event()
+        started = time.perf_counter()
+        background = [asyncio.create_task(tv(http, stats, args, i, done)) for i in range(args.tvs)]
+        background.append(asyncio.create_task(admin(http, stats, args, statuses, done)))
+        await asyncio.gather(*(guest(http, stats, args, i) for i in range(args.guests)))
+        wall = time.perf_counter() - started
+        done.set()
+        await asyncio.gather(*background, return_exceptions=True)
+    return {"config": config_of(args), "wall_seconds": round(wall, 2), "endpoints": stats.report(wall)}
+
+
+def config_of(args):
+    keys = ["guests", "tvs", "rounds", "polls", "max_items", "seed", "poll_interval", "tv_interval", "admin_interval", "ramp"]
+    return {key: getattr(args, key) for key in keys}
+
+
+def print_report(report):
+    print(f"Прогон: {report['wall_seconds']} с, {report['config']}")
+    header = f"{'endpoint':<26}{'count':>7}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'4xx':>6}{'5xx':>6}"
+    print(header)
+    print("-" * len(header))
+    for endpoint, row in report["endpoints"].items():
+        print(
+            f"{endpoint:<26}{row['count']:>7}{row['rps']:>9}{row['p50_ms']:>9}{row['p95_ms']:>9}"
+            f"{row['p99_ms']:>9}{row['max_ms']:>9}{row['4xx']:>6}{row['5xx']:>6}"
+        )
+
+
+def compare(report, baseline, tolerance):
+    """Возвращает список регрессий относительно сохранённого отчёта."""
+    problems = []
+    if baseline.get("config") != report["config"]:
+        problems.append("конфигурация прогона отличается от базовой — сравнение некорректно")
+    for endpoint, old in baseline["endpoints"].items():
+        new = report["endpoints"].get(endpoint)
+        if new is None:
+            problems.append(f"{endpoint}: нет в новом прогоне")
+            continue
+        for key in ("p95_ms", "p99_ms"):
+            if new[key] > old[key] * (1 + tolerance):
+                problems.append(f"{endpoint}: {key} {old[key]} -> {new[key]}")
+        if new["rps"] < old["rps"] * (1 - tolerance):
+            problems.append(f"{endpoint}: rps {old['rps']} -> {new['rps']}")
+        if new["5xx"] > old["5xx"]:
+            problems.append(f"{endpoint}: 5xx {old['5xx']} -> {new['5xx']}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Нагрузочный прогон «вечеринка»")
+    parser.add_argument("--base-url", default="http://localhost:8000/api")
+    parser.add_argument("--guests", type=int, default=50)
+    parser.add_argument("--tvs", type=int, default=2)
+    parser.add_argument("--rounds", type=int, default=3, help="заказов на гостя")
+    parser.add_argument("--polls", type=int, default=5, help="опросов заказа после оформления")
+    parser.add_argument("--max-items", type=int, default=4, help="максимум блюд в корзине")
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--tv-interval", type=float, default=2.0)
+    parser.add_argument("--admin-interval", type=float, default=1.0)
+    parser.add_argument("--ramp", type=float, default=2.0, help="за сколько секунд подтягиваются гости")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--stock", type=int, default=100000, help="остаток каждого блюда перед прогоном")
+    parser.add_argument("--connections", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--admin", default="orfey")
+    parser.add_argument("--admin-password", default="password")
+    parser.add_argument("--tv", default="tv")
+    parser.add_argument("--tv-password", default="password")
+    parser.add_argument("--guest-password", default="guest")
+    parser.add_argument("--json", help="сохранить отчёт в файл")
+    parser.add_argument("--baseline", help="сравнить с сохранённым отчётом")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="допустимое ухудшение, доля")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print_report(report)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            problems = compare(report, json.load(f), args.tolerance)
+        for problem in problems:
+            print(f"РЕГРЕССИЯ: {problem}")
+        if problems:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -68,6 +68,7 @@ export const login = ({ username, password }) =>
     username,
     password,
   });
+export const logout = () => api.post("/auth/logout/");
 
 // Menu endpoints
 export const getMenu = () => api.get("/menu/");
@@ -88,7 +89,20 @@ export const removeFromCart = (orderId, menuItemId) =>
 
 // Orders endpoints
 export const createOrder = (data) => api.post("/orders/", data);
-export const getOrders = () => api.get("/orders/");
+// Список заказов отдаётся страницами: курсор следующей — в заголовке
+// X-Next-Cursor. Админке нужны все заказы, поэтому идём до последней страницы.
+export const getOrders = async () => {
+  const orders = [];
+  let cursor = null;
+  do {
+    const response = await api.get("/orders/", {
+      params: cursor ? { limit: 500, cursor } : { limit: 500 },
+    });
+    orders.push(...response.data);
+    cursor = response.headers["x-next-cursor"];
+  } while (cursor);
+  return { data: orders };
+};
 export const updateOrderStatus = (id, status) =>
   api.put(`/orders/${id}/status`, { status_id: status });
 export const deleteOrder = (id) => api.delete(`/orders/${id}`);
@@ -103,4 +117,16 @@ export const updateToadStatus = (id, isTaken) =>
 export const getDisplayData = () => api.get("/tv/orders/");
 export const getTVOrders = () => api.get("/tv/orders/");
 
+// Поток табло (Server-Sent Events). EventSource не умеет слать заголовки,
+// поэтому токен уходит в query-параметре.
+export const openTVOrdersStream = (onOrders, onError) => {
+  const token = localStorage.getItem("token") || "";
+  const source = new EventSource(
+    `${API_BASE_URL}/tv/orders/stream?token=${encodeURIComponent(token)}`
+  );
+  source.onmessage = (event) => onOrders(JSON.parse(event.data));
+  source.onerror = onError;
+  return source;
+};
+
 export default api;
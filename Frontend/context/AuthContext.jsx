@@ -1,4 +1,5 @@
 import React, { createContext, useContext, useState, useEffect } from "react";
+import { logout as logoutApi } from "../api";
 
 const AuthContext = createContext(null);
 
@@ -31,6 +32,8 @@ export const AuthProvider = ({ children }) => {
   };
 
   const logout = () => {
+    // Токен отзывается на сервере; выходим, даже если запрос не прошёл
+    if (token) logoutApi().catch(() => {});
     setToken(null);
     setUser(null);
   };
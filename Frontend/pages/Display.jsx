@@ -1,6 +1,10 @@
 import React, { useState, useEffect } from "react";
 import { useAuth } from "../context/AuthContext";
-import { getDisplayData } from "../api";
+import { getDisplayData, openTVOrdersStream } from "../api";
+
+// Пауза перед переподключением потока табло: от секунды до минуты
+const STREAM_RETRY_MIN_MS = 1000;
+const STREAM_RETRY_MAX_MS = 60000;
 
 export default function Display() {
   const { user } = useAuth();
@@ -20,14 +24,55 @@ export default function Display() {
       }
     };
 
-    // Initial fetch
-    fetchOrders();
+    let source = null;
+    let interval = null;
+    let retryTimer = null;
+    let retryDelay = STREAM_RETRY_MIN_MS;
 
-    // Set up polling every 10 seconds
-    const interval = setInterval(fetchOrders, 10000);
+    // Запасной вариант — старый опрос раз в 10 секунд
+    const startPolling = () => {
+      if (interval) return;
+      fetchOrders();
+      interval = setInterval(fetchOrders, 10000);
+    };
+    const stopPolling = () => {
+      clearInterval(interval);
+      interval = null;
+    };
 
-    // Cleanup interval on unmount
-    return () => clearInterval(interval);
+    // Сервер сам присылает табло при каждом изменении. Обрыв соединения
+    // EventSource переживает сам, но на ответ не-200 (истёкший токен,
+    // 502 во время рестарта) закрывается насовсем — тогда переподключаемся
+    // с нарастающей паузой, а пока потока нет, опрашиваем табло.
+    const connect = () => {
+      source = openTVOrdersStream(
+        (ordersData) => {
+          retryDelay = STREAM_RETRY_MIN_MS;
+          stopPolling();
+          setOrders(Array.isArray(ordersData) ? ordersData : []);
+          setError(null);
+        },
+        (err) => {
+          console.error("TV stream error:", err);
+          if (err.target.readyState !== EventSource.CLOSED) return;
+          startPolling();
+          retryTimer = setTimeout(connect, retryDelay);
+          retryDelay = Math.min(retryDelay * 2, STREAM_RETRY_MAX_MS);
+        }
+      );
+    };
+
+    if (window.EventSource) {
+      connect();
+    } else {
+      startPolling();
+    }
+
+    return () => {
+      if (source) source.close();
+      clearTimeout(retryTimer);
+      stopPolling();
+    };
   }, []);
 
   // Разделяем заказы по статусам